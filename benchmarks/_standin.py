@@ -0,0 +1,319 @@
+"""
+Local stand-in FortiGate used by the benchmark scripts.
+
+Serves a small subset of the FortiOS REST API over plain HTTP on
+127.0.0.1 so client-side behaviour (threading, pipelining, decoding,
+caching, ...) can be measured without a real device. Latency can be
+injected globally or per path to emulate WAN-attached FortiGates.
+
+Behaviour:
+    - GET on a registered table returns its records, honouring the
+      ``start``/``count`` paging parameters like FortiOS does
+    - GET on any other path echoes the path and query parameters back in
+      ``results`` so callers can detect responses crossing between threads
+    - GET on a table honours ``format=a|b`` (only those fields) and
+      ``exclude-default-values`` (drops fields equal to the defaults given
+      to add_table())
+    - POST/PUT/DELETE on a registered table create, update and delete
+      records keyed by the table's mkey
+    - GET with ``action=schema`` on a path registered with add_schema()
+      returns that schema
+    - every response reports ``version`` and ``build`` as given
+
+This module is test tooling only and is not part of the hfortix package.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+API_PREFIX = "/api/v2/"
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs when many clients (e.g. a whole
+    # fleet) connect at once, adding a 1s retransmit to those connections
+    request_queue_size = 1024
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients dropping connections (cancelled requests) are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandInFortiGate:
+    """
+    Threaded local HTTP server mimicking the FortiOS REST API
+
+    Example:
+        >>> with StandInFortiGate(latency=0.15) as fgt:
+        ...     fgt.add_table("cmdb/firewall/address", records, mkey="name")
+        ...     client = HTTPClient(url=fgt.url, token="x", verify=False)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        path_latency: Optional[dict[str, float]] = None,
+        version: str = "v7.6.0",
+        build: int = 3401,
+    ) -> None:
+        self.latency = latency
+        self.path_latency = dict(path_latency or {})
+        self.version = version
+        self.build = build
+        self.schemas: dict[str, dict[str, Any]] = {}
+        self.tables: dict[str, list[dict[str, Any]]] = {}
+        self.mkeys: dict[str, str] = {}
+        self.defaults: dict[str, dict[str, Any]] = {}
+        self.raw_bodies: dict[str, bytes] = {}
+        self.request_count = 0
+        self.schema_requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.standin = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to HTTPClient / AsyncHTTPClient"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_table(
+        self,
+        path: str,
+        records: list[dict[str, Any]],
+        mkey: str = "name",
+        defaults: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Register a CMDB/monitor table served at ``/api/v2/{path}``"""
+        self.tables[path.strip("/")] = records
+        self.mkeys[path.strip("/")] = mkey
+        self.defaults[path.strip("/")] = dict(defaults or {})
+
+    def add_schema(self, path: str, schema: dict[str, Any]) -> None:
+        """Register the ``action=schema`` response of ``/api/v2/{path}``"""
+        self.schemas[path.strip("/")] = schema
+
+    def add_raw(self, path: str, body: bytes) -> None:
+        """Register a pre-encoded response body served at ``path``"""
+        self.raw_bodies[path.strip("/")] = body
+
+    def start(self) -> "StandInFortiGate":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInFortiGate":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _delay_for(self, path: str) -> float:
+        for prefix, delay in self.path_latency.items():
+            if path.startswith(prefix):
+                return delay
+        return self.latency
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are written separately; without TCP_NODELAY the
+        # body waits on a delayed ACK and adds ~40ms to every response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return  # Keep benchmark output clean
+
+    @property
+    def standin(self) -> StandInFortiGate:
+        return self.server.standin  # type: ignore[attr-defined]
+
+    def _parse(self) -> tuple[str, dict[str, Any]]:
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX) :]
+        query = {
+            k: v[0] if len(v) == 1 else v
+            for k, v in parse_qs(parts.query).items()
+        }
+        return path.strip("/"), query
+
+    def _read_body(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    def _send(self, status: int, body: Any) -> None:
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.standin._lock:
+            self.standin.bytes_sent += len(body)
+
+    def _project(
+        self, table: str, records: list[dict[str, Any]], query: dict
+    ) -> list[dict[str, Any]]:
+        """Apply ``format`` and ``exclude-default-values`` to records"""
+        fields = query.get("format")
+        exclude = query.get("exclude-default-values") not in (
+            None,
+            "false",
+            "0",
+        )
+        if fields is None and not exclude:
+            return records
+        keep = set(fields.split("|")) if fields is not None else None
+        defaults = self.standin.defaults[table] if exclude else {}
+        missing = object()
+        return [
+            {
+                k: v
+                for k, v in record.items()
+                if (keep is None or k in keep)
+                and defaults.get(k, missing) != v
+            }
+            for record in records
+        ]
+
+    def _split_table(self, path: str) -> tuple[Optional[str], Optional[str]]:
+        """Return (table, mkey value) for a path under a known table"""
+        standin = self.standin
+        if path in standin.tables:
+            return path, None
+        table, _, key = path.rpartition("/")
+        if table in standin.tables:
+            return table, key
+        return None, None
+
+    def _envelope(self, path: str, results: Any, **extra: Any) -> dict:
+        body = {
+            "http_method": self.command,
+            "results": results,
+            "vdom": "root",
+            "path": path.split("/")[1] if "/" in path else path,
+            "name": path.rsplit("/", 1)[-1],
+            "status": "success",
+            "http_status": 200,
+            "serial": "FGVMSTANDIN00001",
+            "version": self.standin.version,
+            "build": self.standin.build,
+        }
+        body.update(extra)
+        return body
+
+    def _handle(self) -> None:
+        standin = self.standin
+        path, query = self._parse()
+        with standin._lock:
+            standin.request_count += 1
+        delay = standin._delay_for(path)
+        if delay:
+            time.sleep(delay)
+
+        if query.get("action") == "schema" and path in standin.schemas:
+            with standin._lock:
+                standin.schema_requests += 1
+            self._send(200, self._envelope(path, standin.schemas[path]))
+            return
+
+        if path in standin.raw_bodies and self.command == "GET":
+            self._send(200, standin.raw_bodies[path])
+            return
+
+        table, key = self._split_table(path)
+        if table is None:
+            if self.command == "GET":
+                self._send(200, self._envelope(path, {"path": path, **query}))
+            else:
+                body = self._read_body()
+                self._send(200, self._envelope(path, {"data": body}))
+            return
+
+        records = standin.tables[table]
+        mkey = standin.mkeys[table]
+        if self.command == "GET":
+            if key is not None:
+                match = [r for r in records if str(r.get(mkey)) == key]
+                if not match:
+                    self._send(
+                        404,
+                        {"status": "error", "http_status": 404, "error": -3},
+                    )
+                    return
+                match = self._project(table, match, query)
+                self._send(200, self._envelope(path, match))
+                return
+            start = int(query.get("start", 0))
+            count = query.get("count")
+            page = (
+                records[start : start + int(count)]
+                if count is not None
+                else records[start:]
+            )
+            page = self._project(table, page, query)
+            self._send(
+                200,
+                self._envelope(
+                    path, page, size=len(records), matched_count=len(page)
+                ),
+            )
+            return
+
+        body = self._read_body()
+        # Decide under the lock, send after it (_send takes it too)
+        error = None
+        with standin._lock:
+            if self.command == "POST":
+                if any(r.get(mkey) == body.get(mkey) for r in records):
+                    error = 500, -5
+                else:
+                    records.append(body)
+            elif self.command == "PUT":
+                for record in records:
+                    if str(record.get(mkey)) == key:
+                        record.update(body)
+                        break
+                else:
+                    error = 404, -3
+            elif self.command == "DELETE":
+                records[:] = [r for r in records if str(r.get(mkey)) != key]
+        if error is not None:
+            status, code = error
+            self._send(
+                status,
+                {"status": "error", "http_status": status, "error": code},
+            )
+            return
+        self._send(200, self._envelope(path, {"mkey": key or body.get(mkey)}))
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+    do_DELETE = _handle
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Bulk CMDB apply throughput benchmark.
+
+Applies firewall address payloads to a local stand-in FortiGate with
+injected per-request latency (emulating a WAN-attached device), once one
+``post()`` after the other and then with bulk_apply() / abulk_apply() at
+increasing concurrency. Part of the objects already exist on the device,
+so those payloads take the DuplicateEntryError -> PUT path; one payload
+is malformed and must be reported as failed without stopping the run.
+
+Usage:
+    python benchmarks/bulk_apply.py
+    python benchmarks/bulk_apply.py --latency 0.1 --objects 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+from hfortix.FortiOS.bulk import abulk_apply, bulk_apply  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+TABLE = "cmdb/firewall/address"
+
+
+def payloads(count: int, run: str) -> list:
+    items = [
+        {
+            "name": f"host-{i}",
+            "subnet": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255} "
+            "255.255.255.255",
+            "comment": run,
+        }
+        for i in range(count)
+    ]
+    items.append("host-x 192.0.2.1/32")  # malformed: not a dict
+    return items
+
+
+def existing(count: int) -> list[dict]:
+    # Every 10th object is already configured on the device
+    return [
+        {"name": f"host-{i}", "comment": "old"} for i in range(0, count, 10)
+    ]
+
+
+def connect(url: str, concurrency: int, mode: str = "sync") -> FortiOS:
+    fgt = FortiOS(
+        host=url.split("://", 1)[1],
+        token=TOKEN,
+        verify=False,
+        mode=mode,
+        max_connections=concurrency + 1,
+        max_retries=0,
+    )
+    fgt._client._url = url  # stand-in speaks plain HTTP
+    return fgt
+
+
+def sequential(url: str, items: list[dict]) -> float:
+    fgt = connect(url, 1)
+    start = time.perf_counter()
+    for item in items:
+        try:
+            fgt.api.cmdb.firewall.address.post(payload_dict=item)
+        except Exception:
+            pass
+    elapsed = time.perf_counter() - start
+    fgt.close()
+    return elapsed
+
+
+def check(summary, server: StandInFortiGate, args, run: str) -> bool:
+    records = server.tables[TABLE]
+    return (
+        summary.created == args.objects - len(existing(args.objects))
+        and summary.updated == len(existing(args.objects))
+        and summary.failed == 1
+        and summary.results[-1].error is not None
+        and [r.index for r in summary] == list(range(args.objects + 1))
+        and len(records) == args.objects
+        and all(r.get("comment") == run for r in records)
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Injected server latency per request in seconds",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[4, 8, 16]
+    )
+    args = parser.parse_args()
+    # The client logs every expected duplicate-entry error
+    logging.getLogger("hfortix").setLevel(logging.CRITICAL)
+
+    print(
+        f"{args.objects} addresses ({len(existing(args.objects))} existing), "
+        f"{args.latency * 1000:.0f}ms latency"
+    )
+    print(f"{'mode':>18} {'seconds':>8} {'objects/s':>10} {'speedup':>8}")
+    ok = True
+    with StandInFortiGate(latency=args.latency) as server:
+        server.add_table(TABLE, existing(args.objects))
+        base = sequential(server.url, payloads(args.objects, "sequential"))
+        print(
+            f"{'post() loop':>18} {base:>8.2f} "
+            f"{args.objects / base:>10.0f} {1.0:>7.1f}x"
+        )
+        best = 1.0
+        for concurrency in args.concurrency:
+            for mode in ("sync", "async"):
+                run = f"{mode}-{concurrency}"
+                server.add_table(TABLE, existing(args.objects))
+                fgt = connect(server.url, concurrency, mode)
+                progress: list[int] = []
+                kwargs = dict(
+                    concurrency=concurrency,
+                    on_progress=lambda s: progress.append(s.total),
+                    progress_every=250,
+                )
+                items = payloads(args.objects, run)
+                if mode == "sync":
+                    summary = bulk_apply(
+                        fgt.api.cmdb.firewall.address, items, **kwargs
+                    )
+                    fgt.close()
+                else:
+
+                    async def go():
+                        try:
+                            return await abulk_apply(
+                                fgt.api.cmdb.firewall.address, items, **kwargs
+                            )
+                        finally:
+                            await fgt.aclose()
+
+                    summary = asyncio.run(go())
+                if not check(summary, server, args, run) or (
+                    progress[-1] != args.objects + 1
+                ):
+                    print(f"FAIL: {run}: {summary!r}")
+                    ok = False
+                speedup = base / summary.elapsed
+                best = max(best, speedup)
+                print(
+                    f"{run:>18} {summary.elapsed:>8.2f} "
+                    f"{args.objects / summary.elapsed:>10.0f} "
+                    f"{speedup:>7.1f}x"
+                )
+
+    # Concurrent apply must clearly beat the one-by-one loop
+    ok = ok and best > 3
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Dependency-ordered multi-table apply benchmark.
+
+Creates addresses, services, address groups and the policies using them
+on a local stand-in FortiGate (with injected per-request latency), once
+the safe way by hand - one object after the other, table by table - and
+once with apply_plan(), which orders the changes by their references
+(scheduler.ChangeGraph) and runs each level concurrently. The plans are
+passed in reverse order on purpose; the schedule must not depend on it.
+
+Usage:
+    python benchmarks/dependency_schedule.py
+    python benchmarks/dependency_schedule.py --policies 500 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+from hfortix.FortiOS.reconcile import apply_plan, plan_table  # noqa: E402
+from hfortix.FortiOS.scheduler import ChangeGraph, table_name  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+TABLES = {
+    "address": "cmdb/firewall/address",
+    "service_custom": "cmdb/firewall.service/custom",
+    "addrgrp": "cmdb/firewall/addrgrp",
+    "policy": "cmdb/firewall/policy",
+}
+
+
+def desired(policies: int) -> dict[str, list[dict]]:
+    addresses = [
+        {"name": f"host-{i}", "subnet": f"10.1.{i >> 8 & 255}.{i & 255}/32"}
+        for i in range(2 * policies)
+    ]
+    services = [
+        {"name": f"tcp-{8000 + i}", "tcp-portrange": str(8000 + i)}
+        for i in range(policies)
+    ]
+    groups = [
+        {
+            "name": f"grp-{i}",
+            "member": [
+                {"name": f"host-{2 * i}"},
+                {"name": f"host-{2 * i + 1}"},
+            ],
+        }
+        for i in range(policies)
+    ]
+    rules = [
+        {
+            "policyid": i + 1,
+            "name": f"allow-{i}",
+            "srcaddr": [{"name": f"grp-{i}"}],
+            "dstaddr": [{"name": f"host-{i}"}],
+            "service": [{"name": f"tcp-{8000 + i}"}],
+            "schedule": "always",
+        }
+        for i in range(policies)
+    ]
+    return {
+        "address": addresses,
+        "service_custom": services,
+        "addrgrp": groups,
+        "policy": rules,
+    }
+
+
+def connect(url: str, concurrency: int) -> FortiOS:
+    fgt = FortiOS(
+        host=url.split("://", 1)[1],
+        token=TOKEN,
+        verify=False,
+        max_connections=concurrency + 1,
+        max_retries=0,
+    )
+    fgt._client._url = url  # stand-in speaks plain HTTP
+    return fgt
+
+
+def reset(server: StandInFortiGate) -> None:
+    for table, path in TABLES.items():
+        server.add_table(path, [], "policyid" if table == "policy" else "name")
+
+
+def endpoints(fgt: FortiOS) -> dict:
+    firewall = fgt.api.cmdb.firewall
+    return {
+        "address": firewall.address,
+        "service_custom": firewall.service_custom,
+        "addrgrp": firewall.addrgrp,
+        "policy": firewall.policy,
+    }
+
+
+def by_hand(url: str, objects: dict[str, list[dict]]) -> float:
+    fgt = connect(url, 1)
+    start = time.perf_counter()
+    for table, endpoint in endpoints(fgt).items():
+        for entry in objects[table]:
+            endpoint.post(payload_dict=entry)
+    elapsed = time.perf_counter() - start
+    fgt.close()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--policies", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Injected server latency per request in seconds",
+    )
+    args = parser.parse_args()
+    logging.getLogger("hfortix").setLevel(logging.CRITICAL)
+
+    objects = desired(args.policies)
+    total = sum(len(entries) for entries in objects.values())
+    print(
+        f"{total} objects in {len(objects)} tables, "
+        f"{args.latency * 1000:.0f}ms latency"
+    )
+    ok = True
+    with StandInFortiGate(latency=args.latency) as server:
+        reset(server)
+        serial = by_hand(server.url, objects)
+        print(f"{'one by one':>12} {serial:>8.2f}s")
+
+        reset(server)
+        fgt = connect(server.url, args.concurrency)
+        tables = endpoints(fgt)
+        plans = [
+            plan_table(tables[table], objects[table], key="name")
+            for table in reversed(list(tables))
+        ]
+        # Addresses and services, then groups, then policies
+        graph = ChangeGraph(plans)
+        layout = [
+            sorted({table_name(graph.nodes[i][0].endpoint) for i in level})
+            for level in graph.levels
+        ]
+        print(f"{'levels':>12} {layout}")
+        if layout != [
+            ["firewall.address", "firewall.service_custom"],
+            ["firewall.addrgrp"],
+            ["firewall.policy"],
+        ]:
+            print("FAIL: unexpected dependency levels")
+            ok = False
+        summary = apply_plan(plans, concurrency=args.concurrency)
+        print(f"{'apply_plan':>12} {summary.elapsed:>8.2f}s")
+        fgt.close()
+
+        if summary.created != total or not summary.ok:
+            print(f"FAIL: {summary!r}")
+            ok = False
+        for table, path in TABLES.items():
+            if len(server.tables[path]) != len(objects[table]):
+                print(f"FAIL: {table} not fully created")
+                ok = False
+
+    speedup = serial / summary.elapsed
+    print(f"Dependency-ordered apply is {speedup:.1f}x faster")
+    ok = ok and speedup > 3
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
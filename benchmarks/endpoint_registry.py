@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Endpoint registry benchmark.
+
+CMDB and monitor endpoints are classes built from the per-category
+``_registry.py`` tables on first access. In a fresh interpreter this
+builds every registry endpoint (what used to be one module per endpoint),
+then instantiates all of them for a client, reporting wall time, Python
+heap and the number of ``hfortix`` modules loaded. Heap sizes come from a
+separate run with tracemalloc enabled. Also reports the source size of the
+CMDB and monitor packages.
+
+Usage:
+    python benchmarks/endpoint_registry.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+TOKEN = "benchmarktoken0000000000000000000"
+API = Path(__file__).resolve().parent.parent / "hfortix/FortiOS/api/v2"
+
+
+def _registries() -> list[str]:
+    return sorted(
+        ".".join(path.relative_to(API.parents[3]).with_suffix("").parts)
+        for api in ("cmdb", "monitor")
+        for path in (API / api).glob("*/_registry.py")
+    )
+
+
+def _hfortix_modules() -> int:
+    return sum(1 for name in sys.modules if name.startswith("hfortix"))
+
+
+def measure(trace_heap: bool) -> None:
+    """Child process: build every registry endpoint and report as JSON"""
+    from hfortix import FortiOS
+
+    results = {}
+    fgt = FortiOS(host="192.0.2.1", token=TOKEN, verify=False)
+    if trace_heap:
+        tracemalloc.start()
+
+    def phase(name: str, func):
+        heap = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = func()
+        results[name] = {
+            "seconds": time.perf_counter() - start,
+            "heap": tracemalloc.get_traced_memory()[0] - heap,
+            "modules": _hfortix_modules(),
+        }
+        return value
+
+    def build_all() -> list[type]:
+        classes = []
+        for name in _registries():
+            module = importlib.import_module(name)
+            for spec in module.ENDPOINTS.values():
+                classes.append(getattr(module, spec["class"]))
+        return classes
+
+    classes = phase("build classes", build_all)
+    endpoints = phase(
+        "instantiate", lambda: [cls(fgt._client) for cls in classes]
+    )
+    results["endpoints"] = len(endpoints)
+    results["shared"] = all(
+        type(endpoint) is cls for endpoint, cls in zip(endpoints, classes)
+    )
+    tracemalloc.stop()
+    fgt.close()
+    print(json.dumps(results))
+
+
+def source_size() -> tuple[int, int]:
+    """Number and total size of endpoint source files"""
+    files = [
+        path
+        for api in ("cmdb", "monitor")
+        for path in (API / api).glob("*/*.py")
+    ]
+    return len(files), sum(path.stat().st_size for path in files)
+
+
+def run_child(mode: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--child", choices=["time", "heap"])
+    args = parser.parse_args()
+    if args.child:
+        measure(trace_heap=args.child == "heap")
+        return 0
+
+    results, heap = run_child("time"), run_child("heap")
+    print(f"{results['endpoints']} registry endpoints")
+    print(
+        f"{'phase':>15} {'time (ms)':>10} {'hfortix modules':>16} "
+        f"{'heap (MiB)':>11}"
+    )
+    for name in ("build classes", "instantiate"):
+        phase = results[name]
+        print(
+            f"{name:>15} {phase['seconds'] * 1000:>10.1f} "
+            f"{phase['modules']:>16} {heap[name]['heap'] / 2**20:>11.2f}"
+        )
+    per_endpoint = heap["instantiate"]["heap"] / results["endpoints"]
+    print(f"{per_endpoint:.0f} bytes per endpoint object and client")
+
+    count, size = source_size()
+    print(f"{count} endpoint source files, {size / 1024:.0f} KiB")
+
+    ok = (
+        results["endpoints"] > 800
+        and results["shared"]
+        and results["build classes"]["modules"] < 200
+    )
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for columnar export of a large CMDB table.
+
+Serves a large firewall address table from a local stand-in FortiGate and
+writes it to Parquet twice, each in a fresh subprocess:
+
+- ``list``: the usual approach - ``list(iter())`` into a list of dicts,
+  then ``pyarrow.Table.from_pylist()`` and ``write_table()``
+- ``stream``: ``export_table()``, which converts and writes one batch at
+  a time with the schema taken from the endpoint's field definitions
+
+Peak Python heap is measured with tracemalloc, peak RSS growth with
+getrusage (which includes Arrow buffers). Both files are read back and
+compared. Requires pyarrow.
+
+Usage:
+    python benchmarks/export_memory.py
+    python benchmarks/export_memory.py --records 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+from hfortix.FortiOS.export import export_table  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+TABLE = "cmdb/firewall/address"
+
+
+def build_records(count: int) -> list[dict]:
+    return [
+        {
+            "name": f"host-{i}",
+            "q_origin_key": f"host-{i}",
+            "uuid": f"5e0f{i:08x}-2f4b-51ee-8c1e-0123456789ab",
+            "type": "ipmask",
+            "subnet": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255} "
+            "255.255.255.255",
+            "comment": f"benchmark address {i}",
+            "associated-interface": "port1" if i % 3 else "",
+            "color": i % 32,
+            "route-tag": i % 7,
+            "allow-routing": "disable",
+            "fabric-object": "disable",
+            "tagging": [{"name": "env", "category": "zone", "tags": []}],
+        }
+        for i in range(count)
+    ]
+
+
+def measure(url: str, mode: str, path: str, page_size: int) -> None:
+    """Child process: export the table once and report memory as JSON"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fgt = FortiOS(host=url.split("://", 1)[1], token=TOKEN, verify=False)
+    fgt._client._url = url  # stand-in speaks plain HTTP
+    address = fgt.api.cmdb.firewall.address
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    if mode == "stream":
+        rows = export_table(address, path, page_size=page_size)["rows"]
+    else:
+        table = pa.Table.from_pylist(list(address.iter(page_size=page_size)))
+        pq.write_table(table, path, compression="zstd")
+        rows = table.num_rows
+        del table
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    fgt.close()
+    print(
+        json.dumps(
+            {
+                "rows": rows,
+                "elapsed": elapsed,
+                "heap_peak": peak,
+                "rss_growth": (rss_after - rss_before) * 1024,
+            }
+        )
+    )
+
+
+def run_child(url: str, mode: str, path: str, page_size: int) -> dict:
+    out = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            mode,
+            "--url",
+            url,
+            "--path",
+            path,
+            "--page-size",
+            str(page_size),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--child", choices=["list", "stream"])
+    parser.add_argument("--url")
+    parser.add_argument("--path")
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.url, args.child, args.path, args.page_size)
+        return 0
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("pyarrow not installed, nothing to benchmark")
+        return 0
+
+    records = build_records(args.records)
+    print(f"{args.records} firewall addresses, pages of {args.page_size}")
+    print(
+        f"{'mode':>8} {'time (s)':>9} {'heap peak (MiB)':>16} "
+        f"{'RSS growth (MiB)':>17}"
+    )
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        with StandInFortiGate() as server:
+            server.add_table(TABLE, records)
+            for mode in ("list", "stream"):
+                path = str(Path(tmp) / f"{mode}.parquet")
+                res = run_child(server.url, mode, path, args.page_size)
+                assert res["rows"] == args.records, res
+                results[mode] = res
+                print(
+                    f"{mode:>8} {res['elapsed']:>9.2f} "
+                    f"{res['heap_peak'] / 2**20:>16.1f} "
+                    f"{res['rss_growth'] / 2**20:>17.1f}"
+                )
+        full = pq.read_table(Path(tmp) / "list.parquet")
+        streamed = pq.read_table(Path(tmp) / "stream.parquet")
+
+    ok = True
+    for name in ("name", "subnet", "comment", "color", "route-tag"):
+        if full[name].to_pylist() != streamed[name].to_pylist():
+            print(f"FAIL: column {name!r} differs")
+            ok = False
+    if streamed.schema.field("color").type != "int64":
+        print("FAIL: schema not taken from the field definitions")
+        ok = False
+
+    ratio = results["list"]["heap_peak"] / results["stream"]["heap_peak"]
+    print(f"Streaming export peak heap is {ratio:.0f}x smaller")
+
+    # The streaming export must not hold the whole table in memory
+    ok = ok and ratio > 5
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Field projection benchmark.
+
+A local stand-in FortiGate serves a large firewall/address table whose
+entries look like real ones: about 40 fields, most of them at their
+default. The whole table is read with get() and with iter() four ways:
+
+- full: every field (what callers got before)
+- format: ``format=["name", "subnet", "type"]``
+- view: ``view="summary"``
+- exclude defaults: ``exclude_default_values=True``
+
+Reports the bytes sent by the device and the client wall time (request,
+JSON decode, result handling) for each. The stand-in applies
+``format`` and ``exclude-default-values`` like FortiOS does, so the
+difference is what the device would not have to serialize and send.
+
+Usage:
+    python benchmarks/field_projection.py
+    python benchmarks/field_projection.py --entries 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+
+# Values of a freshly created address on FortiOS 7.6
+DEFAULTS = {
+    "type": "ipmask",
+    "route-tag": 0,
+    "sub-type": "sdn",
+    "clearpass-spt": "unknown",
+    "macaddr": [],
+    "start-ip": "0.0.0.0",
+    "end-ip": "0.0.0.0",
+    "fqdn": "",
+    "country": "",
+    "wildcard-fqdn": "",
+    "cache-ttl": 0,
+    "wildcard": "0.0.0.0 0.0.0.0",
+    "sdn": "",
+    "fsso-group": [],
+    "sso-attribute-value": [],
+    "interface": "",
+    "tenant": "",
+    "organization": "",
+    "epg-name": "",
+    "subnet-name": "",
+    "sdn-tag": "",
+    "policy-group": "",
+    "obj-tag": "",
+    "obj-type": "ip",
+    "tag-detection-level": "",
+    "tag-type": "",
+    "hw-vendor": "",
+    "hw-model": "",
+    "os": "",
+    "sw-version": "",
+    "comment": "",
+    "associated-interface": "",
+    "color": 0,
+    "filter": "",
+    "sdn-addr-type": "private",
+    "node-ip-only": "disable",
+    "obj-id": "",
+    "list": [],
+    "tagging": [],
+    "allow-routing": "disable",
+    "fabric-object": "disable",
+}
+
+
+def entries(count: int) -> list[dict]:
+    return [
+        {
+            "name": f"host-{i}",
+            "q_origin_key": f"host-{i}",
+            "uuid": f"6b1c1e2a-0000-51ee-8d0f-{i:012x}",
+            **DEFAULTS,
+            "subnet": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256} "
+            "255.255.255.255",
+            "comment": "imported" if i % 10 == 0 else "",
+            "color": i % 4,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(fgt, server, read, repeat: int) -> tuple[int, float, int]:
+    """Bytes per read, median seconds per read and entries read"""
+    times = []
+    for _ in range(repeat):
+        before = server.bytes_sent
+        start = time.perf_counter()
+        records = read(fgt.api.cmdb.firewall.address)
+        times.append(time.perf_counter() - start)
+        sent = server.bytes_sent - before
+    return sent, statistics.median(times), len(records)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("hfortix").setLevel(logging.CRITICAL)
+
+    server = StandInFortiGate().start()
+    server.add_table(
+        "cmdb/firewall/address", entries(args.entries), defaults=DEFAULTS
+    )
+    fgt = FortiOS(
+        host=server.url.split("://", 1)[1],
+        token=TOKEN,
+        verify=False,
+        max_retries=0,
+    )
+    fgt._client._url = server.url  # stand-in speaks plain HTTP
+
+    modes = {
+        "full": {},
+        "format": {"format": ["name", "subnet", "type"]},
+        "view": {"view": "summary"},
+        "exclude defaults": {"exclude_default_values": True},
+    }
+    print(f"firewall/address: {args.entries} entries")
+    print(f"summary view: {fgt.api.cmdb.firewall.address.views['summary']}")
+    print(
+        f"{'':>17} {'get() MiB':>10} {'get() ms':>9} {'iter() ms':>10} "
+        f"{'size':>6} {'time':>6}"
+    )
+    results = {}
+    ok = True
+    for label, options in modes.items():
+        sent, seconds, count = measure(
+            fgt, server, lambda ep: ep.get(**options), args.repeat
+        )
+        _, iter_seconds, iter_count = measure(
+            fgt, server, lambda ep: list(ep.iter(**options)), args.repeat
+        )
+        results[label] = (sent, seconds)
+        full_sent, full_seconds = results["full"]
+        print(
+            f"{label:>17} {sent / 2**20:>10.2f} {seconds * 1000:>9.1f} "
+            f"{iter_seconds * 1000:>10.1f} {full_sent / sent:>5.1f}x "
+            f"{full_seconds / seconds:>5.1f}x"
+        )
+        if count != args.entries or iter_count != args.entries:
+            print(f"FAIL: {label} returned {count}/{iter_count} entries")
+            ok = False
+
+    sample = fgt.api.cmdb.firewall.address.get(
+        format=["name", "subnet", "type"]
+    )[0]
+    fgt.close()
+    server.stop()
+    if set(sample) != {"name", "subnet", "type"}:
+        print(f"FAIL: format returned {sorted(sample)}")
+        ok = False
+
+    full_sent, full_seconds = results["full"]
+    ok = (
+        ok
+        and full_sent / results["format"][0] > 4
+        and full_seconds / results["format"][1] > 2
+        and full_sent / results["exclude defaults"][0] > 2
+    )
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Fleet-wide status collection benchmark for FortiOSFleet.
+
+Builds a fleet of N "devices" that all point at one local stand-in
+FortiGate with injected latency (each device still gets its own
+AsyncHTTPClient, connection pool and circuit breaker) and reports:
+
+- Wall time of ``fleet.api.monitor.system.status.get()`` across the
+  fleet versus the sequential estimate (devices x latency)
+- Time to first streamed result
+- Partial results: a subset of devices is made slower than
+  ``device_timeout`` and must come back as timed out without delaying
+  the others. Connections are opened by an untimed warm-up call first,
+  so ``device_timeout`` only has to cover the request itself
+
+Usage:
+    python benchmarks/fleet_status.py
+    python benchmarks/fleet_status.py --devices 500 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS.fleet import FortiOSFleet  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+
+
+async def collect(fleet: FortiOSFleet) -> tuple[float, float, dict]:
+    """Stream status from every device; return (first, total, results)"""
+    start = time.perf_counter()
+    first = 0.0
+    results = {}
+    async for res in fleet.api.monitor.system.status.get():
+        if not results:
+            first = time.perf_counter() - start
+        results[res.device] = res
+    return first, time.perf_counter() - start, results
+
+
+async def run(
+    args: argparse.Namespace,
+    server: StandInFortiGate,
+    slow_server: StandInFortiGate,
+) -> bool:
+    names = [f"fw{i:04d}" for i in range(args.devices)]
+    slow = set(names[::10])
+
+    ok = True
+    async with FortiOSFleet(
+        [{"name": n, "host": server.url} for n in names],
+        token=TOKEN,
+        max_concurrency=args.concurrency,
+        max_retries=0,
+    ) as fleet:
+        first, total, results = await collect(fleet)
+        good = sum(r.ok for r in results.values())
+        sequential = len(names) * args.latency
+        print(
+            f"{len(names)} devices, {args.latency * 1000:.0f}ms latency, "
+            f"max_concurrency={args.concurrency}"
+        )
+        print(f"  first result : {first:.2f}s")
+        print(
+            f"  all results  : {total:.2f}s "
+            f"(sequential ~{sequential:.1f}s, "
+            f"{sequential / total:.0f}x faster)"
+        )
+        print(f"  successful   : {good}/{len(names)}")
+        ok = ok and good == len(names)
+
+    # Healthy devices answer in 1x latency, slow ones in 10x
+    device_timeout = args.latency * 5
+    async with FortiOSFleet(
+        [
+            {"name": n, "host": slow_server.url if n in slow else server.url}
+            for n in names
+        ],
+        token=TOKEN,
+        max_concurrency=args.concurrency,
+        device_timeout=device_timeout,
+        max_retries=0,
+    ) as fleet:
+        # Open every device's connection before the timed call
+        await fleet.api.monitor.system.time.get()
+        _, total, results = await collect(fleet)
+        timed_out = {d for d, r in results.items() if r.timed_out}
+        good = sum(r.ok for r in results.values())
+        print(
+            f"Partial results with {len(slow)} unresponsive devices "
+            f"(device_timeout={device_timeout:.2f}s)"
+        )
+        print(f"  all results  : {total:.2f}s")
+        print(f"  successful   : {good}, timed out: {len(timed_out)}")
+        ok = ok and timed_out == slow and good == len(names) - len(slow)
+
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.2,
+        help="Injected server latency per request in seconds",
+    )
+    args = parser.parse_args()
+
+    with (
+        StandInFortiGate(latency=args.latency) as server,
+        StandInFortiGate(
+            latency=args.latency,
+            path_latency={"monitor/system/status": args.latency * 10},
+        ) as slow_server,
+    ):
+        ok = asyncio.run(run(args, server, slow_server))
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Import and construction time benchmark for the lazy API namespaces.
+
+Each phase runs in a fresh interpreter so module caches are cold:
+
+- import: ``import hfortix``
+- construct: ``FortiOS(...)`` (no connection is made)
+- first endpoint: first access to ``fgt.api.cmdb.firewall.address``
+- full tree: resolving every lazily loaded namespace and endpoint, a
+  superset of what ``FortiOS()`` construction used to import (all CMDB,
+  log and service endpoints) before namespaces were loaded on first access
+
+For each phase the wall time, the number of ``hfortix`` modules loaded and
+the Python heap allocated are reported. Heap sizes come from separate runs
+with tracemalloc enabled, as tracing slows imports down considerably.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+TOKEN = "benchmarktoken0000000000000000000"
+PHASES = ("import", "construct", "first endpoint", "full tree")
+
+
+def _hfortix_modules() -> int:
+    return sum(1 for name in sys.modules if name.startswith("hfortix"))
+
+
+def _resolve_all(namespace: object) -> int:
+    """Touch every lazily created attribute below ``namespace``"""
+    from hfortix.FortiOS.api._helpers import LazyEndpoint
+
+    count = 0
+    for klass in type(namespace).__mro__:
+        for name, value in list(vars(klass).items()):
+            if isinstance(value, LazyEndpoint):
+                count += 1 + _resolve_all(getattr(namespace, name))
+    return count
+
+
+def measure(trace_heap: bool) -> None:
+    """Child process: run all phases once and report them as JSON"""
+    results = {}
+    if trace_heap:
+        tracemalloc.start()
+
+    def phase(name: str, func):
+        heap_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = func()
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "seconds": elapsed,
+            "modules": _hfortix_modules(),
+            "heap": tracemalloc.get_traced_memory()[0] - heap_before,
+        }
+        return value
+
+    def construct():
+        from hfortix import FortiOS
+
+        return FortiOS(host="192.0.2.1", token=TOKEN, verify=False)
+
+    phase("import", lambda: __import__("hfortix"))
+    fgt = phase("construct", construct)
+    phase("first endpoint", lambda: fgt.api.cmdb.firewall.address)
+    resolved = phase("full tree", lambda: _resolve_all(fgt.api))
+    results["namespaces"] = resolved
+    tracemalloc.stop()
+    fgt.close()
+    print(json.dumps(results))
+
+
+def run_child(mode: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", choices=["time", "heap"])
+    args = parser.parse_args()
+
+    if args.child:
+        measure(trace_heap=args.child == "heap")
+        return 0
+
+    runs = [run_child("time") for _ in range(args.repeat)]
+    heap_run = run_child("heap")
+    print(f"median of {args.repeat} runs, each in a fresh interpreter")
+    print(
+        f"{'phase':>15} {'time (ms)':>10} {'hfortix modules':>16} "
+        f"{'heap (MiB)':>11}"
+    )
+    summary = {}
+    for name in PHASES:
+        seconds = statistics.median(run[name]["seconds"] for run in runs)
+        heap = heap_run[name]["heap"]
+        modules = runs[-1][name]["modules"]
+        summary[name] = (seconds, modules, heap)
+        print(
+            f"{name:>15} {seconds * 1000:>10.1f} {modules:>16} "
+            f"{heap / 2**20:>11.2f}"
+        )
+    print(f"{runs[-1]['namespaces']} lazily created attributes in the tree")
+
+    construct, full = summary["construct"], summary["full tree"]
+    print(
+        f"Construction loads {full[1] - construct[1]} fewer modules; "
+        f"resolving the whole tree would take {full[0] * 1000:.0f} ms and "
+        f"{full[2] / 2**20:.1f} MiB"
+    )
+
+    # Construction must not import the endpoint tree; the full tree must
+    # still be reachable
+    ok = construct[1] < 50 and runs[-1]["namespaces"] > 400
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+JSON decode share of request time, per JSON codec.
+
+Serves representative FortiOS payloads (a firewall policy table with
+nested interface/address references, and a large address table) from a
+local stand-in FortiGate and fetches them with ``HTTPClient`` using each
+available codec (``json_codec="json"``, ``"orjson"``, ``"msgspec"``).
+For every payload and codec the median request time and the median time
+to decode the same body alone are reported, together with the share of
+the request spent decoding. The ``response.json()`` row is how responses
+were decoded before codecs were pluggable.
+
+The stand-in serves pre-encoded bodies over loopback, so request time is
+mostly client-side work; on a real FortiGate the decode share is lower,
+but the CPU saved per request is the same.
+
+Usage:
+    python benchmarks/json_codec.py
+    python benchmarks/json_codec.py --policies 5000 --addresses 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS.http_client import HTTPClient  # noqa: E402
+from hfortix.FortiOS.json_codec import get_json_codec  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+
+
+def _refs(prefix: str, count: int) -> list[dict[str, str]]:
+    return [
+        {"name": f"{prefix}-{n}", "q_origin_key": f"{prefix}-{n}"}
+        for n in range(count)
+    ]
+
+
+def build_policies(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "policyid": i,
+            "q_origin_key": i,
+            "status": "enable",
+            "name": f"policy-{i}",
+            "uuid": f"6c8f6c1e-3b1a-51ee-{i:04x}-{i * 7919:012x}"[:36],
+            "srcintf": _refs("port", 1 + i % 3),
+            "dstintf": _refs("wan", 1 + i % 2),
+            "action": "accept" if i % 4 else "deny",
+            "srcaddr": _refs(f"net-{i % 50}", 1 + i % 5),
+            "dstaddr": _refs(f"srv-{i % 80}", 1 + i % 4),
+            "srcaddr6": [],
+            "dstaddr6": [],
+            "internet-service": "disable",
+            "schedule": "always",
+            "service": _refs("svc", 1 + i % 6),
+            "inspection-mode": "flow",
+            "profile-type": "single",
+            "av-profile": "default" if i % 2 else "",
+            "webfilter-profile": "",
+            "ips-sensor": "default",
+            "application-list": "default",
+            "ssl-ssh-profile": "certificate-inspection",
+            "logtraffic": "all",
+            "logtraffic-start": "disable",
+            "nat": "enable" if i % 3 == 0 else "disable",
+            "ippool": "disable",
+            "poolname": [],
+            "users": [],
+            "groups": _refs("grp", i % 2),
+            "comments": f"Managed by automation, change {i * 31}",
+            "hit-count": i * 1013,
+            "session-ttl": "0",
+            "vlan-cos-fwd": 255,
+            "vlan-cos-rev": 255,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def build_addresses(count: int) -> list[dict[str, Any]]:
+    hosts = (
+        f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(count)
+    )
+    return [
+        {
+            "name": f"host-{ip}",
+            "q_origin_key": f"host-{ip}",
+            "uuid": f"0f4a7e2c-3b1a-51ee-8c9d-{i:012x}",
+            "subnet": f"{ip} 255.255.255.255",
+            "type": "ipmask",
+            "sub-type": "sdn",
+            "clearpass-spt": "unknown",
+            "macaddr": [],
+            "start-ip": "0.0.0.0",
+            "end-ip": "0.0.0.0",
+            "fqdn": "",
+            "country": "",
+            "cache-ttl": 0,
+            "sdn": "",
+            "fsso-group": [],
+            "interface": "",
+            "obj-type": "ip",
+            "comment": "",
+            "associated-interface": "",
+            "color": i % 32,
+            "filter": "",
+            "sdn-addr-type": "private",
+            "node-ip-only": "disable",
+            "obj-id": "",
+            "list": [],
+            "tagging": [],
+            "allow-routing": "disable",
+            "fabric-object": "disable",
+        }
+        for i, ip in enumerate(hosts)
+    ]
+
+
+def envelope(name: str, results: list[dict[str, Any]]) -> bytes:
+    return json.dumps(
+        {
+            "http_method": "GET",
+            "size": len(results),
+            "matched_count": len(results),
+            "next_idx": len(results) - 1,
+            "revision": "8f3e2a1b9c7d6e5f4a3b2c1d0e9f8a7b",
+            "results": results,
+            "vdom": "root",
+            "path": "firewall",
+            "name": name,
+            "action": "",
+            "status": "success",
+            "http_status": 200,
+            "serial": "FGVMSTANDIN00001",
+            "version": "v7.6.0",
+            "build": 3401,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def median_seconds(func: Callable[[], Any], repeat: int) -> float:
+    func()  # warm up
+    samples = []
+    for _ in range(repeat):
+        # Don't bill one sample for the garbage of the previous one
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def available_codecs() -> list[str]:
+    names = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            get_json_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--policies", type=int, default=2000)
+    parser.add_argument("--addresses", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    payloads = {
+        "firewall/policy": envelope("policy", build_policies(args.policies)),
+        "firewall/address": envelope(
+            "address", build_addresses(args.addresses)
+        ),
+    }
+    codecs = available_codecs()
+    print(f"codecs available: {', '.join(codecs)}")
+
+    ok = True
+    with StandInFortiGate() as fgt:
+        for path, body in payloads.items():
+            fgt.add_raw(f"cmdb/{path}", body)
+
+        for path, body in payloads.items():
+            expected = json.loads(body)["results"]
+            print(
+                f"\ncmdb/{path}: {len(expected)} entries, "
+                f"{len(body) / 2**20:.1f} MiB"
+            )
+            print(
+                f"{'codec':>16} {'request (ms)':>13} {'decode (ms)':>12} "
+                f"{'decode share':>13}"
+            )
+
+            before = median_seconds(
+                lambda: httpx.Response(200, content=body).json(),
+                args.repeat,
+            )
+            print(f"{'response.json()':>16} {'':>13} {before * 1000:>12.1f}")
+
+            decode_times = {}
+            for name in codecs:
+                client = HTTPClient(
+                    url=fgt.url, token=TOKEN, verify=False, json_codec=name
+                )
+                codec = client.json_codec
+                try:
+                    if client.get("cmdb", path) != expected:
+                        print(f"FAIL: {name} decoded a different result")
+                        ok = False
+                    request = median_seconds(
+                        lambda: client.get("cmdb", path), args.repeat
+                    )
+                finally:
+                    client.close()
+                decode = median_seconds(lambda: codec.loads(body), args.repeat)
+                decode_times[name] = decode
+                print(
+                    f"{name:>16} {request * 1000:>13.1f} "
+                    f"{decode * 1000:>12.1f} {decode / request:>13.0%}"
+                )
+
+            fastest = min(decode_times, key=decode_times.__getitem__)
+            print(
+                f"fastest decode: {fastest} "
+                f"({before / decode_times[fastest]:.1f}x response.json())"
+            )
+            # A fast codec, when installed, must beat the stdlib
+            if fastest == "json" and len(codecs) > 1:
+                ok = False
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Raw log parsing throughput in lines/second.
+
+Generates FortiOS traffic log lines (key=value format with quoted strings,
+IP addresses, counters and occasional optional fields) and parses them:
+
+- ``row-by-row``: a typical hand-written parser producing one dict per
+  line, converting each value on its own
+- ``parse_lines (lists)``: the columnar parser with plain list columns
+- ``parse_lines (numpy)``: the columnar parser with NumPy columns (if
+  NumPy is installed)
+
+Then reads the same lines from a local stand-in FortiGate through
+``raw.iter_batches()`` to show end-to-end ingestion throughput.
+
+Usage:
+    python benchmarks/log_parser.py
+    python benchmarks/log_parser.py --lines 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS.api.v2.log.disk.disk import Disk  # noqa: E402
+from hfortix.FortiOS.api.v2.log.parser import parse_lines  # noqa: E402
+from hfortix.FortiOS.http_client import HTTPClient  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+
+_PAIR = re.compile(r'([^\s=]+)=("(?:[^"\\]|\\.)*"|\S*)')
+
+
+def build_lines(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    apps = ["HTTPS", "DNS", "SSH", "NTP", "Microsoft.Teams"]
+    lines = []
+    for i in range(count):
+        sent = rng.randrange(40, 10**7)
+        line = (
+            f"date=2026-01-15 time=10:{i // 60 % 60:02d}:{i % 60:02d} "
+            f'eventtime={1768472625000000000 + i * 1000} tz="+0100" '
+            f'logid="0000000013" type="traffic" subtype="forward" '
+            f'level="notice" vd="root" srcip=10.1.{i >> 8 & 255}.{i & 255} '
+            f'srcport={rng.randrange(1024, 65535)} srcintf="port2" '
+            f'srcintfrole="lan" dstip=142.250.{rng.randrange(256)}.'
+            f"{rng.randrange(256)} dstport={rng.choice([443, 53, 22, 123])} "
+            f'dstintf="port1" dstintfrole="wan" srccountry="Reserved" '
+            f'dstcountry="United States" sessionid={900000 + i} proto=6 '
+            f'action="close" policyid={1 + i % 40} policytype="policy" '
+            f'policyname="LAN to WAN {i % 40}" service="{rng.choice(apps)}" '
+            f'trandisp="snat" transip=203.0.113.5 '
+            f"transport={rng.randrange(1024, 65535)} "
+            f"duration={rng.randrange(1, 3600)} sentbyte={sent} "
+            f"rcvdbyte={sent * 3 + 17} sentpkt={sent // 1400 + 1} "
+            f"rcvdpkt={sent // 500 + 1}"
+        )
+        if i % 7 == 0:
+            line += ' appcat="unscanned" crscore=5 craction=262144'
+        lines.append(line)
+    return lines
+
+
+def row_by_row(lines: list[str]) -> list[dict[str, Any]]:
+    records = []
+    for line in lines:
+        record: dict[str, Any] = {}
+        for key, value in _PAIR.findall(line):
+            if value.startswith('"'):
+                record[key] = value[1:-1]
+                continue
+            try:
+                record[key] = int(value)
+            except ValueError:
+                try:
+                    record[key] = float(value)
+                except ValueError:
+                    record[key] = value
+        records.append(record)
+    return records
+
+
+def best_seconds(func: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = build_lines(args.lines)
+    size = sum(map(len, lines)) / 2**20
+    print(f"{args.lines} traffic log lines, {size:.1f} MiB")
+
+    expected = row_by_row(lines)
+    ok = parse_lines(lines, use_numpy=False).to_records() == expected
+    if not ok:
+        print("FAIL: columnar parser produced different records")
+
+    parsers = {
+        "row-by-row": lambda: row_by_row(lines),
+        "parse_lines (lists)": lambda: parse_lines(lines, use_numpy=False),
+    }
+    try:
+        import numpy  # noqa: F401
+
+        parsers["parse_lines (numpy)"] = lambda: parse_lines(
+            lines, use_numpy=True
+        )
+    except ImportError:
+        print("numpy not installed, skipping NumPy columns")
+
+    print(f"{'parser':>22} {'seconds':>9} {'lines/s':>11} {'speedup':>8}")
+    rates = {}
+    for name, func in parsers.items():
+        seconds = best_seconds(func, args.repeat)
+        rates[name] = args.lines / seconds
+        print(
+            f"{name:>22} {seconds:>9.3f} {rates[name]:>11,.0f} "
+            f"{rates[name] / rates['row-by-row']:>7.1f}x"
+        )
+    if rates["parse_lines (lists)"] < rates["row-by-row"]:
+        ok = False
+
+    body = ("\n".join(lines) + "\n").encode()
+    with StandInFortiGate() as fgt:
+        fgt.add_raw("log/disk/traffic/forward/raw", body)
+        client = HTTPClient(url=fgt.url, token=TOKEN, verify=False)
+        try:
+            raw = Disk(client).traffic.forward.raw
+            start = time.perf_counter()
+            total = 0
+            sent = 0
+            # The stand-in ignores rows/start and returns every line at once
+            for batch in raw.iter_batches(rows=args.lines + 1):
+                total += len(batch)
+                sent += int(sum(batch["sentbyte"]))
+            seconds = time.perf_counter() - start
+        finally:
+            client.close()
+    print(
+        f"\nraw.iter_batches() from stand-in: {total} lines in "
+        f"{seconds:.3f}s ({total / seconds:,.0f} lines/s)"
+    )
+    if total != args.lines or sent != sum(r["sentbyte"] for r in expected):
+        print("FAIL: iter_batches() lost or changed lines")
+        ok = False
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
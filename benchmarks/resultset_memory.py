@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Compact result set memory benchmark.
+
+Builds synthetic 100,000-entry firewall/address and firewall/policy tables
+shaped like FortiOS 7.6 responses (40-90 fields, mostly defaults, member
+lists of interfaces, addresses and services), encodes them as 1000-entry
+JSON pages and decodes them the way the client does. Each table is then
+held three ways:
+
+- dicts: the decoded entries, what get() returns
+- compact: ResultSet built from the decoded entries (get(compact=True))
+- collect: ResultSet built page by page (collect()), so the decoded
+  dicts of only one page exist at a time
+
+Reports steady-state heap, peak heap while building and build time, and
+checks that the result sets convert back to the original dicts. Heap sizes
+come from a separate run with tracemalloc enabled.
+
+Usage:
+    python benchmarks/resultset_memory.py
+    python benchmarks/resultset_memory.py --entries 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hfortix.FortiOS.resultset import ResultSet  # noqa: E402
+
+PAGE = 1000
+INTERFACES = [f"port{i}" for i in range(1, 9)] + ["wan1", "wan2", "lan"]
+SERVICES = ["HTTP", "HTTPS", "DNS", "SSH", "ALL"] + [
+    f"svc-{i}" for i in range(45)
+]
+SETTINGS = [f"setting-{i}" for i in range(60)]
+
+
+def member(name: str) -> dict:
+    return {"name": name, "q_origin_key": name}
+
+
+def members(rng: random.Random, names: list[str], most: int) -> list:
+    return [member(name) for name in rng.sample(names, rng.randint(1, most))]
+
+
+def address(i: int, rng: random.Random) -> dict:
+    return {
+        "name": f"host-{i}",
+        "q_origin_key": f"host-{i}",
+        "uuid": f"6b1c1e2a-0000-51ee-8d0f-{i:012x}",
+        "subnet": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256} "
+        "255.255.255.255",
+        "type": "ipmask",
+        "route-tag": 0,
+        "sub-type": "sdn",
+        "clearpass-spt": "unknown",
+        "macaddr": [],
+        "start-ip": "0.0.0.0",
+        "end-ip": "0.0.0.0",
+        "fqdn": "",
+        "country": "",
+        "wildcard-fqdn": "",
+        "cache-ttl": 0,
+        "wildcard": "0.0.0.0 0.0.0.0",
+        "sdn": "",
+        "fsso-group": [],
+        "sso-attribute-value": [],
+        "interface": "",
+        "tenant": "",
+        "organization": "",
+        "epg-name": "",
+        "subnet-name": "",
+        "sdn-tag": "",
+        "policy-group": "",
+        "obj-tag": "",
+        "obj-type": "ip",
+        "tag-detection-level": "",
+        "tag-type": "",
+        "hw-vendor": "",
+        "hw-model": "",
+        "os": "",
+        "sw-version": "",
+        "comment": "imported" if i % 10 == 0 else "",
+        "associated-interface": "",
+        "color": i % 4,
+        "filter": "",
+        "sdn-addr-type": "private",
+        "node-ip-only": "disable",
+        "obj-id": "",
+        "list": [],
+        "tagging": [],
+        "allow-routing": "disable",
+        "fabric-object": "disable",
+    }
+
+
+def policy(i: int, rng: random.Random) -> dict:
+    addresses = [f"host-{rng.randrange(100000)}" for _ in range(8)]
+    entry = {
+        "policyid": i + 1,
+        "q_origin_key": i + 1,
+        "status": "enable",
+        "name": f"rule-{i}",
+        "uuid": f"0c1d2e3f-0000-51ee-9a0b-{i:012x}",
+        "srcintf": members(rng, INTERFACES, 2),
+        "dstintf": members(rng, INTERFACES, 2),
+        "action": "accept" if i % 5 else "deny",
+        "srcaddr": members(rng, addresses, 4),
+        "dstaddr": members(rng, addresses, 4),
+        "internet-service": "disable",
+        "schedule": "always",
+        "service": members(rng, SERVICES, 3),
+        "logtraffic": "all" if i % 3 else "utm",
+        "nat": "enable" if i % 2 else "disable",
+        "inspection-mode": "flow",
+        "utm-status": "enable" if i % 4 == 0 else "disable",
+        "av-profile": "default" if i % 4 == 0 else "",
+        "comments": f"ticket CHG{i:06d}" if i % 7 == 0 else "",
+        "groups": [],
+        "users": [],
+    }
+    for j, name in enumerate(SETTINGS):
+        entry[name] = ("disable", "enable", "", 0)[(i + j) % 4 if j < 8 else 0]
+    return entry
+
+
+def pages(kind: str, entries: int) -> list[bytes]:
+    """The table as JSON pages, as a FortiGate would send them"""
+    rng = random.Random(42)
+    make = address if kind == "address" else policy
+    result = []
+    for start in range(0, entries, PAGE):
+        page = [make(i, rng) for i in range(start, min(start + PAGE, entries))]
+        result.append(json.dumps({"results": page}).encode())
+    return result
+
+
+def decode(page: bytes) -> list:
+    return json.loads(page)["results"]
+
+
+def measure(kind: str, entries: int, trace_heap: bool) -> None:
+    """Child process: build the table each way and report as JSON"""
+    data = pages(kind, entries)
+    field = "srcintf" if kind == "policy" else "subnet"
+    results = {}
+    if trace_heap:
+        tracemalloc.start()
+
+    def phase(name: str, build):
+        gc.collect()
+        heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        value = build()
+        seconds = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        results[name] = {
+            "seconds": seconds,
+            "heap": current - heap,
+            "peak": peak - heap,
+        }
+        return value
+
+    dicts = phase("dicts", lambda: [e for page in data for e in decode(page)])
+    if not trace_heap:
+        start = time.perf_counter()
+        for entry in dicts:
+            entry["name"], entry[field]
+        results["dicts"]["scan"] = time.perf_counter() - start
+    check = dicts if not trace_heap else None
+    del dicts
+
+    def compact() -> ResultSet:
+        decoded = [e for page in data for e in decode(page)]
+        return ResultSet(decoded, kind.title())
+
+    for name, build in (
+        ("compact", compact),
+        (
+            "collect",
+            lambda: ResultSet(
+                (e for page in data for e in decode(page)), kind.title()
+            ),
+        ),
+    ):
+        rs = phase(name, build)
+        if check is not None:
+            start = time.perf_counter()
+            for record in rs:
+                record["name"], record[field]
+            results[name]["scan"] = time.perf_counter() - start
+            results[name]["equal"] = rs.to_dicts() == check
+            results[name]["classes"] = len(rs._classes)
+        del rs
+
+    tracemalloc.stop()
+    print(json.dumps(results))
+
+
+def run_child(kind: str, entries: int, mode: str) -> dict:
+    out = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            mode,
+            "--table",
+            kind,
+            "--entries",
+            str(entries),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--child", choices=["time", "heap"])
+    parser.add_argument("--table", choices=["address", "policy"])
+    args = parser.parse_args()
+    if args.child:
+        measure(args.table, args.entries, trace_heap=args.child == "heap")
+        return 0
+
+    ok = True
+    for kind in ("address", "policy"):
+        times = run_child(kind, args.entries, "time")
+        heap = run_child(kind, args.entries, "heap")
+        print(f"firewall/{kind}: {args.entries} entries")
+        print(
+            f"{'':>9} {'heap (MiB)':>11} {'peak (MiB)':>11} "
+            f"{'build (ms)':>11} {'scan (ms)':>10} {'bytes/entry':>12}"
+        )
+        for name in ("dicts", "compact", "collect"):
+            print(
+                f"{name:>9} {heap[name]['heap'] / 2**20:>11.1f} "
+                f"{heap[name]['peak'] / 2**20:>11.1f} "
+                f"{times[name]['seconds'] * 1000:>11.0f} "
+                f"{times[name]['scan'] * 1000:>10.1f} "
+                f"{heap[name]['heap'] / args.entries:>12.0f}"
+            )
+        ratio = heap["dicts"]["heap"] / heap["compact"]["heap"]
+        print(f"ResultSet is {ratio:.1f}x smaller than dicts")
+        if not (times["compact"]["equal"] and times["collect"]["equal"]):
+            print("FAIL: to_dicts() differs from the decoded entries")
+            ok = False
+        ok = (
+            ok
+            and ratio > 3
+            and heap["collect"]["peak"] < heap["dicts"]["heap"] / 2
+        )
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Firmware-aware schema cache benchmark.
+
+A fleet of local stand-in FortiGates on three firmware builds (with
+injected per-request latency) serves ``action=schema`` for
+firewall/address and firewall/policy. Every device validates the same
+import against its own firmware three ways:
+
+- naive: fetch both schemas from every device on every run
+- cold: SchemaCache with an empty disk cache (first run)
+- warm: a new SchemaCache and new clients on the same disk cache (every
+  later run, e.g. the next cron job)
+
+Schema requests must drop to one per table and firmware build when cold
+and to none when warm, and the validation results must follow each
+device's firmware (a field only the newest build has, a wider color
+range). Finally the import is posted through clients created with
+``schema_cache=``: payloads a device's firmware rejects must raise
+ValueError without being sent, the others must be created.
+
+Usage:
+    python benchmarks/schema_cache.py
+    python benchmarks/schema_cache.py --devices 60 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+from hfortix.FortiOS.scheduler import table_name  # noqa: E402
+from hfortix.FortiOS.schema import SchemaCache, TableSchema  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+FIRMWARE = [("v7.0.15", 632), ("v7.2.10", 1706), ("v7.6.0", 3401)]
+
+
+def address_schema(build: int) -> dict:
+    children = {
+        "name": {"type": "string", "size": 79, "required": True},
+        "uuid": {"type": "uuid"},
+        "type": {
+            "type": "option",
+            "options": [
+                {"name": "ipmask"},
+                {"name": "iprange"},
+                {"name": "fqdn"},
+                {"name": "geography"},
+            ],
+        },
+        "subnet": {"type": "ipv4-classnet-any"},
+        "fqdn": {"type": "string", "size": 255},
+        "comment": {"type": "var-string", "size": 255},
+        "color": {
+            "type": "integer",
+            "min-value": 0,
+            "max-value": 32 if build < 3000 else 40,
+        },
+        "allow-routing": {
+            "type": "option",
+            "options": [{"name": "enable"}, {"name": "disable"}],
+        },
+    }
+    if build >= 3000:
+        children["route-tag"] = {
+            "type": "integer",
+            "min-value": 1,
+            "max-value": 4294967295,
+        }
+    return {
+        "name": "address",
+        "category": "table",
+        "mkey": "name",
+        "children": children,
+    }
+
+
+def policy_schema(build: int) -> dict:
+    # A realistically sized table: a few hundred fields
+    children = {
+        "policyid": {
+            "type": "integer",
+            "min-value": 0,
+            "max-value": 4294967294,
+        },
+        "name": {"type": "string", "size": 35},
+        "action": {
+            "type": "option",
+            "options": [
+                {"name": "accept"},
+                {"name": "deny"},
+                {"name": "ipsec"},
+            ],
+        },
+    }
+    for i in range(300 + build % 7):
+        children[f"setting-{i}"] = {
+            "type": "option",
+            "options": [{"name": "enable"}, {"name": "disable"}],
+            "help": "Enable/disable this setting. " * 4,
+        }
+    return {
+        "name": "policy",
+        "category": "table",
+        "mkey": "policyid",
+        "children": children,
+    }
+
+
+def payloads() -> list[dict]:
+    return [
+        {
+            "name": "web-1",
+            "type": "fqdn",
+            "fqdn": "www.example.com",
+            "color": 3,
+        },
+        {
+            "name": "web-2",
+            "type": "ipmask",
+            "subnet": "10.0.0.1/32",
+            "color": 36,
+        },
+        {
+            "name": "web-3",
+            "type": "ipmask",
+            "subnet": "10.0.0.2/32",
+            "route-tag": 7,
+        },
+    ]
+
+
+def connect(url: str, **options) -> FortiOS:
+    fgt = FortiOS(
+        host=url.split("://", 1)[1],
+        token=TOKEN,
+        verify=False,
+        max_retries=0,
+        **options,
+    )
+    fgt._client._url = url  # stand-in speaks plain HTTP
+    return fgt
+
+
+def schemas_sent(servers: list[StandInFortiGate]) -> int:
+    return sum(server.schema_requests for server in servers)
+
+
+def run(servers, cache, workers: int) -> tuple[float, list]:
+    """Validate the import on every device with a shared cache"""
+
+    def device(server) -> list:
+        fgt = connect(server.url)
+        firewall = fgt.api.cmdb.firewall
+        if cache is None:
+            # Naive: ask the device for both schemas, every time
+            schemas = [
+                _fetch(firewall.address),
+                _fetch(firewall.policy),
+            ]
+        else:
+            schemas = [cache.get(firewall.address), cache.get(firewall.policy)]
+        fgt.close()
+        return schemas[0].check_all(payloads())
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(device, servers))
+    return time.perf_counter() - start, results
+
+
+def post_all(server, cache) -> list[bool]:
+    """Post the import through a client that checks writes; True = sent"""
+    fgt = connect(server.url, schema_cache=cache)
+    sent = []
+    for payload in payloads():
+        try:
+            fgt.api.cmdb.firewall.address.post(payload_dict=payload)
+        except ValueError:
+            sent.append(False)
+        else:
+            sent.append(True)
+    fgt.close()
+    return sent
+
+
+def _fetch(endpoint) -> TableSchema:
+    response = endpoint.get(action="schema", raw_json=True)
+    return TableSchema(
+        table_name(endpoint),
+        response["version"],
+        response["build"],
+        response["results"],
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=30)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.03,
+        help="Injected server latency per request in seconds",
+    )
+    args = parser.parse_args()
+    logging.getLogger("hfortix").setLevel(logging.CRITICAL)
+
+    servers = []
+    for i in range(args.devices):
+        version, build = FIRMWARE[i % len(FIRMWARE)]
+        server = StandInFortiGate(
+            latency=args.latency, version=version, build=build
+        ).start()
+        server.add_schema("cmdb/firewall/address", address_schema(build))
+        server.add_schema("cmdb/firewall/policy", policy_schema(build))
+        server.add_table("cmdb/firewall/address", [])
+        servers.append(server)
+    print(
+        f"{args.devices} devices on {len(FIRMWARE)} firmware builds, "
+        f"{args.latency * 1000:.0f}ms latency"
+    )
+
+    ok = True
+    with tempfile.TemporaryDirectory() as directory:
+        timings = {}
+        for label, cache in [
+            ("naive", None),
+            ("cold", SchemaCache(directory)),
+            ("warm", SchemaCache(directory)),
+        ]:
+            before = schemas_sent(servers)
+            elapsed, results = run(servers, cache, args.workers)
+            sent = schemas_sent(servers) - before
+            timings[label] = elapsed
+            print(f"{label:>6} {elapsed:>7.2f}s {sent:>5} schema requests")
+            expected = {"naive": 2 * args.devices, "cold": 6, "warm": 0}
+            if sent != expected[label]:
+                print(f"FAIL: expected {expected[label]} schema requests")
+                ok = False
+            for server, result in zip(servers, results):
+                valid = [valid for valid, _ in result]
+                newest = server.build >= 3000
+                if valid != [True, newest, newest]:
+                    print(f"FAIL: {server.version} validated {result}")
+                    ok = False
+        # Writes checked by the client, on the warm cache
+        before = schemas_sent(servers)
+        cache = SchemaCache(directory)
+        for server in servers:
+            newest = server.build >= 3000
+            sent = post_all(server, cache)
+            created = len(server.tables["cmdb/firewall/address"])
+            if sent != [True, newest, newest] or created != sum(sent):
+                print(f"FAIL: {server.version} sent {sent}, created {created}")
+                ok = False
+        sent = schemas_sent(servers) - before
+        print(f"checked writes: {sent} schema requests")
+        if sent:
+            print("FAIL: expected the warm cache to serve checked writes")
+            ok = False
+        files = sorted(
+            str(path.relative_to(directory))
+            for path in Path(directory).rglob("*.json")
+        )
+        print(f"disk cache: {', '.join(files)}")
+
+    for server in servers:
+        server.stop()
+    speedup = timings["naive"] / timings["warm"]
+    print(f"Warm cache is {speedup:.1f}x faster than fetching schemas")
+    ok = ok and speedup > 1.5
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for streaming JSON decoding of huge responses.
+
+Serves one large table (internet-service style entries) from a local
+stand-in FortiGate and reads it once with the regular ``get()`` path
+(``response.json()`` on the full body) and once with ``get_stream()``,
+which decodes the ``results`` array incrementally. Each mode runs in a
+fresh subprocess so peak RSS is not shared between them; the Python heap
+peak is measured with tracemalloc (which also slows both runs down, so the
+times are only comparable with each other).
+
+Before that, a small response with every kind of JSON value (negative,
+fractional and exponent numbers, escapes, nested arrays) is fed to the
+streaming parser split in two at every offset and must decode exactly
+like ``json.loads``.
+
+Usage:
+    python benchmarks/stream_memory.py
+    python benchmarks/stream_memory.py --records 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS import FortiOS  # noqa: E402
+from hfortix.FortiOS.json_stream import ResultsStreamParser  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+TABLE = "cmdb/firewall/internet-service"
+
+
+def build_body(records: int) -> bytes:
+    entries = [
+        {
+            "id": 65536 + i,
+            "name": f"Vendor-{i % 997}-Service.{i}",
+            "q_origin_key": 65536 + i,
+            "reputation": i % 5,
+            "icon-id": i % 400,
+            "sld-id": i,
+            "direction": "both",
+            "database": "isdb",
+            "ip-range-number": i * 7 % 10000,
+            "extra-ip-range-number": 0,
+            "ip-number": i * 13 % 100000,
+            "singularity": 0,
+            "obsolete": 0,
+        }
+        for i in range(records)
+    ]
+    envelope = {
+        "http_method": "GET",
+        "size": records,
+        "matched_count": records,
+        "results": entries,
+        "vdom": "root",
+        "path": "firewall",
+        "name": "internet-service",
+        "status": "success",
+        "http_status": 200,
+    }
+    return json.dumps(envelope).encode()
+
+
+SPLIT_SAMPLE = (
+    '{"http_method": "GET", "results": [-2500.0, 0, 12, -1.5e-3, 1E+2, '
+    'true, false, null, "tab\\t \\"quoted\\" \\u00e9", [], {}, '
+    '{"id": 7, "rate": 0.25, "members": [{"name": "port1"}], '
+    '"note": ""}], "vdom": "root", "size": 13, "status": "success"}'
+)
+
+
+def split_check(body: str = SPLIT_SAMPLE) -> list[int]:
+    """Offsets where decoding the body in two chunks gives other results"""
+    expected = json.loads(body)
+    failed = []
+    for offset in range(len(body) + 1):
+        parser = ResultsStreamParser()
+        try:
+            entries = parser.feed(body[:offset])
+            entries += parser.feed(body[offset:])
+            entries += parser.close()
+        except ValueError:
+            failed.append(offset)
+            continue
+        envelope = dict(parser.envelope, results=entries)
+        if envelope != expected:
+            failed.append(offset)
+    return failed
+
+
+def measure(url: str, mode: str) -> None:
+    """Child process: read the table once and report memory as JSON"""
+    fgt = FortiOS(host=url.split("://", 1)[1], token=TOKEN, verify=False)
+    fgt._client._url = url  # stand-in speaks plain HTTP
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = 0
+    if mode == "stream":
+        for entry in fgt._client.get_stream("cmdb", TABLE.split("/", 1)[1]):
+            count += entry["sld-id"] >= 0
+    else:
+        for entry in fgt._client.get("cmdb", TABLE.split("/", 1)[1]):
+            count += entry["sld-id"] >= 0
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    fgt.close()
+    print(
+        json.dumps(
+            {
+                "count": count,
+                "elapsed": elapsed,
+                "heap_peak": peak,
+                "rss_growth": (rss_after - rss_before) * 1024,
+            }
+        )
+    )
+
+
+def run_child(url: str, mode: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, "--url", url],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--child", choices=["full", "stream"])
+    parser.add_argument("--url")
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.url, args.child)
+        return 0
+
+    failed = split_check()
+    print(
+        f"split check: {len(SPLIT_SAMPLE) + 1} chunk boundaries, "
+        f"{len(failed)} failed"
+    )
+    if failed:
+        print(f"FAIL: wrong result when split at offsets {failed}")
+
+    body = build_body(args.records)
+    print(f"{args.records} records, {len(body) / 2**20:.1f} MiB response")
+    print(
+        f"{'mode':>8} {'time (s)':>9} {'heap peak (MiB)':>16} "
+        f"{'RSS growth (MiB)':>17}"
+    )
+    results = {}
+    with StandInFortiGate() as server:
+        server.add_raw(TABLE, body)
+        for mode in ("full", "stream"):
+            res = run_child(server.url, mode)
+            assert res["count"] == args.records, res
+            results[mode] = res
+            print(
+                f"{mode:>8} {res['elapsed']:>9.2f} "
+                f"{res['heap_peak'] / 2**20:>16.1f} "
+                f"{res['rss_growth'] / 2**20:>17.1f}"
+            )
+
+    ratio = results["full"]["heap_peak"] / results["stream"]["heap_peak"]
+    print(f"Streaming peak heap is {ratio:.0f}x smaller")
+
+    # The streaming path must not hold the whole response in memory
+    ok = ratio > 10 and not failed
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Thread stress benchmark for a shared sync HTTPClient.
+
+Runs N worker threads against ONE HTTPClient instance talking to a local
+stand-in FortiGate with injected latency and reports:
+
+- Throughput per thread count (should scale roughly linearly until the
+  connection pool or server saturates)
+- Cross-talk: every request carries a unique tag that must come back in
+  its own response
+- Timeout isolation: one endpoint has a very short per-endpoint timeout;
+  requests to other endpoints must never inherit it
+- Statistics consistency: total/successful request counters must match
+  the number of requests issued
+
+Usage:
+    python benchmarks/thread_stress.py
+    python benchmarks/thread_stress.py --threads 1 4 16 32 --requests 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _standin import StandInFortiGate  # noqa: E402
+
+from hfortix.FortiOS.http_client import HTTPClient  # noqa: E402
+
+TOKEN = "benchmarktoken0000000000000000000"
+
+
+def _worker(client: HTTPClient, thread_id: int, requests: int) -> int:
+    """Issue tagged requests and return the number of mismatches seen"""
+    mismatches = 0
+    for i in range(requests):
+        tag = f"{thread_id}-{i}"
+        result = client.get("monitor", "bench/echo", params={"tag": tag})
+        if result.get("tag") != tag:
+            mismatches += 1
+    return mismatches
+
+
+def run_scaling(
+    server: StandInFortiGate, thread_counts: list[int], requests: int
+) -> list[tuple[int, float, int, bool]]:
+    """Measure throughput of one shared client across thread counts"""
+    rows = []
+    for threads in thread_counts:
+        client = HTTPClient(
+            url=server.url,
+            token=TOKEN,
+            verify=False,
+            max_connections=max(thread_counts),
+            max_keepalive_connections=max(thread_counts),
+        )
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [
+                pool.submit(_worker, client, t, requests)
+                for t in range(threads)
+            ]
+            mismatches = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+        stats = client.get_retry_stats()
+        consistent = (
+            stats["total_requests"] == threads * requests
+            and stats["successful_requests"] == threads * requests
+        )
+        client.close()
+        rows.append(
+            (threads, threads * requests / elapsed, mismatches, consistent)
+        )
+    return rows
+
+
+def run_timeout_isolation(server: StandInFortiGate, threads: int) -> int:
+    """
+    Return the number of requests that failed with a borrowed timeout
+
+    ``monitor/bench/fast`` gets a 50ms read timeout and answers instantly.
+    ``monitor/bench/slow`` answers after 150ms and uses the default read
+    timeout, so it must never time out.
+    """
+    client = HTTPClient(
+        url=server.url,
+        token=TOKEN,
+        verify=False,
+        max_retries=0,
+        max_connections=threads * 2,
+        max_keepalive_connections=threads * 2,
+    )
+    client.configure_endpoint_timeout("monitor/bench/fast", read_timeout=0.05)
+
+    def hammer(path: str) -> int:
+        failures = 0
+        for _ in range(10):
+            try:
+                client.get("monitor", path)
+            except Exception:
+                failures += 1
+        return failures
+
+    with ThreadPoolExecutor(max_workers=threads * 2) as pool:
+        futures = [pool.submit(hammer, "bench/fast") for _ in range(threads)]
+        futures += [pool.submit(hammer, "bench/slow") for _ in range(threads)]
+        failures = sum(f.result() for f in futures)
+    client.close()
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16]
+    )
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.01,
+        help="Injected server latency per request in seconds",
+    )
+    args = parser.parse_args()
+
+    ok = True
+    with StandInFortiGate(
+        latency=args.latency, path_latency={"monitor/bench/slow": 0.15}
+    ) as server:
+        print(f"Shared HTTPClient, {args.latency * 1000:.0f}ms latency")
+        print(
+            f"{'threads':>8} {'req/s':>10} {'speedup':>8} "
+            f"{'mismatch':>9} {'stats':>6}"
+        )
+        rows = run_scaling(server, args.threads, args.requests)
+        base = rows[0][1]
+        for threads, rps, mismatches, consistent in rows:
+            print(
+                f"{threads:>8} {rps:>10.1f} {rps / base:>7.1f}x "
+                f"{mismatches:>9} {'ok' if consistent else 'BAD':>6}"
+            )
+            ok = ok and mismatches == 0 and consistent
+
+        failures = run_timeout_isolation(server, max(args.threads))
+        print(f"Timeout isolation: {failures} borrowed-timeout failures")
+        ok = ok and failures == 0
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
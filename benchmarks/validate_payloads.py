@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Payload validation throughput benchmark.
+
+Validates a bulk import of firewall policies with the if-chain the
+validator generator used to emit for every endpoint (one
+``if "field" in payload`` block per field, enum checks as list scans),
+rebuilt from the same table so it checks exactly the same constraints,
+and with the table-driven validators: ``validate_policy_post()`` per
+payload and ``SCHEMA.check_all()`` for the whole batch. Results must be
+identical. Also reports the source size of all validator modules.
+
+Usage:
+    python benchmarks/validate_payloads.py
+    python benchmarks/validate_payloads.py --objects 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hfortix.FortiOS.api.v2.cmdb.firewall._helpers import (  # noqa: E402
+    policy,
+)
+
+
+def if_chain(schema) -> callable:
+    """The former generated validate_<endpoint>_post(), as source"""
+    lines = ["def validate(payload):"]
+    constants = {}
+    for field, rule in schema.body.items():
+        lines.append(f"    if {field!r} in payload:")
+        lines.append(f"        value = payload.get({field!r})")
+        if isinstance(rule, tuple):
+            low, high = rule
+            lines += [
+                "        if value is not None:",
+                "            try:",
+                "                int_val = int(value)",
+                f"                if int_val < {low} or int_val > {high}:",
+                f"                    return (False, '{field} must be "
+                f"between {low} and {high}')",
+                "            except (ValueError, TypeError):",
+                f"                return (False, f'{field} must be "
+                "numeric, got: {value}')",
+            ]
+        elif isinstance(rule, int):
+            lines += [
+                "        if value and isinstance(value, str) and "
+                f"len(value) > {rule}:",
+                f"            return (False, '{field} cannot exceed {rule} "
+                "characters')",
+            ]
+        else:
+            name = f"VALID_{len(constants)}"
+            constants[name] = list(rule)
+            lines += [
+                f"        if value and value not in {name}:",
+                f"            return (False, f\"Invalid {field} '{{value}}'. "
+                f"Must be one of: {{', '.join({name})}}\")",
+            ]
+    lines.append("    return (True, None)")
+    namespace = dict(constants)
+    exec("\n".join(lines), namespace)
+    return namespace["validate"]
+
+
+def payloads(count: int) -> list[dict]:
+    rng = random.Random(0)
+    items = []
+    for i in range(count):
+        item = {
+            "policyid": i + 1,
+            "name": f"allow-{i}",
+            "srcintf": [{"name": "port1"}],
+            "dstintf": [{"name": "port2"}],
+            "srcaddr": [{"name": f"grp-{i % 50}"}],
+            "dstaddr": [{"name": f"host-{i}"}],
+            "service": [{"name": "HTTPS"}],
+            "schedule": "always",
+            "action": rng.choice(["accept", "deny"]),
+            "status": "enable",
+            "logtraffic": rng.choice(["all", "utm"]),
+            "nat": rng.choice(["enable", "disable"]),
+            "inspection-mode": "flow",
+            "comments": "imported",
+        }
+        if i % 100 == 0:
+            item["action"] = "drop"  # invalid
+        if i % 250 == 0:
+            item["name"] = "x" * 40  # too long
+        items.append(item)
+    return items
+
+
+def timed(validate, items: list[dict], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        validate(items)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def one_by_one(validate):
+    return lambda items: [validate(item) for item in items]
+
+
+def helpers_size() -> tuple[int, int]:
+    """Number and total source size of the validator modules"""
+    root = Path(policy.__file__).resolve().parents[3]
+    files = [
+        path
+        for path in root.glob("**/_helpers/*.py")
+        if path.name != "__init__.py"
+    ]
+    return len(files), sum(path.stat().st_size for path in files)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    items = payloads(args.objects)
+    chain = one_by_one(if_chain(policy.SCHEMA))
+    post = one_by_one(policy.validate_policy_post)
+    batch = policy.SCHEMA.check_all
+    print(
+        f"{args.objects} firewall policies, "
+        f"{len(policy.SCHEMA.body)} validated fields"
+    )
+    timings = {}
+    for label, validate in [
+        ("if-chain", chain),
+        ("per payload", post),
+        ("check_all", batch),
+    ]:
+        timings[label] = timed(validate, items, args.rounds)
+        print(f"{label:>12} {timings[label] * 1000:>8.1f}ms")
+
+    expected = chain(items)
+    ok = post(items) == expected and batch(items) == expected
+    if not ok:
+        print("FAIL: results differ")
+    invalid = sum(not valid for valid, _ in expected)
+    print(f"{invalid} invalid payloads found by all")
+    per_payload = timings["if-chain"] / timings["per payload"]
+    batched = timings["if-chain"] / timings["check_all"]
+    print(f"Per-payload validation is {per_payload:.1f}x faster")
+    print(f"Batch validation is {batched:.1f}x faster")
+    ok = ok and per_payload > 1.5 and batched > 3
+
+    count, size = helpers_size()
+    print(f"{count} validator modules, {size / 1024:.0f} KiB of source")
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
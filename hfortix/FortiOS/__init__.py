@@ -6,6 +6,7 @@ Supports configuration management (CMDB), monitoring, logging, and services.
 
 Main Classes:
     FortiOS: Main API client class
+    FortiOSFleet: Concurrent async client for many FortiGates
 
 API Categories:
     - cmdb: Configuration Management Database
@@ -47,12 +48,15 @@ from .exceptions import (  # noqa: E402
 )
 
 # Public API
+from .fleet import FleetResult, FortiOSFleet  # noqa: E402
 from .fortios import FortiOS  # noqa: E402
 from .performance_test import quick_test, run_performance_test  # noqa: E402
 
 __all__ = [
     # Main client
     "FortiOS",
+    "FortiOSFleet",
+    "FleetResult",
     # Exceptions
     "FortinetError",
     "AuthenticationError",
@@ -36,6 +36,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ._helpers.lazy import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
     from typing import Optional
 
@@ -48,6 +50,18 @@ if TYPE_CHECKING:
 
 __all__ = ["API"]
 
+# The API namespaces are only imported when first accessed; the full tree
+# has well over a thousand endpoint modules
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "CMDB": ".v2.cmdb",
+        "Log": ".v2.log",
+        "Monitor": ".v2.monitor",
+        "Service": ".v2.service",
+    },
+)
+
 
 class API:
     """
@@ -110,11 +124,11 @@ class API:
         >>> fgt.api.log.disk.traffic.get(count=100)
     """
 
-    # Type hints for attributes (helps IDE autocomplete)
-    cmdb: "CMDB"
-    log: "Log"
-    monitor: "Monitor"
-    service: "Service"
+    # Created on first access (type hints keep IDE autocomplete working)
+    cmdb: LazyEndpoint[CMDB] = LazyEndpoint("CMDB")
+    log: LazyEndpoint[Log] = LazyEndpoint("Log")
+    monitor: LazyEndpoint[Monitor] = LazyEndpoint("Monitor")
+    service: LazyEndpoint[Service] = LazyEndpoint("Service")
     utils: (
         "Optional[Utils]"  # None when using custom IHTTPClient implementations
     )
@@ -133,20 +147,10 @@ class API:
         # for the repository's script-style harnesses under X/tests.
         self._client = client
 
-        from .utils import Utils
-        from .v2.cmdb import CMDB
-        from .v2.log import Log
-        from .v2.monitor import Monitor
-        from .v2.service import Service
-
-        self.cmdb = CMDB(client)
-        self.log = Log(client)
-        self.monitor = Monitor(client)
-        self.service = Service(client)
-
         # Utils requires concrete HTTPClient for access to internal attributes
         # Check if client is the concrete HTTPClient type
         from ..http_client import HTTPClient
+        from .utils import Utils
 
         if isinstance(client, HTTPClient):
             self.utils = Utils(client)
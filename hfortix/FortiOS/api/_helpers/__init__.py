@@ -10,6 +10,10 @@ Includes functions for:
 - Type conversion (bool to enable/disable, etc.)
 - Data cleaning and filtering
 - Validation helpers (color, status, IP, MAC, etc.)
+- Auto-pagination of list endpoints (start/count paging)
+- Field projection of CMDB reads (format, views, default values)
+- Lazy loading of API namespaces
+- Endpoint classes built from the per-category endpoint registries
 
 This is the central API helpers module that can be used by:
 - hfortix.FortiOS.api.v2.cmdb.* (Configuration endpoints)
@@ -19,6 +23,7 @@ This is the central API helpers module that can be used by:
 - Any other API categories
 """
 
+from .endpoint import Endpoint, endpoint_classes
 from .helpers import (
     build_cmdb_payload,
     build_cmdb_payload_normalized,
@@ -38,6 +43,9 @@ from .helpers import (
     validate_required_fields,
     validate_status,
 )
+from .lazy import LazyEndpoint, lazy_imports
+from .pagination import apaginate, paginate
+from .projection import apply_projection, default_views
 
 __all__ = [
     # Payload building
@@ -63,4 +71,16 @@ __all__ = [
     "validate_ip_address",
     "validate_ipv6_address",
     "validate_ip_network",
+    # Pagination
+    "paginate",
+    "apaginate",
+    # Field projection
+    "apply_projection",
+    "default_views",
+    # Lazy namespaces
+    "LazyEndpoint",
+    "lazy_imports",
+    # Registry endpoints
+    "Endpoint",
+    "endpoint_classes",
 ]
@@ -0,0 +1,711 @@
+"""
+Generic API endpoints built from the endpoint registry.
+
+Most CMDB and monitor endpoints differ only in their path, identifier,
+supported methods and field names. Instead of one module per endpoint,
+every category package has a ``_registry.py`` module describing its
+endpoints as data, and the endpoint classes are created from it on first
+access:
+
+    >>> # hfortix/FortiOS/api/v2/cmdb/firewall/_registry.py
+    >>> ENDPOINTS = {
+    ...     "address": {
+    ...         "class": "Address",
+    ...         "path": "/firewall/address",
+    ...         "mkey": "name",
+    ...         "fields": {"name": str, "subnet": str, "route-tag": int},
+    ...     },
+    ... }
+    >>> __getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
+
+Registry entries (keyed by the endpoint's attribute name) have these keys:
+
+- ``class``: class name, as exported by the category package
+- ``path``: API path, e.g. "/firewall/address"
+- ``mkey``: identifier field of a CMDB table; tables without one are
+  singletons (system/global, ...) with get() and put() only
+- ``fields``: body fields (FortiOS spelling) -> type, in API order
+- ``params``: query parameters of a monitor GET -> type
+- ``required``: monitor parameters or fields that must be passed
+- ``methods``: supported methods, if not the default of the endpoint kind
+- ``children``: attribute -> registry entry of nested endpoints
+- ``views``: named field projections of a CMDB table, in addition to the
+  default ``keys`` and ``summary`` views (see projection.py)
+
+Methods take the fields as keyword arguments in Python spelling
+(``route_tag=``, ``class_=``, ``_802_1X_settings=``) in addition to
+``payload_dict``, exactly like the generated per-endpoint classes did;
+other keyword arguments are passed through unchanged.
+"""
+
+from __future__ import annotations
+
+import inspect
+import keyword
+import sys
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Iterator,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
+
+    from hfortix.FortiOS.http_client_interface import IHTTPClient
+
+from .projection import (
+    apply_projection,
+    default_views,
+)
+
+__all__ = [
+    "CmdbEndpoint",
+    "Endpoint",
+    "MonitorEndpoint",
+    "endpoint_classes",
+    "python_name",
+]
+
+Spec = dict[str, Any]
+
+# Query parameters of CMDB GET requests
+_TABLE_QUERY: dict[str, type] = {
+    "attr": str,
+    "skip_to_datasource": dict,
+    "acs": int,
+    "search": str,
+}
+_SINGLETON_QUERY: dict[str, type] = {
+    "exclude-default-values": bool,
+    "stat-items": str,
+}
+
+_TABLE_NAMES = {name: name for name in _TABLE_QUERY}
+_SINGLETON_NAMES = {name.replace("-", "_"): name for name in _SINGLETON_QUERY}
+
+_TABLE_METHODS = ("get", "iter", "aiter", "exists", "post", "put", "delete")
+_SINGLETON_METHODS = ("get", "put")
+
+
+@lru_cache(maxsize=None)
+def python_name(key: str) -> str:
+    """
+    Keyword argument name of a field, e.g. "route-tag" -> "route_tag"
+
+    Example:
+        >>> python_name("802.1-tlvs"), python_name("class")
+        ('_802_1_tlvs', 'class_')
+    """
+    name = key.replace("-", "_").replace(".", "_").replace("+", "_plus_")
+    if name[:1].isdigit():
+        name = "_" + name
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def _bind(
+    method: str,
+    names: tuple[str, ...],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Add positional arguments to kwargs under their parameter names"""
+    if len(args) > len(names):
+        raise TypeError(
+            f"{method}() takes {len(names)} positional arguments but "
+            f"{len(args)} were given"
+        )
+    for name, value in zip(names, args):
+        if name in kwargs:
+            raise TypeError(
+                f"{method}() got multiple values for argument {name!r}"
+            )
+        kwargs[name] = value
+    return kwargs
+
+
+def _build(
+    base: Optional[dict[str, Any]],
+    names: dict[str, str],
+    kwargs: dict[str, Any],
+    required: Collection[str] = (),
+) -> dict[str, Any]:
+    """
+    Request body or query parameters
+
+    Starts from a copy of ``base`` (payload_dict), adds the known arguments
+    that are not None under their FortiOS names and finally the unknown
+    keyword arguments as given.
+    """
+    data = base.copy() if base else {}
+    extra = {}
+    for name, value in kwargs.items():
+        key = names.get(name)
+        if key is None:
+            extra[name] = value
+        elif value is not None or name in required:
+            data[key] = value
+    data.update(extra)
+    return data
+
+
+class _Unsupported:
+    """Class attribute for a method the endpoint doesn't have"""
+
+    __slots__ = ("_name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # Always an Endpoint subclass
+        cls: Any = owner or type(instance)
+        raise AttributeError(
+            f"{cls.__name__} endpoint ({cls.path}) has no {self._name}()"
+        )
+
+
+class Endpoint:
+    """
+    Base class of registry-built endpoints
+
+    Subclasses are created by endpoint_classes(); the class attributes
+    describe the endpoint.
+    """
+
+    api: ClassVar[str]
+    path: ClassVar[str]
+    # Path under the API namespace, e.g. "firewall.address"
+    table: ClassVar[str]
+    # Identifier field (FortiOS spelling) of CMDB tables
+    mkey: ClassVar[Optional[str]] = None
+    fields: ClassVar[dict[str, Any]] = {}
+    params: ClassVar[dict[str, Any]] = {}
+    required: ClassVar[tuple[str, ...]] = ()
+    methods: ClassVar[tuple[str, ...]] = ()
+    # View name -> fields returned by get(view=...) (CMDB)
+    views: ClassVar[dict[str, tuple[str, ...]]] = {}
+    _children: ClassVar[dict[str, type]] = {}
+    # Method -> positional parameter names
+    _positional: ClassVar[dict[str, tuple[str, ...]]] = {}
+    # Method -> argument name -> FortiOS name
+    _names: ClassVar[dict[str, dict[str, str]]] = {}
+
+    def __init__(self, client: "IHTTPClient") -> None:
+        """
+        Initialize the endpoint
+
+        Args:
+            client: HTTPClient instance for API communication
+        """
+        self._client = client
+        for attr, child in self._children.items():
+            setattr(self, attr, child(client))
+
+    def _arguments(
+        self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        return _bind(method, self._positional[method], args, kwargs)
+
+    def _identifier(self, method: str, kwargs: dict[str, Any]) -> Any:
+        name = python_name(self.mkey or "")
+        value = kwargs.get(name)
+        if not value:
+            raise ValueError(f"{name} is required for {method}()")
+        return value
+
+    def __dir__(self) -> list[str]:
+        # Methods the endpoint doesn't have are not advertised
+        namespace = type(self).__dict__
+        return [
+            name
+            for name in super().__dir__()
+            if not isinstance(namespace.get(name), _Unsupported)
+        ]
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} endpoint {self.api}{self.path}>"
+
+
+class CmdbEndpoint(Endpoint):
+    """CMDB table or singleton built from the registry"""
+
+    def get(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Get all entries, or the entry with the given identifier
+
+        Args:
+            <mkey>: Identifier of the entry (tables, optional)
+            payload_dict: Query parameters
+            attr, skip_to_datasource, acs, search: Query parameters
+                (tables)
+            stat_items: Query parameters (singletons)
+            format: Fields to return, as a list (FortiOS or Python
+                spelling) or a FortiOS format string ("name|subnet")
+            view: Name of a predefined field list, see ``views``
+            exclude_default_values: Leave out fields at their default
+            vdom: Virtual domain name, or False to skip. Handled by
+                HTTPClient.
+            raw_json: If True, return full API response with metadata
+            compact: If True, return the entries as a compact ResultSet
+                (see hfortix.FortiOS.resultset)
+            **kwargs: Additional query parameters (filter, sort, start,
+                count, etc.)
+
+        Returns:
+            Dictionary containing API response
+
+        Raises:
+            ValueError: If the view is unknown or both view and format
+                are given, or if compact is combined with raw_json
+
+        Example:
+            >>> fgt.api.cmdb.firewall.address.get(
+            ...     format=["name", "subnet", "type"]
+            ... )
+            >>> fgt.api.cmdb.firewall.address.get(view="summary")
+        """
+        kwargs = self._arguments("get", args, kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        vdom = kwargs.pop("vdom", None)
+        raw_json = kwargs.pop("raw_json", False)
+        compact = kwargs.pop("compact", False)
+        if compact and raw_json:
+            raise ValueError("compact=True can't be combined with raw_json")
+        endpoint = self.path
+        if self.mkey is not None:
+            mkey = kwargs.pop(python_name(self.mkey), None)
+            if mkey:
+                endpoint = f"{self.path}/{mkey}"
+        params = _build(payload_dict, self._names["get"], kwargs)
+        apply_projection(params, self.views, self._names["format"])
+        result = self._client.get(
+            self.api, endpoint, params=params, vdom=vdom, raw_json=raw_json
+        )
+        if compact:
+            from hfortix.FortiOS.resultset import compact_result
+
+            return compact_result(result, type(self).__name__)
+        return result
+
+    def iter(self, *args: Any, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (sync mode)
+
+        Args:
+            page_size: Entries per request (default 1000)
+            payload_dict: Query parameters
+            vdom: Virtual domain name, or False to skip
+            **kwargs: Additional query parameters (filter, sort, format,
+                view, exclude_default_values, etc.)
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        kwargs = self._arguments("iter", args, kwargs)
+        page_size = kwargs.pop("page_size", 1000)
+        kwargs.setdefault("payload_dict", None)
+        kwargs.setdefault("vdom", None)
+        return paginate(self.get, page_size, **kwargs)
+
+    def aiter(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all entries page by page (async mode), see iter()"""
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        kwargs = self._arguments("aiter", args, kwargs)
+        page_size = kwargs.pop("page_size", 1000)
+        kwargs.setdefault("payload_dict", None)
+        kwargs.setdefault("vdom", None)
+        return apaginate(self.get, page_size, **kwargs)
+
+    def exists(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[bool, Coroutine[Any, Any, bool]]:
+        """
+        Check if an entry exists
+
+        Automatically works in both sync and async modes.
+
+        Args:
+            <mkey>: Identifier of the entry
+            vdom: Virtual domain name, or False to skip
+
+        Returns:
+            bool (sync mode) or Coroutine[bool] (async mode)
+        """
+        from hfortix.FortiOS.exceptions_forti import ResourceNotFoundError
+
+        kwargs = self._arguments("exists", args, kwargs)
+        name = python_name(self.mkey or "")
+        if name not in kwargs:
+            raise TypeError(
+                f"exists() missing 1 required positional argument: {name!r}"
+            )
+        result = self.get(**kwargs)
+        if inspect.iscoroutine(result):
+
+            async def _async() -> bool:
+                try:
+                    await result
+                    return True
+                except ResourceNotFoundError:
+                    return False
+
+            return _async()
+        # Sync mode - get() already executed, no exception means it exists
+        return True
+
+    def post(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Create a new entry
+
+        Args:
+            payload_dict: Fields of the entry (FortiOS spelling)
+            nkey: Entry to insert the new one before
+            <fields>: Fields as keyword arguments (``route_tag=``, ...)
+            vdom: Virtual domain name, or False to skip
+            raw_json: If True, return full API response with metadata
+            **kwargs: Additional fields
+
+        Returns:
+            Dictionary containing API response
+        """
+        kwargs = self._arguments("post", args, kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        vdom = kwargs.pop("vdom", None)
+        raw_json = kwargs.pop("raw_json", False)
+        data = _build(payload_dict, self._names["post"], kwargs)
+        return self._client.post(
+            self.api, self.path, data=data, vdom=vdom, raw_json=raw_json
+        )
+
+    def put(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Update an entry (tables) or the settings (singletons)
+
+        Args:
+            <mkey>: Identifier of the entry (tables, required)
+            payload_dict: Fields to change (FortiOS spelling)
+            before, after: With action=move, the entry to move this one
+                before or after
+            <fields>: Fields as keyword arguments (``route_tag=``, ...)
+            vdom: Virtual domain name, or False to skip
+            raw_json: If True, return full API response with metadata
+            **kwargs: Additional fields
+
+        Returns:
+            Dictionary containing API response
+
+        Raises:
+            ValueError: If the identifier of a table entry is missing
+        """
+        kwargs = self._arguments("put", args, kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        vdom = kwargs.pop("vdom", None)
+        raw_json = kwargs.pop("raw_json", False)
+        endpoint = self.path
+        if self.mkey is not None:
+            endpoint = f"{self.path}/{self._identifier('put', kwargs)}"
+        data = _build(payload_dict, self._names["put"], kwargs)
+        return self._client.put(
+            self.api, endpoint, data=data, vdom=vdom, raw_json=raw_json
+        )
+
+    def delete(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Delete an entry
+
+        Args:
+            <mkey>: Identifier of the entry (required)
+            payload_dict: Query parameters
+            vdom: Virtual domain name, or False to skip
+            raw_json: If True, return full API response with metadata
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dictionary containing API response
+
+        Raises:
+            ValueError: If the identifier is missing
+        """
+        kwargs = self._arguments("delete", args, kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        vdom = kwargs.pop("vdom", None)
+        raw_json = kwargs.pop("raw_json", False)
+        mkey = self._identifier("delete", kwargs)
+        del kwargs[python_name(self.mkey or "")]
+        params = _build(payload_dict, {}, kwargs)
+        return self._client.delete(
+            self.api,
+            f"{self.path}/{mkey}",
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+        )
+
+
+class MonitorEndpoint(Endpoint):
+    """Monitor endpoint built from the registry"""
+
+    # Python names of the required parameters and fields
+    _required: ClassVar[frozenset[str]] = frozenset()
+
+    def _missing(self, method: str, kwargs: dict[str, Any]) -> None:
+        missing = [
+            python_name(key)
+            for key in self.required
+            if python_name(key) not in kwargs
+        ]
+        if missing:
+            names = ", ".join(repr(name) for name in missing)
+            raise TypeError(
+                f"{method}() missing {len(missing)} required positional "
+                f"argument{'s' if len(missing) > 1 else ''}: {names}"
+            )
+
+    def get(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Retrieve monitoring data
+
+        Args:
+            <params>: Query parameters as keyword arguments
+            payload_dict: Query parameters
+            raw_json: If True, return full API response with metadata
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dictionary containing API response
+        """
+        kwargs = self._arguments("get", args, kwargs)
+        self._missing("get", kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        raw_json = kwargs.pop("raw_json", False)
+        params = _build(
+            payload_dict, self._names["get"], kwargs, self._required
+        )
+        return self._client.get(
+            self.api, self.path, params=params, raw_json=raw_json
+        )
+
+    def iter(self, *args: Any, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all records page by page (sync mode)
+
+        Args:
+            page_size: Records per request (default 1000)
+            payload_dict: Query parameters
+            **kwargs: Additional query parameters
+
+        Yields:
+            One record at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        kwargs = self._arguments("iter", args, kwargs)
+        page_size = kwargs.pop("page_size", 1000)
+        kwargs.setdefault("payload_dict", None)
+        return paginate(self.get, page_size, **kwargs)
+
+    def aiter(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all records page by page (async mode), see iter()"""
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        kwargs = self._arguments("aiter", args, kwargs)
+        page_size = kwargs.pop("page_size", 1000)
+        kwargs.setdefault("payload_dict", None)
+        return apaginate(self.get, page_size, **kwargs)
+
+    def post(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Run the monitor action
+
+        Args:
+            <fields>: Body fields as keyword arguments
+            payload_dict: Body fields
+            raw_json: If True, return full API response with metadata
+            **kwargs: Additional body fields
+
+        Returns:
+            Dictionary containing API response
+        """
+        kwargs = self._arguments("post", args, kwargs)
+        self._missing("post", kwargs)
+        payload_dict = kwargs.pop("payload_dict", None)
+        raw_json = kwargs.pop("raw_json", False)
+        data = _build(
+            payload_dict, self._names["post"], kwargs, self._required
+        )
+        return self._client.post(
+            self.api, self.path, data=data, raw_json=raw_json
+        )
+
+
+def _names(keys: Any) -> dict[str, str]:
+    return {python_name(key): key for key in keys}
+
+
+def _cmdb_layout(spec: Spec) -> dict[str, Any]:
+    names = _names(spec.get("fields", ()))
+    mkey = spec.get("mkey")
+    control = ("vdom", "raw_json")
+    methods: tuple[str, ...]
+    if mkey is None:
+        query = _SINGLETON_NAMES
+        methods = _SINGLETON_METHODS
+        identifier: tuple[str, ...] = ()
+        put_fields = tuple(names)
+    else:
+        query = _TABLE_NAMES
+        methods = _TABLE_METHODS
+        identifier = (python_name(mkey),)
+        put_fields = tuple(name for name in names if name != identifier[0])
+    return {
+        "methods": tuple(spec.get("methods", methods)),
+        "_positional": {
+            "get": (*identifier, "payload_dict", *query, *control),
+            "iter": ("page_size", "payload_dict", "vdom"),
+            "aiter": ("page_size", "payload_dict", "vdom"),
+            "exists": (*identifier, "vdom"),
+            "post": ("payload_dict", "nkey", *names, *control),
+            "put": (
+                *identifier,
+                "payload_dict",
+                "before",
+                "after",
+                *put_fields,
+                *control,
+            ),
+            "delete": (*identifier, "payload_dict", *control),
+        },
+        "_names": {
+            "get": query,
+            "post": {"nkey": "nkey", **names},
+            "put": {"before": "before", "after": "after", **names},
+            "format": names,
+        },
+    }
+
+
+def _monitor_layout(spec: Spec) -> dict[str, Any]:
+    params = _names(spec.get("params", ()))
+    fields = _names(spec.get("fields", ()))
+    return {
+        "methods": tuple(spec.get("methods", ())),
+        "_required": frozenset(map(python_name, spec["required"])),
+        "_positional": {
+            "get": (*params, "payload_dict", "raw_json"),
+            "iter": ("page_size", "payload_dict"),
+            "aiter": ("page_size", "payload_dict"),
+            "post": (*fields, "payload_dict", "raw_json"),
+        },
+        "_names": {"get": params, "post": fields},
+    }
+
+
+def build_endpoint(module: str, api: str, table: str, spec: Spec) -> type:
+    """
+    Create the endpoint class of a registry entry
+
+    Args:
+        module: Registry module the class belongs to
+        api: API type ("cmdb" or "monitor")
+        table: Path under the API namespace, e.g. "firewall.address"
+        spec: Registry entry
+
+    Returns:
+        Endpoint subclass
+    """
+    spec = {"required": (), **spec}
+    if api == "cmdb":
+        base: type[Endpoint] = CmdbEndpoint
+        layout = _cmdb_layout(spec)
+    else:
+        base = MonitorEndpoint
+        layout = _monitor_layout(spec)
+    children = {
+        attr: build_endpoint(module, api, f"{table}.{attr}", child)
+        for attr, child in spec.get("children", {}).items()
+    }
+    namespace: dict[str, Any] = {
+        "__module__": module,
+        "__doc__": f"FortiOS {api.upper()} {spec['path']} endpoint",
+        "api": api,
+        "path": spec["path"],
+        "table": table,
+        "mkey": spec.get("mkey"),
+        "fields": dict(spec.get("fields", {})),
+        "params": dict(spec.get("params", {})),
+        "required": tuple(spec["required"]),
+        "_children": children,
+        **layout,
+    }
+    if api == "cmdb":
+        namespace["views"] = default_views(
+            namespace["mkey"], namespace["fields"], spec.get("views")
+        )
+    for method in ("get", "iter", "aiter", "exists", "post", "put", "delete"):
+        if hasattr(base, method) and method not in layout["methods"]:
+            namespace[method] = _Unsupported()
+    return type(spec["class"], (base,), namespace)
+
+
+def endpoint_classes(
+    module_name: str, api: str, registry: dict[str, Spec]
+) -> Callable[[str], type]:
+    """
+    Build a registry module's ``__getattr__`` creating endpoint classes
+
+    Args:
+        module_name: ``__name__`` of the registry module
+        api: API type of the category ("cmdb" or "monitor")
+        registry: Attribute name -> registry entry
+
+    Returns:
+        Function to assign to the module's ``__getattr__``; looks up a
+        class name (e.g. "Address") and creates the class once
+    """
+    module = sys.modules[module_name]
+    # "hfortix.FortiOS.api.v2.cmdb.firewall._registry" -> "firewall"
+    category = module_name.rsplit(".", 1)[0].partition(f".{api}.")[2]
+    by_class = {spec["class"]: attr for attr, spec in registry.items()}
+
+    def __getattr__(name: str) -> type:
+        try:
+            attr = by_class[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        table = f"{category}.{attr}" if category else attr
+        cls = build_endpoint(module_name, api, table, registry[attr])
+        # Cache on the module so each class is only created once
+        setattr(module, name, cls)
+        return cls
+
+    return __getattr__
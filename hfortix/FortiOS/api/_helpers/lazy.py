@@ -0,0 +1,116 @@
+"""
+Lazy loading of API namespaces.
+
+The API tree has well over a thousand endpoint modules. Importing and
+instantiating all of them when a FortiOS client is created makes
+construction slow and memory hungry, while a script typically touches a
+handful of endpoints. Namespaces therefore resolve their children on first
+attribute access:
+
+- ``lazy_imports()`` builds a module-level ``__getattr__`` (PEP 562) that
+  imports an endpoint class from its submodule the first time the name is
+  looked up, so ``from .firewall import Address`` style re-exports keep
+  working without importing every module up front.
+- ``LazyEndpoint`` is a class attribute that instantiates the endpoint
+  class with the namespace's client on first access and caches the
+  instance on the namespace object; later accesses are plain attribute
+  lookups.
+
+Example:
+    >>> # hfortix/FortiOS/api/v2/cmdb/alertemail/__init__.py
+    >>> if TYPE_CHECKING:
+    ...     from .setting import Setting
+    >>> __getattr__ = lazy_imports(__name__, {"Setting": ".setting"})
+    >>>
+    >>> class Alertemail:
+    ...     setting: LazyEndpoint[Setting] = LazyEndpoint("Setting")
+    ...
+    ...     def __init__(self, client):
+    ...         self._client = client
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Generic, Optional, TypeVar, overload
+
+__all__ = ["LazyEndpoint", "lazy_imports"]
+
+T = TypeVar("T")
+
+
+def lazy_imports(
+    module_name: str, imports: dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Build a module-level ``__getattr__`` that imports names on first use
+
+    Args:
+        module_name: ``__name__`` of the module the function is installed in
+        imports: Mapping of exported name to the relative submodule that
+            defines it (e.g. ``{"Address": ".address"}``)
+
+    Returns:
+        Function to assign to the module's ``__getattr__``
+    """
+    module = sys.modules[module_name]
+    package = module.__package__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Cache on the module so the hook only runs once per name
+        setattr(module, name, value)
+        return value
+
+    return __getattr__
+
+
+class LazyEndpoint(Generic[T]):
+    """
+    Namespace attribute created on first access
+
+    Looks ``class_name`` up in the module that defines the owning class
+    (which triggers the import when the module uses ``lazy_imports()``),
+    instantiates it with the namespace's ``_client`` and stores the
+    instance on the namespace object, replacing the descriptor for that
+    object.
+
+    Args:
+        class_name: Name of the endpoint or sub-namespace class in the
+            owner's module
+    """
+
+    __slots__ = ("_class_name", "_attr", "_module")
+
+    def __init__(self, class_name: str) -> None:
+        self._class_name = class_name
+        self._attr = class_name
+        self._module = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = name
+        self._module = owner.__module__
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> "LazyEndpoint[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        cls = getattr(sys.modules[self._module], self._class_name)
+        value = cls(instance._client)
+        # Non-data descriptor: the instance attribute shadows it from now on.
+        # setdefault keeps the first instance if two threads race here.
+        return instance.__dict__.setdefault(self._attr, value)
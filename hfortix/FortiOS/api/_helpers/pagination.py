@@ -0,0 +1,246 @@
+"""
+Auto-pagination for list endpoints.
+
+Drives an endpoint's ``get()`` with the FortiOS ``start``/``count`` paging
+parameters and yields records one at a time, so only one page is held in
+memory no matter how large the table is. Used by the ``iter()`` (sync mode)
+and ``aiter()`` (async mode) methods of the generated endpoint classes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+)
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _page_records(result: Any) -> Optional[List[Any]]:
+    """
+    Extract the records of one page from an endpoint response.
+
+    Most endpoints return a list in ``results``. Some monitor endpoints
+    (e.g. monitor/firewall/sessions) wrap the list in ``details``. Returns
+    None if the response is a single object rather than a page.
+    """
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        details = result.get("details")
+        if isinstance(details, list):
+            return details
+    return None
+
+
+class _PageCursor:
+    """
+    Tracks paging position and decides when the last page was reached.
+
+    Offsets are handed out in steps of page_size, which lets a prefetching
+    reader request pages before the previous ones arrived. A page shorter
+    than the page size ends the iteration. Endpoints that ignore
+    ``start``/``count`` are detected (a single object instead of a list, a
+    page larger than requested or the same page returned twice) so they are
+    read exactly once instead of looping forever.
+    """
+
+    def __init__(self, page_size: int, start: int) -> None:
+        if page_size <= 0:
+            raise ValueError("page_size must be > 0")
+        if start < 0:
+            raise ValueError("start must be >= 0")
+        self.page_size = page_size
+        self.done = False
+        self._next_offset = start
+        self._last_first: Optional[Any] = None
+
+    def next_offset(self) -> int:
+        """Return the ``start`` value of the next page to request"""
+        offset = self._next_offset
+        self._next_offset += self.page_size
+        return offset
+
+    def accept(self, result: Any) -> List[Any]:
+        """Return the records of a page response that should be yielded"""
+        records = _page_records(result)
+        if records is None:
+            self.done = True
+            return [result] if result else []
+        if not records or (
+            self._last_first is not None and records[0] == self._last_first
+        ):
+            self.done = True
+            return []
+        if len(records) != self.page_size:
+            self.done = True
+        self._last_first = records[0]
+        return records
+
+
+def paginate(
+    get: Callable[..., Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start: int = 0,
+    prefetch: int = 0,
+    **params: Any,
+) -> Iterator[Any]:
+    """
+    Iterate over all records of a list endpoint (sync mode).
+
+    Args:
+        get: Bound ``get`` method of an endpoint
+        page_size: Number of records requested per page (default: 1000)
+        start: Index of the first record to return (default: 0)
+        prefetch: Number of pages requested ahead of the page being
+            consumed, using background threads (default: 0, no prefetch).
+            Hides network latency on slow links; requires a thread-safe
+            client such as HTTPClient. Up to ``prefetch`` requests past the
+            end of the table are wasted.
+        **params: Extra arguments passed to every ``get()`` call (filter,
+            format, vdom, ...)
+
+    Yields:
+        Records one at a time
+
+    Raises:
+        TypeError: If the endpoint uses an async client (use apaginate)
+
+    Example:
+        >>> for addr in paginate(fgt.api.cmdb.firewall.address.get, 500):
+        ...     print(addr["name"])
+        >>>
+        >>> # Keep 4 page requests in flight on a high-latency link
+        >>> for policy in fgt.api.cmdb.firewall.policy.iter(prefetch=4):
+        ...     print(policy["policyid"])
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+    params.pop("raw_json", None)
+    cursor = _PageCursor(page_size, start)
+
+    def fetch(offset: int) -> Any:
+        result = get(start=offset, count=page_size, **params)
+        if inspect.iscoroutine(result):
+            result.close()
+            raise TypeError(
+                "iter() is not available in async mode, use aiter() instead"
+            )
+        return result
+
+    if not prefetch:
+        while not cursor.done:
+            yield from cursor.accept(fetch(cursor.next_offset()))
+        return
+
+    pool = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="hfortix-prefetch"
+    )
+    pending: Deque[Future] = deque(
+        pool.submit(fetch, cursor.next_offset()) for _ in range(prefetch)
+    )
+    try:
+        while pending:
+            records = cursor.accept(pending.popleft().result())
+            if not cursor.done:
+                # Top the pipeline up before handing the page to the caller
+                pending.append(pool.submit(fetch, cursor.next_offset()))
+            yield from records
+            if cursor.done:
+                break
+    finally:
+        # Also runs when the caller stops iterating early. Requests already
+        # on the wire are waited for so no background thread uses the
+        # client after iteration ends (e.g. after it was closed).
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+async def apaginate(
+    get: Callable[..., Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start: int = 0,
+    prefetch: int = 0,
+    **params: Any,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over all records of a list endpoint (async mode).
+
+    Args:
+        get: Bound ``get`` method of an endpoint
+        page_size: Number of records requested per page (default: 1000)
+        start: Index of the first record to return (default: 0)
+        prefetch: Number of pages requested ahead of the page being
+            consumed, using background tasks (default: 0, no prefetch).
+            Up to ``prefetch`` requests past the end of the table are
+            wasted.
+        **params: Extra arguments passed to every ``get()`` call (filter,
+            format, vdom, ...)
+
+    Yields:
+        Records one at a time
+
+    Raises:
+        TypeError: If the endpoint uses a sync client (use paginate)
+
+    Example:
+        >>> async for addr in apaginate(fgt.api.cmdb.firewall.address.get):
+        ...     print(addr["name"])
+        >>>
+        >>> async for policy in fgt.api.cmdb.firewall.policy.aiter(
+        ...     prefetch=4
+        ... ):
+        ...     print(policy["policyid"])
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+    params.pop("raw_json", None)
+    cursor = _PageCursor(page_size, start)
+
+    async def fetch(offset: int) -> Any:
+        result = get(start=offset, count=page_size, **params)
+        if not inspect.isawaitable(result):
+            raise TypeError(
+                "aiter() is only available in async mode, use iter() instead"
+            )
+        return await result
+
+    if not prefetch:
+        while not cursor.done:
+            for record in cursor.accept(await fetch(cursor.next_offset())):
+                yield record
+        return
+
+    pending: Deque[asyncio.Future] = deque(
+        asyncio.ensure_future(fetch(cursor.next_offset()))
+        for _ in range(prefetch)
+    )
+    try:
+        while pending:
+            records = cursor.accept(await pending.popleft())
+            if not cursor.done:
+                # Top the pipeline up before handing the page to the caller
+                pending.append(
+                    asyncio.ensure_future(fetch(cursor.next_offset()))
+                )
+            for record in records:
+                yield record
+            if cursor.done:
+                break
+    finally:
+        # Also runs when the caller stops iterating early
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
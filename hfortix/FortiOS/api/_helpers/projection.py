@@ -0,0 +1,137 @@
+"""
+Field projection for CMDB reads.
+
+FortiOS returns every field of every entry unless told otherwise. Two
+query parameters cut the response down on the device, before it is
+serialized:
+
+- ``format=name|subnet|type`` returns only the listed fields
+- ``exclude-default-values`` leaves out fields still at their default
+
+The ``get()``, ``iter()`` and ``aiter()`` methods of CMDB endpoints accept
+both in Python form, plus named views:
+
+    >>> fgt.api.cmdb.firewall.address.get(format=["name", "subnet"])
+    >>> fgt.api.cmdb.firewall.address.get(view="summary")
+    >>> fgt.api.cmdb.firewall.policy.get(exclude_default_values=True)
+
+Every table has a ``keys`` view (only the identifier) and a ``summary``
+view (identifier plus the common descriptive fields it has, e.g. type,
+status, subnet, interfaces, comment); registry entries can define more
+or override them (``views`` key). The views of an endpoint are listed in
+``endpoint.views``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+__all__ = ["SUMMARY_FIELDS", "apply_projection", "default_views"]
+
+# Fields a "summary" view includes if the table has them (FortiOS names)
+SUMMARY_FIELDS = frozenset(
+    {
+        "name",
+        "type",
+        "status",
+        "action",
+        "subnet",
+        "start-ip",
+        "end-ip",
+        "fqdn",
+        "ip",
+        "interface",
+        "member",
+        "srcintf",
+        "dstintf",
+        "srcaddr",
+        "dstaddr",
+        "service",
+        "schedule",
+        "dst",
+        "gateway",
+        "device",
+        "description",
+        "comment",
+        "comments",
+    }
+)
+
+Views = Mapping[str, tuple[str, ...]]
+
+
+def default_views(
+    mkey: Optional[str],
+    fields: Mapping[str, Any],
+    declared: Optional[Views] = None,
+) -> dict[str, tuple[str, ...]]:
+    """
+    Named views of a CMDB table
+
+    Args:
+        mkey: Identifier field (None for singletons)
+        fields: Fields of the table (FortiOS names) in API order
+        declared: Views of the registry entry; replace the defaults of
+            the same name
+
+    Returns:
+        View name -> field names
+    """
+    views: dict[str, tuple[str, ...]] = {}
+    if mkey is not None:
+        views["keys"] = (mkey,)
+        summary = [mkey]
+        summary.extend(
+            name for name in fields if name in SUMMARY_FIELDS and name != mkey
+        )
+        views["summary"] = tuple(summary)
+    for name, view in (declared or {}).items():
+        views[name] = tuple(view)
+    return views
+
+
+def apply_projection(
+    params: dict[str, Any], views: Views, names: Mapping[str, str]
+) -> dict[str, Any]:
+    """
+    Translate projection arguments into FortiOS query parameters
+
+    Handles, in place:
+
+    - ``view``: name of one of ``views`` -> ``format``
+    - ``format``: list of field names (FortiOS or Python spelling) ->
+      ``"a|b|c"``; a string is sent as given
+    - ``exclude_default_values`` -> ``exclude-default-values``
+
+    Args:
+        params: Query parameters of a GET request
+        views: Named views of the endpoint
+        names: Python argument name -> FortiOS field name
+
+    Returns:
+        ``params``
+
+    Raises:
+        ValueError: If the view is unknown or both view and format are
+            given
+    """
+    view = params.pop("view", None)
+    if view is not None:
+        if params.get("format") is not None:
+            raise ValueError("Pass either view or format, not both")
+        try:
+            params["format"] = views[view]
+        except KeyError:
+            available = ", ".join(sorted(views)) or "none"
+            raise ValueError(
+                f"Unknown view {view!r} (available: {available})"
+            ) from None
+    fields = params.get("format")
+    if fields is None:
+        params.pop("format", None)
+    elif not isinstance(fields, str):
+        params["format"] = "|".join(names.get(name, name) for name in fields)
+    exclude = params.pop("exclude_default_values", None)
+    if exclude is not None:
+        params["exclude-default-values"] = exclude
+    return params
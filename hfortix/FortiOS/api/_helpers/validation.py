@@ -0,0 +1,406 @@
+"""
+Table-driven request validation for API endpoints.
+
+Every ``_helpers/<endpoint>.py`` module describes the constraints of its
+endpoint as a table - allowed values, integer ranges and maximum string
+lengths from the API specification - and builds its
+``validate_<endpoint>_<method>()`` functions from it with EndpointSchema:
+
+    >>> SCHEMA = EndpointSchema(
+    ...     body={
+    ...         "policyid": (0, 4294967294),   # integer range
+    ...         "name": 35,                    # maximum string length
+    ...         "action": ["accept", "deny"],  # allowed values
+    ...     },
+    ...     query={"action": ["default", "schema"]},
+    ... )
+    >>> validate_policy_post = SCHEMA.post_validator()
+    >>> validate_policy_post({"name": "allow-web", "action": "drop"})
+    (False, "Invalid action 'drop'. Must be one of: accept, deny")
+
+The table is compiled once (allowed values into frozensets) and a payload
+is checked by looking up only the fields it contains, so validation cost
+depends on the size of the payload rather than on the number of fields the
+endpoint has. Field order in the table is the check order: if a payload
+breaks several constraints, the error of the first one is reported.
+
+EndpointSchema.check_all() validates many payloads at once (a bulk
+import): each field is checked as one column across all payloads, with
+set and min/max operations instead of a Python loop per value, and only
+the payloads a column check flags are validated one by one.
+"""
+
+from __future__ import annotations
+
+import inspect
+from itertools import compress, count, repeat
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+__all__ = ["EndpointSchema"]
+
+ValidationResult = tuple[bool, Optional[str]]
+Validator = Callable[..., ValidationResult]
+# Allowed values, (min, max) integer range or maximum string length
+Constraint = Union[Sequence[str], tuple[int, int], int]
+
+_VALID: ValidationResult = (True, None)
+# Falsy values always pass an enum check
+_FALSY = frozenset((None, "", 0))
+_INTEGERS = frozenset((int, bool))
+_STRINGS = frozenset((str,))
+
+# Rule kinds; a rule is (position, kind, first, second)
+_ENUM = 0  # (frozenset of values, values in documented order)
+_RANGE = 1  # (minimum, maximum)
+_LENGTH = 2  # (maximum length, None)
+
+
+def _compile(fields: dict[str, Constraint]) -> dict[str, tuple]:
+    rules = {}
+    for position, (field, constraint) in enumerate(fields.items()):
+        if isinstance(constraint, tuple):
+            low, high = constraint
+            rules[field] = (position, _RANGE, low, high)
+        elif isinstance(constraint, int):
+            rules[field] = (position, _LENGTH, constraint, None)
+        else:
+            values = tuple(constraint)
+            rules[field] = (position, _ENUM, frozenset(values), values)
+    return rules
+
+
+def _message(field: str, rule: tuple, value: Any, query: bool) -> str:
+    _, kind, first, second = rule
+    if kind == _ENUM:
+        allowed = ", ".join(second)
+        if query:
+            return (
+                f"Invalid query parameter '{field}'='{value}'. "
+                f"Must be one of: {allowed}"
+            )
+        return f"Invalid {field} '{value}'. Must be one of: {allowed}"
+    if kind == _RANGE:
+        try:
+            int(value)
+        except (ValueError, TypeError):
+            return f"{field} must be numeric, got: {value}"
+        return f"{field} must be between {first} and {second}"
+    return f"{field} cannot exceed {first} characters"
+
+
+def _check(
+    rules: dict[str, tuple], values: dict[str, Any], query: bool
+) -> ValidationResult:
+    failed = None
+    for field, value in values.items():
+        rule = rules.get(field)
+        if rule is None:
+            continue
+        kind = rule[1]
+        if kind == _ENUM:
+            if not value:
+                continue
+            try:
+                if value in rule[2]:
+                    continue
+            except TypeError:
+                pass  # unhashable (a list, ...) can't be an allowed value
+        elif kind == _RANGE:
+            if value is None:
+                continue
+            try:
+                number = value if type(value) is int else int(value)
+            except (ValueError, TypeError):
+                pass
+            else:
+                if rule[2] <= number <= rule[3]:
+                    continue
+        elif not (value and isinstance(value, str) and len(value) > rule[2]):
+            continue
+        if failed is None or rule[0] < failed[2][0]:
+            failed = (field, value, rule)
+    if failed is None:
+        return _VALID
+    field, value, rule = failed
+    return (False, _message(field, rule, value, query))
+
+
+def _identifier(
+    key: str, value: Any, kwargs: dict[str, Any], strict: bool
+) -> Any:
+    """Identifier argument, which callers pass by its own name"""
+    if key in kwargs:
+        value = kwargs.pop(key)
+    if strict and kwargs:
+        raise TypeError(f"unexpected keyword argument {next(iter(kwargs))!r}")
+    return value
+
+
+def _signature(*names: str, params: bool = False) -> inspect.Signature:
+    kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+    parameters = [
+        inspect.Parameter(name, kind, default=None) for name in names
+    ]
+    if params:
+        parameters.append(
+            inspect.Parameter("params", inspect.Parameter.VAR_KEYWORD)
+        )
+    return inspect.Signature(parameters)
+
+
+class EndpointSchema:
+    """
+    Compiled validation table of one endpoint
+
+    Args:
+        body: Payload field -> constraint, in check order. A constraint is
+            a list of allowed values, a (min, max) tuple for integers or
+            an int maximum length for strings
+        query: Query parameter -> list of allowed values
+        required: Payload fields that must be present (POST)
+    """
+
+    __slots__ = (
+        "body",
+        "query",
+        "required",
+        "_body",
+        "_query",
+        "_fields",
+        "_allowed",
+    )
+
+    def __init__(
+        self,
+        body: Optional[dict[str, Constraint]] = None,
+        query: Optional[dict[str, Sequence[str]]] = None,
+        required: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.body = body or {}
+        self.query = query or {}
+        self.required = tuple(required or ())
+        self._body = _compile(self.body)
+        self._query = _compile(dict(self.query))
+        self._fields = frozenset(self._body)
+        self._allowed = {
+            field: rule[2] | _FALSY
+            for field, rule in self._body.items()
+            if rule[1] == _ENUM
+        }
+
+    def check(self, payload: dict[str, Any]) -> ValidationResult:
+        """
+        Validate a request body
+
+        Args:
+            payload: Fields to send (FortiOS names, e.g. "srcaddr")
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if self.required:
+            missing = [f for f in self.required if f not in payload]
+            if missing:
+                return (
+                    False,
+                    f"Missing required fields: {', '.join(missing)}",
+                )
+        if not self._body:
+            return _VALID
+        return _check(self._body, payload, False)
+
+    def check_all(
+        self, payloads: Iterable[dict[str, Any]]
+    ) -> list[ValidationResult]:
+        """
+        Validate many request bodies, e.g. a bulk import
+
+        Args:
+            payloads: Fields to send, one dict per object
+
+        Returns:
+            One (is_valid, error_message) tuple per payload, same as
+            check() would return for each
+
+        Example:
+            >>> results = SCHEMA.check_all(policies)
+            >>> errors = [e for ok, e in results if not ok]
+        """
+        items = list(payloads)
+        try:
+            suspects = self._suspects(items)
+        except (KeyError, TypeError):
+            # Fields missing from some payloads or unhashable values
+            return [self.check(payload) for payload in items]
+        results = [_VALID] * len(items)
+        for i in suspects:
+            results[i] = self.check(items[i])
+        return results
+
+    def _suspects(self, items: list[dict[str, Any]]) -> set[int]:
+        """Positions of payloads that may be invalid, column by column"""
+        suspects: set[int] = set()
+        for field in self.required:
+            if not all(map(dict.__contains__, items, repeat(field))):
+                suspects.update(
+                    i for i, item in enumerate(items) if field not in item
+                )
+        rules = self._body
+        for field in self._fields.intersection(set().union(*items)):
+            column = list(map(itemgetter(field), items))
+            _, kind, first, second = rules[field]
+            if kind == _ENUM:
+                allowed = self._allowed[field]
+                if not allowed.issuperset(column):
+                    bad = set(column).difference(allowed)
+                    suspects.update(
+                        compress(count(), map(bad.__contains__, column))
+                    )
+            elif kind == _RANGE:
+                if not (
+                    _INTEGERS.issuperset(map(type, column))
+                    and first <= min(column)
+                    and max(column) <= second
+                ):
+                    suspects.update(
+                        i
+                        for i, value in enumerate(column)
+                        if type(value) not in _INTEGERS
+                        or not first <= value <= second
+                    )
+            elif not (
+                _STRINGS.issuperset(map(type, column))
+                and max(map(len, column), default=0) <= first
+            ):
+                suspects.update(
+                    i
+                    for i, value in enumerate(column)
+                    if type(value) is not str or len(value) > first
+                )
+        return suspects
+
+    def check_query(self, params: dict[str, Any]) -> ValidationResult:
+        """
+        Validate query parameters
+
+        Args:
+            params: Query parameters of a GET request
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not self._query:
+            return _VALID
+        return _check(self._query, params, True)
+
+    def get_validator(self, key: Optional[str] = None) -> Validator:
+        """
+        Build ``validate_<endpoint>_get(attr=None, filters=None,
+        **params)``, with a leading ``key`` argument if given
+        """
+        check_query = self.check_query
+        if key is None:
+
+            def validate_get(
+                attr: Optional[str] = None,
+                filters: Optional[dict[str, Any]] = None,
+                **params: Any,
+            ) -> ValidationResult:
+                """Validate GET request parameters."""
+                return check_query(params)
+
+            return validate_get
+
+        def validate_get_key(
+            mkey: Any = None,
+            attr: Optional[str] = None,
+            filters: Optional[dict[str, Any]] = None,
+            **params: Any,
+        ) -> ValidationResult:
+            """Validate GET request parameters."""
+            mkey = _identifier(key, mkey, params, False)
+            if mkey is not None and str(mkey).strip():
+                if not isinstance(mkey, (str, int)):
+                    return (False, f"{key} must be a string or integer")
+            return check_query(params)
+
+        validate_get_key.__signature__ = _signature(  # type: ignore
+            key, "attr", "filters", params=True
+        )
+        return validate_get_key
+
+    def post_validator(self) -> Validator:
+        """Build ``validate_<endpoint>_post(payload)``"""
+        check = self.check
+
+        def validate_post(payload: dict[str, Any]) -> ValidationResult:
+            """Validate POST request payload."""
+            return check(payload)
+
+        return validate_post
+
+    def put_validator(self, key: Optional[str] = None) -> Validator:
+        """
+        Build ``validate_<endpoint>_put(payload=None)``, with a leading
+        (required) ``key`` argument for tables
+        """
+        check = self.check
+        if key is None:
+
+            def validate_put(
+                payload: Optional[dict[str, Any]] = None,
+            ) -> ValidationResult:
+                """Validate PUT request payload."""
+                if not payload:
+                    return _VALID
+                return check(payload)
+
+            return validate_put
+
+        def validate_put_key(
+            mkey: Any = None,
+            payload: Optional[dict[str, Any]] = None,
+            **kwargs: Any,
+        ) -> ValidationResult:
+            """Validate PUT request payload."""
+            if not _identifier(key, mkey, kwargs, True):
+                return (False, f"{key} is required for PUT operation")
+            if not payload:
+                return _VALID
+            return check(payload)
+
+        validate_put_key.__signature__ = _signature(  # type: ignore
+            key, "payload"
+        )
+        return validate_put_key
+
+    def delete_validator(self, key: Optional[str] = None) -> Validator:
+        """
+        Build ``validate_<endpoint>_delete()``, with a (required) ``key``
+        argument for tables
+        """
+        if key is None:
+
+            def validate_delete() -> ValidationResult:
+                """Validate DELETE request parameters."""
+                return _VALID
+
+            return validate_delete
+
+        def validate_delete_key(
+            mkey: Any = None, **kwargs: Any
+        ) -> ValidationResult:
+            """Validate DELETE request parameters."""
+            if not _identifier(key, mkey, kwargs, True):
+                return (False, f"{key} is required for DELETE operation")
+            return _VALID
+
+        validate_delete_key.__signature__ = _signature(key)  # type: ignore
+        return validate_delete_key
+
+    def __repr__(self) -> str:
+        return (
+            f"EndpointSchema({len(self.body)} body fields, "
+            f"{len(self.query)} query parameters)"
+        )
@@ -39,11 +39,72 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .alertemail import Alertemail
+    from .antivirus import Antivirus
+    from .application import Application
+    from .authentication import Authentication
+    from .automation import Automation
+    from .casb import Casb
+    from .certificate import Certificate
+    from .diameter_filter import DiameterFilter
+    from .dlp import Dlp
+    from .dnsfilter import Dnsfilter
+    from .emailfilter import Emailfilter
+    from .endpoint_control import EndpointControl
+    from .ethernet_oam import EthernetOam
+    from .extension_controller import ExtensionController
+    from .file_filter import FileFilter
+    from .firewall import Firewall
+    from .ftp_proxy import FtpProxy
+    from .icap import Icap
+    from .ips import Ips
+    from .log import Log
+    from .monitoring import Monitoring
+    from .report import Report
+    from .router import Router
+    from .rule import Rule
+    from .sctp_filter import SctpFilter
+    from .system import System
+
 __all__ = ["CMDB"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Alertemail": ".alertemail",
+        "Antivirus": ".antivirus",
+        "Application": ".application",
+        "Authentication": ".authentication",
+        "Automation": ".automation",
+        "Casb": ".casb",
+        "Certificate": ".certificate",
+        "DiameterFilter": ".diameter_filter",
+        "Dlp": ".dlp",
+        "Dnsfilter": ".dnsfilter",
+        "Emailfilter": ".emailfilter",
+        "EndpointControl": ".endpoint_control",
+        "EthernetOam": ".ethernet_oam",
+        "ExtensionController": ".extension_controller",
+        "FileFilter": ".file_filter",
+        "Firewall": ".firewall",
+        "FtpProxy": ".ftp_proxy",
+        "Icap": ".icap",
+        "Ips": ".ips",
+        "Log": ".log",
+        "Monitoring": ".monitoring",
+        "Report": ".report",
+        "Router": ".router",
+        "Rule": ".rule",
+        "SctpFilter": ".sctp_filter",
+        "System": ".system",
+    },
+)
+
 
 class CMDB:
     """
@@ -135,6 +196,41 @@ class CMDB:
         >>> fgt.api.cmdb.firewall.address.delete(name="Server01")
     """
 
+    alertemail: LazyEndpoint[Alertemail] = LazyEndpoint("Alertemail")
+    antivirus: LazyEndpoint[Antivirus] = LazyEndpoint("Antivirus")
+    application: LazyEndpoint[Application] = LazyEndpoint("Application")
+    authentication: LazyEndpoint[Authentication] = LazyEndpoint(
+        "Authentication"
+    )
+    automation: LazyEndpoint[Automation] = LazyEndpoint("Automation")
+    casb: LazyEndpoint[Casb] = LazyEndpoint("Casb")
+    certificate: LazyEndpoint[Certificate] = LazyEndpoint("Certificate")
+    diameter_filter: LazyEndpoint[DiameterFilter] = LazyEndpoint(
+        "DiameterFilter"
+    )
+    dlp: LazyEndpoint[Dlp] = LazyEndpoint("Dlp")
+    dnsfilter: LazyEndpoint[Dnsfilter] = LazyEndpoint("Dnsfilter")
+    emailfilter: LazyEndpoint[Emailfilter] = LazyEndpoint("Emailfilter")
+    endpoint_control: LazyEndpoint[EndpointControl] = LazyEndpoint(
+        "EndpointControl"
+    )
+    ethernet_oam: LazyEndpoint[EthernetOam] = LazyEndpoint("EthernetOam")
+    extension_controller: LazyEndpoint[ExtensionController] = LazyEndpoint(
+        "ExtensionController"
+    )
+    file_filter: LazyEndpoint[FileFilter] = LazyEndpoint("FileFilter")
+    firewall: LazyEndpoint[Firewall] = LazyEndpoint("Firewall")
+    ftp_proxy: LazyEndpoint[FtpProxy] = LazyEndpoint("FtpProxy")
+    icap: LazyEndpoint[Icap] = LazyEndpoint("Icap")
+    ips: LazyEndpoint[Ips] = LazyEndpoint("Ips")
+    log: LazyEndpoint[Log] = LazyEndpoint("Log")
+    monitoring: LazyEndpoint[Monitoring] = LazyEndpoint("Monitoring")
+    report: LazyEndpoint[Report] = LazyEndpoint("Report")
+    router: LazyEndpoint[Router] = LazyEndpoint("Router")
+    rule: LazyEndpoint[Rule] = LazyEndpoint("Rule")
+    sctp_filter: LazyEndpoint[SctpFilter] = LazyEndpoint("SctpFilter")
+    system: LazyEndpoint[System] = LazyEndpoint("System")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize CMDB helper
@@ -144,83 +240,6 @@ class CMDB:
         """
         self._client = client
 
-        # Initialize endpoint classes
-        from importlib import import_module
-
-        from .alertemail import Alertemail
-        from .antivirus import Antivirus
-        from .application import Application
-        from .authentication import Authentication
-        from .automation import Automation
-        from .casb import Casb
-        from .certificate import Certificate
-
-        diameter_filter_mod = import_module(
-            ".diameter_filter", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        from .dlp import Dlp
-        from .dnsfilter import Dnsfilter
-        from .emailfilter import Emailfilter
-
-        endpoint_control_mod = import_module(
-            ".endpoint_control", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        ethernet_oam_mod = import_module(
-            ".ethernet_oam", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        extension_controller_mod = import_module(
-            ".extension_controller", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        file_filter_mod = import_module(
-            ".file_filter", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        from .firewall import Firewall
-
-        ftp_proxy_mod = import_module(
-            ".ftp_proxy", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        from .icap import Icap
-        from .ips import Ips
-        from .log import Log
-        from .monitoring import Monitoring
-        from .report import Report
-        from .router import Router
-        from .rule import Rule
-
-        sctp_filter_mod = import_module(
-            ".sctp_filter", "hfortix.FortiOS.api.v2.cmdb"
-        )
-        from .system import System
-
-        self.alertemail = Alertemail(client)
-        self.antivirus = Antivirus(client)
-        self.application = Application(client)
-        self.authentication = Authentication(client)
-        self.automation = Automation(client)
-        self.casb = Casb(client)
-        self.certificate = Certificate(client)
-        self.diameter_filter = diameter_filter_mod.DiameterFilter(client)
-        self.dlp = Dlp(client)
-        self.dnsfilter = Dnsfilter(client)
-        self.emailfilter = Emailfilter(client)
-        self.endpoint_control = endpoint_control_mod.EndpointControl(client)
-        self.ethernet_oam = ethernet_oam_mod.EthernetOam(client)
-        self.extension_controller = (
-            extension_controller_mod.ExtensionController(client)
-        )
-        self.file_filter = file_filter_mod.FileFilter(client)
-        self.firewall = Firewall(client)
-        self.ftp_proxy = ftp_proxy_mod.FtpProxy(client)
-        self.icap = Icap(client)
-        self.ips = Ips(client)
-        self.log = Log(client)
-        self.monitoring = Monitoring(client)
-        self.report = Report(client)
-        self.router = Router(client)
-        self.rule = Rule(client)
-        self.sctp_filter = sctp_filter_mod.SctpFilter(client)
-        self.system = System(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
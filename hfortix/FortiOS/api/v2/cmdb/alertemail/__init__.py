@@ -1,9 +1,24 @@
 """FortiOS CMDB - Alertemail category"""
 
-from .setting import Setting
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Setting"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Setting": "._registry",
+    },
+)
+
 
 class Alertemail:
     """
@@ -12,6 +27,8 @@ class Alertemail:
     This class provides access to all alertemail CMDB endpoints.
     """
 
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+
     def __init__(self, client):
         """
         Initialize Alertemail with all endpoint classes.
@@ -19,4 +36,4 @@ class Alertemail:
         Args:
             client: HTTPClient instance
         """
-        self.setting = Setting(client)
+        self._client = client
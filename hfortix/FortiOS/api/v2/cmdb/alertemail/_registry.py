@@ -0,0 +1,48 @@
+"""FortiOS CMDB - Alertemail endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "setting": {
+        "class": "Setting",
+        "path": "/alertemail/setting",
+        "fields": {
+            "username": str,
+            "mailto1": str,
+            "mailto2": str,
+            "mailto3": str,
+            "filter-mode": str,
+            "email-interval": int,
+            "IPS-logs": str,
+            "firewall-authentication-failure-logs": str,
+            "HA-logs": str,
+            "IPsec-errors-logs": str,
+            "FDS-update-logs": str,
+            "PPP-errors-logs": str,
+            "antivirus-logs": str,
+            "webfilter-logs": str,
+            "configuration-changes-logs": str,
+            "violation-traffic-logs": str,
+            "admin-login-logs": str,
+            "FDS-license-expiring-warning": str,
+            "log-disk-usage-warning": str,
+            "fortiguard-log-quota-warning": str,
+            "amc-interface-bypass-mode": str,
+            "FIPS-CC-errors": str,
+            "FSSO-disconnect-logs": str,
+            "ssh-logs": str,
+            "local-disk-usage": int,
+            "emergency-interval": int,
+            "alert-interval": int,
+            "critical-interval": int,
+            "error-interval": int,
+            "warning-interval": int,
+            "notification-interval": int,
+            "information-interval": int,
+            "debug-interval": int,
+            "severity": str,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
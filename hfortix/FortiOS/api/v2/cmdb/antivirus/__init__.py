@@ -1,12 +1,27 @@
 """FortiOS CMDB - Antivirus category"""
 
-from .exempt_list import ExemptList
-from .profile import Profile
-from .quarantine import Quarantine
-from .settings import Settings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["ExemptList", "Profile", "Quarantine", "Settings"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "ExemptList": "._registry",
+        "Profile": "._registry",
+        "Quarantine": "._registry",
+        "Settings": "._registry",
+    },
+)
+
 
 class Antivirus:
     """
@@ -15,6 +30,11 @@ class Antivirus:
     This class provides access to all antivirus CMDB endpoints.
     """
 
+    exempt_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ExemptList")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    quarantine: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Quarantine")
+    settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Settings")
+
     def __init__(self, client):
         """
         Initialize Antivirus with all endpoint classes.
@@ -22,7 +42,4 @@ class Antivirus:
         Args:
             client: HTTPClient instance
         """
-        self.exempt_list = ExemptList(client)
-        self.profile = Profile(client)
-        self.quarantine = Quarantine(client)
-        self.settings = Settings(client)
+        self._client = client
@@ -0,0 +1,81 @@
+"""FortiOS CMDB - Antivirus endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "exempt_list": {
+        "class": "ExemptList",
+        "path": "/antivirus/exempt-list",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "hash-type": str,
+            "hash": str,
+            "status": str,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/antivirus/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "replacemsg-group": str,
+            "feature-set": str,
+            "fortisandbox-mode": str,
+            "fortisandbox-max-upload": int,
+            "analytics-ignore-filetype": int,
+            "analytics-accept-filetype": int,
+            "analytics-db": str,
+            "mobile-malware-db": str,
+            "http": list,
+            "ftp": list,
+            "imap": list,
+            "pop3": list,
+            "smtp": list,
+            "mapi": list,
+            "nntp": list,
+            "cifs": list,
+            "ssh": list,
+            "nac-quar": list,
+            "content-disarm": list,
+            "outbreak-prevention-archive-scan": str,
+            "external-blocklist-enable-all": str,
+            "external-blocklist": list,
+            "ems-threat-feed": str,
+            "av-virus-log": str,
+            "extended-log": str,
+            "scan-mode": str,
+        },
+    },
+    "quarantine": {
+        "class": "Quarantine",
+        "path": "/antivirus/quarantine",
+        "fields": {
+            "agelimit": int,
+            "maxfilesize": int,
+            "quarantine-quota": int,
+            "drop-infected": str,
+            "store-infected": str,
+            "drop-machine-learning": str,
+            "store-machine-learning": str,
+            "lowspace": str,
+            "destination": str,
+        },
+    },
+    "settings": {
+        "class": "Settings",
+        "path": "/antivirus/settings",
+        "fields": {
+            "machine-learning-detection": str,
+            "use-extreme-db": str,
+            "grayware": str,
+            "override-timeout": int,
+            "cache-infected-result": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,198 +0,0 @@
-"""
-FortiOS CMDB - Cmdb Antivirus Settings
-
-Configuration endpoint for managing cmdb antivirus settings objects.
-
-API Endpoints:
-    GET    /cmdb/antivirus/settings
-    PUT    /cmdb/antivirus/settings/{identifier}
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # List all items
-    >>> items = fgt.api.cmdb.antivirus.settings.get()
-    >>>
-    >>> # Get specific item (if supported)
-    >>> item = fgt.api.cmdb.antivirus.settings.get(name="item_name")
-    >>>
-    >>> # Create new item (use POST)
-    >>> result = fgt.api.cmdb.antivirus.settings.post(
-    ...     name="new_item",
-    ...     # ... additional parameters
-    ... )
-    >>>
-    >>> # Update existing item (use PUT)
-    >>> result = fgt.api.cmdb.antivirus.settings.put(
-    ...     name="existing_item",
-    ...     # ... parameters to update
-    ... )
-    >>>
-    >>> # Delete item
-    >>> result = fgt.api.cmdb.antivirus.settings.delete(name="item_name")
-
-Important:
-    - Use **POST** to create new objects (404 error if already exists)
-    - Use **PUT** to update existing objects (404 error if doesn't exist)
-    - Use **GET** to retrieve configuration (no changes made)
-    - Use **DELETE** to remove objects (404 error if doesn't exist)
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Settings:
-    """
-    Settings Operations.
-
-    Provides CRUD operations for FortiOS settings configuration.
-
-    Methods:
-        get(): Retrieve configuration objects
-        put(): Update existing configuration objects
-
-    Important:
-        - POST creates new objects (404 if name already exists)
-        - PUT updates existing objects (404 if name doesn't exist)
-        - GET retrieves objects without making changes
-        - DELETE removes objects (404 if name doesn't exist)
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Settings endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        exclude_default_values: bool | None = None,
-        stat_items: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Select all entries in a CLI table.
-
-        Args:
-            exclude_default_values: Exclude properties/objects with default
-            value (optional)
-            stat_items: Items to count occurrence in entire response (multiple
-            items should be separated by '|'). (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        endpoint = "/antivirus/settings"
-        if exclude_default_values is not None:
-            params["exclude-default-values"] = exclude_default_values
-        if stat_items is not None:
-            params["stat-items"] = stat_items
-        params.update(kwargs)
-        return self._client.get(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def put(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        before: str | None = None,
-        after: str | None = None,
-        machine_learning_detection: str | None = None,
-        use_extreme_db: str | None = None,
-        grayware: str | None = None,
-        override_timeout: int | None = None,
-        cache_infected_result: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Update this specific resource.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            before: If *action=move*, use *before* to specify the ID of the
-            resource that this resource will be moved before. (optional)
-            after: If *action=move*, use *after* to specify the ID of the
-            resource that this resource will be moved after. (optional)
-            machine_learning_detection: Use machine learning based malware
-            detection. (optional)
-            use_extreme_db: Enable/disable the use of Extreme AVDB. (optional)
-            grayware: Enable/disable grayware detection when an AntiVirus
-            profile is applied to traffic. (optional)
-            override_timeout: Override the large file scan timeout value in
-            seconds (30 - 3600). Zero is the default value and is used to
-            disable this command. When disabled, the daemon adjusts the large
-            file scan timeout based on the file size. (optional)
-            cache_infected_result: Enable/disable cache of infected scan
-            results (default = enable). (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-        endpoint = "/antivirus/settings"
-        if before is not None:
-            data_payload["before"] = before
-        if after is not None:
-            data_payload["after"] = after
-        if machine_learning_detection is not None:
-            data_payload["machine-learning-detection"] = (
-                machine_learning_detection
-            )
-        if use_extreme_db is not None:
-            data_payload["use-extreme-db"] = use_extreme_db
-        if grayware is not None:
-            data_payload["grayware"] = grayware
-        if override_timeout is not None:
-            data_payload["override-timeout"] = override_timeout
-        if cache_infected_result is not None:
-            data_payload["cache-infected-result"] = cache_infected_result
-        data_payload.update(kwargs)
-        return self._client.put(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
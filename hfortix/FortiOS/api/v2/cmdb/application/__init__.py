@@ -1,13 +1,28 @@
 """FortiOS CMDB - Application category"""
 
-from .custom import Custom
-from .group import Group
-from .list import List
-from .name import Name
-from .rule_settings import RuleSettings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Custom", "Group", "List", "Name", "RuleSettings"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Custom": "._registry",
+        "Group": "._registry",
+        "List": "._registry",
+        "Name": "._registry",
+        "RuleSettings": "._registry",
+    },
+)
+
 
 class Application:
     """
@@ -16,6 +31,12 @@ class Application:
     This class provides access to all application CMDB endpoints.
     """
 
+    custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Custom")
+    group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Group")
+    list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("List")
+    name: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Name")
+    rule_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("RuleSettings")
+
     def __init__(self, client):
         """
         Initialize Application with all endpoint classes.
@@ -23,8 +44,4 @@ class Application:
         Args:
             client: HTTPClient instance
         """
-        self.custom = Custom(client)
-        self.group = Group(client)
-        self.list = List(client)
-        self.name = Name(client)
-        self.rule_settings = RuleSettings(client)
+        self._client = client
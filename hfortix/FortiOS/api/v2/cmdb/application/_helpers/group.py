@@ -8,173 +8,26 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_TYPE = ["application", "filter"]
 VALID_BODY_POPULARITY = ["1", "2", "3", "4", "5"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_group_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_group_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating group.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate comment if present
-    if "comment" in payload:
-        value = payload.get("comment")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "comment cannot exceed 255 characters")
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate popularity if present
-    if "popularity" in payload:
-        value = payload.get("popularity")
-        if value and value not in VALID_BODY_POPULARITY:
-            return (
-                False,
-                f"Invalid popularity '{value}'. Must be one of: {', '.join(VALID_BODY_POPULARITY)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_group_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate comment if present
-    if "comment" in payload:
-        value = payload.get("comment")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "comment cannot exceed 255 characters")
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate popularity if present
-    if "popularity" in payload:
-        value = payload.get("popularity")
-        if value and value not in VALID_BODY_POPULARITY:
-            return (
-                False,
-                f"Invalid popularity '{value}'. Must be one of: {', '.join(VALID_BODY_POPULARITY)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_group_delete(name: str | None = None) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "comment": 255,
+        "type": VALID_BODY_TYPE,
+        "popularity": VALID_BODY_POPULARITY,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_group_get = SCHEMA.get_validator()
+validate_group_post = SCHEMA.post_validator()
+validate_group_put = SCHEMA.put_validator("name")
+validate_group_delete = SCHEMA.delete_validator("name")
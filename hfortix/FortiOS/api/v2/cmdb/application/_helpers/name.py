@@ -8,239 +8,26 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_name_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_name_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating name.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate category if present
-    if "category" in payload:
-        value = payload.get("category")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "category must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"category must be numeric, got: {value}")
-
-    # Validate popularity if present
-    if "popularity" in payload:
-        value = payload.get("popularity")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "popularity must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"popularity must be numeric, got: {value}")
-
-    # Validate risk if present
-    if "risk" in payload:
-        value = payload.get("risk")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "risk must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"risk must be numeric, got: {value}")
-
-    # Validate weight if present
-    if "weight" in payload:
-        value = payload.get("weight")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "weight must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"weight must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_name_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate category if present
-    if "category" in payload:
-        value = payload.get("category")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "category must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"category must be numeric, got: {value}")
-
-    # Validate popularity if present
-    if "popularity" in payload:
-        value = payload.get("popularity")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "popularity must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"popularity must be numeric, got: {value}")
-
-    # Validate risk if present
-    if "risk" in payload:
-        value = payload.get("risk")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "risk must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"risk must be numeric, got: {value}")
-
-    # Validate weight if present
-    if "weight" in payload:
-        value = payload.get("weight")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "weight must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"weight must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_name_delete(name: str | None = None) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "id": (0, 4294967295),
+        "category": (0, 4294967295),
+        "popularity": (0, 255),
+        "risk": (0, 255),
+        "weight": (0, 255),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_name_get = SCHEMA.get_validator()
+validate_name_post = SCHEMA.post_validator()
+validate_name_put = SCHEMA.put_validator("name")
+validate_name_delete = SCHEMA.delete_validator("name")
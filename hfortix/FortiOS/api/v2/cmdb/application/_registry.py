@@ -0,0 +1,92 @@
+"""FortiOS CMDB - Application endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "custom": {
+        "class": "Custom",
+        "path": "/application/custom",
+        "mkey": "tag",
+        "fields": {
+            "tag": str,
+            "id": int,
+            "comment": str,
+            "signature": str,
+            "category": int,
+            "protocol": str,
+            "technology": str,
+            "behavior": str,
+            "vendor": str,
+        },
+    },
+    "group": {
+        "class": "Group",
+        "path": "/application/group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "type": str,
+            "application": list,
+            "category": list,
+            "risk": list,
+            "protocols": str,
+            "vendor": str,
+            "technology": str,
+            "behavior": str,
+            "popularity": str,
+        },
+    },
+    "list": {
+        "class": "List",
+        "path": "/application/list",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "replacemsg-group": str,
+            "extended-log": str,
+            "other-application-action": str,
+            "app-replacemsg": str,
+            "other-application-log": str,
+            "enforce-default-app-port": str,
+            "force-inclusion-ssl-di-sigs": str,
+            "unknown-application-action": str,
+            "unknown-application-log": str,
+            "p2p-block-list": str,
+            "deep-app-inspection": str,
+            "options": str,
+            "entries": list,
+            "control-default-network-services": str,
+            "default-network-services": list,
+        },
+    },
+    "name": {
+        "class": "Name",
+        "path": "/application/name",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "category": int,
+            "popularity": int,
+            "risk": int,
+            "weight": int,
+            "protocol": str,
+            "technology": str,
+            "behavior": str,
+            "vendor": str,
+            "parameters": list,
+            "metadata": list,
+            "status": str,
+        },
+    },
+    "rule_settings": {
+        "class": "RuleSettings",
+        "path": "/application/rule-settings",
+        "mkey": "id",
+        "fields": {"id": int},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
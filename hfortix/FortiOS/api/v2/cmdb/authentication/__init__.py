@@ -1,11 +1,26 @@
 """FortiOS CMDB - Authentication category"""
 
-from .rule import Rule
-from .scheme import Scheme
-from .setting import Setting
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Rule", "Scheme", "Setting"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Rule": "._registry",
+        "Scheme": "._registry",
+        "Setting": "._registry",
+    },
+)
+
 
 class Authentication:
     """
@@ -14,6 +29,10 @@ class Authentication:
     This class provides access to all authentication CMDB endpoints.
     """
 
+    rule: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Rule")
+    scheme: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Scheme")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+
     def __init__(self, client):
         """
         Initialize Authentication with all endpoint classes.
@@ -21,6 +40,4 @@ class Authentication:
         Args:
             client: HTTPClient instance
         """
-        self.rule = Rule(client)
-        self.scheme = Scheme(client)
-        self.setting = Setting(client)
+        self._client = client
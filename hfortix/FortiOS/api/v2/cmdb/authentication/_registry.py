@@ -0,0 +1,86 @@
+"""FortiOS CMDB - Authentication endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "rule": {
+        "class": "Rule",
+        "path": "/authentication/rule",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "protocol": str,
+            "srcintf": list,
+            "srcaddr": list,
+            "dstaddr": list,
+            "srcaddr6": list,
+            "dstaddr6": list,
+            "ip-based": str,
+            "active-auth-method": str,
+            "sso-auth-method": str,
+            "web-auth-cookie": str,
+            "cors-stateful": str,
+            "cors-depth": int,
+            "cert-auth-cookie": str,
+            "transaction-based": str,
+            "web-portal": str,
+            "comments": str,
+            "session-logout": str,
+        },
+    },
+    "scheme": {
+        "class": "Scheme",
+        "path": "/authentication/scheme",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "method": str,
+            "negotiate-ntlm": str,
+            "kerberos-keytab": str,
+            "domain-controller": str,
+            "saml-server": str,
+            "saml-timeout": int,
+            "fsso-agent-for-ntlm": str,
+            "require-tfa": str,
+            "fsso-guest": str,
+            "user-cert": str,
+            "cert-http-header": str,
+            "user-database": list,
+            "ssh-ca": str,
+            "external-idp": str,
+            "group-attr-type": str,
+            "digest-algo": str,
+            "digest-rfc2069": str,
+        },
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/authentication/setting",
+        "fields": {
+            "active-auth-scheme": str,
+            "sso-auth-scheme": str,
+            "update-time": str,
+            "persistent-cookie": str,
+            "ip-auth-cookie": str,
+            "cookie-max-age": int,
+            "cookie-refresh-div": int,
+            "captive-portal-type": str,
+            "captive-portal-ip": str,
+            "captive-portal-ip6": str,
+            "captive-portal": str,
+            "captive-portal6": str,
+            "cert-auth": str,
+            "cert-captive-portal": str,
+            "cert-captive-portal-ip": str,
+            "cert-captive-portal-port": int,
+            "captive-portal-port": int,
+            "auth-https": str,
+            "captive-portal-ssl-port": int,
+            "user-cert-ca": list,
+            "dev-range": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -0,0 +1,17 @@
+"""FortiOS CMDB - Automation endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "setting": {
+        "class": "Setting",
+        "path": "/automation/setting",
+        "fields": {
+            "max-concurrent-stitches": int,
+            "fabric-sync": str,
+            "secure-mode": str,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,12 +1,27 @@
 """FortiOS CMDB - Casb category"""
 
-from .attribute_match import AttributeMatch
-from .profile import Profile
-from .saas_application import SaasApplication
-from .user_activity import UserActivity
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["AttributeMatch", "Profile", "SaasApplication", "UserActivity"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AttributeMatch": "._registry",
+        "Profile": "._registry",
+        "SaasApplication": "._registry",
+        "UserActivity": "._registry",
+    },
+)
+
 
 class Casb:
     """
@@ -15,6 +30,15 @@ class Casb:
     This class provides access to all casb CMDB endpoints.
     """
 
+    attribute_match: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AttributeMatch"
+    )
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    saas_application: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SaasApplication"
+    )
+    user_activity: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("UserActivity")
+
     def __init__(self, client):
         """
         Initialize Casb with all endpoint classes.
@@ -22,7 +46,4 @@ class Casb:
         Args:
             client: HTTPClient instance
         """
-        self.attribute_match = AttributeMatch(client)
-        self.profile = Profile(client)
-        self.saas_application = SaasApplication(client)
-        self.user_activity = UserActivity(client)
+        self._client = client
@@ -8,201 +8,28 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = ["enable", "disable"]
 VALID_BODY_TYPE = ["built-in", "customized"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_saas_application_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_saas_application_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating saas_application.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "name cannot exceed 79 characters")
-
-    # Validate uuid if present
-    if "uuid" in payload:
-        value = payload.get("uuid")
-        if value and isinstance(value, str) and len(value) > 36:
-            return (False, "uuid cannot exceed 36 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate casb-name if present
-    if "casb-name" in payload:
-        value = payload.get("casb-name")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "casb-name cannot exceed 79 characters")
-
-    # Validate description if present
-    if "description" in payload:
-        value = payload.get("description")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "description cannot exceed 63 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_saas_application_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "name cannot exceed 79 characters")
-
-    # Validate uuid if present
-    if "uuid" in payload:
-        value = payload.get("uuid")
-        if value and isinstance(value, str) and len(value) > 36:
-            return (False, "uuid cannot exceed 36 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate casb-name if present
-    if "casb-name" in payload:
-        value = payload.get("casb-name")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "casb-name cannot exceed 79 characters")
-
-    # Validate description if present
-    if "description" in payload:
-        value = payload.get("description")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "description cannot exceed 63 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_saas_application_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 79,
+        "uuid": 36,
+        "status": VALID_BODY_STATUS,
+        "type": VALID_BODY_TYPE,
+        "casb-name": 79,
+        "description": 63,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_saas_application_get = SCHEMA.get_validator()
+validate_saas_application_post = SCHEMA.post_validator()
+validate_saas_application_put = SCHEMA.put_validator("name")
+validate_saas_application_delete = SCHEMA.delete_validator("name")
@@ -0,0 +1,59 @@
+"""FortiOS CMDB - Casb endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "attribute_match": {
+        "class": "AttributeMatch",
+        "path": "/casb/attribute-match",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "application": str,
+            "match-strategy": str,
+            "match": list,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/casb/profile",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "saas-application": list},
+    },
+    "saas_application": {
+        "class": "SaasApplication",
+        "path": "/casb/saas-application",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "status": str,
+            "type": str,
+            "casb-name": str,
+            "description": str,
+            "domains": list,
+            "output-attributes": list,
+            "input-attributes": list,
+        },
+    },
+    "user_activity": {
+        "class": "UserActivity",
+        "path": "/casb/user-activity",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "status": str,
+            "description": str,
+            "type": str,
+            "casb-name": str,
+            "application": str,
+            "category": str,
+            "match-strategy": str,
+            "match": list,
+            "control-options": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,13 +1,28 @@
 """FortiOS CMDB - Certificate category"""
 
-from .ca import Ca
-from .crl import Crl
-from .hsm_local import HsmLocal
-from .local import Local
-from .remote import Remote
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Ca", "Crl", "HsmLocal", "Local", "Remote"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Ca": "._registry",
+        "Crl": "._registry",
+        "HsmLocal": "._registry",
+        "Local": "._registry",
+        "Remote": "._registry",
+    },
+)
+
 
 class Certificate:
     """
@@ -16,6 +31,12 @@ class Certificate:
     This class provides access to all certificate CMDB endpoints.
     """
 
+    ca: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ca")
+    crl: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Crl")
+    hsm_local: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("HsmLocal")
+    local: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Local")
+    remote: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Remote")
+
     def __init__(self, client):
         """
         Initialize Certificate with all endpoint classes.
@@ -23,8 +44,4 @@ class Certificate:
         Args:
             client: HTTPClient instance
         """
-        self.ca = Ca(client)
-        self.crl = Crl(client)
-        self.hsm_local = HsmLocal(client)
-        self.local = Local(client)
-        self.remote = Remote(client)
+        self._client = client
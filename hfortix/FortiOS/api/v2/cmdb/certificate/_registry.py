@@ -0,0 +1,55 @@
+"""FortiOS CMDB - Certificate endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "ca": {
+        "class": "Ca",
+        "path": "/certificate/ca",
+        "mkey": "name",
+        "methods": ("get", "iter", "aiter", "exists"),
+    },
+    "crl": {
+        "class": "Crl",
+        "path": "/certificate/crl",
+        "mkey": "name",
+        "methods": ("get", "iter", "aiter", "exists"),
+    },
+    "hsm_local": {
+        "class": "HsmLocal",
+        "path": "/certificate/hsm-local",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comments": str,
+            "vendor": str,
+            "api-version": str,
+            "certificate": str,
+            "range": str,
+            "source": str,
+            "gch-url": str,
+            "gch-project": str,
+            "gch-location": str,
+            "gch-keyring": str,
+            "gch-cryptokey": str,
+            "gch-cryptokey-version": str,
+            "gch-cloud-service-name": str,
+            "gch-cryptokey-algorithm": str,
+            "details": str,
+        },
+    },
+    "local": {
+        "class": "Local",
+        "path": "/certificate/local",
+        "mkey": "name",
+        "methods": ("get", "iter", "aiter", "exists"),
+    },
+    "remote": {
+        "class": "Remote",
+        "path": "/certificate/remote",
+        "mkey": "name",
+        "methods": ("get", "iter", "aiter", "exists"),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,9 +1,24 @@
 """FortiOS CMDB - Diameter-filter category"""
 
-from .profile import Profile
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Profile"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Profile": "._registry",
+    },
+)
+
 
 class DiameterFilter:
     """
@@ -12,6 +27,8 @@ class DiameterFilter:
     This class provides access to all diameter-filter CMDB endpoints.
     """
 
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+
     def __init__(self, client):
         """
         Initialize DiameterFilter with all endpoint classes.
@@ -19,4 +36,4 @@ class DiameterFilter:
         Args:
             client: HTTPClient instance
         """
-        self.profile = Profile(client)
+        self._client = client
@@ -0,0 +1,27 @@
+"""FortiOS CMDB - Diameter Filter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/diameter-filter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "monitor-all-messages": str,
+            "log-packet": str,
+            "track-requests-answers": str,
+            "missing-request-action": str,
+            "protocol-version-invalid": str,
+            "message-length-invalid": str,
+            "request-error-flag-set": str,
+            "cmd-flags-reserve-set": str,
+            "command-code-invalid": str,
+            "command-code-range": str,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,13 +1,14 @@
 """FortiOS CMDB - Dlp category"""
 
-from .data_type import DataType
-from .dictionary import Dictionary
-from .exact_data_match import ExactDataMatch
-from .filepattern import Filepattern
-from .label import Label
-from .profile import Profile
-from .sensor import Sensor
-from .settings import Settings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "DataType",
@@ -20,6 +21,20 @@ __all__ = [
     "Settings",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "DataType": "._registry",
+        "Dictionary": "._registry",
+        "ExactDataMatch": "._registry",
+        "Filepattern": "._registry",
+        "Label": "._registry",
+        "Profile": "._registry",
+        "Sensor": "._registry",
+        "Settings": "._registry",
+    },
+)
+
 
 class Dlp:
     """
@@ -28,6 +43,17 @@ class Dlp:
     This class provides access to all dlp CMDB endpoints.
     """
 
+    data_type: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DataType")
+    dictionary: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Dictionary")
+    exact_data_match: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ExactDataMatch"
+    )
+    filepattern: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Filepattern")
+    label: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Label")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    sensor: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Sensor")
+    settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Settings")
+
     def __init__(self, client):
         """
         Initialize Dlp with all endpoint classes.
@@ -35,11 +61,4 @@ class Dlp:
         Args:
             client: HTTPClient instance
         """
-        self.data_type = DataType(client)
-        self.dictionary = Dictionary(client)
-        self.exact_data_match = ExactDataMatch(client)
-        self.filepattern = Filepattern(client)
-        self.label = Label(client)
-        self.profile = Profile(client)
-        self.sensor = Sensor(client)
-        self.settings = Settings(client)
+        self._client = client
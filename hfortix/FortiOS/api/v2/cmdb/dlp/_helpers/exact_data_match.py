@@ -8,161 +8,23 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_exact_data_match_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_exact_data_match_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating exact_data_match.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate optional if present
-    if "optional" in payload:
-        value = payload.get("optional")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 32:
-                    return (False, "optional must be between 0 and 32")
-            except (ValueError, TypeError):
-                return (False, f"optional must be numeric, got: {value}")
-
-    # Validate data if present
-    if "data" in payload:
-        value = payload.get("data")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "data cannot exceed 35 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_exact_data_match_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate optional if present
-    if "optional" in payload:
-        value = payload.get("optional")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 32:
-                    return (False, "optional must be between 0 and 32")
-            except (ValueError, TypeError):
-                return (False, f"optional must be numeric, got: {value}")
-
-    # Validate data if present
-    if "data" in payload:
-        value = payload.get("data")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "data cannot exceed 35 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_exact_data_match_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "optional": (0, 32),
+        "data": 35,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_exact_data_match_get = SCHEMA.get_validator()
+validate_exact_data_match_post = SCHEMA.post_validator()
+validate_exact_data_match_put = SCHEMA.put_validator("name")
+validate_exact_data_match_delete = SCHEMA.delete_validator("name")
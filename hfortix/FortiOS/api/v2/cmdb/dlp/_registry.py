@@ -0,0 +1,99 @@
+"""FortiOS CMDB - Dlp endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "data_type": {
+        "class": "DataType",
+        "path": "/dlp/data-type",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "verify": str,
+            "verify2": str,
+            "match-around": str,
+            "look-back": int,
+            "look-ahead": int,
+            "match-back": int,
+            "match-ahead": int,
+            "transform": str,
+            "verify-transformed-pattern": str,
+            "comment": str,
+        },
+    },
+    "dictionary": {
+        "class": "Dictionary",
+        "path": "/dlp/dictionary",
+        "mkey": "name",
+        "fields": {
+            "uuid": str,
+            "name": str,
+            "match-type": str,
+            "match-around": str,
+            "comment": str,
+            "entries": list,
+        },
+    },
+    "exact_data_match": {
+        "class": "ExactDataMatch",
+        "path": "/dlp/exact-data-match",
+        "mkey": "name",
+        "fields": {"name": str, "optional": int, "data": str, "columns": list},
+    },
+    "filepattern": {
+        "class": "Filepattern",
+        "path": "/dlp/filepattern",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "label": {
+        "class": "Label",
+        "path": "/dlp/label",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "mpip-type": str,
+            "connector": str,
+            "comment": str,
+            "entries": list,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/dlp/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "feature-set": str,
+            "replacemsg-group": str,
+            "rule": list,
+            "dlp-log": str,
+            "extended-log": str,
+            "nac-quar-log": str,
+            "full-archive-proto": str,
+            "summary-proto": str,
+            "fortidata-error-action": str,
+        },
+    },
+    "sensor": {
+        "class": "Sensor",
+        "path": "/dlp/sensor",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "match-type": str,
+            "eval": str,
+            "comment": str,
+            "entries": list,
+        },
+    },
+    "settings": {
+        "class": "Settings",
+        "path": "/dlp/settings",
+        "fields": {"config-builder-timeout": int},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
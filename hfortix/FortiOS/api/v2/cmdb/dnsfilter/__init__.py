@@ -1,10 +1,25 @@
 """FortiOS CMDB - Dnsfilter category"""
 
-from .domain_filter import DomainFilter
-from .profile import Profile
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["DomainFilter", "Profile"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "DomainFilter": "._registry",
+        "Profile": "._registry",
+    },
+)
+
 
 class Dnsfilter:
     """
@@ -13,6 +28,9 @@ class Dnsfilter:
     This class provides access to all dnsfilter CMDB endpoints.
     """
 
+    domain_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DomainFilter")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+
     def __init__(self, client):
         """
         Initialize Dnsfilter with all endpoint classes.
@@ -20,5 +38,4 @@ class Dnsfilter:
         Args:
             client: HTTPClient instance
         """
-        self.domain_filter = DomainFilter(client)
-        self.profile = Profile(client)
+        self._client = client
@@ -0,0 +1,38 @@
+"""FortiOS CMDB - Dnsfilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "domain_filter": {
+        "class": "DomainFilter",
+        "path": "/dnsfilter/domain-filter",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/dnsfilter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "domain-filter": list,
+            "ftgd-dns": list,
+            "log-all-domain": str,
+            "sdns-ftgd-err-log": str,
+            "sdns-domain-log": str,
+            "block-action": str,
+            "redirect-portal": str,
+            "redirect-portal6": str,
+            "block-botnet": str,
+            "safe-search": str,
+            "youtube-restrict": str,
+            "external-ip-blocklist": list,
+            "dns-translation": list,
+            "transparent-dns-database": list,
+            "strip-ech": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,13 +1,14 @@
 """FortiOS CMDB - Emailfilter category"""
 
-from .block_allow_list import BlockAllowList
-from .bword import Bword
-from .dnsbl import Dnsbl
-from .fortishield import Fortishield
-from .iptrust import Iptrust
-from .mheader import Mheader
-from .options import Options
-from .profile import Profile
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "BlockAllowList",
@@ -20,6 +21,20 @@ __all__ = [
     "Profile",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "BlockAllowList": "._registry",
+        "Bword": "._registry",
+        "Dnsbl": "._registry",
+        "Fortishield": "._registry",
+        "Iptrust": "._registry",
+        "Mheader": "._registry",
+        "Options": "._registry",
+        "Profile": "._registry",
+    },
+)
+
 
 class Emailfilter:
     """
@@ -28,6 +43,17 @@ class Emailfilter:
     This class provides access to all emailfilter CMDB endpoints.
     """
 
+    block_allow_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "BlockAllowList"
+    )
+    bword: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Bword")
+    dnsbl: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Dnsbl")
+    fortishield: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortishield")
+    iptrust: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Iptrust")
+    mheader: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Mheader")
+    options: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Options")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+
     def __init__(self, client):
         """
         Initialize Emailfilter with all endpoint classes.
@@ -35,11 +61,4 @@ class Emailfilter:
         Args:
             client: HTTPClient instance
         """
-        self.block_allow_list = BlockAllowList(client)
-        self.bword = Bword(client)
-        self.dnsbl = Dnsbl(client)
-        self.fortishield = Fortishield(client)
-        self.iptrust = Iptrust(client)
-        self.mheader = Mheader(client)
-        self.options = Options(client)
-        self.profile = Profile(client)
+        self._client = client
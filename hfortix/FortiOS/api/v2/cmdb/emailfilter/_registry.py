@@ -0,0 +1,78 @@
+"""FortiOS CMDB - Emailfilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "block_allow_list": {
+        "class": "BlockAllowList",
+        "path": "/emailfilter/block-allow-list",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "bword": {
+        "class": "Bword",
+        "path": "/emailfilter/bword",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "dnsbl": {
+        "class": "Dnsbl",
+        "path": "/emailfilter/dnsbl",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "fortishield": {
+        "class": "Fortishield",
+        "path": "/emailfilter/fortishield",
+        "fields": {
+            "spam-submit-srv": str,
+            "spam-submit-force": str,
+            "spam-submit-txt2htm": str,
+        },
+    },
+    "iptrust": {
+        "class": "Iptrust",
+        "path": "/emailfilter/iptrust",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "mheader": {
+        "class": "Mheader",
+        "path": "/emailfilter/mheader",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "options": {
+        "class": "Options",
+        "path": "/emailfilter/options",
+        "fields": {"dns-timeout": int},
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/emailfilter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "feature-set": str,
+            "replacemsg-group": str,
+            "spam-log": str,
+            "spam-log-fortiguard-response": str,
+            "spam-filtering": str,
+            "external": str,
+            "options": str,
+            "imap": list,
+            "pop3": list,
+            "smtp": list,
+            "other-webmails": list,
+            "spam-bword-threshold": int,
+            "spam-bword-table": int,
+            "spam-bal-table": int,
+            "spam-mheader-table": int,
+            "spam-rbl-table": int,
+            "spam-iptrust-table": int,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,11 +1,26 @@
 """FortiOS CMDB - Endpoint-control category"""
 
-from .fctems import Fctems
-from .fctems_override import FctemsOverride
-from .settings import Settings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Fctems", "FctemsOverride", "Settings"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Fctems": "._registry",
+        "FctemsOverride": "._registry",
+        "Settings": "._registry",
+    },
+)
+
 
 class EndpointControl:
     """
@@ -14,6 +29,12 @@ class EndpointControl:
     This class provides access to all endpoint-control CMDB endpoints.
     """
 
+    fctems: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fctems")
+    fctems_override: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FctemsOverride"
+    )
+    settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Settings")
+
     def __init__(self, client):
         """
         Initialize EndpointControl with all endpoint classes.
@@ -21,6 +42,4 @@ class EndpointControl:
         Args:
             client: HTTPClient instance
         """
-        self.fctems = Fctems(client)
-        self.fctems_override = FctemsOverride(client)
-        self.settings = Settings(client)
+        self._client = client
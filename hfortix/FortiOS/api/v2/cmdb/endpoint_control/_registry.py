@@ -0,0 +1,75 @@
+"""FortiOS CMDB - Endpoint Control endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "fctems": {
+        "class": "Fctems",
+        "path": "/endpoint-control/fctems",
+        "mkey": "ems-id",
+        "fields": {
+            "ems-id": int,
+            "status": str,
+            "name": str,
+            "dirty-reason": str,
+            "fortinetone-cloud-authentication": str,
+            "cloud-authentication-access-key": str,
+            "server": str,
+            "https-port": int,
+            "serial-number": str,
+            "tenant-id": str,
+            "source-ip": str,
+            "pull-sysinfo": str,
+            "pull-vulnerabilities": str,
+            "pull-tags": str,
+            "pull-malware-hash": str,
+            "capabilities": str,
+            "call-timeout": int,
+            "out-of-sync-threshold": int,
+            "send-tags-to-all-vdoms": str,
+            "websocket-override": str,
+            "interface-select-method": str,
+            "interface": str,
+            "trust-ca-cn": str,
+            "verifying-ca": str,
+        },
+    },
+    "fctems_override": {
+        "class": "FctemsOverride",
+        "path": "/endpoint-control/fctems-override",
+        "mkey": "ems-id",
+        "fields": {
+            "ems-id": int,
+            "status": str,
+            "name": str,
+            "dirty-reason": str,
+            "fortinetone-cloud-authentication": str,
+            "cloud-authentication-access-key": str,
+            "server": str,
+            "https-port": int,
+            "serial-number": str,
+            "tenant-id": str,
+            "source-ip": str,
+            "pull-sysinfo": str,
+            "pull-vulnerabilities": str,
+            "pull-tags": str,
+            "pull-malware-hash": str,
+            "capabilities": str,
+            "call-timeout": int,
+            "out-of-sync-threshold": int,
+            "send-tags-to-all-vdoms": str,
+            "websocket-override": str,
+            "interface-select-method": str,
+            "interface": str,
+            "trust-ca-cn": str,
+            "verifying-ca": str,
+        },
+    },
+    "settings": {
+        "class": "Settings",
+        "path": "/endpoint-control/settings",
+        "fields": {"override": str},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,9 +1,24 @@
 """FortiOS CMDB - Ethernet-oam category"""
 
-from .cfm import Cfm
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Cfm"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Cfm": "._registry",
+    },
+)
+
 
 class EthernetOam:
     """
@@ -12,6 +27,8 @@ class EthernetOam:
     This class provides access to all ethernet-oam CMDB endpoints.
     """
 
+    cfm: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Cfm")
+
     def __init__(self, client):
         """
         Initialize EthernetOam with all endpoint classes.
@@ -19,4 +36,4 @@ class EthernetOam:
         Args:
             client: HTTPClient instance
         """
-        self.cfm = Cfm(client)
+        self._client = client
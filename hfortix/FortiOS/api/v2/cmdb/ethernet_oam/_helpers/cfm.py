@@ -8,86 +8,20 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_cfm_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_cfm_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating cfm.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate domain-id if present
-    if "domain-id" in payload:
-        value = payload.get("domain-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "domain-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"domain-id must be numeric, got: {value}")
-
-    # Validate domain-level if present
-    if "domain-level" in payload:
-        value = payload.get("domain-level")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 7:
-                    return (False, "domain-level must be between 0 and 7")
-            except (ValueError, TypeError):
-                return (False, f"domain-level must be numeric, got: {value}")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "domain-id": (0, 4294967295),
+        "domain-level": (0, 7),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_cfm_get = SCHEMA.get_validator()
+validate_cfm_post = SCHEMA.post_validator()
@@ -0,0 +1,19 @@
+"""FortiOS CMDB - Ethernet Oam endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "cfm": {
+        "class": "Cfm",
+        "path": "/ethernet-oam/cfm",
+        "mkey": "domain-id",
+        "fields": {
+            "domain-id": int,
+            "domain-name": str,
+            "domain-level": int,
+            "service": list,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
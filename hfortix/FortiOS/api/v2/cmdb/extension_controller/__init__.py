@@ -1,11 +1,14 @@
 """FortiOS CMDB - Extension-controller category"""
 
-from .dataplan import Dataplan
-from .extender import Extender
-from .extender_profile import ExtenderProfile
-from .extender_vap import ExtenderVap
-from .fortigate import Fortigate
-from .fortigate_profile import FortigateProfile
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "Dataplan",
@@ -16,6 +19,18 @@ __all__ = [
     "FortigateProfile",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Dataplan": "._registry",
+        "Extender": "._registry",
+        "ExtenderProfile": "._registry",
+        "ExtenderVap": "._registry",
+        "Fortigate": "._registry",
+        "FortigateProfile": "._registry",
+    },
+)
+
 
 class ExtensionController:
     """
@@ -24,6 +39,17 @@ class ExtensionController:
     This class provides access to all extension-controller CMDB endpoints.
     """
 
+    dataplan: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Dataplan")
+    extender: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Extender")
+    extender_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ExtenderProfile"
+    )
+    extender_vap: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ExtenderVap")
+    fortigate: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortigate")
+    fortigate_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortigateProfile"
+    )
+
     def __init__(self, client):
         """
         Initialize ExtensionController with all endpoint classes.
@@ -31,9 +57,4 @@ class ExtensionController:
         Args:
             client: HTTPClient instance
         """
-        self.dataplan = Dataplan(client)
-        self.extender = Extender(client)
-        self.extender_profile = ExtenderProfile(client)
-        self.extender_vap = ExtenderVap(client)
-        self.fortigate = Fortigate(client)
-        self.fortigate_profile = FortigateProfile(client)
+        self._client = client
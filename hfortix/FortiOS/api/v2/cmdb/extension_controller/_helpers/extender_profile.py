@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_MODEL = [
@@ -47,268 +47,23 @@ VALID_BODY_LOGIN_PASSWORD_CHANGE = ["yes", "default", "no"]
 VALID_BODY_ENFORCE_BANDWIDTH = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_extender_profile_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_extender_profile_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating extender_profile.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (False, "name cannot exceed 31 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 102400000:
-                    return (False, "id must be between 0 and 102400000")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate model if present
-    if "model" in payload:
-        value = payload.get("model")
-        if value and value not in VALID_BODY_MODEL:
-            return (
-                False,
-                f"Invalid model '{value}'. Must be one of: {', '.join(VALID_BODY_MODEL)}",
-            )
-
-    # Validate extension if present
-    if "extension" in payload:
-        value = payload.get("extension")
-        if value and value not in VALID_BODY_EXTENSION:
-            return (
-                False,
-                f"Invalid extension '{value}'. Must be one of: {', '.join(VALID_BODY_EXTENSION)}",
-            )
-
-    # Validate allowaccess if present
-    if "allowaccess" in payload:
-        value = payload.get("allowaccess")
-        if value and value not in VALID_BODY_ALLOWACCESS:
-            return (
-                False,
-                f"Invalid allowaccess '{value}'. Must be one of: {', '.join(VALID_BODY_ALLOWACCESS)}",
-            )
-
-    # Validate login-password-change if present
-    if "login-password-change" in payload:
-        value = payload.get("login-password-change")
-        if value and value not in VALID_BODY_LOGIN_PASSWORD_CHANGE:
-            return (
-                False,
-                f"Invalid login-password-change '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN_PASSWORD_CHANGE)}",
-            )
-
-    # Validate enforce-bandwidth if present
-    if "enforce-bandwidth" in payload:
-        value = payload.get("enforce-bandwidth")
-        if value and value not in VALID_BODY_ENFORCE_BANDWIDTH:
-            return (
-                False,
-                f"Invalid enforce-bandwidth '{value}'. Must be one of: {', '.join(VALID_BODY_ENFORCE_BANDWIDTH)}",
-            )
-
-    # Validate bandwidth-limit if present
-    if "bandwidth-limit" in payload:
-        value = payload.get("bandwidth-limit")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 16776000:
-                    return (
-                        False,
-                        "bandwidth-limit must be between 1 and 16776000",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"bandwidth-limit must be numeric, got: {value}",
-                )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_extender_profile_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (False, "name cannot exceed 31 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 102400000:
-                    return (False, "id must be between 0 and 102400000")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate model if present
-    if "model" in payload:
-        value = payload.get("model")
-        if value and value not in VALID_BODY_MODEL:
-            return (
-                False,
-                f"Invalid model '{value}'. Must be one of: {', '.join(VALID_BODY_MODEL)}",
-            )
-
-    # Validate extension if present
-    if "extension" in payload:
-        value = payload.get("extension")
-        if value and value not in VALID_BODY_EXTENSION:
-            return (
-                False,
-                f"Invalid extension '{value}'. Must be one of: {', '.join(VALID_BODY_EXTENSION)}",
-            )
-
-    # Validate allowaccess if present
-    if "allowaccess" in payload:
-        value = payload.get("allowaccess")
-        if value and value not in VALID_BODY_ALLOWACCESS:
-            return (
-                False,
-                f"Invalid allowaccess '{value}'. Must be one of: {', '.join(VALID_BODY_ALLOWACCESS)}",
-            )
-
-    # Validate login-password-change if present
-    if "login-password-change" in payload:
-        value = payload.get("login-password-change")
-        if value and value not in VALID_BODY_LOGIN_PASSWORD_CHANGE:
-            return (
-                False,
-                f"Invalid login-password-change '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN_PASSWORD_CHANGE)}",
-            )
-
-    # Validate enforce-bandwidth if present
-    if "enforce-bandwidth" in payload:
-        value = payload.get("enforce-bandwidth")
-        if value and value not in VALID_BODY_ENFORCE_BANDWIDTH:
-            return (
-                False,
-                f"Invalid enforce-bandwidth '{value}'. Must be one of: {', '.join(VALID_BODY_ENFORCE_BANDWIDTH)}",
-            )
-
-    # Validate bandwidth-limit if present
-    if "bandwidth-limit" in payload:
-        value = payload.get("bandwidth-limit")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 16776000:
-                    return (
-                        False,
-                        "bandwidth-limit must be between 1 and 16776000",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"bandwidth-limit must be numeric, got: {value}",
-                )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_extender_profile_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 31,
+        "id": (0, 102400000),
+        "model": VALID_BODY_MODEL,
+        "extension": VALID_BODY_EXTENSION,
+        "allowaccess": VALID_BODY_ALLOWACCESS,
+        "login-password-change": VALID_BODY_LOGIN_PASSWORD_CHANGE,
+        "enforce-bandwidth": VALID_BODY_ENFORCE_BANDWIDTH,
+        "bandwidth-limit": (1, 16776000),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_extender_profile_get = SCHEMA.get_validator()
+validate_extender_profile_post = SCHEMA.post_validator()
+validate_extender_profile_put = SCHEMA.put_validator("name")
+validate_extender_profile_delete = SCHEMA.delete_validator("name")
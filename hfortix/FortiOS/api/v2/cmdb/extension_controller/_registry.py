@@ -0,0 +1,131 @@
+"""FortiOS CMDB - Extension Controller endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "dataplan": {
+        "class": "Dataplan",
+        "path": "/extension-controller/dataplan",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "modem-id": str,
+            "type": str,
+            "slot": str,
+            "iccid": str,
+            "carrier": str,
+            "apn": str,
+            "auth-type": str,
+            "username": str,
+            "password": str,
+            "pdn": str,
+            "signal-threshold": int,
+            "signal-period": int,
+            "capacity": int,
+            "monthly-fee": int,
+            "billing-date": int,
+            "overage": str,
+            "preferred-subnet": int,
+            "private-network": str,
+        },
+    },
+    "extender": {
+        "class": "Extender",
+        "path": "/extension-controller/extender",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": str,
+            "authorized": str,
+            "ext-name": str,
+            "description": str,
+            "device-id": int,
+            "extension-type": str,
+            "profile": str,
+            "override-allowaccess": str,
+            "allowaccess": str,
+            "override-login-password-change": str,
+            "login-password-change": str,
+            "login-password": str,
+            "override-enforce-bandwidth": str,
+            "enforce-bandwidth": str,
+            "bandwidth-limit": int,
+            "wan-extension": list,
+            "firmware-provision-latest": str,
+        },
+    },
+    "extender_profile": {
+        "class": "ExtenderProfile",
+        "path": "/extension-controller/extender-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "model": str,
+            "extension": str,
+            "allowaccess": str,
+            "login-password-change": str,
+            "login-password": str,
+            "enforce-bandwidth": str,
+            "bandwidth-limit": int,
+            "cellular": list,
+            "wifi": list,
+            "lan-extension": list,
+        },
+    },
+    "extender_vap": {
+        "class": "ExtenderVap",
+        "path": "/extension-controller/extender-vap",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "ssid": str,
+            "max-clients": int,
+            "broadcast-ssid": str,
+            "security": str,
+            "dtim": int,
+            "rts-threshold": int,
+            "pmf": str,
+            "target-wake-time": str,
+            "bss-color-partial": str,
+            "mu-mimo": str,
+            "passphrase": str,
+            "sae-password": str,
+            "auth-server-address": str,
+            "auth-server-port": int,
+            "auth-server-secret": str,
+            "ip-address": str,
+            "start-ip": str,
+            "end-ip": str,
+            "allowaccess": str,
+        },
+    },
+    "fortigate": {
+        "class": "Fortigate",
+        "path": "/extension-controller/fortigate",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": str,
+            "authorized": str,
+            "hostname": str,
+            "description": str,
+            "device-id": int,
+            "profile": str,
+        },
+    },
+    "fortigate_profile": {
+        "class": "FortigateProfile",
+        "path": "/extension-controller/fortigate-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "extension": str,
+            "lan-extension": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -0,0 +1,23 @@
+"""FortiOS CMDB - File Filter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/file-filter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "feature-set": str,
+            "replacemsg-group": str,
+            "log": str,
+            "extended-log": str,
+            "scan-archive-contents": str,
+            "rules": list,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,94 +1,16 @@
 """FortiOS CMDB - Firewall category"""
 
-from .access_proxy import AccessProxy
-from .access_proxy6 import AccessProxy6
-from .access_proxy_ssh_client_cert import AccessProxySshClientCert
-from .access_proxy_virtual_host import AccessProxyVirtualHost
-from .address import Address
-from .address6 import Address6
-from .address6_template import Address6Template
-from .addrgrp import Addrgrp
-from .addrgrp6 import Addrgrp6
-from .auth_portal import AuthPortal
-from .central_snat_map import CentralSnatMap
-from .city import City
-from .country import Country
-from .decrypted_traffic_mirror import DecryptedTrafficMirror
-from .dnstranslation import Dnstranslation
-from .DoS_policy import DosPolicy
-from .DoS_policy6 import DosPolicy6
-from .global_ import Global
-from .identity_based_route import IdentityBasedRoute
-from .interface_policy import InterfacePolicy
-from .interface_policy6 import InterfacePolicy6
-from .internet_service import InternetService
-from .internet_service_addition import InternetServiceAddition
-from .internet_service_append import InternetServiceAppend
-from .internet_service_botnet import InternetServiceBotnet
-from .internet_service_custom import InternetServiceCustom
-from .internet_service_custom_group import InternetServiceCustomGroup
-from .internet_service_definition import InternetServiceDefinition
-from .internet_service_extension import InternetServiceExtension
-from .internet_service_fortiguard import InternetServiceFortiguard
-from .internet_service_group import InternetServiceGroup
-from .internet_service_ipbl_reason import InternetServiceIpblReason
-from .internet_service_ipbl_vendor import InternetServiceIpblVendor
-from .internet_service_list import InternetServiceList
-from .internet_service_name import InternetServiceName
-from .internet_service_owner import InternetServiceOwner
-from .internet_service_reputation import InternetServiceReputation
-from .internet_service_sld import InternetServiceSld
-from .internet_service_subapp import InternetServiceSubapp
-from .ip_translation import IpTranslation
-from .ipmacbinding_setting import IpmacbindingSetting
-from .ipmacbinding_table import IpmacbindingTable
-from .ippool import Ippool
-from .ippool6 import Ippool6
-from .ldb_monitor import LdbMonitor
-from .local_in_policy import LocalInPolicy
-from .local_in_policy6 import LocalInPolicy6
-from .multicast_address import MulticastAddress
-from .multicast_address6 import MulticastAddress6
-from .multicast_policy import MulticastPolicy
-from .multicast_policy6 import MulticastPolicy6
-from .network_service_dynamic import NetworkServiceDynamic
-from .on_demand_sniffer import OnDemandSniffer
-from .policy import Policy
-from .profile_group import ProfileGroup
-from .profile_protocol_options import ProfileProtocolOptions
-from .proxy_address import ProxyAddress
-from .proxy_addrgrp import ProxyAddrgrp
-from .proxy_policy import ProxyPolicy
-from .region import Region
-from .schedule_group import ScheduleGroup
-from .schedule_onetime import ScheduleOnetime
-from .schedule_recurring import ScheduleRecurring
-from .security_policy import SecurityPolicy
-from .service_category import ServiceCategory
-from .service_custom import ServiceCustom
-from .service_group import ServiceGroup
-from .shaper_per_ip_shaper import ShaperPerIpShaper
-from .shaper_traffic_shaper import ShaperTrafficShaper
-from .shaping_policy import ShapingPolicy
-from .shaping_profile import ShapingProfile
-from .sniffer import Sniffer
-from .ssh_host_key import SshHostKey
-from .ssh_local_ca import SshLocalCa
-from .ssh_local_key import SshLocalKey
-from .ssh_setting import SshSetting
-from .ssl_server import SslServer
-from .ssl_setting import SslSetting
-from .ssl_ssh_profile import SslSshProfile
-from .traffic_class import TrafficClass
-from .ttl_policy import TtlPolicy
-from .vendor_mac import VendorMac
-from .vendor_mac_summary import VendorMacSummary
-from .vip import Vip
-from .vip6 import Vip6
-from .vipgrp import Vipgrp
-from .vipgrp6 import Vipgrp6
-from .wildcard_fqdn_custom import WildcardFqdnCustom
-from .wildcard_fqdn_group import WildcardFqdnGroup
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
+    from .policy import Policy
+
 
 __all__ = [
     "DosPolicy",
@@ -182,42 +104,149 @@ __all__ = [
     "WildcardFqdnGroup",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AccessProxy": "._registry",
+        "AccessProxy6": "._registry",
+        "AccessProxySshClientCert": "._registry",
+        "AccessProxyVirtualHost": "._registry",
+        "Address": "._registry",
+        "Address6": "._registry",
+        "Address6Template": "._registry",
+        "Addrgrp": "._registry",
+        "Addrgrp6": "._registry",
+        "AuthPortal": "._registry",
+        "CentralSnatMap": "._registry",
+        "City": "._registry",
+        "Country": "._registry",
+        "DecryptedTrafficMirror": "._registry",
+        "Dnstranslation": "._registry",
+        "DosPolicy": "._registry",
+        "DosPolicy6": "._registry",
+        "Global": "._registry",
+        "IdentityBasedRoute": "._registry",
+        "InterfacePolicy": "._registry",
+        "InterfacePolicy6": "._registry",
+        "InternetService": "._registry",
+        "InternetServiceAddition": "._registry",
+        "InternetServiceAppend": "._registry",
+        "InternetServiceBotnet": "._registry",
+        "InternetServiceCustom": "._registry",
+        "InternetServiceCustomGroup": "._registry",
+        "InternetServiceDefinition": "._registry",
+        "InternetServiceExtension": "._registry",
+        "InternetServiceFortiguard": "._registry",
+        "InternetServiceGroup": "._registry",
+        "InternetServiceIpblReason": "._registry",
+        "InternetServiceIpblVendor": "._registry",
+        "InternetServiceList": "._registry",
+        "InternetServiceName": "._registry",
+        "InternetServiceOwner": "._registry",
+        "InternetServiceReputation": "._registry",
+        "InternetServiceSld": "._registry",
+        "InternetServiceSubapp": "._registry",
+        "IpTranslation": "._registry",
+        "IpmacbindingSetting": "._registry",
+        "IpmacbindingTable": "._registry",
+        "Ippool": "._registry",
+        "Ippool6": "._registry",
+        "LdbMonitor": "._registry",
+        "LocalInPolicy": "._registry",
+        "LocalInPolicy6": "._registry",
+        "MulticastAddress": "._registry",
+        "MulticastAddress6": "._registry",
+        "MulticastPolicy": "._registry",
+        "MulticastPolicy6": "._registry",
+        "NetworkServiceDynamic": "._registry",
+        "OnDemandSniffer": "._registry",
+        "Policy": ".policy",
+        "ProfileGroup": "._registry",
+        "ProfileProtocolOptions": "._registry",
+        "ProxyAddress": "._registry",
+        "ProxyAddrgrp": "._registry",
+        "ProxyPolicy": "._registry",
+        "Region": "._registry",
+        "ScheduleGroup": "._registry",
+        "ScheduleOnetime": "._registry",
+        "ScheduleRecurring": "._registry",
+        "SecurityPolicy": "._registry",
+        "ServiceCategory": "._registry",
+        "ServiceCustom": "._registry",
+        "ServiceGroup": "._registry",
+        "ShaperPerIpShaper": "._registry",
+        "ShaperTrafficShaper": "._registry",
+        "ShapingPolicy": "._registry",
+        "ShapingProfile": "._registry",
+        "Sniffer": "._registry",
+        "SshHostKey": "._registry",
+        "SshLocalCa": "._registry",
+        "SshLocalKey": "._registry",
+        "SshSetting": "._registry",
+        "SslServer": "._registry",
+        "SslSetting": "._registry",
+        "SslSshProfile": "._registry",
+        "TrafficClass": "._registry",
+        "TtlPolicy": "._registry",
+        "VendorMac": "._registry",
+        "VendorMacSummary": "._registry",
+        "Vip": "._registry",
+        "Vip6": "._registry",
+        "Vipgrp": "._registry",
+        "Vipgrp6": "._registry",
+        "WildcardFqdnCustom": "._registry",
+        "WildcardFqdnGroup": "._registry",
+    },
+)
+
 
 class Shaper:
     """Wrapper for shaper.* endpoints."""
 
+    per_ip_shaper: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ShaperPerIpShaper"
+    )
+    traffic_shaper: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ShaperTrafficShaper"
+    )
+
     def __init__(self, client):
         """Initialize Shaper endpoints."""
-        self.per_ip_shaper = ShaperPerIpShaper(client)
-        self.traffic_shaper = ShaperTrafficShaper(client)
+        self._client = client
 
 
 class Ssh:
     """Wrapper for ssh.* endpoints."""
 
+    host_key: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SshHostKey")
+    local_ca: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SshLocalCa")
+    local_key: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SshLocalKey")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SshSetting")
+
     def __init__(self, client):
         """Initialize Ssh endpoints."""
-        self.host_key = SshHostKey(client)
-        self.local_ca = SshLocalCa(client)
-        self.local_key = SshLocalKey(client)
-        self.setting = SshSetting(client)
+        self._client = client
 
 
 class Ssl:
     """Wrapper for ssl.* endpoints."""
 
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SslSetting")
+
     def __init__(self, client):
         """Initialize Ssl endpoints."""
-        self.setting = SslSetting(client)
+        self._client = client
 
 
 class WildcardFqdn:
     """Wrapper for wildcard_fqdn.* endpoints."""
 
+    custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WildcardFqdnCustom")
+    group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WildcardFqdnGroup")
+
     def __init__(self, client):
         """Initialize WildcardFqdn endpoints."""
-        self.custom = WildcardFqdnCustom(client)
-        self.group = WildcardFqdnGroup(client)
+        self._client = client
 
 
 class Firewall:
@@ -227,6 +256,175 @@ class Firewall:
     This class provides access to all firewall CMDB endpoints.
     """
 
+    dos_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DosPolicy")
+    dos_policy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DosPolicy6")
+    access_proxy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AccessProxy")
+    access_proxy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AccessProxy6")
+    access_proxy_ssh_client_cert: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AccessProxySshClientCert"
+    )
+    access_proxy_virtual_host: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AccessProxyVirtualHost"
+    )
+    address: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Address")
+    address6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Address6")
+    address6_template: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Address6Template"
+    )
+    addrgrp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Addrgrp")
+    addrgrp6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Addrgrp6")
+    auth_portal: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AuthPortal")
+    central_snat_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CentralSnatMap"
+    )
+    city: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("City")
+    country: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Country")
+    decrypted_traffic_mirror: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "DecryptedTrafficMirror"
+    )
+    dnstranslation: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Dnstranslation")
+    global_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Global")
+    identity_based_route: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IdentityBasedRoute"
+    )
+    interface_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InterfacePolicy"
+    )
+    interface_policy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InterfacePolicy6"
+    )
+    internet_service: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetService"
+    )
+    internet_service_addition: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceAddition"
+    )
+    internet_service_append: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceAppend"
+    )
+    internet_service_botnet: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceBotnet"
+    )
+    internet_service_custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceCustom"
+    )
+    internet_service_custom_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceCustomGroup"
+    )
+    internet_service_definition: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceDefinition"
+    )
+    internet_service_extension: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceExtension"
+    )
+    internet_service_fortiguard: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceFortiguard"
+    )
+    internet_service_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceGroup"
+    )
+    internet_service_ipbl_reason: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceIpblReason"
+    )
+    internet_service_ipbl_vendor: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceIpblVendor"
+    )
+    internet_service_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceList"
+    )
+    internet_service_name: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceName"
+    )
+    internet_service_owner: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceOwner"
+    )
+    internet_service_reputation: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceReputation"
+    )
+    internet_service_sld: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceSld"
+    )
+    internet_service_subapp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InternetServiceSubapp"
+    )
+    ip_translation: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("IpTranslation")
+    ipmacbinding_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpmacbindingSetting"
+    )
+    ipmacbinding_table: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpmacbindingTable"
+    )
+    ippool: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ippool")
+    ippool6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ippool6")
+    ldb_monitor: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("LdbMonitor")
+    local_in_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("LocalInPolicy")
+    local_in_policy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "LocalInPolicy6"
+    )
+    multicast_address: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "MulticastAddress"
+    )
+    multicast_address6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "MulticastAddress6"
+    )
+    multicast_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "MulticastPolicy"
+    )
+    multicast_policy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "MulticastPolicy6"
+    )
+    network_service_dynamic: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "NetworkServiceDynamic"
+    )
+    on_demand_sniffer: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "OnDemandSniffer"
+    )
+    policy: LazyEndpoint[Policy] = LazyEndpoint("Policy")
+    profile_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ProfileGroup")
+    profile_protocol_options: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ProfileProtocolOptions"
+    )
+    proxy_address: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ProxyAddress")
+    proxy_addrgrp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ProxyAddrgrp")
+    proxy_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ProxyPolicy")
+    region: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Region")
+    schedule_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ScheduleGroup")
+    schedule_onetime: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ScheduleOnetime"
+    )
+    schedule_recurring: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ScheduleRecurring"
+    )
+    security_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SecurityPolicy"
+    )
+    service_category: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ServiceCategory"
+    )
+    service_custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ServiceCustom")
+    service_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ServiceGroup")
+    shaping_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ShapingPolicy")
+    shaping_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ShapingProfile"
+    )
+    sniffer: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Sniffer")
+    ssl_server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SslServer")
+    ssl_ssh_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SslSshProfile")
+    traffic_class: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("TrafficClass")
+    ttl_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("TtlPolicy")
+    vendor_mac: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("VendorMac")
+    vendor_mac_summary: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "VendorMacSummary"
+    )
+    vip: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Vip")
+    vip6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Vip6")
+    vipgrp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Vipgrp")
+    vipgrp6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Vipgrp6")
+    shaper: LazyEndpoint[Shaper] = LazyEndpoint("Shaper")
+    ssh: LazyEndpoint[Ssh] = LazyEndpoint("Ssh")
+    ssl: LazyEndpoint[Ssl] = LazyEndpoint("Ssl")
+    wildcard_fqdn: LazyEndpoint[WildcardFqdn] = LazyEndpoint("WildcardFqdn")
+
     def __init__(self, client):
         """
         Initialize Firewall with all endpoint classes.
@@ -234,87 +432,4 @@ class Firewall:
         Args:
             client: HTTPClient instance
         """
-        self.dos_policy = DosPolicy(client)
-        self.dos_policy6 = DosPolicy6(client)
-        self.access_proxy = AccessProxy(client)
-        self.access_proxy6 = AccessProxy6(client)
-        self.access_proxy_ssh_client_cert = AccessProxySshClientCert(client)
-        self.access_proxy_virtual_host = AccessProxyVirtualHost(client)
-        self.address = Address(client)
-        self.address6 = Address6(client)
-        self.address6_template = Address6Template(client)
-        self.addrgrp = Addrgrp(client)
-        self.addrgrp6 = Addrgrp6(client)
-        self.auth_portal = AuthPortal(client)
-        self.central_snat_map = CentralSnatMap(client)
-        self.city = City(client)
-        self.country = Country(client)
-        self.decrypted_traffic_mirror = DecryptedTrafficMirror(client)
-        self.dnstranslation = Dnstranslation(client)
-        self.global_ = Global(client)
-        self.identity_based_route = IdentityBasedRoute(client)
-        self.interface_policy = InterfacePolicy(client)
-        self.interface_policy6 = InterfacePolicy6(client)
-        self.internet_service = InternetService(client)
-        self.internet_service_addition = InternetServiceAddition(client)
-        self.internet_service_append = InternetServiceAppend(client)
-        self.internet_service_botnet = InternetServiceBotnet(client)
-        self.internet_service_custom = InternetServiceCustom(client)
-        self.internet_service_custom_group = InternetServiceCustomGroup(client)
-        self.internet_service_definition = InternetServiceDefinition(client)
-        self.internet_service_extension = InternetServiceExtension(client)
-        self.internet_service_fortiguard = InternetServiceFortiguard(client)
-        self.internet_service_group = InternetServiceGroup(client)
-        self.internet_service_ipbl_reason = InternetServiceIpblReason(client)
-        self.internet_service_ipbl_vendor = InternetServiceIpblVendor(client)
-        self.internet_service_list = InternetServiceList(client)
-        self.internet_service_name = InternetServiceName(client)
-        self.internet_service_owner = InternetServiceOwner(client)
-        self.internet_service_reputation = InternetServiceReputation(client)
-        self.internet_service_sld = InternetServiceSld(client)
-        self.internet_service_subapp = InternetServiceSubapp(client)
-        self.ip_translation = IpTranslation(client)
-        self.ipmacbinding_setting = IpmacbindingSetting(client)
-        self.ipmacbinding_table = IpmacbindingTable(client)
-        self.ippool = Ippool(client)
-        self.ippool6 = Ippool6(client)
-        self.ldb_monitor = LdbMonitor(client)
-        self.local_in_policy = LocalInPolicy(client)
-        self.local_in_policy6 = LocalInPolicy6(client)
-        self.multicast_address = MulticastAddress(client)
-        self.multicast_address6 = MulticastAddress6(client)
-        self.multicast_policy = MulticastPolicy(client)
-        self.multicast_policy6 = MulticastPolicy6(client)
-        self.network_service_dynamic = NetworkServiceDynamic(client)
-        self.on_demand_sniffer = OnDemandSniffer(client)
-        self.policy = Policy(client)
-        self.profile_group = ProfileGroup(client)
-        self.profile_protocol_options = ProfileProtocolOptions(client)
-        self.proxy_address = ProxyAddress(client)
-        self.proxy_addrgrp = ProxyAddrgrp(client)
-        self.proxy_policy = ProxyPolicy(client)
-        self.region = Region(client)
-        self.schedule_group = ScheduleGroup(client)
-        self.schedule_onetime = ScheduleOnetime(client)
-        self.schedule_recurring = ScheduleRecurring(client)
-        self.security_policy = SecurityPolicy(client)
-        self.service_category = ServiceCategory(client)
-        self.service_custom = ServiceCustom(client)
-        self.service_group = ServiceGroup(client)
-        self.shaping_policy = ShapingPolicy(client)
-        self.shaping_profile = ShapingProfile(client)
-        self.sniffer = Sniffer(client)
-        self.ssl_server = SslServer(client)
-        self.ssl_ssh_profile = SslSshProfile(client)
-        self.traffic_class = TrafficClass(client)
-        self.ttl_policy = TtlPolicy(client)
-        self.vendor_mac = VendorMac(client)
-        self.vendor_mac_summary = VendorMacSummary(client)
-        self.vip = Vip(client)
-        self.vip6 = Vip6(client)
-        self.vipgrp = Vipgrp(client)
-        self.vipgrp6 = Vipgrp6(client)
-        self.shaper = Shaper(client)
-        self.ssh = Ssh(client)
-        self.ssl = Ssl(client)
-        self.wildcard_fqdn = WildcardFqdn(client)
+        self._client = client
@@ -15,7 +15,7 @@ firewall-specific functionality on top.
 """
 
 # Import from central API helpers
-from ...._helpers import (
+from ....._helpers import (
     build_cmdb_payload,
     normalize_member_list,
     normalize_to_name_list,
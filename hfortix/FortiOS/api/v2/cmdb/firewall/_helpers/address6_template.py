@@ -8,180 +8,24 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_FABRIC_OBJECT = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_address6_template_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_address6_template_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating address6_template.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate subnet-segment-count if present
-    if "subnet-segment-count" in payload:
-        value = payload.get("subnet-segment-count")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 6:
-                    return (
-                        False,
-                        "subnet-segment-count must be between 1 and 6",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"subnet-segment-count must be numeric, got: {value}",
-                )
-
-    # Validate fabric-object if present
-    if "fabric-object" in payload:
-        value = payload.get("fabric-object")
-        if value and value not in VALID_BODY_FABRIC_OBJECT:
-            return (
-                False,
-                f"Invalid fabric-object '{value}'. Must be one of: {', '.join(VALID_BODY_FABRIC_OBJECT)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_address6_template_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate subnet-segment-count if present
-    if "subnet-segment-count" in payload:
-        value = payload.get("subnet-segment-count")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 6:
-                    return (
-                        False,
-                        "subnet-segment-count must be between 1 and 6",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"subnet-segment-count must be numeric, got: {value}",
-                )
-
-    # Validate fabric-object if present
-    if "fabric-object" in payload:
-        value = payload.get("fabric-object")
-        if value and value not in VALID_BODY_FABRIC_OBJECT:
-            return (
-                False,
-                f"Invalid fabric-object '{value}'. Must be one of: {', '.join(VALID_BODY_FABRIC_OBJECT)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_address6_template_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "subnet-segment-count": (1, 6),
+        "fabric-object": VALID_BODY_FABRIC_OBJECT,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_address6_template_get = SCHEMA.get_validator()
+validate_address6_template_post = SCHEMA.post_validator()
+validate_address6_template_put = SCHEMA.put_validator("name")
+validate_address6_template_delete = SCHEMA.delete_validator("name")
@@ -8,258 +8,27 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_TYPE = ["default", "location"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_internet_service_name_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_internet_service_name_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating internet_service_name.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate internet-service-id if present
-    if "internet-service-id" in payload:
-        value = payload.get("internet-service-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "internet-service-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"internet-service-id must be numeric, got: {value}",
-                )
-
-    # Validate country-id if present
-    if "country-id" in payload:
-        value = payload.get("country-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "country-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"country-id must be numeric, got: {value}")
-
-    # Validate region-id if present
-    if "region-id" in payload:
-        value = payload.get("region-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "region-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"region-id must be numeric, got: {value}")
-
-    # Validate city-id if present
-    if "city-id" in payload:
-        value = payload.get("city-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "city-id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"city-id must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_internet_service_name_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate type if present
-    if "type" in payload:
-        value = payload.get("type")
-        if value and value not in VALID_BODY_TYPE:
-            return (
-                False,
-                f"Invalid type '{value}'. Must be one of: {', '.join(VALID_BODY_TYPE)}",
-            )
-
-    # Validate internet-service-id if present
-    if "internet-service-id" in payload:
-        value = payload.get("internet-service-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "internet-service-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"internet-service-id must be numeric, got: {value}",
-                )
-
-    # Validate country-id if present
-    if "country-id" in payload:
-        value = payload.get("country-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "country-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"country-id must be numeric, got: {value}")
-
-    # Validate region-id if present
-    if "region-id" in payload:
-        value = payload.get("region-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "region-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"region-id must be numeric, got: {value}")
-
-    # Validate city-id if present
-    if "city-id" in payload:
-        value = payload.get("city-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "city-id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"city-id must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_internet_service_name_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "type": VALID_BODY_TYPE,
+        "internet-service-id": (0, 4294967295),
+        "country-id": (0, 4294967295),
+        "region-id": (0, 4294967295),
+        "city-id": (0, 4294967295),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_internet_service_name_get = SCHEMA.get_validator()
+validate_internet_service_name_post = SCHEMA.post_validator()
+validate_internet_service_name_put = SCHEMA.put_validator("name")
+validate_internet_service_name_delete = SCHEMA.delete_validator("name")
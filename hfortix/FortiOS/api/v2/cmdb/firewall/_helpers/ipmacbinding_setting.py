@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_BINDTHROUGHFW = ["enable", "disable"]
@@ -16,89 +16,16 @@ VALID_BODY_BINDTOFW = ["enable", "disable"]
 VALID_BODY_UNDEFINEDHOST = ["allow", "block"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_ipmacbinding_setting_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_ipmacbinding_setting_put(
-    payload: dict[str, Any] | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate bindthroughfw if present
-    if "bindthroughfw" in payload:
-        value = payload.get("bindthroughfw")
-        if value and value not in VALID_BODY_BINDTHROUGHFW:
-            return (
-                False,
-                f"Invalid bindthroughfw '{value}'. Must be one of: {', '.join(VALID_BODY_BINDTHROUGHFW)}",
-            )
-
-    # Validate bindtofw if present
-    if "bindtofw" in payload:
-        value = payload.get("bindtofw")
-        if value and value not in VALID_BODY_BINDTOFW:
-            return (
-                False,
-                f"Invalid bindtofw '{value}'. Must be one of: {', '.join(VALID_BODY_BINDTOFW)}",
-            )
-
-    # Validate undefinedhost if present
-    if "undefinedhost" in payload:
-        value = payload.get("undefinedhost")
-        if value and value not in VALID_BODY_UNDEFINEDHOST:
-            return (
-                False,
-                f"Invalid undefinedhost '{value}'. Must be one of: {', '.join(VALID_BODY_UNDEFINEDHOST)}",
-            )
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "bindthroughfw": VALID_BODY_BINDTHROUGHFW,
+        "bindtofw": VALID_BODY_BINDTOFW,
+        "undefinedhost": VALID_BODY_UNDEFINEDHOST,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_ipmacbinding_setting_get = SCHEMA.get_validator()
+validate_ipmacbinding_setting_put = SCHEMA.put_validator()
@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = ["enable", "disable"]
@@ -19,378 +19,31 @@ VALID_BODY_LOGTRAFFIC = ["all", "utm", "disable"]
 VALID_BODY_AUTO_ASIC_OFFLOAD = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_multicast_policy_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_multicast_policy_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating multicast_policy.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967294:
-                    return (False, "id must be between 0 and 4294967294")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comments if present
-    if "comments" in payload:
-        value = payload.get("comments")
-        if value and isinstance(value, str) and len(value) > 1023:
-            return (False, "comments cannot exceed 1023 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate srcintf if present
-    if "srcint" in payload:
-        value = payload.get("srcint")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "srcintf cannot exceed 35 characters")
-
-    # Validate dstintf if present
-    if "dstint" in payload:
-        value = payload.get("dstint")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "dstintf cannot exceed 35 characters")
-
-    # Validate snat if present
-    if "snat" in payload:
-        value = payload.get("snat")
-        if value and value not in VALID_BODY_SNAT:
-            return (
-                False,
-                f"Invalid snat '{value}'. Must be one of: {', '.join(VALID_BODY_SNAT)}",
-            )
-
-    # Validate action if present
-    if "action" in payload:
-        value = payload.get("action")
-        if value and value not in VALID_BODY_ACTION:
-            return (
-                False,
-                f"Invalid action '{value}'. Must be one of: {', '.join(VALID_BODY_ACTION)}",
-            )
-
-    # Validate protocol if present
-    if "protocol" in payload:
-        value = payload.get("protocol")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "protocol must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"protocol must be numeric, got: {value}")
-
-    # Validate start-port if present
-    if "start-port" in payload:
-        value = payload.get("start-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "start-port must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"start-port must be numeric, got: {value}")
-
-    # Validate end-port if present
-    if "end-port" in payload:
-        value = payload.get("end-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "end-port must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"end-port must be numeric, got: {value}")
-
-    # Validate utm-status if present
-    if "utm-status" in payload:
-        value = payload.get("utm-status")
-        if value and value not in VALID_BODY_UTM_STATUS:
-            return (
-                False,
-                f"Invalid utm-status '{value}'. Must be one of: {', '.join(VALID_BODY_UTM_STATUS)}",
-            )
-
-    # Validate ips-sensor if present
-    if "ips-sensor" in payload:
-        value = payload.get("ips-sensor")
-        if value and isinstance(value, str) and len(value) > 47:
-            return (False, "ips-sensor cannot exceed 47 characters")
-
-    # Validate logtraffic if present
-    if "logtraffic" in payload:
-        value = payload.get("logtraffic")
-        if value and value not in VALID_BODY_LOGTRAFFIC:
-            return (
-                False,
-                f"Invalid logtraffic '{value}'. Must be one of: {', '.join(VALID_BODY_LOGTRAFFIC)}",
-            )
-
-    # Validate auto-asic-offload if present
-    if "auto-asic-offload" in payload:
-        value = payload.get("auto-asic-offload")
-        if value and value not in VALID_BODY_AUTO_ASIC_OFFLOAD:
-            return (
-                False,
-                f"Invalid auto-asic-offload '{value}'. Must be one of: {', '.join(VALID_BODY_AUTO_ASIC_OFFLOAD)}",
-            )
-
-    # Validate traffic-shaper if present
-    if "traffic-shaper" in payload:
-        value = payload.get("traffic-shaper")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "traffic-shaper cannot exceed 35 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_multicast_policy_put(
-    id: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        id: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # id is required for updates
-    if not id:
-        return (False, "id is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967294:
-                    return (False, "id must be between 0 and 4294967294")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comments if present
-    if "comments" in payload:
-        value = payload.get("comments")
-        if value and isinstance(value, str) and len(value) > 1023:
-            return (False, "comments cannot exceed 1023 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate srcintf if present
-    if "srcint" in payload:
-        value = payload.get("srcint")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "srcintf cannot exceed 35 characters")
-
-    # Validate dstintf if present
-    if "dstint" in payload:
-        value = payload.get("dstint")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "dstintf cannot exceed 35 characters")
-
-    # Validate snat if present
-    if "snat" in payload:
-        value = payload.get("snat")
-        if value and value not in VALID_BODY_SNAT:
-            return (
-                False,
-                f"Invalid snat '{value}'. Must be one of: {', '.join(VALID_BODY_SNAT)}",
-            )
-
-    # Validate action if present
-    if "action" in payload:
-        value = payload.get("action")
-        if value and value not in VALID_BODY_ACTION:
-            return (
-                False,
-                f"Invalid action '{value}'. Must be one of: {', '.join(VALID_BODY_ACTION)}",
-            )
-
-    # Validate protocol if present
-    if "protocol" in payload:
-        value = payload.get("protocol")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "protocol must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"protocol must be numeric, got: {value}")
-
-    # Validate start-port if present
-    if "start-port" in payload:
-        value = payload.get("start-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "start-port must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"start-port must be numeric, got: {value}")
-
-    # Validate end-port if present
-    if "end-port" in payload:
-        value = payload.get("end-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "end-port must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"end-port must be numeric, got: {value}")
-
-    # Validate utm-status if present
-    if "utm-status" in payload:
-        value = payload.get("utm-status")
-        if value and value not in VALID_BODY_UTM_STATUS:
-            return (
-                False,
-                f"Invalid utm-status '{value}'. Must be one of: {', '.join(VALID_BODY_UTM_STATUS)}",
-            )
-
-    # Validate ips-sensor if present
-    if "ips-sensor" in payload:
-        value = payload.get("ips-sensor")
-        if value and isinstance(value, str) and len(value) > 47:
-            return (False, "ips-sensor cannot exceed 47 characters")
-
-    # Validate logtraffic if present
-    if "logtraffic" in payload:
-        value = payload.get("logtraffic")
-        if value and value not in VALID_BODY_LOGTRAFFIC:
-            return (
-                False,
-                f"Invalid logtraffic '{value}'. Must be one of: {', '.join(VALID_BODY_LOGTRAFFIC)}",
-            )
-
-    # Validate auto-asic-offload if present
-    if "auto-asic-offload" in payload:
-        value = payload.get("auto-asic-offload")
-        if value and value not in VALID_BODY_AUTO_ASIC_OFFLOAD:
-            return (
-                False,
-                f"Invalid auto-asic-offload '{value}'. Must be one of: {', '.join(VALID_BODY_AUTO_ASIC_OFFLOAD)}",
-            )
-
-    # Validate traffic-shaper if present
-    if "traffic-shaper" in payload:
-        value = payload.get("traffic-shaper")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "traffic-shaper cannot exceed 35 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_multicast_policy_delete(
-    id: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        id: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not id:
-        return (False, "id is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "id": (0, 4294967294),
+        "name": 35,
+        "comments": 1023,
+        "status": VALID_BODY_STATUS,
+        "srcintf": 35,
+        "dstintf": 35,
+        "snat": VALID_BODY_SNAT,
+        "action": VALID_BODY_ACTION,
+        "protocol": (0, 255),
+        "start-port": (0, 65535),
+        "end-port": (0, 65535),
+        "utm-status": VALID_BODY_UTM_STATUS,
+        "ips-sensor": 47,
+        "logtraffic": VALID_BODY_LOGTRAFFIC,
+        "auto-asic-offload": VALID_BODY_AUTO_ASIC_OFFLOAD,
+        "traffic-shaper": 35,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_multicast_policy_get = SCHEMA.get_validator()
+validate_multicast_policy_post = SCHEMA.post_validator()
+validate_multicast_policy_put = SCHEMA.put_validator("id")
+validate_multicast_policy_delete = SCHEMA.delete_validator("id")
@@ -0,0 +1,1743 @@
+"""FortiOS CMDB - Firewall endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "DoS_policy": {
+        "class": "DosPolicy",
+        "path": "/firewall/DoS-policy",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "status": str,
+            "name": str,
+            "comments": str,
+            "interface": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "service": list,
+            "anomaly": list,
+        },
+    },
+    "DoS_policy6": {
+        "class": "DosPolicy6",
+        "path": "/firewall/DoS-policy6",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "status": str,
+            "name": str,
+            "comments": str,
+            "interface": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "service": list,
+            "anomaly": list,
+        },
+    },
+    "access_proxy": {
+        "class": "AccessProxy",
+        "path": "/firewall/access-proxy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vip": str,
+            "auth-portal": str,
+            "auth-virtual-host": str,
+            "log-blocked-traffic": str,
+            "add-vhost-domain-to-dnsdb": str,
+            "svr-pool-multiplex": str,
+            "svr-pool-ttl": int,
+            "svr-pool-server-max-request": int,
+            "svr-pool-server-max-concurrent-request": int,
+            "decrypted-traffic-mirror": str,
+            "api-gateway": list,
+            "api-gateway6": list,
+        },
+    },
+    "access_proxy6": {
+        "class": "AccessProxy6",
+        "path": "/firewall/access-proxy6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vip": str,
+            "auth-portal": str,
+            "auth-virtual-host": str,
+            "log-blocked-traffic": str,
+            "add-vhost-domain-to-dnsdb": str,
+            "svr-pool-multiplex": str,
+            "svr-pool-ttl": int,
+            "svr-pool-server-max-request": int,
+            "svr-pool-server-max-concurrent-request": int,
+            "decrypted-traffic-mirror": str,
+            "api-gateway": list,
+            "api-gateway6": list,
+        },
+    },
+    "access_proxy_ssh_client_cert": {
+        "class": "AccessProxySshClientCert",
+        "path": "/firewall/access-proxy-ssh-client-cert",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "source-address": str,
+            "permit-x11-forwarding": str,
+            "permit-agent-forwarding": str,
+            "permit-port-forwarding": str,
+            "permit-pty": str,
+            "permit-user-rc": str,
+            "cert-extension": list,
+            "auth-ca": str,
+        },
+    },
+    "access_proxy_virtual_host": {
+        "class": "AccessProxyVirtualHost",
+        "path": "/firewall/access-proxy-virtual-host",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ssl-certificate": list,
+            "host": str,
+            "host-type": str,
+            "replacemsg-group": str,
+            "empty-cert-action": str,
+            "user-agent-detect": str,
+            "client-cert": str,
+        },
+    },
+    "address": {
+        "class": "Address",
+        "path": "/firewall/address",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "subnet": str,
+            "type": str,
+            "route-tag": int,
+            "sub-type": str,
+            "clearpass-spt": str,
+            "macaddr": list,
+            "start-ip": str,
+            "end-ip": str,
+            "fqdn": str,
+            "country": str,
+            "wildcard-fqdn": str,
+            "cache-ttl": int,
+            "wildcard": str,
+            "sdn": str,
+            "fsso-group": list,
+            "sso-attribute-value": list,
+            "interface": str,
+            "tenant": str,
+            "organization": str,
+            "epg-name": str,
+            "subnet-name": str,
+            "sdn-tag": str,
+            "policy-group": str,
+            "obj-tag": str,
+            "obj-type": str,
+            "tag-detection-level": str,
+            "tag-type": str,
+            "hw-vendor": str,
+            "hw-model": str,
+            "os": str,
+            "sw-version": str,
+            "comment": str,
+            "associated-interface": str,
+            "color": int,
+            "sdn-addr-type": str,
+            "node-ip-only": str,
+            "obj-id": str,
+            "list": list,
+            "tagging": list,
+            "allow-routing": str,
+            "passive-fqdn-learning": str,
+            "fabric-object": str,
+        },
+    },
+    "address6": {
+        "class": "Address6",
+        "path": "/firewall/address6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "type": str,
+            "route-tag": int,
+            "macaddr": list,
+            "sdn": str,
+            "ip6": str,
+            "wildcard": str,
+            "start-ip": str,
+            "end-ip": str,
+            "fqdn": str,
+            "country": str,
+            "cache-ttl": int,
+            "color": int,
+            "obj-id": str,
+            "tagging": list,
+            "comment": str,
+            "template": str,
+            "subnet-segment": list,
+            "host-type": str,
+            "host": str,
+            "tenant": str,
+            "epg-name": str,
+            "sdn-tag": str,
+            "list": list,
+            "sdn-addr-type": str,
+            "passive-fqdn-learning": str,
+            "fabric-object": str,
+        },
+    },
+    "address6_template": {
+        "class": "Address6Template",
+        "path": "/firewall/address6-template",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "ip6": str,
+            "subnet-segment-count": int,
+            "subnet-segment": list,
+            "fabric-object": str,
+        },
+    },
+    "addrgrp": {
+        "class": "Addrgrp",
+        "path": "/firewall/addrgrp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "category": str,
+            "allow-routing": str,
+            "member": list,
+            "comment": str,
+            "uuid": str,
+            "exclude": str,
+            "exclude-member": list,
+            "color": int,
+            "tagging": list,
+            "fabric-object": str,
+        },
+    },
+    "addrgrp6": {
+        "class": "Addrgrp6",
+        "path": "/firewall/addrgrp6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "color": int,
+            "comment": str,
+            "member": list,
+            "exclude": str,
+            "exclude-member": list,
+            "tagging": list,
+            "fabric-object": str,
+        },
+    },
+    "auth_portal": {
+        "class": "AuthPortal",
+        "path": "/firewall/auth-portal",
+        "fields": {
+            "groups": list,
+            "portal-addr": str,
+            "portal-addr6": str,
+            "identity-based-route": str,
+            "proxy-auth": str,
+        },
+    },
+    "central_snat_map": {
+        "class": "CentralSnatMap",
+        "path": "/firewall/central-snat-map",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "uuid": str,
+            "status": str,
+            "type": str,
+            "srcintf": list,
+            "dstintf": list,
+            "orig-addr": list,
+            "orig-addr6": list,
+            "dst-addr": list,
+            "dst-addr6": list,
+            "protocol": int,
+            "orig-port": str,
+            "nat": str,
+            "nat46": str,
+            "nat64": str,
+            "nat-ippool": list,
+            "nat-ippool6": list,
+            "port-preserve": str,
+            "port-random": str,
+            "nat-port": str,
+            "dst-port": str,
+            "comments": str,
+        },
+    },
+    "city": {
+        "class": "City",
+        "path": "/firewall/city",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "country": {
+        "class": "Country",
+        "path": "/firewall/country",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "region": list},
+    },
+    "decrypted_traffic_mirror": {
+        "class": "DecryptedTrafficMirror",
+        "path": "/firewall/decrypted-traffic-mirror",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "dstmac": str,
+            "traffic-type": str,
+            "traffic-source": str,
+            "interface": list,
+        },
+    },
+    "dnstranslation": {
+        "class": "Dnstranslation",
+        "path": "/firewall/dnstranslation",
+        "mkey": "id",
+        "fields": {"id": int, "src": str, "dst": str, "netmask": str},
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/firewall/global",
+        "fields": {"banned-ip-persistency": str},
+    },
+    "identity_based_route": {
+        "class": "IdentityBasedRoute",
+        "path": "/firewall/identity-based-route",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "interface_policy": {
+        "class": "InterfacePolicy",
+        "path": "/firewall/interface-policy",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "uuid": str,
+            "status": str,
+            "comments": str,
+            "logtraffic": str,
+            "interface": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "service": list,
+            "application-list-status": str,
+            "application-list": str,
+            "ips-sensor-status": str,
+            "ips-sensor": str,
+            "dsri": str,
+            "av-profile-status": str,
+            "av-profile": str,
+            "webfilter-profile-status": str,
+            "webfilter-profile": str,
+            "casb-profile-status": str,
+            "casb-profile": str,
+            "emailfilter-profile-status": str,
+            "emailfilter-profile": str,
+            "dlp-profile-status": str,
+            "dlp-profile": str,
+        },
+    },
+    "interface_policy6": {
+        "class": "InterfacePolicy6",
+        "path": "/firewall/interface-policy6",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "uuid": str,
+            "status": str,
+            "comments": str,
+            "logtraffic": str,
+            "interface": str,
+            "srcaddr6": list,
+            "dstaddr6": list,
+            "service6": list,
+            "application-list-status": str,
+            "application-list": str,
+            "ips-sensor-status": str,
+            "ips-sensor": str,
+            "dsri": str,
+            "av-profile-status": str,
+            "av-profile": str,
+            "webfilter-profile-status": str,
+            "webfilter-profile": str,
+            "casb-profile-status": str,
+            "casb-profile": str,
+            "emailfilter-profile-status": str,
+            "emailfilter-profile": str,
+            "dlp-profile-status": str,
+            "dlp-profile": str,
+        },
+    },
+    "internet_service": {
+        "class": "InternetService",
+        "path": "/firewall/internet-service",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "name": str,
+            "icon-id": int,
+            "direction": str,
+            "database": str,
+            "ip-range-number": int,
+            "extra-ip-range-number": int,
+            "ip-number": int,
+            "ip6-range-number": int,
+            "extra-ip6-range-number": int,
+            "singularity": int,
+            "obsolete": int,
+        },
+    },
+    "internet_service_addition": {
+        "class": "InternetServiceAddition",
+        "path": "/firewall/internet-service-addition",
+        "mkey": "id",
+        "fields": {"id": int, "comment": str, "entry": list},
+    },
+    "internet_service_append": {
+        "class": "InternetServiceAppend",
+        "path": "/firewall/internet-service-append",
+        "fields": {"addr-mode": str, "match-port": int, "append-port": int},
+    },
+    "internet_service_botnet": {
+        "class": "InternetServiceBotnet",
+        "path": "/firewall/internet-service-botnet",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_custom": {
+        "class": "InternetServiceCustom",
+        "path": "/firewall/internet-service-custom",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "reputation": int,
+            "comment": str,
+            "entry": list,
+        },
+    },
+    "internet_service_custom_group": {
+        "class": "InternetServiceCustomGroup",
+        "path": "/firewall/internet-service-custom-group",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "member": list},
+    },
+    "internet_service_definition": {
+        "class": "InternetServiceDefinition",
+        "path": "/firewall/internet-service-definition",
+        "mkey": "id",
+        "fields": {"id": int, "entry": list},
+    },
+    "internet_service_extension": {
+        "class": "InternetServiceExtension",
+        "path": "/firewall/internet-service-extension",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "comment": str,
+            "entry": list,
+            "disable-entry": list,
+        },
+    },
+    "internet_service_fortiguard": {
+        "class": "InternetServiceFortiguard",
+        "path": "/firewall/internet-service-fortiguard",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "entry": list},
+    },
+    "internet_service_group": {
+        "class": "InternetServiceGroup",
+        "path": "/firewall/internet-service-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "direction": str,
+            "member": list,
+        },
+    },
+    "internet_service_ipbl_reason": {
+        "class": "InternetServiceIpblReason",
+        "path": "/firewall/internet-service-ipbl-reason",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_ipbl_vendor": {
+        "class": "InternetServiceIpblVendor",
+        "path": "/firewall/internet-service-ipbl-vendor",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_list": {
+        "class": "InternetServiceList",
+        "path": "/firewall/internet-service-list",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_name": {
+        "class": "InternetServiceName",
+        "path": "/firewall/internet-service-name",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "internet-service-id": int,
+            "country-id": int,
+            "region-id": int,
+            "city-id": int,
+        },
+    },
+    "internet_service_owner": {
+        "class": "InternetServiceOwner",
+        "path": "/firewall/internet-service-owner",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_reputation": {
+        "class": "InternetServiceReputation",
+        "path": "/firewall/internet-service-reputation",
+        "mkey": "id",
+        "fields": {"id": int, "description": str},
+    },
+    "internet_service_sld": {
+        "class": "InternetServiceSld",
+        "path": "/firewall/internet-service-sld",
+        "mkey": "id",
+        "fields": {"id": int, "name": str},
+    },
+    "internet_service_subapp": {
+        "class": "InternetServiceSubapp",
+        "path": "/firewall/internet-service-subapp",
+        "mkey": "id",
+        "fields": {"id": int, "sub-app": list},
+    },
+    "ip_translation": {
+        "class": "IpTranslation",
+        "path": "/firewall/ip-translation",
+        "mkey": "transid",
+        "fields": {
+            "transid": int,
+            "type": str,
+            "startip": str,
+            "endip": str,
+            "map-startip": str,
+        },
+    },
+    "ipmacbinding_setting": {
+        "class": "IpmacbindingSetting",
+        "path": "/firewall.ipmacbinding/setting",
+        "fields": {
+            "bindthroughfw": str,
+            "bindtofw": str,
+            "undefinedhost": str,
+        },
+    },
+    "ipmacbinding_table": {
+        "class": "IpmacbindingTable",
+        "path": "/firewall.ipmacbinding/table",
+        "mkey": "seq-num",
+        "fields": {
+            "seq-num": int,
+            "ip": str,
+            "mac": str,
+            "name": str,
+            "status": str,
+        },
+    },
+    "ippool": {
+        "class": "Ippool",
+        "path": "/firewall/ippool",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "startip": str,
+            "endip": str,
+            "startport": int,
+            "endport": int,
+            "source-startip": str,
+            "source-endip": str,
+            "block-size": int,
+            "port-per-user": int,
+            "num-blocks-per-user": int,
+            "pba-timeout": int,
+            "pba-interim-log": int,
+            "permit-any-host": str,
+            "arp-reply": str,
+            "arp-intf": str,
+            "associated-interface": str,
+            "comments": str,
+            "nat64": str,
+            "add-nat64-route": str,
+            "source-prefix6": str,
+            "client-prefix-length": int,
+            "tcp-session-quota": int,
+            "udp-session-quota": int,
+            "icmp-session-quota": int,
+            "privileged-port-use-pba": str,
+            "subnet-broadcast-in-ippool": str,
+        },
+    },
+    "ippool6": {
+        "class": "Ippool6",
+        "path": "/firewall/ippool6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "startip": str,
+            "endip": str,
+            "internal-prefix": str,
+            "external-prefix": str,
+            "comments": str,
+            "nat46": str,
+            "add-nat46-route": str,
+        },
+    },
+    "ldb_monitor": {
+        "class": "LdbMonitor",
+        "path": "/firewall/ldb-monitor",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "interval": int,
+            "timeout": int,
+            "retry": int,
+            "port": int,
+            "src-ip": str,
+            "http-get": str,
+            "http-match": str,
+            "http-max-redirects": int,
+            "dns-protocol": str,
+            "dns-request-domain": str,
+            "dns-match-ip": str,
+        },
+    },
+    "local_in_policy": {
+        "class": "LocalInPolicy",
+        "path": "/firewall/local-in-policy",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "uuid": str,
+            "ha-mgmt-intf-only": str,
+            "intf": list,
+            "srcaddr": list,
+            "srcaddr-negate": str,
+            "dstaddr": list,
+            "internet-service-src": str,
+            "internet-service-src-name": list,
+            "internet-service-src-group": list,
+            "internet-service-src-custom": list,
+            "internet-service-src-custom-group": list,
+            "internet-service-src-fortiguard": list,
+            "dstaddr-negate": str,
+            "service": list,
+            "service-negate": str,
+            "internet-service-src-negate": str,
+            "schedule": str,
+            "status": str,
+            "virtual-patch": str,
+            "logtraffic": str,
+            "comments": str,
+        },
+    },
+    "local_in_policy6": {
+        "class": "LocalInPolicy6",
+        "path": "/firewall/local-in-policy6",
+        "mkey": "policyid",
+        "fields": {
+            "policyid": int,
+            "uuid": str,
+            "intf": list,
+            "srcaddr": list,
+            "srcaddr-negate": str,
+            "dstaddr": list,
+            "internet-service6-src": str,
+            "internet-service6-src-name": list,
+            "internet-service6-src-group": list,
+            "internet-service6-src-custom": list,
+            "internet-service6-src-custom-group": list,
+            "internet-service6-src-fortiguard": list,
+            "dstaddr-negate": str,
+            "service": list,
+            "service-negate": str,
+            "internet-service6-src-negate": str,
+            "schedule": str,
+            "status": str,
+            "virtual-patch": str,
+            "logtraffic": str,
+            "comments": str,
+        },
+    },
+    "multicast_address": {
+        "class": "MulticastAddress",
+        "path": "/firewall/multicast-address",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "subnet": str,
+            "start-ip": str,
+            "end-ip": str,
+            "comment": str,
+            "associated-interface": str,
+            "color": int,
+            "tagging": list,
+        },
+    },
+    "multicast_address6": {
+        "class": "MulticastAddress6",
+        "path": "/firewall/multicast-address6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ip6": str,
+            "comment": str,
+            "color": int,
+            "tagging": list,
+        },
+    },
+    "multicast_policy": {
+        "class": "MulticastPolicy",
+        "path": "/firewall/multicast-policy",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "uuid": str,
+            "name": str,
+            "comments": str,
+            "status": str,
+            "srcintf": str,
+            "dstintf": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "snat": str,
+            "snat-ip": str,
+            "dnat": str,
+            "protocol": int,
+            "start-port": int,
+            "end-port": int,
+            "utm-status": str,
+            "ips-sensor": str,
+            "logtraffic": str,
+            "auto-asic-offload": str,
+            "traffic-shaper": str,
+        },
+    },
+    "multicast_policy6": {
+        "class": "MulticastPolicy6",
+        "path": "/firewall/multicast-policy6",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "uuid": str,
+            "status": str,
+            "name": str,
+            "srcintf": str,
+            "dstintf": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "protocol": int,
+            "start-port": int,
+            "end-port": int,
+            "utm-status": str,
+            "ips-sensor": str,
+            "logtraffic": str,
+            "auto-asic-offload": str,
+            "comments": str,
+        },
+    },
+    "network_service_dynamic": {
+        "class": "NetworkServiceDynamic",
+        "path": "/firewall/network-service-dynamic",
+        "mkey": "name",
+        "fields": {"name": str, "sdn": str, "comment": str},
+    },
+    "on_demand_sniffer": {
+        "class": "OnDemandSniffer",
+        "path": "/firewall/on-demand-sniffer",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "max-packet-count": int,
+            "hosts": list,
+            "ports": list,
+            "protocols": list,
+            "non-ip-packet": str,
+            "advanced-filter": str,
+        },
+    },
+    "profile_group": {
+        "class": "ProfileGroup",
+        "path": "/firewall/profile-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "profile-protocol-options": str,
+            "ssl-ssh-profile": str,
+            "av-profile": str,
+            "webfilter-profile": str,
+            "dnsfilter-profile": str,
+            "emailfilter-profile": str,
+            "dlp-profile": str,
+            "file-filter-profile": str,
+            "ips-sensor": str,
+            "application-list": str,
+            "voip-profile": str,
+            "ips-voip-filter": str,
+            "sctp-filter-profile": str,
+            "diameter-filter-profile": str,
+            "virtual-patch-profile": str,
+            "icap-profile": str,
+            "videofilter-profile": str,
+            "waf-profile": str,
+            "ssh-filter-profile": str,
+            "casb-profile": str,
+        },
+    },
+    "profile_protocol_options": {
+        "class": "ProfileProtocolOptions",
+        "path": "/firewall/profile-protocol-options",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "replacemsg-group": str,
+            "oversize-log": str,
+            "switching-protocols-log": str,
+            "http": list,
+            "ftp": list,
+            "imap": list,
+            "mapi": list,
+            "pop3": list,
+            "smtp": list,
+            "nntp": list,
+            "ssh": list,
+            "dns": list,
+            "cifs": list,
+            "mail-signature": list,
+            "rpc-over-http": str,
+        },
+    },
+    "proxy_address": {
+        "class": "ProxyAddress",
+        "path": "/firewall/proxy-address",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "type": str,
+            "host": str,
+            "host-regex": str,
+            "path": str,
+            "query": str,
+            "referrer": str,
+            "category": list,
+            "method": str,
+            "ua": str,
+            "ua-min-ver": str,
+            "ua-max-ver": str,
+            "header-name": str,
+            "header": str,
+            "case-sensitivity": str,
+            "header-group": list,
+            "color": int,
+            "tagging": list,
+            "comment": str,
+            "application": list,
+        },
+    },
+    "proxy_addrgrp": {
+        "class": "ProxyAddrgrp",
+        "path": "/firewall/proxy-addrgrp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "uuid": str,
+            "member": list,
+            "color": int,
+            "tagging": list,
+            "comment": str,
+        },
+    },
+    "proxy_policy": {
+        "class": "ProxyPolicy",
+        "path": "/firewall/proxy-policy",
+        "mkey": "policyid",
+        "fields": {
+            "uuid": str,
+            "policyid": int,
+            "name": str,
+            "proxy": str,
+            "access-proxy": list,
+            "access-proxy6": list,
+            "ztna-proxy": list,
+            "srcintf": list,
+            "dstintf": list,
+            "srcaddr": list,
+            "poolname": list,
+            "poolname6": list,
+            "dstaddr": list,
+            "ztna-ems-tag": list,
+            "ztna-tags-match-logic": str,
+            "device-ownership": str,
+            "url-risk": list,
+            "internet-service": str,
+            "internet-service-negate": str,
+            "internet-service-name": list,
+            "internet-service-group": list,
+            "internet-service-custom": list,
+            "internet-service-custom-group": list,
+            "internet-service-fortiguard": list,
+            "internet-service6": str,
+            "internet-service6-negate": str,
+            "internet-service6-name": list,
+            "internet-service6-group": list,
+            "internet-service6-custom": list,
+            "internet-service6-custom-group": list,
+            "internet-service6-fortiguard": list,
+            "service": list,
+            "srcaddr-negate": str,
+            "dstaddr-negate": str,
+            "ztna-ems-tag-negate": str,
+            "service-negate": str,
+            "status": str,
+            "schedule": str,
+            "logtraffic": str,
+            "session-ttl": int,
+            "srcaddr6": list,
+            "dstaddr6": list,
+            "groups": list,
+            "users": list,
+            "http-tunnel-auth": str,
+            "ssh-policy-redirect": str,
+            "webproxy-forward-server": str,
+            "isolator-server": str,
+            "webproxy-profile": str,
+            "transparent": str,
+            "disclaimer": str,
+            "utm-status": str,
+            "profile-type": str,
+            "profile-group": str,
+            "profile-protocol-options": str,
+            "ssl-ssh-profile": str,
+            "av-profile": str,
+            "webfilter-profile": str,
+            "dnsfilter-profile": str,
+            "emailfilter-profile": str,
+            "dlp-profile": str,
+            "file-filter-profile": str,
+            "ips-sensor": str,
+            "application-list": str,
+            "ips-voip-filter": str,
+            "sctp-filter-profile": str,
+            "icap-profile": str,
+            "videofilter-profile": str,
+            "waf-profile": str,
+            "ssh-filter-profile": str,
+            "casb-profile": str,
+            "replacemsg-override-group": str,
+            "logtraffic-start": str,
+            "log-http-transaction": str,
+            "comments": str,
+            "block-notification": str,
+            "redirect-url": str,
+            "https-sub-category": str,
+            "decrypted-traffic-mirror": str,
+            "detect-https-in-http-request": str,
+        },
+    },
+    "region": {
+        "class": "Region",
+        "path": "/firewall/region",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "city": list},
+    },
+    "schedule_group": {
+        "class": "ScheduleGroup",
+        "path": "/firewall.schedule/group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "member": list,
+            "uuid": str,
+            "color": int,
+            "fabric-object": str,
+        },
+    },
+    "schedule_onetime": {
+        "class": "ScheduleOnetime",
+        "path": "/firewall.schedule/onetime",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "start": str,
+            "start-utc": str,
+            "end": str,
+            "end-utc": str,
+            "color": int,
+            "expiration-days": int,
+            "fabric-object": str,
+        },
+    },
+    "schedule_recurring": {
+        "class": "ScheduleRecurring",
+        "path": "/firewall.schedule/recurring",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "start": str,
+            "end": str,
+            "day": str,
+            "label-day": str,
+            "color": int,
+            "fabric-object": str,
+        },
+    },
+    "security_policy": {
+        "class": "SecurityPolicy",
+        "path": "/firewall/security-policy",
+        "mkey": "policyid",
+        "fields": {
+            "uuid": str,
+            "policyid": int,
+            "name": str,
+            "comments": str,
+            "srcintf": list,
+            "dstintf": list,
+            "srcaddr": list,
+            "srcaddr-negate": str,
+            "dstaddr": list,
+            "dstaddr-negate": str,
+            "srcaddr6": list,
+            "srcaddr6-negate": str,
+            "dstaddr6": list,
+            "dstaddr6-negate": str,
+            "internet-service": str,
+            "internet-service-name": list,
+            "internet-service-negate": str,
+            "internet-service-group": list,
+            "internet-service-custom": list,
+            "internet-service-custom-group": list,
+            "internet-service-fortiguard": list,
+            "internet-service-src": str,
+            "internet-service-src-name": list,
+            "internet-service-src-negate": str,
+            "internet-service-src-group": list,
+            "internet-service-src-custom": list,
+            "internet-service-src-custom-group": list,
+            "internet-service-src-fortiguard": list,
+            "internet-service6": str,
+            "internet-service6-name": list,
+            "internet-service6-negate": str,
+            "internet-service6-group": list,
+            "internet-service6-custom": list,
+            "internet-service6-custom-group": list,
+            "internet-service6-fortiguard": list,
+            "internet-service6-src": str,
+            "internet-service6-src-name": list,
+            "internet-service6-src-negate": str,
+            "internet-service6-src-group": list,
+            "internet-service6-src-custom": list,
+            "internet-service6-src-custom-group": list,
+            "internet-service6-src-fortiguard": list,
+            "enforce-default-app-port": str,
+            "service": list,
+            "service-negate": str,
+            "send-deny-packet": str,
+            "schedule": str,
+            "status": str,
+            "logtraffic": str,
+            "learning-mode": str,
+            "nat46": str,
+            "nat64": str,
+            "profile-type": str,
+            "profile-group": str,
+            "profile-protocol-options": str,
+            "ssl-ssh-profile": str,
+            "av-profile": str,
+            "webfilter-profile": str,
+            "dnsfilter-profile": str,
+            "emailfilter-profile": str,
+            "dlp-profile": str,
+            "file-filter-profile": str,
+            "ips-sensor": str,
+            "application-list": str,
+            "voip-profile": str,
+            "ips-voip-filter": str,
+            "sctp-filter-profile": str,
+            "diameter-filter-profile": str,
+            "virtual-patch-profile": str,
+            "icap-profile": str,
+            "videofilter-profile": str,
+            "ssh-filter-profile": str,
+            "casb-profile": str,
+            "application": list,
+            "app-category": list,
+            "url-category": str,
+            "app-group": list,
+            "groups": list,
+            "users": list,
+            "fsso-groups": list,
+        },
+    },
+    "service_category": {
+        "class": "ServiceCategory",
+        "path": "/firewall.service/category",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "comment": str,
+            "fabric-object": str,
+        },
+    },
+    "service_custom": {
+        "class": "ServiceCustom",
+        "path": "/firewall.service/custom",
+        "mkey": "name",
+        "views": {
+            "summary": (
+                "name",
+                "protocol",
+                "tcp-portrange",
+                "udp-portrange",
+                "sctp-portrange",
+                "category",
+                "comment",
+            ),
+        },
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "proxy": str,
+            "category": str,
+            "protocol": str,
+            "helper": str,
+            "iprange": str,
+            "fqdn": str,
+            "protocol-number": int,
+            "icmptype": int,
+            "icmpcode": int,
+            "tcp-portrange": str,
+            "udp-portrange": str,
+            "udplite-portrange": str,
+            "sctp-portrange": str,
+            "tcp-halfclose-timer": int,
+            "tcp-halfopen-timer": int,
+            "tcp-timewait-timer": int,
+            "tcp-rst-timer": int,
+            "udp-idle-timer": int,
+            "session-ttl": str,
+            "check-reset-range": str,
+            "comment": str,
+            "color": int,
+            "app-service-type": str,
+            "app-category": list,
+            "application": list,
+            "fabric-object": str,
+        },
+    },
+    "service_group": {
+        "class": "ServiceGroup",
+        "path": "/firewall.service/group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "proxy": str,
+            "member": list,
+            "comment": str,
+            "color": int,
+            "fabric-object": str,
+        },
+    },
+    "shaper_per_ip_shaper": {
+        "class": "ShaperPerIpShaper",
+        "path": "/firewall.shaper/per-ip-shaper",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "max-bandwidth": int,
+            "bandwidth-unit": str,
+            "max-concurrent-session": int,
+            "max-concurrent-tcp-session": int,
+            "max-concurrent-udp-session": int,
+            "diffserv-forward": str,
+            "diffserv-reverse": str,
+            "diffservcode-forward": str,
+            "diffservcode-rev": str,
+        },
+    },
+    "shaper_traffic_shaper": {
+        "class": "ShaperTrafficShaper",
+        "path": "/firewall.shaper/traffic-shaper",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "guaranteed-bandwidth": int,
+            "maximum-bandwidth": int,
+            "bandwidth-unit": str,
+            "priority": str,
+            "per-policy": str,
+            "diffserv": str,
+            "diffservcode": str,
+            "dscp-marking-method": str,
+            "exceed-bandwidth": int,
+            "exceed-dscp": str,
+            "maximum-dscp": str,
+            "cos-marking": str,
+            "cos-marking-method": str,
+            "cos": str,
+            "exceed-cos": str,
+            "maximum-cos": str,
+            "overhead": int,
+            "exceed-class-id": int,
+        },
+    },
+    "shaping_policy": {
+        "class": "ShapingPolicy",
+        "path": "/firewall/shaping-policy",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "uuid": str,
+            "name": str,
+            "comment": str,
+            "status": str,
+            "ip-version": str,
+            "traffic-type": str,
+            "srcaddr": list,
+            "dstaddr": list,
+            "srcaddr6": list,
+            "dstaddr6": list,
+            "internet-service": str,
+            "internet-service-name": list,
+            "internet-service-group": list,
+            "internet-service-custom": list,
+            "internet-service-custom-group": list,
+            "internet-service-fortiguard": list,
+            "internet-service-src": str,
+            "internet-service-src-name": list,
+            "internet-service-src-group": list,
+            "internet-service-src-custom": list,
+            "internet-service-src-custom-group": list,
+            "internet-service-src-fortiguard": list,
+            "service": list,
+            "schedule": str,
+            "users": list,
+            "groups": list,
+            "application": list,
+            "app-category": list,
+            "app-group": list,
+            "url-category": list,
+            "srcintf": list,
+            "dstintf": list,
+            "tos-mask": str,
+            "tos": str,
+            "tos-negate": str,
+            "traffic-shaper": str,
+            "traffic-shaper-reverse": str,
+            "per-ip-shaper": str,
+            "class-id": int,
+            "diffserv-forward": str,
+            "diffserv-reverse": str,
+            "diffservcode-forward": str,
+            "diffservcode-rev": str,
+            "cos-mask": str,
+            "cos": str,
+        },
+    },
+    "shaping_profile": {
+        "class": "ShapingProfile",
+        "path": "/firewall/shaping-profile",
+        "mkey": "profile-name",
+        "fields": {
+            "profile-name": str,
+            "comment": str,
+            "type": str,
+            "npu-offloading": str,
+            "default-class-id": int,
+            "shaping-entries": list,
+        },
+    },
+    "sniffer": {
+        "class": "Sniffer",
+        "path": "/firewall/sniffer",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "uuid": str,
+            "status": str,
+            "logtraffic": str,
+            "ipv6": str,
+            "non-ip": str,
+            "interface": str,
+            "host": str,
+            "port": str,
+            "protocol": str,
+            "vlan": str,
+            "application-list-status": str,
+            "application-list": str,
+            "ips-sensor-status": str,
+            "ips-sensor": str,
+            "dsri": str,
+            "av-profile-status": str,
+            "av-profile": str,
+            "webfilter-profile-status": str,
+            "webfilter-profile": str,
+            "emailfilter-profile-status": str,
+            "emailfilter-profile": str,
+            "dlp-profile-status": str,
+            "dlp-profile": str,
+            "ip-threatfeed-status": str,
+            "ip-threatfeed": list,
+            "file-filter-profile-status": str,
+            "file-filter-profile": str,
+            "ips-dos-status": str,
+            "anomaly": list,
+        },
+    },
+    "ssh_host_key": {
+        "class": "SshHostKey",
+        "path": "/firewall.ssh/host-key",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "type": str,
+            "nid": str,
+            "usage": str,
+            "ip": str,
+            "port": int,
+            "hostname": str,
+            "public-key": str,
+        },
+    },
+    "ssh_local_ca": {
+        "class": "SshLocalCa",
+        "path": "/firewall.ssh/local-ca",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "password": str,
+            "private-key": str,
+            "public-key": str,
+            "source": str,
+        },
+    },
+    "ssh_local_key": {
+        "class": "SshLocalKey",
+        "path": "/firewall.ssh/local-key",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "password": str,
+            "private-key": str,
+            "public-key": str,
+            "source": str,
+        },
+    },
+    "ssh_setting": {
+        "class": "SshSetting",
+        "path": "/firewall.ssh/setting",
+        "fields": {
+            "caname": str,
+            "untrusted-caname": str,
+            "hostkey-rsa2048": str,
+            "hostkey-dsa1024": str,
+            "hostkey-ecdsa256": str,
+            "hostkey-ecdsa384": str,
+            "hostkey-ecdsa521": str,
+            "hostkey-ed25519": str,
+            "host-trusted-checking": str,
+        },
+    },
+    "ssl_server": {
+        "class": "SslServer",
+        "path": "/firewall/ssl-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ip": str,
+            "port": int,
+            "ssl-mode": str,
+            "add-header-x-forwarded-proto": str,
+            "mapped-port": int,
+            "ssl-cert": list,
+            "ssl-dh-bits": str,
+            "ssl-algorithm": str,
+            "ssl-client-renegotiation": str,
+            "ssl-min-version": str,
+            "ssl-max-version": str,
+            "ssl-send-empty-frags": str,
+            "url-rewrite": str,
+        },
+    },
+    "ssl_setting": {
+        "class": "SslSetting",
+        "path": "/firewall.ssl/setting",
+        "fields": {
+            "proxy-connect-timeout": int,
+            "ssl-dh-bits": str,
+            "ssl-send-empty-frags": str,
+            "no-matching-cipher-action": str,
+            "cert-manager-cache-timeout": int,
+            "resigned-short-lived-certificate": str,
+            "cert-cache-capacity": int,
+            "cert-cache-timeout": int,
+            "session-cache-capacity": int,
+            "session-cache-timeout": int,
+            "kxp-queue-threshold": int,
+            "ssl-queue-threshold": int,
+            "abbreviate-handshake": str,
+        },
+    },
+    "ssl_ssh_profile": {
+        "class": "SslSshProfile",
+        "path": "/firewall/ssl-ssh-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "ssl": list,
+            "https": list,
+            "ftps": list,
+            "imaps": list,
+            "pop3s": list,
+            "smtps": list,
+            "ssh": list,
+            "dot": list,
+            "allowlist": str,
+            "block-blocklisted-certificates": str,
+            "ssl-exempt": list,
+            "ech-outer-sni": list,
+            "server-cert-mode": str,
+            "use-ssl-server": str,
+            "caname": str,
+            "untrusted-caname": str,
+            "server-cert": list,
+            "ssl-server": list,
+            "ssl-exemption-ip-rating": str,
+            "ssl-exemption-log": str,
+            "ssl-anomaly-log": str,
+            "ssl-negotiation-log": str,
+            "ssl-server-cert-log": str,
+            "ssl-handshake-log": str,
+            "rpc-over-https": str,
+            "mapi-over-https": str,
+            "supported-alpn": str,
+        },
+    },
+    "traffic_class": {
+        "class": "TrafficClass",
+        "path": "/firewall/traffic-class",
+        "mkey": "class-id",
+        "fields": {"class-id": int, "class-name": str},
+    },
+    "ttl_policy": {
+        "class": "TtlPolicy",
+        "path": "/firewall/ttl-policy",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "status": str,
+            "srcintf": str,
+            "srcaddr": list,
+            "service": list,
+            "schedule": str,
+            "ttl": str,
+        },
+    },
+    "vendor_mac": {
+        "class": "VendorMac",
+        "path": "/firewall/vendor-mac",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "mac-number": int, "obsolete": int},
+    },
+    "vendor_mac_summary": {
+        "class": "VendorMacSummary",
+        "path": "/firewall/vendor-mac-summary",
+    },
+    "vip": {
+        "class": "Vip",
+        "path": "/firewall/vip",
+        "mkey": "name",
+        "views": {
+            "summary": (
+                "name",
+                "type",
+                "extintf",
+                "extip",
+                "mappedip",
+                "portforward",
+                "protocol",
+                "extport",
+                "mappedport",
+                "status",
+                "comment",
+            ),
+        },
+        "fields": {
+            "name": str,
+            "id": int,
+            "uuid": str,
+            "comment": str,
+            "type": str,
+            "server-type": str,
+            "dns-mapping-ttl": int,
+            "ldb-method": str,
+            "src-filter": list,
+            "src-vip-filter": str,
+            "service": list,
+            "extip": str,
+            "extaddr": list,
+            "h2-support": str,
+            "h3-support": str,
+            "quic": list,
+            "nat44": str,
+            "nat46": str,
+            "add-nat46-route": str,
+            "mappedip": list,
+            "mapped-addr": str,
+            "extintf": str,
+            "arp-reply": str,
+            "http-redirect": str,
+            "persistence": str,
+            "nat-source-vip": str,
+            "portforward": str,
+            "status": str,
+            "protocol": str,
+            "extport": str,
+            "mappedport": str,
+            "gratuitous-arp-interval": int,
+            "srcintf-filter": list,
+            "portmapping-type": str,
+            "empty-cert-action": str,
+            "user-agent-detect": str,
+            "client-cert": str,
+            "realservers": list,
+            "http-cookie-domain-from-host": str,
+            "http-cookie-domain": str,
+            "http-cookie-path": str,
+            "http-cookie-generation": int,
+            "http-cookie-age": int,
+            "http-cookie-share": str,
+            "https-cookie-secure": str,
+            "http-multiplex": str,
+            "http-multiplex-ttl": int,
+            "http-multiplex-max-request": int,
+            "http-multiplex-max-concurrent-request": int,
+            "http-ip-header": str,
+            "http-ip-header-name": str,
+            "outlook-web-access": str,
+            "weblogic-server": str,
+            "websphere-server": str,
+            "ssl-mode": str,
+            "ssl-certificate": list,
+            "ssl-dh-bits": str,
+            "ssl-algorithm": str,
+            "ssl-cipher-suites": list,
+            "ssl-server-algorithm": str,
+            "ssl-server-cipher-suites": list,
+            "ssl-pfs": str,
+            "ssl-min-version": str,
+            "ssl-max-version": str,
+            "ssl-server-min-version": str,
+            "ssl-server-max-version": str,
+            "ssl-accept-ffdhe-groups": str,
+            "ssl-send-empty-frags": str,
+            "ssl-client-fallback": str,
+            "ssl-client-renegotiation": str,
+            "ssl-client-session-state-type": str,
+            "ssl-client-session-state-timeout": int,
+            "ssl-client-session-state-max": int,
+            "ssl-client-rekey-count": int,
+            "ssl-server-renegotiation": str,
+            "ssl-server-session-state-type": str,
+            "ssl-server-session-state-timeout": int,
+            "ssl-server-session-state-max": int,
+            "ssl-http-location-conversion": str,
+            "ssl-http-match-host": str,
+            "ssl-hpkp": str,
+            "ssl-hpkp-primary": str,
+            "ssl-hpkp-backup": str,
+            "ssl-hpkp-age": int,
+            "ssl-hpkp-report-uri": str,
+            "ssl-hpkp-include-subdomains": str,
+            "ssl-hsts": str,
+            "ssl-hsts-age": int,
+            "ssl-hsts-include-subdomains": str,
+            "monitor": list,
+            "max-embryonic-connections": int,
+            "color": int,
+            "ipv6-mappedip": str,
+            "ipv6-mappedport": str,
+            "one-click-gslb-server": str,
+            "gslb-hostname": str,
+            "gslb-domain-name": str,
+            "gslb-public-ips": list,
+        },
+    },
+    "vip6": {
+        "class": "Vip6",
+        "path": "/firewall/vip6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "uuid": str,
+            "comment": str,
+            "type": str,
+            "src-filter": list,
+            "src-vip-filter": str,
+            "extip": str,
+            "mappedip": str,
+            "nat-source-vip": str,
+            "ndp-reply": str,
+            "portforward": str,
+            "protocol": str,
+            "extport": str,
+            "mappedport": str,
+            "color": int,
+            "ldb-method": str,
+            "server-type": str,
+            "http-redirect": str,
+            "persistence": str,
+            "h2-support": str,
+            "h3-support": str,
+            "quic": list,
+            "nat66": str,
+            "nat64": str,
+            "add-nat64-route": str,
+            "empty-cert-action": str,
+            "user-agent-detect": str,
+            "client-cert": str,
+            "realservers": list,
+            "http-cookie-domain-from-host": str,
+            "http-cookie-domain": str,
+            "http-cookie-path": str,
+            "http-cookie-generation": int,
+            "http-cookie-age": int,
+            "http-cookie-share": str,
+            "https-cookie-secure": str,
+            "http-multiplex": str,
+            "http-ip-header": str,
+            "http-ip-header-name": str,
+            "outlook-web-access": str,
+            "weblogic-server": str,
+            "websphere-server": str,
+            "ssl-mode": str,
+            "ssl-certificate": list,
+            "ssl-dh-bits": str,
+            "ssl-algorithm": str,
+            "ssl-cipher-suites": list,
+            "ssl-server-renegotiation": str,
+            "ssl-server-algorithm": str,
+            "ssl-server-cipher-suites": list,
+            "ssl-pfs": str,
+            "ssl-min-version": str,
+            "ssl-max-version": str,
+            "ssl-server-min-version": str,
+            "ssl-server-max-version": str,
+            "ssl-accept-ffdhe-groups": str,
+            "ssl-send-empty-frags": str,
+            "ssl-client-fallback": str,
+            "ssl-client-renegotiation": str,
+            "ssl-client-session-state-type": str,
+            "ssl-client-session-state-timeout": int,
+            "ssl-client-session-state-max": int,
+            "ssl-client-rekey-count": int,
+            "ssl-server-session-state-type": str,
+            "ssl-server-session-state-timeout": int,
+            "ssl-server-session-state-max": int,
+            "ssl-http-location-conversion": str,
+            "ssl-http-match-host": str,
+            "ssl-hpkp": str,
+            "ssl-hpkp-primary": str,
+            "ssl-hpkp-backup": str,
+            "ssl-hpkp-age": int,
+            "ssl-hpkp-report-uri": str,
+            "ssl-hpkp-include-subdomains": str,
+            "ssl-hsts": str,
+            "ssl-hsts-age": int,
+            "ssl-hsts-include-subdomains": str,
+            "monitor": list,
+            "max-embryonic-connections": int,
+            "embedded-ipv4-address": str,
+            "ipv4-mappedip": str,
+            "ipv4-mappedport": str,
+        },
+    },
+    "vipgrp": {
+        "class": "Vipgrp",
+        "path": "/firewall/vipgrp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "interface": str,
+            "color": int,
+            "comments": str,
+            "member": list,
+        },
+    },
+    "vipgrp6": {
+        "class": "Vipgrp6",
+        "path": "/firewall/vipgrp6",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "color": int,
+            "comments": str,
+            "member": list,
+        },
+    },
+    "wildcard_fqdn_custom": {
+        "class": "WildcardFqdnCustom",
+        "path": "/firewall.wildcard-fqdn/custom",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "wildcard-fqdn": str,
+            "color": int,
+            "comment": str,
+        },
+    },
+    "wildcard_fqdn_group": {
+        "class": "WildcardFqdnGroup",
+        "path": "/firewall.wildcard-fqdn/group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "member": list,
+            "color": int,
+            "comment": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
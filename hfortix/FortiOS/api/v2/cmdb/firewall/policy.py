@@ -47,12 +47,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Union, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
 
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 # Import from central API helpers
 from ...._helpers import build_cmdb_payload
+from ...._helpers.projection import apply_projection, default_views
 
 
 class Policy:
@@ -74,6 +75,28 @@ class Policy:
         - DELETE removes objects (404 if name doesn't exist)
     """
 
+    # View name -> fields returned by get(view=...)
+    views = default_views(
+        "policyid",
+        {},
+        {
+            "summary": (
+                "policyid",
+                "name",
+                "status",
+                "action",
+                "srcintf",
+                "dstintf",
+                "srcaddr",
+                "dstaddr",
+                "service",
+                "schedule",
+                "nat",
+                "comments",
+            ),
+        },
+    )
+
     def __init__(self, client: "IHTTPClient"):
         """
         Initialize Policy endpoint.
@@ -119,13 +142,25 @@ class Policy:
             sort: Sort results (e.g., sort='name,asc')
             start: Starting entry index for paging
             count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
+            format: Fields to return, as a list (e.g., format=['name',
+            'action']) or a string (e.g., format='name|action')
+            view: Name of a predefined field list, see ``views``
+            exclude_default_values: Leave out fields at their default
+            compact: If True, return the entries as a compact ResultSet
+            (see hfortix.FortiOS.resultset)
             See FortiOS REST API documentation for full list of query
             parameters
 
         Returns:
             Dictionary containing API response
+
+        Raises:
+            ValueError: If the view is unknown or both view and format are
+            given, or if compact is combined with raw_json
         """
+        compact = kwargs.pop("compact", False)
+        if compact and raw_json:
+            raise ValueError("compact=True can't be combined with raw_json")
         params = payload_dict.copy() if payload_dict else {}
 
         # Build endpoint path
@@ -142,9 +177,73 @@ class Policy:
         if search is not None:
             params["search"] = search
         params.update(kwargs)
-        return self._client.get(
+        apply_projection(params, self.views, {})
+        result = self._client.get(
             "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
         )
+        if compact:
+            from hfortix.FortiOS.resultset import compact_result
+
+            return compact_result(result, "Policy")
+        return result
+
+    def iter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (sync mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of query parameters
+            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
+            **kwargs: Additional query parameters (filter, sort, format, etc.)
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+
+        Example:
+            >>> for item in fgt.api.cmdb.firewall.policy.iter():
+            ...     print(item)
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        return paginate(
+            self.get, page_size, payload_dict=payload_dict, vdom=vdom, **kwargs
+        )
+
+    def aiter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (async mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of query parameters
+            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
+            **kwargs: Additional query parameters (filter, sort, format, etc.)
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+
+        Example:
+            >>> async for item in fgt.api.cmdb.firewall.policy.aiter():
+            ...     print(item)
+        """
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        return apaginate(
+            self.get, page_size, payload_dict=payload_dict, vdom=vdom, **kwargs
+        )
 
     def put(
         self,
@@ -1,9 +1,24 @@
 """FortiOS CMDB - Ftp-proxy category"""
 
-from .explicit import Explicit
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Explicit"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Explicit": "._registry",
+    },
+)
+
 
 class FtpProxy:
     """
@@ -12,6 +27,8 @@ class FtpProxy:
     This class provides access to all ftp-proxy CMDB endpoints.
     """
 
+    explicit: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Explicit")
+
     def __init__(self, client):
         """
         Initialize FtpProxy with all endpoint classes.
@@ -19,4 +36,4 @@ class FtpProxy:
         Args:
             client: HTTPClient instance
         """
-        self.explicit = Explicit(client)
+        self._client = client
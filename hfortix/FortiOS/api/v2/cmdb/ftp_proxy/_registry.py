@@ -0,0 +1,24 @@
+"""FortiOS CMDB - Ftp Proxy endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "explicit": {
+        "class": "Explicit",
+        "path": "/ftp-proxy/explicit",
+        "fields": {
+            "status": str,
+            "incoming-port": str,
+            "incoming-ip": str,
+            "outgoing-ip": str,
+            "sec-default-action": str,
+            "server-data-mode": str,
+            "ssl": str,
+            "ssl-cert": list,
+            "ssl-dh-bits": str,
+            "ssl-algorithm": str,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
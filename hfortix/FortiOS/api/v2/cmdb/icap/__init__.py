@@ -1,11 +1,26 @@
 """FortiOS CMDB - Icap category"""
 
-from .profile import Profile
-from .server import Server
-from .server_group import ServerGroup
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Profile", "Server", "ServerGroup"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Profile": "._registry",
+        "Server": "._registry",
+        "ServerGroup": "._registry",
+    },
+)
+
 
 class Icap:
     """
@@ -14,6 +29,10 @@ class Icap:
     This class provides access to all icap CMDB endpoints.
     """
 
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Server")
+    server_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ServerGroup")
+
     def __init__(self, client):
         """
         Initialize Icap with all endpoint classes.
@@ -21,6 +40,4 @@ class Icap:
         Args:
             client: HTTPClient instance
         """
-        self.profile = Profile(client)
-        self.server = Server(client)
-        self.server_group = ServerGroup(client)
+        self._client = client
@@ -0,0 +1,70 @@
+"""FortiOS CMDB - Icap endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/icap/profile",
+        "mkey": "name",
+        "fields": {
+            "replacemsg-group": str,
+            "name": str,
+            "comment": str,
+            "request": str,
+            "response": str,
+            "file-transfer": str,
+            "streaming-content-bypass": str,
+            "ocr-only": str,
+            "204-size-limit": int,
+            "204-response": str,
+            "preview": str,
+            "preview-data-length": int,
+            "request-server": str,
+            "response-server": str,
+            "file-transfer-server": str,
+            "request-failure": str,
+            "response-failure": str,
+            "file-transfer-failure": str,
+            "request-path": str,
+            "response-path": str,
+            "file-transfer-path": str,
+            "methods": str,
+            "response-req-hdr": str,
+            "respmod-default-action": str,
+            "icap-block-log": str,
+            "chunk-encap": str,
+            "extension-feature": str,
+            "scan-progress-interval": int,
+            "timeout": int,
+            "icap-headers": list,
+            "respmod-forward-rules": list,
+        },
+    },
+    "server": {
+        "class": "Server",
+        "path": "/icap/server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "addr-type": str,
+            "ip-address": str,
+            "ip6-address": str,
+            "fqdn": str,
+            "port": int,
+            "max-connections": int,
+            "secure": str,
+            "ssl-cert": str,
+            "healthcheck": str,
+            "healthcheck-service": str,
+        },
+    },
+    "server_group": {
+        "class": "ServerGroup",
+        "path": "/icap/server-group",
+        "mkey": "name",
+        "fields": {"name": str, "ldb-method": str, "server-list": list},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
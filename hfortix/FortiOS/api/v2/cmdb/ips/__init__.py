@@ -1,13 +1,14 @@
 """FortiOS CMDB - Ips category"""
 
-from .custom import Custom
-from .decoder import Decoder
-from .global_ import Global
-from .rule import Rule
-from .rule_settings import RuleSettings
-from .sensor import Sensor
-from .settings import Settings
-from .view_map import ViewMap
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "Custom",
@@ -20,6 +21,20 @@ __all__ = [
     "ViewMap",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Custom": "._registry",
+        "Decoder": "._registry",
+        "Global": "._registry",
+        "Rule": "._registry",
+        "RuleSettings": "._registry",
+        "Sensor": "._registry",
+        "Settings": "._registry",
+        "ViewMap": "._registry",
+    },
+)
+
 
 class Ips:
     """
@@ -28,6 +43,15 @@ class Ips:
     This class provides access to all ips CMDB endpoints.
     """
 
+    custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Custom")
+    decoder: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Decoder")
+    global_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Global")
+    rule: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Rule")
+    rule_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("RuleSettings")
+    sensor: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Sensor")
+    settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Settings")
+    view_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ViewMap")
+
     def __init__(self, client):
         """
         Initialize Ips with all endpoint classes.
@@ -35,11 +59,4 @@ class Ips:
         Args:
             client: HTTPClient instance
         """
-        self.custom = Custom(client)
-        self.decoder = Decoder(client)
-        self.global_ = Global(client)
-        self.rule = Rule(client)
-        self.rule_settings = RuleSettings(client)
-        self.sensor = Sensor(client)
-        self.settings = Settings(client)
-        self.view_map = ViewMap(client)
+        self._client = client
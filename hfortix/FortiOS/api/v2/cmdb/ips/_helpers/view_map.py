@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_WHICH = [
@@ -21,224 +21,20 @@ VALID_BODY_WHICH = [
 ]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_view_map_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_view_map_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating view_map.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate vdom-id if present
-    if "vdom-id" in payload:
-        value = payload.get("vdom-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "vdom-id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"vdom-id must be numeric, got: {value}")
-
-    # Validate policy-id if present
-    if "policy-id" in payload:
-        value = payload.get("policy-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "policy-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"policy-id must be numeric, got: {value}")
-
-    # Validate id-policy-id if present
-    if "id-policy-id" in payload:
-        value = payload.get("id-policy-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "id-policy-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"id-policy-id must be numeric, got: {value}")
-
-    # Validate which if present
-    if "which" in payload:
-        value = payload.get("which")
-        if value and value not in VALID_BODY_WHICH:
-            return (
-                False,
-                f"Invalid which '{value}'. Must be one of: {', '.join(VALID_BODY_WHICH)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_view_map_put(
-    id: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        id: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # id is required for updates
-    if not id:
-        return (False, "id is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate vdom-id if present
-    if "vdom-id" in payload:
-        value = payload.get("vdom-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "vdom-id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"vdom-id must be numeric, got: {value}")
-
-    # Validate policy-id if present
-    if "policy-id" in payload:
-        value = payload.get("policy-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "policy-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"policy-id must be numeric, got: {value}")
-
-    # Validate id-policy-id if present
-    if "id-policy-id" in payload:
-        value = payload.get("id-policy-id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (
-                        False,
-                        "id-policy-id must be between 0 and 4294967295",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"id-policy-id must be numeric, got: {value}")
-
-    # Validate which if present
-    if "which" in payload:
-        value = payload.get("which")
-        if value and value not in VALID_BODY_WHICH:
-            return (
-                False,
-                f"Invalid which '{value}'. Must be one of: {', '.join(VALID_BODY_WHICH)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_view_map_delete(id: str | None = None) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        id: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not id:
-        return (False, "id is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "id": (0, 4294967295),
+        "vdom-id": (0, 4294967295),
+        "policy-id": (0, 4294967295),
+        "id-policy-id": (0, 4294967295),
+        "which": VALID_BODY_WHICH,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_view_map_get = SCHEMA.get_validator()
+validate_view_map_post = SCHEMA.post_validator()
+validate_view_map_put = SCHEMA.put_validator("id")
+validate_view_map_delete = SCHEMA.delete_validator("id")
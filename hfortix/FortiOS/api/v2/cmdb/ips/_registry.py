@@ -0,0 +1,123 @@
+"""FortiOS CMDB - Ips endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "custom": {
+        "class": "Custom",
+        "path": "/ips/custom",
+        "mkey": "tag",
+        "fields": {
+            "tag": str,
+            "signature": str,
+            "rule-id": int,
+            "severity": str,
+            "location": str,
+            "os": str,
+            "application": str,
+            "protocol": str,
+            "status": str,
+            "log": str,
+            "log-packet": str,
+            "comment": str,
+        },
+    },
+    "decoder": {
+        "class": "Decoder",
+        "path": "/ips/decoder",
+        "mkey": "name",
+        "fields": {"name": str, "parameter": list, "status": str},
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/ips/global",
+        "fields": {
+            "fail-open": str,
+            "database": str,
+            "traffic-submit": str,
+            "anomaly-mode": str,
+            "session-limit-mode": str,
+            "socket-size": int,
+            "engine-count": int,
+            "sync-session-ttl": str,
+            "np-accel-mode": str,
+            "ips-reserve-cpu": str,
+            "cp-accel-mode": str,
+            "deep-app-insp-timeout": int,
+            "deep-app-insp-db-limit": int,
+            "exclude-signatures": str,
+            "packet-log-queue-depth": int,
+            "ngfw-max-scan-range": int,
+            "av-mem-limit": int,
+            "machine-learning-detection": str,
+            "tls-active-probe": list,
+        },
+    },
+    "rule": {
+        "class": "Rule",
+        "path": "/ips/rule",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "log": str,
+            "log-packet": str,
+            "group": str,
+            "severity": str,
+            "location": str,
+            "os": str,
+            "application": str,
+            "service": str,
+            "rule-id": int,
+            "rev": int,
+            "date": int,
+            "metadata": list,
+        },
+    },
+    "rule_settings": {
+        "class": "RuleSettings",
+        "path": "/ips/rule-settings",
+        "mkey": "id",
+        "fields": {"id": int},
+    },
+    "sensor": {
+        "class": "Sensor",
+        "path": "/ips/sensor",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "replacemsg-group": str,
+            "block-malicious-url": str,
+            "scan-botnet-connections": str,
+            "extended-log": str,
+            "entries": list,
+        },
+    },
+    "settings": {
+        "class": "Settings",
+        "path": "/ips/settings",
+        "fields": {
+            "packet-log-history": int,
+            "packet-log-post-attack": int,
+            "packet-log-memory": int,
+            "ips-packet-quota": int,
+            "proxy-inline-ips": str,
+            "ha-session-pickup": str,
+        },
+    },
+    "view_map": {
+        "class": "ViewMap",
+        "path": "/ips/view-map",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "vdom-id": int,
+            "policy-id": int,
+            "id-policy-id": int,
+            "which": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,65 +1,14 @@
 """FortiOS CMDB - Log category"""
 
-from .custom_field import CustomField
-from .disk_filter import DiskFilter
-from .disk_setting import DiskSetting
-from .eventfilter import Eventfilter
-from .fortianalyzer2_filter import Fortianalyzer2Filter
-from .fortianalyzer2_override_filter import Fortianalyzer2OverrideFilter
-from .fortianalyzer2_override_setting import Fortianalyzer2OverrideSetting
-from .fortianalyzer2_setting import Fortianalyzer2Setting
-from .fortianalyzer3_filter import Fortianalyzer3Filter
-from .fortianalyzer3_override_filter import Fortianalyzer3OverrideFilter
-from .fortianalyzer3_override_setting import Fortianalyzer3OverrideSetting
-from .fortianalyzer3_setting import Fortianalyzer3Setting
-from .fortianalyzer_cloud_filter import FortianalyzerCloudFilter
-from .fortianalyzer_cloud_override_filter import (
-    FortianalyzerCloudOverrideFilter,
-)
-from .fortianalyzer_cloud_override_setting import (
-    FortianalyzerCloudOverrideSetting,
-)
-from .fortianalyzer_cloud_setting import FortianalyzerCloudSetting
-from .fortianalyzer_filter import FortianalyzerFilter
-from .fortianalyzer_override_filter import FortianalyzerOverrideFilter
-from .fortianalyzer_override_setting import FortianalyzerOverrideSetting
-from .fortianalyzer_setting import FortianalyzerSetting
-from .fortiguard_filter import FortiguardFilter
-from .fortiguard_override_filter import FortiguardOverrideFilter
-from .fortiguard_override_setting import FortiguardOverrideSetting
-from .fortiguard_setting import FortiguardSetting
-from .gui_display import GuiDisplay
-from .memory_filter import MemoryFilter
-from .memory_global_setting import MemoryGlobalSetting
-from .memory_setting import MemorySetting
-from .null_device_filter import NullDeviceFilter
-from .null_device_setting import NullDeviceSetting
-from .setting import Setting
-from .syslogd2_filter import Syslogd2Filter
-from .syslogd2_override_filter import Syslogd2OverrideFilter
-from .syslogd2_override_setting import Syslogd2OverrideSetting
-from .syslogd2_setting import Syslogd2Setting
-from .syslogd3_filter import Syslogd3Filter
-from .syslogd3_override_filter import Syslogd3OverrideFilter
-from .syslogd3_override_setting import Syslogd3OverrideSetting
-from .syslogd3_setting import Syslogd3Setting
-from .syslogd4_filter import Syslogd4Filter
-from .syslogd4_override_filter import Syslogd4OverrideFilter
-from .syslogd4_override_setting import Syslogd4OverrideSetting
-from .syslogd4_setting import Syslogd4Setting
-from .syslogd_filter import SyslogdFilter
-from .syslogd_override_filter import SyslogdOverrideFilter
-from .syslogd_override_setting import SyslogdOverrideSetting
-from .syslogd_setting import SyslogdSetting
-from .tacacs_plus_accounting2_filter import TacacsPlusAccounting2Filter
-from .tacacs_plus_accounting2_setting import TacacsPlusAccounting2Setting
-from .tacacs_plus_accounting3_filter import TacacsPlusAccounting3Filter
-from .tacacs_plus_accounting3_setting import TacacsPlusAccounting3Setting
-from .tacacs_plus_accounting_filter import TacacsPlusAccountingFilter
-from .tacacs_plus_accounting_setting import TacacsPlusAccountingSetting
-from .threat_weight import ThreatWeight
-from .webtrends_filter import WebtrendsFilter
-from .webtrends_setting import WebtrendsSetting
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "CustomField",
@@ -120,168 +69,316 @@ __all__ = [
     "WebtrendsSetting",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "CustomField": "._registry",
+        "DiskFilter": "._registry",
+        "DiskSetting": "._registry",
+        "Eventfilter": "._registry",
+        "Fortianalyzer2Filter": "._registry",
+        "Fortianalyzer2OverrideFilter": "._registry",
+        "Fortianalyzer2OverrideSetting": "._registry",
+        "Fortianalyzer2Setting": "._registry",
+        "Fortianalyzer3Filter": "._registry",
+        "Fortianalyzer3OverrideFilter": "._registry",
+        "Fortianalyzer3OverrideSetting": "._registry",
+        "Fortianalyzer3Setting": "._registry",
+        "FortianalyzerCloudFilter": "._registry",
+        "FortianalyzerCloudOverrideFilter": "._registry",
+        "FortianalyzerCloudOverrideSetting": "._registry",
+        "FortianalyzerCloudSetting": "._registry",
+        "FortianalyzerFilter": "._registry",
+        "FortianalyzerOverrideFilter": "._registry",
+        "FortianalyzerOverrideSetting": "._registry",
+        "FortianalyzerSetting": "._registry",
+        "FortiguardFilter": "._registry",
+        "FortiguardOverrideFilter": "._registry",
+        "FortiguardOverrideSetting": "._registry",
+        "FortiguardSetting": "._registry",
+        "GuiDisplay": "._registry",
+        "MemoryFilter": "._registry",
+        "MemoryGlobalSetting": "._registry",
+        "MemorySetting": "._registry",
+        "NullDeviceFilter": "._registry",
+        "NullDeviceSetting": "._registry",
+        "Setting": "._registry",
+        "Syslogd2Filter": "._registry",
+        "Syslogd2OverrideFilter": "._registry",
+        "Syslogd2OverrideSetting": "._registry",
+        "Syslogd2Setting": "._registry",
+        "Syslogd3Filter": "._registry",
+        "Syslogd3OverrideFilter": "._registry",
+        "Syslogd3OverrideSetting": "._registry",
+        "Syslogd3Setting": "._registry",
+        "Syslogd4Filter": "._registry",
+        "Syslogd4OverrideFilter": "._registry",
+        "Syslogd4OverrideSetting": "._registry",
+        "Syslogd4Setting": "._registry",
+        "SyslogdFilter": "._registry",
+        "SyslogdOverrideFilter": "._registry",
+        "SyslogdOverrideSetting": "._registry",
+        "SyslogdSetting": "._registry",
+        "TacacsPlusAccounting2Filter": "._registry",
+        "TacacsPlusAccounting2Setting": "._registry",
+        "TacacsPlusAccounting3Filter": "._registry",
+        "TacacsPlusAccounting3Setting": "._registry",
+        "TacacsPlusAccountingFilter": "._registry",
+        "TacacsPlusAccountingSetting": "._registry",
+        "ThreatWeight": "._registry",
+        "WebtrendsFilter": "._registry",
+        "WebtrendsSetting": "._registry",
+    },
+)
+
 
 class Disk:
     """Wrapper for disk.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DiskFilter")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("DiskSetting")
+
     def __init__(self, client):
         """Initialize Disk endpoints."""
-        self.filter = DiskFilter(client)
-        self.setting = DiskSetting(client)
+        self._client = client
 
 
 class Fortianalyzer2:
     """Wrapper for fortianalyzer2.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortianalyzer2Filter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Fortianalyzer2OverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Fortianalyzer2OverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortianalyzer2Setting")
+
     def __init__(self, client):
         """Initialize Fortianalyzer2 endpoints."""
-        self.filter = Fortianalyzer2Filter(client)
-        self.override_filter = Fortianalyzer2OverrideFilter(client)
-        self.override_setting = Fortianalyzer2OverrideSetting(client)
-        self.setting = Fortianalyzer2Setting(client)
+        self._client = client
 
 
 class Fortianalyzer3:
     """Wrapper for fortianalyzer3.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortianalyzer3Filter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Fortianalyzer3OverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Fortianalyzer3OverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortianalyzer3Setting")
+
     def __init__(self, client):
         """Initialize Fortianalyzer3 endpoints."""
-        self.filter = Fortianalyzer3Filter(client)
-        self.override_filter = Fortianalyzer3OverrideFilter(client)
-        self.override_setting = Fortianalyzer3OverrideSetting(client)
-        self.setting = Fortianalyzer3Setting(client)
+        self._client = client
 
 
 class FortianalyzerCloud:
     """Wrapper for fortianalyzer_cloud.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerCloudFilter"
+    )
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerCloudOverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerCloudOverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerCloudSetting"
+    )
+
     def __init__(self, client):
         """Initialize FortianalyzerCloud endpoints."""
-        self.filter = FortianalyzerCloudFilter(client)
-        self.override_filter = FortianalyzerCloudOverrideFilter(client)
-        self.override_setting = FortianalyzerCloudOverrideSetting(client)
-        self.setting = FortianalyzerCloudSetting(client)
+        self._client = client
 
 
 class Fortianalyzer:
     """Wrapper for fortianalyzer.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FortianalyzerFilter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerOverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortianalyzerOverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FortianalyzerSetting")
+
     def __init__(self, client):
         """Initialize Fortianalyzer endpoints."""
-        self.filter = FortianalyzerFilter(client)
-        self.override_filter = FortianalyzerOverrideFilter(client)
-        self.override_setting = FortianalyzerOverrideSetting(client)
-        self.setting = FortianalyzerSetting(client)
+        self._client = client
 
 
 class Fortiguard:
     """Wrapper for fortiguard.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FortiguardFilter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortiguardOverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortiguardOverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FortiguardSetting")
+
     def __init__(self, client):
         """Initialize Fortiguard endpoints."""
-        self.filter = FortiguardFilter(client)
-        self.override_filter = FortiguardOverrideFilter(client)
-        self.override_setting = FortiguardOverrideSetting(client)
-        self.setting = FortiguardSetting(client)
+        self._client = client
 
 
 class Memory:
     """Wrapper for memory.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MemoryFilter")
+    global_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "MemoryGlobalSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MemorySetting")
+
     def __init__(self, client):
         """Initialize Memory endpoints."""
-        self.filter = MemoryFilter(client)
-        self.global_setting = MemoryGlobalSetting(client)
-        self.setting = MemorySetting(client)
+        self._client = client
 
 
 class NullDevice:
     """Wrapper for null_device.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("NullDeviceFilter")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("NullDeviceSetting")
+
     def __init__(self, client):
         """Initialize NullDevice endpoints."""
-        self.filter = NullDeviceFilter(client)
-        self.setting = NullDeviceSetting(client)
+        self._client = client
 
 
 class Syslogd2:
     """Wrapper for syslogd2.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd2Filter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd2OverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd2OverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd2Setting")
+
     def __init__(self, client):
         """Initialize Syslogd2 endpoints."""
-        self.filter = Syslogd2Filter(client)
-        self.override_filter = Syslogd2OverrideFilter(client)
-        self.override_setting = Syslogd2OverrideSetting(client)
-        self.setting = Syslogd2Setting(client)
+        self._client = client
 
 
 class Syslogd3:
     """Wrapper for syslogd3.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd3Filter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd3OverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd3OverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd3Setting")
+
     def __init__(self, client):
         """Initialize Syslogd3 endpoints."""
-        self.filter = Syslogd3Filter(client)
-        self.override_filter = Syslogd3OverrideFilter(client)
-        self.override_setting = Syslogd3OverrideSetting(client)
-        self.setting = Syslogd3Setting(client)
+        self._client = client
 
 
 class Syslogd4:
     """Wrapper for syslogd4.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd4Filter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd4OverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Syslogd4OverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Syslogd4Setting")
+
     def __init__(self, client):
         """Initialize Syslogd4 endpoints."""
-        self.filter = Syslogd4Filter(client)
-        self.override_filter = Syslogd4OverrideFilter(client)
-        self.override_setting = Syslogd4OverrideSetting(client)
-        self.setting = Syslogd4Setting(client)
+        self._client = client
 
 
 class Syslogd:
     """Wrapper for syslogd.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SyslogdFilter")
+    override_filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SyslogdOverrideFilter"
+    )
+    override_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SyslogdOverrideSetting"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SyslogdSetting")
+
     def __init__(self, client):
         """Initialize Syslogd endpoints."""
-        self.filter = SyslogdFilter(client)
-        self.override_filter = SyslogdOverrideFilter(client)
-        self.override_setting = SyslogdOverrideSetting(client)
-        self.setting = SyslogdSetting(client)
+        self._client = client
 
 
 class TacacsAccounting2:
     """Wrapper for tacacs_plus_accounting2.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccounting2Filter"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccounting2Setting"
+    )
+
     def __init__(self, client):
         """Initialize TacacsAccounting2 endpoints."""
-        self.filter = TacacsPlusAccounting2Filter(client)
-        self.setting = TacacsPlusAccounting2Setting(client)
+        self._client = client
 
 
 class TacacsAccounting3:
     """Wrapper for tacacs_plus_accounting3.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccounting3Filter"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccounting3Setting"
+    )
+
     def __init__(self, client):
         """Initialize TacacsAccounting3 endpoints."""
-        self.filter = TacacsPlusAccounting3Filter(client)
-        self.setting = TacacsPlusAccounting3Setting(client)
+        self._client = client
 
 
 class TacacsAccounting:
     """Wrapper for tacacs_plus_accounting.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccountingFilter"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TacacsPlusAccountingSetting"
+    )
+
     def __init__(self, client):
         """Initialize TacacsAccounting endpoints."""
-        self.filter = TacacsPlusAccountingFilter(client)
-        self.setting = TacacsPlusAccountingSetting(client)
+        self._client = client
 
 
 class Webtrends:
     """Wrapper for webtrends.* endpoints."""
 
+    filter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WebtrendsFilter")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WebtrendsSetting")
+
     def __init__(self, client):
         """Initialize Webtrends endpoints."""
-        self.filter = WebtrendsFilter(client)
-        self.setting = WebtrendsSetting(client)
+        self._client = client
 
 
 class Log:
@@ -291,6 +388,40 @@ class Log:
     This class provides access to all log CMDB endpoints.
     """
 
+    custom_field: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("CustomField")
+    eventfilter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Eventfilter")
+    gui_display: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("GuiDisplay")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+    threat_weight: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ThreatWeight")
+    disk: LazyEndpoint[Disk] = LazyEndpoint("Disk")
+    fortianalyzer2: LazyEndpoint[Fortianalyzer2] = LazyEndpoint(
+        "Fortianalyzer2"
+    )
+    fortianalyzer3: LazyEndpoint[Fortianalyzer3] = LazyEndpoint(
+        "Fortianalyzer3"
+    )
+    fortianalyzer_cloud: LazyEndpoint[FortianalyzerCloud] = LazyEndpoint(
+        "FortianalyzerCloud"
+    )
+    fortianalyzer: LazyEndpoint[Fortianalyzer] = LazyEndpoint("Fortianalyzer")
+    fortiguard: LazyEndpoint[Fortiguard] = LazyEndpoint("Fortiguard")
+    memory: LazyEndpoint[Memory] = LazyEndpoint("Memory")
+    null_device: LazyEndpoint[NullDevice] = LazyEndpoint("NullDevice")
+    syslogd2: LazyEndpoint[Syslogd2] = LazyEndpoint("Syslogd2")
+    syslogd3: LazyEndpoint[Syslogd3] = LazyEndpoint("Syslogd3")
+    syslogd4: LazyEndpoint[Syslogd4] = LazyEndpoint("Syslogd4")
+    syslogd: LazyEndpoint[Syslogd] = LazyEndpoint("Syslogd")
+    tacacs_accounting2: LazyEndpoint[TacacsAccounting2] = LazyEndpoint(
+        "TacacsAccounting2"
+    )
+    tacacs_accounting3: LazyEndpoint[TacacsAccounting3] = LazyEndpoint(
+        "TacacsAccounting3"
+    )
+    tacacs_accounting: LazyEndpoint[TacacsAccounting] = LazyEndpoint(
+        "TacacsAccounting"
+    )
+    webtrends: LazyEndpoint[Webtrends] = LazyEndpoint("Webtrends")
+
     def __init__(self, client):
         """
         Initialize Log with all endpoint classes.
@@ -298,24 +429,4 @@ class Log:
         Args:
             client: HTTPClient instance
         """
-        self.custom_field = CustomField(client)
-        self.eventfilter = Eventfilter(client)
-        self.gui_display = GuiDisplay(client)
-        self.setting = Setting(client)
-        self.threat_weight = ThreatWeight(client)
-        self.disk = Disk(client)
-        self.fortianalyzer2 = Fortianalyzer2(client)
-        self.fortianalyzer3 = Fortianalyzer3(client)
-        self.fortianalyzer_cloud = FortianalyzerCloud(client)
-        self.fortianalyzer = Fortianalyzer(client)
-        self.fortiguard = Fortiguard(client)
-        self.memory = Memory(client)
-        self.null_device = NullDevice(client)
-        self.syslogd2 = Syslogd2(client)
-        self.syslogd3 = Syslogd3(client)
-        self.syslogd4 = Syslogd4(client)
-        self.syslogd = Syslogd(client)
-        self.tacacs_accounting2 = TacacsAccounting2(client)
-        self.tacacs_accounting3 = TacacsAccounting3(client)
-        self.tacacs_accounting = TacacsAccounting(client)
-        self.webtrends = Webtrends(client)
+        self._client = client
@@ -0,0 +1,1078 @@
+"""FortiOS CMDB - Log endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "custom_field": {
+        "class": "CustomField",
+        "path": "/log/custom-field",
+        "mkey": "id",
+        "fields": {"id": str, "name": str, "value": str},
+    },
+    "disk_filter": {
+        "class": "DiskFilter",
+        "path": "/log.disk/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "disk_setting": {
+        "class": "DiskSetting",
+        "path": "/log.disk/setting",
+        "fields": {
+            "status": str,
+            "ips-archive": str,
+            "max-log-file-size": int,
+            "max-policy-packet-capture-size": int,
+            "roll-schedule": str,
+            "roll-day": str,
+            "roll-time": str,
+            "diskfull": str,
+            "log-quota": int,
+            "dlp-archive-quota": int,
+            "report-quota": int,
+            "maximum-log-age": int,
+            "upload": str,
+            "upload-destination": str,
+            "uploadip": str,
+            "uploadport": int,
+            "source-ip": str,
+            "uploaduser": str,
+            "uploadpass": str,
+            "uploaddir": str,
+            "uploadtype": str,
+            "uploadsched": str,
+            "uploadtime": str,
+            "upload-delete-files": str,
+            "upload-ssl-conn": str,
+            "full-first-warning-threshold": int,
+            "full-second-warning-threshold": int,
+            "full-final-warning-threshold": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "eventfilter": {
+        "class": "Eventfilter",
+        "path": "/log/eventfilter",
+        "fields": {
+            "event": str,
+            "system": str,
+            "vpn": str,
+            "user": str,
+            "router": str,
+            "wireless-activity": str,
+            "wan-opt": str,
+            "endpoint": str,
+            "ha": str,
+            "security-rating": str,
+            "fortiextender": str,
+            "connector": str,
+            "sdwan": str,
+            "cifs": str,
+            "switch-controller": str,
+            "rest-api": str,
+            "web-svc": str,
+        },
+    },
+    "fortianalyzer2_filter": {
+        "class": "Fortianalyzer2Filter",
+        "path": "/log.fortianalyzer2/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer2_override_filter": {
+        "class": "Fortianalyzer2OverrideFilter",
+        "path": "/log.fortianalyzer2/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer2_override_setting": {
+        "class": "Fortianalyzer2OverrideSetting",
+        "path": "/log.fortianalyzer2/override-setting",
+        "fields": {
+            "use-management-vdom": str,
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer2_setting": {
+        "class": "Fortianalyzer2Setting",
+        "path": "/log.fortianalyzer2/setting",
+        "fields": {
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer3_filter": {
+        "class": "Fortianalyzer3Filter",
+        "path": "/log.fortianalyzer3/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer3_override_filter": {
+        "class": "Fortianalyzer3OverrideFilter",
+        "path": "/log.fortianalyzer3/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer3_override_setting": {
+        "class": "Fortianalyzer3OverrideSetting",
+        "path": "/log.fortianalyzer3/override-setting",
+        "fields": {
+            "use-management-vdom": str,
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer3_setting": {
+        "class": "Fortianalyzer3Setting",
+        "path": "/log.fortianalyzer3/setting",
+        "fields": {
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer_cloud_filter": {
+        "class": "FortianalyzerCloudFilter",
+        "path": "/log.fortianalyzer-cloud/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer_cloud_override_filter": {
+        "class": "FortianalyzerCloudOverrideFilter",
+        "path": "/log.fortianalyzer-cloud/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer_cloud_override_setting": {
+        "class": "FortianalyzerCloudOverrideSetting",
+        "path": "/log.fortianalyzer-cloud/override-setting",
+        "fields": {"status": str},
+    },
+    "fortianalyzer_cloud_setting": {
+        "class": "FortianalyzerCloudSetting",
+        "path": "/log.fortianalyzer-cloud/setting",
+        "fields": {
+            "status": str,
+            "ips-archive": str,
+            "certificate-verification": str,
+            "serial": list,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer_filter": {
+        "class": "FortianalyzerFilter",
+        "path": "/log.fortianalyzer/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer_override_filter": {
+        "class": "FortianalyzerOverrideFilter",
+        "path": "/log.fortianalyzer/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "dlp-archive": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortianalyzer_override_setting": {
+        "class": "FortianalyzerOverrideSetting",
+        "path": "/log.fortianalyzer/override-setting",
+        "fields": {
+            "use-management-vdom": str,
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortianalyzer_setting": {
+        "class": "FortianalyzerSetting",
+        "path": "/log.fortianalyzer/setting",
+        "fields": {
+            "status": str,
+            "ips-archive": str,
+            "server": str,
+            "alt-server": str,
+            "fallback-to-primary": str,
+            "certificate-verification": str,
+            "serial": list,
+            "server-cert-ca": str,
+            "preshared-key": str,
+            "access-config": str,
+            "hmac-algorithm": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "monitor-keepalive-period": int,
+            "monitor-failure-retry-period": int,
+            "certificate": str,
+            "source-ip": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "reliable": str,
+            "priority": str,
+            "max-log-rate": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortiguard_filter": {
+        "class": "FortiguardFilter",
+        "path": "/log.fortiguard/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortiguard_override_filter": {
+        "class": "FortiguardOverrideFilter",
+        "path": "/log.fortiguard/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "free-style": list,
+        },
+    },
+    "fortiguard_override_setting": {
+        "class": "FortiguardOverrideSetting",
+        "path": "/log.fortiguard/override-setting",
+        "fields": {
+            "override": str,
+            "status": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "priority": str,
+            "max-log-rate": int,
+            "access-config": str,
+        },
+    },
+    "fortiguard_setting": {
+        "class": "FortiguardSetting",
+        "path": "/log.fortiguard/setting",
+        "fields": {
+            "status": str,
+            "upload-option": str,
+            "upload-interval": str,
+            "upload-day": str,
+            "upload-time": str,
+            "priority": str,
+            "max-log-rate": int,
+            "access-config": str,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "conn-timeout": int,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "gui_display": {
+        "class": "GuiDisplay",
+        "path": "/log/gui-display",
+        "fields": {
+            "resolve-hosts": str,
+            "resolve-apps": str,
+            "fortiview-unscanned-apps": str,
+        },
+    },
+    "memory_filter": {
+        "class": "MemoryFilter",
+        "path": "/log.memory/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "memory_global_setting": {
+        "class": "MemoryGlobalSetting",
+        "path": "/log.memory/global-setting",
+        "fields": {
+            "max-size": int,
+            "full-first-warning-threshold": int,
+            "full-second-warning-threshold": int,
+            "full-final-warning-threshold": int,
+        },
+    },
+    "memory_setting": {
+        "class": "MemorySetting",
+        "path": "/log.memory/setting",
+        "fields": {"status": str},
+    },
+    "null_device_filter": {
+        "class": "NullDeviceFilter",
+        "path": "/log.null-device/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "null_device_setting": {
+        "class": "NullDeviceSetting",
+        "path": "/log.null-device/setting",
+        "fields": {"status": str},
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/log/setting",
+        "fields": {
+            "resolve-ip": str,
+            "resolve-port": str,
+            "log-user-in-upper": str,
+            "fwpolicy-implicit-log": str,
+            "fwpolicy6-implicit-log": str,
+            "extended-log": str,
+            "local-in-allow": str,
+            "local-in-deny-unicast": str,
+            "local-in-deny-broadcast": str,
+            "local-in-policy-log": str,
+            "local-out": str,
+            "local-out-ioc-detection": str,
+            "daemon-log": str,
+            "neighbor-event": str,
+            "brief-traffic-format": str,
+            "user-anonymize": str,
+            "expolicy-implicit-log": str,
+            "log-policy-comment": str,
+            "faz-override": str,
+            "syslog-override": str,
+            "rest-api-set": str,
+            "rest-api-get": str,
+            "rest-api-performance": str,
+            "long-live-session-stat": str,
+            "extended-utm-log": str,
+            "zone-name": str,
+            "web-svc-perf": str,
+            "custom-log-fields": list,
+            "anonymization-hash": str,
+        },
+    },
+    "syslogd2_filter": {
+        "class": "Syslogd2Filter",
+        "path": "/log.syslogd2/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd2_override_filter": {
+        "class": "Syslogd2OverrideFilter",
+        "path": "/log.syslogd2/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd2_override_setting": {
+        "class": "Syslogd2OverrideSetting",
+        "path": "/log.syslogd2/override-setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "use-management-vdom": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd2_setting": {
+        "class": "Syslogd2Setting",
+        "path": "/log.syslogd2/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd3_filter": {
+        "class": "Syslogd3Filter",
+        "path": "/log.syslogd3/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd3_override_filter": {
+        "class": "Syslogd3OverrideFilter",
+        "path": "/log.syslogd3/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd3_override_setting": {
+        "class": "Syslogd3OverrideSetting",
+        "path": "/log.syslogd3/override-setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "use-management-vdom": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd3_setting": {
+        "class": "Syslogd3Setting",
+        "path": "/log.syslogd3/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd4_filter": {
+        "class": "Syslogd4Filter",
+        "path": "/log.syslogd4/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd4_override_filter": {
+        "class": "Syslogd4OverrideFilter",
+        "path": "/log.syslogd4/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd4_override_setting": {
+        "class": "Syslogd4OverrideSetting",
+        "path": "/log.syslogd4/override-setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "use-management-vdom": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd4_setting": {
+        "class": "Syslogd4Setting",
+        "path": "/log.syslogd4/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd_filter": {
+        "class": "SyslogdFilter",
+        "path": "/log.syslogd/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd_override_filter": {
+        "class": "SyslogdOverrideFilter",
+        "path": "/log.syslogd/override-filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "syslogd_override_setting": {
+        "class": "SyslogdOverrideSetting",
+        "path": "/log.syslogd/override-setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "use-management-vdom": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "syslogd_setting": {
+        "class": "SyslogdSetting",
+        "path": "/log.syslogd/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "mode": str,
+            "port": int,
+            "facility": str,
+            "source-ip-interface": str,
+            "source-ip": str,
+            "priority": str,
+            "max-log-rate": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "certificate": str,
+            "custom-field-name": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "tacacs_plus_accounting2_filter": {
+        "class": "TacacsPlusAccounting2Filter",
+        "path": "/log.tacacs+accounting2/filter",
+        "fields": {
+            "login-audit": str,
+            "config-change-audit": str,
+            "cli-cmd-audit": str,
+        },
+    },
+    "tacacs_plus_accounting2_setting": {
+        "class": "TacacsPlusAccounting2Setting",
+        "path": "/log.tacacs+accounting2/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "server-key": str,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "tacacs_plus_accounting3_filter": {
+        "class": "TacacsPlusAccounting3Filter",
+        "path": "/log.tacacs+accounting3/filter",
+        "fields": {
+            "login-audit": str,
+            "config-change-audit": str,
+            "cli-cmd-audit": str,
+        },
+    },
+    "tacacs_plus_accounting3_setting": {
+        "class": "TacacsPlusAccounting3Setting",
+        "path": "/log.tacacs+accounting3/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "server-key": str,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "tacacs_plus_accounting_filter": {
+        "class": "TacacsPlusAccountingFilter",
+        "path": "/log.tacacs+accounting/filter",
+        "fields": {
+            "login-audit": str,
+            "config-change-audit": str,
+            "cli-cmd-audit": str,
+        },
+    },
+    "tacacs_plus_accounting_setting": {
+        "class": "TacacsPlusAccountingSetting",
+        "path": "/log.tacacs+accounting/setting",
+        "fields": {
+            "status": str,
+            "server": str,
+            "server-key": str,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "threat_weight": {
+        "class": "ThreatWeight",
+        "path": "/log/threat-weight",
+        "fields": {
+            "status": str,
+            "level": list,
+            "blocked-connection": str,
+            "failed-connection": str,
+            "url-block-detected": str,
+            "botnet-connection-detected": str,
+            "malware": list,
+            "ips": list,
+            "web": list,
+            "geolocation": list,
+            "application": list,
+        },
+    },
+    "webtrends_filter": {
+        "class": "WebtrendsFilter",
+        "path": "/log.webtrends/filter",
+        "fields": {
+            "severity": str,
+            "forward-traffic": str,
+            "local-traffic": str,
+            "multicast-traffic": str,
+            "sniffer-traffic": str,
+            "ztna-traffic": str,
+            "http-transaction": str,
+            "anomaly": str,
+            "voip": str,
+            "forti-switch": str,
+            "debug": str,
+            "free-style": list,
+        },
+    },
+    "webtrends_setting": {
+        "class": "WebtrendsSetting",
+        "path": "/log.webtrends/setting",
+        "fields": {"status": str, "server": str},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
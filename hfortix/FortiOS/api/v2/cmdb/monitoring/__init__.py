@@ -1,9 +1,24 @@
 """FortiOS CMDB - Monitoring category"""
 
-from .npu_hpe import NpuHpe
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["NpuHpe"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "NpuHpe": "._registry",
+    },
+)
+
 
 class Monitoring:
     """
@@ -12,6 +27,8 @@ class Monitoring:
     This class provides access to all monitoring CMDB endpoints.
     """
 
+    npu_hpe: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("NpuHpe")
+
     def __init__(self, client):
         """
         Initialize Monitoring with all endpoint classes.
@@ -19,4 +36,4 @@ class Monitoring:
         Args:
             client: HTTPClient instance
         """
-        self.npu_hpe = NpuHpe(client)
+        self._client = client
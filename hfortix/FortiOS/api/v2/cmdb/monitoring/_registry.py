@@ -0,0 +1,13 @@
+"""FortiOS CMDB - Monitoring endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "npu_hpe": {
+        "class": "NpuHpe",
+        "path": "/monitoring/npu-hpe",
+        "fields": {"status": str, "interval": int, "multipliers": str},
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,10 +1,25 @@
 """FortiOS CMDB - Report category"""
 
-from .layout import Layout
-from .setting import Setting
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Layout", "Setting"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Layout": "._registry",
+        "Setting": "._registry",
+    },
+)
+
 
 class Report:
     """
@@ -13,6 +28,9 @@ class Report:
     This class provides access to all report CMDB endpoints.
     """
 
+    layout: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Layout")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+
     def __init__(self, client):
         """
         Initialize Report with all endpoint classes.
@@ -20,5 +38,4 @@ class Report:
         Args:
             client: HTTPClient instance
         """
-        self.layout = Layout(client)
-        self.setting = Setting(client)
+        self._client = client
@@ -0,0 +1,42 @@
+"""FortiOS CMDB - Report endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "layout": {
+        "class": "Layout",
+        "path": "/report/layout",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "title": str,
+            "subtitle": str,
+            "description": str,
+            "style-theme": str,
+            "options": str,
+            "schedule-type": str,
+            "day": str,
+            "time": str,
+            "cutoff-option": str,
+            "cutoff-time": str,
+            "email-send": str,
+            "email-recipients": str,
+            "max-pdf-report": int,
+            "page": list,
+            "body-item": list,
+        },
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/report/setting",
+        "fields": {
+            "pdf-report": str,
+            "fortiview": str,
+            "report-source": str,
+            "web-browsing-threshold": int,
+            "top-n": int,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
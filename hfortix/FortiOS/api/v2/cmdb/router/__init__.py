@@ -1,31 +1,14 @@
 """FortiOS CMDB - Router category"""
 
-from .access_list import AccessList
-from .access_list6 import AccessList6
-from .aspath_list import AspathList
-from .auth_path import AuthPath
-from .bfd import Bfd
-from .bfd6 import Bfd6
-from .bgp import Bgp
-from .community_list import CommunityList
-from .extcommunity_list import ExtcommunityList
-from .isis import Isis
-from .key_chain import KeyChain
-from .multicast import Multicast
-from .multicast6 import Multicast6
-from .multicast_flow import MulticastFlow
-from .ospf import Ospf
-from .ospf6 import Ospf6
-from .policy import Policy
-from .policy6 import Policy6
-from .prefix_list import PrefixList
-from .prefix_list6 import PrefixList6
-from .rip import Rip
-from .ripng import Ripng
-from .route_map import RouteMap
-from .setting import Setting
-from .static import Static
-from .static6 import Static6
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "AccessList",
@@ -56,6 +39,38 @@ __all__ = [
     "Static6",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AccessList": "._registry",
+        "AccessList6": "._registry",
+        "AspathList": "._registry",
+        "AuthPath": "._registry",
+        "Bfd": "._registry",
+        "Bfd6": "._registry",
+        "Bgp": "._registry",
+        "CommunityList": "._registry",
+        "ExtcommunityList": "._registry",
+        "Isis": "._registry",
+        "KeyChain": "._registry",
+        "Multicast": "._registry",
+        "Multicast6": "._registry",
+        "MulticastFlow": "._registry",
+        "Ospf": "._registry",
+        "Ospf6": "._registry",
+        "Policy": "._registry",
+        "Policy6": "._registry",
+        "PrefixList": "._registry",
+        "PrefixList6": "._registry",
+        "Rip": "._registry",
+        "Ripng": "._registry",
+        "RouteMap": "._registry",
+        "Setting": "._registry",
+        "Static": "._registry",
+        "Static6": "._registry",
+    },
+)
+
 
 class Router:
     """
@@ -64,6 +79,35 @@ class Router:
     This class provides access to all router CMDB endpoints.
     """
 
+    access_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AccessList")
+    access_list6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AccessList6")
+    aspath_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AspathList")
+    auth_path: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AuthPath")
+    bfd: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Bfd")
+    bfd6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Bfd6")
+    bgp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Bgp")
+    community_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("CommunityList")
+    extcommunity_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ExtcommunityList"
+    )
+    isis: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Isis")
+    key_chain: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("KeyChain")
+    multicast: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Multicast")
+    multicast6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Multicast6")
+    multicast_flow: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MulticastFlow")
+    ospf: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ospf")
+    ospf6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ospf6")
+    policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Policy")
+    policy6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Policy6")
+    prefix_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("PrefixList")
+    prefix_list6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("PrefixList6")
+    rip: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Rip")
+    ripng: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ripng")
+    route_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("RouteMap")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+    static: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Static")
+    static6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Static6")
+
     def __init__(self, client):
         """
         Initialize Router with all endpoint classes.
@@ -71,29 +115,4 @@ class Router:
         Args:
             client: HTTPClient instance
         """
-        self.access_list = AccessList(client)
-        self.access_list6 = AccessList6(client)
-        self.aspath_list = AspathList(client)
-        self.auth_path = AuthPath(client)
-        self.bfd = Bfd(client)
-        self.bfd6 = Bfd6(client)
-        self.bgp = Bgp(client)
-        self.community_list = CommunityList(client)
-        self.extcommunity_list = ExtcommunityList(client)
-        self.isis = Isis(client)
-        self.key_chain = KeyChain(client)
-        self.multicast = Multicast(client)
-        self.multicast6 = Multicast6(client)
-        self.multicast_flow = MulticastFlow(client)
-        self.ospf = Ospf(client)
-        self.ospf6 = Ospf6(client)
-        self.policy = Policy(client)
-        self.policy6 = Policy6(client)
-        self.prefix_list = PrefixList(client)
-        self.prefix_list6 = PrefixList6(client)
-        self.rip = Rip(client)
-        self.ripng = Ripng(client)
-        self.route_map = RouteMap(client)
-        self.setting = Setting(client)
-        self.static = Static(client)
-        self.static6 = Static6(client)
+        self._client = client
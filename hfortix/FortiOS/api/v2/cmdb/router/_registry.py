@@ -0,0 +1,458 @@
+"""FortiOS CMDB - Router endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "access_list": {
+        "class": "AccessList",
+        "path": "/router/access-list",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "access_list6": {
+        "class": "AccessList6",
+        "path": "/router/access-list6",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "aspath_list": {
+        "class": "AspathList",
+        "path": "/router/aspath-list",
+        "mkey": "name",
+        "fields": {"name": str, "rule": list},
+    },
+    "auth_path": {
+        "class": "AuthPath",
+        "path": "/router/auth-path",
+        "mkey": "name",
+        "fields": {"name": str, "device": str, "gateway": str},
+    },
+    "bfd": {
+        "class": "Bfd",
+        "path": "/router/bfd",
+        "fields": {"neighbor": list, "multihop-template": list},
+    },
+    "bfd6": {
+        "class": "Bfd6",
+        "path": "/router/bfd6",
+        "fields": {"neighbor": list, "multihop-template": list},
+    },
+    "bgp": {
+        "class": "Bgp",
+        "path": "/router/bgp",
+        "fields": {
+            "as": str,
+            "router-id": str,
+            "keepalive-timer": int,
+            "holdtime-timer": int,
+            "always-compare-med": str,
+            "bestpath-as-path-ignore": str,
+            "bestpath-cmp-confed-aspath": str,
+            "bestpath-cmp-routerid": str,
+            "bestpath-med-confed": str,
+            "bestpath-med-missing-as-worst": str,
+            "client-to-client-reflection": str,
+            "dampening": str,
+            "deterministic-med": str,
+            "ebgp-multipath": str,
+            "ibgp-multipath": str,
+            "enforce-first-as": str,
+            "fast-external-failover": str,
+            "log-neighbour-changes": str,
+            "network-import-check": str,
+            "ignore-optional-capability": str,
+            "additional-path": str,
+            "additional-path6": str,
+            "additional-path-vpnv4": str,
+            "additional-path-vpnv6": str,
+            "multipath-recursive-distance": str,
+            "recursive-next-hop": str,
+            "recursive-inherit-priority": str,
+            "tag-resolve-mode": str,
+            "cluster-id": str,
+            "confederation-identifier": int,
+            "confederation-peers": list,
+            "dampening-route-map": str,
+            "dampening-reachability-half-life": int,
+            "dampening-reuse": int,
+            "dampening-suppress": int,
+            "dampening-max-suppress-time": int,
+            "dampening-unreachability-half-life": int,
+            "default-local-preference": int,
+            "scan-time": int,
+            "distance-external": int,
+            "distance-internal": int,
+            "distance-local": int,
+            "synchronization": str,
+            "graceful-restart": str,
+            "graceful-restart-time": int,
+            "graceful-stalepath-time": int,
+            "graceful-update-delay": int,
+            "graceful-end-on-timer": str,
+            "additional-path-select": int,
+            "additional-path-select6": int,
+            "additional-path-select-vpnv4": int,
+            "additional-path-select-vpnv6": int,
+            "cross-family-conditional-adv": str,
+            "aggregate-address": list,
+            "aggregate-address6": list,
+            "neighbor": list,
+            "neighbor-group": list,
+            "neighbor-range": list,
+            "neighbor-range6": list,
+            "network": list,
+            "network6": list,
+            "redistribute": list,
+            "redistribute6": list,
+            "admin-distance": list,
+            "vrf": list,
+            "vrf6": list,
+        },
+    },
+    "community_list": {
+        "class": "CommunityList",
+        "path": "/router/community-list",
+        "mkey": "name",
+        "fields": {"name": str, "type": str, "rule": list},
+    },
+    "extcommunity_list": {
+        "class": "ExtcommunityList",
+        "path": "/router/extcommunity-list",
+        "mkey": "name",
+        "fields": {"name": str, "type": str, "rule": list},
+    },
+    "isis": {
+        "class": "Isis",
+        "path": "/router/isis",
+        "fields": {
+            "is-type": str,
+            "adv-passive-only": str,
+            "adv-passive-only6": str,
+            "auth-mode-l1": str,
+            "auth-mode-l2": str,
+            "auth-password-l1": str,
+            "auth-password-l2": str,
+            "auth-keychain-l1": str,
+            "auth-keychain-l2": str,
+            "auth-sendonly-l1": str,
+            "auth-sendonly-l2": str,
+            "ignore-lsp-errors": str,
+            "lsp-gen-interval-l1": int,
+            "lsp-gen-interval-l2": int,
+            "lsp-refresh-interval": int,
+            "max-lsp-lifetime": int,
+            "spf-interval-exp-l1": str,
+            "spf-interval-exp-l2": str,
+            "dynamic-hostname": str,
+            "adjacency-check": str,
+            "adjacency-check6": str,
+            "overload-bit": str,
+            "overload-bit-suppress": str,
+            "overload-bit-on-startup": int,
+            "default-originate": str,
+            "default-originate6": str,
+            "metric-style": str,
+            "redistribute-l1": str,
+            "redistribute-l1-list": str,
+            "redistribute-l2": str,
+            "redistribute-l2-list": str,
+            "redistribute6-l1": str,
+            "redistribute6-l1-list": str,
+            "redistribute6-l2": str,
+            "redistribute6-l2-list": str,
+            "isis-net": list,
+            "isis-interface": list,
+            "summary-address": list,
+            "summary-address6": list,
+            "redistribute": list,
+            "redistribute6": list,
+        },
+    },
+    "key_chain": {
+        "class": "KeyChain",
+        "path": "/router/key-chain",
+        "mkey": "name",
+        "fields": {"name": str},
+    },
+    "multicast": {
+        "class": "Multicast",
+        "path": "/router/multicast",
+        "fields": {
+            "route-threshold": int,
+            "route-limit": int,
+            "multicast-routing": str,
+            "pim-sm-global": list,
+            "pim-sm-global-vrf": list,
+            "interface": list,
+        },
+    },
+    "multicast6": {
+        "class": "Multicast6",
+        "path": "/router/multicast6",
+        "fields": {
+            "multicast-routing": str,
+            "multicast-pmtu": str,
+            "interface": list,
+            "pim-sm-global": list,
+        },
+    },
+    "multicast_flow": {
+        "class": "MulticastFlow",
+        "path": "/router/multicast-flow",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "flows": list},
+    },
+    "ospf": {
+        "class": "Ospf",
+        "path": "/router/osp",
+        "fields": {
+            "abr-type": str,
+            "auto-cost-ref-bandwidth": int,
+            "distance-external": int,
+            "distance-inter-area": int,
+            "distance-intra-area": int,
+            "database-overflow": str,
+            "database-overflow-max-lsas": int,
+            "database-overflow-time-to-recover": int,
+            "default-information-originate": str,
+            "default-information-metric": int,
+            "default-information-metric-type": str,
+            "default-information-route-map": str,
+            "default-metric": int,
+            "distance": int,
+            "lsa-refresh-interval": int,
+            "rfc1583-compatible": str,
+            "router-id": str,
+            "spf-timers": str,
+            "bfd": str,
+            "log-neighbour-changes": str,
+            "distribute-list-in": str,
+            "distribute-route-map-in": str,
+            "restart-mode": str,
+            "restart-period": int,
+            "restart-on-topology-change": str,
+            "area": list,
+            "ospf-interface": list,
+            "network": list,
+            "neighbor": list,
+            "passive-interface": list,
+            "summary-address": list,
+            "distribute-list": list,
+            "redistribute": list,
+        },
+    },
+    "ospf6": {
+        "class": "Ospf6",
+        "path": "/router/ospf6",
+        "fields": {
+            "abr-type": str,
+            "auto-cost-ref-bandwidth": int,
+            "default-information-originate": str,
+            "log-neighbour-changes": str,
+            "default-information-metric": int,
+            "default-information-metric-type": str,
+            "default-information-route-map": str,
+            "default-metric": int,
+            "router-id": str,
+            "spf-timers": str,
+            "bfd": str,
+            "restart-mode": str,
+            "restart-period": int,
+            "restart-on-topology-change": str,
+            "area": list,
+            "ospf6-interface": list,
+            "redistribute": list,
+            "passive-interface": list,
+            "summary-address": list,
+        },
+    },
+    "policy": {
+        "class": "Policy",
+        "path": "/router/policy",
+        "mkey": "seq-num",
+        "fields": {
+            "seq-num": int,
+            "input-device": list,
+            "input-device-negate": str,
+            "src": list,
+            "srcaddr": list,
+            "src-negate": str,
+            "dst": list,
+            "dstaddr": list,
+            "dst-negate": str,
+            "protocol": int,
+            "start-port": int,
+            "end-port": int,
+            "start-source-port": int,
+            "end-source-port": int,
+            "gateway": str,
+            "output-device": str,
+            "tos": str,
+            "tos-mask": str,
+            "status": str,
+            "comments": str,
+            "internet-service-id": list,
+            "internet-service-custom": list,
+            "internet-service-fortiguard": list,
+            "users": list,
+            "groups": list,
+        },
+    },
+    "policy6": {
+        "class": "Policy6",
+        "path": "/router/policy6",
+        "mkey": "seq-num",
+        "fields": {
+            "seq-num": int,
+            "input-device": list,
+            "input-device-negate": str,
+            "src": list,
+            "srcaddr": list,
+            "src-negate": str,
+            "dst": list,
+            "dstaddr": list,
+            "dst-negate": str,
+            "protocol": int,
+            "start-port": int,
+            "end-port": int,
+            "start-source-port": int,
+            "end-source-port": int,
+            "gateway": str,
+            "output-device": str,
+            "tos": str,
+            "tos-mask": str,
+            "status": str,
+            "comments": str,
+            "internet-service-id": list,
+            "internet-service-custom": list,
+            "internet-service-fortiguard": list,
+            "users": list,
+            "groups": list,
+        },
+    },
+    "prefix_list": {
+        "class": "PrefixList",
+        "path": "/router/prefix-list",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "prefix_list6": {
+        "class": "PrefixList6",
+        "path": "/router/prefix-list6",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "rip": {
+        "class": "Rip",
+        "path": "/router/rip",
+        "fields": {
+            "default-information-originate": str,
+            "default-metric": int,
+            "max-out-metric": int,
+            "distance": list,
+            "distribute-list": list,
+            "neighbor": list,
+            "network": list,
+            "offset-list": list,
+            "passive-interface": list,
+            "redistribute": list,
+            "update-timer": int,
+            "timeout-timer": int,
+            "garbage-timer": int,
+            "version": str,
+            "interface": list,
+        },
+    },
+    "ripng": {
+        "class": "Ripng",
+        "path": "/router/ripng",
+        "fields": {
+            "default-information-originate": str,
+            "default-metric": int,
+            "max-out-metric": int,
+            "distance": list,
+            "distribute-list": list,
+            "neighbor": list,
+            "network": list,
+            "aggregate-address": list,
+            "offset-list": list,
+            "passive-interface": list,
+            "redistribute": list,
+            "update-timer": int,
+            "timeout-timer": int,
+            "garbage-timer": int,
+            "interface": list,
+        },
+    },
+    "route_map": {
+        "class": "RouteMap",
+        "path": "/router/route-map",
+        "mkey": "name",
+        "fields": {"name": str, "comments": str, "rule": list},
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/router/setting",
+        "fields": {
+            "show-filter": str,
+            "hostname": str,
+            "kernel-route-distance": int,
+        },
+    },
+    "static": {
+        "class": "Static",
+        "path": "/router/static",
+        "mkey": "seq-num",
+        "fields": {
+            "seq-num": int,
+            "status": str,
+            "dst": str,
+            "src": str,
+            "gateway": str,
+            "preferred-source": str,
+            "distance": int,
+            "weight": int,
+            "priority": int,
+            "device": str,
+            "comment": str,
+            "blackhole": str,
+            "dynamic-gateway": str,
+            "sdwan-zone": list,
+            "dstaddr": str,
+            "internet-service": int,
+            "internet-service-custom": str,
+            "internet-service-fortiguard": str,
+            "link-monitor-exempt": str,
+            "tag": int,
+            "vrf": int,
+            "bfd": str,
+        },
+    },
+    "static6": {
+        "class": "Static6",
+        "path": "/router/static6",
+        "mkey": "seq-num",
+        "fields": {
+            "seq-num": int,
+            "status": str,
+            "dst": str,
+            "gateway": str,
+            "device": str,
+            "devindex": int,
+            "distance": int,
+            "weight": int,
+            "priority": int,
+            "comment": str,
+            "blackhole": str,
+            "dynamic-gateway": str,
+            "sdwan-zone": list,
+            "dstaddr": str,
+            "link-monitor-exempt": str,
+            "vrf": int,
+            "bfd": str,
+            "tag": int,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,12 +1,27 @@
 """FortiOS CMDB - Rule category"""
 
-from .fmwp import Fmwp
-from .iotd import Iotd
-from .otdt import Otdt
-from .otvp import Otvp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Fmwp", "Iotd", "Otdt", "Otvp"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Fmwp": "._registry",
+        "Iotd": "._registry",
+        "Otdt": "._registry",
+        "Otvp": "._registry",
+    },
+)
+
 
 class Rule:
     """
@@ -15,6 +30,11 @@ class Rule:
     This class provides access to all rule CMDB endpoints.
     """
 
+    fmwp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fmwp")
+    iotd: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Iotd")
+    otdt: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Otdt")
+    otvp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Otvp")
+
     def __init__(self, client):
         """
         Initialize Rule with all endpoint classes.
@@ -22,7 +42,4 @@ class Rule:
         Args:
             client: HTTPClient instance
         """
-        self.fmwp = Fmwp(client)
-        self.iotd = Iotd(client)
-        self.otdt = Otdt(client)
-        self.otvp = Otvp(client)
+        self._client = client
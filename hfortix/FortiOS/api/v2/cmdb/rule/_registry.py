@@ -0,0 +1,90 @@
+"""FortiOS CMDB - Rule endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "fmwp": {
+        "class": "Fmwp",
+        "path": "/rule/fmwp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "log": str,
+            "log-packet": str,
+            "group": str,
+            "severity": str,
+            "location": str,
+            "os": str,
+            "application": str,
+            "service": str,
+            "rule-id": int,
+            "rev": int,
+            "date": int,
+            "metadata": list,
+        },
+    },
+    "iotd": {
+        "class": "Iotd",
+        "path": "/rule/iotd",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "category": int,
+            "popularity": int,
+            "risk": int,
+            "weight": int,
+            "protocol": str,
+            "technology": str,
+            "behavior": str,
+            "vendor": str,
+            "parameters": list,
+            "metadata": list,
+            "status": str,
+        },
+    },
+    "otdt": {
+        "class": "Otdt",
+        "path": "/rule/otdt",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "category": int,
+            "popularity": int,
+            "risk": int,
+            "weight": int,
+            "protocol": str,
+            "technology": str,
+            "behavior": str,
+            "vendor": str,
+            "parameters": list,
+            "metadata": list,
+            "status": str,
+        },
+    },
+    "otvp": {
+        "class": "Otvp",
+        "path": "/rule/otvp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "log": str,
+            "log-packet": str,
+            "group": str,
+            "severity": str,
+            "location": str,
+            "os": str,
+            "application": str,
+            "service": str,
+            "rule-id": int,
+            "rev": int,
+            "date": int,
+            "metadata": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
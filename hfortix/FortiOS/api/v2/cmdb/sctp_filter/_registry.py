@@ -0,0 +1,14 @@
+"""FortiOS CMDB - Sctp Filter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/sctp-filter/profile",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "ppid-filters": list},
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -51,6 +51,8 @@ if TYPE_CHECKING:
 
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+from ...._helpers.projection import apply_projection, default_views
+
 
 class Eight02OneXSettings:
     """
@@ -69,6 +71,9 @@ class Eight02OneXSettings:
         - DELETE removes objects (404 if name doesn't exist)
     """
 
+    # View name -> fields returned by get(view=...)
+    views = default_views(None, {})
+
     def __init__(self, client: "IHTTPClient"):
         """
         Initialize Eight02OneXSettings endpoint.
@@ -120,6 +125,7 @@ class Eight02OneXSettings:
         if stat_items is not None:
             params["stat-items"] = stat_items
         params.update(kwargs)
+        apply_projection(params, self.views, {})
         return self._client.get(
             "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
         )
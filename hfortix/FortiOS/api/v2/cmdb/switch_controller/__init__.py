@@ -1,52 +1,14 @@
 """FortiOS CMDB - Switch-controller category"""
 
-from .acl_group import AclGroup
-from .acl_ingress import AclIngress
-from .auto_config_custom import AutoConfigCustom
-from .auto_config_default import AutoConfigDefault
-from .auto_config_policy import AutoConfigPolicy
-from .custom_command import CustomCommand
-from .dynamic_port_policy import DynamicPortPolicy
-from .flow_tracking import FlowTracking
-from .fortilink_settings import FortilinkSettings
-from .global_ import Global
-from .igmp_snooping import IgmpSnooping
-from .initial_config_template import InitialConfigTemplate
-from .initial_config_vlans import InitialConfigVlans
-from .ip_source_guard_log import IpSourceGuardLog
-from .lldp_profile import LldpProfile
-from .lldp_settings import LldpSettings
-from .location import Location
-from .mac_policy import MacPolicy
-from .managed_switch import ManagedSwitch
-from .network_monitor_settings import NetworkMonitorSettings
-from .ptp_interface_policy import PtpInterfacePolicy
-from .ptp_profile import PtpProfile
-from .qos_dot1p_map import QosDot1pMap
-from .qos_ip_dscp_map import QosIpDscpMap
-from .qos_qos_policy import QosQosPolicy
-from .qos_queue_policy import QosQueuePolicy
-from .remote_log import RemoteLog
-from .security_policy__802_1X import SecurityPolicyEight02OneX
-from .security_policy_local_access import SecurityPolicyLocalAccess
-from .sflow import Sflow
-from .snmp_community import SnmpCommunity
-from .snmp_sysinfo import SnmpSysinfo
-from .snmp_trap_threshold import SnmpTrapThreshold
-from .snmp_user import SnmpUser
-from .storm_control import StormControl
-from .storm_control_policy import StormControlPolicy
-from .stp_instance import StpInstance
-from .stp_settings import StpSettings
-from .switch_group import SwitchGroup
-from .switch_interface_tag import SwitchInterfaceTag
-from .switch_log import SwitchLog
-from .switch_profile import SwitchProfile
-from .system import System
-from .traffic_policy import TrafficPolicy
-from .traffic_sniffer import TrafficSniffer
-from .virtual_port_pool import VirtualPortPool
-from .vlan_policy import VlanPolicy
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "AclGroup",
@@ -98,6 +60,59 @@ __all__ = [
     "VlanPolicy",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AclGroup": "._registry",
+        "AclIngress": "._registry",
+        "AutoConfigCustom": "._registry",
+        "AutoConfigDefault": "._registry",
+        "AutoConfigPolicy": "._registry",
+        "CustomCommand": "._registry",
+        "DynamicPortPolicy": "._registry",
+        "FlowTracking": "._registry",
+        "FortilinkSettings": "._registry",
+        "Global": "._registry",
+        "IgmpSnooping": "._registry",
+        "InitialConfigTemplate": "._registry",
+        "InitialConfigVlans": "._registry",
+        "IpSourceGuardLog": "._registry",
+        "LldpProfile": "._registry",
+        "LldpSettings": "._registry",
+        "Location": "._registry",
+        "MacPolicy": "._registry",
+        "ManagedSwitch": "._registry",
+        "NetworkMonitorSettings": "._registry",
+        "PtpInterfacePolicy": "._registry",
+        "PtpProfile": "._registry",
+        "QosDot1pMap": "._registry",
+        "QosIpDscpMap": "._registry",
+        "QosQosPolicy": "._registry",
+        "QosQueuePolicy": "._registry",
+        "RemoteLog": "._registry",
+        "SecurityPolicyEight02OneX": "._registry",
+        "SecurityPolicyLocalAccess": "._registry",
+        "Sflow": "._registry",
+        "SnmpCommunity": "._registry",
+        "SnmpSysinfo": "._registry",
+        "SnmpTrapThreshold": "._registry",
+        "SnmpUser": "._registry",
+        "StormControl": "._registry",
+        "StormControlPolicy": "._registry",
+        "StpInstance": "._registry",
+        "StpSettings": "._registry",
+        "SwitchGroup": "._registry",
+        "SwitchInterfaceTag": "._registry",
+        "SwitchLog": "._registry",
+        "SwitchProfile": "._registry",
+        "System": "._registry",
+        "TrafficPolicy": "._registry",
+        "TrafficSniffer": "._registry",
+        "VirtualPortPool": "._registry",
+        "VlanPolicy": "._registry",
+    },
+)
+
 
 class SwitchController:
     """
@@ -106,6 +121,90 @@ class SwitchController:
     This class provides access to all switch-controller CMDB endpoints.
     """
 
+    acl_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AclGroup")
+    acl_ingress: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("AclIngress")
+    auto_config_custom: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AutoConfigCustom"
+    )
+    auto_config_default: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AutoConfigDefault"
+    )
+    auto_config_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AutoConfigPolicy"
+    )
+    custom_command: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("CustomCommand")
+    dynamic_port_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "DynamicPortPolicy"
+    )
+    flow_tracking: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FlowTracking")
+    fortilink_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FortilinkSettings"
+    )
+    global_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Global")
+    igmp_snooping: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("IgmpSnooping")
+    initial_config_template: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InitialConfigTemplate"
+    )
+    initial_config_vlans: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InitialConfigVlans"
+    )
+    ip_source_guard_log: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpSourceGuardLog"
+    )
+    lldp_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("LldpProfile")
+    lldp_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("LldpSettings")
+    location: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Location")
+    mac_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MacPolicy")
+    managed_switch: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ManagedSwitch")
+    network_monitor_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "NetworkMonitorSettings"
+    )
+    ptp_interface_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "PtpInterfacePolicy"
+    )
+    ptp_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("PtpProfile")
+    qos_dot1p_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("QosDot1pMap")
+    qos_ip_dscp_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("QosIpDscpMap")
+    qos_qos_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("QosQosPolicy")
+    qos_queue_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "QosQueuePolicy"
+    )
+    remote_log: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("RemoteLog")
+    security_policy__802_1x: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SecurityPolicyEight02OneX"
+    )
+    security_policy_local_access: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SecurityPolicyLocalAccess"
+    )
+    sflow: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Sflow")
+    snmp_community: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SnmpCommunity")
+    snmp_sysinfo: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SnmpSysinfo")
+    snmp_trap_threshold: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SnmpTrapThreshold"
+    )
+    snmp_user: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SnmpUser")
+    storm_control: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("StormControl")
+    storm_control_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "StormControlPolicy"
+    )
+    stp_instance: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("StpInstance")
+    stp_settings: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("StpSettings")
+    switch_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SwitchGroup")
+    switch_interface_tag: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SwitchInterfaceTag"
+    )
+    switch_log: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SwitchLog")
+    switch_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SwitchProfile")
+    system: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("System")
+    traffic_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("TrafficPolicy")
+    traffic_sniffer: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TrafficSniffer"
+    )
+    virtual_port_pool: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "VirtualPortPool"
+    )
+    vlan_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("VlanPolicy")
+
     def __init__(self, client):
         """
         Initialize SwitchController with all endpoint classes.
@@ -113,50 +212,4 @@ class SwitchController:
         Args:
             client: HTTPClient instance
         """
-        self.acl_group = AclGroup(client)
-        self.acl_ingress = AclIngress(client)
-        self.auto_config_custom = AutoConfigCustom(client)
-        self.auto_config_default = AutoConfigDefault(client)
-        self.auto_config_policy = AutoConfigPolicy(client)
-        self.custom_command = CustomCommand(client)
-        self.dynamic_port_policy = DynamicPortPolicy(client)
-        self.flow_tracking = FlowTracking(client)
-        self.fortilink_settings = FortilinkSettings(client)
-        self.global_ = Global(client)
-        self.igmp_snooping = IgmpSnooping(client)
-        self.initial_config_template = InitialConfigTemplate(client)
-        self.initial_config_vlans = InitialConfigVlans(client)
-        self.ip_source_guard_log = IpSourceGuardLog(client)
-        self.lldp_profile = LldpProfile(client)
-        self.lldp_settings = LldpSettings(client)
-        self.location = Location(client)
-        self.mac_policy = MacPolicy(client)
-        self.managed_switch = ManagedSwitch(client)
-        self.network_monitor_settings = NetworkMonitorSettings(client)
-        self.ptp_interface_policy = PtpInterfacePolicy(client)
-        self.ptp_profile = PtpProfile(client)
-        self.qos_dot1p_map = QosDot1pMap(client)
-        self.qos_ip_dscp_map = QosIpDscpMap(client)
-        self.qos_qos_policy = QosQosPolicy(client)
-        self.qos_queue_policy = QosQueuePolicy(client)
-        self.remote_log = RemoteLog(client)
-        self.security_policy__802_1x = SecurityPolicyEight02OneX(client)
-        self.security_policy_local_access = SecurityPolicyLocalAccess(client)
-        self.sflow = Sflow(client)
-        self.snmp_community = SnmpCommunity(client)
-        self.snmp_sysinfo = SnmpSysinfo(client)
-        self.snmp_trap_threshold = SnmpTrapThreshold(client)
-        self.snmp_user = SnmpUser(client)
-        self.storm_control = StormControl(client)
-        self.storm_control_policy = StormControlPolicy(client)
-        self.stp_instance = StpInstance(client)
-        self.stp_settings = StpSettings(client)
-        self.switch_group = SwitchGroup(client)
-        self.switch_interface_tag = SwitchInterfaceTag(client)
-        self.switch_log = SwitchLog(client)
-        self.switch_profile = SwitchProfile(client)
-        self.system = System(client)
-        self.traffic_policy = TrafficPolicy(client)
-        self.traffic_sniffer = TrafficSniffer(client)
-        self.virtual_port_pool = VirtualPortPool(client)
-        self.vlan_policy = VlanPolicy(client)
+        self._client = client
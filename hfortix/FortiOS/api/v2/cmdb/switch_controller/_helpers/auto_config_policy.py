@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_POE_STATUS = ["enable", "disable"]
@@ -16,200 +16,21 @@ VALID_BODY_IGMP_FLOOD_REPORT = ["enable", "disable"]
 VALID_BODY_IGMP_FLOOD_TRAFFIC = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_auto_config_policy_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_auto_config_policy_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating auto_config_policy.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate qos-policy if present
-    if "qos-policy" in payload:
-        value = payload.get("qos-policy")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "qos-policy cannot exceed 63 characters")
-
-    # Validate storm-control-policy if present
-    if "storm-control-policy" in payload:
-        value = payload.get("storm-control-policy")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "storm-control-policy cannot exceed 63 characters")
-
-    # Validate poe-status if present
-    if "poe-status" in payload:
-        value = payload.get("poe-status")
-        if value and value not in VALID_BODY_POE_STATUS:
-            return (
-                False,
-                f"Invalid poe-status '{value}'. Must be one of: {', '.join(VALID_BODY_POE_STATUS)}",
-            )
-
-    # Validate igmp-flood-report if present
-    if "igmp-flood-report" in payload:
-        value = payload.get("igmp-flood-report")
-        if value and value not in VALID_BODY_IGMP_FLOOD_REPORT:
-            return (
-                False,
-                f"Invalid igmp-flood-report '{value}'. Must be one of: {', '.join(VALID_BODY_IGMP_FLOOD_REPORT)}",
-            )
-
-    # Validate igmp-flood-traffic if present
-    if "igmp-flood-traffic" in payload:
-        value = payload.get("igmp-flood-traffic")
-        if value and value not in VALID_BODY_IGMP_FLOOD_TRAFFIC:
-            return (
-                False,
-                f"Invalid igmp-flood-traffic '{value}'. Must be one of: {', '.join(VALID_BODY_IGMP_FLOOD_TRAFFIC)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_auto_config_policy_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate qos-policy if present
-    if "qos-policy" in payload:
-        value = payload.get("qos-policy")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "qos-policy cannot exceed 63 characters")
-
-    # Validate storm-control-policy if present
-    if "storm-control-policy" in payload:
-        value = payload.get("storm-control-policy")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "storm-control-policy cannot exceed 63 characters")
-
-    # Validate poe-status if present
-    if "poe-status" in payload:
-        value = payload.get("poe-status")
-        if value and value not in VALID_BODY_POE_STATUS:
-            return (
-                False,
-                f"Invalid poe-status '{value}'. Must be one of: {', '.join(VALID_BODY_POE_STATUS)}",
-            )
-
-    # Validate igmp-flood-report if present
-    if "igmp-flood-report" in payload:
-        value = payload.get("igmp-flood-report")
-        if value and value not in VALID_BODY_IGMP_FLOOD_REPORT:
-            return (
-                False,
-                f"Invalid igmp-flood-report '{value}'. Must be one of: {', '.join(VALID_BODY_IGMP_FLOOD_REPORT)}",
-            )
-
-    # Validate igmp-flood-traffic if present
-    if "igmp-flood-traffic" in payload:
-        value = payload.get("igmp-flood-traffic")
-        if value and value not in VALID_BODY_IGMP_FLOOD_TRAFFIC:
-            return (
-                False,
-                f"Invalid igmp-flood-traffic '{value}'. Must be one of: {', '.join(VALID_BODY_IGMP_FLOOD_TRAFFIC)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_auto_config_policy_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "qos-policy": 63,
+        "storm-control-policy": 63,
+        "poe-status": VALID_BODY_POE_STATUS,
+        "igmp-flood-report": VALID_BODY_IGMP_FLOOD_REPORT,
+        "igmp-flood-traffic": VALID_BODY_IGMP_FLOOD_TRAFFIC,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_auto_config_policy_get = SCHEMA.get_validator()
+validate_auto_config_policy_post = SCHEMA.post_validator()
+validate_auto_config_policy_put = SCHEMA.put_validator("name")
+validate_auto_config_policy_delete = SCHEMA.delete_validator("name")
@@ -8,205 +8,27 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_LINK_DOWN_FLUSH = ["disable", "enable"]
 VALID_BODY_ACCESS_VLAN_MODE = ["legacy", "fail-open", "fail-close"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_fortilink_settings_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_fortilink_settings_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating fortilink_settings.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate fortilink if present
-    if "fortilink" in payload:
-        value = payload.get("fortilink")
-        if value and isinstance(value, str) and len(value) > 15:
-            return (False, "fortilink cannot exceed 15 characters")
-
-    # Validate inactive-timer if present
-    if "inactive-timer" in payload:
-        value = payload.get("inactive-timer")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 1440:
-                    return (
-                        False,
-                        "inactive-timer must be between 1 and 1440",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"inactive-timer must be numeric, got: {value}")
-
-    # Validate link-down-flush if present
-    if "link-down-flush" in payload:
-        value = payload.get("link-down-flush")
-        if value and value not in VALID_BODY_LINK_DOWN_FLUSH:
-            return (
-                False,
-                f"Invalid link-down-flush '{value}'. Must be one of: {', '.join(VALID_BODY_LINK_DOWN_FLUSH)}",
-            )
-
-    # Validate access-vlan-mode if present
-    if "access-vlan-mode" in payload:
-        value = payload.get("access-vlan-mode")
-        if value and value not in VALID_BODY_ACCESS_VLAN_MODE:
-            return (
-                False,
-                f"Invalid access-vlan-mode '{value}'. Must be one of: {', '.join(VALID_BODY_ACCESS_VLAN_MODE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_fortilink_settings_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate fortilink if present
-    if "fortilink" in payload:
-        value = payload.get("fortilink")
-        if value and isinstance(value, str) and len(value) > 15:
-            return (False, "fortilink cannot exceed 15 characters")
-
-    # Validate inactive-timer if present
-    if "inactive-timer" in payload:
-        value = payload.get("inactive-timer")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 1440:
-                    return (
-                        False,
-                        "inactive-timer must be between 1 and 1440",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"inactive-timer must be numeric, got: {value}")
-
-    # Validate link-down-flush if present
-    if "link-down-flush" in payload:
-        value = payload.get("link-down-flush")
-        if value and value not in VALID_BODY_LINK_DOWN_FLUSH:
-            return (
-                False,
-                f"Invalid link-down-flush '{value}'. Must be one of: {', '.join(VALID_BODY_LINK_DOWN_FLUSH)}",
-            )
-
-    # Validate access-vlan-mode if present
-    if "access-vlan-mode" in payload:
-        value = payload.get("access-vlan-mode")
-        if value and value not in VALID_BODY_ACCESS_VLAN_MODE:
-            return (
-                False,
-                f"Invalid access-vlan-mode '{value}'. Must be one of: {', '.join(VALID_BODY_ACCESS_VLAN_MODE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_fortilink_settings_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "fortilink": 15,
+        "inactive-timer": (1, 1440),
+        "link-down-flush": VALID_BODY_LINK_DOWN_FLUSH,
+        "access-vlan-mode": VALID_BODY_ACCESS_VLAN_MODE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_fortilink_settings_get = SCHEMA.get_validator()
+validate_fortilink_settings_post = SCHEMA.post_validator()
+validate_fortilink_settings_put = SCHEMA.put_validator("name")
+validate_fortilink_settings_delete = SCHEMA.delete_validator("name")
@@ -8,173 +8,24 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_ptp_interface_policy_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_ptp_interface_policy_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating ptp_interface_policy.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate description if present
-    if "description" in payload:
-        value = payload.get("description")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "description cannot exceed 63 characters")
-
-    # Validate vlan if present
-    if "vlan" in payload:
-        value = payload.get("vlan")
-        if value and isinstance(value, str) and len(value) > 15:
-            return (False, "vlan cannot exceed 15 characters")
-
-    # Validate vlan-pri if present
-    if "vlan-pri" in payload:
-        value = payload.get("vlan-pri")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 7:
-                    return (False, "vlan-pri must be between 0 and 7")
-            except (ValueError, TypeError):
-                return (False, f"vlan-pri must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_ptp_interface_policy_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate description if present
-    if "description" in payload:
-        value = payload.get("description")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "description cannot exceed 63 characters")
-
-    # Validate vlan if present
-    if "vlan" in payload:
-        value = payload.get("vlan")
-        if value and isinstance(value, str) and len(value) > 15:
-            return (False, "vlan cannot exceed 15 characters")
-
-    # Validate vlan-pri if present
-    if "vlan-pri" in payload:
-        value = payload.get("vlan-pri")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 7:
-                    return (False, "vlan-pri must be between 0 and 7")
-            except (ValueError, TypeError):
-                return (False, f"vlan-pri must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_ptp_interface_policy_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "description": 63,
+        "vlan": 15,
+        "vlan-pri": (0, 7),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_ptp_interface_policy_get = SCHEMA.get_validator()
+validate_ptp_interface_policy_post = SCHEMA.post_validator()
+validate_ptp_interface_policy_put = SCHEMA.put_validator("name")
+validate_ptp_interface_policy_delete = SCHEMA.delete_validator("name")
@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_LOGIN_PASSWD_OVERRIDE = ["enable", "disable"]
@@ -17,194 +17,20 @@ VALID_BODY_REVISION_BACKUP_ON_LOGOUT = ["enable", "disable"]
 VALID_BODY_REVISION_BACKUP_ON_UPGRADE = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_switch_profile_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_switch_profile_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating switch_profile.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate login-passwd-override if present
-    if "login-passwd-override" in payload:
-        value = payload.get("login-passwd-override")
-        if value and value not in VALID_BODY_LOGIN_PASSWD_OVERRIDE:
-            return (
-                False,
-                f"Invalid login-passwd-override '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN_PASSWD_OVERRIDE)}",
-            )
-
-    # Validate login if present
-    if "login" in payload:
-        value = payload.get("login")
-        if value and value not in VALID_BODY_LOGIN:
-            return (
-                False,
-                f"Invalid login '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN)}",
-            )
-
-    # Validate revision-backup-on-logout if present
-    if "revision-backup-on-logout" in payload:
-        value = payload.get("revision-backup-on-logout")
-        if value and value not in VALID_BODY_REVISION_BACKUP_ON_LOGOUT:
-            return (
-                False,
-                f"Invalid revision-backup-on-logout '{value}'. Must be one of: {', '.join(VALID_BODY_REVISION_BACKUP_ON_LOGOUT)}",
-            )
-
-    # Validate revision-backup-on-upgrade if present
-    if "revision-backup-on-upgrade" in payload:
-        value = payload.get("revision-backup-on-upgrade")
-        if value and value not in VALID_BODY_REVISION_BACKUP_ON_UPGRADE:
-            return (
-                False,
-                f"Invalid revision-backup-on-upgrade '{value}'. Must be one of: {', '.join(VALID_BODY_REVISION_BACKUP_ON_UPGRADE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_switch_profile_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate login-passwd-override if present
-    if "login-passwd-override" in payload:
-        value = payload.get("login-passwd-override")
-        if value and value not in VALID_BODY_LOGIN_PASSWD_OVERRIDE:
-            return (
-                False,
-                f"Invalid login-passwd-override '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN_PASSWD_OVERRIDE)}",
-            )
-
-    # Validate login if present
-    if "login" in payload:
-        value = payload.get("login")
-        if value and value not in VALID_BODY_LOGIN:
-            return (
-                False,
-                f"Invalid login '{value}'. Must be one of: {', '.join(VALID_BODY_LOGIN)}",
-            )
-
-    # Validate revision-backup-on-logout if present
-    if "revision-backup-on-logout" in payload:
-        value = payload.get("revision-backup-on-logout")
-        if value and value not in VALID_BODY_REVISION_BACKUP_ON_LOGOUT:
-            return (
-                False,
-                f"Invalid revision-backup-on-logout '{value}'. Must be one of: {', '.join(VALID_BODY_REVISION_BACKUP_ON_LOGOUT)}",
-            )
-
-    # Validate revision-backup-on-upgrade if present
-    if "revision-backup-on-upgrade" in payload:
-        value = payload.get("revision-backup-on-upgrade")
-        if value and value not in VALID_BODY_REVISION_BACKUP_ON_UPGRADE:
-            return (
-                False,
-                f"Invalid revision-backup-on-upgrade '{value}'. Must be one of: {', '.join(VALID_BODY_REVISION_BACKUP_ON_UPGRADE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_switch_profile_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "login-passwd-override": VALID_BODY_LOGIN_PASSWD_OVERRIDE,
+        "login": VALID_BODY_LOGIN,
+        "revision-backup-on-logout": VALID_BODY_REVISION_BACKUP_ON_LOGOUT,
+        "revision-backup-on-upgrade": VALID_BODY_REVISION_BACKUP_ON_UPGRADE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_switch_profile_get = SCHEMA.get_validator()
+validate_switch_profile_post = SCHEMA.post_validator()
+validate_switch_profile_put = SCHEMA.put_validator("name")
+validate_switch_profile_delete = SCHEMA.delete_validator("name")
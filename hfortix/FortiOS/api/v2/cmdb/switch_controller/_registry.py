@@ -0,0 +1,643 @@
+"""FortiOS CMDB - Switch Controller endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "acl_group": {
+        "class": "AclGroup",
+        "path": "/switch-controller.acl/group",
+        "mkey": "name",
+        "fields": {"name": str, "ingress": list},
+    },
+    "acl_ingress": {
+        "class": "AclIngress",
+        "path": "/switch-controller.acl/ingress",
+        "mkey": "id",
+        "fields": {"id": int, "description": str, "classifier": list},
+    },
+    "auto_config_custom": {
+        "class": "AutoConfigCustom",
+        "path": "/switch-controller.auto-config/custom",
+        "mkey": "name",
+        "fields": {"name": str, "switch-binding": list},
+    },
+    "auto_config_default": {
+        "class": "AutoConfigDefault",
+        "path": "/switch-controller.auto-config/default",
+        "fields": {"fgt-policy": str, "isl-policy": str, "icl-policy": str},
+    },
+    "auto_config_policy": {
+        "class": "AutoConfigPolicy",
+        "path": "/switch-controller.auto-config/policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "qos-policy": str,
+            "storm-control-policy": str,
+            "poe-status": str,
+            "igmp-flood-report": str,
+            "igmp-flood-traffic": str,
+        },
+    },
+    "custom_command": {
+        "class": "CustomCommand",
+        "path": "/switch-controller/custom-command",
+        "mkey": "command-name",
+        "fields": {"command-name": str, "description": str, "command": str},
+    },
+    "dynamic_port_policy": {
+        "class": "DynamicPortPolicy",
+        "path": "/switch-controller/dynamic-port-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "fortilink": str,
+            "policy": list,
+        },
+    },
+    "flow_tracking": {
+        "class": "FlowTracking",
+        "path": "/switch-controller/flow-tracking",
+        "fields": {
+            "sample-mode": str,
+            "sample-rate": int,
+            "collectors": list,
+            "level": str,
+            "max-export-pkt-size": int,
+            "template-export-period": int,
+            "timeout-general": int,
+            "timeout-icmp": int,
+            "timeout-max": int,
+            "timeout-tcp": int,
+            "timeout-tcp-fin": int,
+            "timeout-tcp-rst": int,
+            "timeout-udp": int,
+            "aggregates": list,
+        },
+    },
+    "fortilink_settings": {
+        "class": "FortilinkSettings",
+        "path": "/switch-controller/fortilink-settings",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "fortilink": str,
+            "inactive-timer": int,
+            "link-down-flush": str,
+            "access-vlan-mode": str,
+            "nac-ports": list,
+        },
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/switch-controller/global",
+        "fields": {
+            "mac-aging-interval": int,
+            "https-image-push": str,
+            "vlan-all-mode": str,
+            "vlan-optimization": str,
+            "vlan-identity": str,
+            "disable-discovery": list,
+            "mac-retention-period": int,
+            "default-virtual-switch-vlan": str,
+            "dhcp-server-access-list": str,
+            "dhcp-option82-format": str,
+            "dhcp-option82-circuit-id": str,
+            "dhcp-option82-remote-id": str,
+            "dhcp-snoop-client-req": str,
+            "dhcp-snoop-client-db-exp": int,
+            "dhcp-snoop-db-per-port-learn-limit": int,
+            "log-mac-limit-violations": str,
+            "mac-violation-timer": int,
+            "sn-dns-resolution": str,
+            "mac-event-logging": str,
+            "bounce-quarantined-link": str,
+            "quarantine-mode": str,
+            "update-user-device": str,
+            "custom-command": list,
+            "fips-enforce": str,
+            "firmware-provision-on-authorization": str,
+            "switch-on-deauth": str,
+            "firewall-auth-user-hold-period": int,
+        },
+    },
+    "igmp_snooping": {
+        "class": "IgmpSnooping",
+        "path": "/switch-controller/igmp-snooping",
+        "fields": {
+            "aging-time": int,
+            "flood-unknown-multicast": str,
+            "query-interval": int,
+        },
+    },
+    "initial_config_template": {
+        "class": "InitialConfigTemplate",
+        "path": "/switch-controller.initial-config/template",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vlanid": int,
+            "ip": str,
+            "allowaccess": str,
+            "auto-ip": str,
+            "dhcp-server": str,
+        },
+    },
+    "initial_config_vlans": {
+        "class": "InitialConfigVlans",
+        "path": "/switch-controller.initial-config/vlans",
+        "fields": {
+            "optional-vlans": str,
+            "default-vlan": str,
+            "quarantine": str,
+            "rspan": str,
+            "voice": str,
+            "video": str,
+            "nac": str,
+            "nac-segment": str,
+        },
+    },
+    "ip_source_guard_log": {
+        "class": "IpSourceGuardLog",
+        "path": "/switch-controller/ip-source-guard-log",
+        "fields": {"log-violations": str, "violation-timer": int},
+    },
+    "lldp_profile": {
+        "class": "LldpProfile",
+        "path": "/switch-controller/lldp-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "med-tlvs": str,
+            "802.1-tlvs": str,
+            "802.3-tlvs": str,
+            "auto-isl": str,
+            "auto-isl-hello-timer": int,
+            "auto-isl-receive-timeout": int,
+            "auto-isl-port-group": int,
+            "auto-mclag-icl": str,
+            "auto-isl-auth": str,
+            "auto-isl-auth-user": str,
+            "auto-isl-auth-identity": str,
+            "auto-isl-auth-reauth": int,
+            "auto-isl-auth-encrypt": str,
+            "auto-isl-auth-macsec-profile": str,
+            "med-network-policy": list,
+            "med-location-service": list,
+            "custom-tlvs": list,
+        },
+    },
+    "lldp_settings": {
+        "class": "LldpSettings",
+        "path": "/switch-controller/lldp-settings",
+        "fields": {
+            "tx-hold": int,
+            "tx-interval": int,
+            "fast-start-interval": int,
+            "management-interface": str,
+            "device-detection": str,
+        },
+    },
+    "location": {
+        "class": "Location",
+        "path": "/switch-controller/location",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "address-civic": list,
+            "coordinates": list,
+            "elin-number": list,
+        },
+    },
+    "mac_policy": {
+        "class": "MacPolicy",
+        "path": "/switch-controller/mac-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "fortilink": str,
+            "vlan": str,
+            "traffic-policy": str,
+            "bounce-port-link": str,
+            "bounce-port-duration": int,
+            "poe-reset": str,
+        },
+    },
+    "managed_switch": {
+        "class": "ManagedSwitch",
+        "path": "/switch-controller/managed-switch",
+        "mkey": "switch-id",
+        "fields": {
+            "switch-id": str,
+            "sn": str,
+            "description": str,
+            "switch-profile": str,
+            "access-profile": str,
+            "purdue-level": str,
+            "fsw-wan1-peer": str,
+            "fsw-wan1-admin": str,
+            "poe-pre-standard-detection": str,
+            "dhcp-server-access-list": str,
+            "poe-detection-type": int,
+            "max-poe-budget": int,
+            "directly-connected": int,
+            "version": int,
+            "max-allowed-trunk-members": int,
+            "pre-provisioned": int,
+            "l3-discovered": int,
+            "mgmt-mode": int,
+            "tunnel-discovered": int,
+            "tdr-supported": str,
+            "dynamic-capability": str,
+            "switch-device-tag": str,
+            "switch-dhcp_opt43_key": str,
+            "mclag-igmp-snooping-aware": str,
+            "dynamically-discovered": int,
+            "ptp-status": str,
+            "ptp-profile": str,
+            "radius-nas-ip-override": str,
+            "radius-nas-ip": str,
+            "route-offload": str,
+            "route-offload-mclag": str,
+            "route-offload-router": list,
+            "vlan": list,
+            "type": str,
+            "owner-vdom": str,
+            "flow-identity": str,
+            "staged-image-version": str,
+            "delayed-restart-trigger": int,
+            "firmware-provision": str,
+            "firmware-provision-version": str,
+            "firmware-provision-latest": str,
+            "ports": list,
+            "ip-source-guard": list,
+            "stp-settings": list,
+            "stp-instance": list,
+            "override-snmp-sysinfo": str,
+            "snmp-sysinfo": list,
+            "override-snmp-trap-threshold": str,
+            "snmp-trap-threshold": list,
+            "override-snmp-community": str,
+            "snmp-community": list,
+            "override-snmp-user": str,
+            "snmp-user": list,
+            "qos-drop-policy": str,
+            "qos-red-probability": int,
+            "switch-log": list,
+            "remote-log": list,
+            "storm-control": list,
+            "mirror": list,
+            "static-mac": list,
+            "custom-command": list,
+            "dhcp-snooping-static-client": list,
+            "igmp-snooping": list,
+            "802-1X-settings": list,
+            "router-vrf": list,
+            "system-interface": list,
+            "router-static": list,
+            "system-dhcp-server": list,
+        },
+    },
+    "network_monitor_settings": {
+        "class": "NetworkMonitorSettings",
+        "path": "/switch-controller/network-monitor-settings",
+        "fields": {"network-monitoring": str},
+    },
+    "ptp_interface_policy": {
+        "class": "PtpInterfacePolicy",
+        "path": "/switch-controller.ptp/interface-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "vlan": str,
+            "vlan-pri": int,
+        },
+    },
+    "ptp_profile": {
+        "class": "PtpProfile",
+        "path": "/switch-controller.ptp/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "mode": str,
+            "ptp-profile": str,
+            "transport": str,
+            "domain": int,
+            "pdelay-req-interval": str,
+        },
+    },
+    "qos_dot1p_map": {
+        "class": "QosDot1pMap",
+        "path": "/switch-controller.qos/dot1p-map",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "egress-pri-tagging": str,
+            "priority-0": str,
+            "priority-1": str,
+            "priority-2": str,
+            "priority-3": str,
+            "priority-4": str,
+            "priority-5": str,
+            "priority-6": str,
+            "priority-7": str,
+        },
+    },
+    "qos_ip_dscp_map": {
+        "class": "QosIpDscpMap",
+        "path": "/switch-controller.qos/ip-dscp-map",
+        "mkey": "name",
+        "fields": {"name": str, "description": str, "map": list},
+    },
+    "qos_qos_policy": {
+        "class": "QosQosPolicy",
+        "path": "/switch-controller.qos/qos-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "default-cos": int,
+            "trust-dot1p-map": str,
+            "trust-ip-dscp-map": str,
+            "queue-policy": str,
+        },
+    },
+    "qos_queue_policy": {
+        "class": "QosQueuePolicy",
+        "path": "/switch-controller.qos/queue-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "schedule": str,
+            "rate-by": str,
+            "cos-queue": list,
+        },
+    },
+    "remote_log": {
+        "class": "RemoteLog",
+        "path": "/switch-controller/remote-log",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "server": str,
+            "port": int,
+            "severity": str,
+            "csv": str,
+            "facility": str,
+        },
+    },
+    "security_policy__802_1X": {
+        "class": "SecurityPolicyEight02OneX",
+        "path": "/switch-controller.security-policy/802-1X",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "security-mode": str,
+            "user-group": list,
+            "mac-auth-bypass": str,
+            "auth-order": str,
+            "auth-priority": str,
+            "open-auth": str,
+            "eap-passthru": str,
+            "eap-auto-untagged-vlans": str,
+            "guest-vlan": str,
+            "guest-vlan-id": str,
+            "guest-auth-delay": int,
+            "auth-fail-vlan": str,
+            "auth-fail-vlan-id": str,
+            "framevid-apply": str,
+            "radius-timeout-overwrite": str,
+            "policy-type": str,
+            "authserver-timeout-period": int,
+            "authserver-timeout-vlan": str,
+            "authserver-timeout-vlanid": str,
+            "authserver-timeout-tagged": str,
+            "authserver-timeout-tagged-vlanid": str,
+            "dacl": str,
+        },
+    },
+    "security_policy_local_access": {
+        "class": "SecurityPolicyLocalAccess",
+        "path": "/switch-controller.security-policy/local-access",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "mgmt-allowaccess": str,
+            "internal-allowaccess": str,
+        },
+    },
+    "sflow": {
+        "class": "Sflow",
+        "path": "/switch-controller/sflow",
+        "fields": {"collector-ip": str, "collector-port": int},
+    },
+    "snmp_community": {
+        "class": "SnmpCommunity",
+        "path": "/switch-controller/snmp-community",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "name": str,
+            "status": str,
+            "hosts": list,
+            "query-v1-status": str,
+            "query-v1-port": int,
+            "query-v2c-status": str,
+            "query-v2c-port": int,
+            "trap-v1-status": str,
+            "trap-v1-lport": int,
+            "trap-v1-rport": int,
+            "trap-v2c-status": str,
+            "trap-v2c-lport": int,
+            "trap-v2c-rport": int,
+            "events": str,
+        },
+    },
+    "snmp_sysinfo": {
+        "class": "SnmpSysinfo",
+        "path": "/switch-controller/snmp-sysinfo",
+        "fields": {
+            "status": str,
+            "engine-id": str,
+            "description": str,
+            "contact-info": str,
+            "location": str,
+        },
+    },
+    "snmp_trap_threshold": {
+        "class": "SnmpTrapThreshold",
+        "path": "/switch-controller/snmp-trap-threshold",
+        "fields": {
+            "trap-high-cpu-threshold": int,
+            "trap-low-memory-threshold": int,
+            "trap-log-full-threshold": int,
+        },
+    },
+    "snmp_user": {
+        "class": "SnmpUser",
+        "path": "/switch-controller/snmp-user",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "queries": str,
+            "query-port": int,
+            "security-level": str,
+            "auth-proto": str,
+            "auth-pwd": str,
+            "priv-proto": str,
+            "priv-pwd": str,
+        },
+    },
+    "storm_control": {
+        "class": "StormControl",
+        "path": "/switch-controller/storm-control",
+        "fields": {
+            "rate": int,
+            "burst-size-level": int,
+            "unknown-unicast": str,
+            "unknown-multicast": str,
+            "broadcast": str,
+        },
+    },
+    "storm_control_policy": {
+        "class": "StormControlPolicy",
+        "path": "/switch-controller/storm-control-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "storm-control-mode": str,
+            "rate": int,
+            "burst-size-level": int,
+            "unknown-unicast": str,
+            "unknown-multicast": str,
+            "broadcast": str,
+        },
+    },
+    "stp_instance": {
+        "class": "StpInstance",
+        "path": "/switch-controller/stp-instance",
+        "mkey": "id",
+        "fields": {"id": str, "vlan-range": list},
+    },
+    "stp_settings": {
+        "class": "StpSettings",
+        "path": "/switch-controller/stp-settings",
+        "fields": {
+            "name": str,
+            "revision": int,
+            "hello-time": int,
+            "forward-time": int,
+            "max-age": int,
+            "max-hops": int,
+            "pending-timer": int,
+        },
+    },
+    "switch_group": {
+        "class": "SwitchGroup",
+        "path": "/switch-controller/switch-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "fortilink": str,
+            "members": list,
+        },
+    },
+    "switch_interface_tag": {
+        "class": "SwitchInterfaceTag",
+        "path": "/switch-controller/switch-interface-tag",
+        "mkey": "name",
+        "fields": {"name": str},
+    },
+    "switch_log": {
+        "class": "SwitchLog",
+        "path": "/switch-controller/switch-log",
+        "fields": {"status": str, "severity": str},
+    },
+    "switch_profile": {
+        "class": "SwitchProfile",
+        "path": "/switch-controller/switch-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "login-passwd-override": str,
+            "login-passwd": str,
+            "login": str,
+            "revision-backup-on-logout": str,
+            "revision-backup-on-upgrade": str,
+        },
+    },
+    "system": {
+        "class": "System",
+        "path": "/switch-controller/system",
+        "fields": {
+            "parallel-process-override": str,
+            "parallel-process": int,
+            "data-sync-interval": int,
+            "iot-weight-threshold": int,
+            "iot-scan-interval": int,
+            "iot-holdoff": int,
+            "iot-mac-idle": int,
+            "nac-periodic-interval": int,
+            "dynamic-periodic-interval": int,
+            "tunnel-mode": str,
+            "caputp-echo-interval": int,
+            "caputp-max-retransmit": int,
+        },
+    },
+    "traffic_policy": {
+        "class": "TrafficPolicy",
+        "path": "/switch-controller/traffic-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "policer-status": str,
+            "guaranteed-bandwidth": int,
+            "guaranteed-burst": int,
+            "maximum-burst": int,
+            "type": str,
+            "cos-queue": int,
+        },
+    },
+    "traffic_sniffer": {
+        "class": "TrafficSniffer",
+        "path": "/switch-controller/traffic-sniffer",
+        "fields": {
+            "mode": str,
+            "erspan-ip": str,
+            "target-mac": list,
+            "target-ip": list,
+            "target-port": list,
+        },
+    },
+    "virtual_port_pool": {
+        "class": "VirtualPortPool",
+        "path": "/switch-controller/virtual-port-pool",
+        "mkey": "name",
+        "fields": {"name": str, "description": str},
+    },
+    "vlan_policy": {
+        "class": "VlanPolicy",
+        "path": "/switch-controller/vlan-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "fortilink": str,
+            "vlan": str,
+            "allowed-vlans": list,
+            "untagged-vlans": list,
+            "allowed-vlans-all": str,
+            "discard-mode": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -47,10 +47,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
 
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+from ...._helpers.projection import apply_projection, default_views
+
 
 class ThreeGModemCustom:
     """
@@ -71,6 +73,9 @@ class ThreeGModemCustom:
         - DELETE removes objects (404 if name doesn't exist)
     """
 
+    # View name -> fields returned by get(view=...)
+    views = default_views("id", {})
+
     def __init__(self, client: "IHTTPClient"):
         """
         Initialize ThreeGModemCustom endpoint.
@@ -138,10 +143,69 @@ class ThreeGModemCustom:
         if search is not None:
             params["search"] = search
         params.update(kwargs)
+        apply_projection(params, self.views, {})
         return self._client.get(
             "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
         )
 
+    def iter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (sync mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of query parameters
+            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
+            **kwargs: Additional query parameters (filter, sort, format, etc.)
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+
+        Example:
+            >>> for item in fgt.api.cmdb.system._3g_modem_custom.iter():
+            ...     print(item)
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        return paginate(
+            self.get, page_size, payload_dict=payload_dict, vdom=vdom, **kwargs
+        )
+
+    def aiter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (async mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of query parameters
+            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
+            **kwargs: Additional query parameters (filter, sort, format, etc.)
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+
+        Example:
+            >>> async for item in fgt.api.cmdb.system._3g_modem_custom.aiter():
+            ...     print(item)
+        """
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        return apaginate(
+            self.get, page_size, payload_dict=payload_dict, vdom=vdom, **kwargs
+        )
+
     def put(
         self,
         id: str | None = None,
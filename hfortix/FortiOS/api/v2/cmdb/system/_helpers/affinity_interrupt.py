@@ -8,179 +8,24 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_affinity_interrupt_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_affinity_interrupt_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating affinity_interrupt.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate interrupt if present
-    if "interrupt" in payload:
-        value = payload.get("interrupt")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "interrupt cannot exceed 127 characters")
-
-    # Validate affinity-cpumask if present
-    if "affinity-cpumask" in payload:
-        value = payload.get("affinity-cpumask")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "affinity-cpumask cannot exceed 127 characters")
-
-    # Validate default-affinity-cpumask if present
-    if "default-affinity-cpumask" in payload:
-        value = payload.get("default-affinity-cpumask")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (
-                False,
-                "default-affinity-cpumask cannot exceed 127 characters",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_affinity_interrupt_put(
-    id: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        id: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # id is required for updates
-    if not id:
-        return (False, "id is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate interrupt if present
-    if "interrupt" in payload:
-        value = payload.get("interrupt")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "interrupt cannot exceed 127 characters")
-
-    # Validate affinity-cpumask if present
-    if "affinity-cpumask" in payload:
-        value = payload.get("affinity-cpumask")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "affinity-cpumask cannot exceed 127 characters")
-
-    # Validate default-affinity-cpumask if present
-    if "default-affinity-cpumask" in payload:
-        value = payload.get("default-affinity-cpumask")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (
-                False,
-                "default-affinity-cpumask cannot exceed 127 characters",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_affinity_interrupt_delete(
-    id: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        id: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not id:
-        return (False, "id is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "id": (0, 4294967295),
+        "interrupt": 127,
+        "affinity-cpumask": 127,
+        "default-affinity-cpumask": 127,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_affinity_interrupt_get = SCHEMA.get_validator()
+validate_affinity_interrupt_post = SCHEMA.post_validator()
+validate_affinity_interrupt_put = SCHEMA.put_validator("id")
+validate_affinity_interrupt_delete = SCHEMA.delete_validator("id")
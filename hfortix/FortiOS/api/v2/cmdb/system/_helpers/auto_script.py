@@ -8,246 +8,28 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_START = ["manual", "auto"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_auto_script_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_auto_script_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating auto_script.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate interval if present
-    if "interval" in payload:
-        value = payload.get("interval")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 31557600:
-                    return (False, "interval must be between 0 and 31557600")
-            except (ValueError, TypeError):
-                return (False, f"interval must be numeric, got: {value}")
-
-    # Validate repeat if present
-    if "repeat" in payload:
-        value = payload.get("repeat")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "repeat must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"repeat must be numeric, got: {value}")
-
-    # Validate start if present
-    if "start" in payload:
-        value = payload.get("start")
-        if value and value not in VALID_BODY_START:
-            return (
-                False,
-                f"Invalid start '{value}'. Must be one of: {', '.join(VALID_BODY_START)}",
-            )
-
-    # Validate script if present
-    if "script" in payload:
-        value = payload.get("script")
-        if value and isinstance(value, str) and len(value) > 1023:
-            return (False, "script cannot exceed 1023 characters")
-
-    # Validate output-size if present
-    if "output-size" in payload:
-        value = payload.get("output-size")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 10 or int_val > 1024:
-                    return (False, "output-size must be between 10 and 1024")
-            except (ValueError, TypeError):
-                return (False, f"output-size must be numeric, got: {value}")
-
-    # Validate timeout if present
-    if "timeout" in payload:
-        value = payload.get("timeout")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 300:
-                    return (False, "timeout must be between 0 and 300")
-            except (ValueError, TypeError):
-                return (False, f"timeout must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_auto_script_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate interval if present
-    if "interval" in payload:
-        value = payload.get("interval")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 31557600:
-                    return (False, "interval must be between 0 and 31557600")
-            except (ValueError, TypeError):
-                return (False, f"interval must be numeric, got: {value}")
-
-    # Validate repeat if present
-    if "repeat" in payload:
-        value = payload.get("repeat")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (False, "repeat must be between 0 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"repeat must be numeric, got: {value}")
-
-    # Validate start if present
-    if "start" in payload:
-        value = payload.get("start")
-        if value and value not in VALID_BODY_START:
-            return (
-                False,
-                f"Invalid start '{value}'. Must be one of: {', '.join(VALID_BODY_START)}",
-            )
-
-    # Validate script if present
-    if "script" in payload:
-        value = payload.get("script")
-        if value and isinstance(value, str) and len(value) > 1023:
-            return (False, "script cannot exceed 1023 characters")
-
-    # Validate output-size if present
-    if "output-size" in payload:
-        value = payload.get("output-size")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 10 or int_val > 1024:
-                    return (False, "output-size must be between 10 and 1024")
-            except (ValueError, TypeError):
-                return (False, f"output-size must be numeric, got: {value}")
-
-    # Validate timeout if present
-    if "timeout" in payload:
-        value = payload.get("timeout")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 300:
-                    return (False, "timeout must be between 0 and 300")
-            except (ValueError, TypeError):
-                return (False, f"timeout must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_auto_script_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "interval": (0, 31557600),
+        "repeat": (0, 65535),
+        "start": VALID_BODY_START,
+        "script": 1023,
+        "output-size": (10, 1024),
+        "timeout": (0, 300),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_auto_script_get = SCHEMA.get_validator()
+validate_auto_script_post = SCHEMA.post_validator()
+validate_auto_script_put = SCHEMA.put_validator("name")
+validate_auto_script_delete = SCHEMA.delete_validator("name")
@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = [
@@ -57,158 +57,24 @@ VALID_BODY_FAILURE_REASON = [
 ]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_device_upgrade_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_device_upgrade_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating device_upgrade.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate vdom if present
-    if "vdom" in payload:
-        value = payload.get("vdom")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (False, "vdom cannot exceed 31 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate ha-reboot-controller if present
-    if "ha-reboot-controller" in payload:
-        value = payload.get("ha-reboot-controller")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "ha-reboot-controller cannot exceed 79 characters")
-
-    # Validate next-path-index if present
-    if "next-path-index" in payload:
-        value = payload.get("next-path-index")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 10:
-                    return (False, "next-path-index must be between 0 and 10")
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"next-path-index must be numeric, got: {value}",
-                )
-
-    # Validate starter-admin if present
-    if "starter-admin" in payload:
-        value = payload.get("starter-admin")
-        if value and isinstance(value, str) and len(value) > 64:
-            return (False, "starter-admin cannot exceed 64 characters")
-
-    # Validate serial if present
-    if "serial" in payload:
-        value = payload.get("serial")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "serial cannot exceed 79 characters")
-
-    # Validate timing if present
-    if "timing" in payload:
-        value = payload.get("timing")
-        if value and value not in VALID_BODY_TIMING:
-            return (
-                False,
-                f"Invalid timing '{value}'. Must be one of: {', '.join(VALID_BODY_TIMING)}",
-            )
-
-    # Validate maximum-minutes if present
-    if "maximum-minutes" in payload:
-        value = payload.get("maximum-minutes")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 5 or int_val > 10080:
-                    return (
-                        False,
-                        "maximum-minutes must be between 5 and 10080",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"maximum-minutes must be numeric, got: {value}",
-                )
-
-    # Validate device-type if present
-    if "device-type" in payload:
-        value = payload.get("device-type")
-        if value and value not in VALID_BODY_DEVICE_TYPE:
-            return (
-                False,
-                f"Invalid device-type '{value}'. Must be one of: {', '.join(VALID_BODY_DEVICE_TYPE)}",
-            )
-
-    # Validate allow-download if present
-    if "allow-download" in payload:
-        value = payload.get("allow-download")
-        if value and value not in VALID_BODY_ALLOW_DOWNLOAD:
-            return (
-                False,
-                f"Invalid allow-download '{value}'. Must be one of: {', '.join(VALID_BODY_ALLOW_DOWNLOAD)}",
-            )
-
-    # Validate failure-reason if present
-    if "failure-reason" in payload:
-        value = payload.get("failure-reason")
-        if value and value not in VALID_BODY_FAILURE_REASON:
-            return (
-                False,
-                f"Invalid failure-reason '{value}'. Must be one of: {', '.join(VALID_BODY_FAILURE_REASON)}",
-            )
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "vdom": 31,
+        "status": VALID_BODY_STATUS,
+        "ha-reboot-controller": 79,
+        "next-path-index": (0, 10),
+        "starter-admin": 64,
+        "serial": 79,
+        "timing": VALID_BODY_TIMING,
+        "maximum-minutes": (5, 10080),
+        "device-type": VALID_BODY_DEVICE_TYPE,
+        "allow-download": VALID_BODY_ALLOW_DOWNLOAD,
+        "failure-reason": VALID_BODY_FAILURE_REASON,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_device_upgrade_get = SCHEMA.get_validator()
+validate_device_upgrade_post = SCHEMA.post_validator()
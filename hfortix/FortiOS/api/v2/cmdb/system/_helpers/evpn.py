@@ -8,183 +8,26 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_IP_LOCAL_LEARNING = ["enable", "disable"]
 VALID_BODY_ARP_SUPPRESSION = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_evpn_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_evpn_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating evpn.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 65535:
-                    return (False, "id must be between 1 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate rd if present
-    if "rd" in payload:
-        value = payload.get("rd")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "rd cannot exceed 79 characters")
-
-    # Validate ip-local-learning if present
-    if "ip-local-learning" in payload:
-        value = payload.get("ip-local-learning")
-        if value and value not in VALID_BODY_IP_LOCAL_LEARNING:
-            return (
-                False,
-                f"Invalid ip-local-learning '{value}'. Must be one of: {', '.join(VALID_BODY_IP_LOCAL_LEARNING)}",
-            )
-
-    # Validate arp-suppression if present
-    if "arp-suppression" in payload:
-        value = payload.get("arp-suppression")
-        if value and value not in VALID_BODY_ARP_SUPPRESSION:
-            return (
-                False,
-                f"Invalid arp-suppression '{value}'. Must be one of: {', '.join(VALID_BODY_ARP_SUPPRESSION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_evpn_put(
-    id: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        id: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # id is required for updates
-    if not id:
-        return (False, "id is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 65535:
-                    return (False, "id must be between 1 and 65535")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate rd if present
-    if "rd" in payload:
-        value = payload.get("rd")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "rd cannot exceed 79 characters")
-
-    # Validate ip-local-learning if present
-    if "ip-local-learning" in payload:
-        value = payload.get("ip-local-learning")
-        if value and value not in VALID_BODY_IP_LOCAL_LEARNING:
-            return (
-                False,
-                f"Invalid ip-local-learning '{value}'. Must be one of: {', '.join(VALID_BODY_IP_LOCAL_LEARNING)}",
-            )
-
-    # Validate arp-suppression if present
-    if "arp-suppression" in payload:
-        value = payload.get("arp-suppression")
-        if value and value not in VALID_BODY_ARP_SUPPRESSION:
-            return (
-                False,
-                f"Invalid arp-suppression '{value}'. Must be one of: {', '.join(VALID_BODY_ARP_SUPPRESSION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_evpn_delete(id: str | None = None) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        id: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not id:
-        return (False, "id is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "id": (1, 65535),
+        "rd": 79,
+        "ip-local-learning": VALID_BODY_IP_LOCAL_LEARNING,
+        "arp-suppression": VALID_BODY_ARP_SUPPRESSION,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_evpn_get = SCHEMA.get_validator()
+validate_evpn_post = SCHEMA.post_validator()
+validate_evpn_put = SCHEMA.put_validator("id")
+validate_evpn_delete = SCHEMA.delete_validator("id")
@@ -8,165 +8,25 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_DISPLAY_REPORT = ["enable", "disable"]
 VALID_BODY_DISPLAY_INSIGHT = ["enable", "disable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_security_rating_controls_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_security_rating_controls_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating security_rating_controls.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate display-report if present
-    if "display-report" in payload:
-        value = payload.get("display-report")
-        if value and value not in VALID_BODY_DISPLAY_REPORT:
-            return (
-                False,
-                f"Invalid display-report '{value}'. Must be one of: {', '.join(VALID_BODY_DISPLAY_REPORT)}",
-            )
-
-    # Validate display-insight if present
-    if "display-insight" in payload:
-        value = payload.get("display-insight")
-        if value and value not in VALID_BODY_DISPLAY_INSIGHT:
-            return (
-                False,
-                f"Invalid display-insight '{value}'. Must be one of: {', '.join(VALID_BODY_DISPLAY_INSIGHT)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_security_rating_controls_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate display-report if present
-    if "display-report" in payload:
-        value = payload.get("display-report")
-        if value and value not in VALID_BODY_DISPLAY_REPORT:
-            return (
-                False,
-                f"Invalid display-report '{value}'. Must be one of: {', '.join(VALID_BODY_DISPLAY_REPORT)}",
-            )
-
-    # Validate display-insight if present
-    if "display-insight" in payload:
-        value = payload.get("display-insight")
-        if value and value not in VALID_BODY_DISPLAY_INSIGHT:
-            return (
-                False,
-                f"Invalid display-insight '{value}'. Must be one of: {', '.join(VALID_BODY_DISPLAY_INSIGHT)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_security_rating_controls_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "display-report": VALID_BODY_DISPLAY_REPORT,
+        "display-insight": VALID_BODY_DISPLAY_INSIGHT,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_security_rating_controls_get = SCHEMA.get_validator()
+validate_security_rating_controls_post = SCHEMA.post_validator()
+validate_security_rating_controls_put = SCHEMA.put_validator("name")
+validate_security_rating_controls_delete = SCHEMA.delete_validator("name")
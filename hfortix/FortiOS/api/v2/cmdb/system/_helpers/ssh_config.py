@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_SSH_KEX_ALGO = [
@@ -73,107 +73,18 @@ VALID_BODY_SSH_HSK_ALGO = [
 VALID_BODY_SSH_HSK_OVERRIDE = ["disable", "enable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_ssh_config_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_ssh_config_put(
-    payload: dict[str, Any] | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate ssh-kex-algo if present
-    if "ssh-kex-algo" in payload:
-        value = payload.get("ssh-kex-algo")
-        if value and value not in VALID_BODY_SSH_KEX_ALGO:
-            return (
-                False,
-                f"Invalid ssh-kex-algo '{value}'. Must be one of: {', '.join(VALID_BODY_SSH_KEX_ALGO)}",
-            )
-
-    # Validate ssh-enc-algo if present
-    if "ssh-enc-algo" in payload:
-        value = payload.get("ssh-enc-algo")
-        if value and value not in VALID_BODY_SSH_ENC_ALGO:
-            return (
-                False,
-                f"Invalid ssh-enc-algo '{value}'. Must be one of: {', '.join(VALID_BODY_SSH_ENC_ALGO)}",
-            )
-
-    # Validate ssh-mac-algo if present
-    if "ssh-mac-algo" in payload:
-        value = payload.get("ssh-mac-algo")
-        if value and value not in VALID_BODY_SSH_MAC_ALGO:
-            return (
-                False,
-                f"Invalid ssh-mac-algo '{value}'. Must be one of: {', '.join(VALID_BODY_SSH_MAC_ALGO)}",
-            )
-
-    # Validate ssh-hsk-algo if present
-    if "ssh-hsk-algo" in payload:
-        value = payload.get("ssh-hsk-algo")
-        if value and value not in VALID_BODY_SSH_HSK_ALGO:
-            return (
-                False,
-                f"Invalid ssh-hsk-algo '{value}'. Must be one of: {', '.join(VALID_BODY_SSH_HSK_ALGO)}",
-            )
-
-    # Validate ssh-hsk-override if present
-    if "ssh-hsk-override" in payload:
-        value = payload.get("ssh-hsk-override")
-        if value and value not in VALID_BODY_SSH_HSK_OVERRIDE:
-            return (
-                False,
-                f"Invalid ssh-hsk-override '{value}'. Must be one of: {', '.join(VALID_BODY_SSH_HSK_OVERRIDE)}",
-            )
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "ssh-kex-algo": VALID_BODY_SSH_KEX_ALGO,
+        "ssh-enc-algo": VALID_BODY_SSH_ENC_ALGO,
+        "ssh-mac-algo": VALID_BODY_SSH_MAC_ALGO,
+        "ssh-hsk-algo": VALID_BODY_SSH_HSK_ALGO,
+        "ssh-hsk-override": VALID_BODY_SSH_HSK_OVERRIDE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_ssh_config_get = SCHEMA.get_validator()
+validate_ssh_config_put = SCHEMA.put_validator()
@@ -8,231 +8,29 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = ["enable", "disable"]
 VALID_BODY_MEDIA_STATUS = ["enable", "disable", "fail"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_storage_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_storage_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating storage.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate media-status if present
-    if "media-status" in payload:
-        value = payload.get("media-status")
-        if value and value not in VALID_BODY_MEDIA_STATUS:
-            return (
-                False,
-                f"Invalid media-status '{value}'. Must be one of: {', '.join(VALID_BODY_MEDIA_STATUS)}",
-            )
-
-    # Validate order if present
-    if "order" in payload:
-        value = payload.get("order")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "order must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"order must be numeric, got: {value}")
-
-    # Validate partition if present
-    if "partition" in payload:
-        value = payload.get("partition")
-        if value and isinstance(value, str) and len(value) > 16:
-            return (False, "partition cannot exceed 16 characters")
-
-    # Validate device if present
-    if "device" in payload:
-        value = payload.get("device")
-        if value and isinstance(value, str) and len(value) > 19:
-            return (False, "device cannot exceed 19 characters")
-
-    # Validate size if present
-    if "size" in payload:
-        value = payload.get("size")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "size must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"size must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_storage_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate media-status if present
-    if "media-status" in payload:
-        value = payload.get("media-status")
-        if value and value not in VALID_BODY_MEDIA_STATUS:
-            return (
-                False,
-                f"Invalid media-status '{value}'. Must be one of: {', '.join(VALID_BODY_MEDIA_STATUS)}",
-            )
-
-    # Validate order if present
-    if "order" in payload:
-        value = payload.get("order")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 255:
-                    return (False, "order must be between 0 and 255")
-            except (ValueError, TypeError):
-                return (False, f"order must be numeric, got: {value}")
-
-    # Validate partition if present
-    if "partition" in payload:
-        value = payload.get("partition")
-        if value and isinstance(value, str) and len(value) > 16:
-            return (False, "partition cannot exceed 16 characters")
-
-    # Validate device if present
-    if "device" in payload:
-        value = payload.get("device")
-        if value and isinstance(value, str) and len(value) > 19:
-            return (False, "device cannot exceed 19 characters")
-
-    # Validate size if present
-    if "size" in payload:
-        value = payload.get("size")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "size must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"size must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_storage_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "status": VALID_BODY_STATUS,
+        "media-status": VALID_BODY_MEDIA_STATUS,
+        "order": (0, 255),
+        "partition": 16,
+        "device": 19,
+        "size": (0, 4294967295),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_storage_get = SCHEMA.get_validator()
+validate_storage_post = SCHEMA.post_validator()
+validate_storage_put = SCHEMA.put_validator("name")
+validate_storage_delete = SCHEMA.delete_validator("name")
@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_OBJECT = [
@@ -40,168 +40,18 @@ VALID_BODY_OBJECT = [
 VALID_BODY_SCOPE = ["all", "inclusive", "exclusive"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_vdom_exception_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_vdom_exception_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating vdom_exception.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 4096:
-                    return (False, "id must be between 1 and 4096")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate object if present
-    if "object" in payload:
-        value = payload.get("object")
-        if value and value not in VALID_BODY_OBJECT:
-            return (
-                False,
-                f"Invalid object '{value}'. Must be one of: {', '.join(VALID_BODY_OBJECT)}",
-            )
-
-    # Validate scope if present
-    if "scope" in payload:
-        value = payload.get("scope")
-        if value and value not in VALID_BODY_SCOPE:
-            return (
-                False,
-                f"Invalid scope '{value}'. Must be one of: {', '.join(VALID_BODY_SCOPE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_vdom_exception_put(
-    id: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        id: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # id is required for updates
-    if not id:
-        return (False, "id is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 1 or int_val > 4096:
-                    return (False, "id must be between 1 and 4096")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate object if present
-    if "object" in payload:
-        value = payload.get("object")
-        if value and value not in VALID_BODY_OBJECT:
-            return (
-                False,
-                f"Invalid object '{value}'. Must be one of: {', '.join(VALID_BODY_OBJECT)}",
-            )
-
-    # Validate scope if present
-    if "scope" in payload:
-        value = payload.get("scope")
-        if value and value not in VALID_BODY_SCOPE:
-            return (
-                False,
-                f"Invalid scope '{value}'. Must be one of: {', '.join(VALID_BODY_SCOPE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_vdom_exception_delete(
-    id: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        id: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not id:
-        return (False, "id is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "id": (1, 4096),
+        "object": VALID_BODY_OBJECT,
+        "scope": VALID_BODY_SCOPE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_vdom_exception_get = SCHEMA.get_validator()
+validate_vdom_exception_post = SCHEMA.post_validator()
+validate_vdom_exception_put = SCHEMA.put_validator("id")
+validate_vdom_exception_delete = SCHEMA.delete_validator("id")
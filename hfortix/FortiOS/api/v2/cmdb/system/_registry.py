@@ -0,0 +1,2870 @@
+"""FortiOS CMDB - System endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "accprofile": {
+        "class": "Accprofile",
+        "path": "/system/accprofile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comments": str,
+            "secfabgrp": str,
+            "ftviewgrp": str,
+            "authgrp": str,
+            "sysgrp": str,
+            "netgrp": str,
+            "loggrp": str,
+            "fwgrp": str,
+            "vpngrp": str,
+            "utmgrp": str,
+            "wifi": str,
+            "netgrp-permission": list,
+            "sysgrp-permission": list,
+            "fwgrp-permission": list,
+            "loggrp-permission": list,
+            "utmgrp-permission": list,
+            "secfabgrp-permission": list,
+            "admintimeout-override": str,
+            "admintimeout": int,
+            "cli-diagnose": str,
+            "cli-get": str,
+            "cli-show": str,
+            "cli-exec": str,
+            "cli-config": str,
+            "system-execute-ssh": str,
+            "system-execute-telnet": str,
+        },
+    },
+    "acme": {
+        "class": "Acme",
+        "path": "/system/acme",
+        "fields": {
+            "interface": list,
+            "use-ha-direct": str,
+            "source-ip": str,
+            "source-ip6": str,
+            "accounts": list,
+            "acc-details": str,
+            "status": str,
+        },
+    },
+    "admin": {
+        "class": "Admin",
+        "path": "/system/admin",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "remote-auth": str,
+            "remote-group": str,
+            "wildcard": str,
+            "password": str,
+            "peer-auth": str,
+            "peer-group": str,
+            "trusthost1": str,
+            "trusthost2": str,
+            "trusthost3": str,
+            "trusthost4": str,
+            "trusthost5": str,
+            "trusthost6": str,
+            "trusthost7": str,
+            "trusthost8": str,
+            "trusthost9": str,
+            "trusthost10": str,
+            "ip6-trusthost1": str,
+            "ip6-trusthost2": str,
+            "ip6-trusthost3": str,
+            "ip6-trusthost4": str,
+            "ip6-trusthost5": str,
+            "ip6-trusthost6": str,
+            "ip6-trusthost7": str,
+            "ip6-trusthost8": str,
+            "ip6-trusthost9": str,
+            "ip6-trusthost10": str,
+            "accprofile": str,
+            "allow-remove-admin-session": str,
+            "comments": str,
+            "ssh-public-key1": str,
+            "ssh-public-key2": str,
+            "ssh-public-key3": str,
+            "ssh-certificate": str,
+            "schedule": str,
+            "accprofile-override": str,
+            "vdom-override": str,
+            "password-expire": str,
+            "force-password-change": str,
+            "two-factor": str,
+            "two-factor-authentication": str,
+            "two-factor-notification": str,
+            "fortitoken": str,
+            "email-to": str,
+            "sms-server": str,
+            "sms-custom-server": str,
+            "sms-phone": str,
+            "guest-auth": str,
+            "guest-usergroups": list,
+            "guest-lang": str,
+            "status": str,
+            "list": str,
+        },
+    },
+    "affinity_interrupt": {
+        "class": "AffinityInterrupt",
+        "path": "/system/affinity-interrupt",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "interrupt": str,
+            "affinity-cpumask": str,
+            "default-affinity-cpumask": str,
+        },
+    },
+    "affinity_packet_redistribution": {
+        "class": "AffinityPacketRedistribution",
+        "path": "/system/affinity-packet-redistribution",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "interface": str,
+            "rxqid": int,
+            "round-robin": str,
+            "affinity-cpumask": str,
+        },
+    },
+    "alarm": {
+        "class": "Alarm",
+        "path": "/system/alarm",
+        "fields": {"status": str, "audible": str, "groups": list},
+    },
+    "alias": {
+        "class": "Alias",
+        "path": "/system/alias",
+        "mkey": "name",
+        "fields": {"name": str, "command": str},
+    },
+    "api_user": {
+        "class": "ApiUser",
+        "path": "/system/api-user",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comments": str,
+            "api-key": str,
+            "accprofile": str,
+            "schedule": str,
+            "cors-allow-origin": str,
+            "peer-auth": str,
+            "peer-group": str,
+            "trusthost": list,
+        },
+    },
+    "arp_table": {
+        "class": "ArpTable",
+        "path": "/system/arp-table",
+        "mkey": "id",
+        "fields": {"id": int, "interface": str, "ip": str, "mac": str},
+    },
+    "auto_install": {
+        "class": "AutoInstall",
+        "path": "/system/auto-install",
+        "fields": {
+            "auto-install-config": str,
+            "auto-install-image": str,
+            "default-config-file": str,
+            "default-image-file": str,
+        },
+    },
+    "auto_script": {
+        "class": "AutoScript",
+        "path": "/system/auto-script",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interval": int,
+            "repeat": int,
+            "script": str,
+            "output-size": int,
+            "timeout": int,
+        },
+    },
+    "automation_action": {
+        "class": "AutomationAction",
+        "path": "/system/automation-action",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "action-type": str,
+            "system-action": str,
+            "tls-certificate": str,
+            "forticare-email": str,
+            "email-to": list,
+            "email-from": str,
+            "email-subject": str,
+            "minimum-interval": int,
+            "aws-api-key": str,
+            "azure-function-authorization": str,
+            "azure-api-key": str,
+            "alicloud-function-authorization": str,
+            "alicloud-access-key-id": str,
+            "alicloud-access-key-secret": str,
+            "message-type": str,
+            "message": str,
+            "replacement-message": str,
+            "replacemsg-group": str,
+            "protocol": str,
+            "method": str,
+            "uri": str,
+            "http-body": str,
+            "port": int,
+            "http-headers": list,
+            "form-data": list,
+            "verify-host-cert": str,
+            "script": str,
+            "output-size": int,
+            "timeout": int,
+            "duration": int,
+            "output-interval": int,
+            "file-only": str,
+            "execute-security-fabric": str,
+            "accprofile": str,
+            "regular-expression": str,
+            "log-debug-print": str,
+            "security-tag": str,
+            "sdn-connector": list,
+        },
+    },
+    "automation_condition": {
+        "class": "AutomationCondition",
+        "path": "/system/automation-condition",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "condition-type": str,
+            "cpu-usage-percent": int,
+            "mem-usage-percent": int,
+            "vpn-tunnel-name": str,
+            "vpn-tunnel-state": str,
+        },
+    },
+    "automation_destination": {
+        "class": "AutomationDestination",
+        "path": "/system/automation-destination",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "destination": list,
+            "ha-group-id": int,
+        },
+    },
+    "automation_stitch": {
+        "class": "AutomationStitch",
+        "path": "/system/automation-stitch",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "status": str,
+            "trigger": str,
+            "condition": list,
+            "condition-logic": str,
+            "actions": list,
+            "destination": list,
+        },
+    },
+    "automation_trigger": {
+        "class": "AutomationTrigger",
+        "path": "/system/automation-trigger",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "trigger-type": str,
+            "event-type": str,
+            "license-type": str,
+            "report-type": str,
+            "stitch-name": str,
+            "logid": list,
+            "trigger-frequency": str,
+            "trigger-weekday": str,
+            "trigger-day": int,
+            "trigger-hour": int,
+            "trigger-minute": int,
+            "trigger-datetime": str,
+            "fields": list,
+            "faz-event-name": str,
+            "faz-event-severity": str,
+            "faz-event-tags": str,
+            "serial": str,
+            "fabric-event-name": str,
+            "fabric-event-severity": str,
+        },
+    },
+    "autoupdate_schedule": {
+        "class": "AutoupdateSchedule",
+        "path": "/system.autoupdate/schedule",
+        "fields": {"status": str, "frequency": str, "time": str, "day": str},
+    },
+    "central_management": {
+        "class": "CentralManagement",
+        "path": "/system/central-management",
+        "fields": {
+            "mode": str,
+            "type": str,
+            "fortigate-cloud-sso-default-profile": str,
+            "schedule-config-restore": str,
+            "schedule-script-restore": str,
+            "allow-push-configuration": str,
+            "allow-push-firmware": str,
+            "allow-remote-firmware-upgrade": str,
+            "allow-monitor": str,
+            "serial-number": str,
+            "fmg": str,
+            "fmg-source-ip": str,
+            "fmg-source-ip6": str,
+            "local-cert": str,
+            "ca-cert": str,
+            "server-list": list,
+            "fmg-update-port": str,
+            "fmg-update-http-header": str,
+            "include-default-servers": str,
+            "enc-algorithm": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "cloud_service": {
+        "class": "CloudService",
+        "path": "/system/cloud-service",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vendor": str,
+            "traffic-vdom": str,
+            "gck-service-account": str,
+            "gck-private-key": str,
+            "gck-keyid": str,
+            "gck-access-token-lifetime": int,
+        },
+    },
+    "console": {
+        "class": "Console",
+        "path": "/system/console",
+        "fields": {"output": str, "login": str, "fortiexplorer": str},
+    },
+    "csf": {
+        "class": "Csf",
+        "path": "/system/cs",
+        "fields": {
+            "status": str,
+            "uid": str,
+            "upstream": str,
+            "source-ip": str,
+            "upstream-interface-select-method": str,
+            "upstream-interface": str,
+            "upstream-port": int,
+            "group-name": str,
+            "group-password": str,
+            "accept-auth-by-cert": str,
+            "log-unification": str,
+            "authorization-request-type": str,
+            "certificate": str,
+            "fabric-workers": int,
+            "downstream-access": str,
+            "legacy-authentication": str,
+            "downstream-accprofile": str,
+            "configuration-sync": str,
+            "fabric-object-unification": str,
+            "saml-configuration-sync": str,
+            "trusted-list": list,
+            "fabric-connector": list,
+            "forticloud-account-enforcement": str,
+            "file-mgmt": str,
+            "file-quota": int,
+            "file-quota-warning": int,
+        },
+    },
+    "custom_language": {
+        "class": "CustomLanguage",
+        "path": "/system/custom-language",
+        "mkey": "name",
+        "fields": {"name": str, "filename": str, "comments": str},
+    },
+    "ddns": {
+        "class": "Ddns",
+        "path": "/system/ddns",
+        "mkey": "ddnsid",
+        "fields": {
+            "ddnsid": int,
+            "ddns-server": str,
+            "addr-type": str,
+            "server-type": str,
+            "ddns-server-addr": list,
+            "ddns-zone": str,
+            "ddns-ttl": int,
+            "ddns-auth": str,
+            "ddns-keyname": str,
+            "ddns-key": str,
+            "ddns-domain": str,
+            "ddns-username": str,
+            "ddns-sn": str,
+            "ddns-password": str,
+            "use-public-ip": str,
+            "update-interval": int,
+            "clear-text": str,
+            "ssl-certificate": str,
+            "bound-ip": str,
+            "monitor-interface": list,
+        },
+    },
+    "dedicated_mgmt": {
+        "class": "DedicatedMgmt",
+        "path": "/system/dedicated-mgmt",
+        "fields": {
+            "status": str,
+            "interface": str,
+            "default-gateway": str,
+            "dhcp-server": str,
+            "dhcp-netmask": str,
+            "dhcp-start-ip": str,
+            "dhcp-end-ip": str,
+        },
+    },
+    "device_upgrade": {
+        "class": "DeviceUpgrade",
+        "path": "/system/device-upgrade",
+        "mkey": "serial",
+        "fields": {
+            "status": str,
+            "ha-reboot-controller": str,
+            "next-path-index": int,
+            "known-ha-members": list,
+            "initial-version": str,
+            "starter-admin": str,
+            "serial": str,
+            "timing": str,
+            "maximum-minutes": int,
+            "time": str,
+            "setup-time": str,
+            "upgrade-path": str,
+            "device-type": str,
+            "allow-download": str,
+            "failure-reason": str,
+        },
+    },
+    "device_upgrade_exemptions": {
+        "class": "DeviceUpgradeExemptions",
+        "path": "/system/device-upgrade-exemptions",
+        "mkey": "id",
+        "fields": {"id": int, "fortinet-device": str, "version": str},
+    },
+    "dhcp6_server": {
+        "class": "Dhcp6Server",
+        "path": "/system.dhcp6/server",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "status": str,
+            "rapid-commit": str,
+            "lease-time": int,
+            "dns-service": str,
+            "dns-search-list": str,
+            "dns-server1": str,
+            "dns-server2": str,
+            "dns-server3": str,
+            "dns-server4": str,
+            "domain": str,
+            "subnet": str,
+            "interface": str,
+            "delegated-prefix-route": str,
+            "options": list,
+            "upstream-interface": str,
+            "delegated-prefix-iaid": int,
+            "ip-mode": str,
+            "prefix-mode": str,
+            "prefix-range": list,
+            "ip-range": list,
+        },
+    },
+    "dhcp_server": {
+        "class": "DhcpServer",
+        "path": "/system.dhcp/server",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "status": str,
+            "lease-time": int,
+            "mac-acl-default-action": str,
+            "forticlient-on-net-status": str,
+            "dns-service": str,
+            "dns-server1": str,
+            "dns-server2": str,
+            "dns-server3": str,
+            "dns-server4": str,
+            "wifi-ac-service": str,
+            "wifi-ac1": str,
+            "wifi-ac2": str,
+            "wifi-ac3": str,
+            "ntp-service": str,
+            "ntp-server1": str,
+            "ntp-server2": str,
+            "ntp-server3": str,
+            "domain": str,
+            "wins-server1": str,
+            "wins-server2": str,
+            "default-gateway": str,
+            "next-server": str,
+            "netmask": str,
+            "interface": str,
+            "ip-range": list,
+            "timezone-option": str,
+            "timezone": str,
+            "tftp-server": list,
+            "filename": str,
+            "options": list,
+            "server-type": str,
+            "ip-mode": str,
+            "conflicted-ip-timeout": int,
+            "ipsec-lease-hold": int,
+            "auto-configuration": str,
+            "dhcp-settings-from-fortiipam": str,
+            "auto-managed-status": str,
+            "ddns-update": str,
+            "ddns-update-override": str,
+            "ddns-server-ip": str,
+            "ddns-zone": str,
+            "ddns-auth": str,
+            "ddns-keyname": str,
+            "ddns-key": str,
+            "ddns-ttl": int,
+            "vci-match": str,
+            "vci-string": list,
+            "exclude-range": list,
+            "shared-subnet": str,
+            "relay-agent": str,
+            "reserved-address": list,
+        },
+    },
+    "dns": {
+        "class": "Dns",
+        "path": "/system/dns",
+        "fields": {
+            "primary": str,
+            "secondary": str,
+            "protocol": str,
+            "ssl-certificate": str,
+            "server-hostname": list,
+            "domain": list,
+            "ip6-primary": str,
+            "ip6-secondary": str,
+            "timeout": int,
+            "retry": int,
+            "dns-cache-limit": int,
+            "dns-cache-ttl": int,
+            "cache-notfound-responses": str,
+            "source-ip": str,
+            "source-ip-interface": str,
+            "root-servers": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "server-select-method": str,
+            "alt-primary": str,
+            "alt-secondary": str,
+            "log": str,
+            "fqdn-cache-ttl": int,
+            "fqdn-max-refresh": int,
+            "fqdn-min-refresh": int,
+            "hostname-ttl": int,
+            "hostname-limit": int,
+        },
+    },
+    "dns64": {
+        "class": "Dns64",
+        "path": "/system/dns64",
+        "fields": {
+            "status": str,
+            "dns64-prefix": str,
+            "always-synthesize-aaaa-record": str,
+        },
+    },
+    "dns_database": {
+        "class": "DnsDatabase",
+        "path": "/system/dns-database",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "domain": str,
+            "allow-transfer": str,
+            "type": str,
+            "view": str,
+            "ip-primary": str,
+            "primary-name": str,
+            "contact": str,
+            "ttl": int,
+            "authoritative": str,
+            "forwarder": str,
+            "forwarder6": str,
+            "source-ip": str,
+            "source-ip6": str,
+            "source-ip-interface": str,
+            "rr-max": int,
+            "dns-entry": list,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "dns_server": {
+        "class": "DnsServer",
+        "path": "/system/dns-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "mode": str,
+            "dnsfilter-profile": str,
+            "doh": str,
+            "doh3": str,
+            "doq": str,
+        },
+    },
+    "dscp_based_priority": {
+        "class": "DscpBasedPriority",
+        "path": "/system/dscp-based-priority",
+        "mkey": "id",
+        "fields": {"id": int, "ds": int, "priority": str},
+    },
+    "email_server": {
+        "class": "EmailServer",
+        "path": "/system/email-server",
+        "fields": {
+            "type": str,
+            "server": str,
+            "port": int,
+            "source-ip": str,
+            "source-ip6": str,
+            "authenticate": str,
+            "validate-server": str,
+            "username": str,
+            "password": str,
+            "security": str,
+            "ssl-min-proto-version": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "evpn": {
+        "class": "Evpn",
+        "path": "/system/evpn",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "rd": str,
+            "import-rt": list,
+            "export-rt": list,
+            "ip-local-learning": str,
+            "arp-suppression": str,
+        },
+    },
+    "external_resource": {
+        "class": "ExternalResource",
+        "path": "/system/external-resource",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "uuid": str,
+            "status": str,
+            "type": str,
+            "namespace": str,
+            "object-array-path": str,
+            "address-name-field": str,
+            "address-data-field": str,
+            "address-comment-field": str,
+            "update-method": str,
+            "category": int,
+            "username": str,
+            "password": str,
+            "client-cert-auth": str,
+            "client-cert": str,
+            "comments": str,
+            "resource": str,
+            "user-agent": str,
+            "server-identity-check": str,
+            "refresh-rate": int,
+            "source-ip": str,
+            "source-ip-interface": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fabric_vpn": {
+        "class": "FabricVpn",
+        "path": "/system/fabric-vpn",
+        "fields": {
+            "status": str,
+            "sync-mode": str,
+            "branch-name": str,
+            "policy-rule": str,
+            "vpn-role": str,
+            "overlays": list,
+            "advertised-subnets": list,
+            "loopback-address-block": str,
+            "loopback-interface": str,
+            "loopback-advertised-subnet": int,
+            "psksecret": str,
+            "bgp-as": str,
+            "sdwan-zone": str,
+            "health-checks": str,
+        },
+    },
+    "federated_upgrade": {
+        "class": "FederatedUpgrade",
+        "path": "/system/federated-upgrade",
+        "fields": {
+            "status": str,
+            "source": str,
+            "failure-reason": str,
+            "failure-device": str,
+            "upgrade-id": int,
+            "next-path-index": int,
+            "ignore-signing-errors": str,
+            "ha-reboot-controller": str,
+            "known-ha-members": list,
+            "initial-version": str,
+            "starter-admin": str,
+            "node-list": list,
+        },
+    },
+    "fips_cc": {
+        "class": "FipsCc",
+        "path": "/system/fips-cc",
+        "fields": {
+            "status": str,
+            "self-test-period": int,
+            "key-generation-self-test": str,
+        },
+    },
+    "fortiguard": {
+        "class": "Fortiguard",
+        "path": "/system/fortiguard",
+        "fields": {
+            "fortiguard-anycast": str,
+            "fortiguard-anycast-source": str,
+            "protocol": str,
+            "port": str,
+            "service-account-id": str,
+            "load-balance-servers": int,
+            "auto-join-forticloud": str,
+            "update-server-location": str,
+            "sandbox-region": str,
+            "update-ffdb": str,
+            "update-uwdb": str,
+            "update-dldb": str,
+            "update-extdb": str,
+            "update-build-proxy": str,
+            "persistent-connection": str,
+            "auto-firmware-upgrade": str,
+            "auto-firmware-upgrade-day": str,
+            "auto-firmware-upgrade-delay": int,
+            "auto-firmware-upgrade-start-hour": int,
+            "auto-firmware-upgrade-end-hour": int,
+            "FDS-license-expiring-days": int,
+            "subscribe-update-notification": str,
+            "antispam-force-off": str,
+            "antispam-cache": str,
+            "antispam-cache-ttl": int,
+            "antispam-cache-mpermille": int,
+            "antispam-license": int,
+            "antispam-expiration": int,
+            "antispam-timeout": int,
+            "outbreak-prevention-force-off": str,
+            "outbreak-prevention-cache": str,
+            "outbreak-prevention-cache-ttl": int,
+            "outbreak-prevention-cache-mpermille": int,
+            "outbreak-prevention-license": int,
+            "outbreak-prevention-expiration": int,
+            "outbreak-prevention-timeout": int,
+            "webfilter-force-off": str,
+            "webfilter-cache": str,
+            "webfilter-cache-ttl": int,
+            "webfilter-license": int,
+            "webfilter-expiration": int,
+            "webfilter-timeout": int,
+            "sdns-server-ip": str,
+            "sdns-server-port": int,
+            "anycast-sdns-server-ip": str,
+            "anycast-sdns-server-port": int,
+            "sdns-options": str,
+            "source-ip": str,
+            "source-ip6": str,
+            "proxy-server-ip": str,
+            "proxy-server-port": int,
+            "proxy-username": str,
+            "proxy-password": str,
+            "ddns-server-ip": str,
+            "ddns-server-ip6": str,
+            "ddns-server-port": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fortisandbox": {
+        "class": "Fortisandbox",
+        "path": "/system/fortisandbox",
+        "fields": {
+            "status": str,
+            "forticloud": str,
+            "server": str,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "enc-algorithm": str,
+            "ssl-min-proto-version": str,
+            "email": str,
+            "ca": str,
+            "cn": str,
+            "certificate-verification": str,
+        },
+    },
+    "fsso_polling": {
+        "class": "FssoPolling",
+        "path": "/system/fsso-polling",
+        "fields": {
+            "status": str,
+            "listening-port": int,
+            "authentication": str,
+            "auth-password": str,
+        },
+    },
+    "ftm_push": {
+        "class": "FtmPush",
+        "path": "/system/ftm-push",
+        "fields": {
+            "proxy": str,
+            "interface": str,
+            "server": str,
+            "server-port": int,
+            "server-cert": str,
+            "server-ip": str,
+            "status": str,
+        },
+    },
+    "geneve": {
+        "class": "Geneve",
+        "path": "/system/geneve",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "vni": int,
+            "type": str,
+            "ip-version": str,
+            "remote-ip": str,
+            "remote-ip6": str,
+            "dstport": int,
+        },
+    },
+    "geoip_country": {
+        "class": "GeoipCountry",
+        "path": "/system/geoip-country",
+        "mkey": "id",
+        "fields": {"id": str, "name": str},
+    },
+    "geoip_override": {
+        "class": "GeoipOverride",
+        "path": "/system/geoip-override",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "country-id": str,
+            "ip-range": list,
+            "ip6-range": list,
+        },
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/system/global",
+        "fields": {
+            "language": str,
+            "gui-allow-incompatible-fabric-fgt": str,
+            "gui-ipv6": str,
+            "gui-replacement-message-groups": str,
+            "gui-local-out": str,
+            "gui-certificates": str,
+            "gui-custom-language": str,
+            "gui-wireless-opensecurity": str,
+            "gui-app-detection-sdwan": str,
+            "gui-display-hostname": str,
+            "gui-fortigate-cloud-sandbox": str,
+            "gui-firmware-upgrade-warning": str,
+            "gui-forticare-registration-setup-warning": str,
+            "gui-auto-upgrade-setup-warning": str,
+            "gui-workflow-management": str,
+            "gui-cdn-usage": str,
+            "admin-https-ssl-versions": str,
+            "admin-https-ssl-ciphersuites": str,
+            "admin-https-ssl-banned-ciphers": str,
+            "admintimeout": int,
+            "admin-console-timeout": int,
+            "ssd-trim-freq": str,
+            "ssd-trim-hour": int,
+            "ssd-trim-min": int,
+            "ssd-trim-weekday": str,
+            "ssd-trim-date": int,
+            "admin-concurrent": str,
+            "admin-lockout-threshold": int,
+            "admin-lockout-duration": int,
+            "refresh": int,
+            "interval": int,
+            "failtime": int,
+            "purdue-level": str,
+            "daily-restart": str,
+            "restart-time": str,
+            "wad-restart-mode": str,
+            "wad-restart-start-time": str,
+            "wad-restart-end-time": str,
+            "wad-p2s-max-body-size": int,
+            "radius-port": int,
+            "speedtestd-server-port": int,
+            "speedtestd-ctrl-port": int,
+            "admin-login-max": int,
+            "remoteauthtimeout": int,
+            "ldapconntimeout": int,
+            "batch-cmdb": str,
+            "multi-factor-authentication": str,
+            "ssl-min-proto-version": str,
+            "autorun-log-fsck": str,
+            "timezone": str,
+            "traffic-priority": str,
+            "traffic-priority-level": str,
+            "quic-congestion-control-algo": str,
+            "quic-max-datagram-size": int,
+            "quic-udp-payload-size-shaping-per-cid": str,
+            "quic-ack-thresold": int,
+            "quic-pmtud": str,
+            "quic-tls-handshake-timeout": int,
+            "anti-replay": str,
+            "send-pmtu-icmp": str,
+            "honor-df": str,
+            "pmtu-discovery": str,
+            "virtual-switch-vlan": str,
+            "revision-image-auto-backup": str,
+            "revision-backup-on-logout": str,
+            "management-vdom": str,
+            "hostname": str,
+            "alias": str,
+            "strong-crypto": str,
+            "ssl-static-key-ciphers": str,
+            "snat-route-change": str,
+            "ipv6-snat-route-change": str,
+            "speedtest-server": str,
+            "cli-audit-log": str,
+            "dh-params": str,
+            "fds-statistics": str,
+            "fds-statistics-period": int,
+            "tcp-option": str,
+            "lldp-transmission": str,
+            "lldp-reception": str,
+            "proxy-auth-timeout": int,
+            "proxy-keep-alive-mode": str,
+            "proxy-re-authentication-time": int,
+            "proxy-auth-lifetime": str,
+            "proxy-auth-lifetime-timeout": int,
+            "proxy-resource-mode": str,
+            "proxy-cert-use-mgmt-vdom": str,
+            "sys-perf-log-interval": int,
+            "check-protocol-header": str,
+            "vip-arp-range": str,
+            "reset-sessionless-tcp": str,
+            "allow-traffic-redirect": str,
+            "ipv6-allow-traffic-redirect": str,
+            "strict-dirty-session-check": str,
+            "tcp-halfclose-timer": int,
+            "tcp-halfopen-timer": int,
+            "tcp-timewait-timer": int,
+            "tcp-rst-timer": int,
+            "udp-idle-timer": int,
+            "block-session-timer": int,
+            "ip-src-port-range": str,
+            "pre-login-banner": str,
+            "post-login-banner": str,
+            "tftp": str,
+            "av-failopen": str,
+            "av-failopen-session": str,
+            "memory-use-threshold-extreme": int,
+            "memory-use-threshold-red": int,
+            "memory-use-threshold-green": int,
+            "ip-fragment-mem-thresholds": int,
+            "ip-fragment-timeout": int,
+            "ipv6-fragment-timeout": int,
+            "cpu-use-threshold": int,
+            "log-single-cpu-high": str,
+            "check-reset-range": str,
+            "single-vdom-npuvlink": str,
+            "vdom-mode": str,
+            "long-vdom-name": str,
+            "upgrade-report": str,
+            "edit-vdom-prompt": str,
+            "admin-port": int,
+            "admin-sport": int,
+            "admin-host": str,
+            "admin-https-redirect": str,
+            "admin-hsts-max-age": int,
+            "admin-ssh-password": str,
+            "admin-restrict-local": str,
+            "admin-ssh-port": int,
+            "admin-ssh-grace-time": int,
+            "admin-ssh-v1": str,
+            "admin-telnet": str,
+            "admin-telnet-port": int,
+            "admin-forticloud-sso-login": str,
+            "admin-forticloud-sso-default-profile": str,
+            "default-service-source-port": str,
+            "admin-reset-button": str,
+            "admin-server-cert": str,
+            "admin-https-pki-required": str,
+            "wifi-certificate": str,
+            "dhcp-lease-backup-interval": int,
+            "wifi-ca-certificate": str,
+            "auth-http-port": int,
+            "auth-https-port": int,
+            "auth-ike-saml-port": int,
+            "auth-keepalive": str,
+            "policy-auth-concurrent": int,
+            "auth-session-limit": str,
+            "auth-cert": str,
+            "clt-cert-req": str,
+            "fortiservice-port": int,
+            "cfg-save": str,
+            "cfg-revert-timeout": int,
+            "reboot-upon-config-restore": str,
+            "admin-scp": str,
+            "wireless-controller": str,
+            "wireless-controller-port": int,
+            "fortiextender-data-port": int,
+            "fortiextender": str,
+            "extender-controller-reserved-network": str,
+            "fortiextender-discovery-lockdown": str,
+            "fortiextender-vlan-mode": str,
+            "fortiextender-provision-on-authorization": str,
+            "switch-controller": str,
+            "switch-controller-reserved-network": str,
+            "dnsproxy-worker-count": int,
+            "url-filter-count": int,
+            "httpd-max-worker-count": int,
+            "proxy-worker-count": int,
+            "scanunit-count": int,
+            "proxy-hardware-acceleration": str,
+            "fgd-alert-subscription": str,
+            "ipsec-hmac-offload": str,
+            "ipv6-accept-dad": int,
+            "ipv6-allow-anycast-probe": str,
+            "ipv6-allow-multicast-probe": str,
+            "ipv6-allow-local-in-silent-drop": str,
+            "csr-ca-attribute": str,
+            "wimax-4g-usb": str,
+            "cert-chain-max": int,
+            "two-factor-ftk-expiry": int,
+            "two-factor-email-expiry": int,
+            "two-factor-sms-expiry": int,
+            "two-factor-fac-expiry": int,
+            "two-factor-ftm-expiry": int,
+            "wad-worker-count": int,
+            "wad-worker-dev-cache": int,
+            "wad-csvc-cs-count": int,
+            "wad-csvc-db-count": int,
+            "wad-source-affinity": str,
+            "wad-memory-change-granularity": int,
+            "login-timestamp": str,
+            "ip-conflict-detection": str,
+            "miglogd-children": int,
+            "log-daemon-cpu-threshold": int,
+            "special-file-23-support": str,
+            "log-uuid-address": str,
+            "log-ssl-connection": str,
+            "rest-api-key-url-query": str,
+            "gui-cdn-domain-override": str,
+            "arp-max-entry": int,
+            "ha-affinity": str,
+            "bfd-affinity": str,
+            "cmdbsvr-affinity": str,
+            "ndp-max-entry": int,
+            "br-fdb-max-entry": int,
+            "max-route-cache-size": int,
+            "ipsec-asic-offload": str,
+            "device-idle-timeout": int,
+            "user-device-store-max-devices": int,
+            "user-device-store-max-device-mem": int,
+            "user-device-store-max-users": int,
+            "user-device-store-max-unified-mem": int,
+            "gui-device-latitude": str,
+            "gui-device-longitude": str,
+            "private-data-encryption": str,
+            "auto-auth-extension-device": str,
+            "gui-theme": str,
+            "gui-date-format": str,
+            "gui-date-time-source": str,
+            "igmp-state-limit": int,
+            "cloud-communication": str,
+            "ipsec-ha-seqjump-rate": int,
+            "fortitoken-cloud": str,
+            "fortitoken-cloud-push-status": str,
+            "fortitoken-cloud-region": str,
+            "fortitoken-cloud-sync-interval": int,
+            "faz-disk-buffer-size": int,
+            "irq-time-accounting": str,
+            "management-ip": str,
+            "management-port": int,
+            "management-port-use-admin-sport": str,
+            "forticonverter-integration": str,
+            "forticonverter-config-upload": str,
+            "internet-service-database": str,
+            "internet-service-download-list": list,
+            "geoip-full-db": str,
+            "early-tcp-npu-session": str,
+            "npu-neighbor-update": str,
+            "delay-tcp-npu-session": str,
+            "interface-subnet-usage": str,
+            "sflowd-max-children-num": int,
+            "fortigslb-integration": str,
+            "user-history-password-threshold": int,
+            "auth-session-auto-backup": str,
+            "auth-session-auto-backup-interval": str,
+            "scim-https-port": int,
+            "scim-http-port": int,
+            "scim-server-cert": str,
+            "application-bandwidth-tracking": str,
+            "tls-session-cache": str,
+        },
+    },
+    "gre_tunnel": {
+        "class": "GreTunnel",
+        "path": "/system/gre-tunnel",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "ip-version": str,
+            "remote-gw6": str,
+            "local-gw6": str,
+            "remote-gw": str,
+            "local-gw": str,
+            "use-sdwan": str,
+            "sequence-number-transmission": str,
+            "sequence-number-reception": str,
+            "checksum-transmission": str,
+            "checksum-reception": str,
+            "key-outbound": int,
+            "key-inbound": int,
+            "dscp-copying": str,
+            "diffservcode": str,
+            "keepalive-interval": int,
+            "keepalive-failtimes": int,
+        },
+    },
+    "ha": {
+        "class": "Ha",
+        "path": "/system/ha",
+        "fields": {
+            "group-id": int,
+            "group-name": str,
+            "mode": str,
+            "sync-packet-balance": str,
+            "password": str,
+            "hbdev": str,
+            "auto-virtual-mac-interface": list,
+            "backup-hbdev": list,
+            "session-sync-dev": str,
+            "route-ttl": int,
+            "route-wait": int,
+            "route-hold": int,
+            "multicast-ttl": int,
+            "evpn-ttl": int,
+            "load-balance-all": str,
+            "sync-config": str,
+            "encryption": str,
+            "authentication": str,
+            "hb-interval": int,
+            "hb-interval-in-milliseconds": str,
+            "hb-lost-threshold": int,
+            "hello-holddown": int,
+            "gratuitous-arps": str,
+            "arps": int,
+            "arps-interval": int,
+            "session-pickup": str,
+            "session-pickup-connectionless": str,
+            "session-pickup-expectation": str,
+            "session-pickup-nat": str,
+            "session-pickup-delay": str,
+            "link-failed-signal": str,
+            "upgrade-mode": str,
+            "uninterruptible-primary-wait": int,
+            "standalone-mgmt-vdom": str,
+            "ha-mgmt-status": str,
+            "ha-mgmt-interfaces": list,
+            "ha-eth-type": str,
+            "hc-eth-type": str,
+            "l2ep-eth-type": str,
+            "ha-uptime-diff-margin": int,
+            "standalone-config-sync": str,
+            "logical-sn": str,
+            "schedule": str,
+            "weight": str,
+            "cpu-threshold": str,
+            "memory-threshold": str,
+            "http-proxy-threshold": str,
+            "ftp-proxy-threshold": str,
+            "imap-proxy-threshold": str,
+            "nntp-proxy-threshold": str,
+            "pop3-proxy-threshold": str,
+            "smtp-proxy-threshold": str,
+            "override": str,
+            "priority": int,
+            "override-wait-time": int,
+            "monitor": str,
+            "pingserver-monitor-interface": str,
+            "pingserver-failover-threshold": int,
+            "pingserver-secondary-force-reset": str,
+            "pingserver-flip-timeout": int,
+            "vcluster-status": str,
+            "vcluster": list,
+            "ha-direct": str,
+            "ssd-failover": str,
+            "memory-compatible-mode": str,
+            "memory-based-failover": str,
+            "memory-failover-threshold": int,
+            "memory-failover-monitor-period": int,
+            "memory-failover-sample-rate": int,
+            "memory-failover-flip-timeout": int,
+            "failover-hold-time": int,
+            "check-secondary-dev-health": str,
+            "ipsec-phase2-proposal": str,
+            "bounce-intf-upon-failover": str,
+            "status": str,
+        },
+    },
+    "ha_monitor": {
+        "class": "HaMonitor",
+        "path": "/system/ha-monitor",
+        "fields": {
+            "monitor-vlan": str,
+            "vlan-hb-interval": int,
+            "vlan-hb-lost-threshold": int,
+        },
+    },
+    "health_check_fortiguard": {
+        "class": "HealthCheckFortiguard",
+        "path": "/system/health-check-fortiguard",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "obsolete": int,
+            "protocol": str,
+        },
+    },
+    "ike": {
+        "class": "Ike",
+        "path": "/system/ike",
+        "fields": {
+            "embryonic-limit": int,
+            "dh-multiprocess": str,
+            "dh-worker-count": int,
+            "dh-mode": str,
+            "dh-keypair-cache": str,
+            "dh-keypair-count": int,
+            "dh-keypair-throttle": str,
+            "dh-group-1": list,
+            "dh-group-2": list,
+            "dh-group-5": list,
+            "dh-group-14": list,
+            "dh-group-15": list,
+            "dh-group-16": list,
+            "dh-group-17": list,
+            "dh-group-18": list,
+            "dh-group-19": list,
+            "dh-group-20": list,
+            "dh-group-21": list,
+            "dh-group-27": list,
+            "dh-group-28": list,
+            "dh-group-29": list,
+            "dh-group-30": list,
+            "dh-group-31": list,
+            "dh-group-32": list,
+        },
+    },
+    "interface": {
+        "class": "Interface",
+        "path": "/system/interface",
+        "mkey": "name",
+        "views": {
+            "summary": (
+                "name",
+                "type",
+                "role",
+                "ip",
+                "allowaccess",
+                "status",
+                "alias",
+                "interface",
+                "vlanid",
+                "description",
+            ),
+        },
+        "fields": {
+            "name": str,
+            "vrf": int,
+            "cli-conn-status": int,
+            "fortilink": str,
+            "switch-controller-source-ip": str,
+            "mode": str,
+            "client-options": list,
+            "distance": int,
+            "priority": int,
+            "dhcp-relay-interface-select-method": str,
+            "dhcp-relay-interface": str,
+            "dhcp-relay-vrf-select": int,
+            "dhcp-broadcast-flag": str,
+            "dhcp-relay-service": str,
+            "dhcp-relay-ip": str,
+            "dhcp-relay-source-ip": str,
+            "dhcp-relay-circuit-id": str,
+            "dhcp-relay-link-selection": str,
+            "dhcp-relay-request-all-server": str,
+            "dhcp-relay-allow-no-end-option": str,
+            "dhcp-relay-type": str,
+            "dhcp-smart-relay": str,
+            "dhcp-relay-agent-option": str,
+            "dhcp-classless-route-addition": str,
+            "management-ip": str,
+            "ip": str,
+            "allowaccess": str,
+            "gwdetect": str,
+            "ping-serv-status": int,
+            "detectserver": str,
+            "detectprotocol": str,
+            "ha-priority": int,
+            "fail-detect": str,
+            "fail-detect-option": str,
+            "fail-alert-method": str,
+            "fail-action-on-extender": str,
+            "fail-alert-interfaces": list,
+            "dhcp-client-identifier": str,
+            "dhcp-renew-time": int,
+            "ipunnumbered": str,
+            "username": str,
+            "pppoe-egress-cos": str,
+            "pppoe-unnumbered-negotiate": str,
+            "password": str,
+            "idle-timeout": int,
+            "multilink": str,
+            "mrru": int,
+            "detected-peer-mtu": int,
+            "disc-retry-timeout": int,
+            "padt-retry-timeout": int,
+            "service-name": str,
+            "ac-name": str,
+            "lcp-echo-interval": int,
+            "lcp-max-echo-fails": int,
+            "defaultgw": str,
+            "dns-server-override": str,
+            "dns-server-protocol": str,
+            "auth-type": str,
+            "pptp-client": str,
+            "pptp-user": str,
+            "pptp-password": str,
+            "pptp-server-ip": str,
+            "pptp-auth-type": str,
+            "pptp-timeout": int,
+            "arpforward": str,
+            "ndiscforward": str,
+            "broadcast-forward": str,
+            "bfd": str,
+            "bfd-desired-min-tx": int,
+            "bfd-detect-mult": int,
+            "bfd-required-min-rx": int,
+            "l2forward": str,
+            "icmp-send-redirect": str,
+            "icmp-accept-redirect": str,
+            "reachable-time": int,
+            "vlanforward": str,
+            "stpforward": str,
+            "stpforward-mode": str,
+            "ips-sniffer-mode": str,
+            "ident-accept": str,
+            "ipmac": str,
+            "subst": str,
+            "macaddr": str,
+            "virtual-mac": str,
+            "substitute-dst-mac": str,
+            "speed": str,
+            "status": str,
+            "netbios-forward": str,
+            "wins-ip": str,
+            "type": str,
+            "dedicated-to": str,
+            "trust-ip-1": str,
+            "trust-ip-2": str,
+            "trust-ip-3": str,
+            "trust-ip6-1": str,
+            "trust-ip6-2": str,
+            "trust-ip6-3": str,
+            "wccp": str,
+            "netflow-sampler": str,
+            "netflow-sample-rate": int,
+            "netflow-sampler-id": int,
+            "sflow-sampler": str,
+            "drop-fragment": str,
+            "src-check": str,
+            "sample-rate": int,
+            "polling-interval": int,
+            "sample-direction": str,
+            "explicit-web-proxy": str,
+            "explicit-ftp-proxy": str,
+            "proxy-captive-portal": str,
+            "tcp-mss": int,
+            "inbandwidth": int,
+            "outbandwidth": int,
+            "egress-shaping-profile": str,
+            "ingress-shaping-profile": str,
+            "spillover-threshold": int,
+            "ingress-spillover-threshold": int,
+            "weight": int,
+            "interface": str,
+            "external": str,
+            "mtu-override": str,
+            "mtu": int,
+            "vlan-protocol": str,
+            "vlanid": int,
+            "trunk": str,
+            "forward-domain": int,
+            "remote-ip": str,
+            "member": list,
+            "lacp-mode": str,
+            "lacp-ha-secondary": str,
+            "system-id-type": str,
+            "system-id": str,
+            "lacp-speed": str,
+            "min-links": int,
+            "min-links-down": str,
+            "algorithm": str,
+            "link-up-delay": int,
+            "aggregate-type": str,
+            "priority-override": str,
+            "aggregate": str,
+            "redundant-interface": str,
+            "devindex": int,
+            "vindex": int,
+            "switch": str,
+            "description": str,
+            "alias": str,
+            "l2tp-client": str,
+            "l2tp-client-settings": list,
+            "security-mode": str,
+            "security-mac-auth-bypass": str,
+            "security-ip-auth-bypass": str,
+            "security-8021x-mode": str,
+            "security-8021x-master": str,
+            "security-8021x-dynamic-vlan-id": int,
+            "security-8021x-member-mode": str,
+            "security-external-web": str,
+            "security-external-logout": str,
+            "replacemsg-override-group": str,
+            "security-redirect-url": str,
+            "auth-cert": str,
+            "auth-portal-addr": str,
+            "security-exempt-list": str,
+            "security-groups": list,
+            "ike-saml-server": str,
+            "stp": str,
+            "stp-ha-secondary": str,
+            "stp-edge": str,
+            "device-identification": str,
+            "exclude-signatures": str,
+            "device-user-identification": str,
+            "lldp-reception": str,
+            "lldp-transmission": str,
+            "lldp-network-policy": str,
+            "estimated-upstream-bandwidth": int,
+            "estimated-downstream-bandwidth": int,
+            "measured-upstream-bandwidth": int,
+            "measured-downstream-bandwidth": int,
+            "bandwidth-measure-time": int,
+            "monitor-bandwidth": str,
+            "vrrp-virtual-mac": str,
+            "vrrp": list,
+            "phy-setting": list,
+            "role": str,
+            "snmp-index": int,
+            "secondary-IP": str,
+            "secondaryip": list,
+            "preserve-session-route": str,
+            "auto-auth-extension-device": str,
+            "ap-discover": str,
+            "fortilink-neighbor-detect": str,
+            "ip-managed-by-fortiipam": str,
+            "managed-subnetwork-size": str,
+            "fortilink-split-interface": str,
+            "internal": int,
+            "fortilink-backup-link": int,
+            "switch-controller-access-vlan": str,
+            "switch-controller-traffic-policy": str,
+            "switch-controller-rspan-mode": str,
+            "switch-controller-netflow-collect": str,
+            "switch-controller-mgmt-vlan": int,
+            "switch-controller-igmp-snooping": str,
+            "switch-controller-igmp-snooping-proxy": str,
+            "switch-controller-igmp-snooping-fast-leave": str,
+            "switch-controller-dhcp-snooping": str,
+            "switch-controller-dhcp-snooping-verify-mac": str,
+            "switch-controller-dhcp-snooping-option82": str,
+            "dhcp-snooping-server-list": list,
+            "switch-controller-arp-inspection": str,
+            "switch-controller-learning-limit": int,
+            "switch-controller-nac": str,
+            "switch-controller-dynamic": str,
+            "switch-controller-feature": str,
+            "switch-controller-iot-scanning": str,
+            "switch-controller-offload": str,
+            "switch-controller-offload-ip": str,
+            "switch-controller-offload-gw": str,
+            "swc-vlan": int,
+            "swc-first-create": int,
+            "color": int,
+            "tagging": list,
+            "eap-supplicant": str,
+            "eap-method": str,
+            "eap-identity": str,
+            "eap-password": str,
+            "eap-ca-cert": str,
+            "eap-user-cert": str,
+            "default-purdue-level": str,
+            "ipv6": list,
+            "physical": str,
+        },
+    },
+    "ipam": {
+        "class": "Ipam",
+        "path": "/system/ipam",
+        "fields": {
+            "status": str,
+            "server-type": str,
+            "automatic-conflict-resolution": str,
+            "require-subnet-size-match": str,
+            "manage-lan-addresses": str,
+            "manage-lan-extension-addresses": str,
+            "manage-ssid-addresses": str,
+            "pools": list,
+            "rules": list,
+        },
+    },
+    "ipip_tunnel": {
+        "class": "IpipTunnel",
+        "path": "/system/ipip-tunnel",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "remote-gw": str,
+            "local-gw": str,
+            "use-sdwan": str,
+            "auto-asic-offload": str,
+        },
+    },
+    "ips": {
+        "class": "Ips",
+        "path": "/system/ips",
+        "fields": {
+            "signature-hold-time": str,
+            "override-signature-hold-by-id": str,
+        },
+    },
+    "ips_urlfilter_dns": {
+        "class": "IpsUrlfilterDns",
+        "path": "/system/ips-urlfilter-dns",
+        "mkey": "address",
+        "fields": {"address": str, "status": str, "ipv6-capability": str},
+    },
+    "ips_urlfilter_dns6": {
+        "class": "IpsUrlfilterDns6",
+        "path": "/system/ips-urlfilter-dns6",
+        "mkey": "address6",
+        "fields": {"address6": str, "status": str},
+    },
+    "ipsec_aggregate": {
+        "class": "IpsecAggregate",
+        "path": "/system/ipsec-aggregate",
+        "mkey": "name",
+        "fields": {"name": str, "member": list, "algorithm": str},
+    },
+    "ipv6_neighbor_cache": {
+        "class": "Ipv6NeighborCache",
+        "path": "/system/ipv6-neighbor-cache",
+        "mkey": "id",
+        "fields": {"id": int, "interface": str, "ipv6": str, "mac": str},
+    },
+    "ipv6_tunnel": {
+        "class": "Ipv6Tunnel",
+        "path": "/system/ipv6-tunnel",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "source": str,
+            "destination": str,
+            "interface": str,
+            "use-sdwan": str,
+            "auto-asic-offload": str,
+        },
+    },
+    "link_monitor": {
+        "class": "LinkMonitor",
+        "path": "/system/link-monitor",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "addr-mode": str,
+            "srcintf": str,
+            "server-config": str,
+            "server-type": str,
+            "server": list,
+            "protocol": str,
+            "port": int,
+            "gateway-ip": str,
+            "gateway-ip6": str,
+            "route": list,
+            "source-ip": str,
+            "source-ip6": str,
+            "http-get": str,
+            "http-agent": str,
+            "http-match": str,
+            "interval": int,
+            "probe-timeout": int,
+            "failtime": int,
+            "recoverytime": int,
+            "probe-count": int,
+            "security-mode": str,
+            "password": str,
+            "packet-size": int,
+            "ha-priority": int,
+            "fail-weight": int,
+            "update-cascade-interface": str,
+            "update-static-route": str,
+            "update-policy-route": str,
+            "status": str,
+            "diffservcode": str,
+            "class-id": int,
+            "service-detection": str,
+            "server-list": list,
+        },
+    },
+    "lldp_network_policy": {
+        "class": "LldpNetworkPolicy",
+        "path": "/system.lldp/network-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "voice": list,
+            "voice-signaling": list,
+            "guest": list,
+            "guest-voice-signaling": list,
+            "softphone": list,
+            "video-conferencing": list,
+            "streaming-video": list,
+            "video-signaling": list,
+        },
+    },
+    "lte_modem": {
+        "class": "LteModem",
+        "path": "/system/lte-modem",
+        "fields": {
+            "status": str,
+            "extra-init": str,
+            "pdptype": str,
+            "authtype": str,
+            "username": str,
+            "passwd": str,
+            "apn": str,
+            "modem-port": int,
+            "mode": str,
+            "holddown-timer": int,
+            "interface": str,
+        },
+    },
+    "mac_address_table": {
+        "class": "MacAddressTable",
+        "path": "/system/mac-address-table",
+        "mkey": "mac",
+        "fields": {"mac": str, "interface": str, "reply-substitute": str},
+    },
+    "mobile_tunnel": {
+        "class": "MobileTunnel",
+        "path": "/system/mobile-tunnel",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "roaming-interface": str,
+            "home-agent": str,
+            "home-address": str,
+            "renew-interval": int,
+            "lifetime": int,
+            "reg-interval": int,
+            "reg-retry": int,
+            "n-mhae-spi": int,
+            "n-mhae-key-type": str,
+            "n-mhae-key": str,
+            "hash-algorithm": str,
+            "tunnel-mode": str,
+            "network": list,
+        },
+    },
+    "modem": {
+        "class": "Modem",
+        "path": "/system/modem",
+        "fields": {
+            "status": str,
+            "pin-init": str,
+            "network-init": str,
+            "lockdown-lac": str,
+            "mode": str,
+            "auto-dial": str,
+            "dial-on-demand": str,
+            "idle-timer": int,
+            "redial": str,
+            "reset": int,
+            "holddown-timer": int,
+            "connect-timeout": int,
+            "interface": str,
+            "wireless-port": int,
+            "dont-send-CR1": str,
+            "phone1": str,
+            "dial-cmd1": str,
+            "username1": str,
+            "passwd1": str,
+            "extra-init1": str,
+            "peer-modem1": str,
+            "ppp-echo-request1": str,
+            "authtype1": str,
+            "dont-send-CR2": str,
+            "phone2": str,
+            "dial-cmd2": str,
+            "username2": str,
+            "passwd2": str,
+            "extra-init2": str,
+            "peer-modem2": str,
+            "ppp-echo-request2": str,
+            "authtype2": str,
+            "dont-send-CR3": str,
+            "phone3": str,
+            "dial-cmd3": str,
+            "username3": str,
+            "passwd3": str,
+            "extra-init3": str,
+            "peer-modem3": str,
+            "ppp-echo-request3": str,
+            "altmode": str,
+            "authtype3": str,
+            "traffic-check": str,
+            "distance": int,
+            "priority": int,
+        },
+    },
+    "nd_proxy": {
+        "class": "NdProxy",
+        "path": "/system/nd-proxy",
+        "fields": {"status": str, "member": list},
+    },
+    "netflow": {
+        "class": "Netflow",
+        "path": "/system/netflow",
+        "fields": {
+            "active-flow-timeout": int,
+            "inactive-flow-timeout": int,
+            "template-tx-timeout": int,
+            "template-tx-counter": int,
+            "session-cache-size": str,
+            "exclusion-filters": list,
+            "collectors": list,
+        },
+    },
+    "network_visibility": {
+        "class": "NetworkVisibility",
+        "path": "/system/network-visibility",
+        "fields": {
+            "destination-visibility": str,
+            "source-location": str,
+            "destination-hostname-visibility": str,
+            "destination-location": str,
+        },
+    },
+    "ngfw_settings": {
+        "class": "NgfwSettings",
+        "path": "/system/ngfw-settings",
+        "fields": {
+            "match-timeout": int,
+            "tcp-match-timeout": int,
+            "tcp-halfopen-match-timeout": int,
+        },
+    },
+    "np6xlite": {
+        "class": "Np6xlite",
+        "path": "/system/np6xlite",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "fastpath": str,
+            "per-session-accounting": str,
+            "session-timeout-interval": int,
+            "ipsec-inner-fragment": str,
+            "ipsec-throughput-msg-frequency": str,
+            "ipsec-sts-timeout": str,
+            "hpe": list,
+            "fp-anomaly": list,
+        },
+    },
+    "npu": {
+        "class": "Npu",
+        "path": "/system/npu",
+        "fields": {
+            "dedicated-management-cpu": str,
+            "dedicated-management-affinity": str,
+            "capwap-offload": str,
+            "ipsec-mtu-override": str,
+            "ipsec-ordering": str,
+            "ipsec-enc-subengine-mask": str,
+            "ipsec-dec-subengine-mask": str,
+            "priority-protocol": list,
+        },
+    },
+    "ntp": {
+        "class": "Ntp",
+        "path": "/system/ntp",
+        "fields": {
+            "ntpsync": str,
+            "type": str,
+            "syncinterval": int,
+            "ntpserver": list,
+            "source-ip": str,
+            "source-ip6": str,
+            "server-mode": str,
+            "authentication": str,
+            "key-type": str,
+            "key-id": int,
+            "interface": list,
+        },
+    },
+    "object_tagging": {
+        "class": "ObjectTagging",
+        "path": "/system/object-tagging",
+        "mkey": "category",
+        "fields": {
+            "category": str,
+            "address": str,
+            "device": str,
+            "interface": str,
+            "multiple": str,
+            "color": int,
+            "tags": list,
+        },
+    },
+    "password_policy": {
+        "class": "PasswordPolicy",
+        "path": "/system/password-policy",
+        "fields": {
+            "status": str,
+            "apply-to": str,
+            "minimum-length": int,
+            "min-lower-case-letter": int,
+            "min-upper-case-letter": int,
+            "min-non-alphanumeric": int,
+            "min-number": int,
+            "expire-status": str,
+            "expire-day": int,
+            "reuse-password": str,
+            "reuse-password-limit": int,
+            "login-lockout-upon-weaker-encryption": str,
+        },
+    },
+    "password_policy_guest_admin": {
+        "class": "PasswordPolicyGuestAdmin",
+        "path": "/system/password-policy-guest-admin",
+        "fields": {
+            "status": str,
+            "apply-to": str,
+            "minimum-length": int,
+            "min-lower-case-letter": int,
+            "min-upper-case-letter": int,
+            "min-non-alphanumeric": int,
+            "min-number": int,
+            "expire-status": str,
+            "expire-day": int,
+            "reuse-password": str,
+            "reuse-password-limit": int,
+        },
+    },
+    "pcp_server": {
+        "class": "PcpServer",
+        "path": "/system/pcp-server",
+        "fields": {"status": str, "pools": list},
+    },
+    "physical_switch": {
+        "class": "PhysicalSwitch",
+        "path": "/system/physical-switch",
+        "mkey": "name",
+        "fields": {"name": str, "age-enable": str, "age-val": int},
+    },
+    "pppoe_interface": {
+        "class": "PppoeInterface",
+        "path": "/system/pppoe-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "dial-on-demand": str,
+            "ipv6": str,
+            "device": str,
+            "username": str,
+            "password": str,
+            "pppoe-egress-cos": str,
+            "auth-type": str,
+            "ipunnumbered": str,
+            "pppoe-unnumbered-negotiate": str,
+            "idle-timeout": int,
+            "multilink": str,
+            "mrru": int,
+            "disc-retry-timeout": int,
+            "padt-retry-timeout": int,
+            "service-name": str,
+            "ac-name": str,
+            "lcp-echo-interval": int,
+            "lcp-max-echo-fails": int,
+        },
+    },
+    "probe_response": {
+        "class": "ProbeResponse",
+        "path": "/system/probe-response",
+        "fields": {
+            "port": int,
+            "http-probe-value": str,
+            "ttl-mode": str,
+            "mode": str,
+            "security-mode": str,
+            "password": str,
+            "timeout": int,
+        },
+    },
+    "proxy_arp": {
+        "class": "ProxyArp",
+        "path": "/system/proxy-arp",
+        "mkey": "id",
+        "fields": {"id": int, "interface": str, "ip": str, "end-ip": str},
+    },
+    "ptp": {
+        "class": "Ptp",
+        "path": "/system/ptp",
+        "fields": {
+            "status": str,
+            "mode": str,
+            "delay-mechanism": str,
+            "request-interval": int,
+            "interface": str,
+            "server-mode": str,
+            "server-interface": list,
+        },
+    },
+    "replacemsg_admin": {
+        "class": "ReplacemsgAdmin",
+        "path": "/system.replacemsg/admin",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_alertmail": {
+        "class": "ReplacemsgAlertmail",
+        "path": "/system.replacemsg/alertmail",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_auth": {
+        "class": "ReplacemsgAuth",
+        "path": "/system.replacemsg/auth",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_automation": {
+        "class": "ReplacemsgAutomation",
+        "path": "/system.replacemsg/automation",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_group": {
+        "class": "ReplacemsgGroup",
+        "path": "/system/replacemsg-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "group-type": str,
+            "mail": list,
+            "http": list,
+            "fortiguard-wf": list,
+            "spam": list,
+            "alertmail": list,
+            "admin": list,
+            "auth": list,
+            "sslvpn": list,
+            "nac-quar": list,
+            "traffic-quota": list,
+            "utm": list,
+            "custom-message": list,
+            "automation": list,
+        },
+    },
+    "replacemsg_http": {
+        "class": "ReplacemsgHttp",
+        "path": "/system.replacemsg/http",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_image": {
+        "class": "ReplacemsgImage",
+        "path": "/system/replacemsg-image",
+        "mkey": "name",
+        "fields": {"name": str, "image-type": str, "image-base64": str},
+    },
+    "replacemsg_mail": {
+        "class": "ReplacemsgMail",
+        "path": "/system.replacemsg/mail",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_nac_quar": {
+        "class": "ReplacemsgNacQuar",
+        "path": "/system.replacemsg/nac-quar",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_spam": {
+        "class": "ReplacemsgSpam",
+        "path": "/system.replacemsg/spam",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_sslvpn": {
+        "class": "ReplacemsgSslvpn",
+        "path": "/system.replacemsg/sslvpn",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_traffic_quota": {
+        "class": "ReplacemsgTrafficQuota",
+        "path": "/system.replacemsg/traffic-quota",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "replacemsg_utm": {
+        "class": "ReplacemsgUtm",
+        "path": "/system.replacemsg/utm",
+        "mkey": "msg-type",
+        "fields": {"msg-type": str, "buffer": str, "header": str},
+    },
+    "resource_limits": {
+        "class": "ResourceLimits",
+        "path": "/system/resource-limits",
+        "fields": {
+            "session": int,
+            "ipsec-phase1": int,
+            "ipsec-phase2": int,
+            "ipsec-phase1-interface": int,
+            "ipsec-phase2-interface": int,
+            "dialup-tunnel": int,
+            "firewall-policy": int,
+            "firewall-address": int,
+            "firewall-addrgrp": int,
+            "custom-service": int,
+            "service-group": int,
+            "onetime-schedule": int,
+            "recurring-schedule": int,
+            "user": int,
+            "user-group": int,
+            "log-disk-quota": int,
+        },
+    },
+    "saml": {
+        "class": "Saml",
+        "path": "/system/saml",
+        "fields": {
+            "status": str,
+            "role": str,
+            "default-login-page": str,
+            "default-profile": str,
+            "cert": str,
+            "binding-protocol": str,
+            "portal-url": str,
+            "entity-id": str,
+            "single-sign-on-url": str,
+            "single-logout-url": str,
+            "idp-entity-id": str,
+            "idp-single-sign-on-url": str,
+            "idp-single-logout-url": str,
+            "idp-cert": str,
+            "server-address": str,
+            "require-signed-resp-and-asrt": str,
+            "tolerance": int,
+            "life": int,
+            "service-providers": list,
+        },
+    },
+    "sdn_connector": {
+        "class": "SdnConnector",
+        "path": "/system/sdn-connector",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "type": str,
+            "proxy": str,
+            "use-metadata-iam": str,
+            "microsoft-365": str,
+            "ha-status": str,
+            "verify-certificate": str,
+            "server": str,
+            "server-list": list,
+            "server-port": int,
+            "message-server-port": int,
+            "username": str,
+            "password": str,
+            "vcenter-server": str,
+            "vcenter-username": str,
+            "vcenter-password": str,
+            "access-key": str,
+            "secret-key": str,
+            "region": str,
+            "vpc-id": str,
+            "alt-resource-ip": str,
+            "external-account-list": list,
+            "tenant-id": str,
+            "client-id": str,
+            "client-secret": str,
+            "subscription-id": str,
+            "resource-group": str,
+            "login-endpoint": str,
+            "resource-url": str,
+            "azure-region": str,
+            "nic": list,
+            "route-table": list,
+            "user-id": str,
+            "compartment-list": list,
+            "oci-region-list": list,
+            "oci-region-type": str,
+            "oci-cert": str,
+            "oci-fingerprint": str,
+            "external-ip": list,
+            "route": list,
+            "gcp-project-list": list,
+            "forwarding-rule": list,
+            "service-account": str,
+            "private-key": str,
+            "secret-token": str,
+            "domain": str,
+            "group-name": str,
+            "server-cert": str,
+            "server-ca-cert": str,
+            "api-key": str,
+            "ibm-region": str,
+            "par-id": str,
+            "update-interval": int,
+        },
+    },
+    "sdn_proxy": {
+        "class": "SdnProxy",
+        "path": "/system/sdn-proxy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "server": str,
+            "server-port": int,
+            "username": str,
+            "password": str,
+        },
+    },
+    "sdn_vpn": {
+        "class": "SdnVpn",
+        "path": "/system/sdn-vpn",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "sdn": str,
+            "remote-type": str,
+            "routing-type": str,
+            "vgw-id": str,
+            "tgw-id": str,
+            "subnet-id": str,
+            "bgp-as": int,
+            "cgw-gateway": str,
+            "nat-traversal": str,
+            "tunnel-interface": str,
+            "internal-interface": str,
+            "local-cidr": str,
+            "remote-cidr": str,
+            "cgw-name": str,
+            "psksecret": str,
+            "type": int,
+            "status": int,
+            "code": int,
+        },
+    },
+    "sdwan": {
+        "class": "Sdwan",
+        "path": "/system/sdwan",
+        "fields": {
+            "status": str,
+            "load-balance-mode": str,
+            "speedtest-bypass-routing": str,
+            "duplication-max-num": int,
+            "duplication-max-discrepancy": int,
+            "neighbor-hold-down": str,
+            "neighbor-hold-down-time": int,
+            "app-perf-log-period": int,
+            "neighbor-hold-boot-time": int,
+            "fail-detect": str,
+            "fail-alert-interfaces": list,
+            "zone": list,
+            "members": list,
+            "health-check": list,
+            "service": list,
+            "neighbor": list,
+            "duplication": list,
+        },
+    },
+    "security_rating_controls": {
+        "class": "SecurityRatingControls",
+        "path": "/system.security-rating/controls",
+        "mkey": "name",
+        "fields": {"name": str, "display-report": str, "display-insight": str},
+    },
+    "security_rating_settings": {
+        "class": "SecurityRatingSettings",
+        "path": "/system.security-rating/settings",
+        "fields": {"override-sync": str},
+    },
+    "session_helper": {
+        "class": "SessionHelper",
+        "path": "/system/session-helper",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "protocol": int, "port": int},
+    },
+    "session_ttl": {
+        "class": "SessionTtl",
+        "path": "/system/session-ttl",
+        "fields": {"default": str, "port": list},
+    },
+    "settings": {
+        "class": "Settings",
+        "path": "/system/settings",
+        "fields": {
+            "comments": str,
+            "vdom-type": str,
+            "lan-extension-controller-addr": str,
+            "lan-extension-controller-port": int,
+            "opmode": str,
+            "ngfw-mode": str,
+            "http-external-dest": str,
+            "firewall-session-dirty": str,
+            "manageip": str,
+            "gateway": str,
+            "ip": str,
+            "manageip6": str,
+            "gateway6": str,
+            "ip6": str,
+            "device": str,
+            "bfd": str,
+            "bfd-desired-min-tx": int,
+            "bfd-required-min-rx": int,
+            "bfd-detect-mult": int,
+            "bfd-dont-enforce-src-port": str,
+            "utf8-spam-tagging": str,
+            "wccp-cache-engine": str,
+            "vpn-stats-log": str,
+            "vpn-stats-period": int,
+            "v4-ecmp-mode": str,
+            "mac-ttl": int,
+            "fw-session-hairpin": str,
+            "prp-trailer-action": str,
+            "snat-hairpin-traffic": str,
+            "dhcp-proxy": str,
+            "dhcp-proxy-interface-select-method": str,
+            "dhcp-proxy-interface": str,
+            "dhcp-proxy-vrf-select": int,
+            "dhcp-server-ip": str,
+            "dhcp6-server-ip": str,
+            "central-nat": str,
+            "gui-default-policy-columns": list,
+            "lldp-reception": str,
+            "lldp-transmission": str,
+            "link-down-access": str,
+            "nat46-generate-ipv6-fragment-header": str,
+            "nat46-force-ipv4-packet-forwarding": str,
+            "nat64-force-ipv6-packet-forwarding": str,
+            "detect-unknown-esp": str,
+            "intree-ses-best-route": str,
+            "auxiliary-session": str,
+            "asymroute": str,
+            "asymroute-icmp": str,
+            "tcp-session-without-syn": str,
+            "ses-denied-traffic": str,
+            "ses-denied-multicast-traffic": str,
+            "strict-src-check": str,
+            "allow-linkdown-path": str,
+            "asymroute6": str,
+            "asymroute6-icmp": str,
+            "sctp-session-without-init": str,
+            "sip-expectation": str,
+            "sip-nat-trace": str,
+            "h323-direct-model": str,
+            "status": str,
+            "sip-tcp-port": int,
+            "sip-udp-port": int,
+            "sip-ssl-port": int,
+            "sccp-port": int,
+            "multicast-forward": str,
+            "multicast-ttl-notchange": str,
+            "multicast-skip-policy": str,
+            "allow-subnet-overlap": str,
+            "deny-tcp-with-icmp": str,
+            "ecmp-max-paths": int,
+            "discovered-device-timeout": int,
+            "email-portal-check-dns": str,
+            "default-voip-alg-mode": str,
+            "gui-icap": str,
+            "gui-implicit-policy": str,
+            "gui-dns-database": str,
+            "gui-load-balance": str,
+            "gui-multicast-policy": str,
+            "gui-dos-policy": str,
+            "gui-object-colors": str,
+            "gui-route-tag-address-creation": str,
+            "gui-voip-profile": str,
+            "gui-ap-profile": str,
+            "gui-security-profile-group": str,
+            "gui-local-in-policy": str,
+            "gui-explicit-proxy": str,
+            "gui-dynamic-routing": str,
+            "gui-policy-based-ipsec": str,
+            "gui-threat-weight": str,
+            "gui-spamfilter": str,
+            "gui-file-filter": str,
+            "gui-application-control": str,
+            "gui-ips": str,
+            "gui-dhcp-advanced": str,
+            "gui-vpn": str,
+            "gui-wireless-controller": str,
+            "gui-advanced-wireless-features": str,
+            "gui-switch-controller": str,
+            "gui-fortiap-split-tunneling": str,
+            "gui-webfilter-advanced": str,
+            "gui-traffic-shaping": str,
+            "gui-wan-load-balancing": str,
+            "gui-antivirus": str,
+            "gui-webfilter": str,
+            "gui-videofilter": str,
+            "gui-dnsfilter": str,
+            "gui-waf-profile": str,
+            "gui-dlp-profile": str,
+            "gui-dlp-advanced": str,
+            "gui-virtual-patch-profile": str,
+            "gui-casb": str,
+            "gui-fortiextender-controller": str,
+            "gui-advanced-policy": str,
+            "gui-allow-unnamed-policy": str,
+            "gui-email-collection": str,
+            "gui-multiple-interface-policy": str,
+            "gui-policy-disclaimer": str,
+            "gui-ztna": str,
+            "gui-ot": str,
+            "gui-dynamic-device-os-id": str,
+            "location-id": str,
+            "ike-session-resume": str,
+            "ike-quick-crash-detect": str,
+            "ike-dn-format": str,
+            "ike-port": int,
+            "ike-tcp-port": int,
+            "ike-policy-route": str,
+            "ike-detailed-event-logs": str,
+            "block-land-attack": str,
+            "default-app-port-as-service": str,
+            "fqdn-session-check": str,
+            "ext-resource-session-check": str,
+            "dyn-addr-session-check": str,
+            "default-policy-expiry-days": int,
+            "gui-enforce-change-summary": str,
+            "internet-service-database-cache": str,
+            "internet-service-app-ctrl-size": int,
+        },
+    },
+    "sflow": {
+        "class": "Sflow",
+        "path": "/system/sflow",
+        "fields": {"collectors": list},
+    },
+    "sit_tunnel": {
+        "class": "SitTunnel",
+        "path": "/system/sit-tunnel",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "source": str,
+            "destination": str,
+            "ip6": str,
+            "interface": str,
+            "use-sdwan": str,
+            "auto-asic-offload": str,
+        },
+    },
+    "sms_server": {
+        "class": "SmsServer",
+        "path": "/system/sms-server",
+        "mkey": "name",
+        "fields": {"name": str, "mail-server": str},
+    },
+    "snmp_community": {
+        "class": "SnmpCommunity",
+        "path": "/system.snmp/community",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "name": str,
+            "status": str,
+            "hosts": list,
+            "hosts6": list,
+            "query-v1-status": str,
+            "query-v1-port": int,
+            "query-v2c-status": str,
+            "query-v2c-port": int,
+            "trap-v1-status": str,
+            "trap-v1-lport": int,
+            "trap-v1-rport": int,
+            "trap-v2c-status": str,
+            "trap-v2c-lport": int,
+            "trap-v2c-rport": int,
+            "events": str,
+            "mib-view": str,
+            "vdoms": list,
+        },
+    },
+    "snmp_mib_view": {
+        "class": "SnmpMibView",
+        "path": "/system.snmp/mib-view",
+        "mkey": "name",
+        "fields": {"name": str, "include": str, "exclude": str},
+    },
+    "snmp_rmon_stat": {
+        "class": "SnmpRmonStat",
+        "path": "/system.snmp/rmon-stat",
+        "mkey": "id",
+        "fields": {"id": int, "source": str, "owner": str},
+    },
+    "snmp_sysinfo": {
+        "class": "SnmpSysinfo",
+        "path": "/system.snmp/sysinfo",
+        "fields": {
+            "status": str,
+            "engine-id-type": str,
+            "engine-id": str,
+            "description": str,
+            "contact-info": str,
+            "location": str,
+            "trap-high-cpu-threshold": int,
+            "trap-low-memory-threshold": int,
+            "trap-log-full-threshold": int,
+            "trap-free-memory-threshold": int,
+            "trap-freeable-memory-threshold": int,
+            "append-index": str,
+            "non-mgmt-vdom-query": str,
+        },
+    },
+    "snmp_user": {
+        "class": "SnmpUser",
+        "path": "/system.snmp/user",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "trap-status": str,
+            "trap-lport": int,
+            "trap-rport": int,
+            "queries": str,
+            "query-port": int,
+            "notify-hosts": str,
+            "notify-hosts6": str,
+            "source-ip": str,
+            "source-ipv6": str,
+            "ha-direct": str,
+            "events": str,
+            "mib-view": str,
+            "vdoms": list,
+            "security-level": str,
+            "auth-proto": str,
+            "auth-pwd": str,
+            "priv-proto": str,
+            "priv-pwd": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "sov_sase": {
+        "class": "SovSase",
+        "path": "/system/sov-sase",
+        "fields": {"status": str},
+    },
+    "speed_test_schedule": {
+        "class": "SpeedTestSchedule",
+        "path": "/system/speed-test-schedule",
+        "mkey": "interface",
+        "fields": {
+            "interface": str,
+            "status": str,
+            "diffserv": str,
+            "server-name": str,
+            "mode": str,
+            "schedules": list,
+            "dynamic-server": str,
+            "ctrl-port": int,
+            "server-port": int,
+            "update-shaper": str,
+            "update-inbandwidth": str,
+            "update-outbandwidth": str,
+            "update-interface-shaping": str,
+            "update-inbandwidth-maximum": int,
+            "update-inbandwidth-minimum": int,
+            "update-outbandwidth-maximum": int,
+            "update-outbandwidth-minimum": int,
+            "expected-inbandwidth-minimum": int,
+            "expected-inbandwidth-maximum": int,
+            "expected-outbandwidth-minimum": int,
+            "expected-outbandwidth-maximum": int,
+            "retries": int,
+            "retry-pause": int,
+        },
+    },
+    "speed_test_server": {
+        "class": "SpeedTestServer",
+        "path": "/system/speed-test-server",
+        "mkey": "name",
+        "fields": {"name": str, "timestamp": int, "host": list},
+    },
+    "speed_test_setting": {
+        "class": "SpeedTestSetting",
+        "path": "/system/speed-test-setting",
+        "fields": {"latency-threshold": int, "multiple-tcp-stream": int},
+    },
+    "ssh_config": {
+        "class": "SshConfig",
+        "path": "/system/ssh-config",
+        "fields": {
+            "ssh-kex-algo": str,
+            "ssh-enc-algo": str,
+            "ssh-mac-algo": str,
+            "ssh-hsk-algo": str,
+            "ssh-hsk-override": str,
+            "ssh-hsk-password": str,
+            "ssh-hsk": str,
+        },
+    },
+    "sso_admin": {
+        "class": "SsoAdmin",
+        "path": "/system/sso-admin",
+        "mkey": "name",
+        "fields": {"name": str, "accprofile": str},
+    },
+    "sso_forticloud_admin": {
+        "class": "SsoForticloudAdmin",
+        "path": "/system/sso-forticloud-admin",
+        "mkey": "name",
+        "fields": {"name": str, "accprofile": str},
+    },
+    "sso_fortigate_cloud_admin": {
+        "class": "SsoFortigateCloudAdmin",
+        "path": "/system/sso-fortigate-cloud-admin",
+        "mkey": "name",
+        "fields": {"name": str, "accprofile": str},
+    },
+    "standalone_cluster": {
+        "class": "StandaloneCluster",
+        "path": "/system/standalone-cluster",
+        "fields": {
+            "standalone-group-id": int,
+            "group-member-id": int,
+            "layer2-connection": str,
+            "session-sync-dev": str,
+            "encryption": str,
+            "psksecret": str,
+            "asymmetric-traffic-control": str,
+            "cluster-peer": list,
+            "monitor-interface": list,
+            "pingsvr-monitor-interface": list,
+            "monitor-prefix": list,
+            "helper-traffic-bounce": str,
+            "utm-traffic-bounce": str,
+        },
+    },
+    "storage": {
+        "class": "Storage",
+        "path": "/system/storage",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "media-status": str,
+            "order": int,
+            "partition": str,
+            "device": str,
+            "size": int,
+        },
+    },
+    "stp": {
+        "class": "Stp",
+        "path": "/system/stp",
+        "fields": {
+            "switch-priority": str,
+            "hello-time": int,
+            "forward-delay": int,
+            "max-age": int,
+            "max-hops": int,
+            "list": str,
+        },
+    },
+    "switch_interface": {
+        "class": "SwitchInterface",
+        "path": "/system/switch-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "span-dest-port": str,
+            "span-source-port": list,
+            "member": list,
+            "type": str,
+            "intra-switch-policy": str,
+            "mac-ttl": int,
+            "span": str,
+            "span-direction": str,
+        },
+    },
+    "timezone": {
+        "class": "Timezone",
+        "path": "/system/timezone",
+        "mkey": "name",
+        "fields": {"name": str},
+    },
+    "tos_based_priority": {
+        "class": "TosBasedPriority",
+        "path": "/system/tos-based-priority",
+        "mkey": "id",
+        "fields": {"id": int, "tos": int, "priority": str},
+    },
+    "vdom": {
+        "class": "Vdom",
+        "path": "/system/vdom",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "short-name": str,
+            "vcluster-id": int,
+            "flag": int,
+        },
+    },
+    "vdom_dns": {
+        "class": "VdomDns",
+        "path": "/system/vdom-dns",
+        "fields": {
+            "vdom-dns": str,
+            "primary": str,
+            "secondary": str,
+            "protocol": str,
+            "ssl-certificate": str,
+            "server-hostname": list,
+            "ip6-primary": str,
+            "ip6-secondary": str,
+            "source-ip": str,
+            "source-ip-interface": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "server-select-method": str,
+            "alt-primary": str,
+            "alt-secondary": str,
+        },
+    },
+    "vdom_exception": {
+        "class": "VdomException",
+        "path": "/system/vdom-exception",
+        "mkey": "id",
+        "fields": {"id": int, "object": str},
+    },
+    "vdom_link": {
+        "class": "VdomLink",
+        "path": "/system/vdom-link",
+        "mkey": "name",
+        "fields": {"name": str, "vcluster": str, "type": str},
+    },
+    "vdom_netflow": {
+        "class": "VdomNetflow",
+        "path": "/system/vdom-netflow",
+        "fields": {"vdom-netflow": str, "collectors": list},
+    },
+    "vdom_property": {
+        "class": "VdomProperty",
+        "path": "/system/vdom-property",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "snmp-index": int,
+            "session": str,
+            "ipsec-phase1": str,
+            "ipsec-phase2": str,
+            "ipsec-phase1-interface": str,
+            "ipsec-phase2-interface": str,
+            "dialup-tunnel": str,
+            "firewall-policy": str,
+            "firewall-address": str,
+            "firewall-addrgrp": str,
+            "custom-service": str,
+            "service-group": str,
+            "onetime-schedule": str,
+            "recurring-schedule": str,
+            "user": str,
+            "user-group": str,
+            "log-disk-quota": str,
+        },
+    },
+    "vdom_radius_server": {
+        "class": "VdomRadiusServer",
+        "path": "/system/vdom-radius-server",
+        "mkey": "name",
+        "fields": {"name": str, "status": str, "radius-server-vdom": str},
+    },
+    "vdom_sflow": {
+        "class": "VdomSflow",
+        "path": "/system/vdom-sflow",
+        "fields": {"vdom-sflow": str, "collectors": list},
+    },
+    "virtual_switch": {
+        "class": "VirtualSwitch",
+        "path": "/system/virtual-switch",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "physical-switch": str,
+            "vlan": int,
+            "port": list,
+            "span": str,
+            "span-source-port": str,
+            "span-dest-port": str,
+            "span-direction": str,
+        },
+    },
+    "virtual_wire_pair": {
+        "class": "VirtualWirePair",
+        "path": "/system/virtual-wire-pair",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "member": list,
+            "wildcard-vlan": str,
+            "vlan-filter": str,
+        },
+    },
+    "vne_interface": {
+        "class": "VneInterface",
+        "path": "/system/vne-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "ssl-certificate": str,
+            "bmr-hostname": str,
+            "auto-asic-offload": str,
+            "ipv4-address": str,
+            "br": str,
+            "update-url": str,
+            "mode": str,
+            "http-username": str,
+            "http-password": str,
+        },
+    },
+    "vxlan": {
+        "class": "Vxlan",
+        "path": "/system/vxlan",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "vni": int,
+            "ip-version": str,
+            "remote-ip": list,
+            "local-ip": str,
+            "remote-ip6": list,
+            "local-ip6": str,
+            "dstport": int,
+            "multicast-ttl": int,
+            "evpn-id": int,
+            "learn-from-traffic": str,
+        },
+    },
+    "wccp": {
+        "class": "Wccp",
+        "path": "/system/wccp",
+        "mkey": "service-id",
+        "fields": {
+            "service-id": str,
+            "router-id": str,
+            "cache-id": str,
+            "group-address": str,
+            "server-list": str,
+            "router-list": str,
+            "ports-defined": str,
+            "server-type": str,
+            "ports": str,
+            "authentication": str,
+            "password": str,
+            "forward-method": str,
+            "cache-engine-method": str,
+            "service-type": str,
+            "primary-hash": str,
+            "priority": int,
+            "protocol": int,
+            "assignment-weight": int,
+            "assignment-bucket-format": str,
+            "return-method": str,
+            "assignment-method": str,
+            "assignment-srcaddr-mask": str,
+            "assignment-dstaddr-mask": str,
+        },
+    },
+    "zone": {
+        "class": "Zone",
+        "path": "/system/zone",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "tagging": list,
+            "description": str,
+            "intrazone": str,
+            "interface": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
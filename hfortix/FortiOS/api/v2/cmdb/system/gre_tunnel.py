@@ -1,500 +0,0 @@
-"""
-FortiOS CMDB - Cmdb System Gre Tunnel
-
-Configuration endpoint for managing cmdb system gre tunnel objects.
-
-API Endpoints:
-    GET    /cmdb/system/gre_tunnel
-    POST   /cmdb/system/gre_tunnel
-    GET    /cmdb/system/gre_tunnel
-    PUT    /cmdb/system/gre_tunnel/{identifier}
-    DELETE /cmdb/system/gre_tunnel/{identifier}
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # List all items
-    >>> items = fgt.api.cmdb.system.gre_tunnel.get()
-    >>>
-    >>> # Get specific item (if supported)
-    >>> item = fgt.api.cmdb.system.gre_tunnel.get(name="item_name")
-    >>>
-    >>> # Create new item (use POST)
-    >>> result = fgt.api.cmdb.system.gre_tunnel.post(
-    ...     name="new_item",
-    ...     # ... additional parameters
-    ... )
-    >>>
-    >>> # Update existing item (use PUT)
-    >>> result = fgt.api.cmdb.system.gre_tunnel.put(
-    ...     name="existing_item",
-    ...     # ... parameters to update
-    ... )
-    >>>
-    >>> # Delete item
-    >>> result = fgt.api.cmdb.system.gre_tunnel.delete(name="item_name")
-
-Important:
-    - Use **POST** to create new objects (404 error if already exists)
-    - Use **PUT** to update existing objects (404 error if doesn't exist)
-    - Use **GET** to retrieve configuration (no changes made)
-    - Use **DELETE** to remove objects (404 error if doesn't exist)
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union, cast
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class GreTunnel:
-    """
-    Gretunnel Operations.
-
-    Provides CRUD operations for FortiOS gretunnel configuration.
-
-    Methods:
-        get(): Retrieve configuration objects
-        post(): Create new configuration objects
-        put(): Update existing configuration objects
-        delete(): Remove configuration objects
-
-    Important:
-        - POST creates new objects (404 if name already exists)
-        - PUT updates existing objects (404 if name doesn't exist)
-        - GET retrieves objects without making changes
-        - DELETE removes objects (404 if name doesn't exist)
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize GreTunnel endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        attr: str | None = None,
-        skip_to_datasource: dict | None = None,
-        acs: int | None = None,
-        search: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Select a specific entry from a CLI table.
-
-        Args:
-            name: Object identifier (optional for list, required for specific)
-            attr: Attribute name that references other table (optional)
-            skip_to_datasource: Skip to provided table's Nth entry. E.g
-            {datasource: 'firewall.address', pos: 10, global_entry: false}
-            (optional)
-            acs: If true, returned result are in ascending order. (optional)
-            search: If present, the objects will be filtered by the search
-            value. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if name:
-            endpoint = f"/system/gre-tunnel/{name}"
-        else:
-            endpoint = "/system/gre-tunnel"
-        if attr is not None:
-            params["attr"] = attr
-        if skip_to_datasource is not None:
-            params["skip_to_datasource"] = skip_to_datasource
-        if acs is not None:
-            params["acs"] = acs
-        if search is not None:
-            params["search"] = search
-        params.update(kwargs)
-        return self._client.get(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def put(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        before: str | None = None,
-        after: str | None = None,
-        interface: str | None = None,
-        ip_version: str | None = None,
-        remote_gw6: str | None = None,
-        local_gw6: str | None = None,
-        remote_gw: str | None = None,
-        local_gw: str | None = None,
-        use_sdwan: str | None = None,
-        sequence_number_transmission: str | None = None,
-        sequence_number_reception: str | None = None,
-        checksum_transmission: str | None = None,
-        checksum_reception: str | None = None,
-        key_outbound: int | None = None,
-        key_inbound: int | None = None,
-        dscp_copying: str | None = None,
-        diffservcode: str | None = None,
-        keepalive_interval: int | None = None,
-        keepalive_failtimes: int | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Update this specific resource.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            name: Object identifier (required)
-            before: If *action=move*, use *before* to specify the ID of the
-            resource that this resource will be moved before. (optional)
-            after: If *action=move*, use *after* to specify the ID of the
-            resource that this resource will be moved after. (optional)
-            name: Tunnel name. (optional)
-            interface: Interface name. (optional)
-            ip_version: IP version to use for VPN interface. (optional)
-            remote_gw6: IPv6 address of the remote gateway. (optional)
-            local_gw6: IPv6 address of the local gateway. (optional)
-            remote_gw: IP address of the remote gateway. (optional)
-            local_gw: IP address of the local gateway. (optional)
-            use_sdwan: Enable/disable use of SD-WAN to reach remote gateway.
-            (optional)
-            sequence_number_transmission: Enable/disable including of sequence
-            numbers in transmitted GRE packets. (optional)
-            sequence_number_reception: Enable/disable validating sequence
-            numbers in received GRE packets. (optional)
-            checksum_transmission: Enable/disable including checksums in
-            transmitted GRE packets. (optional)
-            checksum_reception: Enable/disable validating checksums in received
-            GRE packets. (optional)
-            key_outbound: Include this key in transmitted GRE packets (0 -
-            4294967295). (optional)
-            key_inbound: Require received GRE packets contain this key (0 -
-            4294967295). (optional)
-            dscp_copying: Enable/disable DSCP copying. (optional)
-            diffservcode: DiffServ setting to be applied to GRE tunnel outer IP
-            header. (optional)
-            keepalive_interval: Keepalive message interval (0 - 32767, 0 =
-            disabled). (optional)
-            keepalive_failtimes: Number of consecutive unreturned keepalive
-            messages before a GRE connection is considered down (1 - 255).
-            (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for put()")
-        endpoint = f"/system/gre-tunnel/{name}"
-        if before is not None:
-            data_payload["before"] = before
-        if after is not None:
-            data_payload["after"] = after
-        if name is not None:
-            data_payload["name"] = name
-        if interface is not None:
-            data_payload["interface"] = interface
-        if ip_version is not None:
-            data_payload["ip-version"] = ip_version
-        if remote_gw6 is not None:
-            data_payload["remote-gw6"] = remote_gw6
-        if local_gw6 is not None:
-            data_payload["local-gw6"] = local_gw6
-        if remote_gw is not None:
-            data_payload["remote-gw"] = remote_gw
-        if local_gw is not None:
-            data_payload["local-gw"] = local_gw
-        if use_sdwan is not None:
-            data_payload["use-sdwan"] = use_sdwan
-        if sequence_number_transmission is not None:
-            data_payload["sequence-number-transmission"] = (
-                sequence_number_transmission
-            )
-        if sequence_number_reception is not None:
-            data_payload["sequence-number-reception"] = (
-                sequence_number_reception
-            )
-        if checksum_transmission is not None:
-            data_payload["checksum-transmission"] = checksum_transmission
-        if checksum_reception is not None:
-            data_payload["checksum-reception"] = checksum_reception
-        if key_outbound is not None:
-            data_payload["key-outbound"] = key_outbound
-        if key_inbound is not None:
-            data_payload["key-inbound"] = key_inbound
-        if dscp_copying is not None:
-            data_payload["dscp-copying"] = dscp_copying
-        if diffservcode is not None:
-            data_payload["diffservcode"] = diffservcode
-        if keepalive_interval is not None:
-            data_payload["keepalive-interval"] = keepalive_interval
-        if keepalive_failtimes is not None:
-            data_payload["keepalive-failtimes"] = keepalive_failtimes
-        data_payload.update(kwargs)
-        return self._client.put(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
-
-    def delete(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Delete this specific resource.
-
-        Args:
-            name: Object identifier (required)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for delete()")
-        endpoint = f"/system/gre-tunnel/{name}"
-        params.update(kwargs)
-        return self._client.delete(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def exists(
-        self,
-        name: str,
-        vdom: str | bool | None = None,
-    ) -> Union[bool, Coroutine[Any, Any, bool]]:
-        """
-        Check if an object exists.
-
-        Args:
-            name: Object identifier
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-
-        Returns:
-            True if object exists, False otherwise
-
-        Example:
-            >>> if fgt.api.cmdb.firewall.address.exists("server1"):
-            ...     print("Address exists")
-        """
-        import inspect
-
-        from hfortix.FortiOS.exceptions_forti import ResourceNotFoundError
-
-        # Call get() - returns dict (sync) or coroutine (async)
-        result = self.get(name=name, vdom=vdom)
-
-        # Check if async mode
-        if inspect.iscoroutine(result):
-
-            async def _async():
-                try:
-                    # Runtime check confirms result is a coroutine, cast for
-                    # mypy
-                    await cast(Coroutine[Any, Any, dict[str, Any]], result)
-                    return True
-                except ResourceNotFoundError:
-                    return False
-
-            # Type ignore justified: mypy can't verify Union return type
-            # narrowing
-
-            return _async()
-        # Sync mode - get() already executed, no exception means it exists
-        return True
-
-    def post(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        nkey: str | None = None,
-        name: str | None = None,
-        interface: str | None = None,
-        ip_version: str | None = None,
-        remote_gw6: str | None = None,
-        local_gw6: str | None = None,
-        remote_gw: str | None = None,
-        local_gw: str | None = None,
-        use_sdwan: str | None = None,
-        sequence_number_transmission: str | None = None,
-        sequence_number_reception: str | None = None,
-        checksum_transmission: str | None = None,
-        checksum_reception: str | None = None,
-        key_outbound: int | None = None,
-        key_inbound: int | None = None,
-        dscp_copying: str | None = None,
-        diffservcode: str | None = None,
-        keepalive_interval: int | None = None,
-        keepalive_failtimes: int | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Create object(s) in this table.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            nkey: If *action=clone*, use *nkey* to specify the ID for the new
-            resource to be created. (optional)
-            name: Tunnel name. (optional)
-            interface: Interface name. (optional)
-            ip_version: IP version to use for VPN interface. (optional)
-            remote_gw6: IPv6 address of the remote gateway. (optional)
-            local_gw6: IPv6 address of the local gateway. (optional)
-            remote_gw: IP address of the remote gateway. (optional)
-            local_gw: IP address of the local gateway. (optional)
-            use_sdwan: Enable/disable use of SD-WAN to reach remote gateway.
-            (optional)
-            sequence_number_transmission: Enable/disable including of sequence
-            numbers in transmitted GRE packets. (optional)
-            sequence_number_reception: Enable/disable validating sequence
-            numbers in received GRE packets. (optional)
-            checksum_transmission: Enable/disable including checksums in
-            transmitted GRE packets. (optional)
-            checksum_reception: Enable/disable validating checksums in received
-            GRE packets. (optional)
-            key_outbound: Include this key in transmitted GRE packets (0 -
-            4294967295). (optional)
-            key_inbound: Require received GRE packets contain this key (0 -
-            4294967295). (optional)
-            dscp_copying: Enable/disable DSCP copying. (optional)
-            diffservcode: DiffServ setting to be applied to GRE tunnel outer IP
-            header. (optional)
-            keepalive_interval: Keepalive message interval (0 - 32767, 0 =
-            disabled). (optional)
-            keepalive_failtimes: Number of consecutive unreturned keepalive
-            messages before a GRE connection is considered down (1 - 255).
-            (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-        endpoint = "/system/gre-tunnel"
-        if nkey is not None:
-            data_payload["nkey"] = nkey
-        if name is not None:
-            data_payload["name"] = name
-        if interface is not None:
-            data_payload["interface"] = interface
-        if ip_version is not None:
-            data_payload["ip-version"] = ip_version
-        if remote_gw6 is not None:
-            data_payload["remote-gw6"] = remote_gw6
-        if local_gw6 is not None:
-            data_payload["local-gw6"] = local_gw6
-        if remote_gw is not None:
-            data_payload["remote-gw"] = remote_gw
-        if local_gw is not None:
-            data_payload["local-gw"] = local_gw
-        if use_sdwan is not None:
-            data_payload["use-sdwan"] = use_sdwan
-        if sequence_number_transmission is not None:
-            data_payload["sequence-number-transmission"] = (
-                sequence_number_transmission
-            )
-        if sequence_number_reception is not None:
-            data_payload["sequence-number-reception"] = (
-                sequence_number_reception
-            )
-        if checksum_transmission is not None:
-            data_payload["checksum-transmission"] = checksum_transmission
-        if checksum_reception is not None:
-            data_payload["checksum-reception"] = checksum_reception
-        if key_outbound is not None:
-            data_payload["key-outbound"] = key_outbound
-        if key_inbound is not None:
-            data_payload["key-inbound"] = key_inbound
-        if dscp_copying is not None:
-            data_payload["dscp-copying"] = dscp_copying
-        if diffservcode is not None:
-            data_payload["diffservcode"] = diffservcode
-        if keepalive_interval is not None:
-            data_payload["keepalive-interval"] = keepalive_interval
-        if keepalive_failtimes is not None:
-            data_payload["keepalive-failtimes"] = keepalive_failtimes
-        data_payload.update(kwargs)
-        return self._client.post(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
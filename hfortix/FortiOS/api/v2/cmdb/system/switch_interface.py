@@ -1,424 +0,0 @@
-"""
-FortiOS CMDB - Cmdb System Switch Interface
-
-Configuration endpoint for managing cmdb system switch interface objects.
-
-API Endpoints:
-    GET    /cmdb/system/switch_interface
-    POST   /cmdb/system/switch_interface
-    GET    /cmdb/system/switch_interface
-    PUT    /cmdb/system/switch_interface/{identifier}
-    DELETE /cmdb/system/switch_interface/{identifier}
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # List all items
-    >>> items = fgt.api.cmdb.system.switch_interface.get()
-    >>>
-    >>> # Get specific item (if supported)
-    >>> item = fgt.api.cmdb.system.switch_interface.get(name="item_name")
-    >>>
-    >>> # Create new item (use POST)
-    >>> result = fgt.api.cmdb.system.switch_interface.post(
-    ...     name="new_item",
-    ...     # ... additional parameters
-    ... )
-    >>>
-    >>> # Update existing item (use PUT)
-    >>> result = fgt.api.cmdb.system.switch_interface.put(
-    ...     name="existing_item",
-    ...     # ... parameters to update
-    ... )
-    >>>
-    >>> # Delete item
-    >>> result = fgt.api.cmdb.system.switch_interface.delete(name="item_name")
-
-Important:
-    - Use **POST** to create new objects (404 error if already exists)
-    - Use **PUT** to update existing objects (404 error if doesn't exist)
-    - Use **GET** to retrieve configuration (no changes made)
-    - Use **DELETE** to remove objects (404 error if doesn't exist)
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union, cast
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class SwitchInterface:
-    """
-    Switchinterface Operations.
-
-    Provides CRUD operations for FortiOS switchinterface configuration.
-
-    Methods:
-        get(): Retrieve configuration objects
-        post(): Create new configuration objects
-        put(): Update existing configuration objects
-        delete(): Remove configuration objects
-
-    Important:
-        - POST creates new objects (404 if name already exists)
-        - PUT updates existing objects (404 if name doesn't exist)
-        - GET retrieves objects without making changes
-        - DELETE removes objects (404 if name doesn't exist)
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize SwitchInterface endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        attr: str | None = None,
-        skip_to_datasource: dict | None = None,
-        acs: int | None = None,
-        search: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Select a specific entry from a CLI table.
-
-        Args:
-            name: Object identifier (optional for list, required for specific)
-            attr: Attribute name that references other table (optional)
-            skip_to_datasource: Skip to provided table's Nth entry. E.g
-            {datasource: 'firewall.address', pos: 10, global_entry: false}
-            (optional)
-            acs: If true, returned result are in ascending order. (optional)
-            search: If present, the objects will be filtered by the search
-            value. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if name:
-            endpoint = f"/system/switch-interface/{name}"
-        else:
-            endpoint = "/system/switch-interface"
-        if attr is not None:
-            params["attr"] = attr
-        if skip_to_datasource is not None:
-            params["skip_to_datasource"] = skip_to_datasource
-        if acs is not None:
-            params["acs"] = acs
-        if search is not None:
-            params["search"] = search
-        params.update(kwargs)
-        return self._client.get(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def put(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        before: str | None = None,
-        after: str | None = None,
-        span_dest_port: str | None = None,
-        span_source_port: list | None = None,
-        member: list | None = None,
-        type: str | None = None,
-        intra_switch_policy: str | None = None,
-        mac_ttl: int | None = None,
-        span: str | None = None,
-        span_direction: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Update this specific resource.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            name: Object identifier (required)
-            before: If *action=move*, use *before* to specify the ID of the
-            resource that this resource will be moved before. (optional)
-            after: If *action=move*, use *after* to specify the ID of the
-            resource that this resource will be moved after. (optional)
-            name: Interface name (name cannot be in use by any other
-            interfaces, VLANs, or inter-VDOM links). (optional)
-            span_dest_port: SPAN destination port name. All traffic on the SPAN
-            source ports is echoed to the SPAN destination port. (optional)
-            span_source_port: Physical interface name. Port spanning echoes all
-            traffic on the SPAN source ports to the SPAN destination port.
-            (optional)
-            member: Names of the interfaces that belong to the virtual switch.
-            (optional)
-            type: Type of switch based on functionality: switch for normal
-            functionality, or hub to duplicate packets to all port members.
-            (optional)
-            intra_switch_policy: Allow any traffic between switch interfaces or
-            require firewall policies to allow traffic between switch
-            interfaces. (optional)
-            mac_ttl: Duration for which MAC addresses are held in the ARP table
-            (300 - 8640000 sec, default = 300). (optional)
-            span: Enable/disable port spanning. Port spanning echoes traffic
-            received by the software switch to the span destination port.
-            (optional)
-            span_direction: The direction in which the SPAN port operates,
-            either: rx, tx, or both. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for put()")
-        endpoint = f"/system/switch-interface/{name}"
-        if before is not None:
-            data_payload["before"] = before
-        if after is not None:
-            data_payload["after"] = after
-        if name is not None:
-            data_payload["name"] = name
-        if span_dest_port is not None:
-            data_payload["span-dest-port"] = span_dest_port
-        if span_source_port is not None:
-            data_payload["span-source-port"] = span_source_port
-        if member is not None:
-            data_payload["member"] = member
-        if type is not None:
-            data_payload["type"] = type
-        if intra_switch_policy is not None:
-            data_payload["intra-switch-policy"] = intra_switch_policy
-        if mac_ttl is not None:
-            data_payload["mac-ttl"] = mac_ttl
-        if span is not None:
-            data_payload["span"] = span
-        if span_direction is not None:
-            data_payload["span-direction"] = span_direction
-        data_payload.update(kwargs)
-        return self._client.put(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
-
-    def delete(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Delete this specific resource.
-
-        Args:
-            name: Object identifier (required)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for delete()")
-        endpoint = f"/system/switch-interface/{name}"
-        params.update(kwargs)
-        return self._client.delete(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def exists(
-        self,
-        name: str,
-        vdom: str | bool | None = None,
-    ) -> Union[bool, Coroutine[Any, Any, bool]]:
-        """
-        Check if an object exists.
-
-        Args:
-            name: Object identifier
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-
-        Returns:
-            True if object exists, False otherwise
-
-        Example:
-            >>> if fgt.api.cmdb.firewall.address.exists("server1"):
-            ...     print("Address exists")
-        """
-        import inspect
-
-        from hfortix.FortiOS.exceptions_forti import ResourceNotFoundError
-
-        # Call get() - returns dict (sync) or coroutine (async)
-        result = self.get(name=name, vdom=vdom)
-
-        # Check if async mode
-        if inspect.iscoroutine(result):
-
-            async def _async():
-                try:
-                    # Runtime check confirms result is a coroutine, cast for
-                    # mypy
-                    await cast(Coroutine[Any, Any, dict[str, Any]], result)
-                    return True
-                except ResourceNotFoundError:
-                    return False
-
-            # Type ignore justified: mypy can't verify Union return type
-            # narrowing
-
-            return _async()
-        # Sync mode - get() already executed, no exception means it exists
-        return True
-
-    def post(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        nkey: str | None = None,
-        name: str | None = None,
-        span_dest_port: str | None = None,
-        span_source_port: list | None = None,
-        member: list | None = None,
-        type: str | None = None,
-        intra_switch_policy: str | None = None,
-        mac_ttl: int | None = None,
-        span: str | None = None,
-        span_direction: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Create object(s) in this table.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            nkey: If *action=clone*, use *nkey* to specify the ID for the new
-            resource to be created. (optional)
-            name: Interface name (name cannot be in use by any other
-            interfaces, VLANs, or inter-VDOM links). (optional)
-            span_dest_port: SPAN destination port name. All traffic on the SPAN
-            source ports is echoed to the SPAN destination port. (optional)
-            span_source_port: Physical interface name. Port spanning echoes all
-            traffic on the SPAN source ports to the SPAN destination port.
-            (optional)
-            member: Names of the interfaces that belong to the virtual switch.
-            (optional)
-            type: Type of switch based on functionality: switch for normal
-            functionality, or hub to duplicate packets to all port members.
-            (optional)
-            intra_switch_policy: Allow any traffic between switch interfaces or
-            require firewall policies to allow traffic between switch
-            interfaces. (optional)
-            mac_ttl: Duration for which MAC addresses are held in the ARP table
-            (300 - 8640000 sec, default = 300). (optional)
-            span: Enable/disable port spanning. Port spanning echoes traffic
-            received by the software switch to the span destination port.
-            (optional)
-            span_direction: The direction in which the SPAN port operates,
-            either: rx, tx, or both. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-        endpoint = "/system/switch-interface"
-        if nkey is not None:
-            data_payload["nkey"] = nkey
-        if name is not None:
-            data_payload["name"] = name
-        if span_dest_port is not None:
-            data_payload["span-dest-port"] = span_dest_port
-        if span_source_port is not None:
-            data_payload["span-source-port"] = span_source_port
-        if member is not None:
-            data_payload["member"] = member
-        if type is not None:
-            data_payload["type"] = type
-        if intra_switch_policy is not None:
-            data_payload["intra-switch-policy"] = intra_switch_policy
-        if mac_ttl is not None:
-            data_payload["mac-ttl"] = mac_ttl
-        if span is not None:
-            data_payload["span"] = span
-        if span_direction is not None:
-            data_payload["span-direction"] = span_direction
-        data_payload.update(kwargs)
-        return self._client.post(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
@@ -1,29 +1,16 @@
 """FortiOS CMDB - User category"""
 
-from .adgrp import Adgrp
-from .certificate import Certificate
-from .domain_controller import DomainController
-from .exchange import Exchange
-from .external_identity_provider import ExternalIdentityProvider
-from .fortitoken import Fortitoken
-from .fsso import Fsso
-from .fsso_polling import FssoPolling
-from .group import Group
-from .krb_keytab import KrbKeytab
-from .ldap import Ldap
-from .local import Local
-from .nac_policy import NacPolicy
-from .password_policy import PasswordPolicy
-from .peer import Peer
-from .peergrp import Peergrp
-from .pop3 import Pop3
-from .quarantine import Quarantine
-from .radius import Radius
-from .saml import Saml
-from .scim import Scim
-from .security_exempt_list import SecurityExemptList
-from .setting import Setting
-from .tacacs_plus_ import TacacsPlus
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
+    from .fortitoken import Fortitoken
+
 
 __all__ = [
     "Adgrp",
@@ -52,6 +39,36 @@ __all__ = [
     "TacacsPlus",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Adgrp": "._registry",
+        "Certificate": "._registry",
+        "DomainController": "._registry",
+        "Exchange": "._registry",
+        "ExternalIdentityProvider": "._registry",
+        "Fortitoken": ".fortitoken",
+        "Fsso": "._registry",
+        "FssoPolling": "._registry",
+        "Group": "._registry",
+        "KrbKeytab": "._registry",
+        "Ldap": "._registry",
+        "Local": "._registry",
+        "NacPolicy": "._registry",
+        "PasswordPolicy": "._registry",
+        "Peer": "._registry",
+        "Peergrp": "._registry",
+        "Pop3": "._registry",
+        "Quarantine": "._registry",
+        "Radius": "._registry",
+        "Saml": "._registry",
+        "Scim": "._registry",
+        "SecurityExemptList": "._registry",
+        "Setting": "._registry",
+        "TacacsPlus": "._registry",
+    },
+)
+
 
 class User:
     """
@@ -60,6 +77,39 @@ class User:
     This class provides access to all user CMDB endpoints.
     """
 
+    adgrp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Adgrp")
+    certificate: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Certificate")
+    domain_controller: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "DomainController"
+    )
+    exchange: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Exchange")
+    external_identity_provider: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ExternalIdentityProvider"
+    )
+    fortitoken: LazyEndpoint[Fortitoken] = LazyEndpoint("Fortitoken")
+    fsso: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fsso")
+    fsso_polling: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FssoPolling")
+    group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Group")
+    krb_keytab: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("KrbKeytab")
+    ldap: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Ldap")
+    local: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Local")
+    nac_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("NacPolicy")
+    password_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "PasswordPolicy"
+    )
+    peer: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Peer")
+    peergrp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Peergrp")
+    pop3: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Pop3")
+    quarantine: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Quarantine")
+    radius: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Radius")
+    saml: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Saml")
+    scim: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Scim")
+    security_exempt_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "SecurityExemptList"
+    )
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+    tacacs_plus_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("TacacsPlus")
+
     def __init__(self, client):
         """
         Initialize User with all endpoint classes.
@@ -67,27 +117,4 @@ class User:
         Args:
             client: HTTPClient instance
         """
-        self.adgrp = Adgrp(client)
-        self.certificate = Certificate(client)
-        self.domain_controller = DomainController(client)
-        self.exchange = Exchange(client)
-        self.external_identity_provider = ExternalIdentityProvider(client)
-        self.fortitoken = Fortitoken(client)
-        self.fsso = Fsso(client)
-        self.fsso_polling = FssoPolling(client)
-        self.group = Group(client)
-        self.krb_keytab = KrbKeytab(client)
-        self.ldap = Ldap(client)
-        self.local = Local(client)
-        self.nac_policy = NacPolicy(client)
-        self.password_policy = PasswordPolicy(client)
-        self.peer = Peer(client)
-        self.peergrp = Peergrp(client)
-        self.pop3 = Pop3(client)
-        self.quarantine = Quarantine(client)
-        self.radius = Radius(client)
-        self.saml = Saml(client)
-        self.scim = Scim(client)
-        self.security_exempt_list = SecurityExemptList(client)
-        self.setting = Setting(client)
-        self.tacacs_plus_ = TacacsPlus(client)
+        self._client = client
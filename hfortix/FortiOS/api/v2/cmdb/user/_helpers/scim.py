@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = ["enable", "disable"]
@@ -17,248 +17,24 @@ VALID_BODY_CLIENT_IDENTITY_CHECK = ["enable", "disable"]
 VALID_BODY_CASCADE = ["disable", "enable"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_scim_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_scim_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating scim.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate base-url if present
-    if "base-url" in payload:
-        value = payload.get("base-url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "base-url cannot exceed 127 characters")
-
-    # Validate auth-method if present
-    if "auth-method" in payload:
-        value = payload.get("auth-method")
-        if value and value not in VALID_BODY_AUTH_METHOD:
-            return (
-                False,
-                f"Invalid auth-method '{value}'. Must be one of: {', '.join(VALID_BODY_AUTH_METHOD)}",
-            )
-
-    # Validate token-certificate if present
-    if "token-certificate" in payload:
-        value = payload.get("token-certificate")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "token-certificate cannot exceed 79 characters")
-
-    # Validate certificate if present
-    if "certificate" in payload:
-        value = payload.get("certificate")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "certificate cannot exceed 79 characters")
-
-    # Validate client-identity-check if present
-    if "client-identity-check" in payload:
-        value = payload.get("client-identity-check")
-        if value and value not in VALID_BODY_CLIENT_IDENTITY_CHECK:
-            return (
-                False,
-                f"Invalid client-identity-check '{value}'. Must be one of: {', '.join(VALID_BODY_CLIENT_IDENTITY_CHECK)}",
-            )
-
-    # Validate cascade if present
-    if "cascade" in payload:
-        value = payload.get("cascade")
-        if value and value not in VALID_BODY_CASCADE:
-            return (
-                False,
-                f"Invalid cascade '{value}'. Must be one of: {', '.join(VALID_BODY_CASCADE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_scim_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate id if present
-    if "id" in payload:
-        value = payload.get("id")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 4294967295:
-                    return (False, "id must be between 0 and 4294967295")
-            except (ValueError, TypeError):
-                return (False, f"id must be numeric, got: {value}")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate base-url if present
-    if "base-url" in payload:
-        value = payload.get("base-url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "base-url cannot exceed 127 characters")
-
-    # Validate auth-method if present
-    if "auth-method" in payload:
-        value = payload.get("auth-method")
-        if value and value not in VALID_BODY_AUTH_METHOD:
-            return (
-                False,
-                f"Invalid auth-method '{value}'. Must be one of: {', '.join(VALID_BODY_AUTH_METHOD)}",
-            )
-
-    # Validate token-certificate if present
-    if "token-certificate" in payload:
-        value = payload.get("token-certificate")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "token-certificate cannot exceed 79 characters")
-
-    # Validate certificate if present
-    if "certificate" in payload:
-        value = payload.get("certificate")
-        if value and isinstance(value, str) and len(value) > 79:
-            return (False, "certificate cannot exceed 79 characters")
-
-    # Validate client-identity-check if present
-    if "client-identity-check" in payload:
-        value = payload.get("client-identity-check")
-        if value and value not in VALID_BODY_CLIENT_IDENTITY_CHECK:
-            return (
-                False,
-                f"Invalid client-identity-check '{value}'. Must be one of: {', '.join(VALID_BODY_CLIENT_IDENTITY_CHECK)}",
-            )
-
-    # Validate cascade if present
-    if "cascade" in payload:
-        value = payload.get("cascade")
-        if value and value not in VALID_BODY_CASCADE:
-            return (
-                False,
-                f"Invalid cascade '{value}'. Must be one of: {', '.join(VALID_BODY_CASCADE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_scim_delete(name: str | None = None) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "id": (0, 4294967295),
+        "status": VALID_BODY_STATUS,
+        "base-url": 127,
+        "auth-method": VALID_BODY_AUTH_METHOD,
+        "token-certificate": 79,
+        "certificate": 79,
+        "client-identity-check": VALID_BODY_CLIENT_IDENTITY_CHECK,
+        "cascade": VALID_BODY_CASCADE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_scim_get = SCHEMA.get_validator()
+validate_scim_post = SCHEMA.post_validator()
+validate_scim_put = SCHEMA.put_validator("name")
+validate_scim_delete = SCHEMA.delete_validator("name")
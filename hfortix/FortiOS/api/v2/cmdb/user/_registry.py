@@ -0,0 +1,563 @@
+"""FortiOS CMDB - User endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "adgrp": {
+        "class": "Adgrp",
+        "path": "/user/adgrp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server-name": str,
+            "connector-source": str,
+            "id": int,
+        },
+    },
+    "certificate": {
+        "class": "Certificate",
+        "path": "/user/certificate",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "status": str,
+            "type": str,
+            "common-name": str,
+            "issuer": str,
+        },
+    },
+    "domain_controller": {
+        "class": "DomainController",
+        "path": "/user/domain-controller",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ad-mode": str,
+            "hostname": str,
+            "username": str,
+            "password": str,
+            "ip-address": str,
+            "ip6": str,
+            "port": int,
+            "source-ip-address": str,
+            "source-ip6": str,
+            "source-port": int,
+            "interface-select-method": str,
+            "interface": str,
+            "extra-server": list,
+            "domain-name": str,
+            "replication-port": int,
+            "ldap-server": list,
+            "change-detection": str,
+            "change-detection-period": int,
+            "dns-srv-lookup": str,
+            "adlds-dn": str,
+            "adlds-ip-address": str,
+            "adlds-ip6": str,
+            "adlds-port": int,
+        },
+    },
+    "exchange": {
+        "class": "Exchange",
+        "path": "/user/exchange",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server-name": str,
+            "domain-name": str,
+            "username": str,
+            "password": str,
+            "ip": str,
+            "connect-protocol": str,
+            "validate-server-certificate": str,
+            "auth-type": str,
+            "auth-level": str,
+            "http-auth-type": str,
+            "ssl-min-proto-version": str,
+            "auto-discover-kdc": str,
+            "kdc-ip": list,
+        },
+    },
+    "external_identity_provider": {
+        "class": "ExternalIdentityProvider",
+        "path": "/user/external-identity-provider",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "version": str,
+            "url": str,
+            "user-attr-name": str,
+            "group-attr-name": str,
+            "port": int,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "server-identity-check": str,
+            "timeout": int,
+        },
+    },
+    "fsso": {
+        "class": "Fsso",
+        "path": "/user/fsso",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "server": str,
+            "port": int,
+            "password": str,
+            "server2": str,
+            "port2": int,
+            "password2": str,
+            "server3": str,
+            "port3": int,
+            "password3": str,
+            "server4": str,
+            "port4": int,
+            "password4": str,
+            "server5": str,
+            "port5": int,
+            "password5": str,
+            "logon-timeout": int,
+            "ldap-server": str,
+            "group-poll-interval": int,
+            "ldap-poll": str,
+            "ldap-poll-interval": int,
+            "ldap-poll-filter": str,
+            "user-info-server": str,
+            "ssl": str,
+            "sni": str,
+            "ssl-server-host-ip-check": str,
+            "ssl-trusted-cert": str,
+            "source-ip": str,
+            "source-ip6": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+    "fsso_polling": {
+        "class": "FssoPolling",
+        "path": "/user/fsso-polling",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "status": str,
+            "server": str,
+            "default-domain": str,
+            "port": int,
+            "user": str,
+            "password": str,
+            "ldap-server": str,
+            "logon-history": int,
+            "polling-frequency": int,
+            "adgrp": list,
+            "smbv1": str,
+            "smb-ntlmv1-auth": str,
+        },
+    },
+    "group": {
+        "class": "Group",
+        "path": "/user/group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "group-type": str,
+            "authtimeout": int,
+            "auth-concurrent-override": str,
+            "auth-concurrent-value": int,
+            "http-digest-realm": str,
+            "sso-attribute-value": str,
+            "member": list,
+            "match": list,
+            "user-id": str,
+            "password": str,
+            "user-name": str,
+            "sponsor": str,
+            "company": str,
+            "email": str,
+            "mobile-phone": str,
+            "sms-server": str,
+            "sms-custom-server": str,
+            "expire-type": str,
+            "expire": int,
+            "max-accounts": int,
+            "multiple-guest-add": str,
+            "guest": list,
+        },
+    },
+    "krb_keytab": {
+        "class": "KrbKeytab",
+        "path": "/user/krb-keytab",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "pac-data": str,
+            "principal": str,
+            "ldap-server": list,
+            "keytab": str,
+        },
+    },
+    "ldap": {
+        "class": "Ldap",
+        "path": "/user/ldap",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "secondary-server": str,
+            "tertiary-server": str,
+            "status-ttl": int,
+            "server-identity-check": str,
+            "source-ip": str,
+            "source-ip-interface": str,
+            "source-port": int,
+            "cnid": str,
+            "dn": str,
+            "type": str,
+            "two-factor": str,
+            "two-factor-authentication": str,
+            "two-factor-notification": str,
+            "two-factor-filter": str,
+            "username": str,
+            "password": str,
+            "group-member-check": str,
+            "group-search-base": str,
+            "group-object-filter": str,
+            "group-filter": str,
+            "secure": str,
+            "ssl-min-proto-version": str,
+            "ca-cert": str,
+            "port": int,
+            "password-expiry-warning": str,
+            "password-renewal": str,
+            "member-attr": str,
+            "account-key-processing": str,
+            "account-key-cert-field": str,
+            "account-key-filter": str,
+            "search-type": str,
+            "client-cert-auth": str,
+            "client-cert": str,
+            "obtain-user-info": str,
+            "user-info-exchange-server": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "antiphish": str,
+            "password-attr": str,
+        },
+    },
+    "local": {
+        "class": "Local",
+        "path": "/user/local",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "status": str,
+            "type": str,
+            "passwd": str,
+            "ldap-server": str,
+            "radius-server": str,
+            "tacacs+-server": str,
+            "saml-server": str,
+            "two-factor": str,
+            "two-factor-authentication": str,
+            "two-factor-notification": str,
+            "fortitoken": str,
+            "email-to": str,
+            "sms-server": str,
+            "sms-custom-server": str,
+            "sms-phone": str,
+            "passwd-policy": str,
+            "passwd-time": str,
+            "authtimeout": int,
+            "workstation": str,
+            "auth-concurrent-override": str,
+            "auth-concurrent-value": int,
+            "ppk-secret": str,
+            "ppk-identity": str,
+            "qkd-profile": str,
+            "username-sensitivity": str,
+        },
+    },
+    "nac_policy": {
+        "class": "NacPolicy",
+        "path": "/user/nac-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "description": str,
+            "category": str,
+            "status": str,
+            "match-type": str,
+            "match-period": int,
+            "match-remove": str,
+            "mac": str,
+            "hw-vendor": str,
+            "type": str,
+            "family": str,
+            "os": str,
+            "hw-version": str,
+            "sw-version": str,
+            "host": str,
+            "user": str,
+            "src": str,
+            "user-group": str,
+            "ems-tag": str,
+            "fortivoice-tag": str,
+            "severity": list,
+            "switch-fortilink": str,
+            "switch-group": list,
+            "switch-mac-policy": str,
+            "firewall-address": str,
+            "ssid-policy": str,
+        },
+    },
+    "password_policy": {
+        "class": "PasswordPolicy",
+        "path": "/user/password-policy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "expire-status": str,
+            "expire-days": int,
+            "warn-days": int,
+            "expired-password-renewal": str,
+            "minimum-length": int,
+            "min-lower-case-letter": int,
+            "min-upper-case-letter": int,
+            "min-non-alphanumeric": int,
+            "min-number": int,
+            "min-change-characters": int,
+            "reuse-password": str,
+            "reuse-password-limit": int,
+        },
+    },
+    "peer": {
+        "class": "Peer",
+        "path": "/user/peer",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "mandatory-ca-verify": str,
+            "ca": str,
+            "subject": str,
+            "cn": str,
+            "cn-type": str,
+            "mfa-mode": str,
+            "mfa-server": str,
+            "mfa-username": str,
+            "mfa-password": str,
+            "ocsp-override-server": str,
+            "two-factor": str,
+            "passwd": str,
+        },
+    },
+    "peergrp": {
+        "class": "Peergrp",
+        "path": "/user/peergrp",
+        "mkey": "name",
+        "fields": {"name": str, "member": list},
+    },
+    "pop3": {
+        "class": "Pop3",
+        "path": "/user/pop3",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "port": int,
+            "secure": str,
+            "ssl-min-proto-version": str,
+        },
+    },
+    "quarantine": {
+        "class": "Quarantine",
+        "path": "/user/quarantine",
+        "fields": {
+            "quarantine": str,
+            "traffic-policy": str,
+            "firewall-groups": str,
+            "targets": list,
+        },
+    },
+    "radius": {
+        "class": "Radius",
+        "path": "/user/radius",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "secret": str,
+            "secondary-server": str,
+            "secondary-secret": str,
+            "tertiary-server": str,
+            "tertiary-secret": str,
+            "timeout": int,
+            "status-ttl": int,
+            "all-usergroup": str,
+            "use-management-vdom": str,
+            "switch-controller-nas-ip-dynamic": str,
+            "nas-ip": str,
+            "nas-id-type": str,
+            "call-station-id-type": str,
+            "nas-id": str,
+            "acct-interim-interval": int,
+            "radius-coa": str,
+            "radius-port": int,
+            "h3c-compatibility": str,
+            "auth-type": str,
+            "source-ip": str,
+            "source-ip-interface": str,
+            "username-case-sensitive": str,
+            "group-override-attr-type": str,
+            "class": list,
+            "password-renewal": str,
+            "require-message-authenticator": str,
+            "password-encoding": str,
+            "mac-username-delimiter": str,
+            "mac-password-delimiter": str,
+            "mac-case": str,
+            "acct-all-servers": str,
+            "switch-controller-acct-fast-framedip-detect": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "switch-controller-service-type": str,
+            "transport-protocol": str,
+            "tls-min-proto-version": str,
+            "ca-cert": str,
+            "client-cert": str,
+            "server-identity-check": str,
+            "account-key-processing": str,
+            "account-key-cert-field": str,
+            "rsso": str,
+            "rsso-radius-server-port": int,
+            "rsso-radius-response": str,
+            "rsso-validate-request-secret": str,
+            "rsso-secret": str,
+            "rsso-endpoint-attribute": str,
+            "rsso-endpoint-block-attribute": str,
+            "sso-attribute": str,
+            "sso-attribute-key": str,
+            "sso-attribute-value-override": str,
+            "rsso-context-timeout": int,
+            "rsso-log-period": int,
+            "rsso-log-flags": str,
+            "rsso-flush-ip-session": str,
+            "rsso-ep-one-ip-only": str,
+            "delimiter": str,
+            "accounting-server": list,
+        },
+    },
+    "saml": {
+        "class": "Saml",
+        "path": "/user/saml",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "cert": str,
+            "entity-id": str,
+            "single-sign-on-url": str,
+            "single-logout-url": str,
+            "idp-entity-id": str,
+            "idp-single-sign-on-url": str,
+            "idp-single-logout-url": str,
+            "idp-cert": str,
+            "scim-client": str,
+            "scim-user-attr-type": str,
+            "scim-group-attr-type": str,
+            "user-name": str,
+            "group-name": str,
+            "digest-method": str,
+            "require-signed-resp-and-asrt": str,
+            "limit-relaystate": str,
+            "clock-tolerance": int,
+            "adfs-claim": str,
+            "user-claim-type": str,
+            "group-claim-type": str,
+            "reauth": str,
+        },
+    },
+    "scim": {
+        "class": "Scim",
+        "path": "/user/scim",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "id": int,
+            "status": str,
+            "base-url": str,
+            "auth-method": str,
+            "token-certificate": str,
+            "secret": str,
+            "certificate": str,
+            "client-identity-check": str,
+            "cascade": str,
+        },
+    },
+    "security_exempt_list": {
+        "class": "SecurityExemptList",
+        "path": "/user/security-exempt-list",
+        "mkey": "name",
+        "fields": {"name": str, "description": str, "rule": list},
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/user/setting",
+        "fields": {
+            "auth-type": str,
+            "auth-cert": str,
+            "auth-ca-cert": str,
+            "auth-secure-http": str,
+            "auth-http-basic": str,
+            "auth-ssl-allow-renegotiation": str,
+            "auth-src-mac": str,
+            "auth-on-demand": str,
+            "auth-timeout": int,
+            "auth-timeout-type": str,
+            "auth-portal-timeout": int,
+            "radius-ses-timeout-act": str,
+            "auth-blackout-time": int,
+            "auth-invalid-max": int,
+            "auth-lockout-threshold": int,
+            "auth-lockout-duration": int,
+            "per-policy-disclaimer": str,
+            "auth-ports": list,
+            "auth-ssl-min-proto-version": str,
+            "auth-ssl-max-proto-version": str,
+            "auth-ssl-sigalgs": str,
+            "default-user-password-policy": str,
+            "cors": str,
+            "cors-allowed-origins": list,
+        },
+    },
+    "tacacs_plus_": {
+        "class": "TacacsPlus",
+        "path": "/user/tacacs+",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "secondary-server": str,
+            "tertiary-server": str,
+            "port": int,
+            "secondary-key": str,
+            "tertiary-key": str,
+            "status-ttl": int,
+            "authen-type": str,
+            "authorization": str,
+            "source-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
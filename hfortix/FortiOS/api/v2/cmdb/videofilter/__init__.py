@@ -1,11 +1,26 @@
 """FortiOS CMDB - Videofilter category"""
 
-from .keyword import Keyword
-from .profile import Profile
-from .youtube_key import YoutubeKey
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["Keyword", "Profile", "YoutubeKey"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Keyword": "._registry",
+        "Profile": "._registry",
+        "YoutubeKey": "._registry",
+    },
+)
+
 
 class Videofilter:
     """
@@ -14,6 +29,10 @@ class Videofilter:
     This class provides access to all videofilter CMDB endpoints.
     """
 
+    keyword: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Keyword")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    youtube_key: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("YoutubeKey")
+
     def __init__(self, client):
         """
         Initialize Videofilter with all endpoint classes.
@@ -21,6 +40,4 @@ class Videofilter:
         Args:
             client: HTTPClient instance
         """
-        self.keyword = Keyword(client)
-        self.profile = Profile(client)
-        self.youtube_key = YoutubeKey(client)
+        self._client = client
@@ -0,0 +1,40 @@
+"""FortiOS CMDB - Videofilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "keyword": {
+        "class": "Keyword",
+        "path": "/videofilter/keyword",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "name": str,
+            "comment": str,
+            "match": str,
+            "word": list,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/videofilter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "filters": list,
+            "youtube": str,
+            "vimeo": str,
+            "dailymotion": str,
+            "replacemsg-group": str,
+        },
+    },
+    "youtube_key": {
+        "class": "YoutubeKey",
+        "path": "/videofilter/youtube-key",
+        "mkey": "id",
+        "fields": {"id": int},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -0,0 +1,20 @@
+"""FortiOS CMDB - Virtual Patch endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/virtual-patch/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "severity": str,
+            "log": str,
+            "exemption": list,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -0,0 +1,21 @@
+"""FortiOS CMDB - Voip endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "profile": {
+        "class": "Profile",
+        "path": "/voip/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "feature-set": str,
+            "comment": str,
+            "sip": list,
+            "sccp": list,
+            "msrp": list,
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
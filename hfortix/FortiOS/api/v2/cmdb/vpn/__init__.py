@@ -1,24 +1,14 @@
 """FortiOS CMDB - Vpn category"""
 
-from .certificate_ca import CertificateCa
-from .certificate_crl import CertificateCrl
-from .certificate_hsm_local import CertificateHsmLocal
-from .certificate_local import CertificateLocal
-from .certificate_ocsp_server import CertificateOcspServer
-from .certificate_remote import CertificateRemote
-from .certificate_setting import CertificateSetting
-from .ipsec_concentrator import IpsecConcentrator
-from .ipsec_fec import IpsecFec
-from .ipsec_manualkey import IpsecManualkey
-from .ipsec_manualkey_interface import IpsecManualkeyInterface
-from .ipsec_phase1 import IpsecPhase1
-from .ipsec_phase1_interface import IpsecPhase1Interface
-from .ipsec_phase2 import IpsecPhase2
-from .ipsec_phase2_interface import IpsecPhase2Interface
-from .kmip_server import KmipServer
-from .l2tp import L2tp
-from .pptp import Pptp
-from .qkd import Qkd
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "CertificateCa",
@@ -42,6 +32,31 @@ __all__ = [
     "Qkd",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "CertificateCa": "._registry",
+        "CertificateCrl": "._registry",
+        "CertificateHsmLocal": "._registry",
+        "CertificateLocal": "._registry",
+        "CertificateOcspServer": "._registry",
+        "CertificateRemote": "._registry",
+        "CertificateSetting": "._registry",
+        "IpsecConcentrator": "._registry",
+        "IpsecFec": "._registry",
+        "IpsecManualkey": "._registry",
+        "IpsecManualkeyInterface": "._registry",
+        "IpsecPhase1": "._registry",
+        "IpsecPhase1Interface": "._registry",
+        "IpsecPhase2": "._registry",
+        "IpsecPhase2Interface": "._registry",
+        "KmipServer": "._registry",
+        "L2tp": "._registry",
+        "Pptp": "._registry",
+        "Qkd": "._registry",
+    },
+)
+
 
 class Vpn:
     """
@@ -50,6 +65,48 @@ class Vpn:
     This class provides access to all vpn CMDB endpoints.
     """
 
+    certificate_ca: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("CertificateCa")
+    certificate_crl: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateCrl"
+    )
+    certificate_hsm_local: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateHsmLocal"
+    )
+    certificate_local: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateLocal"
+    )
+    certificate_ocsp_server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateOcspServer"
+    )
+    certificate_remote: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateRemote"
+    )
+    certificate_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "CertificateSetting"
+    )
+    ipsec_concentrator: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsecConcentrator"
+    )
+    ipsec_fec: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("IpsecFec")
+    ipsec_manualkey: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsecManualkey"
+    )
+    ipsec_manualkey_interface: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsecManualkeyInterface"
+    )
+    ipsec_phase1: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("IpsecPhase1")
+    ipsec_phase1_interface: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsecPhase1Interface"
+    )
+    ipsec_phase2: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("IpsecPhase2")
+    ipsec_phase2_interface: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsecPhase2Interface"
+    )
+    kmip_server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("KmipServer")
+    l2tp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("L2tp")
+    pptp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Pptp")
+    qkd: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Qkd")
+
     def __init__(self, client):
         """
         Initialize Vpn with all endpoint classes.
@@ -57,22 +114,4 @@ class Vpn:
         Args:
             client: HTTPClient instance
         """
-        self.certificate_ca = CertificateCa(client)
-        self.certificate_crl = CertificateCrl(client)
-        self.certificate_hsm_local = CertificateHsmLocal(client)
-        self.certificate_local = CertificateLocal(client)
-        self.certificate_ocsp_server = CertificateOcspServer(client)
-        self.certificate_remote = CertificateRemote(client)
-        self.certificate_setting = CertificateSetting(client)
-        self.ipsec_concentrator = IpsecConcentrator(client)
-        self.ipsec_fec = IpsecFec(client)
-        self.ipsec_manualkey = IpsecManualkey(client)
-        self.ipsec_manualkey_interface = IpsecManualkeyInterface(client)
-        self.ipsec_phase1 = IpsecPhase1(client)
-        self.ipsec_phase1_interface = IpsecPhase1Interface(client)
-        self.ipsec_phase2 = IpsecPhase2(client)
-        self.ipsec_phase2_interface = IpsecPhase2Interface(client)
-        self.kmip_server = KmipServer(client)
-        self.l2tp = L2tp(client)
-        self.pptp = Pptp(client)
-        self.qkd = Qkd(client)
+        self._client = client
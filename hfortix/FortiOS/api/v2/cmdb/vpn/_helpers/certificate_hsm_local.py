@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_VENDOR = ["unknown", "gch"]
@@ -30,320 +30,29 @@ VALID_BODY_GCH_CRYPTOKEY_ALGORITHM = [
 ]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_certificate_hsm_local_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_certificate_hsm_local_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating certificate_hsm_local.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comments if present
-    if "comments" in payload:
-        value = payload.get("comments")
-        if value and isinstance(value, str) and len(value) > 511:
-            return (False, "comments cannot exceed 511 characters")
-
-    # Validate vendor if present
-    if "vendor" in payload:
-        value = payload.get("vendor")
-        if value and value not in VALID_BODY_VENDOR:
-            return (
-                False,
-                f"Invalid vendor '{value}'. Must be one of: {', '.join(VALID_BODY_VENDOR)}",
-            )
-
-    # Validate api-version if present
-    if "api-version" in payload:
-        value = payload.get("api-version")
-        if value and value not in VALID_BODY_API_VERSION:
-            return (
-                False,
-                f"Invalid api-version '{value}'. Must be one of: {', '.join(VALID_BODY_API_VERSION)}",
-            )
-
-    # Validate range if present
-    if "range" in payload:
-        value = payload.get("range")
-        if value and value not in VALID_BODY_RANGE:
-            return (
-                False,
-                f"Invalid range '{value}'. Must be one of: {', '.join(VALID_BODY_RANGE)}",
-            )
-
-    # Validate source if present
-    if "source" in payload:
-        value = payload.get("source")
-        if value and value not in VALID_BODY_SOURCE:
-            return (
-                False,
-                f"Invalid source '{value}'. Must be one of: {', '.join(VALID_BODY_SOURCE)}",
-            )
-
-    # Validate gch-url if present
-    if "gch-url" in payload:
-        value = payload.get("gch-url")
-        if value and isinstance(value, str) and len(value) > 1024:
-            return (False, "gch-url cannot exceed 1024 characters")
-
-    # Validate gch-project if present
-    if "gch-project" in payload:
-        value = payload.get("gch-project")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (False, "gch-project cannot exceed 31 characters")
-
-    # Validate gch-location if present
-    if "gch-location" in payload:
-        value = payload.get("gch-location")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-location cannot exceed 63 characters")
-
-    # Validate gch-keyring if present
-    if "gch-keyring" in payload:
-        value = payload.get("gch-keyring")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-keyring cannot exceed 63 characters")
-
-    # Validate gch-cryptokey if present
-    if "gch-cryptokey" in payload:
-        value = payload.get("gch-cryptokey")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-cryptokey cannot exceed 63 characters")
-
-    # Validate gch-cryptokey-version if present
-    if "gch-cryptokey-version" in payload:
-        value = payload.get("gch-cryptokey-version")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (
-                False,
-                "gch-cryptokey-version cannot exceed 31 characters",
-            )
-
-    # Validate gch-cloud-service-name if present
-    if "gch-cloud-service-name" in payload:
-        value = payload.get("gch-cloud-service-name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (
-                False,
-                "gch-cloud-service-name cannot exceed 35 characters",
-            )
-
-    # Validate gch-cryptokey-algorithm if present
-    if "gch-cryptokey-algorithm" in payload:
-        value = payload.get("gch-cryptokey-algorithm")
-        if value and value not in VALID_BODY_GCH_CRYPTOKEY_ALGORITHM:
-            return (
-                False,
-                f"Invalid gch-cryptokey-algorithm '{value}'. Must be one of: {', '.join(VALID_BODY_GCH_CRYPTOKEY_ALGORITHM)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_certificate_hsm_local_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comments if present
-    if "comments" in payload:
-        value = payload.get("comments")
-        if value and isinstance(value, str) and len(value) > 511:
-            return (False, "comments cannot exceed 511 characters")
-
-    # Validate vendor if present
-    if "vendor" in payload:
-        value = payload.get("vendor")
-        if value and value not in VALID_BODY_VENDOR:
-            return (
-                False,
-                f"Invalid vendor '{value}'. Must be one of: {', '.join(VALID_BODY_VENDOR)}",
-            )
-
-    # Validate api-version if present
-    if "api-version" in payload:
-        value = payload.get("api-version")
-        if value and value not in VALID_BODY_API_VERSION:
-            return (
-                False,
-                f"Invalid api-version '{value}'. Must be one of: {', '.join(VALID_BODY_API_VERSION)}",
-            )
-
-    # Validate range if present
-    if "range" in payload:
-        value = payload.get("range")
-        if value and value not in VALID_BODY_RANGE:
-            return (
-                False,
-                f"Invalid range '{value}'. Must be one of: {', '.join(VALID_BODY_RANGE)}",
-            )
-
-    # Validate source if present
-    if "source" in payload:
-        value = payload.get("source")
-        if value and value not in VALID_BODY_SOURCE:
-            return (
-                False,
-                f"Invalid source '{value}'. Must be one of: {', '.join(VALID_BODY_SOURCE)}",
-            )
-
-    # Validate gch-url if present
-    if "gch-url" in payload:
-        value = payload.get("gch-url")
-        if value and isinstance(value, str) and len(value) > 1024:
-            return (False, "gch-url cannot exceed 1024 characters")
-
-    # Validate gch-project if present
-    if "gch-project" in payload:
-        value = payload.get("gch-project")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (False, "gch-project cannot exceed 31 characters")
-
-    # Validate gch-location if present
-    if "gch-location" in payload:
-        value = payload.get("gch-location")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-location cannot exceed 63 characters")
-
-    # Validate gch-keyring if present
-    if "gch-keyring" in payload:
-        value = payload.get("gch-keyring")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-keyring cannot exceed 63 characters")
-
-    # Validate gch-cryptokey if present
-    if "gch-cryptokey" in payload:
-        value = payload.get("gch-cryptokey")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "gch-cryptokey cannot exceed 63 characters")
-
-    # Validate gch-cryptokey-version if present
-    if "gch-cryptokey-version" in payload:
-        value = payload.get("gch-cryptokey-version")
-        if value and isinstance(value, str) and len(value) > 31:
-            return (
-                False,
-                "gch-cryptokey-version cannot exceed 31 characters",
-            )
-
-    # Validate gch-cloud-service-name if present
-    if "gch-cloud-service-name" in payload:
-        value = payload.get("gch-cloud-service-name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (
-                False,
-                "gch-cloud-service-name cannot exceed 35 characters",
-            )
-
-    # Validate gch-cryptokey-algorithm if present
-    if "gch-cryptokey-algorithm" in payload:
-        value = payload.get("gch-cryptokey-algorithm")
-        if value and value not in VALID_BODY_GCH_CRYPTOKEY_ALGORITHM:
-            return (
-                False,
-                f"Invalid gch-cryptokey-algorithm '{value}'. Must be one of: {', '.join(VALID_BODY_GCH_CRYPTOKEY_ALGORITHM)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_certificate_hsm_local_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "comments": 511,
+        "vendor": VALID_BODY_VENDOR,
+        "api-version": VALID_BODY_API_VERSION,
+        "range": VALID_BODY_RANGE,
+        "source": VALID_BODY_SOURCE,
+        "gch-url": 1024,
+        "gch-project": 31,
+        "gch-location": 63,
+        "gch-keyring": 63,
+        "gch-cryptokey": 63,
+        "gch-cryptokey-version": 31,
+        "gch-cloud-service-name": 35,
+        "gch-cryptokey-algorithm": VALID_BODY_GCH_CRYPTOKEY_ALGORITHM,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_certificate_hsm_local_get = SCHEMA.get_validator()
+validate_certificate_hsm_local_post = SCHEMA.post_validator()
+validate_certificate_hsm_local_put = SCHEMA.put_validator("name")
+validate_certificate_hsm_local_delete = SCHEMA.delete_validator("name")
@@ -8,206 +8,28 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_UNAVAIL_ACTION = ["revoke", "ignore"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_certificate_ocsp_server_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_certificate_ocsp_server_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating certificate_ocsp_server.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate url if present
-    if "url" in payload:
-        value = payload.get("url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "url cannot exceed 127 characters")
-
-    # Validate cert if present
-    if "cert" in payload:
-        value = payload.get("cert")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "cert cannot exceed 127 characters")
-
-    # Validate secondary-url if present
-    if "secondary-url" in payload:
-        value = payload.get("secondary-url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "secondary-url cannot exceed 127 characters")
-
-    # Validate secondary-cert if present
-    if "secondary-cert" in payload:
-        value = payload.get("secondary-cert")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "secondary-cert cannot exceed 127 characters")
-
-    # Validate unavail-action if present
-    if "unavail-action" in payload:
-        value = payload.get("unavail-action")
-        if value and value not in VALID_BODY_UNAVAIL_ACTION:
-            return (
-                False,
-                f"Invalid unavail-action '{value}'. Must be one of: {', '.join(VALID_BODY_UNAVAIL_ACTION)}",
-            )
-
-    # Validate source-ip if present
-    if "source-ip" in payload:
-        value = payload.get("source-ip")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "source-ip cannot exceed 63 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_certificate_ocsp_server_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate url if present
-    if "url" in payload:
-        value = payload.get("url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "url cannot exceed 127 characters")
-
-    # Validate cert if present
-    if "cert" in payload:
-        value = payload.get("cert")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "cert cannot exceed 127 characters")
-
-    # Validate secondary-url if present
-    if "secondary-url" in payload:
-        value = payload.get("secondary-url")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "secondary-url cannot exceed 127 characters")
-
-    # Validate secondary-cert if present
-    if "secondary-cert" in payload:
-        value = payload.get("secondary-cert")
-        if value and isinstance(value, str) and len(value) > 127:
-            return (False, "secondary-cert cannot exceed 127 characters")
-
-    # Validate unavail-action if present
-    if "unavail-action" in payload:
-        value = payload.get("unavail-action")
-        if value and value not in VALID_BODY_UNAVAIL_ACTION:
-            return (
-                False,
-                f"Invalid unavail-action '{value}'. Must be one of: {', '.join(VALID_BODY_UNAVAIL_ACTION)}",
-            )
-
-    # Validate source-ip if present
-    if "source-ip" in payload:
-        value = payload.get("source-ip")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "source-ip cannot exceed 63 characters")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_certificate_ocsp_server_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "url": 127,
+        "cert": 127,
+        "secondary-url": 127,
+        "secondary-cert": 127,
+        "unavail-action": VALID_BODY_UNAVAIL_ACTION,
+        "source-ip": 63,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_certificate_ocsp_server_get = SCHEMA.get_validator()
+validate_certificate_ocsp_server_post = SCHEMA.post_validator()
+validate_certificate_ocsp_server_put = SCHEMA.put_validator("name")
+validate_certificate_ocsp_server_delete = SCHEMA.delete_validator("name")
@@ -0,0 +1,784 @@
+"""FortiOS CMDB - Vpn endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "certificate_ca": {
+        "class": "CertificateCa",
+        "path": "/vpn.certificate/ca",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ca": str,
+            "range": str,
+            "source": str,
+            "ssl-inspection-trusted": str,
+            "scep-url": str,
+            "est-url": str,
+            "auto-update-days": int,
+            "auto-update-days-warning": int,
+            "source-ip": str,
+            "ca-identifier": str,
+            "obsolete": str,
+            "fabric-ca": str,
+            "details": str,
+        },
+        "methods": ("get", "iter", "aiter", "exists", "post"),
+    },
+    "certificate_crl": {
+        "class": "CertificateCrl",
+        "path": "/vpn.certificate/crl",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "crl": str,
+            "range": str,
+            "source": str,
+            "update-vdom": str,
+            "ldap-server": str,
+            "ldap-username": str,
+            "ldap-password": str,
+            "http-url": str,
+            "scep-url": str,
+            "scep-cert": str,
+            "update-interval": int,
+            "source-ip": str,
+        },
+        "methods": ("get", "iter", "aiter", "exists", "post"),
+    },
+    "certificate_hsm_local": {
+        "class": "CertificateHsmLocal",
+        "path": "/vpn.certificate/hsm-local",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comments": str,
+            "vendor": str,
+            "api-version": str,
+            "certificate": str,
+            "range": str,
+            "source": str,
+            "gch-url": str,
+            "gch-project": str,
+            "gch-location": str,
+            "gch-keyring": str,
+            "gch-cryptokey": str,
+            "gch-cryptokey-version": str,
+            "gch-cloud-service-name": str,
+            "gch-cryptokey-algorithm": str,
+            "details": str,
+        },
+    },
+    "certificate_local": {
+        "class": "CertificateLocal",
+        "path": "/vpn.certificate/local",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "password": str,
+            "comments": str,
+            "private-key": str,
+            "certificate": str,
+            "csr": str,
+            "state": str,
+            "scep-url": str,
+            "range": str,
+            "source": str,
+            "auto-regenerate-days": int,
+            "auto-regenerate-days-warning": int,
+            "scep-password": str,
+            "ca-identifier": str,
+            "name-encoding": str,
+            "source-ip": str,
+            "ike-localid": str,
+            "ike-localid-type": str,
+            "enroll-protocol": str,
+            "private-key-retain": str,
+            "cmp-server": str,
+            "cmp-path": str,
+            "cmp-server-cert": str,
+            "cmp-regeneration-method": str,
+            "acme-ca-url": str,
+            "acme-domain": str,
+            "acme-email": str,
+            "acme-eab-key-id": str,
+            "acme-eab-key-hmac": str,
+            "acme-rsa-key-size": int,
+            "acme-renew-window": int,
+            "est-server": str,
+            "est-ca-id": str,
+            "est-http-username": str,
+            "est-http-password": str,
+            "est-client-cert": str,
+            "est-server-cert": str,
+            "est-srp-username": str,
+            "est-srp-password": str,
+            "est-regeneration-method": str,
+            "details": str,
+        },
+        "methods": ("get", "iter", "aiter", "exists", "post"),
+    },
+    "certificate_ocsp_server": {
+        "class": "CertificateOcspServer",
+        "path": "/vpn.certificate/ocsp-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "url": str,
+            "cert": str,
+            "secondary-url": str,
+            "secondary-cert": str,
+            "unavail-action": str,
+            "source-ip": str,
+        },
+    },
+    "certificate_remote": {
+        "class": "CertificateRemote",
+        "path": "/vpn.certificate/remote",
+        "mkey": "name",
+        "fields": {"name": str, "remote": str, "range": str, "source": str},
+        "methods": ("get", "iter", "aiter", "exists", "post"),
+    },
+    "certificate_setting": {
+        "class": "CertificateSetting",
+        "path": "/vpn.certificate/setting",
+        "fields": {
+            "ocsp-status": str,
+            "ocsp-option": str,
+            "proxy": str,
+            "proxy-port": int,
+            "proxy-username": str,
+            "proxy-password": str,
+            "source-ip": str,
+            "ocsp-default-server": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "check-ca-cert": str,
+            "check-ca-chain": str,
+            "subject-match": str,
+            "subject-set": str,
+            "cn-match": str,
+            "cn-allow-multi": str,
+            "crl-verification": list,
+            "strict-ocsp-check": str,
+            "ssl-min-proto-version": str,
+            "cmp-save-extra-certs": str,
+            "cmp-key-usage-checking": str,
+            "cert-expire-warning": int,
+            "certname-rsa1024": str,
+            "certname-rsa2048": str,
+            "certname-rsa4096": str,
+            "certname-dsa1024": str,
+            "certname-dsa2048": str,
+            "certname-ecdsa256": str,
+            "certname-ecdsa384": str,
+            "certname-ecdsa521": str,
+            "certname-ed25519": str,
+            "certname-ed448": str,
+        },
+    },
+    "ipsec_concentrator": {
+        "class": "IpsecConcentrator",
+        "path": "/vpn.ipsec/concentrator",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "src-check": str, "member": list},
+    },
+    "ipsec_fec": {
+        "class": "IpsecFec",
+        "path": "/vpn.ipsec/fec",
+        "mkey": "name",
+        "fields": {"name": str, "mappings": list},
+    },
+    "ipsec_manualkey": {
+        "class": "IpsecManualkey",
+        "path": "/vpn.ipsec/manualkey",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "remote-gw": str,
+            "local-gw": str,
+            "authentication": str,
+            "encryption": str,
+            "authkey": str,
+            "enckey": str,
+            "localspi": str,
+            "remotespi": str,
+            "npu-offload": str,
+        },
+    },
+    "ipsec_manualkey_interface": {
+        "class": "IpsecManualkeyInterface",
+        "path": "/vpn.ipsec/manualkey-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "interface": str,
+            "ip-version": str,
+            "addr-type": str,
+            "remote-gw": str,
+            "remote-gw6": str,
+            "local-gw": str,
+            "local-gw6": str,
+            "auth-alg": str,
+            "enc-alg": str,
+            "auth-key": str,
+            "enc-key": str,
+            "local-spi": str,
+            "remote-spi": str,
+            "npu-offload": str,
+        },
+    },
+    "ipsec_phase1": {
+        "class": "IpsecPhase1",
+        "path": "/vpn.ipsec/phase1",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "interface": str,
+            "ike-version": str,
+            "remote-gw": str,
+            "local-gw": str,
+            "remotegw-ddns": str,
+            "keylife": int,
+            "certificate": list,
+            "authmethod": str,
+            "authmethod-remote": str,
+            "mode": str,
+            "peertype": str,
+            "peerid": str,
+            "usrgrp": str,
+            "peer": str,
+            "peergrp": str,
+            "mode-cfg": str,
+            "mode-cfg-allow-client-selector": str,
+            "assign-ip": str,
+            "assign-ip-from": str,
+            "ipv4-start-ip": str,
+            "ipv4-end-ip": str,
+            "ipv4-netmask": str,
+            "dhcp-ra-giaddr": str,
+            "dhcp6-ra-linkaddr": str,
+            "dns-mode": str,
+            "ipv4-dns-server1": str,
+            "ipv4-dns-server2": str,
+            "ipv4-dns-server3": str,
+            "internal-domain-list": list,
+            "dns-suffix-search": list,
+            "ipv4-wins-server1": str,
+            "ipv4-wins-server2": str,
+            "ipv4-exclude-range": list,
+            "ipv4-split-include": str,
+            "split-include-service": str,
+            "ipv4-name": str,
+            "ipv6-start-ip": str,
+            "ipv6-end-ip": str,
+            "ipv6-prefix": int,
+            "ipv6-dns-server1": str,
+            "ipv6-dns-server2": str,
+            "ipv6-dns-server3": str,
+            "ipv6-exclude-range": list,
+            "ipv6-split-include": str,
+            "ipv6-name": str,
+            "ip-delay-interval": int,
+            "unity-support": str,
+            "domain": str,
+            "banner": str,
+            "include-local-lan": str,
+            "ipv4-split-exclude": str,
+            "ipv6-split-exclude": str,
+            "save-password": str,
+            "client-auto-negotiate": str,
+            "client-keep-alive": str,
+            "backup-gateway": list,
+            "proposal": str,
+            "add-route": str,
+            "add-gw-route": str,
+            "psksecret": str,
+            "psksecret-remote": str,
+            "keepalive": int,
+            "distance": int,
+            "priority": int,
+            "localid": str,
+            "localid-type": str,
+            "auto-negotiate": str,
+            "negotiate-timeout": int,
+            "fragmentation": str,
+            "dpd": str,
+            "dpd-retrycount": int,
+            "dpd-retryinterval": str,
+            "comments": str,
+            "npu-offload": str,
+            "send-cert-chain": str,
+            "dhgrp": str,
+            "addke1": str,
+            "addke2": str,
+            "addke3": str,
+            "addke4": str,
+            "addke5": str,
+            "addke6": str,
+            "addke7": str,
+            "suite-b": str,
+            "eap": str,
+            "eap-identity": str,
+            "eap-exclude-peergrp": str,
+            "eap-cert-auth": str,
+            "acct-verify": str,
+            "ppk": str,
+            "ppk-secret": str,
+            "ppk-identity": str,
+            "wizard-type": str,
+            "xauthtype": str,
+            "reauth": str,
+            "authusr": str,
+            "authpasswd": str,
+            "group-authentication": str,
+            "group-authentication-secret": str,
+            "authusrgrp": str,
+            "mesh-selector-type": str,
+            "idle-timeout": str,
+            "shared-idle-timeout": str,
+            "idle-timeoutinterval": int,
+            "ha-sync-esp-seqno": str,
+            "fgsp-sync": str,
+            "inbound-dscp-copy": str,
+            "nattraversal": str,
+            "fragmentation-mtu": int,
+            "childless-ike": str,
+            "azure-ad-autoconnect": str,
+            "client-resume": str,
+            "client-resume-interval": int,
+            "rekey": str,
+            "digital-signature-auth": str,
+            "signature-hash-alg": str,
+            "rsa-signature-format": str,
+            "rsa-signature-hash-override": str,
+            "enforce-unique-id": str,
+            "cert-id-validation": str,
+            "fec-egress": str,
+            "fec-send-timeout": int,
+            "fec-base": int,
+            "fec-codec": str,
+            "fec-redundant": int,
+            "fec-ingress": str,
+            "fec-receive-timeout": int,
+            "fec-health-check": str,
+            "fec-mapping-profile": str,
+            "network-overlay": str,
+            "network-id": int,
+            "dev-id-notification": str,
+            "dev-id": str,
+            "loopback-asymroute": str,
+            "link-cost": int,
+            "kms": str,
+            "exchange-fgt-device-id": str,
+            "ipv6-auto-linklocal": str,
+            "ems-sn-check": str,
+            "cert-trust-store": str,
+            "qkd": str,
+            "qkd-hybrid": str,
+            "qkd-profile": str,
+            "transport": str,
+            "fortinet-esp": str,
+            "auto-transport-threshold": int,
+            "remote-gw-match": str,
+            "remote-gw-subnet": str,
+            "remote-gw-start-ip": str,
+            "remote-gw-end-ip": str,
+            "remote-gw-country": str,
+            "remote-gw-ztna-tags": list,
+            "remote-gw6-match": str,
+            "remote-gw6-subnet": str,
+            "remote-gw6-start-ip": str,
+            "remote-gw6-end-ip": str,
+            "remote-gw6-country": str,
+            "cert-peer-username-validation": str,
+            "cert-peer-username-strip": str,
+        },
+    },
+    "ipsec_phase1_interface": {
+        "class": "IpsecPhase1Interface",
+        "path": "/vpn.ipsec/phase1-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "type": str,
+            "interface": str,
+            "ip-version": str,
+            "ike-version": str,
+            "local-gw": str,
+            "local-gw6": str,
+            "remote-gw": str,
+            "remote-gw6": str,
+            "remotegw-ddns": str,
+            "keylife": int,
+            "certificate": list,
+            "authmethod": str,
+            "authmethod-remote": str,
+            "mode": str,
+            "peertype": str,
+            "peerid": str,
+            "default-gw": str,
+            "default-gw-priority": int,
+            "usrgrp": str,
+            "peer": str,
+            "peergrp": str,
+            "monitor": list,
+            "monitor-min": int,
+            "monitor-hold-down-type": str,
+            "monitor-hold-down-delay": int,
+            "monitor-hold-down-weekday": str,
+            "monitor-hold-down-time": str,
+            "net-device": str,
+            "passive-mode": str,
+            "exchange-interface-ip": str,
+            "exchange-ip-addr4": str,
+            "exchange-ip-addr6": str,
+            "aggregate-member": str,
+            "aggregate-weight": int,
+            "packet-redistribution": str,
+            "peer-egress-shaping": str,
+            "peer-egress-shaping-value": int,
+            "mode-cfg": str,
+            "mode-cfg-allow-client-selector": str,
+            "assign-ip": str,
+            "assign-ip-from": str,
+            "ipv4-start-ip": str,
+            "ipv4-end-ip": str,
+            "ipv4-netmask": str,
+            "dhcp-ra-giaddr": str,
+            "dhcp6-ra-linkaddr": str,
+            "dns-mode": str,
+            "ipv4-dns-server1": str,
+            "ipv4-dns-server2": str,
+            "ipv4-dns-server3": str,
+            "internal-domain-list": list,
+            "dns-suffix-search": list,
+            "ipv4-wins-server1": str,
+            "ipv4-wins-server2": str,
+            "ipv4-exclude-range": list,
+            "ipv4-split-include": str,
+            "split-include-service": str,
+            "ipv4-name": str,
+            "ipv6-start-ip": str,
+            "ipv6-end-ip": str,
+            "ipv6-prefix": int,
+            "ipv6-dns-server1": str,
+            "ipv6-dns-server2": str,
+            "ipv6-dns-server3": str,
+            "ipv6-exclude-range": list,
+            "ipv6-split-include": str,
+            "ipv6-name": str,
+            "ip-delay-interval": int,
+            "unity-support": str,
+            "domain": str,
+            "banner": str,
+            "include-local-lan": str,
+            "ipv4-split-exclude": str,
+            "ipv6-split-exclude": str,
+            "save-password": str,
+            "client-auto-negotiate": str,
+            "client-keep-alive": str,
+            "backup-gateway": list,
+            "proposal": str,
+            "add-route": str,
+            "add-gw-route": str,
+            "psksecret": str,
+            "psksecret-remote": str,
+            "keepalive": int,
+            "distance": int,
+            "priority": int,
+            "localid": str,
+            "localid-type": str,
+            "auto-negotiate": str,
+            "negotiate-timeout": int,
+            "fragmentation": str,
+            "ip-fragmentation": str,
+            "dpd": str,
+            "dpd-retrycount": int,
+            "dpd-retryinterval": str,
+            "comments": str,
+            "npu-offload": str,
+            "send-cert-chain": str,
+            "dhgrp": str,
+            "addke1": str,
+            "addke2": str,
+            "addke3": str,
+            "addke4": str,
+            "addke5": str,
+            "addke6": str,
+            "addke7": str,
+            "suite-b": str,
+            "eap": str,
+            "eap-identity": str,
+            "eap-exclude-peergrp": str,
+            "eap-cert-auth": str,
+            "acct-verify": str,
+            "ppk": str,
+            "ppk-secret": str,
+            "ppk-identity": str,
+            "wizard-type": str,
+            "xauthtype": str,
+            "reauth": str,
+            "authusr": str,
+            "authpasswd": str,
+            "group-authentication": str,
+            "group-authentication-secret": str,
+            "authusrgrp": str,
+            "mesh-selector-type": str,
+            "idle-timeout": str,
+            "shared-idle-timeout": str,
+            "idle-timeoutinterval": int,
+            "ha-sync-esp-seqno": str,
+            "fgsp-sync": str,
+            "inbound-dscp-copy": str,
+            "auto-discovery-sender": str,
+            "auto-discovery-receiver": str,
+            "auto-discovery-forwarder": str,
+            "auto-discovery-psk": str,
+            "auto-discovery-shortcuts": str,
+            "auto-discovery-crossover": str,
+            "auto-discovery-offer-interval": int,
+            "auto-discovery-dialup-placeholder": str,
+            "encapsulation": str,
+            "encapsulation-address": str,
+            "encap-local-gw4": str,
+            "encap-local-gw6": str,
+            "encap-remote-gw4": str,
+            "encap-remote-gw6": str,
+            "vni": int,
+            "nattraversal": str,
+            "fragmentation-mtu": int,
+            "childless-ike": str,
+            "azure-ad-autoconnect": str,
+            "client-resume": str,
+            "client-resume-interval": int,
+            "rekey": str,
+            "digital-signature-auth": str,
+            "signature-hash-alg": str,
+            "rsa-signature-format": str,
+            "rsa-signature-hash-override": str,
+            "enforce-unique-id": str,
+            "cert-id-validation": str,
+            "fec-egress": str,
+            "fec-send-timeout": int,
+            "fec-base": int,
+            "fec-codec": str,
+            "fec-redundant": int,
+            "fec-ingress": str,
+            "fec-receive-timeout": int,
+            "fec-health-check": str,
+            "fec-mapping-profile": str,
+            "network-overlay": str,
+            "network-id": int,
+            "dev-id-notification": str,
+            "dev-id": str,
+            "loopback-asymroute": str,
+            "link-cost": int,
+            "kms": str,
+            "exchange-fgt-device-id": str,
+            "ipv6-auto-linklocal": str,
+            "ems-sn-check": str,
+            "cert-trust-store": str,
+            "qkd": str,
+            "qkd-hybrid": str,
+            "qkd-profile": str,
+            "transport": str,
+            "fortinet-esp": str,
+            "auto-transport-threshold": int,
+            "remote-gw-match": str,
+            "remote-gw-subnet": str,
+            "remote-gw-start-ip": str,
+            "remote-gw-end-ip": str,
+            "remote-gw-country": str,
+            "remote-gw-ztna-tags": list,
+            "remote-gw6-match": str,
+            "remote-gw6-subnet": str,
+            "remote-gw6-start-ip": str,
+            "remote-gw6-end-ip": str,
+            "remote-gw6-country": str,
+            "cert-peer-username-validation": str,
+            "cert-peer-username-strip": str,
+        },
+    },
+    "ipsec_phase2": {
+        "class": "IpsecPhase2",
+        "path": "/vpn.ipsec/phase2",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "phase1name": str,
+            "dhcp-ipsec": str,
+            "use-natip": str,
+            "selector-match": str,
+            "proposal": str,
+            "pfs": str,
+            "dhgrp": str,
+            "addke1": str,
+            "addke2": str,
+            "addke3": str,
+            "addke4": str,
+            "addke5": str,
+            "addke6": str,
+            "addke7": str,
+            "replay": str,
+            "keepalive": str,
+            "auto-negotiate": str,
+            "add-route": str,
+            "inbound-dscp-copy": str,
+            "keylifeseconds": int,
+            "keylifekbs": int,
+            "keylife-type": str,
+            "single-source": str,
+            "route-overlap": str,
+            "encapsulation": str,
+            "l2tp": str,
+            "comments": str,
+            "initiator-ts-narrow": str,
+            "diffserv": str,
+            "diffservcode": str,
+            "protocol": int,
+            "src-name": str,
+            "src-name6": str,
+            "src-addr-type": str,
+            "src-start-ip": str,
+            "src-start-ip6": str,
+            "src-end-ip": str,
+            "src-end-ip6": str,
+            "src-subnet": str,
+            "src-subnet6": str,
+            "src-port": int,
+            "dst-name": str,
+            "dst-name6": str,
+            "dst-addr-type": str,
+            "dst-start-ip": str,
+            "dst-start-ip6": str,
+            "dst-end-ip": str,
+            "dst-end-ip6": str,
+            "dst-subnet": str,
+            "dst-subnet6": str,
+            "dst-port": int,
+        },
+    },
+    "ipsec_phase2_interface": {
+        "class": "IpsecPhase2Interface",
+        "path": "/vpn.ipsec/phase2-interface",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "phase1name": str,
+            "dhcp-ipsec": str,
+            "proposal": str,
+            "pfs": str,
+            "dhgrp": str,
+            "addke1": str,
+            "addke2": str,
+            "addke3": str,
+            "addke4": str,
+            "addke5": str,
+            "addke6": str,
+            "addke7": str,
+            "replay": str,
+            "keepalive": str,
+            "auto-negotiate": str,
+            "add-route": str,
+            "inbound-dscp-copy": str,
+            "auto-discovery-sender": str,
+            "auto-discovery-forwarder": str,
+            "keylifeseconds": int,
+            "keylifekbs": int,
+            "keylife-type": str,
+            "single-source": str,
+            "route-overlap": str,
+            "encapsulation": str,
+            "l2tp": str,
+            "comments": str,
+            "initiator-ts-narrow": str,
+            "diffserv": str,
+            "diffservcode": str,
+            "protocol": int,
+            "src-name": str,
+            "src-name6": str,
+            "src-addr-type": str,
+            "src-start-ip": str,
+            "src-start-ip6": str,
+            "src-end-ip": str,
+            "src-end-ip6": str,
+            "src-subnet": str,
+            "src-subnet6": str,
+            "src-port": int,
+            "dst-name": str,
+            "dst-name6": str,
+            "dst-addr-type": str,
+            "dst-start-ip": str,
+            "dst-start-ip6": str,
+            "dst-end-ip": str,
+            "dst-end-ip6": str,
+            "dst-subnet": str,
+            "dst-subnet6": str,
+            "dst-port": int,
+        },
+    },
+    "kmip_server": {
+        "class": "KmipServer",
+        "path": "/vpn/kmip-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server-list": list,
+            "username": str,
+            "password": str,
+            "ssl-min-proto-version": str,
+            "server-identity-check": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "source-ip": str,
+        },
+    },
+    "l2tp": {
+        "class": "L2tp",
+        "path": "/vpn/l2tp",
+        "fields": {
+            "status": str,
+            "eip": str,
+            "sip": str,
+            "usrgrp": str,
+            "enforce-ipsec": str,
+            "lcp-echo-interval": int,
+            "lcp-max-echo-fails": int,
+            "hello-interval": int,
+            "compress": str,
+        },
+    },
+    "pptp": {
+        "class": "Pptp",
+        "path": "/vpn/pptp",
+        "fields": {
+            "status": str,
+            "ip-mode": str,
+            "eip": str,
+            "sip": str,
+            "local-ip": str,
+            "usrgrp": str,
+        },
+    },
+    "qkd": {
+        "class": "Qkd",
+        "path": "/vpn/qkd",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "server": str,
+            "port": int,
+            "id": str,
+            "peer": str,
+            "certificate": list,
+            "comment": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,432 +0,0 @@
-"""
-FortiOS CMDB - Cmdb Vpn Ipsec Manualkey
-
-Configuration endpoint for managing cmdb vpn ipsec manualkey objects.
-
-API Endpoints:
-    GET    /cmdb/vpn/ipsec_manualkey
-    POST   /cmdb/vpn/ipsec_manualkey
-    GET    /cmdb/vpn/ipsec_manualkey
-    PUT    /cmdb/vpn/ipsec_manualkey/{identifier}
-    DELETE /cmdb/vpn/ipsec_manualkey/{identifier}
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # List all items
-    >>> items = fgt.api.cmdb.vpn.ipsec_manualkey.get()
-    >>>
-    >>> # Get specific item (if supported)
-    >>> item = fgt.api.cmdb.vpn.ipsec_manualkey.get(name="item_name")
-    >>>
-    >>> # Create new item (use POST)
-    >>> result = fgt.api.cmdb.vpn.ipsec_manualkey.post(
-    ...     name="new_item",
-    ...     # ... additional parameters
-    ... )
-    >>>
-    >>> # Update existing item (use PUT)
-    >>> result = fgt.api.cmdb.vpn.ipsec_manualkey.put(
-    ...     name="existing_item",
-    ...     # ... parameters to update
-    ... )
-    >>>
-    >>> # Delete item
-    >>> result = fgt.api.cmdb.vpn.ipsec_manualkey.delete(name="item_name")
-
-Important:
-    - Use **POST** to create new objects (404 error if already exists)
-    - Use **PUT** to update existing objects (404 error if doesn't exist)
-    - Use **GET** to retrieve configuration (no changes made)
-    - Use **DELETE** to remove objects (404 error if doesn't exist)
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union, cast
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class IpsecManualkey:
-    """
-    Ipsecmanualkey Operations.
-
-    Provides CRUD operations for FortiOS ipsecmanualkey configuration.
-
-    Methods:
-        get(): Retrieve configuration objects
-        post(): Create new configuration objects
-        put(): Update existing configuration objects
-        delete(): Remove configuration objects
-
-    Important:
-        - POST creates new objects (404 if name already exists)
-        - PUT updates existing objects (404 if name doesn't exist)
-        - GET retrieves objects without making changes
-        - DELETE removes objects (404 if name doesn't exist)
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize IpsecManualkey endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        attr: str | None = None,
-        skip_to_datasource: dict | None = None,
-        acs: int | None = None,
-        search: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Select a specific entry from a CLI table.
-
-        Args:
-            name: Object identifier (optional for list, required for specific)
-            attr: Attribute name that references other table (optional)
-            skip_to_datasource: Skip to provided table's Nth entry. E.g
-            {datasource: 'firewall.address', pos: 10, global_entry: false}
-            (optional)
-            acs: If true, returned result are in ascending order. (optional)
-            search: If present, the objects will be filtered by the search
-            value. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if name:
-            endpoint = f"/vpn.ipsec/manualkey/{name}"
-        else:
-            endpoint = "/vpn.ipsec/manualkey"
-        if attr is not None:
-            params["attr"] = attr
-        if skip_to_datasource is not None:
-            params["skip_to_datasource"] = skip_to_datasource
-        if acs is not None:
-            params["acs"] = acs
-        if search is not None:
-            params["search"] = search
-        params.update(kwargs)
-        return self._client.get(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def put(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        before: str | None = None,
-        after: str | None = None,
-        interface: str | None = None,
-        remote_gw: str | None = None,
-        local_gw: str | None = None,
-        authentication: str | None = None,
-        encryption: str | None = None,
-        authkey: str | None = None,
-        enckey: str | None = None,
-        localspi: str | None = None,
-        remotespi: str | None = None,
-        npu_offload: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Update this specific resource.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            name: Object identifier (required)
-            before: If *action=move*, use *before* to specify the ID of the
-            resource that this resource will be moved before. (optional)
-            after: If *action=move*, use *after* to specify the ID of the
-            resource that this resource will be moved after. (optional)
-            name: IPsec tunnel name. (optional)
-            interface: Name of the physical, aggregate, or VLAN interface.
-            (optional)
-            remote_gw: Peer gateway. (optional)
-            local_gw: Local gateway. (optional)
-            authentication: Authentication algorithm. Must be the same for both
-            ends of the tunnel. (optional)
-            encryption: Encryption algorithm. Must be the same for both ends of
-            the tunnel. (optional)
-            authkey: Hexadecimal authentication key in 16-digit (8-byte)
-            segments separated by hyphens. (optional)
-            enckey: Hexadecimal encryption key in 16-digit (8-byte) segments
-            separated by hyphens. (optional)
-            localspi: Local SPI, a hexadecimal 8-digit (4-byte) tag. Discerns
-            between two traffic streams with different encryption rules.
-            (optional)
-            remotespi: Remote SPI, a hexadecimal 8-digit (4-byte) tag. Discerns
-            between two traffic streams with different encryption rules.
-            (optional)
-            npu_offload: Enable/disable NPU offloading. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for put()")
-        endpoint = f"/vpn.ipsec/manualkey/{name}"
-        if before is not None:
-            data_payload["before"] = before
-        if after is not None:
-            data_payload["after"] = after
-        if name is not None:
-            data_payload["name"] = name
-        if interface is not None:
-            data_payload["interface"] = interface
-        if remote_gw is not None:
-            data_payload["remote-gw"] = remote_gw
-        if local_gw is not None:
-            data_payload["local-gw"] = local_gw
-        if authentication is not None:
-            data_payload["authentication"] = authentication
-        if encryption is not None:
-            data_payload["encryption"] = encryption
-        if authkey is not None:
-            data_payload["authkey"] = authkey
-        if enckey is not None:
-            data_payload["enckey"] = enckey
-        if localspi is not None:
-            data_payload["localspi"] = localspi
-        if remotespi is not None:
-            data_payload["remotespi"] = remotespi
-        if npu_offload is not None:
-            data_payload["npu-offload"] = npu_offload
-        data_payload.update(kwargs)
-        return self._client.put(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
-
-    def delete(
-        self,
-        name: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Delete this specific resource.
-
-        Args:
-            name: Object identifier (required)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        params = payload_dict.copy() if payload_dict else {}
-
-        # Build endpoint path
-        if not name:
-            raise ValueError("name is required for delete()")
-        endpoint = f"/vpn.ipsec/manualkey/{name}"
-        params.update(kwargs)
-        return self._client.delete(
-            "cmdb", endpoint, params=params, vdom=vdom, raw_json=raw_json
-        )
-
-    def exists(
-        self,
-        name: str,
-        vdom: str | bool | None = None,
-    ) -> Union[bool, Coroutine[Any, Any, bool]]:
-        """
-        Check if an object exists.
-
-        Args:
-            name: Object identifier
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-
-        Returns:
-            True if object exists, False otherwise
-
-        Example:
-            >>> if fgt.api.cmdb.firewall.address.exists("server1"):
-            ...     print("Address exists")
-        """
-        import inspect
-
-        from hfortix.FortiOS.exceptions_forti import ResourceNotFoundError
-
-        # Call get() - returns dict (sync) or coroutine (async)
-        result = self.get(name=name, vdom=vdom)
-
-        # Check if async mode
-        if inspect.iscoroutine(result):
-
-            async def _async():
-                try:
-                    # Runtime check confirms result is a coroutine, cast for
-                    # mypy
-                    await cast(Coroutine[Any, Any, dict[str, Any]], result)
-                    return True
-                except ResourceNotFoundError:
-                    return False
-
-            # Type ignore justified: mypy can't verify Union return type
-            # narrowing
-
-            return _async()
-        # Sync mode - get() already executed, no exception means it exists
-        return True
-
-    def post(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        nkey: str | None = None,
-        name: str | None = None,
-        interface: str | None = None,
-        remote_gw: str | None = None,
-        local_gw: str | None = None,
-        authentication: str | None = None,
-        encryption: str | None = None,
-        authkey: str | None = None,
-        enckey: str | None = None,
-        localspi: str | None = None,
-        remotespi: str | None = None,
-        npu_offload: str | None = None,
-        vdom: str | bool | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Create object(s) in this table.
-
-        Args:
-            payload_dict: Optional dictionary of all parameters (can be passed
-            as first positional arg)
-            nkey: If *action=clone*, use *nkey* to specify the ID for the new
-            resource to be created. (optional)
-            name: IPsec tunnel name. (optional)
-            interface: Name of the physical, aggregate, or VLAN interface.
-            (optional)
-            remote_gw: Peer gateway. (optional)
-            local_gw: Local gateway. (optional)
-            authentication: Authentication algorithm. Must be the same for both
-            ends of the tunnel. (optional)
-            encryption: Encryption algorithm. Must be the same for both ends of
-            the tunnel. (optional)
-            authkey: Hexadecimal authentication key in 16-digit (8-byte)
-            segments separated by hyphens. (optional)
-            enckey: Hexadecimal encryption key in 16-digit (8-byte) segments
-            separated by hyphens. (optional)
-            localspi: Local SPI, a hexadecimal 8-digit (4-byte) tag. Discerns
-            between two traffic streams with different encryption rules.
-            (optional)
-            remotespi: Remote SPI, a hexadecimal 8-digit (4-byte) tag. Discerns
-            between two traffic streams with different encryption rules.
-            (optional)
-            npu_offload: Enable/disable NPU offloading. (optional)
-            vdom: Virtual domain name, or False to skip. Handled by HTTPClient.
-            raw_json: If True, return full API response with metadata. If
-            False, return only results.
-            **kwargs: Additional query parameters (filter, sort, start, count,
-            format, etc.)
-
-        Common Query Parameters (via **kwargs):
-            filter: Filter results (e.g., filter='name==value')
-            sort: Sort results (e.g., sort='name,asc')
-            start: Starting entry index for paging
-            count: Maximum number of entries to return
-            format: Fields to return (e.g., format='name|type')
-            See FortiOS REST API documentation for full list of query
-            parameters
-
-        Returns:
-            Dictionary containing API response
-        """
-        data_payload = payload_dict.copy() if payload_dict else {}
-        endpoint = "/vpn.ipsec/manualkey"
-        if nkey is not None:
-            data_payload["nkey"] = nkey
-        if name is not None:
-            data_payload["name"] = name
-        if interface is not None:
-            data_payload["interface"] = interface
-        if remote_gw is not None:
-            data_payload["remote-gw"] = remote_gw
-        if local_gw is not None:
-            data_payload["local-gw"] = local_gw
-        if authentication is not None:
-            data_payload["authentication"] = authentication
-        if encryption is not None:
-            data_payload["encryption"] = encryption
-        if authkey is not None:
-            data_payload["authkey"] = authkey
-        if enckey is not None:
-            data_payload["enckey"] = enckey
-        if localspi is not None:
-            data_payload["localspi"] = localspi
-        if remotespi is not None:
-            data_payload["remotespi"] = remotespi
-        if npu_offload is not None:
-            data_payload["npu-offload"] = npu_offload
-        data_payload.update(kwargs)
-        return self._client.post(
-            "cmdb", endpoint, data=data_payload, vdom=vdom, raw_json=raw_json
-        )
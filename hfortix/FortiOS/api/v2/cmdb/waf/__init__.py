@@ -1,11 +1,26 @@
 """FortiOS CMDB - Waf category"""
 
-from .main_class import MainClass
-from .profile import Profile
-from .signature import Signature
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = ["MainClass", "Profile", "Signature"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "MainClass": "._registry",
+        "Profile": "._registry",
+        "Signature": "._registry",
+    },
+)
+
 
 class Waf:
     """
@@ -14,6 +29,10 @@ class Waf:
     This class provides access to all waf CMDB endpoints.
     """
 
+    main_class: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MainClass")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    signature: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Signature")
+
     def __init__(self, client):
         """
         Initialize Waf with all endpoint classes.
@@ -21,6 +40,4 @@ class Waf:
         Args:
             client: HTTPClient instance
         """
-        self.main_class = MainClass(client)
-        self.profile = Profile(client)
-        self.signature = Signature(client)
+        self._client = client
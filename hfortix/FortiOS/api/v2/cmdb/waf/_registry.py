@@ -0,0 +1,36 @@
+"""FortiOS CMDB - Waf endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "main_class": {
+        "class": "MainClass",
+        "path": "/waf/main-class",
+        "mkey": "id",
+        "fields": {"name": str, "id": int},
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/waf/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "external": str,
+            "extended-log": str,
+            "signature": list,
+            "constraint": list,
+            "method": list,
+            "address-list": list,
+            "url-access": list,
+            "comment": str,
+        },
+    },
+    "signature": {
+        "class": "Signature",
+        "path": "/waf/signature",
+        "mkey": "id",
+        "fields": {"desc": str, "id": int},
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
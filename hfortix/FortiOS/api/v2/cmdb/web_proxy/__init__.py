@@ -1,15 +1,16 @@
 """FortiOS CMDB - Web-proxy category"""
 
-from .debug_url import DebugUrl
-from .explicit import Explicit
-from .fast_fallback import FastFallback
-from .forward_server import ForwardServer
-from .forward_server_group import ForwardServerGroup
-from .global_ import Global
-from .isolator_server import IsolatorServer
-from .profile import Profile
-from .url_match import UrlMatch
-from .wisp import Wisp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
+    from .debug_url import DebugUrl
+
 
 __all__ = [
     "DebugUrl",
@@ -24,6 +25,22 @@ __all__ = [
     "Wisp",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "DebugUrl": ".debug_url",
+        "Explicit": "._registry",
+        "FastFallback": "._registry",
+        "ForwardServer": "._registry",
+        "ForwardServerGroup": "._registry",
+        "Global": "._registry",
+        "IsolatorServer": "._registry",
+        "Profile": "._registry",
+        "UrlMatch": "._registry",
+        "Wisp": "._registry",
+    },
+)
+
 
 class WebProxy:
     """
@@ -32,6 +49,21 @@ class WebProxy:
     This class provides access to all web-proxy CMDB endpoints.
     """
 
+    debug_url: LazyEndpoint[DebugUrl] = LazyEndpoint("DebugUrl")
+    explicit: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Explicit")
+    fast_fallback: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FastFallback")
+    forward_server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ForwardServer")
+    forward_server_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ForwardServerGroup"
+    )
+    global_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Global")
+    isolator_server: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IsolatorServer"
+    )
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    url_match: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("UrlMatch")
+    wisp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Wisp")
+
     def __init__(self, client):
         """
         Initialize WebProxy with all endpoint classes.
@@ -39,13 +71,4 @@ class WebProxy:
         Args:
             client: HTTPClient instance
         """
-        self.debug_url = DebugUrl(client)
-        self.explicit = Explicit(client)
-        self.fast_fallback = FastFallback(client)
-        self.forward_server = ForwardServer(client)
-        self.forward_server_group = ForwardServerGroup(client)
-        self.global_ = Global(client)
-        self.isolator_server = IsolatorServer(client)
-        self.profile = Profile(client)
-        self.url_match = UrlMatch(client)
-        self.wisp = Wisp(client)
+        self._client = client
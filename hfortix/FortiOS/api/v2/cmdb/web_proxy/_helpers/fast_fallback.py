@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_STATUS = ["enable", "disable"]
@@ -16,210 +16,20 @@ VALID_BODY_CONNECTION_MODE = ["sequentially", "simultaneously"]
 VALID_BODY_PROTOCOL = ["IPv4-first", "IPv6-first", "IPv4-only", "IPv6-only"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_fast_fallback_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_fast_fallback_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating fast_fallback.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate connection-mode if present
-    if "connection-mode" in payload:
-        value = payload.get("connection-mode")
-        if value and value not in VALID_BODY_CONNECTION_MODE:
-            return (
-                False,
-                f"Invalid connection-mode '{value}'. Must be one of: {', '.join(VALID_BODY_CONNECTION_MODE)}",
-            )
-
-    # Validate protocol if present
-    if "protocol" in payload:
-        value = payload.get("protocol")
-        if value and value not in VALID_BODY_PROTOCOL:
-            return (
-                False,
-                f"Invalid protocol '{value}'. Must be one of: {', '.join(VALID_BODY_PROTOCOL)}",
-            )
-
-    # Validate connection-timeout if present
-    if "connection-timeout" in payload:
-        value = payload.get("connection-timeout")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 200 or int_val > 1800000:
-                    return (
-                        False,
-                        "connection-timeout must be between 200 and 1800000",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"connection-timeout must be numeric, got: {value}",
-                )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_fast_fallback_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate status if present
-    if "status" in payload:
-        value = payload.get("status")
-        if value and value not in VALID_BODY_STATUS:
-            return (
-                False,
-                f"Invalid status '{value}'. Must be one of: {', '.join(VALID_BODY_STATUS)}",
-            )
-
-    # Validate connection-mode if present
-    if "connection-mode" in payload:
-        value = payload.get("connection-mode")
-        if value and value not in VALID_BODY_CONNECTION_MODE:
-            return (
-                False,
-                f"Invalid connection-mode '{value}'. Must be one of: {', '.join(VALID_BODY_CONNECTION_MODE)}",
-            )
-
-    # Validate protocol if present
-    if "protocol" in payload:
-        value = payload.get("protocol")
-        if value and value not in VALID_BODY_PROTOCOL:
-            return (
-                False,
-                f"Invalid protocol '{value}'. Must be one of: {', '.join(VALID_BODY_PROTOCOL)}",
-            )
-
-    # Validate connection-timeout if present
-    if "connection-timeout" in payload:
-        value = payload.get("connection-timeout")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 200 or int_val > 1800000:
-                    return (
-                        False,
-                        "connection-timeout must be between 200 and 1800000",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"connection-timeout must be numeric, got: {value}",
-                )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_fast_fallback_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "status": VALID_BODY_STATUS,
+        "connection-mode": VALID_BODY_CONNECTION_MODE,
+        "protocol": VALID_BODY_PROTOCOL,
+        "connection-timeout": (200, 1800000),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_fast_fallback_get = SCHEMA.get_validator()
+validate_fast_fallback_post = SCHEMA.post_validator()
+validate_fast_fallback_put = SCHEMA.put_validator("name")
+validate_fast_fallback_delete = SCHEMA.delete_validator("name")
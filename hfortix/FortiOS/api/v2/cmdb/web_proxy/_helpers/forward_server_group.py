@@ -8,7 +8,7 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_AFFINITY = ["enable", "disable"]
@@ -16,176 +16,19 @@ VALID_BODY_LDB_METHOD = ["weighted", "least-session", "active-passive"]
 VALID_BODY_GROUP_DOWN_OPTION = ["block", "pass"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_forward_server_group_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_forward_server_group_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating forward_server_group.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate affinity if present
-    if "affinity" in payload:
-        value = payload.get("affinity")
-        if value and value not in VALID_BODY_AFFINITY:
-            return (
-                False,
-                f"Invalid affinity '{value}'. Must be one of: {', '.join(VALID_BODY_AFFINITY)}",
-            )
-
-    # Validate ldb-method if present
-    if "ldb-method" in payload:
-        value = payload.get("ldb-method")
-        if value and value not in VALID_BODY_LDB_METHOD:
-            return (
-                False,
-                f"Invalid ldb-method '{value}'. Must be one of: {', '.join(VALID_BODY_LDB_METHOD)}",
-            )
-
-    # Validate group-down-option if present
-    if "group-down-option" in payload:
-        value = payload.get("group-down-option")
-        if value and value not in VALID_BODY_GROUP_DOWN_OPTION:
-            return (
-                False,
-                f"Invalid group-down-option '{value}'. Must be one of: {', '.join(VALID_BODY_GROUP_DOWN_OPTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_forward_server_group_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "name cannot exceed 63 characters")
-
-    # Validate affinity if present
-    if "affinity" in payload:
-        value = payload.get("affinity")
-        if value and value not in VALID_BODY_AFFINITY:
-            return (
-                False,
-                f"Invalid affinity '{value}'. Must be one of: {', '.join(VALID_BODY_AFFINITY)}",
-            )
-
-    # Validate ldb-method if present
-    if "ldb-method" in payload:
-        value = payload.get("ldb-method")
-        if value and value not in VALID_BODY_LDB_METHOD:
-            return (
-                False,
-                f"Invalid ldb-method '{value}'. Must be one of: {', '.join(VALID_BODY_LDB_METHOD)}",
-            )
-
-    # Validate group-down-option if present
-    if "group-down-option" in payload:
-        value = payload.get("group-down-option")
-        if value and value not in VALID_BODY_GROUP_DOWN_OPTION:
-            return (
-                False,
-                f"Invalid group-down-option '{value}'. Must be one of: {', '.join(VALID_BODY_GROUP_DOWN_OPTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_forward_server_group_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 63,
+        "affinity": VALID_BODY_AFFINITY,
+        "ldb-method": VALID_BODY_LDB_METHOD,
+        "group-down-option": VALID_BODY_GROUP_DOWN_OPTION,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_forward_server_group_get = SCHEMA.get_validator()
+validate_forward_server_group_post = SCHEMA.post_validator()
+validate_forward_server_group_put = SCHEMA.put_validator("name")
+validate_forward_server_group_delete = SCHEMA.delete_validator("name")
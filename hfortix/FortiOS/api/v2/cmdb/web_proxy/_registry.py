@@ -0,0 +1,199 @@
+"""FortiOS CMDB - Web Proxy endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "explicit": {
+        "class": "Explicit",
+        "path": "/web-proxy/explicit",
+        "fields": {
+            "status": str,
+            "secure-web-proxy": str,
+            "ftp-over-http": str,
+            "socks": str,
+            "http-incoming-port": str,
+            "http-connection-mode": str,
+            "https-incoming-port": str,
+            "secure-web-proxy-cert": list,
+            "client-cert": str,
+            "user-agent-detect": str,
+            "empty-cert-action": str,
+            "ssl-dh-bits": str,
+            "ftp-incoming-port": str,
+            "socks-incoming-port": str,
+            "incoming-ip": str,
+            "outgoing-ip": str,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "ipv6-status": str,
+            "incoming-ip6": str,
+            "outgoing-ip6": str,
+            "strict-guest": str,
+            "pref-dns-result": str,
+            "unknown-http-version": str,
+            "realm": str,
+            "sec-default-action": str,
+            "https-replacement-message": str,
+            "message-upon-server-error": str,
+            "pac-file-server-status": str,
+            "pac-file-url": str,
+            "pac-file-server-port": str,
+            "pac-file-through-https": str,
+            "pac-file-name": str,
+            "pac-file-data": str,
+            "pac-policy": list,
+            "ssl-algorithm": str,
+            "trace-auth-no-rsp": str,
+        },
+    },
+    "fast_fallback": {
+        "class": "FastFallback",
+        "path": "/web-proxy/fast-fallback",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "connection-mode": str,
+            "protocol": str,
+            "connection-timeout": int,
+        },
+    },
+    "forward_server": {
+        "class": "ForwardServer",
+        "path": "/web-proxy/forward-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "addr-type": str,
+            "ip": str,
+            "ipv6": str,
+            "fqdn": str,
+            "port": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "comment": str,
+            "masquerade": str,
+            "healthcheck": str,
+            "monitor": str,
+            "server-down-option": str,
+            "username": str,
+            "password": str,
+        },
+    },
+    "forward_server_group": {
+        "class": "ForwardServerGroup",
+        "path": "/web-proxy/forward-server-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "affinity": str,
+            "ldb-method": str,
+            "group-down-option": str,
+            "server-list": list,
+        },
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/web-proxy/global",
+        "fields": {
+            "ssl-cert": str,
+            "ssl-ca-cert": str,
+            "fast-policy-match": str,
+            "ldap-user-cache": str,
+            "proxy-fqdn": str,
+            "max-request-length": int,
+            "max-message-length": int,
+            "http2-client-window-size": int,
+            "http2-server-window-size": int,
+            "auth-sign-timeout": int,
+            "strict-web-check": str,
+            "forward-proxy-auth": str,
+            "forward-server-affinity-timeout": int,
+            "max-waf-body-cache-length": int,
+            "webproxy-profile": str,
+            "learn-client-ip": str,
+            "always-learn-client-ip": str,
+            "learn-client-ip-from-header": str,
+            "learn-client-ip-srcaddr": list,
+            "learn-client-ip-srcaddr6": list,
+            "src-affinity-exempt-addr": str,
+            "src-affinity-exempt-addr6": str,
+            "policy-partial-match": str,
+            "log-policy-pending": str,
+            "log-forward-server": str,
+            "log-app-id": str,
+            "proxy-transparent-cert-inspection": str,
+            "request-obs-fold": str,
+        },
+    },
+    "isolator_server": {
+        "class": "IsolatorServer",
+        "path": "/web-proxy/isolator-server",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "addr-type": str,
+            "ip": str,
+            "ipv6": str,
+            "fqdn": str,
+            "port": int,
+            "interface-select-method": str,
+            "interface": str,
+            "vrf-select": int,
+            "comment": str,
+            "masquerade": str,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/web-proxy/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "header-client-ip": str,
+            "header-via-request": str,
+            "header-via-response": str,
+            "header-client-cert": str,
+            "header-x-forwarded-for": str,
+            "header-x-forwarded-client-cert": str,
+            "header-front-end-https": str,
+            "header-x-authenticated-user": str,
+            "header-x-authenticated-groups": str,
+            "strip-encoding": str,
+            "log-header-change": str,
+            "headers": list,
+        },
+    },
+    "url_match": {
+        "class": "UrlMatch",
+        "path": "/web-proxy/url-match",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "url-pattern": str,
+            "forward-server": str,
+            "fast-fallback": str,
+            "cache-exemption": str,
+            "comment": str,
+        },
+    },
+    "wisp": {
+        "class": "Wisp",
+        "path": "/web-proxy/wisp",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "outgoing-ip": str,
+            "server-ip": str,
+            "server-port": int,
+            "max-connections": int,
+            "timeout": int,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,19 +1,14 @@
 """FortiOS CMDB - Webfilter category"""
 
-from .content import Content
-from .content_header import ContentHeader
-from .fortiguard import Fortiguard
-from .ftgd_local_cat import FtgdLocalCat
-from .ftgd_local_rating import FtgdLocalRating
-from .ftgd_local_risk import FtgdLocalRisk
-from .ftgd_risk_level import FtgdRiskLevel
-from .ips_urlfilter_cache_setting import IpsUrlfilterCacheSetting
-from .ips_urlfilter_setting import IpsUrlfilterSetting
-from .ips_urlfilter_setting6 import IpsUrlfilterSetting6
-from .override import Override
-from .profile import Profile
-from .search_engine import SearchEngine
-from .urlfilter import Urlfilter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "Content",
@@ -32,6 +27,26 @@ __all__ = [
     "Urlfilter",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Content": "._registry",
+        "ContentHeader": "._registry",
+        "Fortiguard": "._registry",
+        "FtgdLocalCat": "._registry",
+        "FtgdLocalRating": "._registry",
+        "FtgdLocalRisk": "._registry",
+        "FtgdRiskLevel": "._registry",
+        "IpsUrlfilterCacheSetting": "._registry",
+        "IpsUrlfilterSetting": "._registry",
+        "IpsUrlfilterSetting6": "._registry",
+        "Override": "._registry",
+        "Profile": "._registry",
+        "SearchEngine": "._registry",
+        "Urlfilter": "._registry",
+    },
+)
+
 
 class Webfilter:
     """
@@ -40,6 +55,29 @@ class Webfilter:
     This class provides access to all webfilter CMDB endpoints.
     """
 
+    content: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Content")
+    content_header: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ContentHeader")
+    fortiguard: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Fortiguard")
+    ftgd_local_cat: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FtgdLocalCat")
+    ftgd_local_rating: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "FtgdLocalRating"
+    )
+    ftgd_local_risk: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FtgdLocalRisk")
+    ftgd_risk_level: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("FtgdRiskLevel")
+    ips_urlfilter_cache_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsUrlfilterCacheSetting"
+    )
+    ips_urlfilter_setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsUrlfilterSetting"
+    )
+    ips_urlfilter_setting6: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "IpsUrlfilterSetting6"
+    )
+    override: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Override")
+    profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Profile")
+    search_engine: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SearchEngine")
+    urlfilter: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Urlfilter")
+
     def __init__(self, client):
         """
         Initialize Webfilter with all endpoint classes.
@@ -47,17 +85,4 @@ class Webfilter:
         Args:
             client: HTTPClient instance
         """
-        self.content = Content(client)
-        self.content_header = ContentHeader(client)
-        self.fortiguard = Fortiguard(client)
-        self.ftgd_local_cat = FtgdLocalCat(client)
-        self.ftgd_local_rating = FtgdLocalRating(client)
-        self.ftgd_local_risk = FtgdLocalRisk(client)
-        self.ftgd_risk_level = FtgdRiskLevel(client)
-        self.ips_urlfilter_cache_setting = IpsUrlfilterCacheSetting(client)
-        self.ips_urlfilter_setting = IpsUrlfilterSetting(client)
-        self.ips_urlfilter_setting6 = IpsUrlfilterSetting6(client)
-        self.override = Override(client)
-        self.profile = Profile(client)
-        self.search_engine = SearchEngine(client)
-        self.urlfilter = Urlfilter(client)
+        self._client = client
@@ -0,0 +1,180 @@
+"""FortiOS CMDB - Webfilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "content": {
+        "class": "Content",
+        "path": "/webfilter/content",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "content_header": {
+        "class": "ContentHeader",
+        "path": "/webfilter/content-header",
+        "mkey": "id",
+        "fields": {"id": int, "name": str, "comment": str, "entries": list},
+    },
+    "fortiguard": {
+        "class": "Fortiguard",
+        "path": "/webfilter/fortiguard",
+        "fields": {
+            "cache-mode": str,
+            "cache-prefix-match": str,
+            "cache-mem-permille": int,
+            "ovrd-auth-port-http": int,
+            "ovrd-auth-port-https": int,
+            "ovrd-auth-port-https-flow": int,
+            "ovrd-auth-port-warning": int,
+            "ovrd-auth-https": str,
+            "warn-auth-https": str,
+            "close-ports": str,
+            "request-packet-size-limit": int,
+            "embed-image": str,
+        },
+    },
+    "ftgd_local_cat": {
+        "class": "FtgdLocalCat",
+        "path": "/webfilter/ftgd-local-cat",
+        "mkey": "desc",
+        "fields": {"status": str, "id": int, "desc": str},
+    },
+    "ftgd_local_rating": {
+        "class": "FtgdLocalRating",
+        "path": "/webfilter/ftgd-local-rating",
+        "mkey": "url",
+        "fields": {"url": str, "status": str, "comment": str, "rating": str},
+    },
+    "ftgd_local_risk": {
+        "class": "FtgdLocalRisk",
+        "path": "/webfilter/ftgd-local-risk",
+        "mkey": "url",
+        "fields": {
+            "url": str,
+            "status": str,
+            "comment": str,
+            "risk-score": int,
+        },
+    },
+    "ftgd_risk_level": {
+        "class": "FtgdRiskLevel",
+        "path": "/webfilter/ftgd-risk-level",
+        "mkey": "name",
+        "fields": {"name": str, "high": int, "low": int},
+    },
+    "ips_urlfilter_cache_setting": {
+        "class": "IpsUrlfilterCacheSetting",
+        "path": "/webfilter/ips-urlfilter-cache-setting",
+        "fields": {"dns-retry-interval": int, "extended-ttl": int},
+    },
+    "ips_urlfilter_setting": {
+        "class": "IpsUrlfilterSetting",
+        "path": "/webfilter/ips-urlfilter-setting",
+        "fields": {
+            "device": str,
+            "distance": int,
+            "gateway": str,
+            "geo-filter": str,
+        },
+    },
+    "ips_urlfilter_setting6": {
+        "class": "IpsUrlfilterSetting6",
+        "path": "/webfilter/ips-urlfilter-setting6",
+        "fields": {
+            "device": str,
+            "distance": int,
+            "gateway6": str,
+            "geo-filter": str,
+        },
+    },
+    "override": {
+        "class": "Override",
+        "path": "/webfilter/override",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "status": str,
+            "ip": str,
+            "user": str,
+            "user-group": str,
+            "old-profile": str,
+            "new-profile": str,
+            "ip6": str,
+            "expires": str,
+            "initiator": str,
+        },
+    },
+    "profile": {
+        "class": "Profile",
+        "path": "/webfilter/profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "feature-set": str,
+            "replacemsg-group": str,
+            "options": str,
+            "https-replacemsg": str,
+            "web-flow-log-encoding": str,
+            "ovrd-perm": str,
+            "post-action": str,
+            "override": list,
+            "web": list,
+            "ftgd-wf": list,
+            "antiphish": list,
+            "wisp": str,
+            "wisp-servers": list,
+            "wisp-algorithm": str,
+            "log-all-url": str,
+            "web-content-log": str,
+            "web-filter-activex-log": str,
+            "web-filter-command-block-log": str,
+            "web-filter-cookie-log": str,
+            "web-filter-applet-log": str,
+            "web-filter-jscript-log": str,
+            "web-filter-js-log": str,
+            "web-filter-vbs-log": str,
+            "web-filter-unknown-log": str,
+            "web-filter-referer-log": str,
+            "web-filter-cookie-removal-log": str,
+            "web-url-log": str,
+            "web-invalid-domain-log": str,
+            "web-ftgd-err-log": str,
+            "web-ftgd-quota-usage": str,
+            "extended-log": str,
+            "web-extended-all-action-log": str,
+            "web-antiphishing-log": str,
+        },
+    },
+    "search_engine": {
+        "class": "SearchEngine",
+        "path": "/webfilter/search-engine",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "hostname": str,
+            "url": str,
+            "query": str,
+            "safesearch": str,
+            "charset": str,
+            "safesearch-str": str,
+        },
+    },
+    "urlfilter": {
+        "class": "Urlfilter",
+        "path": "/webfilter/urlfilter",
+        "mkey": "id",
+        "fields": {
+            "id": int,
+            "name": str,
+            "comment": str,
+            "one-arm-ips-urlfilter": str,
+            "ip-addr-block": str,
+            "ip4-mapped-ip6": str,
+            "include-subdomains": str,
+            "entries": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
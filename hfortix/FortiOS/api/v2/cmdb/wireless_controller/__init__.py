@@ -1,51 +1,14 @@
 """FortiOS CMDB - Wireless-controller category"""
 
-from .access_control_list import AccessControlList
-from .ap_status import ApStatus
-from .apcfg_profile import ApcfgProfile
-from .arrp_profile import ArrpProfile
-from .ble_profile import BleProfile
-from .bonjour_profile import BonjourProfile
-from .global_ import Global
-from .hotspot20_anqp_3gpp_cellular import Hotspot20AnqpThreeGppCellular
-from .hotspot20_anqp_ip_address_type import Hotspot20AnqpIpAddressType
-from .hotspot20_anqp_nai_realm import Hotspot20AnqpNaiRealm
-from .hotspot20_anqp_network_auth_type import Hotspot20AnqpNetworkAuthType
-from .hotspot20_anqp_roaming_consortium import Hotspot20AnqpRoamingConsortium
-from .hotspot20_anqp_venue_name import Hotspot20AnqpVenueName
-from .hotspot20_anqp_venue_url import Hotspot20AnqpVenueUrl
-from .hotspot20_h2qp_advice_of_charge import Hotspot20H2qpAdviceOfCharge
-from .hotspot20_h2qp_conn_capability import Hotspot20H2qpConnCapability
-from .hotspot20_h2qp_operator_name import Hotspot20H2qpOperatorName
-from .hotspot20_h2qp_osu_provider import Hotspot20H2qpOsuProvider
-from .hotspot20_h2qp_osu_provider_nai import Hotspot20H2qpOsuProviderNai
-from .hotspot20_h2qp_terms_and_conditions import (
-    Hotspot20H2qpTermsAndConditions,
-)
-from .hotspot20_h2qp_wan_metric import Hotspot20H2qpWanMetric
-from .hotspot20_hs_profile import Hotspot20HsProfile
-from .hotspot20_icon import Hotspot20Icon
-from .hotspot20_qos_map import Hotspot20QosMap
-from .inter_controller import InterController
-from .log import Log
-from .lw_profile import LwProfile
-from .mpsk_profile import MpskProfile
-from .nac_profile import NacProfile
-from .qos_profile import QosProfile
-from .region import Region
-from .setting import Setting
-from .snmp import Snmp
-from .ssid_policy import SsidPolicy
-from .syslog_profile import SyslogProfile
-from .timers import Timers
-from .utm_profile import UtmProfile
-from .vap import Vap
-from .vap_group import VapGroup
-from .wag_profile import WagProfile
-from .wids_profile import WidsProfile
-from .wtp import Wtp
-from .wtp_group import WtpGroup
-from .wtp_profile import WtpProfile
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "AccessControlList",
@@ -94,6 +57,56 @@ __all__ = [
     "WtpProfile",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AccessControlList": "._registry",
+        "ApStatus": "._registry",
+        "ApcfgProfile": "._registry",
+        "ArrpProfile": "._registry",
+        "BleProfile": "._registry",
+        "BonjourProfile": "._registry",
+        "Global": "._registry",
+        "Hotspot20AnqpThreeGppCellular": "._registry",
+        "Hotspot20AnqpIpAddressType": "._registry",
+        "Hotspot20AnqpNaiRealm": "._registry",
+        "Hotspot20AnqpNetworkAuthType": "._registry",
+        "Hotspot20AnqpRoamingConsortium": "._registry",
+        "Hotspot20AnqpVenueName": "._registry",
+        "Hotspot20AnqpVenueUrl": "._registry",
+        "Hotspot20H2qpAdviceOfCharge": "._registry",
+        "Hotspot20H2qpConnCapability": "._registry",
+        "Hotspot20H2qpOperatorName": "._registry",
+        "Hotspot20H2qpOsuProvider": "._registry",
+        "Hotspot20H2qpOsuProviderNai": "._registry",
+        "Hotspot20H2qpTermsAndConditions": "._registry",
+        "Hotspot20H2qpWanMetric": "._registry",
+        "Hotspot20HsProfile": "._registry",
+        "Hotspot20Icon": "._registry",
+        "Hotspot20QosMap": "._registry",
+        "InterController": "._registry",
+        "Log": "._registry",
+        "LwProfile": "._registry",
+        "MpskProfile": "._registry",
+        "NacProfile": "._registry",
+        "QosProfile": "._registry",
+        "Region": "._registry",
+        "Setting": "._registry",
+        "Snmp": "._registry",
+        "SsidPolicy": "._registry",
+        "SyslogProfile": "._registry",
+        "Timers": "._registry",
+        "UtmProfile": "._registry",
+        "Vap": "._registry",
+        "VapGroup": "._registry",
+        "WagProfile": "._registry",
+        "WidsProfile": "._registry",
+        "Wtp": "._registry",
+        "WtpGroup": "._registry",
+        "WtpProfile": "._registry",
+    },
+)
+
 
 class WirelessController:
     """
@@ -102,6 +115,89 @@ class WirelessController:
     This class provides access to all wireless-controller CMDB endpoints.
     """
 
+    access_control_list: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "AccessControlList"
+    )
+    ap_status: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ApStatus")
+    apcfg_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ApcfgProfile")
+    arrp_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("ArrpProfile")
+    ble_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("BleProfile")
+    bonjour_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "BonjourProfile"
+    )
+    global_: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Global")
+    hotspot20_anqp_3gpp_cellular: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20AnqpThreeGppCellular"
+    )
+    hotspot20_anqp_ip_address_type: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20AnqpIpAddressType"
+    )
+    hotspot20_anqp_nai_realm: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20AnqpNaiRealm"
+    )
+    hotspot20_anqp_network_auth_type: LazyEndpoint[CmdbEndpoint] = (
+        LazyEndpoint("Hotspot20AnqpNetworkAuthType")
+    )
+    hotspot20_anqp_roaming_consortium: LazyEndpoint[CmdbEndpoint] = (
+        LazyEndpoint("Hotspot20AnqpRoamingConsortium")
+    )
+    hotspot20_anqp_venue_name: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20AnqpVenueName"
+    )
+    hotspot20_anqp_venue_url: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20AnqpVenueUrl"
+    )
+    hotspot20_h2qp_advice_of_charge: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpAdviceOfCharge"
+    )
+    hotspot20_h2qp_conn_capability: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpConnCapability"
+    )
+    hotspot20_h2qp_operator_name: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpOperatorName"
+    )
+    hotspot20_h2qp_osu_provider: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpOsuProvider"
+    )
+    hotspot20_h2qp_osu_provider_nai: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpOsuProviderNai"
+    )
+    hotspot20_h2qp_terms_and_conditions: LazyEndpoint[CmdbEndpoint] = (
+        LazyEndpoint("Hotspot20H2qpTermsAndConditions")
+    )
+    hotspot20_h2qp_wan_metric: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20H2qpWanMetric"
+    )
+    hotspot20_hs_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20HsProfile"
+    )
+    hotspot20_icon: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Hotspot20Icon")
+    hotspot20_qos_map: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "Hotspot20QosMap"
+    )
+    inter_controller: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "InterController"
+    )
+    log: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Log")
+    lw_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("LwProfile")
+    mpsk_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("MpskProfile")
+    nac_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("NacProfile")
+    qos_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("QosProfile")
+    region: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Region")
+    setting: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Setting")
+    snmp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Snmp")
+    ssid_policy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SsidPolicy")
+    syslog_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("SyslogProfile")
+    timers: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Timers")
+    utm_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("UtmProfile")
+    vap: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Vap")
+    vap_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("VapGroup")
+    wag_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WagProfile")
+    wids_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WidsProfile")
+    wtp: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("Wtp")
+    wtp_group: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WtpGroup")
+    wtp_profile: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WtpProfile")
+
     def __init__(self, client):
         """
         Initialize WirelessController with all endpoint classes.
@@ -109,63 +205,4 @@ class WirelessController:
         Args:
             client: HTTPClient instance
         """
-        self.access_control_list = AccessControlList(client)
-        self.ap_status = ApStatus(client)
-        self.apcfg_profile = ApcfgProfile(client)
-        self.arrp_profile = ArrpProfile(client)
-        self.ble_profile = BleProfile(client)
-        self.bonjour_profile = BonjourProfile(client)
-        self.global_ = Global(client)
-        self.hotspot20_anqp_3gpp_cellular = Hotspot20AnqpThreeGppCellular(
-            client
-        )
-        self.hotspot20_anqp_ip_address_type = Hotspot20AnqpIpAddressType(
-            client
-        )
-        self.hotspot20_anqp_nai_realm = Hotspot20AnqpNaiRealm(client)
-        self.hotspot20_anqp_network_auth_type = Hotspot20AnqpNetworkAuthType(
-            client
-        )
-        self.hotspot20_anqp_roaming_consortium = (
-            Hotspot20AnqpRoamingConsortium(client)
-        )
-        self.hotspot20_anqp_venue_name = Hotspot20AnqpVenueName(client)
-        self.hotspot20_anqp_venue_url = Hotspot20AnqpVenueUrl(client)
-        self.hotspot20_h2qp_advice_of_charge = Hotspot20H2qpAdviceOfCharge(
-            client
-        )
-        self.hotspot20_h2qp_conn_capability = Hotspot20H2qpConnCapability(
-            client
-        )
-        self.hotspot20_h2qp_operator_name = Hotspot20H2qpOperatorName(client)
-        self.hotspot20_h2qp_osu_provider = Hotspot20H2qpOsuProvider(client)
-        self.hotspot20_h2qp_osu_provider_nai = Hotspot20H2qpOsuProviderNai(
-            client
-        )
-        self.hotspot20_h2qp_terms_and_conditions = (
-            Hotspot20H2qpTermsAndConditions(client)
-        )
-        self.hotspot20_h2qp_wan_metric = Hotspot20H2qpWanMetric(client)
-        self.hotspot20_hs_profile = Hotspot20HsProfile(client)
-        self.hotspot20_icon = Hotspot20Icon(client)
-        self.hotspot20_qos_map = Hotspot20QosMap(client)
-        self.inter_controller = InterController(client)
-        self.log = Log(client)
-        self.lw_profile = LwProfile(client)
-        self.mpsk_profile = MpskProfile(client)
-        self.nac_profile = NacProfile(client)
-        self.qos_profile = QosProfile(client)
-        self.region = Region(client)
-        self.setting = Setting(client)
-        self.snmp = Snmp(client)
-        self.ssid_policy = SsidPolicy(client)
-        self.syslog_profile = SyslogProfile(client)
-        self.timers = Timers(client)
-        self.utm_profile = UtmProfile(client)
-        self.vap = Vap(client)
-        self.vap_group = VapGroup(client)
-        self.wag_profile = WagProfile(client)
-        self.wids_profile = WidsProfile(client)
-        self.wtp = Wtp(client)
-        self.wtp_group = WtpGroup(client)
-        self.wtp_profile = WtpProfile(client)
+        self._client = client
@@ -8,244 +8,28 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_LW_PROTOCOL = ["basics-station", "packet-forwarder"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_lw_profile_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_lw_profile_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating lw_profile.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comment if present
-    if "comment" in payload:
-        value = payload.get("comment")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "comment cannot exceed 63 characters")
-
-    # Validate lw-protocol if present
-    if "lw-protocol" in payload:
-        value = payload.get("lw-protocol")
-        if value and value not in VALID_BODY_LW_PROTOCOL:
-            return (
-                False,
-                f"Invalid lw-protocol '{value}'. Must be one of: {', '.join(VALID_BODY_LW_PROTOCOL)}",
-            )
-
-    # Validate cups-server if present
-    if "cups-server" in payload:
-        value = payload.get("cups-server")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "cups-server cannot exceed 255 characters")
-
-    # Validate cups-server-port if present
-    if "cups-server-port" in payload:
-        value = payload.get("cups-server-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "cups-server-port must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"cups-server-port must be numeric, got: {value}",
-                )
-
-    # Validate tc-server if present
-    if "tc-server" in payload:
-        value = payload.get("tc-server")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "tc-server cannot exceed 255 characters")
-
-    # Validate tc-server-port if present
-    if "tc-server-port" in payload:
-        value = payload.get("tc-server-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "tc-server-port must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"tc-server-port must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_lw_profile_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate comment if present
-    if "comment" in payload:
-        value = payload.get("comment")
-        if value and isinstance(value, str) and len(value) > 63:
-            return (False, "comment cannot exceed 63 characters")
-
-    # Validate lw-protocol if present
-    if "lw-protocol" in payload:
-        value = payload.get("lw-protocol")
-        if value and value not in VALID_BODY_LW_PROTOCOL:
-            return (
-                False,
-                f"Invalid lw-protocol '{value}'. Must be one of: {', '.join(VALID_BODY_LW_PROTOCOL)}",
-            )
-
-    # Validate cups-server if present
-    if "cups-server" in payload:
-        value = payload.get("cups-server")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "cups-server cannot exceed 255 characters")
-
-    # Validate cups-server-port if present
-    if "cups-server-port" in payload:
-        value = payload.get("cups-server-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "cups-server-port must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"cups-server-port must be numeric, got: {value}",
-                )
-
-    # Validate tc-server if present
-    if "tc-server" in payload:
-        value = payload.get("tc-server")
-        if value and isinstance(value, str) and len(value) > 255:
-            return (False, "tc-server cannot exceed 255 characters")
-
-    # Validate tc-server-port if present
-    if "tc-server-port" in payload:
-        value = payload.get("tc-server-port")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "tc-server-port must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (False, f"tc-server-port must be numeric, got: {value}")
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_lw_profile_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "comment": 63,
+        "lw-protocol": VALID_BODY_LW_PROTOCOL,
+        "cups-server": 255,
+        "cups-server-port": (0, 65535),
+        "tc-server": 255,
+        "tc-server-port": (0, 65535),
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_lw_profile_get = SCHEMA.get_validator()
+validate_lw_profile_post = SCHEMA.post_validator()
+validate_lw_profile_put = SCHEMA.put_validator("name")
+validate_lw_profile_delete = SCHEMA.delete_validator("name")
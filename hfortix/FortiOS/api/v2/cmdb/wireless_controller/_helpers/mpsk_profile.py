@@ -8,211 +8,27 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
 # Valid enum values from API documentation
 VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH = ["enable", "disable"]
 VALID_BODY_MPSK_TYPE = ["wpa2-personal", "wpa3-sae", "wpa3-sae-transition"]
 VALID_QUERY_ACTION = ["default", "schema"]
 
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_mpsk_profile_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    # Validate query parameters if present
-    if "action" in params:
-        value = params.get("action")
-        if value and value not in VALID_QUERY_ACTION:
-            return (
-                False,
-                f"Invalid query parameter 'action'='{value}'. Must be one of: {', '.join(VALID_QUERY_ACTION)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_mpsk_profile_post(
-    payload: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating mpsk_profile.
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate mpsk-concurrent-clients if present
-    if "mpsk-concurrent-clients" in payload:
-        value = payload.get("mpsk-concurrent-clients")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "mpsk-concurrent-clients must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"mpsk-concurrent-clients must be numeric, got: {value}",
-                )
-
-    # Validate mpsk-external-server-auth if present
-    if "mpsk-external-server-auth" in payload:
-        value = payload.get("mpsk-external-server-auth")
-        if value and value not in VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH:
-            return (
-                False,
-                f"Invalid mpsk-external-server-auth '{value}'. Must be one of: {', '.join(VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH)}",
-            )
-
-    # Validate mpsk-external-server if present
-    if "mpsk-external-server" in payload:
-        value = payload.get("mpsk-external-server")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "mpsk-external-server cannot exceed 35 characters")
-
-    # Validate mpsk-type if present
-    if "mpsk-type" in payload:
-        value = payload.get("mpsk-type")
-        if value and value not in VALID_BODY_MPSK_TYPE:
-            return (
-                False,
-                f"Invalid mpsk-type '{value}'. Must be one of: {', '.join(VALID_BODY_MPSK_TYPE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# PUT Validation
-# ============================================================================
-
-
-def validate_mpsk_profile_put(
-    name: str | None = None, payload: dict[str, Any] | None = None
-) -> tuple[bool, str | None]:
-    """
-    Validate PUT request payload for updating {endpoint_name}.
-
-    Args:
-        name: Object identifier (required)
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # name is required for updates
-    if not name:
-        return (False, "name is required for PUT operation")
-
-    # If no payload provided, nothing to validate
-    if not payload:
-        return (True, None)
-
-    # Validate name if present
-    if "name" in payload:
-        value = payload.get("name")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "name cannot exceed 35 characters")
-
-    # Validate mpsk-concurrent-clients if present
-    if "mpsk-concurrent-clients" in payload:
-        value = payload.get("mpsk-concurrent-clients")
-        if value is not None:
-            try:
-                int_val = int(value)
-                if int_val < 0 or int_val > 65535:
-                    return (
-                        False,
-                        "mpsk-concurrent-clients must be between 0 and 65535",
-                    )
-            except (ValueError, TypeError):
-                return (
-                    False,
-                    f"mpsk-concurrent-clients must be numeric, got: {value}",
-                )
-
-    # Validate mpsk-external-server-auth if present
-    if "mpsk-external-server-auth" in payload:
-        value = payload.get("mpsk-external-server-auth")
-        if value and value not in VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH:
-            return (
-                False,
-                f"Invalid mpsk-external-server-auth '{value}'. Must be one of: {', '.join(VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH)}",
-            )
-
-    # Validate mpsk-external-server if present
-    if "mpsk-external-server" in payload:
-        value = payload.get("mpsk-external-server")
-        if value and isinstance(value, str) and len(value) > 35:
-            return (False, "mpsk-external-server cannot exceed 35 characters")
-
-    # Validate mpsk-type if present
-    if "mpsk-type" in payload:
-        value = payload.get("mpsk-type")
-        if value and value not in VALID_BODY_MPSK_TYPE:
-            return (
-                False,
-                f"Invalid mpsk-type '{value}'. Must be one of: {', '.join(VALID_BODY_MPSK_TYPE)}",
-            )
-
-    return (True, None)
-
-
-# ============================================================================
-# DELETE Validation
-# ============================================================================
-
-
-def validate_mpsk_profile_delete(
-    name: str | None = None,
-) -> tuple[bool, str | None]:
-    """
-    Validate DELETE request parameters.
-
-    Args:
-        name: Object identifier (required)
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    if not name:
-        return (False, "name is required for DELETE operation")
-
-    return (True, None)
+# Body fields in check order: allowed values (list), integer
+# range (min, max) or maximum string length (int)
+SCHEMA = EndpointSchema(
+    body={
+        "name": 35,
+        "mpsk-concurrent-clients": (0, 65535),
+        "mpsk-external-server-auth": VALID_BODY_MPSK_EXTERNAL_SERVER_AUTH,
+        "mpsk-external-server": 35,
+        "mpsk-type": VALID_BODY_MPSK_TYPE,
+    },
+    query={"action": VALID_QUERY_ACTION},
+)
+
+validate_mpsk_profile_get = SCHEMA.get_validator()
+validate_mpsk_profile_post = SCHEMA.post_validator()
+validate_mpsk_profile_put = SCHEMA.put_validator("name")
+validate_mpsk_profile_delete = SCHEMA.delete_validator("name")
@@ -0,0 +1,1001 @@
+"""FortiOS CMDB - Wireless Controller endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "access_control_list": {
+        "class": "AccessControlList",
+        "path": "/wireless-controller/access-control-list",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "layer3-ipv4-rules": list,
+            "layer3-ipv6-rules": list,
+        },
+    },
+    "ap_status": {
+        "class": "ApStatus",
+        "path": "/wireless-controller/ap-status",
+        "mkey": "id",
+        "fields": {"id": int, "bssid": str, "ssid": str, "status": str},
+    },
+    "apcfg_profile": {
+        "class": "ApcfgProfile",
+        "path": "/wireless-controller/apcfg-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ap-family": str,
+            "comment": str,
+            "ac-type": str,
+            "ac-timer": int,
+            "ac-ip": str,
+            "ac-port": int,
+            "command-list": list,
+        },
+    },
+    "arrp_profile": {
+        "class": "ArrpProfile",
+        "path": "/wireless-controller/arrp-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "selection-period": int,
+            "monitor-period": int,
+            "weight-managed-ap": int,
+            "weight-rogue-ap": int,
+            "weight-noise-floor": int,
+            "weight-channel-load": int,
+            "weight-spectral-rssi": int,
+            "weight-weather-channel": int,
+            "weight-dfs-channel": int,
+            "threshold-ap": int,
+            "threshold-noise-floor": str,
+            "threshold-channel-load": int,
+            "threshold-spectral-rssi": str,
+            "threshold-tx-retries": int,
+            "threshold-rx-errors": int,
+            "include-weather-channel": str,
+            "include-dfs-channel": str,
+            "override-darrp-optimize": str,
+            "darrp-optimize": int,
+            "darrp-optimize-schedules": list,
+        },
+    },
+    "ble_profile": {
+        "class": "BleProfile",
+        "path": "/wireless-controller/ble-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "advertising": str,
+            "ibeacon-uuid": str,
+            "major-id": int,
+            "minor-id": int,
+            "eddystone-namespace": str,
+            "eddystone-instance": str,
+            "eddystone-url": str,
+            "txpower": str,
+            "beacon-interval": int,
+            "ble-scanning": str,
+            "scan-type": str,
+            "scan-threshold": str,
+            "scan-period": int,
+            "scan-time": int,
+            "scan-interval": int,
+            "scan-window": int,
+        },
+    },
+    "bonjour_profile": {
+        "class": "BonjourProfile",
+        "path": "/wireless-controller/bonjour-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "micro-location": str,
+            "policy-list": list,
+        },
+    },
+    "global_": {
+        "class": "Global",
+        "path": "/wireless-controller/global",
+        "fields": {
+            "name": str,
+            "location": str,
+            "acd-process-count": int,
+            "wpad-process-count": int,
+            "image-download": str,
+            "rolling-wtp-upgrade": str,
+            "rolling-wtp-upgrade-threshold": str,
+            "max-retransmit": int,
+            "control-message-offload": str,
+            "data-ethernet-II": str,
+            "link-aggregation": str,
+            "mesh-eth-type": int,
+            "fiapp-eth-type": int,
+            "discovery-mc-addr": str,
+            "discovery-mc-addr6": str,
+            "max-clients": int,
+            "rogue-scan-mac-adjacency": int,
+            "ipsec-base-ip": str,
+            "wtp-share": str,
+            "tunnel-mode": str,
+            "nac-interval": int,
+            "ap-log-server": str,
+            "ap-log-server-ip": str,
+            "ap-log-server-port": int,
+            "max-sta-offline": int,
+            "max-sta-offline-ip2mac": int,
+            "max-sta-cap": int,
+            "max-sta-cap-wtp": int,
+            "max-rogue-ap": int,
+            "max-rogue-ap-wtp": int,
+            "max-rogue-sta": int,
+            "max-wids-entry": int,
+            "max-ble-device": int,
+            "dfs-lab-test": str,
+        },
+    },
+    "hotspot20_anqp_3gpp_cellular": {
+        "class": "Hotspot20AnqpThreeGppCellular",
+        "path": "/wireless-controller.hotspot20/anqp-3gpp-cellular",
+        "mkey": "name",
+        "fields": {"name": str, "mcc-mnc-list": list},
+    },
+    "hotspot20_anqp_ip_address_type": {
+        "class": "Hotspot20AnqpIpAddressType",
+        "path": "/wireless-controller.hotspot20/anqp-ip-address-type",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "ipv6-address-type": str,
+            "ipv4-address-type": str,
+        },
+    },
+    "hotspot20_anqp_nai_realm": {
+        "class": "Hotspot20AnqpNaiRealm",
+        "path": "/wireless-controller.hotspot20/anqp-nai-realm",
+        "mkey": "name",
+        "fields": {"name": str, "nai-list": list},
+    },
+    "hotspot20_anqp_network_auth_type": {
+        "class": "Hotspot20AnqpNetworkAuthType",
+        "path": "/wireless-controller.hotspot20/anqp-network-auth-type",
+        "mkey": "name",
+        "fields": {"name": str, "auth-type": str, "url": str},
+    },
+    "hotspot20_anqp_roaming_consortium": {
+        "class": "Hotspot20AnqpRoamingConsortium",
+        "path": "/wireless-controller.hotspot20/anqp-roaming-consortium",
+        "mkey": "name",
+        "fields": {"name": str, "oi-list": list},
+    },
+    "hotspot20_anqp_venue_name": {
+        "class": "Hotspot20AnqpVenueName",
+        "path": "/wireless-controller.hotspot20/anqp-venue-name",
+        "mkey": "name",
+        "fields": {"name": str, "value-list": list},
+    },
+    "hotspot20_anqp_venue_url": {
+        "class": "Hotspot20AnqpVenueUrl",
+        "path": "/wireless-controller.hotspot20/anqp-venue-url",
+        "mkey": "name",
+        "fields": {"name": str, "value-list": list},
+    },
+    "hotspot20_h2qp_advice_of_charge": {
+        "class": "Hotspot20H2qpAdviceOfCharge",
+        "path": "/wireless-controller.hotspot20/h2qp-advice-of-charge",
+        "mkey": "name",
+        "fields": {"name": str, "aoc-list": list},
+    },
+    "hotspot20_h2qp_conn_capability": {
+        "class": "Hotspot20H2qpConnCapability",
+        "path": "/wireless-controller.hotspot20/h2qp-conn-capability",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "icmp-port": str,
+            "ftp-port": str,
+            "ssh-port": str,
+            "http-port": str,
+            "tls-port": str,
+            "pptp-vpn-port": str,
+            "voip-tcp-port": str,
+            "voip-udp-port": str,
+            "ikev2-port": str,
+            "ikev2-xx-port": str,
+            "esp-port": str,
+        },
+    },
+    "hotspot20_h2qp_operator_name": {
+        "class": "Hotspot20H2qpOperatorName",
+        "path": "/wireless-controller.hotspot20/h2qp-operator-name",
+        "mkey": "name",
+        "fields": {"name": str, "value-list": list},
+    },
+    "hotspot20_h2qp_osu_provider": {
+        "class": "Hotspot20H2qpOsuProvider",
+        "path": "/wireless-controller.hotspot20/h2qp-osu-provider",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "friendly-name": list,
+            "server-uri": str,
+            "osu-method": str,
+            "osu-nai": str,
+            "service-description": list,
+            "icon": str,
+        },
+    },
+    "hotspot20_h2qp_osu_provider_nai": {
+        "class": "Hotspot20H2qpOsuProviderNai",
+        "path": "/wireless-controller.hotspot20/h2qp-osu-provider-nai",
+        "mkey": "name",
+        "fields": {"name": str, "nai-list": list},
+    },
+    "hotspot20_h2qp_terms_and_conditions": {
+        "class": "Hotspot20H2qpTermsAndConditions",
+        "path": "/wireless-controller.hotspot20/h2qp-terms-and-conditions",
+        "mkey": "name",
+        "fields": {"name": str, "filename": str, "timestamp": int, "url": str},
+    },
+    "hotspot20_h2qp_wan_metric": {
+        "class": "Hotspot20H2qpWanMetric",
+        "path": "/wireless-controller.hotspot20/h2qp-wan-metric",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "link-status": str,
+            "symmetric-wan-link": str,
+            "link-at-capacity": str,
+            "uplink-speed": int,
+            "downlink-speed": int,
+            "uplink-load": int,
+            "downlink-load": int,
+            "load-measurement-duration": int,
+        },
+    },
+    "hotspot20_hs_profile": {
+        "class": "Hotspot20HsProfile",
+        "path": "/wireless-controller.hotspot20/hs-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "release": int,
+            "access-network-type": str,
+            "access-network-internet": str,
+            "access-network-asra": str,
+            "access-network-esr": str,
+            "access-network-uesa": str,
+            "venue-group": str,
+            "venue-type": str,
+            "hessid": str,
+            "proxy-arp": str,
+            "l2tif": str,
+            "pame-bi": str,
+            "anqp-domain-id": int,
+            "domain-name": str,
+            "osu-ssid": str,
+            "gas-comeback-delay": int,
+            "gas-fragmentation-limit": int,
+            "dgaf": str,
+            "deauth-request-timeout": int,
+            "wnm-sleep-mode": str,
+            "bss-transition": str,
+            "venue-name": str,
+            "venue-url": str,
+            "roaming-consortium": str,
+            "nai-realm": str,
+            "oper-friendly-name": str,
+            "oper-icon": str,
+            "advice-of-charge": str,
+            "osu-provider-nai": str,
+            "terms-and-conditions": str,
+            "osu-provider": list,
+            "wan-metrics": str,
+            "network-auth": str,
+            "3gpp-plmn": str,
+            "conn-cap": str,
+            "qos-map": str,
+            "ip-addr-type": str,
+            "wba-open-roaming": str,
+            "wba-financial-clearing-provider": str,
+            "wba-data-clearing-provider": str,
+            "wba-charging-currency": str,
+            "wba-charging-rate": int,
+        },
+    },
+    "hotspot20_icon": {
+        "class": "Hotspot20Icon",
+        "path": "/wireless-controller.hotspot20/icon",
+        "mkey": "name",
+        "fields": {"name": str, "icon-list": list},
+    },
+    "hotspot20_qos_map": {
+        "class": "Hotspot20QosMap",
+        "path": "/wireless-controller.hotspot20/qos-map",
+        "mkey": "name",
+        "fields": {"name": str, "dscp-except": list, "dscp-range": list},
+    },
+    "inter_controller": {
+        "class": "InterController",
+        "path": "/wireless-controller/inter-controller",
+        "fields": {
+            "inter-controller-mode": str,
+            "l3-roaming": str,
+            "inter-controller-key": str,
+            "inter-controller-pri": str,
+            "fast-failover-max": int,
+            "fast-failover-wait": int,
+            "inter-controller-peer": list,
+        },
+    },
+    "log": {
+        "class": "Log",
+        "path": "/wireless-controller/log",
+        "fields": {
+            "status": str,
+            "addrgrp-log": str,
+            "ble-log": str,
+            "clb-log": str,
+            "dhcp-starv-log": str,
+            "led-sched-log": str,
+            "radio-event-log": str,
+            "rogue-event-log": str,
+            "sta-event-log": str,
+            "sta-locate-log": str,
+            "wids-log": str,
+            "wtp-event-log": str,
+            "wtp-fips-event-log": str,
+        },
+    },
+    "lw_profile": {
+        "class": "LwProfile",
+        "path": "/wireless-controller/lw-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "lw-protocol": str,
+            "cups-server": str,
+            "cups-server-port": int,
+            "cups-api-key": str,
+            "tc-server": str,
+            "tc-server-port": int,
+            "tc-api-key": str,
+        },
+    },
+    "mpsk_profile": {
+        "class": "MpskProfile",
+        "path": "/wireless-controller/mpsk-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "mpsk-concurrent-clients": int,
+            "mpsk-external-server-auth": str,
+            "mpsk-external-server": str,
+            "mpsk-type": str,
+            "mpsk-group": list,
+        },
+    },
+    "nac_profile": {
+        "class": "NacProfile",
+        "path": "/wireless-controller/nac-profile",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "onboarding-vlan": str},
+    },
+    "qos_profile": {
+        "class": "QosProfile",
+        "path": "/wireless-controller/qos-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "uplink": int,
+            "downlink": int,
+            "uplink-sta": int,
+            "downlink-sta": int,
+            "burst": str,
+            "wmm": str,
+            "wmm-uapsd": str,
+            "call-admission-control": str,
+            "call-capacity": int,
+            "bandwidth-admission-control": str,
+            "bandwidth-capacity": int,
+            "dscp-wmm-mapping": str,
+            "dscp-wmm-vo": list,
+            "dscp-wmm-vi": list,
+            "dscp-wmm-be": list,
+            "dscp-wmm-bk": list,
+            "wmm-dscp-marking": str,
+            "wmm-vo-dscp": int,
+            "wmm-vi-dscp": int,
+            "wmm-be-dscp": int,
+            "wmm-bk-dscp": int,
+        },
+    },
+    "region": {
+        "class": "Region",
+        "path": "/wireless-controller/region",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comments": str,
+            "grayscale": str,
+            "opacity": int,
+        },
+    },
+    "setting": {
+        "class": "Setting",
+        "path": "/wireless-controller/setting",
+        "fields": {
+            "account-id": str,
+            "country": str,
+            "duplicate-ssid": str,
+            "fapc-compatibility": str,
+            "wfa-compatibility": str,
+            "phishing-ssid-detect": str,
+            "fake-ssid-action": str,
+            "offending-ssid": list,
+            "device-weight": int,
+            "device-holdoff": int,
+            "device-idle": int,
+            "firmware-provision-on-authorization": str,
+            "rolling-wtp-upgrade": str,
+            "darrp-optimize": int,
+            "darrp-optimize-schedules": list,
+        },
+    },
+    "snmp": {
+        "class": "Snmp",
+        "path": "/wireless-controller/snmp",
+        "fields": {
+            "engine-id": str,
+            "contact-info": str,
+            "trap-high-cpu-threshold": int,
+            "trap-high-mem-threshold": int,
+            "community": list,
+            "user": list,
+        },
+    },
+    "ssid_policy": {
+        "class": "SsidPolicy",
+        "path": "/wireless-controller/ssid-policy",
+        "mkey": "name",
+        "fields": {"name": str, "description": str, "vlan": str},
+    },
+    "syslog_profile": {
+        "class": "SyslogProfile",
+        "path": "/wireless-controller/syslog-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "server-status": str,
+            "server": str,
+            "server-port": int,
+            "server-type": str,
+            "log-level": str,
+        },
+    },
+    "timers": {
+        "class": "Timers",
+        "path": "/wireless-controller/timers",
+        "fields": {
+            "echo-interval": int,
+            "nat-session-keep-alive": int,
+            "discovery-interval": int,
+            "client-idle-timeout": int,
+            "client-idle-rehome-timeout": int,
+            "auth-timeout": int,
+            "rogue-ap-log": int,
+            "fake-ap-log": int,
+            "sta-offline-cleanup": int,
+            "sta-offline-ip2mac-cleanup": int,
+            "sta-cap-cleanup": int,
+            "rogue-ap-cleanup": int,
+            "rogue-sta-cleanup": int,
+            "wids-entry-cleanup": int,
+            "ble-device-cleanup": int,
+            "sta-stats-interval": int,
+            "vap-stats-interval": int,
+            "radio-stats-interval": int,
+            "sta-capability-interval": int,
+            "sta-locate-timer": int,
+            "ipsec-intf-cleanup": int,
+            "ble-scan-report-intv": int,
+            "drma-interval": int,
+            "ap-reboot-wait-interval1": int,
+            "ap-reboot-wait-time": str,
+            "ap-reboot-wait-interval2": int,
+        },
+    },
+    "utm_profile": {
+        "class": "UtmProfile",
+        "path": "/wireless-controller/utm-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "utm-log": str,
+            "ips-sensor": str,
+            "application-list": str,
+            "antivirus-profile": str,
+            "webfilter-profile": str,
+            "scan-botnet-connections": str,
+        },
+    },
+    "vap": {
+        "class": "Vap",
+        "path": "/wireless-controller/vap",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "pre-auth": str,
+            "external-pre-auth": str,
+            "mesh-backhaul": str,
+            "atf-weight": int,
+            "max-clients": int,
+            "max-clients-ap": int,
+            "ssid": str,
+            "broadcast-ssid": str,
+            "security": str,
+            "pmf": str,
+            "pmf-assoc-comeback-timeout": int,
+            "pmf-sa-query-retry-timeout": int,
+            "beacon-protection": str,
+            "okc": str,
+            "mbo": str,
+            "gas-comeback-delay": int,
+            "gas-fragmentation-limit": int,
+            "mbo-cell-data-conn-pref": str,
+            "80211k": str,
+            "80211v": str,
+            "neighbor-report-dual-band": str,
+            "fast-bss-transition": str,
+            "ft-mobility-domain": int,
+            "ft-r0-key-lifetime": int,
+            "ft-over-ds": str,
+            "sae-groups": str,
+            "owe-groups": str,
+            "owe-transition": str,
+            "owe-transition-ssid": str,
+            "additional-akms": str,
+            "eapol-key-retries": str,
+            "tkip-counter-measure": str,
+            "external-web": str,
+            "external-web-format": str,
+            "external-logout": str,
+            "mac-username-delimiter": str,
+            "mac-password-delimiter": str,
+            "mac-calling-station-delimiter": str,
+            "mac-called-station-delimiter": str,
+            "mac-case": str,
+            "called-station-id-type": str,
+            "mac-auth-bypass": str,
+            "radius-mac-auth": str,
+            "radius-mac-auth-server": str,
+            "radius-mac-auth-block-interval": int,
+            "radius-mac-mpsk-auth": str,
+            "radius-mac-mpsk-timeout": int,
+            "radius-mac-auth-usergroups": list,
+            "auth": str,
+            "encrypt": str,
+            "keyindex": int,
+            "passphrase": str,
+            "sae-password": str,
+            "sae-h2e-only": str,
+            "sae-hnp-only": str,
+            "sae-pk": str,
+            "sae-private-key": str,
+            "akm24-only": str,
+            "radius-server": str,
+            "nas-filter-rule": str,
+            "domain-name-stripping": str,
+            "mlo": str,
+            "local-standalone": str,
+            "local-standalone-nat": str,
+            "ip": str,
+            "dhcp-lease-time": int,
+            "local-standalone-dns": str,
+            "local-standalone-dns-ip": str,
+            "local-lan-partition": str,
+            "local-bridging": str,
+            "local-lan": str,
+            "local-authentication": str,
+            "usergroup": list,
+            "captive-portal": str,
+            "captive-network-assistant-bypass": str,
+            "portal-message-override-group": str,
+            "portal-message-overrides": list,
+            "portal-type": str,
+            "selected-usergroups": list,
+            "security-exempt-list": str,
+            "security-redirect-url": str,
+            "auth-cert": str,
+            "auth-portal-addr": str,
+            "intra-vap-privacy": str,
+            "schedule": list,
+            "ldpc": str,
+            "high-efficiency": str,
+            "target-wake-time": str,
+            "port-macauth": str,
+            "port-macauth-timeout": int,
+            "port-macauth-reauth-timeout": int,
+            "bss-color-partial": str,
+            "mpsk-profile": str,
+            "split-tunneling": str,
+            "nac": str,
+            "nac-profile": str,
+            "vlanid": int,
+            "vlan-auto": str,
+            "dynamic-vlan": str,
+            "captive-portal-fw-accounting": str,
+            "captive-portal-ac-name": str,
+            "captive-portal-auth-timeout": int,
+            "multicast-rate": str,
+            "multicast-enhance": str,
+            "igmp-snooping": str,
+            "dhcp-address-enforcement": str,
+            "broadcast-suppression": str,
+            "ipv6-rules": str,
+            "me-disable-thresh": int,
+            "mu-mimo": str,
+            "probe-resp-suppression": str,
+            "probe-resp-threshold": str,
+            "radio-sensitivity": str,
+            "quarantine": str,
+            "radio-5g-threshold": str,
+            "radio-2g-threshold": str,
+            "vlan-name": list,
+            "vlan-pooling": str,
+            "vlan-pool": list,
+            "dhcp-option43-insertion": str,
+            "dhcp-option82-insertion": str,
+            "dhcp-option82-circuit-id-insertion": str,
+            "dhcp-option82-remote-id-insertion": str,
+            "ptk-rekey": str,
+            "ptk-rekey-intv": int,
+            "gtk-rekey": str,
+            "gtk-rekey-intv": int,
+            "eap-reauth": str,
+            "eap-reauth-intv": int,
+            "roaming-acct-interim-update": str,
+            "qos-profile": str,
+            "hotspot20-profile": str,
+            "access-control-list": str,
+            "primary-wag-profile": str,
+            "secondary-wag-profile": str,
+            "tunnel-echo-interval": int,
+            "tunnel-fallback-interval": int,
+            "rates-11a": str,
+            "rates-11bg": str,
+            "rates-11n-ss12": str,
+            "rates-11n-ss34": str,
+            "rates-11ac-mcs-map": str,
+            "rates-11ax-mcs-map": str,
+            "rates-11be-mcs-map": str,
+            "rates-11be-mcs-map-160": str,
+            "rates-11be-mcs-map-320": str,
+            "utm-profile": str,
+            "utm-status": str,
+            "utm-log": str,
+            "ips-sensor": str,
+            "application-list": str,
+            "antivirus-profile": str,
+            "webfilter-profile": str,
+            "scan-botnet-connections": str,
+            "address-group": str,
+            "address-group-policy": str,
+            "sticky-client-remove": str,
+            "sticky-client-threshold-5g": str,
+            "sticky-client-threshold-2g": str,
+            "sticky-client-threshold-6g": str,
+            "bstm-rssi-disassoc-timer": int,
+            "bstm-load-balancing-disassoc-timer": int,
+            "bstm-disassociation-imminent": str,
+            "beacon-advertising": str,
+            "osen": str,
+            "application-detection-engine": str,
+            "application-dscp-marking": str,
+            "application-report-intv": int,
+            "l3-roaming": str,
+            "l3-roaming-mode": str,
+        },
+    },
+    "vap_group": {
+        "class": "VapGroup",
+        "path": "/wireless-controller/vap-group",
+        "mkey": "name",
+        "fields": {"name": str, "comment": str, "vaps": list},
+    },
+    "wag_profile": {
+        "class": "WagProfile",
+        "path": "/wireless-controller/wag-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "tunnel-type": str,
+            "wag-ip": str,
+            "wag-port": int,
+            "ping-interval": int,
+            "ping-number": int,
+            "return-packet-timeout": int,
+            "dhcp-ip-addr": str,
+        },
+    },
+    "wids_profile": {
+        "class": "WidsProfile",
+        "path": "/wireless-controller/wids-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "sensor-mode": str,
+            "ap-scan": str,
+            "ap-scan-channel-list-2G-5G": list,
+            "ap-scan-channel-list-6G": list,
+            "ap-bgscan-period": int,
+            "ap-bgscan-intv": int,
+            "ap-bgscan-duration": int,
+            "ap-bgscan-idle": int,
+            "ap-bgscan-report-intv": int,
+            "ap-bgscan-disable-schedules": list,
+            "ap-fgscan-report-intv": int,
+            "ap-scan-passive": str,
+            "ap-scan-threshold": str,
+            "ap-auto-suppress": str,
+            "wireless-bridge": str,
+            "deauth-broadcast": str,
+            "null-ssid-probe-resp": str,
+            "long-duration-attack": str,
+            "long-duration-thresh": int,
+            "invalid-mac-oui": str,
+            "weak-wep-iv": str,
+            "auth-frame-flood": str,
+            "auth-flood-time": int,
+            "auth-flood-thresh": int,
+            "assoc-frame-flood": str,
+            "assoc-flood-time": int,
+            "assoc-flood-thresh": int,
+            "reassoc-flood": str,
+            "reassoc-flood-time": int,
+            "reassoc-flood-thresh": int,
+            "probe-flood": str,
+            "probe-flood-time": int,
+            "probe-flood-thresh": int,
+            "bcn-flood": str,
+            "bcn-flood-time": int,
+            "bcn-flood-thresh": int,
+            "rts-flood": str,
+            "rts-flood-time": int,
+            "rts-flood-thresh": int,
+            "cts-flood": str,
+            "cts-flood-time": int,
+            "cts-flood-thresh": int,
+            "client-flood": str,
+            "client-flood-time": int,
+            "client-flood-thresh": int,
+            "block_ack-flood": str,
+            "block_ack-flood-time": int,
+            "block_ack-flood-thresh": int,
+            "pspoll-flood": str,
+            "pspoll-flood-time": int,
+            "pspoll-flood-thresh": int,
+            "netstumbler": str,
+            "netstumbler-time": int,
+            "netstumbler-thresh": int,
+            "wellenreiter": str,
+            "wellenreiter-time": int,
+            "wellenreiter-thresh": int,
+            "spoofed-deauth": str,
+            "asleap-attack": str,
+            "eapol-start-flood": str,
+            "eapol-start-thresh": int,
+            "eapol-start-intv": int,
+            "eapol-logoff-flood": str,
+            "eapol-logoff-thresh": int,
+            "eapol-logoff-intv": int,
+            "eapol-succ-flood": str,
+            "eapol-succ-thresh": int,
+            "eapol-succ-intv": int,
+            "eapol-fail-flood": str,
+            "eapol-fail-thresh": int,
+            "eapol-fail-intv": int,
+            "eapol-pre-succ-flood": str,
+            "eapol-pre-succ-thresh": int,
+            "eapol-pre-succ-intv": int,
+            "eapol-pre-fail-flood": str,
+            "eapol-pre-fail-thresh": int,
+            "eapol-pre-fail-intv": int,
+            "deauth-unknown-src-thresh": int,
+            "windows-bridge": str,
+            "disassoc-broadcast": str,
+            "ap-spoofing": str,
+            "chan-based-mitm": str,
+            "adhoc-valid-ssid": str,
+            "adhoc-network": str,
+            "eapol-key-overflow": str,
+            "ap-impersonation": str,
+            "invalid-addr-combination": str,
+            "beacon-wrong-channel": str,
+            "ht-greenfield": str,
+            "overflow-ie": str,
+            "malformed-ht-ie": str,
+            "malformed-auth": str,
+            "malformed-association": str,
+            "ht-40mhz-intolerance": str,
+            "valid-ssid-misuse": str,
+            "valid-client-misassociation": str,
+            "hotspotter-attack": str,
+            "pwsave-dos-attack": str,
+            "omerta-attack": str,
+            "disconnect-station": str,
+            "unencrypted-valid": str,
+            "fata-jack": str,
+            "risky-encryption": str,
+            "fuzzed-beacon": str,
+            "fuzzed-probe-request": str,
+            "fuzzed-probe-response": str,
+            "air-jack": str,
+            "wpa-ft-attack": str,
+        },
+    },
+    "wtp": {
+        "class": "Wtp",
+        "path": "/wireless-controller/wtp",
+        "mkey": "wtp-id",
+        "fields": {
+            "wtp-id": str,
+            "index": int,
+            "uuid": str,
+            "admin": str,
+            "name": str,
+            "location": str,
+            "comment": str,
+            "region": str,
+            "region-x": str,
+            "region-y": str,
+            "firmware-provision": str,
+            "firmware-provision-latest": str,
+            "wtp-profile": str,
+            "apcfg-profile": str,
+            "bonjour-profile": str,
+            "ble-major-id": int,
+            "ble-minor-id": int,
+            "override-led-state": str,
+            "led-state": str,
+            "override-wan-port-mode": str,
+            "wan-port-mode": str,
+            "override-ip-fragment": str,
+            "ip-fragment-preventing": str,
+            "tun-mtu-uplink": int,
+            "tun-mtu-downlink": int,
+            "override-split-tunnel": str,
+            "split-tunneling-acl-path": str,
+            "split-tunneling-acl-local-ap-subnet": str,
+            "split-tunneling-acl": list,
+            "override-lan": str,
+            "lan": list,
+            "override-allowaccess": str,
+            "allowaccess": str,
+            "override-login-passwd-change": str,
+            "login-passwd-change": str,
+            "login-passwd": str,
+            "override-default-mesh-root": str,
+            "default-mesh-root": str,
+            "radio-1": list,
+            "radio-2": list,
+            "radio-3": list,
+            "radio-4": list,
+            "image-download": str,
+            "mesh-bridge-enable": str,
+            "purdue-level": str,
+            "coordinate-latitude": str,
+            "coordinate-longitude": str,
+        },
+    },
+    "wtp_group": {
+        "class": "WtpGroup",
+        "path": "/wireless-controller/wtp-group",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "platform-type": str,
+            "ble-major-id": int,
+            "wtps": list,
+        },
+    },
+    "wtp_profile": {
+        "class": "WtpProfile",
+        "path": "/wireless-controller/wtp-profile",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "comment": str,
+            "platform": list,
+            "control-message-offload": str,
+            "bonjour-profile": str,
+            "apcfg-profile": str,
+            "apcfg-mesh": str,
+            "apcfg-mesh-ap-type": str,
+            "apcfg-mesh-ssid": str,
+            "apcfg-mesh-eth-bridge": str,
+            "ble-profile": str,
+            "lw-profile": str,
+            "syslog-profile": str,
+            "wan-port-mode": str,
+            "lan": list,
+            "energy-efficient-ethernet": str,
+            "led-state": str,
+            "led-schedules": list,
+            "dtls-policy": str,
+            "dtls-in-kernel": str,
+            "max-clients": int,
+            "handoff-rssi": int,
+            "handoff-sta-thresh": int,
+            "handoff-roaming": str,
+            "deny-mac-list": list,
+            "ap-country": str,
+            "ip-fragment-preventing": str,
+            "tun-mtu-uplink": int,
+            "tun-mtu-downlink": int,
+            "split-tunneling-acl-path": str,
+            "split-tunneling-acl-local-ap-subnet": str,
+            "split-tunneling-acl": list,
+            "allowaccess": str,
+            "login-passwd-change": str,
+            "login-passwd": str,
+            "lldp": str,
+            "poe-mode": str,
+            "usb-port": str,
+            "frequency-handoff": str,
+            "ap-handoff": str,
+            "default-mesh-root": str,
+            "radio-1": list,
+            "radio-2": list,
+            "radio-3": list,
+            "radio-4": list,
+            "lbs": list,
+            "ext-info-enable": str,
+            "indoor-outdoor-deployment": str,
+            "esl-ses-dongle": list,
+            "console-login": str,
+            "wan-port-auth": str,
+            "wan-port-auth-usrname": str,
+            "wan-port-auth-password": str,
+            "wan-port-auth-methods": str,
+            "wan-port-auth-macsec": str,
+            "apcfg-auto-cert": str,
+            "apcfg-auto-cert-enroll-protocol": str,
+            "apcfg-auto-cert-crypto-algo": str,
+            "apcfg-auto-cert-est-server": str,
+            "apcfg-auto-cert-est-ca-id": str,
+            "apcfg-auto-cert-est-http-username": str,
+            "apcfg-auto-cert-est-http-password": str,
+            "apcfg-auto-cert-est-subject": str,
+            "apcfg-auto-cert-est-subject-alt-name": str,
+            "apcfg-auto-cert-auto-regen-days": int,
+            "apcfg-auto-cert-est-https-ca": str,
+            "apcfg-auto-cert-scep-keytype": str,
+            "apcfg-auto-cert-scep-keysize": str,
+            "apcfg-auto-cert-scep-ec-name": str,
+            "apcfg-auto-cert-scep-sub-fully-dn": str,
+            "apcfg-auto-cert-scep-url": str,
+            "apcfg-auto-cert-scep-password": str,
+            "apcfg-auto-cert-scep-ca-id": str,
+            "apcfg-auto-cert-scep-subject-alt-name": str,
+            "apcfg-auto-cert-scep-https-ca": str,
+            "unii-4-5ghz-band": str,
+            "admin-auth-tacacs+": str,
+            "admin-restrict-local": str,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -1,10 +1,14 @@
 """FortiOS CMDB - Ztna category"""
 
-from .reverse_connector import ReverseConnector
-from .traffic_forward_proxy import TrafficForwardProxy
-from .web_portal import WebPortal
-from .web_portal_bookmark import WebPortalBookmark
-from .web_proxy import WebProxy
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
+if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import CmdbEndpoint
+
 
 __all__ = [
     "ReverseConnector",
@@ -14,6 +18,17 @@ __all__ = [
     "WebProxy",
 ]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "ReverseConnector": "._registry",
+        "TrafficForwardProxy": "._registry",
+        "WebPortal": "._registry",
+        "WebPortalBookmark": "._registry",
+        "WebProxy": "._registry",
+    },
+)
+
 
 class Ztna:
     """
@@ -22,6 +37,18 @@ class Ztna:
     This class provides access to all ztna CMDB endpoints.
     """
 
+    reverse_connector: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "ReverseConnector"
+    )
+    traffic_forward_proxy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "TrafficForwardProxy"
+    )
+    web_portal: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WebPortal")
+    web_portal_bookmark: LazyEndpoint[CmdbEndpoint] = LazyEndpoint(
+        "WebPortalBookmark"
+    )
+    web_proxy: LazyEndpoint[CmdbEndpoint] = LazyEndpoint("WebProxy")
+
     def __init__(self, client):
         """
         Initialize Ztna with all endpoint classes.
@@ -29,8 +56,4 @@ class Ztna:
         Args:
             client: HTTPClient instance
         """
-        self.reverse_connector = ReverseConnector(client)
-        self.traffic_forward_proxy = TrafficForwardProxy(client)
-        self.web_portal = WebPortal(client)
-        self.web_portal_bookmark = WebPortalBookmark(client)
-        self.web_proxy = WebProxy(client)
+        self._client = client
@@ -0,0 +1,101 @@
+"""FortiOS CMDB - Ztna endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "reverse_connector": {
+        "class": "ReverseConnector",
+        "path": "/ztna/reverse-connector",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "status": str,
+            "address": str,
+            "port": int,
+            "health-check-interval": int,
+            "ssl-max-version": str,
+            "certificate": str,
+            "trusted-server-ca": str,
+        },
+    },
+    "traffic_forward_proxy": {
+        "class": "TrafficForwardProxy",
+        "path": "/ztna/traffic-forward-proxy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vip": str,
+            "host": str,
+            "decrypted-traffic-mirror": str,
+            "log-blocked-traffic": str,
+            "auth-portal": str,
+            "auth-virtual-host": str,
+            "vip6": str,
+        },
+    },
+    "web_portal": {
+        "class": "WebPortal",
+        "path": "/ztna/web-portal",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vip": str,
+            "host": str,
+            "decrypted-traffic-mirror": str,
+            "log-blocked-traffic": str,
+            "auth-portal": str,
+            "auth-virtual-host": str,
+            "vip6": str,
+            "auth-rule": str,
+            "display-bookmark": str,
+            "focus-bookmark": str,
+            "display-status": str,
+            "display-history": str,
+            "policy-auth-sso": str,
+            "heading": str,
+            "theme": str,
+            "clipboard": str,
+            "default-window-width": int,
+            "default-window-height": int,
+            "cookie-age": int,
+            "forticlient-download": str,
+            "customize-forticlient-download-url": str,
+            "windows-forticlient-download-url": str,
+            "macos-forticlient-download-url": str,
+        },
+    },
+    "web_portal_bookmark": {
+        "class": "WebPortalBookmark",
+        "path": "/ztna/web-portal-bookmark",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "users": list,
+            "groups": list,
+            "bookmarks": list,
+        },
+    },
+    "web_proxy": {
+        "class": "WebProxy",
+        "path": "/ztna/web-proxy",
+        "mkey": "name",
+        "fields": {
+            "name": str,
+            "vip": str,
+            "host": str,
+            "decrypted-traffic-mirror": str,
+            "log-blocked-traffic": str,
+            "auth-portal": str,
+            "auth-virtual-host": str,
+            "vip6": str,
+            "svr-pool-multiplex": str,
+            "svr-pool-ttl": int,
+            "svr-pool-server-max-request": int,
+            "svr-pool-server-max-concurrent-request": int,
+            "api-gateway": list,
+            "api-gateway6": list,
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "cmdb", ENDPOINTS)
@@ -7,11 +7,30 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .disk.disk import Disk
+    from .fortianalyzer.fortianalyzer import FortiAnalyzer
+    from .forticloud.forticloud import FortiCloud
+    from .memory.memory import Memory
+    from .search.search import Search
+
 __all__ = ["Log"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Disk": ".disk.disk",
+        "FortiAnalyzer": ".fortianalyzer.fortianalyzer",
+        "Memory": ".memory.memory",
+        "FortiCloud": ".forticloud.forticloud",
+        "Search": ".search.search",
+    },
+)
+
 
 class Log:
     """
@@ -19,6 +38,12 @@ class Log:
     Provides access to log endpoints
     """
 
+    disk: LazyEndpoint[Disk] = LazyEndpoint("Disk")
+    fortianalyzer: LazyEndpoint[FortiAnalyzer] = LazyEndpoint("FortiAnalyzer")
+    memory: LazyEndpoint[Memory] = LazyEndpoint("Memory")
+    forticloud: LazyEndpoint[FortiCloud] = LazyEndpoint("FortiCloud")
+    search: LazyEndpoint[Search] = LazyEndpoint("Search")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Log helper
@@ -28,19 +53,6 @@ class Log:
         """
         self._client = client
 
-        # Initialize endpoint classes
-        from .disk.disk import Disk
-        from .fortianalyzer.fortianalyzer import FortiAnalyzer
-        from .forticloud.forticloud import FortiCloud
-        from .memory.memory import Memory
-        from .search.search import Search
-
-        self.disk = Disk(client)
-        self.fortianalyzer = FortiAnalyzer(client)
-        self.memory = Memory(client)
-        self.forticloud = FortiCloud(client)
-        self.search = Search(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["disk", "fortianalyzer", "memory", "forticloud", "search"]
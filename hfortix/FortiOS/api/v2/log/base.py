@@ -25,14 +25,51 @@ Note:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Union
+import inspect
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Union
+
+from .parser import LogBatch, aiter_batches, iter_batches
+from .session import (
+    DEFAULT_ROWS,
+    afollow_raw,
+    afollow_session,
+    follow_raw,
+    follow_session,
+)
+from .windows import (
+    DEFAULT_WINDOW,
+    afetch_windows,
+    combine_filters,
+    fetch_windows,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
 
+    from hfortix.FortiOS.download import DownloadTarget
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 
+def _query_params(
+    payload_dict: Optional[dict[str, Any]],
+    kwargs: dict[str, Any],
+    **named: Any,
+) -> dict[str, Any]:
+    """Build log query parameters from payload_dict or named arguments"""
+    if payload_dict:
+        params = payload_dict.copy()
+    else:
+        params = {k: v for k, v in named.items() if v is not None}
+    params.update(kwargs)
+    return params
+
+
+def _abort_session(client: "IHTTPClient", session_id: Any) -> Any:
+    """Release a log search session (log/search/abort/<session_id>)"""
+    return client.post("log", f"search/abort/{session_id}", data={})
+
+
 class ArchiveResource:
     """
     Archiveresource Operations.
@@ -143,6 +180,54 @@ class ArchiveDownloadResource:
             "log", endpoint, params=params if params else None
         )
 
+    def download(
+        self,
+        dest: "DownloadTarget",
+        mkey: Optional[int] = None,
+        checksum: Optional[str] = None,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Stream an archived packet capture file to disk.
+
+        Unlike get(), the capture is written in chunks as it downloads and
+        never held in memory as a whole.
+
+        Args:
+            dest: File path or binary file object opened for writing
+            mkey: Archive identifier
+            checksum: hashlib algorithm computed while writing (e.g.
+            "sha256")
+            payload_dict: Dictionary containing all parameters
+            **kwargs: Additional parameters
+
+        Returns:
+            Dictionary with path, bytes and (if requested) checksum
+
+        Example:
+            result = fgt.api.log.disk.ips.archive_download.download(
+                "capture.pcap", mkey=123, checksum="sha256"
+            )
+        """
+        endpoint = f"{self._storage}/{self._log_type}/archive-download"
+
+        if payload_dict:
+            params = payload_dict.copy()
+        else:
+            params = {}
+            if mkey is not None:
+                params["mkey"] = mkey
+
+        params.update(kwargs)
+        return self._client.download(
+            "log",
+            endpoint,
+            dest,
+            params=params if params else None,
+            checksum=checksum,
+        )
+
 
 class RawResource:
     """Raw log resource - supports all log types"""
@@ -264,6 +349,186 @@ class RawResource:
             data = cast(bytes, binary_data)
             return data.decode("utf-8")
 
+    def iter_lines(
+        self,
+        rows: int = DEFAULT_ROWS,
+        start: int = 0,
+        max_rows: Optional[int] = None,
+        session_id: Optional[int] = None,
+        serial_no: Optional[str] = None,
+        is_ha_member: Optional[Union[str, bool]] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "Iterator[str]":
+        """
+        Iterate over raw log lines page by page (sync mode).
+
+        Each page is streamed from the socket and split into lines as it
+        arrives, so neither a page nor the whole result is ever held in
+        memory as one string. Paging stops at the first short page.
+
+        Args:
+            rows: Lines requested per page (default: 1000)
+            start: Index of the first line (default: 0)
+            max_rows: Stop after this many lines (default: None = all)
+            session_id: Log session to read from. It is kept alive between
+            pages and aborted when iteration ends (raw responses don't
+            report a session of their own)
+            serial_no: Retrieve log from the specified device
+            is_ha_member: Is the specified device an HA member
+            filter: Filtering key/value pairs (supports operators: ==, !=,
+            =@, !@, <=, <, >=, >)
+            payload_dict: Dictionary containing all parameters (alternative
+            to individual params)
+            **kwargs: Additional parameters
+
+        Yields:
+            Raw log lines (FortiOS key=value format)
+
+        Raises:
+            TypeError: If the client is async (use aiter_lines())
+
+        Example:
+            for line in fgt.api.log.disk.traffic.forward.raw.iter_lines(
+                filter="dstport==443", max_rows=50000
+            ):
+                print(line)
+        """
+        endpoint = f"{self._storage}/{self._log_type}/raw"
+        params = _query_params(
+            payload_dict,
+            kwargs,
+            serial_no=serial_no,
+            is_ha_member=is_ha_member,
+            filter=filter,
+        )
+
+        def fetch(page: dict[str, Any]) -> Any:
+            body = self._client.iter_binary(
+                "log", endpoint, params={**params, **page}
+            )
+            if inspect.isasyncgen(body):
+                raise TypeError(
+                    "iter_lines() is not available in async mode, use "
+                    "aiter_lines() instead"
+                )
+            return body
+
+        return follow_raw(
+            fetch,
+            lambda sid: _abort_session(self._client, sid),
+            rows=rows,
+            start=start,
+            max_rows=max_rows,
+            session_id=session_id,
+        )
+
+    def aiter_lines(
+        self,
+        rows: int = DEFAULT_ROWS,
+        start: int = 0,
+        max_rows: Optional[int] = None,
+        session_id: Optional[int] = None,
+        serial_no: Optional[str] = None,
+        is_ha_member: Optional[Union[str, bool]] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "AsyncIterator[str]":
+        """
+        Iterate over raw log lines page by page (async mode).
+
+        Same arguments as iter_lines().
+
+        Example:
+            async for line in fgt.api.log.disk.virus.raw.aiter_lines():
+                print(line)
+        """
+        endpoint = f"{self._storage}/{self._log_type}/raw"
+        params = _query_params(
+            payload_dict,
+            kwargs,
+            serial_no=serial_no,
+            is_ha_member=is_ha_member,
+            filter=filter,
+        )
+
+        def fetch(page: dict[str, Any]) -> Any:
+            body = self._client.iter_binary(
+                "log", endpoint, params={**params, **page}
+            )
+            if not inspect.isasyncgen(body):
+                raise TypeError(
+                    "aiter_lines() is only available in async mode, use "
+                    "iter_lines() instead"
+                )
+            return body
+
+        return afollow_raw(
+            fetch,
+            lambda sid: _abort_session(self._client, sid),
+            rows=rows,
+            start=start,
+            max_rows=max_rows,
+            session_id=session_id,
+        )
+
+    def iter_batches(
+        self,
+        batch_size: int = 10000,
+        types: Optional[dict[str, Any]] = None,
+        use_numpy: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "Iterator[LogBatch]":
+        """
+        Iterate over raw logs parsed into columnar batches (sync mode).
+
+        Lines are read with iter_lines() and parsed batch by batch, so
+        memory is bounded by ``batch_size``.
+
+        Args:
+            batch_size: Log lines per batch (default: 10000)
+            types: Field name -> int, float or str to skip type inference
+            use_numpy: True for NumPy columns, False for lists, None to use
+            NumPy if installed (default)
+            **kwargs: Arguments of iter_lines() (rows, max_rows, filter, ...)
+
+        Yields:
+            LogBatch objects (one column per log field)
+
+        Example:
+            for batch in fgt.api.log.disk.traffic.forward.raw.iter_batches(
+                filter="dstport==443"
+            ):
+                total += batch["sentbyte"].sum()
+        """
+        return iter_batches(
+            self.iter_lines(**kwargs),
+            batch_size=batch_size,
+            types=types,
+            use_numpy=use_numpy,
+        )
+
+    def aiter_batches(
+        self,
+        batch_size: int = 10000,
+        types: Optional[dict[str, Any]] = None,
+        use_numpy: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "AsyncIterator[LogBatch]":
+        """
+        Iterate over raw logs parsed into columnar batches (async mode).
+
+        Same arguments as iter_batches().
+        """
+        return aiter_batches(
+            self.aiter_lines(**kwargs),
+            batch_size=batch_size,
+            types=types,
+            use_numpy=use_numpy,
+        )
+
 
 class LogResource:
     """Formatted log resource"""
@@ -341,10 +606,296 @@ class LogResource:
             raw_json=raw_json,
         )
 
+    def iter(
+        self,
+        rows: int = DEFAULT_ROWS,
+        start: int = 0,
+        max_rows: Optional[int] = None,
+        serial_no: Optional[str] = None,
+        is_ha_member: Optional[Union[str, bool]] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        extra: Optional[str] = None,
+        poll_interval: float = 1.0,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "Iterator[dict[str, Any]]":
+        """
+        Iterate over log entries, following the log session (sync mode).
+
+        Starts a search, keeps its session alive between pages and polls
+        until the search is complete, yielding entries as pages arrive.
+        The session is aborted through log/search/abort when iteration
+        ends, including when the caller stops early.
+
+        Args:
+            rows: Entries requested per page (default: 1000)
+            start: Index of the first entry (default: 0)
+            max_rows: Stop after this many entries (default: None = all)
+            serial_no: Retrieve log from the specified device
+            is_ha_member: Is the specified device an HA member
+            filter: Filtering key/value pairs (supports operators: ==, !=,
+            =@, !@, <=, <, >=, >)
+            extra: Extra data flags (e.g., 'reverse_lookup', 'country_id')
+            poll_interval: Seconds between polls while a disk search is
+            still running and has no new entries (default: 1.0)
+            payload_dict: Dictionary containing all parameters (alternative
+            to individual params)
+            **kwargs: Additional parameters
+
+        Yields:
+            Log entries one at a time
+
+        Raises:
+            TypeError: If the client is async (use aiter())
+
+        Example:
+            for entry in fgt.api.log.disk.traffic.forward.iter(
+                filter="srcip==192.168.1.10"
+            ):
+                print(entry["date"], entry["time"], entry["dstip"])
+        """
+        endpoint = f"{self._storage}/{self._log_type}"
+        params = _query_params(
+            payload_dict,
+            kwargs,
+            serial_no=serial_no,
+            is_ha_member=is_ha_member,
+            filter=filter,
+            extra=extra,
+        )
+
+        def fetch(page: dict[str, Any]) -> Any:
+            # Every follower needs a session of its own
+            result = self._client.get(
+                "log",
+                endpoint,
+                params={**params, **page},
+                raw_json=True,
+                coalesce=False,
+            )
+            if inspect.iscoroutine(result):
+                result.close()
+                raise TypeError(
+                    "iter() is not available in async mode, use aiter() "
+                    "instead"
+                )
+            return result
+
+        return follow_session(
+            fetch,
+            lambda sid: _abort_session(self._client, sid),
+            rows=rows,
+            start=start,
+            max_rows=max_rows,
+            poll_interval=poll_interval,
+        )
+
+    def aiter(
+        self,
+        rows: int = DEFAULT_ROWS,
+        start: int = 0,
+        max_rows: Optional[int] = None,
+        serial_no: Optional[str] = None,
+        is_ha_member: Optional[Union[str, bool]] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        extra: Optional[str] = None,
+        poll_interval: float = 1.0,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "AsyncIterator[dict[str, Any]]":
+        """
+        Iterate over log entries, following the log session (async mode).
+
+        Same arguments as iter().
+
+        Example:
+            async for entry in fgt.api.log.memory.event.system.aiter(
+                max_rows=500
+            ):
+                print(entry["msg"])
+        """
+        endpoint = f"{self._storage}/{self._log_type}"
+        params = _query_params(
+            payload_dict,
+            kwargs,
+            serial_no=serial_no,
+            is_ha_member=is_ha_member,
+            filter=filter,
+            extra=extra,
+        )
+
+        async def fetch(page: dict[str, Any]) -> Any:
+            # Every follower needs a session of its own
+            result = self._client.get(
+                "log",
+                endpoint,
+                params={**params, **page},
+                raw_json=True,
+                coalesce=False,
+            )
+            if not inspect.isawaitable(result):
+                raise TypeError(
+                    "aiter() is only available in async mode, use iter() "
+                    "instead"
+                )
+            return await result
+
+        return afollow_session(
+            fetch,
+            lambda sid: _abort_session(self._client, sid),
+            rows=rows,
+            start=start,
+            max_rows=max_rows,
+            poll_interval=poll_interval,
+        )
+
+    def iter_time_range(
+        self,
+        start: datetime,
+        end: datetime,
+        window: timedelta = DEFAULT_WINDOW,
+        concurrency: int = 4,
+        newest_first: bool = False,
+        dedupe: bool = True,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        max_rows: Optional[int] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> "Iterator[dict[str, Any]]":
+        """
+        Iterate over a time range, fetching windows in parallel (sync mode).
+
+        Splits ``[start, end)`` into windows (never spanning midnight) and
+        runs one iter() search per window, restricted with date/time
+        filters, ``concurrency`` windows at a time on background threads.
+        Entries are yielded window by window in time order; entries
+        returned by both searches at a window boundary are yielded once.
+
+        Args:
+            start: Start of the range (inclusive, device local time)
+            end: End of the range (exclusive, device local time)
+            window: Maximum window length (default: 1 hour)
+            concurrency: Windows fetched at the same time (default: 4).
+            Each holds a log search session on the device
+            newest_first: Yield the newest window first (default: False)
+            dedupe: Drop duplicate entries at window boundaries (default:
+            True)
+            key: Dedupe key of an entry (default: the whole entry)
+            max_rows: Stop after this many entries (default: None = all)
+            filter: Additional filter(s), combined with the window filters
+            **kwargs: Arguments of iter() for every window (rows, extra,
+            serial_no, poll_interval, ...)
+
+        Yields:
+            Log entries one at a time
+
+        Raises:
+            TypeError: If the client is async (use aiter_time_range())
+
+        Example:
+            from datetime import datetime, timedelta
+
+            week = fgt.api.log.disk.traffic.forward.iter_time_range(
+                datetime(2026, 1, 12),
+                datetime(2026, 1, 19),
+                window=timedelta(hours=6),
+                filter="dstport==443",
+            )
+            for entry in week:
+                print(entry["date"], entry["time"], entry["srcip"])
+        """
+        return fetch_windows(
+            lambda window_filter: self.iter(
+                filter=combine_filters(filter, window_filter), **kwargs
+            ),
+            start,
+            end,
+            window=window,
+            concurrency=concurrency,
+            newest_first=newest_first,
+            dedupe=dedupe,
+            key=key,
+            max_rows=max_rows,
+        )
+
+    def aiter_time_range(
+        self,
+        start: datetime,
+        end: datetime,
+        window: timedelta = DEFAULT_WINDOW,
+        concurrency: int = 4,
+        newest_first: bool = False,
+        dedupe: bool = True,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        max_rows: Optional[int] = None,
+        filter: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> "AsyncIterator[dict[str, Any]]":
+        """
+        Iterate over a time range, fetching windows in parallel (async mode).
+
+        Same arguments as iter_time_range(); windows run as tasks.
+
+        Example:
+            system = fgt.api.log.memory.event.system
+            async for entry in system.aiter_time_range(
+                datetime(2026, 1, 15), datetime(2026, 1, 16)
+            ):
+                print(entry["msg"])
+        """
+        return afetch_windows(
+            lambda window_filter: self.aiter(
+                filter=combine_filters(filter, window_filter), **kwargs
+            ),
+            start,
+            end,
+            window=window,
+            concurrency=concurrency,
+            newest_first=newest_first,
+            dedupe=dedupe,
+            key=key,
+            max_rows=max_rows,
+        )
+
+
+class LogIterMixin:
+    """
+    Session-following iteration for log type classes.
+
+    Log type classes (Virus, TrafficForward, ...) keep their formatted
+    LogResource in ``_resource``; this adds its iter()/aiter() and
+    iter_time_range()/aiter_time_range() to them.
+    """
+
+    _resource: LogResource
+
+    def iter(self, *args: Any, **kwargs: Any) -> "Iterator[dict[str, Any]]":
+        """Iterate over log entries (see LogResource.iter())"""
+        return self._resource.iter(*args, **kwargs)
+
+    def aiter(
+        self, *args: Any, **kwargs: Any
+    ) -> "AsyncIterator[dict[str, Any]]":
+        """Iterate over log entries in async mode (see LogResource.aiter())"""
+        return self._resource.aiter(*args, **kwargs)
+
+    def iter_time_range(
+        self, *args: Any, **kwargs: Any
+    ) -> "Iterator[dict[str, Any]]":
+        """Fetch a time range in parallel windows (see LogResource)"""
+        return self._resource.iter_time_range(*args, **kwargs)
+
+    def aiter_time_range(
+        self, *args: Any, **kwargs: Any
+    ) -> "AsyncIterator[dict[str, Any]]":
+        """Fetch a time range in parallel windows in async mode"""
+        return self._resource.aiter_time_range(*args, **kwargs)
+
 
 __all__ = [
     "ArchiveResource",
     "ArchiveDownloadResource",
     "RawResource",
     "LogResource",
+    "LogIterMixin",
 ]
@@ -27,7 +27,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from .base import LogResource, RawResource
+from .base import LogIterMixin, LogResource, RawResource
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -35,7 +35,7 @@ if TYPE_CHECKING:
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 
-class CIFS:
+class CIFS(LogIterMixin):
     """
     Cifs Operations.
 
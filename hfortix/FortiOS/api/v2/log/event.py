@@ -27,7 +27,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from .base import LogResource, RawResource
+from .base import LogIterMixin, LogResource, RawResource
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -36,7 +36,7 @@ if TYPE_CHECKING:
 
 
 # Event subtypes
-class EventVPN:
+class EventVPN(LogIterMixin):
     """
     Eventvpn Operations.
 
@@ -131,7 +131,7 @@ class EventVPN:
         )
 
 
-class EventUser:
+class EventUser(LogIterMixin):
     """User events - /disk/event/user"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -216,7 +216,7 @@ class EventUser:
         )
 
 
-class EventRouter:
+class EventRouter(LogIterMixin):
     """Router events - /disk/event/router"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -301,7 +301,7 @@ class EventRouter:
         )
 
 
-class EventWireless:
+class EventWireless(LogIterMixin):
     """Wireless events - /disk/event/wireless"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -386,7 +386,7 @@ class EventWireless:
         )
 
 
-class EventWAD:
+class EventWAD(LogIterMixin):
     """WAD events - /disk/event/wad"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -471,7 +471,7 @@ class EventWAD:
         )
 
 
-class EventEndpoint:
+class EventEndpoint(LogIterMixin):
     """Endpoint events - /disk/event/endpoint"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -556,7 +556,7 @@ class EventEndpoint:
         )
 
 
-class EventHA:
+class EventHA(LogIterMixin):
     """HA events - /disk/event/ha"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -642,7 +642,7 @@ class EventHA:
         )
 
 
-class EventComplianceCheck:
+class EventComplianceCheck(LogIterMixin):
     """Compliance check events - /disk/event/compliance-check"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -727,7 +727,7 @@ class EventComplianceCheck:
         )
 
 
-class EventSecurityRating:
+class EventSecurityRating(LogIterMixin):
     """Security rating events - /disk/event/security-rating"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -811,7 +811,7 @@ class EventSecurityRating:
         )
 
 
-class EventFortiextender:
+class EventFortiextender(LogIterMixin):
     """Fortiextender events - /disk/event/fortiextender"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -896,7 +896,7 @@ class EventFortiextender:
         )
 
 
-class EventConnector:
+class EventConnector(LogIterMixin):
     """Connector events - /disk/event/connector"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -981,7 +981,7 @@ class EventConnector:
         )
 
 
-class EventSystem:
+class EventSystem(LogIterMixin):
     """System events - /disk/event/system"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
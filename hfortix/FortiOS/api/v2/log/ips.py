@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 from .base import (
     ArchiveDownloadResource,
     ArchiveResource,
+    LogIterMixin,
     LogResource,
     RawResource,
 )
@@ -40,7 +41,7 @@ if TYPE_CHECKING:
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 
-class IPS:
+class IPS(LogIterMixin):
     """
     Ips Operations.
 
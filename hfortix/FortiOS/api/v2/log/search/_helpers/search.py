@@ -8,62 +8,10 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
-from ...._helpers import validate_required_fields
+# session_id: Provide the session ID for the request
+SCHEMA = EndpointSchema(required=["session_id"])
 
-# Valid enum values from API documentation
-# ============================================================================
-# GET Validation
-# ============================================================================
-
-
-def validate_search_get(
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-    """
-    return (True, None)
-
-
-# ============================================================================
-# POST Validation
-# ============================================================================
-
-
-def validate_search_post(payload: dict[str, Any]) -> tuple[bool, str | None]:
-    """
-    Validate POST request payload for creating search.
-
-    Required fields (API documentation):
-    - session_id: Provide the session ID for the request
-
-    Args:
-        payload: The payload to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-    """
-    # Required fields
-    required_fields = ["session_id"]
-
-    is_valid, missing = validate_required_fields(payload, required_fields)
-    if not is_valid:
-        return (False, f"Missing required fields: {', '.join(missing)}")
-
-    return (True, None)
+validate_search_get = SCHEMA.get_validator()
+validate_search_post = SCHEMA.post_validator()
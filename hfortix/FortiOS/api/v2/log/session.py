@@ -0,0 +1,334 @@
+"""
+Following FortiOS log search sessions.
+
+A log query (``log/<storage>/<type>``) is served from a search session on
+the FortiGate. The first request starts the search and returns a
+``session_id``; later requests pass it back, together with ``start``, to
+read the next rows. Disk searches run in the background, so a page can
+come back short or empty while ``completed`` (percent) is still below
+100. With ``keep_session_alive`` the session survives between requests
+and has to be released with ``log/search/abort/<session_id>``.
+
+follow_session() (sync) and afollow_session() (async) drive that loop for
+``LogResource.iter()`` / ``aiter()`` and yield records one at a time. The
+session is always aborted when iteration ends - including when the caller
+stops early or an error is raised - so no search is left running on the
+device.
+
+Raw log endpoints return plain text without session metadata.
+follow_raw() / afollow_raw() page through them with ``start``/``rows``,
+stream each page and yield one log line at a time; a session is only
+kept alive (and aborted) when the caller passes its ``session_id``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+logger = logging.getLogger("hfortix.log.session")
+
+__all__ = [
+    "DEFAULT_ROWS",
+    "afollow_raw",
+    "afollow_session",
+    "follow_raw",
+    "follow_session",
+]
+
+DEFAULT_ROWS = 1000
+
+
+class _SessionCursor:
+    """
+    Paging position, session state and stop condition of a log query
+
+    Args:
+        rows: Rows requested per page
+        start: Index of the first row to return
+        max_rows: Stop after this many rows (None = all)
+        poll_interval: Seconds to wait before polling a search that is
+            still running and returned no rows
+        session_id: Existing session to continue (None = start a new one)
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        start: int,
+        max_rows: Optional[int],
+        poll_interval: float,
+        session_id: Optional[int] = None,
+    ) -> None:
+        if rows <= 0:
+            raise ValueError("rows must be > 0")
+        if start < 0:
+            raise ValueError("start must be >= 0")
+        if max_rows is not None and max_rows < 0:
+            raise ValueError("max_rows must be >= 0")
+        self.rows = rows
+        self.offset = start
+        self.remaining = max_rows
+        self.poll_interval = poll_interval
+        self.session_id = session_id
+        self.done = max_rows == 0
+        # Seconds to wait before the next request (search still running)
+        self.wait = 0.0
+
+    def params(self, keep_alive: bool = True) -> dict[str, Any]:
+        """Query parameters of the next page request"""
+        rows = self.rows
+        if self.remaining is not None:
+            rows = min(rows, self.remaining)
+        params: dict[str, Any] = {"rows": rows, "start": self.offset}
+        if self.session_id is not None:
+            params["session_id"] = self.session_id
+        if keep_alive:
+            params["keep_session_alive"] = True
+        return params
+
+    def advance(self, count: int, requested: int, completed: Any) -> None:
+        """Record a page of ``count`` rows and decide whether to stop"""
+        self.offset += count
+        if self.remaining is not None:
+            self.remaining -= count
+            if self.remaining <= 0:
+                self.done = True
+                return
+        try:
+            finished = completed is None or float(completed) >= 100
+        except (TypeError, ValueError):
+            finished = True
+        self.wait = 0.0
+        if count > requested:
+            # The endpoint ignored rows/start; it returned everything at once
+            self.done = True
+            return
+        if count == requested:
+            return
+        if finished:
+            self.done = True
+        elif count == 0:
+            self.wait = self.poll_interval
+
+    def accept(self, response: Any, requested: int) -> list[Any]:
+        """Return the records of a page response and update the cursor"""
+        if not isinstance(response, dict):
+            # Not a session response; treat it as the only page
+            self.done = True
+            return response if isinstance(response, list) else [response]
+        if response.get("session_id") is not None:
+            self.session_id = response["session_id"]
+        records = response.get("results") or []
+        if not isinstance(records, list):
+            records = [records]
+        self.advance(len(records), requested, response.get("completed"))
+        return records
+
+
+def _log_abort_error(session_id: Any, error: Exception) -> None:
+    logger.warning("Failed to abort log session %s: %s", session_id, error)
+
+
+def follow_session(
+    fetch: Callable[[dict[str, Any]], Any],
+    abort: Callable[[Any], Any],
+    rows: int = DEFAULT_ROWS,
+    start: int = 0,
+    max_rows: Optional[int] = None,
+    poll_interval: float = 1.0,
+) -> Iterator[Any]:
+    """
+    Yield the records of a log query, following its session (sync mode)
+
+    Args:
+        fetch: Called with the paging parameters; returns the full JSON
+            response of one page
+        abort: Called with the session ID when iteration ends
+        rows: Rows requested per page (default: 1000)
+        start: Index of the first row (default: 0)
+        max_rows: Stop after this many rows (default: None = all)
+        poll_interval: Seconds between polls of a running search that has
+            no new rows yet (default: 1.0)
+
+    Yields:
+        Log records one at a time
+    """
+    cursor = _SessionCursor(rows, start, max_rows, poll_interval)
+    try:
+        while not cursor.done:
+            if cursor.wait:
+                time.sleep(cursor.wait)
+            params = cursor.params()
+            yield from cursor.accept(fetch(params), params["rows"])
+    finally:
+        if cursor.session_id is not None:
+            try:
+                abort(cursor.session_id)
+            except Exception as e:
+                _log_abort_error(cursor.session_id, e)
+
+
+async def afollow_session(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    abort: Callable[[Any], Awaitable[Any]],
+    rows: int = DEFAULT_ROWS,
+    start: int = 0,
+    max_rows: Optional[int] = None,
+    poll_interval: float = 1.0,
+) -> AsyncIterator[Any]:
+    """
+    Yield the records of a log query, following its session (async mode)
+
+    Same as follow_session() with awaitable ``fetch`` and ``abort``.
+    """
+    cursor = _SessionCursor(rows, start, max_rows, poll_interval)
+    try:
+        while not cursor.done:
+            if cursor.wait:
+                await asyncio.sleep(cursor.wait)
+            params = cursor.params()
+            for record in cursor.accept(await fetch(params), params["rows"]):
+                yield record
+    finally:
+        if cursor.session_id is not None:
+            try:
+                await abort(cursor.session_id)
+            except Exception as e:
+                _log_abort_error(cursor.session_id, e)
+
+
+def _decode_line(line: Union[bytes, bytearray]) -> str:
+    return bytes(line).rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a chunked text body into non-empty lines"""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _decode_line(line)
+    if pending.strip():
+        yield _decode_line(pending)
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a chunked text body into non-empty lines (async)"""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _decode_line(line)
+    if pending.strip():
+        yield _decode_line(pending)
+
+
+def follow_raw(
+    fetch: Callable[[dict[str, Any]], Iterable[bytes]],
+    abort: Callable[[Any], Any],
+    rows: int = DEFAULT_ROWS,
+    start: int = 0,
+    max_rows: Optional[int] = None,
+    session_id: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield the lines of a raw log query page by page (sync mode)
+
+    Args:
+        fetch: Called with the paging parameters; returns the response body
+            of one page as an iterable of byte chunks
+        abort: Called with ``session_id`` when iteration ends (only if a
+            session ID was given)
+        rows: Lines requested per page (default: 1000)
+        start: Index of the first line (default: 0)
+        max_rows: Stop after this many lines (default: None = all)
+        session_id: Existing log session to read from; it is kept alive
+            between pages and aborted at the end
+
+    Yields:
+        Raw log lines (without line terminator)
+    """
+    cursor = _SessionCursor(rows, start, max_rows, 0.0, session_id)
+    keep_alive = session_id is not None
+    try:
+        while not cursor.done:
+            params = cursor.params(keep_alive)
+            body = fetch(params)
+            count = 0
+            try:
+                for line in iter_lines(body):
+                    if count == cursor.remaining:
+                        # The endpoint sent more lines than requested
+                        break
+                    count += 1
+                    yield line
+            finally:
+                # Release the connection if the caller stopped mid-page
+                close = getattr(body, "close", None)
+                if close is not None:
+                    close()
+            cursor.advance(count, params["rows"], None)
+    finally:
+        if keep_alive:
+            try:
+                abort(session_id)
+            except Exception as e:
+                _log_abort_error(session_id, e)
+
+
+async def afollow_raw(
+    fetch: Callable[[dict[str, Any]], AsyncIterable[bytes]],
+    abort: Callable[[Any], Awaitable[Any]],
+    rows: int = DEFAULT_ROWS,
+    start: int = 0,
+    max_rows: Optional[int] = None,
+    session_id: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield the lines of a raw log query page by page (async mode)
+
+    Same as follow_raw() with an async ``fetch`` and awaitable ``abort``.
+    """
+    cursor = _SessionCursor(rows, start, max_rows, 0.0, session_id)
+    keep_alive = session_id is not None
+    try:
+        while not cursor.done:
+            params = cursor.params(keep_alive)
+            body = fetch(params)
+            count = 0
+            try:
+                async for line in aiter_lines(body):
+                    if count == cursor.remaining:
+                        # The endpoint sent more lines than requested
+                        break
+                    count += 1
+                    yield line
+            finally:
+                # Release the connection if the caller stopped mid-page
+                aclose = getattr(body, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            cursor.advance(count, params["rows"], None)
+    finally:
+        if keep_alive:
+            try:
+                await abort(session_id)
+            except Exception as e:
+                _log_abort_error(session_id, e)
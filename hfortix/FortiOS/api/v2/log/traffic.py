@@ -27,7 +27,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from .base import LogResource, RawResource
+from .base import LogIterMixin, LogResource, RawResource
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -36,7 +36,7 @@ if TYPE_CHECKING:
 
 
 # Traffic subtypes
-class TrafficForward:
+class TrafficForward(LogIterMixin):
     """
     Trafficforward Operations.
 
@@ -131,7 +131,7 @@ class TrafficForward:
         )
 
 
-class TrafficLocal:
+class TrafficLocal(LogIterMixin):
     """Local traffic - /disk/traffic/local"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -216,7 +216,7 @@ class TrafficLocal:
         )
 
 
-class TrafficMulticast:
+class TrafficMulticast(LogIterMixin):
     """Multicast traffic - /disk/traffic/multicast"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -301,7 +301,7 @@ class TrafficMulticast:
         )
 
 
-class TrafficSniffer:
+class TrafficSniffer(LogIterMixin):
     """Sniffer traffic - /disk/traffic/sniffer"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -386,7 +386,7 @@ class TrafficSniffer:
         )
 
 
-class TrafficFortiview:
+class TrafficFortiview(LogIterMixin):
     """Fortiview traffic - /disk/traffic/fortiview"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -471,7 +471,7 @@ class TrafficFortiview:
         )
 
 
-class TrafficThreat:
+class TrafficThreat(LogIterMixin):
     """Threat traffic - /disk/traffic/threat"""
 
     def __init__(self, client: "IHTTPClient", storage: str = "disk") -> None:
@@ -0,0 +1,370 @@
+"""
+Time-window partitioned log queries.
+
+A log search is sequential: one session, read page after page. To pull a
+long time range faster, split_windows() cuts the range into windows and
+fetch_windows() (sync, threads) / afetch_windows() (async, tasks) run one
+search per window concurrently, each restricted to its window with
+``date``/``time`` log filters. Used by ``LogResource.iter_time_range()``
+and ``aiter_time_range()``.
+
+Windows never span midnight: the log filter syntax compares ``date`` and
+``time`` separately, so a window is always one date plus a time range::
+
+    filter=date==2026-01-15&filter=time>=10:00:00&filter=time<11:00:00
+
+Results are handed out window by window in time order, whatever order the
+searches finish in; at most ``concurrency`` windows are fetched (and held
+in memory) at once. A log stamped exactly at a window boundary can be
+returned by both neighbouring searches, so entries within a second of a
+boundary are deduplicated.
+
+Dates and times are the FortiGate's local log time; timezone information
+on the datetimes passed in is ignored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+__all__ = [
+    "DEFAULT_WINDOW",
+    "afetch_windows",
+    "combine_filters",
+    "fetch_windows",
+    "split_windows",
+    "window_filters",
+]
+
+DEFAULT_WINDOW = timedelta(hours=1)
+
+Window = tuple[datetime, datetime]
+
+_SECOND = timedelta(seconds=1)
+
+
+def split_windows(
+    start: datetime,
+    end: datetime,
+    window: timedelta = DEFAULT_WINDOW,
+) -> list[Window]:
+    """
+    Split ``[start, end)`` into windows of at most ``window``
+
+    Windows are additionally cut at midnight, and boundaries are whole
+    seconds (``start`` is rounded down, ``end`` up).
+
+    Args:
+        start: Start of the range (inclusive)
+        end: End of the range (exclusive)
+        window: Maximum window length (default: 1 hour)
+
+    Returns:
+        List of (start, end) tuples in time order
+
+    Raises:
+        ValueError: If ``end`` is not after ``start`` or ``window`` is
+            shorter than one second
+
+    Example:
+        >>> split_windows(
+        ...     datetime(2026, 1, 15, 22), datetime(2026, 1, 16, 1),
+        ...     timedelta(hours=2),
+        ... )
+        [(datetime(2026, 1, 15, 22, 0), datetime(2026, 1, 16, 0, 0)),
+         (datetime(2026, 1, 16, 0, 0), datetime(2026, 1, 16, 1, 0))]
+    """
+    start = start.replace(tzinfo=None, microsecond=0)
+    end = end.replace(tzinfo=None)
+    if end.microsecond:
+        end = end.replace(microsecond=0) + _SECOND
+    if end <= start:
+        raise ValueError("end must be after start")
+    if window < _SECOND:
+        raise ValueError("window must be at least one second")
+    windows = []
+    while start < end:
+        midnight = datetime.combine(start.date() + timedelta(days=1), time())
+        stop = min(start + window, midnight, end)
+        windows.append((start, stop))
+        start = stop
+    return windows
+
+
+def window_filters(start: datetime, end: datetime) -> list[str]:
+    """
+    Log filters selecting ``[start, end)`` within one day
+
+    Args:
+        start: Start of the window (inclusive)
+        end: End of the window (exclusive); at most the next midnight
+
+    Returns:
+        Filter expressions to be combined (AND) with other filters
+    """
+    filters = [f"date=={start:%Y-%m-%d}"]
+    if start.time() != time():
+        filters.append(f"time>={start:%H:%M:%S}")
+    if end.date() == start.date():
+        filters.append(f"time<{end:%H:%M:%S}")
+    return filters
+
+
+def combine_filters(
+    filter: Optional[Union[str, list[str]]], window: list[str]
+) -> list[str]:
+    """AND a caller's filter (string or list) with a window's filters"""
+    if filter is None:
+        return list(window)
+    if isinstance(filter, str):
+        return [filter, *window]
+    return [*filter, *window]
+
+
+def _stamp(record: Any) -> Optional[str]:
+    """``date time`` of a log entry, comparable as a string"""
+    if not isinstance(record, dict):
+        return None
+    date, clock = record.get("date"), record.get("time")
+    if date is None or clock is None:
+        return None
+    return f"{date} {clock}"
+
+
+def _record_key(record: Any) -> Hashable:
+    """Default dedupe key: the whole entry"""
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+class _Reassembler:
+    """
+    Orders window results, drops boundary duplicates and applies max_rows
+
+    Args:
+        windows: Windows in the order their results are handed out
+        newest_first: Whether ``windows`` runs backwards in time
+        dedupe: Drop entries already returned by the previous window
+        key: Dedupe key of an entry
+        max_rows: Stop after this many entries (None = all)
+    """
+
+    def __init__(
+        self,
+        windows: list[Window],
+        newest_first: bool,
+        dedupe: bool,
+        key: Callable[[Any], Hashable],
+        max_rows: Optional[int],
+    ) -> None:
+        if max_rows is not None and max_rows < 0:
+            raise ValueError("max_rows must be >= 0")
+        # Boundary shared by window i and window i + 1
+        self._boundaries = [
+            w[0] if newest_first else w[1] for w in windows[:-1]
+        ]
+        self._dedupe = dedupe
+        self._key = key
+        self._remaining = max_rows
+        self._index = 0
+        self._seen: set[Hashable] = set()
+        self.done = max_rows == 0 or not windows
+
+    def _near(self, boundary: datetime) -> tuple[str, str]:
+        low = boundary - _SECOND
+        return f"{low:%Y-%m-%d %H:%M:%S}", f"{boundary:%Y-%m-%d %H:%M:%S}"
+
+    def accept(self, records: list[Any]) -> list[Any]:
+        """Return the entries of the next window to hand out"""
+        index = self._index
+        self._index += 1
+        if self._dedupe and index > 0 and self._seen:
+            low, high = self._near(self._boundaries[index - 1])
+            seen, key = self._seen, self._key
+            records = [
+                r
+                for r in records
+                if not (low <= (_stamp(r) or "") <= high and key(r) in seen)
+            ]
+        if self._remaining is not None:
+            records = records[: self._remaining]
+            self._remaining -= len(records)
+            if self._remaining <= 0:
+                self.done = True
+        if self._index > len(self._boundaries):
+            self.done = True
+        elif self._dedupe and not self.done:
+            low, high = self._near(self._boundaries[index])
+            self._seen = {
+                self._key(r)
+                for r in records
+                if low <= (_stamp(r) or "") <= high
+            }
+        return records
+
+
+def _window_order(
+    start: datetime,
+    end: datetime,
+    window: timedelta,
+    concurrency: int,
+    newest_first: bool,
+) -> list[Window]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    windows = split_windows(start, end, window)
+    if newest_first:
+        windows.reverse()
+    return windows
+
+
+def fetch_windows(
+    fetch: Callable[[list[str]], Iterable[Any]],
+    start: datetime,
+    end: datetime,
+    window: timedelta = DEFAULT_WINDOW,
+    concurrency: int = 4,
+    newest_first: bool = False,
+    dedupe: bool = True,
+    key: Optional[Callable[[Any], Hashable]] = None,
+    max_rows: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Fetch a time range window by window, ``concurrency`` at a time (sync)
+
+    Args:
+        fetch: Called with the window's filter list; returns the window's
+            entries (e.g. a LogResource.iter() generator)
+        start: Start of the range (inclusive)
+        end: End of the range (exclusive)
+        window: Maximum window length (default: 1 hour)
+        concurrency: Windows fetched at the same time, using background
+            threads (default: 4). Requires a thread-safe client such as
+            HTTPClient
+        newest_first: Hand out the newest window first (default: oldest)
+        dedupe: Drop boundary entries already returned by the previous
+            window (default: True)
+        key: Dedupe key of an entry (default: the whole entry)
+        max_rows: Stop after this many entries (default: None = all)
+
+    Yields:
+        Log entries, window by window
+    """
+    windows = _window_order(start, end, window, concurrency, newest_first)
+    order = _Reassembler(
+        windows, newest_first, dedupe, key or _record_key, max_rows
+    )
+    stop = threading.Event()
+
+    def collect(filters: list[str]) -> list[Any]:
+        records: list[Any] = []
+        entries = fetch(filters)
+        try:
+            for record in entries:
+                if stop.is_set():
+                    break
+                records.append(record)
+        finally:
+            # Aborts the window's log session if it was left early
+            close = getattr(entries, "close", None)
+            if close is not None:
+                close()
+        return records
+
+    todo = iter(windows)
+    pool = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="hfortix-logwindow"
+    )
+    pending: Deque[Future] = deque()
+
+    def submit() -> None:
+        for window_start, window_end in todo:
+            filters = window_filters(window_start, window_end)
+            pending.append(pool.submit(collect, filters))
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit()
+        while pending and not order.done:
+            records = pending.popleft().result()
+            submit()
+            yield from order.accept(records)
+    finally:
+        # Also runs when the caller stops early: in-flight windows stop
+        # at their next entry and abort their sessions
+        stop.set()
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+async def afetch_windows(
+    fetch: Callable[[list[str]], AsyncIterator[Any]],
+    start: datetime,
+    end: datetime,
+    window: timedelta = DEFAULT_WINDOW,
+    concurrency: int = 4,
+    newest_first: bool = False,
+    dedupe: bool = True,
+    key: Optional[Callable[[Any], Hashable]] = None,
+    max_rows: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """
+    Fetch a time range window by window, ``concurrency`` at a time (async)
+
+    Same as fetch_windows() with ``fetch`` returning an async iterator
+    (e.g. a LogResource.aiter() generator); windows run as tasks.
+    """
+    windows = _window_order(start, end, window, concurrency, newest_first)
+    order = _Reassembler(
+        windows, newest_first, dedupe, key or _record_key, max_rows
+    )
+
+    async def collect(filters: list[str]) -> list[Any]:
+        entries = fetch(filters)
+        try:
+            return [record async for record in entries]
+        finally:
+            # Aborts the window's log session if the task was cancelled
+            aclose = getattr(entries, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    todo = iter(windows)
+    pending: Deque[asyncio.Future] = deque()
+
+    def submit() -> None:
+        for window_start, window_end in todo:
+            filters = window_filters(window_start, window_end)
+            pending.append(asyncio.ensure_future(collect(filters)))
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit()
+        while pending and not order.done:
+            records = await pending.popleft()
+            submit()
+            for record in order.accept(records):
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -3,19 +3,34 @@ FortiOS Monitor - Azure
 Azure SDN connector monitoring and operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Azure"]
 
-from .application_list import ApplicationList
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "ApplicationList": "._registry",
+    },
+)
 
 
 class Azure:
     """Azure Monitor category class"""
 
+    application_list: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ApplicationList"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Azure Monitor category
@@ -25,9 +40,6 @@ class Azure:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.application_list = ApplicationList(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["application_list"]
@@ -0,0 +1,21 @@
+"""FortiOS MONITOR - Azure endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "application_list": {
+        "class": "ApplicationList",
+        "path": "/azure/application-list",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "refresh": {
+                "class": "Refresh",
+                "path": "/azure/application-list/refresh",
+                "fields": {"last_update_time": int},
+                "methods": ("post",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,19 +3,34 @@ FortiOS Monitor - CASB
 CASB (Cloud Access Security Broker) monitoring operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Casb"]
 
-from .saas_application import SaasApplication
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "SaasApplication": "._registry",
+    },
+)
 
 
 class Casb:
     """CASB Monitor category class"""
 
+    saas_application: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "SaasApplication"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize CASB Monitor category
@@ -25,9 +40,6 @@ class Casb:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.saas_application = SaasApplication(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["saas_application"]
@@ -8,45 +8,8 @@ Auto-generated from OpenAPI specification by generate_validators.py
 Customize as needed for endpoint-specific business logic.
 """
 
-from typing import Any
+from hfortix.FortiOS.api._helpers.validation import EndpointSchema
 
-# Valid enum values from API documentation
-# ============================================================================
-# GET Validation
-# ============================================================================
+SCHEMA = EndpointSchema()
 
-
-def validate_saas_application_get(
-    mkey: str | None = None,
-    attr: str | None = None,
-    filters: dict[str, Any] | None = None,
-    **params: Any,
-) -> tuple[bool, str | None]:
-    """
-    Validate GET request parameters.
-
-    Args:
-        mkey: Object identifier (optional for list, required for specific)
-        attr: Attribute filter (optional)
-        filters: Additional filter parameters
-        **params: Other query parameters
-
-    Returns:
-        Tuple of (is_valid, error_message)
-
-    Example:
-        >>> # List all objects
-        >>> is_valid, error = {func_name}()
-        >>>
-        >>> # Get specific object
-        >>> is_valid, error = validate_saas_application_get(mkey="value")
-        >>> if not is_valid:
-        ...     raise ValueError(error)
-    """
-    # mkey is optional - if None, returns list of all objects
-    # Validate format only if provided and not empty
-    if mkey is not None and str(mkey).strip():
-        if not isinstance(mkey, (str, int)):
-            return (False, "mkey must be a string or integer")
-
-    return (True, None)
+validate_saas_application_get = SCHEMA.get_validator("mkey")
@@ -0,0 +1,21 @@
+"""FortiOS MONITOR - Casb endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "saas_application": {
+        "class": "SaasApplication",
+        "path": "/casb/saas-application",
+        "methods": (),
+        "children": {
+            "details": {
+                "class": "Details",
+                "path": "/casb/saas-application/details",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
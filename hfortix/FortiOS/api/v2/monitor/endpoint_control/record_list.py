@@ -28,7 +28,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
 
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
@@ -85,3 +85,49 @@ class RecordList:
         return self._client.get(
             "monitor", "/endpoint-control/record-list", params=params
         )
+
+    def iter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (sync mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of parameters
+            **kwargs: Additional parameters passed to get()
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        return paginate(
+            self.get, page_size, payload_dict=payload_dict, **kwargs
+        )
+
+    def aiter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (async mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of parameters
+            **kwargs: Additional parameters passed to get()
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        return apaginate(
+            self.get, page_size, payload_dict=payload_dict, **kwargs
+        )
@@ -11,15 +11,154 @@ This module provides access to firewall monitoring endpoints including:
 - GTP tunnel monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .check_addrgrp_exclude_mac_member import CheckAddrgrpExcludeMacMember
+    from .internet_service import InternetService
+    from .shaper_multi_class_shaper import ShaperMultiClassShaper
+
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Health": "._registry",
+        "LocalIn": "._registry",
+        "LocalIn6": "._registry",
+        "Acl": "._registry",
+        "Acl6": "._registry",
+        "CentralSnatMap": "._registry",
+        "Dnat": "._registry",
+        "CheckAddrgrpExcludeMacMember": ".check_addrgrp_exclude_mac_member",
+        "InternetService": ".internet_service",
+        "InternetServiceFqdn": "._registry",
+        "InternetServiceFqdnIconIds": "._registry",
+        "InternetServiceBasic": "._registry",
+        "NetworkServiceDynamic": "._registry",
+        "Proxy": "._registry",
+        "Policy": "._registry",
+        "SecurityPolicy": "._registry",
+        "ProxyPolicy": "._registry",
+        "MulticastPolicy": "._registry",
+        "MulticastPolicy6": "._registry",
+        "SaasApplication": "._registry",
+        "PolicyLookup": "._registry",
+        "Sessions": "._registry",
+        "Shaper": "._registry",
+        "ShaperMultiClassShaper": ".shaper_multi_class_shaper",
+        "PerIpShaper": "._registry",
+        "LoadBalance": "._registry",
+        "VipOverlap": "._registry",
+        "AddressFqdns": "._registry",
+        "AddressFqdns6": "._registry",
+        "ClearpassAddress": "._registry",
+        "Ippool": "._registry",
+        "UUID": "._registry",
+        "Gtp": "._registry",
+        "GtpStatistics": "._registry",
+        "GtpRuntimeStatistics": "._registry",
+        "AddressDynamic": "._registry",
+        "Address6Dynamic": "._registry",
+        "SdnConnectorFilters": "._registry",
+        "ZtnaFirewallPolicy": "._registry",
+    },
+)
+
 
 class Firewall:
     """Firewall Monitor API endpoints."""
 
+    _health: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Health")
+    _local_in: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LocalIn")
+    _local_in6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LocalIn6")
+    _acl: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Acl")
+    _acl6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Acl6")
+    _central_snat_map: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CentralSnatMap"
+    )
+    _dnat: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Dnat")
+    _check_addrgrp_exclude_mac_member: LazyEndpoint[
+        CheckAddrgrpExcludeMacMember
+    ] = LazyEndpoint("CheckAddrgrpExcludeMacMember")
+    _internet_service: LazyEndpoint[InternetService] = LazyEndpoint(
+        "InternetService"
+    )
+    _internet_service_fqdn: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "InternetServiceFqdn"
+    )
+    _internet_service_fqdn_icon_ids: LazyEndpoint[MonitorEndpoint] = (
+        LazyEndpoint("InternetServiceFqdnIconIds")
+    )
+    _internet_service_basic: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "InternetServiceBasic"
+    )
+    _network_service_dynamic: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "NetworkServiceDynamic"
+    )
+    _proxy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Proxy")
+    _policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Policy")
+    _security_policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "SecurityPolicy"
+    )
+    _proxy_policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ProxyPolicy")
+    _multicast_policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MulticastPolicy"
+    )
+    _multicast_policy6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MulticastPolicy6"
+    )
+    _saas_application: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "SaasApplication"
+    )
+    _policy_lookup: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "PolicyLookup"
+    )
+    _sessions: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Sessions")
+    _shaper: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Shaper")
+    _shaper_multi_class_shaper: LazyEndpoint[ShaperMultiClassShaper] = (
+        LazyEndpoint("ShaperMultiClassShaper")
+    )
+    _per_ip_shaper: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("PerIpShaper")
+    _load_balance: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LoadBalance")
+    _vip_overlap: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("VipOverlap")
+    _address_fqdns: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AddressFqdns"
+    )
+    _address_fqdns6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AddressFqdns6"
+    )
+    _clearpass_address: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ClearpassAddress"
+    )
+    _ippool: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ippool")
+    _uuid: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("UUID")
+    _gtp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Gtp")
+    _gtp_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "GtpStatistics"
+    )
+    _gtp_runtime_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "GtpRuntimeStatistics"
+    )
+    _address_dynamic: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AddressDynamic"
+    )
+    _address6_dynamic: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "Address6Dynamic"
+    )
+    _sdn_connector_filters: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "SdnConnectorFilters"
+    )
+    _ztna_firewall_policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ZtnaFirewallPolicy"
+    )
+
     def __init__(self, client: "IHTTPClient"):
         """
         Initialize Firewall Monitor API.
@@ -30,94 +169,6 @@ class Firewall:
         """
         self._client = client
 
-        # Import classes directly for cleaner code
-        from .acl import Acl
-        from .acl6 import Acl6
-        from .address6_dynamic import Address6Dynamic
-        from .address_dynamic import AddressDynamic
-        from .address_fqdns import AddressFqdns
-        from .address_fqdns6 import AddressFqdns6
-        from .central_snat_map import CentralSnatMap
-        from .check_addrgrp_exclude_mac_member import (
-            CheckAddrgrpExcludeMacMember,
-        )
-        from .clearpass_address import ClearpassAddress
-        from .dnat import Dnat
-        from .gtp import Gtp
-        from .gtp_runtime_statistics import GtpRuntimeStatistics
-        from .gtp_statistics import GtpStatistics
-        from .health import Health
-        from .internet_service import InternetService
-        from .internet_service_basic import InternetServiceBasic
-        from .internet_service_fqdn import InternetServiceFqdn
-        from .internet_service_fqdn_icon_ids import InternetServiceFqdnIconIds
-        from .ippool import Ippool
-        from .load_balance import LoadBalance
-        from .local_in import LocalIn
-        from .local_in6 import LocalIn6
-        from .multicast_policy import MulticastPolicy
-        from .multicast_policy6 import MulticastPolicy6
-        from .network_service_dynamic import NetworkServiceDynamic
-        from .per_ip_shaper import PerIpShaper
-        from .policy import Policy
-        from .policy_lookup import PolicyLookup
-        from .proxy import Proxy
-        from .proxy_policy import ProxyPolicy
-        from .saas_application import SaasApplication
-        from .sdn_connector_filters import SdnConnectorFilters
-        from .security_policy import SecurityPolicy
-        from .sessions import Sessions
-        from .shaper import Shaper
-        from .shaper_multi_class_shaper import ShaperMultiClassShaper
-        from .uuid import UUID
-        from .vip_overlap import VipOverlap
-        from .ztna_firewall_policy import ZtnaFirewallPolicy
-
-        # Initialize all sub-endpoints
-        self._health = Health(client)
-        self._local_in = LocalIn(client)
-        self._local_in6 = LocalIn6(client)
-        self._acl = Acl(client)
-        self._acl6 = Acl6(client)
-        self._central_snat_map = CentralSnatMap(client)
-        self._dnat = Dnat(client)
-        self._check_addrgrp_exclude_mac_member = CheckAddrgrpExcludeMacMember(
-            client
-        )
-        self._internet_service = InternetService(client)
-        self._internet_service_fqdn = InternetServiceFqdn(client)
-        self._internet_service_fqdn_icon_ids = InternetServiceFqdnIconIds(
-            client
-        )
-        self._internet_service_basic = InternetServiceBasic(client)
-        self._network_service_dynamic = NetworkServiceDynamic(client)
-        self._proxy = Proxy(client)
-        self._policy = Policy(client)
-        self._security_policy = SecurityPolicy(client)
-        self._proxy_policy = ProxyPolicy(client)
-        self._multicast_policy = MulticastPolicy(client)
-        self._multicast_policy6 = MulticastPolicy6(client)
-        self._saas_application = SaasApplication(client)
-        self._policy_lookup = PolicyLookup(client)
-        self._sessions = Sessions(client)
-        self._shaper = Shaper(client)
-        self._shaper_multi_class_shaper = ShaperMultiClassShaper(client)
-        self._per_ip_shaper = PerIpShaper(client)
-        self._load_balance = LoadBalance(client)
-        self._vip_overlap = VipOverlap(client)
-        self._address_fqdns = AddressFqdns(client)
-        self._address_fqdns6 = AddressFqdns6(client)
-        self._clearpass_address = ClearpassAddress(client)
-        self._ippool = Ippool(client)
-        self._uuid = UUID(client)
-        self._gtp = Gtp(client)
-        self._gtp_statistics = GtpStatistics(client)
-        self._gtp_runtime_statistics = GtpRuntimeStatistics(client)
-        self._address_dynamic = AddressDynamic(client)
-        self._address6_dynamic = Address6Dynamic(client)
-        self._sdn_connector_filters = SdnConnectorFilters(client)
-        self._ztna_firewall_policy = ZtnaFirewallPolicy(client)
-
     @property
     def health(self):
         """Load balance server health monitors."""
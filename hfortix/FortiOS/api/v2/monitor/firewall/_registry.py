@@ -0,0 +1,492 @@
+"""FortiOS MONITOR - Firewall endpoint registry"""
+
+from typing import Any
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "acl": {
+        "class": "Acl",
+        "path": "/firewall/acl",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/acl/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "acl6": {
+        "class": "Acl6",
+        "path": "/firewall/acl6",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/acl6/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "address6_dynamic": {
+        "class": "Address6Dynamic",
+        "path": "/firewall/address6-dynamic",
+        "params": {"mkey": str},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "address_dynamic": {
+        "class": "AddressDynamic",
+        "path": "/firewall/address-dynamic",
+        "params": {"mkey": str},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "address_fqdns": {
+        "class": "AddressFqdns",
+        "path": "/firewall/address-fqdns",
+        "params": {"mkey": str},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "address_fqdns6": {
+        "class": "AddressFqdns6",
+        "path": "/firewall/address-fqdns6",
+        "params": {"mkey": str},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "central_snat_map": {
+        "class": "CentralSnatMap",
+        "path": "/firewall/central-snat-map",
+        "params": {"policyid": int, "ip_version": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/central-snat-map/clear-counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/central-snat-map/reset",
+                "methods": ("post",),
+            },
+        },
+    },
+    "clearpass_address": {
+        "class": "ClearpassAddress",
+        "path": "/firewall/clearpass-address",
+        "methods": (),
+        "children": {
+            "add": {
+                "class": "Add",
+                "path": "/firewall/clearpass-address/add",
+                "fields": {"endpoint_ip": list, "spt": str},
+                "methods": ("post",),
+            },
+            "delete": {
+                "class": "Delete",
+                "path": "/firewall/clearpass-address/delete",
+                "fields": {"endpoint_ip": list, "spt": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "dnat": {
+        "class": "Dnat",
+        "path": "/firewall/dnat",
+        "params": {"uuid": Any, "ip_version": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/dnat/clear-counters",
+                "fields": {"id": int, "is_ipv6": bool},
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/dnat/reset",
+                "methods": ("post",),
+            },
+        },
+    },
+    "gtp": {
+        "class": "Gtp",
+        "path": "/firewall/gtp",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "flush": {
+                "class": "Flush",
+                "path": "/firewall/gtp/flush",
+                "fields": {
+                    "scope": str,
+                    "gtp_profile": str,
+                    "version": int,
+                    "imsi": str,
+                    "msisdn": str,
+                    "ms_addr": str,
+                    "ms_addr6": str,
+                    "cteid": int,
+                    "cteid_addr": str,
+                    "cteid_addr6": str,
+                    "fteid": int,
+                    "fteid_addr": str,
+                    "fteid_addr6": str,
+                    "apn": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "gtp_runtime_statistics": {
+        "class": "GtpRuntimeStatistics",
+        "path": "/firewall/gtp-runtime-statistics",
+        "methods": ("get",),
+    },
+    "gtp_statistics": {
+        "class": "GtpStatistics",
+        "path": "/firewall/gtp-statistics",
+        "methods": ("get",),
+    },
+    "health": {
+        "class": "Health",
+        "path": "/firewall/health",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "internet_service_basic": {
+        "class": "InternetServiceBasic",
+        "path": "/firewall/internet-service-basic",
+        "params": {"ipv6_only": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "internet_service_fqdn": {
+        "class": "InternetServiceFqdn",
+        "path": "/firewall/internet-service-fqdn",
+        "methods": ("get",),
+    },
+    "internet_service_fqdn_icon_ids": {
+        "class": "InternetServiceFqdnIconIds",
+        "path": "/firewall/internet-service-fqdn-icon-ids",
+        "methods": ("get",),
+    },
+    "ippool": {
+        "class": "Ippool",
+        "path": "/firewall/ippool",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "mapping": {
+                "class": "Mapping",
+                "path": "/firewall/ippool/mapping",
+                "params": {"mkey": str},
+                "required": ("mkey",),
+                "methods": ("get",),
+            }
+        },
+    },
+    "load_balance": {
+        "class": "LoadBalance",
+        "path": "/firewall/load-balance",
+        "params": {"count": int},
+        "required": ("count",),
+        "methods": ("get", "iter", "aiter"),
+    },
+    "local_in": {
+        "class": "LocalIn",
+        "path": "/firewall/local-in",
+        "params": {"include_ttl": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "local_in6": {
+        "class": "LocalIn6",
+        "path": "/firewall/local-in6",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "multicast_policy": {
+        "class": "MulticastPolicy",
+        "path": "/firewall/multicast-policy",
+        "params": {"policyid": int},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/multicast-policy/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/multicast-policy/reset",
+                "methods": ("post",),
+            },
+        },
+    },
+    "multicast_policy6": {
+        "class": "MulticastPolicy6",
+        "path": "/firewall/multicast-policy6",
+        "params": {"policyid": int},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/multicast-policy6/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/multicast-policy6/reset",
+                "methods": ("post",),
+            },
+        },
+    },
+    "network_service_dynamic": {
+        "class": "NetworkServiceDynamic",
+        "path": "/firewall/network-service-dynamic",
+        "params": {"mkey": str},
+        "required": ("mkey",),
+        "methods": ("get", "iter", "aiter"),
+    },
+    "per_ip_shaper": {
+        "class": "PerIpShaper",
+        "path": "/firewall/per-ip-shaper",
+        "params": {"shaper_name": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/per-ip-shaper/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+    "policy": {
+        "class": "Policy",
+        "path": "/firewall/policy",
+        "params": {"policyid": Any, "ip_version": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/policy/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/policy/reset",
+                "methods": ("post",),
+            },
+            "update_global_label": {
+                "class": "UpdateGlobalLabel",
+                "path": "/firewall/policy/update-global-label",
+                "fields": {
+                    "policyid": str,
+                    "current-label": str,
+                    "new-label": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "policy_lookup": {
+        "class": "PolicyLookup",
+        "path": "/firewall/policy-lookup",
+        "params": {
+            "srcintf": str,
+            "sourceip": str,
+            "protocol": str,
+            "dest": str,
+            "ipv6": bool,
+            "sourceport": int,
+            "destport": int,
+            "icmptype": int,
+            "icmpcode": int,
+            "policy_type": str,
+            "auth_type": str,
+            "user_group": Any,
+            "server_name": str,
+            "user_db": str,
+            "group_attr_type": str,
+        },
+        "required": ("srcintf", "sourceip", "protocol", "dest"),
+        "methods": ("get",),
+    },
+    "proxy": {
+        "class": "Proxy",
+        "path": "/firewall/proxy",
+        "methods": (),
+        "children": {
+            "sessions": {
+                "class": "Sessions",
+                "path": "/firewall/proxy/sessions",
+                "params": {
+                    "count": int,
+                    "ip_version": str,
+                    "summary": bool,
+                    "srcaddr": str,
+                    "dstaddr": str,
+                    "srcaddr6": str,
+                    "dstaddr6": str,
+                    "srcport": str,
+                    "dstport": str,
+                    "srcintf": str,
+                    "dstintf": str,
+                    "policyid": str,
+                    "proxy-policyid": str,
+                    "protocol": str,
+                    "application": str,
+                    "country": str,
+                    "seconds": str,
+                    "since": str,
+                    "owner": str,
+                    "username": str,
+                    "src_uuid": str,
+                    "dst_uuid": str,
+                },
+                "required": ("count",),
+                "methods": ("get", "iter", "aiter"),
+            }
+        },
+    },
+    "proxy_policy": {
+        "class": "ProxyPolicy",
+        "path": "/firewall/proxy-policy",
+        "params": {"policyid": int},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/proxy-policy/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "saas_application": {
+        "class": "SaasApplication",
+        "path": "/firewall/saas-application",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "sdn_connector_filters": {
+        "class": "SdnConnectorFilters",
+        "path": "/firewall/sdn-connector-filters",
+        "params": {"connector": str},
+        "required": ("connector",),
+        "methods": ("get", "iter", "aiter"),
+    },
+    "security_policy": {
+        "class": "SecurityPolicy",
+        "path": "/firewall/security-policy",
+        "params": {"policyid": int},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/security-policy/clear_counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            },
+            "update_global_label": {
+                "class": "UpdateGlobalLabel",
+                "path": "/firewall/security-policy/update-global-label",
+                "fields": {
+                    "policyid": str,
+                    "current-label": str,
+                    "new-label": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "sessions": {
+        "class": "Sessions",
+        "path": "/firewall/sessions",
+        "params": {
+            "count": int,
+            "ip_version": str,
+            "summary": bool,
+            "srcport": str,
+            "policyid": str,
+            "security-policyid": str,
+            "application": str,
+            "protocol": str,
+            "dstport": str,
+            "srcintf": str,
+            "dstintf": str,
+            "srcintfrole": list,
+            "dstintfrole": list,
+            "srcaddr": str,
+            "srcaddr6": str,
+            "srcuuid": str,
+            "dstaddr": str,
+            "dstaddr6": str,
+            "dstuuid": str,
+            "username": str,
+            "shaper": str,
+            "country": str,
+            "owner": str,
+            "natsourceaddress": str,
+            "natsourceport": str,
+            "since": str,
+            "seconds": str,
+            "fortiasic": str,
+            "nturbo": str,
+        },
+        "required": ("count",),
+        "methods": ("get", "iter", "aiter"),
+    },
+    "shaper": {
+        "class": "Shaper",
+        "path": "/firewall/shaper",
+        "params": {"shaper_name": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "multi_class_shaper": {
+                "class": "MultiClassShaper",
+                "path": "/firewall/shaper/multi-class-shaper",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/firewall/shaper/reset",
+                "methods": ("post",),
+            },
+        },
+    },
+    "uuid": {
+        "class": "UUID",
+        "path": "/firewall/uuid-list",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "type_lookup": {
+                "class": "TypeLookup",
+                "path": "/firewall/uuid-type-lookup",
+                "params": {"uuids": Any},
+                "required": ("uuids",),
+                "methods": ("get",),
+            }
+        },
+    },
+    "vip_overlap": {
+        "class": "VipOverlap",
+        "path": "/firewall/vip-overlap",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ztna_firewall_policy": {
+        "class": "ZtnaFirewallPolicy",
+        "path": "/firewall/ztna-firewall-policy",
+        "methods": (),
+        "children": {
+            "clear_counters": {
+                "class": "ClearCounters",
+                "path": "/firewall/ztna-firewall-policy/clear-counters",
+                "fields": {"policy": int},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -1,82 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Firewall Gtp Runtime Statistics
-
-Monitoring endpoint for monitor firewall gtp runtime statistics data.
-
-API Endpoints:
-    GET    /monitor/firewall/gtp_runtime_statistics
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.firewall.gtp_runtime_statistics.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.firewall.gtp_runtime_statistics.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class GtpRuntimeStatistics:
-    """
-    Gtpruntimestatistics Operations.
-
-    Provides read-only access for FortiOS gtpruntimestatistics data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize GtpRuntimeStatistics endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Retrieve runtime statistics for GTP.
-
-        Args:
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.firewall.gtp_runtime_statistics.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/firewall/gtp-runtime-statistics", params=params
-        )
@@ -1,86 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Firewall Internet Service Basic
-
-Monitoring endpoint for monitor firewall internet service basic data.
-
-API Endpoints:
-    GET    /monitor/firewall/internet_service_basic
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.firewall.internet_service_basic.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.firewall.internet_service_basic.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class InternetServiceBasic:
-    """
-    Internetservicebasic Operations.
-
-    Provides read-only access for FortiOS internetservicebasic data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize InternetServiceBasic endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        ipv6_only: bool | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        List internet services with basic information.
-
-        Args:
-            ipv6_only: Only return IPv6 entries. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.firewall.internet_service_basic.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        if ipv6_only is not None:
-            params["ipv6_only"] = ipv6_only
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/firewall/internet-service-basic", params=params
-        )
@@ -1,125 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Firewall Ippool
-
-Monitoring endpoint for monitor firewall ippool data.
-
-API Endpoints:
-    GET    /monitor/firewall/ippool
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.firewall.ippool.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.firewall.ippool.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Mapping:
-    """
-    Mapping Operations.
-
-    Provides read-only access for FortiOS mapping data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Mapping endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def get(
-        self,
-        mkey: str,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Get the list of IPv4 mappings for the specified IP pool.
-
-        Args:
-            mkey: The IP pool name. (required)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.firewall.ippool.mapping.get(mkey='value')
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params["mkey"] = mkey
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/firewall/ippool/mapping", params=params
-        )
-
-
-class Ippool:
-    """Ippool operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Ippool endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.mapping = Mapping(client)
-
-    def get(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        List IPv4 pool statistics.
-
-        Args:
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.firewall.ippool.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params.update(kwargs)
-        return self._client.get("monitor", "/firewall/ippool", params=params)
@@ -3,19 +3,34 @@ FortiOS Monitor - Firmware
 Firmware upgrade monitoring and operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Firmware"]
 
-from .extension_device import ExtensionDevice
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "ExtensionDevice": "._registry",
+    },
+)
 
 
 class Firmware:
     """Firmware Monitor category class"""
 
+    extension_device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ExtensionDevice"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Firmware Monitor category
@@ -25,9 +40,6 @@ class Firmware:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.extension_device = ExtensionDevice(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["extension_device"]
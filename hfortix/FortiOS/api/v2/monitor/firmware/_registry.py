@@ -0,0 +1,15 @@
+"""FortiOS MONITOR - Firmware endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "extension_device": {
+        "class": "ExtensionDevice",
+        "path": "/firmware/extension-device",
+        "params": {"type": str, "timeout": int, "version": str},
+        "required": ("type",),
+        "methods": ("get", "iter", "aiter"),
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,21 +3,40 @@ FortiOS Monitor - Fortiguard
 FortiGuard service monitoring and operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Fortiguard"]
 
-from .answers import Answers
-from .redirect_portal import RedirectPortal
-from .service_communication_stats import ServiceCommunicationStats
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Answers": "._registry",
+        "RedirectPortal": "._registry",
+        "ServiceCommunicationStats": "._registry",
+    },
+)
 
 
 class Fortiguard:
     """Fortiguard Monitor category class"""
 
+    answers: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Answers")
+    redirect_portal: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "RedirectPortal"
+    )
+    service_communication_stats: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ServiceCommunicationStats"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Fortiguard Monitor category
@@ -27,11 +46,6 @@ class Fortiguard:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.answers = Answers(client)
-        self.redirect_portal = RedirectPortal(client)
-        self.service_communication_stats = ServiceCommunicationStats(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["answers", "redirect_portal", "service_communication_stats"]
@@ -0,0 +1,31 @@
+"""FortiOS MONITOR - Fortiguard endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "answers": {
+        "class": "Answers",
+        "path": "/fortiguard/answers",
+        "params": {
+            "page": int,
+            "pagesize": int,
+            "sortkey": str,
+            "topics": str,
+            "limit": int,
+        },
+        "methods": ("get", "iter", "aiter"),
+    },
+    "redirect_portal": {
+        "class": "RedirectPortal",
+        "path": "/fortiguard/redirect-portal",
+        "methods": ("get",),
+    },
+    "service_communication_stats": {
+        "class": "ServiceCommunicationStats",
+        "path": "/fortiguard/service-communication-stats",
+        "params": {"service_type": str, "timeslot": str},
+        "methods": ("get",),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
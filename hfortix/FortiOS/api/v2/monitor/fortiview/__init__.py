@@ -3,22 +3,44 @@ FortiOS Monitor - Fortiview
 FortiView statistics and monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Fortiview"]
 
-from .historical_statistics import HistoricalStatistics
-from .realtime_proxy_statistics import RealtimeProxyStatistics
-from .realtime_statistics import RealtimeStatistics
-from .session import Session
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "HistoricalStatistics": "._registry",
+        "RealtimeProxyStatistics": "._registry",
+        "RealtimeStatistics": "._registry",
+        "Session": "._registry",
+    },
+)
 
 
 class Fortiview:
     """Fortiview Monitor category class"""
 
+    historical_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HistoricalStatistics"
+    )
+    realtime_proxy_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "RealtimeProxyStatistics"
+    )
+    realtime_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "RealtimeStatistics"
+    )
+    session: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Session")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Fortiview Monitor category
@@ -28,12 +50,6 @@ class Fortiview:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.historical_statistics = HistoricalStatistics(client)
-        self.realtime_proxy_statistics = RealtimeProxyStatistics(client)
-        self.realtime_statistics = RealtimeStatistics(client)
-        self.session = Session(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
@@ -0,0 +1,105 @@
+"""FortiOS MONITOR - Fortiview endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "historical_statistics": {
+        "class": "HistoricalStatistics",
+        "path": "/fortiview/historical-statistics",
+        "params": {
+            "filter": str,
+            "sessionid": int,
+            "device": str,
+            "report_by": str,
+            "sort_by": str,
+            "chart_only": bool,
+            "end": int,
+            "ip_version": str,
+        },
+        "methods": ("get",),
+    },
+    "realtime_proxy_statistics": {
+        "class": "RealtimeProxyStatistics",
+        "path": "/fortiview/realtime-proxy-statistics",
+        "params": {
+            "report_by": str,
+            "sort_by": str,
+            "ip_version": str,
+            "srcaddr": str,
+            "dstaddr": str,
+            "srcaddr6": str,
+            "dstaddr6": str,
+            "srcport": str,
+            "dstport": str,
+            "srcintf": str,
+            "dstintf": str,
+            "policyid": str,
+            "proxy-policyid": str,
+            "protocol": str,
+            "application": str,
+            "country": str,
+            "seconds": str,
+            "since": str,
+            "owner": str,
+            "username": str,
+            "srcuuid": str,
+            "dstuuid": str,
+        },
+        "methods": ("get",),
+    },
+    "realtime_statistics": {
+        "class": "RealtimeStatistics",
+        "path": "/fortiview/realtime-statistics",
+        "params": {
+            "srcaddr": str,
+            "dstaddr": str,
+            "srcaddr6": str,
+            "dstaddr6": str,
+            "srcport": str,
+            "dstport": str,
+            "srcintf": str,
+            "srcintfrole": list,
+            "dstintf": str,
+            "dstintfrole": list,
+            "policyid": str,
+            "security-policyid": str,
+            "protocol": str,
+            "web-category": str,
+            "web-domain": str,
+            "application": str,
+            "country": str,
+            "seconds": str,
+            "since": str,
+            "owner": str,
+            "username": str,
+            "shaper": str,
+            "srcuuid": str,
+            "dstuuid": str,
+            "sessionid": int,
+            "report_by": str,
+            "sort_by": str,
+            "ip_version": str,
+        },
+        "methods": ("get",),
+    },
+    "session": {
+        "class": "Session",
+        "path": "/fortiview/session",
+        "methods": (),
+        "children": {
+            "cancel": {
+                "class": "Cancel",
+                "path": "/fortiview/session/cancel",
+                "fields": {
+                    "sessionid": int,
+                    "device": str,
+                    "report_by": str,
+                    "view_level": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,19 +3,32 @@ FortiOS Monitor - Geoip
 GeoIP lookup operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Geoip"]
 
-from .geoip_query import GeoipQuery
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "GeoipQuery": "._registry",
+    },
+)
 
 
 class Geoip:
     """Geoip Monitor category class"""
 
+    geoip_query: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("GeoipQuery")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Geoip Monitor category
@@ -25,9 +38,6 @@ class Geoip:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.geoip_query = GeoipQuery(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["geoip_query"]
@@ -0,0 +1,21 @@
+"""FortiOS MONITOR - Geoip endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "geoip_query": {
+        "class": "GeoipQuery",
+        "path": "/geoip/geoip-query",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/geoip/geoip-query/select",
+                "fields": {"ip_addresses": list},
+                "methods": ("post",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,23 +3,42 @@ FortiOS Monitor - Ips
 IPS monitoring and operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Ips"]
 
-from .anomaly import Anomaly
-from .hold_signatures import HoldSignatures
-from .metadata import Metadata
-from .rate_based import RateBased
-from .session import Session
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Anomaly": "._registry",
+        "HoldSignatures": "._registry",
+        "Metadata": "._registry",
+        "RateBased": "._registry",
+        "Session": "._registry",
+    },
+)
 
 
 class Ips:
     """Ips Monitor category class"""
 
+    anomaly: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Anomaly")
+    hold_signatures: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HoldSignatures"
+    )
+    metadata: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Metadata")
+    rate_based: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("RateBased")
+    session: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Session")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Ips Monitor category
@@ -29,13 +48,6 @@ class Ips:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.anomaly = Anomaly(client)
-        self.hold_signatures = HoldSignatures(client)
-        self.metadata = Metadata(client)
-        self.rate_based = RateBased(client)
-        self.session = Session(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
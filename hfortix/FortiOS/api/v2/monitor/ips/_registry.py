@@ -0,0 +1,41 @@
+"""FortiOS MONITOR - Ips endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "anomaly": {
+        "class": "Anomaly",
+        "path": "/ips/anomaly",
+        "methods": ("get",),
+    },
+    "hold_signatures": {
+        "class": "HoldSignatures",
+        "path": "/ips/hold-signatures",
+        "params": {"ips_sensor": str},
+        "methods": ("get",),
+    },
+    "metadata": {
+        "class": "Metadata",
+        "path": "/ips/metadata",
+        "methods": ("get",),
+    },
+    "rate_based": {
+        "class": "RateBased",
+        "path": "/ips/rate-based",
+        "methods": ("get",),
+    },
+    "session": {
+        "class": "Session",
+        "path": "/ips/session",
+        "methods": (),
+        "children": {
+            "performance": {
+                "class": "Performance",
+                "path": "/ips/session/performance",
+                "methods": ("get",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,23 +3,46 @@ FortiOS Monitor - License
 License status and management
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["License"]
 
-from .database import Database
-from .fortianalyzer_status import FortianalyzerStatus
-from .forticare_org_list import ForticareOrgList
-from .forticare_resellers import ForticareResellers
-from .status import Status
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Database": "._registry",
+        "FortianalyzerStatus": "._registry",
+        "ForticareOrgList": "._registry",
+        "ForticareResellers": "._registry",
+        "Status": "._registry",
+    },
+)
 
 
 class License:
     """License Monitor category class"""
 
+    database: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Database")
+    fortianalyzer_status: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "FortianalyzerStatus"
+    )
+    forticare_org_list: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ForticareOrgList"
+    )
+    forticare_resellers: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ForticareResellers"
+    )
+    status: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Status")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize License Monitor category
@@ -29,13 +52,6 @@ class License:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.database = Database(client)
-        self.fortianalyzer_status = FortianalyzerStatus(client)
-        self.forticare_org_list = ForticareOrgList(client)
-        self.forticare_resellers = ForticareResellers(client)
-        self.status = Status(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
@@ -0,0 +1,48 @@
+"""FortiOS MONITOR - License endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "database": {
+        "class": "Database",
+        "path": "/license/database",
+        "methods": (),
+        "children": {
+            "upgrade": {
+                "class": "Upgrade",
+                "path": "/license/database/upgrade",
+                "fields": {
+                    "db_name": str,
+                    "confirm_not_signed": bool,
+                    "confirm_not_ga_certified": bool,
+                    "file_id": str,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "fortianalyzer_status": {
+        "class": "FortianalyzerStatus",
+        "path": "/license/fortianalyzer-status",
+        "methods": ("get",),
+    },
+    "forticare_org_list": {
+        "class": "ForticareOrgList",
+        "path": "/license/forticare-org-list",
+        "methods": ("get",),
+    },
+    "forticare_resellers": {
+        "class": "ForticareResellers",
+        "path": "/license/forticare-resellers",
+        "params": {"country_code": int},
+        "methods": ("get",),
+    },
+    "status": {
+        "class": "Status",
+        "path": "/license/status",
+        "methods": ("get",),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,33 +3,78 @@ FortiOS Monitor - Log
 Log device operations and management
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Log"]
 
-from .av_archive import AvArchive
-from .current_disk_usage import CurrentDiskUsage
-from .device import Device
-from .feature_set import FeatureSet
-from .fortianalyzer import Fortianalyzer
-from .fortianalyzer_queue import FortianalyzerQueue
-from .forticloud import Forticloud
-from .forticloud_report import ForticloudReport
-from .forticloud_report_list import ForticloudReportList
-from .historic_daily_remote_logs import HistoricDailyRemoteLogs
-from .hourly_disk_usage import HourlyDiskUsage
-from .local_report import LocalReport
-from .local_report_list import LocalReportList
-from .policy_archive import PolicyArchive
-from .stats import Stats
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AvArchive": "._registry",
+        "CurrentDiskUsage": "._registry",
+        "Device": "._registry",
+        "FeatureSet": "._registry",
+        "Fortianalyzer": "._registry",
+        "FortianalyzerQueue": "._registry",
+        "Forticloud": "._registry",
+        "ForticloudReport": "._registry",
+        "ForticloudReportList": "._registry",
+        "HistoricDailyRemoteLogs": "._registry",
+        "HourlyDiskUsage": "._registry",
+        "LocalReport": "._registry",
+        "LocalReportList": "._registry",
+        "PolicyArchive": "._registry",
+        "Stats": "._registry",
+    },
+)
 
 
 class Log:
     """Log Monitor category class"""
 
+    av_archive: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("AvArchive")
+    current_disk_usage: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CurrentDiskUsage"
+    )
+    device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Device")
+    feature_set: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("FeatureSet")
+    fortianalyzer: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "Fortianalyzer"
+    )
+    fortianalyzer_queue: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "FortianalyzerQueue"
+    )
+    forticloud: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Forticloud")
+    forticloud_report: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ForticloudReport"
+    )
+    forticloud_report_list: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ForticloudReportList"
+    )
+    historic_daily_remote_logs: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HistoricDailyRemoteLogs"
+    )
+    hourly_disk_usage: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HourlyDiskUsage"
+    )
+    local_report: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LocalReport")
+    local_report_list: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "LocalReportList"
+    )
+    policy_archive: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "PolicyArchive"
+    )
+    stats: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Stats")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Log Monitor category
@@ -39,23 +84,6 @@ class Log:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.av_archive = AvArchive(client)
-        self.current_disk_usage = CurrentDiskUsage(client)
-        self.device = Device(client)
-        self.feature_set = FeatureSet(client)
-        self.fortianalyzer = Fortianalyzer(client)
-        self.fortianalyzer_queue = FortianalyzerQueue(client)
-        self.forticloud = Forticloud(client)
-        self.forticloud_report = ForticloudReport(client)
-        self.forticloud_report_list = ForticloudReportList(client)
-        self.historic_daily_remote_logs = HistoricDailyRemoteLogs(client)
-        self.hourly_disk_usage = HourlyDiskUsage(client)
-        self.local_report = LocalReport(client)
-        self.local_report_list = LocalReportList(client)
-        self.policy_archive = PolicyArchive(client)
-        self.stats = Stats(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
@@ -0,0 +1,152 @@
+"""FortiOS MONITOR - Log endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "av_archive": {
+        "class": "AvArchive",
+        "path": "/log/av-archive",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/log/av-archive/download",
+                "params": {"mkey": str},
+                "required": ("mkey",),
+                "methods": ("get",),
+            }
+        },
+    },
+    "current_disk_usage": {
+        "class": "CurrentDiskUsage",
+        "path": "/log/current-disk-usage",
+        "methods": ("get",),
+    },
+    "device": {
+        "class": "Device",
+        "path": "/log/device",
+        "methods": (),
+        "children": {
+            "state": {
+                "class": "State",
+                "path": "/log/device/state",
+                "params": {"scope": str},
+                "methods": ("get",),
+            }
+        },
+    },
+    "feature_set": {
+        "class": "FeatureSet",
+        "path": "/log/feature-set",
+        "methods": ("get",),
+    },
+    "fortianalyzer": {
+        "class": "Fortianalyzer",
+        "path": "/log/fortianalyzer",
+        "params": {"scope": str, "server": str, "srcip": str},
+        "methods": ("get",),
+    },
+    "fortianalyzer_queue": {
+        "class": "FortianalyzerQueue",
+        "path": "/log/fortianalyzer-queue",
+        "params": {"scope": str},
+        "methods": ("get",),
+    },
+    "forticloud": {
+        "class": "Forticloud",
+        "path": "/log/forticloud",
+        "methods": ("get",),
+        "children": {
+            "connection": {
+                "class": "Connection",
+                "path": "/log/forticloud/connection",
+                "methods": ("get",),
+            }
+        },
+    },
+    "forticloud_report": {
+        "class": "ForticloudReport",
+        "path": "/log/forticloud-report",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/log/forticloud-report/download",
+                "params": {"mkey": int, "report_name": str, "inline": int},
+                "required": ("mkey", "report_name"),
+                "methods": ("get",),
+            }
+        },
+    },
+    "forticloud_report_list": {
+        "class": "ForticloudReportList",
+        "path": "/log/forticloud-report-list",
+        "methods": ("get",),
+    },
+    "historic_daily_remote_logs": {
+        "class": "HistoricDailyRemoteLogs",
+        "path": "/log/historic-daily-remote-logs",
+        "params": {"server": str},
+        "required": ("server",),
+        "methods": ("get",),
+    },
+    "hourly_disk_usage": {
+        "class": "HourlyDiskUsage",
+        "path": "/log/hourly-disk-usage",
+        "methods": ("get",),
+    },
+    "local_report": {
+        "class": "LocalReport",
+        "path": "/log/local-report",
+        "methods": (),
+        "children": {
+            "delete": {
+                "class": "Delete",
+                "path": "/log/local-report/delete",
+                "fields": {"mkeys": list},
+                "methods": ("post",),
+            },
+            "download": {
+                "class": "Download",
+                "path": "/log/local-report/download",
+                "params": {"mkey": str, "layout": str},
+                "required": ("mkey",),
+                "methods": ("get",),
+            },
+        },
+    },
+    "local_report_list": {
+        "class": "LocalReportList",
+        "path": "/log/local-report-list",
+        "methods": ("get",),
+    },
+    "policy_archive": {
+        "class": "PolicyArchive",
+        "path": "/log/policy-archive",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/log/policy-archive/download",
+                "params": {"mkey": int, "srcip": str, "dstip": str},
+                "required": ("mkey", "srcip", "dstip"),
+                "methods": ("get",),
+            }
+        },
+    },
+    "stats": {
+        "class": "Stats",
+        "path": "/log/stats",
+        "params": {"dev": str},
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/log/stats/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,25 +3,47 @@ FortiOS Monitor - Network
 Network monitoring operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .debug_flow import DebugFlow
+
 __all__ = ["Network"]
 
-from .arp import Arp
-from .ddns import Ddns
-from .debug_flow import DebugFlow
-from .dns import Dns
-from .fortiguard import Fortiguard
-from .lldp import Lldp
-from .reverse_ip_lookup import ReverseIpLookup
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Arp": "._registry",
+        "Ddns": "._registry",
+        "DebugFlow": ".debug_flow",
+        "Dns": "._registry",
+        "Fortiguard": "._registry",
+        "Lldp": "._registry",
+        "ReverseIpLookup": "._registry",
+    },
+)
 
 
 class Network:
     """Network Monitor category class"""
 
+    arp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Arp")
+    ddns: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ddns")
+    debug_flow: LazyEndpoint[DebugFlow] = LazyEndpoint("DebugFlow")
+    dns: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Dns")
+    fortiguard: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Fortiguard")
+    lldp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Lldp")
+    reverse_ip_lookup: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ReverseIpLookup"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Network Monitor category
@@ -31,15 +53,6 @@ class Network:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.arp = Arp(client)
-        self.ddns = Ddns(client)
-        self.debug_flow = DebugFlow(client)
-        self.dns = Dns(client)
-        self.fortiguard = Fortiguard(client)
-        self.lldp = Lldp(client)
-        self.reverse_ip_lookup = ReverseIpLookup(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
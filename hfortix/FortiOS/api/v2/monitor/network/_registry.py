@@ -0,0 +1,78 @@
+"""FortiOS MONITOR - Network endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "arp": {"class": "Arp", "path": "/network/arp", "methods": ("get",)},
+    "ddns": {
+        "class": "Ddns",
+        "path": "/network/ddns",
+        "methods": (),
+        "children": {
+            "lookup": {
+                "class": "Lookup",
+                "path": "/network/ddns/lookup",
+                "params": {"domain": str},
+                "required": ("domain",),
+                "methods": ("get",),
+            },
+            "servers": {
+                "class": "Servers",
+                "path": "/network/ddns/servers",
+                "methods": ("get",),
+            },
+        },
+    },
+    "dns": {
+        "class": "Dns",
+        "path": "/network/dns",
+        "methods": (),
+        "children": {
+            "latency": {
+                "class": "Latency",
+                "path": "/network/dns/latency",
+                "methods": ("get",),
+            }
+        },
+    },
+    "fortiguard": {
+        "class": "Fortiguard",
+        "path": "/network/fortiguard",
+        "methods": (),
+        "children": {
+            "live_services_latency": {
+                "class": "LiveServicesLatency",
+                "path": "/network/fortiguard/live-services-latency",
+                "methods": ("get",),
+            }
+        },
+    },
+    "lldp": {
+        "class": "Lldp",
+        "path": "/network/lldp",
+        "methods": (),
+        "children": {
+            "neighbors": {
+                "class": "Neighbors",
+                "path": "/network/lldp/neighbors",
+                "params": {"scope": str, "port": str},
+                "methods": ("get", "iter", "aiter"),
+            },
+            "ports": {
+                "class": "Ports",
+                "path": "/network/lldp/ports",
+                "params": {"mkey": str, "scope": str},
+                "methods": ("get", "iter", "aiter"),
+            },
+        },
+    },
+    "reverse_ip_lookup": {
+        "class": "ReverseIpLookup",
+        "path": "/network/reverse-ip-lookup",
+        "params": {"ip": str},
+        "required": ("ip",),
+        "methods": ("get",),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
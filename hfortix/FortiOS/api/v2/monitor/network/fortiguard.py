@@ -1,100 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Network Fortiguard
-
-Monitoring endpoint for monitor network fortiguard data.
-
-API Endpoints:
-    GET    /monitor/network/fortiguard
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.network.fortiguard.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.network.fortiguard.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class LiveServicesLatency:
-    """
-    Liveserviceslatency Operations.
-
-    Provides read-only access for FortiOS liveserviceslatency data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize LiveServicesLatency endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def get(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Get latency information for live FortiGuard services.
-
-        Args:
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.network.fortiguard.live_services_latency.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params.update(kwargs)
-        return self._client.get(
-            "monitor",
-            "/network/fortiguard/live-services-latency",
-            params=params,
-        )
-
-
-class Fortiguard:
-    """Fortiguard operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Fortiguard endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.live_services_latency = LiveServicesLatency(client)
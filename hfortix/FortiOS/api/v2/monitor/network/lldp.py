@@ -1,154 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Network Lldp
-
-Monitoring endpoint for monitor network lldp data.
-
-API Endpoints:
-    GET    /monitor/network/lldp
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.network.lldp.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.network.lldp.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Neighbors:
-    """
-    Neighbors Operations.
-
-    Provides read-only access for FortiOS neighbors data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Neighbors endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def get(
-        self,
-        scope: str | None = None,
-        port: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        List all active LLDP neighbors.
-
-        Args:
-            scope: Scope of LLDP neighbors [*vdom|global]. (optional)
-            port: Filter: specific port name. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.network.lldp.neighbors.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        if scope is not None:
-            params["scope"] = scope
-        if port is not None:
-            params["port"] = port
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/network/lldp/neighbors", params=params
-        )
-
-
-class Ports:
-    """Ports operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Ports endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def get(
-        self,
-        mkey: str | None = None,
-        scope: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        List all active LLDP ports.
-
-        Args:
-            mkey: Filter: specific port name. (optional)
-            scope: Scope of LLDP ports [*vdom|global]. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.network.lldp.ports.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        if mkey is not None:
-            params["mkey"] = mkey
-        if scope is not None:
-            params["scope"] = scope
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/network/lldp/ports", params=params
-        )
-
-
-class Lldp:
-    """Lldp operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Lldp endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.neighbors = Neighbors(client)
-        self.ports = Ports(client)
@@ -1,85 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Network Reverse Ip Lookup
-
-Monitoring endpoint for monitor network reverse ip lookup data.
-
-API Endpoints:
-    GET    /monitor/network/reverse_ip_lookup
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.network.reverse_ip_lookup.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.network.reverse_ip_lookup.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class ReverseIpLookup:
-    """
-    Reverseiplookup Operations.
-
-    Provides read-only access for FortiOS reverseiplookup data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize ReverseIpLookup endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        ip: str,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Retrieve the resolved DNS domain name for a given IP address.
-
-        Args:
-            ip: IP address (in dot-decimal notation). (required)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.network.reverse_ip_lookup.get(ip='value')
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params["ip"] = ip
-        params.update(kwargs)
-        return self._client.get(
-            "monitor", "/network/reverse-ip-lookup", params=params
-        )
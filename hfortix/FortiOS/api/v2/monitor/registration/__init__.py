@@ -3,21 +3,36 @@ FortiOS Monitor - Registration
 Device registration operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Registration"]
 
-from .forticare import Forticare
-from .forticloud import Forticloud
-from .vdom import Vdom
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Forticare": "._registry",
+        "Forticloud": "._registry",
+        "Vdom": "._registry",
+    },
+)
 
 
 class Registration:
     """Registration Monitor category class"""
 
+    forticare: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Forticare")
+    forticloud: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Forticloud")
+    vdom: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Vdom")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Registration Monitor category
@@ -27,11 +42,6 @@ class Registration:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.forticare = Forticare(client)
-        self.forticloud = Forticloud(client)
-        self.vdom = Vdom(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["forticare", "forticloud", "vdom"]
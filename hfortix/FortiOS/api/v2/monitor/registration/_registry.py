@@ -0,0 +1,158 @@
+"""FortiOS MONITOR - Registration endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "forticare": {
+        "class": "Forticare",
+        "path": "/registration/forticare",
+        "methods": (),
+        "children": {
+            "add_license": {
+                "class": "AddLicense",
+                "path": "/registration/forticare/add-license",
+                "fields": {"registration_code": str},
+                "methods": ("post",),
+            },
+            "check_connectivity": {
+                "class": "CheckConnectivity",
+                "path": "/registration/forticare/check-connectivity",
+                "methods": ("get",),
+            },
+            "create": {
+                "class": "Create",
+                "path": "/registration/forticare/create",
+                "fields": {
+                    "email": str,
+                    "password": str,
+                    "first_name": str,
+                    "last_name": str,
+                    "title": str,
+                    "company": str,
+                    "address": str,
+                    "city": str,
+                    "country_code": int,
+                    "state": str,
+                    "state_code": str,
+                    "postal_code": str,
+                    "phone": str,
+                    "industry": str,
+                    "industry_id": int,
+                    "orgsize_id": int,
+                    "reseller_name": str,
+                    "reseller_id": int,
+                    "is_government": bool,
+                },
+                "methods": ("post",),
+            },
+            "deregister_device": {
+                "class": "DeregisterDevice",
+                "path": "/registration/forticare/deregister-device",
+                "fields": {"email": str, "password": str},
+                "methods": ("post",),
+            },
+            "login": {
+                "class": "Login",
+                "path": "/registration/forticare/login",
+                "fields": {
+                    "serial": str,
+                    "email": str,
+                    "password": str,
+                    "reseller_name": str,
+                    "reseller_id": int,
+                    "agreement_accepted": bool,
+                    "is_government": bool,
+                },
+                "methods": ("post",),
+            },
+            "transfer": {
+                "class": "Transfer",
+                "path": "/registration/forticare/transfer",
+                "fields": {
+                    "email": str,
+                    "password": str,
+                    "old_email": str,
+                    "old_password": str,
+                    "is_government": bool,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "forticloud": {
+        "class": "Forticloud",
+        "path": "/registration/forticloud",
+        "methods": (),
+        "children": {
+            "device_status": {
+                "class": "DeviceStatus",
+                "path": "/registration/forticloud/device-status",
+                "params": {"serials": list, "update_cache": bool},
+                "required": ("serials",),
+                "methods": ("get",),
+            },
+            "disclaimer": {
+                "class": "Disclaimer",
+                "path": "/registration/forticloud/disclaimer",
+                "methods": ("get",),
+            },
+            "domains": {
+                "class": "Domains",
+                "path": "/registration/forticloud/domains",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "login": {
+                "class": "Login",
+                "path": "/registration/forticloud/login",
+                "fields": {
+                    "email": str,
+                    "password": str,
+                    "send_logs": bool,
+                    "domain": str,
+                },
+                "methods": ("post",),
+            },
+            "logout": {
+                "class": "Logout",
+                "path": "/registration/forticloud/logout",
+                "methods": ("post",),
+            },
+            "migrate": {
+                "class": "Migrate",
+                "path": "/registration/forticloud/migrate",
+                "fields": {"email": str, "password": str},
+                "methods": ("post",),
+            },
+            "register_device": {
+                "class": "RegisterDevice",
+                "path": "/registration/forticloud/register-device",
+                "fields": {
+                    "serial": str,
+                    "email": str,
+                    "password": str,
+                    "reseller": str,
+                    "reseller_id": int,
+                    "country": str,
+                    "is_government": bool,
+                    "agreement_accepted": bool,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "vdom": {
+        "class": "Vdom",
+        "path": "/registration/vdom",
+        "methods": (),
+        "children": {
+            "add_license": {
+                "class": "AddLicense",
+                "path": "/registration/vdom/add-license",
+                "fields": {"license": str},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
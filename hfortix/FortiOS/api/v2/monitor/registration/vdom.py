@@ -1,102 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Registration Vdom
-
-Monitoring endpoint for monitor registration vdom data.
-
-API Endpoints:
-    GET    /monitor/registration/vdom
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.registration.vdom.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.registration.vdom.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class AddLicense:
-    """
-    Addlicense Operations.
-
-    Provides read-only access for FortiOS addlicense data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize AddLicense endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def post(
-        self,
-        license: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Add a VDOM license.
-
-        Args:
-            license: VDOM license key. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.registration.vdom.add_license.post()
-        """
-        data = payload_dict.copy() if payload_dict else {}
-        if license is not None:
-            data["license"] = license
-        data.update(kwargs)
-        return self._client.post(
-            "monitor", "/registration/vdom/add-license", data=data
-        )
-
-
-class Vdom:
-    """Vdom operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Vdom endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.add_license = AddLicense(client)
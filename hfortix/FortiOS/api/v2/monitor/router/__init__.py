@@ -3,29 +3,52 @@ FortiOS Monitor - Router
 Router monitoring and BGP/OSPF operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Router"]
 
-from .bgp import Bgp
-from .charts import Charts
-from .ipv4 import Ipv4
-from .ipv6 import Ipv6
-from .lookup import Lookup
-from .lookup_policy import LookupPolicy
-from .ospf import Ospf
-from .policy import Policy
-from .policy6 import Policy6
-from .sdwan import Sdwan
-from .statistics import Statistics
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Bgp": "._registry",
+        "Charts": "._registry",
+        "Ipv4": "._registry",
+        "Ipv6": "._registry",
+        "Lookup": "._registry",
+        "LookupPolicy": "._registry",
+        "Ospf": "._registry",
+        "Policy": "._registry",
+        "Policy6": "._registry",
+        "Sdwan": "._registry",
+        "Statistics": "._registry",
+    },
+)
 
 
 class Router:
     """Router Monitor category class"""
 
+    bgp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Bgp")
+    charts: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Charts")
+    ipv4: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ipv4")
+    ipv6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ipv6")
+    lookup: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Lookup")
+    lookup_policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LookupPolicy")
+    ospf: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ospf")
+    policy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Policy")
+    policy6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Policy6")
+    sdwan: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Sdwan")
+    statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Statistics")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Router Monitor category
@@ -35,19 +58,6 @@ class Router:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.bgp = Bgp(client)
-        self.charts = Charts(client)
-        self.ipv4 = Ipv4(client)
-        self.ipv6 = Ipv6(client)
-        self.lookup = Lookup(client)
-        self.lookup_policy = LookupPolicy(client)
-        self.ospf = Ospf(client)
-        self.policy = Policy(client)
-        self.policy6 = Policy6(client)
-        self.sdwan = Sdwan(client)
-        self.statistics = Statistics(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
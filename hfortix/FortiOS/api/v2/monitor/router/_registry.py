@@ -0,0 +1,195 @@
+"""FortiOS MONITOR - Router endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "bgp": {
+        "class": "Bgp",
+        "path": "/router/bgp",
+        "methods": (),
+        "children": {
+            "clear_soft_in": {
+                "class": "ClearSoftIn",
+                "path": "/router/bgp/clear-soft-in",
+                "methods": ("post",),
+            },
+            "clear_soft_out": {
+                "class": "ClearSoftOut",
+                "path": "/router/bgp/clear-soft-out",
+                "methods": ("post",),
+            },
+            "neighbors": {
+                "class": "Neighbors",
+                "path": "/router/bgp/neighbors",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "neighbors_statistics": {
+                "class": "NeighborsStatistics",
+                "path": "/router/bgp/neighbors-statistics",
+                "params": {"ip_version": str},
+                "methods": ("get",),
+            },
+            "neighbors6": {
+                "class": "Neighbors6",
+                "path": "/router/bgp/neighbors6",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "paths": {
+                "class": "Paths",
+                "path": "/router/bgp/paths",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "paths_statistics": {
+                "class": "PathsStatistics",
+                "path": "/router/bgp/paths-statistics",
+                "params": {"ip_version": str},
+                "methods": ("get",),
+            },
+            "paths6": {
+                "class": "Paths6",
+                "path": "/router/bgp/paths6",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "soft_reset_neighbor": {
+                "class": "SoftResetNeighbor",
+                "path": "/router/bgp/soft-reset-neighbor",
+                "fields": {"ip": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "charts": {
+        "class": "Charts",
+        "path": "/router/charts",
+        "params": {
+            "operator": str,
+            "ip_version": int,
+            "ip_mask": str,
+            "gateway": str,
+            "type": str,
+            "origin": str,
+            "interface": str,
+        },
+        "methods": ("get",),
+    },
+    "ipv4": {
+        "class": "Ipv4",
+        "path": "/router/ipv4",
+        "params": {
+            "operator": str,
+            "ip_mask": str,
+            "gateway": str,
+            "type": str,
+            "origin": str,
+            "interface": str,
+        },
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ipv6": {
+        "class": "Ipv6",
+        "path": "/router/ipv6",
+        "params": {
+            "operator": str,
+            "ip_mask": str,
+            "gateway": str,
+            "type": str,
+            "origin": str,
+            "interface": str,
+        },
+        "methods": ("get", "iter", "aiter"),
+    },
+    "lookup": {
+        "class": "Lookup",
+        "path": "/router/lookup",
+        "params": {"destination": str, "ipv6": bool},
+        "required": ("destination",),
+        "methods": ("get",),
+        "children": {
+            "ha_peer": {
+                "class": "HaPeer",
+                "path": "/router/lookup/ha-peer",
+                "params": {"serial": str, "destination": str, "ipv6": bool},
+                "required": ("serial", "destination"),
+                "methods": ("get",),
+            }
+        },
+    },
+    "lookup_policy": {
+        "class": "LookupPolicy",
+        "path": "/router/lookup-policy",
+        "params": {
+            "destination": str,
+            "ipv6": bool,
+            "source": str,
+            "destination_port": int,
+            "source_port": int,
+            "interface_name": str,
+            "protocol_number": int,
+        },
+        "required": ("destination",),
+        "methods": ("get",),
+    },
+    "ospf": {
+        "class": "Ospf",
+        "path": "/router/ospf",
+        "methods": (),
+        "children": {
+            "neighbors": {
+                "class": "Neighbors",
+                "path": "/router/ospf/neighbors",
+                "methods": ("get", "iter", "aiter"),
+            }
+        },
+    },
+    "policy": {
+        "class": "Policy",
+        "path": "/router/policy",
+        "params": {"count_only": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "policy6": {
+        "class": "Policy6",
+        "path": "/router/policy6",
+        "params": {"count_only": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "sdwan": {
+        "class": "Sdwan",
+        "path": "/router/sdwan",
+        "methods": (),
+        "children": {
+            "routes": {
+                "class": "Routes",
+                "path": "/router/sdwan/routes",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "routes_statistics": {
+                "class": "RoutesStatistics",
+                "path": "/router/sdwan/routes-statistics",
+                "params": {"ip_version": str},
+                "methods": ("get",),
+            },
+            "routes6": {
+                "class": "Routes6",
+                "path": "/router/sdwan/routes6",
+                "methods": ("get", "iter", "aiter"),
+            },
+        },
+    },
+    "statistics": {
+        "class": "Statistics",
+        "path": "/router/statistics",
+        "params": {
+            "operator": str,
+            "ip_version": int,
+            "ip_mask": str,
+            "gateway": str,
+            "type": str,
+            "origin": str,
+            "interface": str,
+        },
+        "methods": ("get",),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,19 +3,34 @@ FortiOS Monitor - Sdwan
 SD-WAN monitoring and health checks
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Sdwan"]
 
-from .link_monitor_metrics import LinkMonitorMetrics
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "LinkMonitorMetrics": "._registry",
+    },
+)
 
 
 class Sdwan:
     """Sdwan Monitor category class"""
 
+    link_monitor_metrics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "LinkMonitorMetrics"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Sdwan Monitor category
@@ -25,9 +40,6 @@ class Sdwan:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.link_monitor_metrics = LinkMonitorMetrics(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["link_monitor_metrics"]
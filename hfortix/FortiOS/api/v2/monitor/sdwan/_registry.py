@@ -0,0 +1,31 @@
+"""FortiOS MONITOR - Sdwan endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "link_monitor_metrics": {
+        "class": "LinkMonitorMetrics",
+        "path": "/sdwan/link-monitor-metrics",
+        "methods": (),
+        "children": {
+            "report": {
+                "class": "Report",
+                "path": "/sdwan/link-monitor-metrics/report",
+                "fields": {
+                    "agent_ip": str,
+                    "application_name": str,
+                    "application_id": int,
+                    "latency": str,
+                    "jitter": str,
+                    "packet_loss": str,
+                    "ntt": str,
+                    "srt": str,
+                    "application_error": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,19 +3,32 @@ FortiOS Monitor - Service
 Service monitoring operations
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Service"]
 
-from .ldap import Ldap
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Ldap": "._registry",
+    },
+)
 
 
 class Service:
     """Service Monitor category class"""
 
+    ldap: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ldap")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Service Monitor category
@@ -25,9 +38,6 @@ class Service:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.ldap = Ldap(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["ldap"]
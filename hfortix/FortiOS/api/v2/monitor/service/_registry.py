@@ -0,0 +1,27 @@
+"""FortiOS MONITOR - Service endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "ldap": {
+        "class": "Ldap",
+        "path": "/service/ldap",
+        "methods": (),
+        "children": {
+            "query": {
+                "class": "Query",
+                "path": "/service/ldap/query",
+                "params": {
+                    "mkey": str,
+                    "server_info_only": bool,
+                    "skip_schema": bool,
+                    "ldap_filter": str,
+                    "ldap": str,
+                },
+                "methods": ("get",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
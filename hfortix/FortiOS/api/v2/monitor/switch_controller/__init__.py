@@ -3,27 +3,58 @@ FortiOS Monitor - Switch Controller
 FortiSwitch controller monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["SwitchController"]
 
-from .detected_device import DetectedDevice
-from .fsw_firmware import FswFirmware
-from .isl_lockdown import IslLockdown
-from .known_nac_device_criteria_list import KnownNacDeviceCriteriaList
-from .managed_switch import ManagedSwitch
-from .matched_devices import MatchedDevices
-from .mclag_icl import MclagIcl
-from .nac_device import NacDevice
-from .recommendation import Recommendation
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "DetectedDevice": "._registry",
+        "FswFirmware": "._registry",
+        "IslLockdown": "._registry",
+        "KnownNacDeviceCriteriaList": "._registry",
+        "ManagedSwitch": "._registry",
+        "MatchedDevices": "._registry",
+        "MclagIcl": "._registry",
+        "NacDevice": "._registry",
+        "Recommendation": "._registry",
+    },
+)
 
 
 class SwitchController:
     """SwitchController Monitor category class"""
 
+    detected_device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "DetectedDevice"
+    )
+    fsw_firmware: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("FswFirmware")
+    isl_lockdown: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("IslLockdown")
+    known_nac_device_criteria_list: LazyEndpoint[MonitorEndpoint] = (
+        LazyEndpoint("KnownNacDeviceCriteriaList")
+    )
+    managed_switch: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ManagedSwitch"
+    )
+    matched_devices: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MatchedDevices"
+    )
+    mclag_icl: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("MclagIcl")
+    nac_device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("NacDevice")
+    recommendation: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "Recommendation"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize SwitchController Monitor category
@@ -33,19 +64,6 @@ class SwitchController:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.detected_device = DetectedDevice(client)
-        self.fsw_firmware = FswFirmware(client)
-        self.isl_lockdown = IslLockdown(client)
-        self.known_nac_device_criteria_list = KnownNacDeviceCriteriaList(
-            client
-        )
-        self.managed_switch = ManagedSwitch(client)
-        self.matched_devices = MatchedDevices(client)
-        self.mclag_icl = MclagIcl(client)
-        self.nac_device = NacDevice(client)
-        self.recommendation = Recommendation(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
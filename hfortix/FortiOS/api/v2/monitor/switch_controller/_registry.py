@@ -0,0 +1,259 @@
+"""FortiOS MONITOR - Switch Controller endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "detected_device": {
+        "class": "DetectedDevice",
+        "path": "/switch-controller/detected-device",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "fsw_firmware": {
+        "class": "FswFirmware",
+        "path": "/switch-controller/fsw-firmware",
+        "params": {"mkey": str, "timeout": int, "version": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/switch-controller/fsw-firmware/download",
+                "fields": {"image_id": str},
+                "methods": ("post",),
+            },
+            "push": {
+                "class": "Push",
+                "path": "/switch-controller/fsw-firmware/push",
+                "fields": {"switch_id": str, "image_id": str},
+                "methods": ("post",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/switch-controller/fsw-firmware/upload",
+                "fields": {"switch_ids": str, "file_content": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "isl_lockdown": {
+        "class": "IslLockdown",
+        "path": "/switch-controller/isl-lockdown",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/switch-controller/isl-lockdown/status",
+                "params": {"fortilink": str},
+                "required": ("fortilink",),
+                "methods": ("get",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/switch-controller/isl-lockdown/update",
+                "fields": {"fortilink": str, "status": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "known_nac_device_criteria_list": {
+        "class": "KnownNacDeviceCriteriaList",
+        "path": "/switch-controller/known-nac-device-criteria-list",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "managed_switch": {
+        "class": "ManagedSwitch",
+        "path": "/switch-controller/managed-switch",
+        "methods": (),
+        "children": {
+            "bios": {
+                "class": "Bios",
+                "path": "/switch-controller/managed-switch/bios",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            },
+            "bounce_port": {
+                "class": "BouncePort",
+                "path": "/switch-controller/managed-switch/bounce-port",
+                "fields": {
+                    "mkey": str,
+                    "port": str,
+                    "duration": int,
+                    "stop": bool,
+                },
+                "methods": ("post",),
+            },
+            "cable_status": {
+                "class": "CableStatus",
+                "path": "/switch-controller/managed-switch/cable-status",
+                "params": {"mkey": str, "port": str},
+                "required": ("mkey", "port"),
+                "methods": ("get",),
+            },
+            "dhcp_snooping": {
+                "class": "DhcpSnooping",
+                "path": "/switch-controller/managed-switch/dhcp-snooping",
+                "methods": ("get",),
+            },
+            "faceplate_xml": {
+                "class": "FaceplateXml",
+                "path": "/switch-controller/managed-switch/faceplate-xml",
+                "params": {"mkey": str},
+                "required": ("mkey",),
+                "methods": ("get",),
+            },
+            "factory_reset": {
+                "class": "FactoryReset",
+                "path": "/switch-controller/managed-switch/factory-reset",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            },
+            "health_status": {
+                "class": "HealthStatus",
+                "path": "/switch-controller/managed-switch/health-status",
+                "params": {"mkey": str, "serial": str},
+                "methods": ("get",),
+            },
+            "models": {
+                "class": "Models",
+                "path": "/switch-controller/managed-switch/models",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "poe_reset": {
+                "class": "PoeReset",
+                "path": "/switch-controller/managed-switch/poe-reset",
+                "fields": {"mkey": str, "port": str},
+                "methods": ("post",),
+            },
+            "port_health": {
+                "class": "PortHealth",
+                "path": "/switch-controller/managed-switch/port-health",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            },
+            "port_stats": {
+                "class": "PortStats",
+                "path": "/switch-controller/managed-switch/port-stats",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            },
+            "port_stats_reset": {
+                "class": "PortStatsReset",
+                "path": "/switch-controller/managed-switch/port-stats-reset",
+                "fields": {"mkey": str, "ports": list},
+                "methods": ("post",),
+            },
+            "restart": {
+                "class": "Restart",
+                "path": "/switch-controller/managed-switch/restart",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            },
+            "status": {
+                "class": "Status",
+                "path": "/switch-controller/managed-switch/status",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            },
+            "transceivers": {
+                "class": "Transceivers",
+                "path": "/switch-controller/managed-switch/transceivers",
+                "methods": ("get",),
+            },
+            "tx_rx": {
+                "class": "TxRx",
+                "path": "/switch-controller/managed-switch/tx-rx",
+                "params": {"mkey": str, "port": str},
+                "required": ("mkey", "port"),
+                "methods": ("get",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/switch-controller/managed-switch/update",
+                "fields": {"mkey": str, "admin": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "matched_devices": {
+        "class": "MatchedDevices",
+        "path": "/switch-controller/matched-devices",
+        "params": {"mkey": str, "include_dynamic": bool, "mac": str},
+        "methods": ("get",),
+    },
+    "mclag_icl": {
+        "class": "MclagIcl",
+        "path": "/switch-controller/mclag-icl",
+        "methods": (),
+        "children": {
+            "eligible_peer": {
+                "class": "EligiblePeer",
+                "path": "/switch-controller/mclag-icl/eligible-peer",
+                "params": {"fortilink": str},
+                "required": ("fortilink",),
+                "methods": ("get",),
+            },
+            "set_tier_plus": {
+                "class": "SetTierPlus",
+                "path": "/switch-controller/mclag-icl/set-tier-plus",
+                "fields": {
+                    "fortilink": str,
+                    "parent_peer1": str,
+                    "parent_peer2": str,
+                    "peer1": str,
+                    "peer2": str,
+                    "isl_port_group": str,
+                },
+                "methods": ("post",),
+            },
+            "set_tier1": {
+                "class": "SetTier1",
+                "path": "/switch-controller/mclag-icl/set-tier1",
+                "fields": {"fortilink": str, "peer1": str, "peer2": str},
+                "methods": ("post",),
+            },
+            "tier_plus_candidates": {
+                "class": "TierPlusCandidates",
+                "path": "/switch-controller/mclag-icl/tier-plus-candidates",
+                "params": {
+                    "fortilink": str,
+                    "parent_peer1": str,
+                    "parent_peer2": str,
+                    "is_tier2": bool,
+                },
+                "required": (
+                    "fortilink",
+                    "parent_peer1",
+                    "parent_peer2",
+                    "is_tier2",
+                ),
+                "methods": ("get",),
+            },
+        },
+    },
+    "nac_device": {
+        "class": "NacDevice",
+        "path": "/switch-controller/nac-device",
+        "methods": (),
+        "children": {
+            "stats": {
+                "class": "Stats",
+                "path": "/switch-controller/nac-device/stats",
+                "methods": ("get",),
+            }
+        },
+    },
+    "recommendation": {
+        "class": "Recommendation",
+        "path": "/switch-controller/recommendation",
+        "methods": (),
+        "children": {
+            "pse_config": {
+                "class": "PseConfig",
+                "path": "/switch-controller/recommendation/pse-config",
+                "fields": {"fortilink": str},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
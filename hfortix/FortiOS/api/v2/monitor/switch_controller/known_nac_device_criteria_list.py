@@ -1,88 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Switch Controller Known Nac Device Criteria List
-
-Monitoring endpoint for monitor switch controller known nac device criteria
-list data.
-
-API Endpoints:
-    GET    /monitor/switch_controller/known_nac_device_criteria_list
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data =
-    fgt.api.monitor.switch_controller.known_nac_device_criteria_list.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data =
-    fgt.api.monitor.switch_controller.known_nac_device_criteria_list.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class KnownNacDeviceCriteriaList:
-    """
-    Knownnacdevicecriterialist Operations.
-
-    Provides read-only access for FortiOS knownnacdevicecriterialist data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize KnownNacDeviceCriteriaList endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-    def get(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Retrieve a list of commonly configured NAC devices.
-
-        Args:
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>>
-            fgt.api.monitor.switch_controller.known_nac_device_criteria_list.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        params.update(kwargs)
-        return self._client.get(
-            "monitor",
-            "/switch-controller/known-nac-device-criteria-list",
-            params=params,
-        )
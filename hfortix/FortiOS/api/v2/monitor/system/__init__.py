@@ -3,99 +3,251 @@ FortiOS Monitor - System
 System monitoring, status, and diagnostics
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .config import Config
+
 __all__ = ["System"]
 
-from .acme_certificate_status import AcmeCertificateStatus
-from .acquired_dns import AcquiredDns
-from .admin import Admin
-from .api_user import ApiUser
-from .automation_action import AutomationAction
-from .automation_stitch import AutomationStitch
-from .available_certificates import AvailableCertificates
-from .available_interfaces import AvailableInterfaces
-from .botnet import Botnet
-from .botnet_domains import BotnetDomains
-from .central_management import CentralManagement
-from .certificate import Certificate
-from .change_password import ChangePassword
-from .check_port_availability import CheckPortAvailability
-from .cluster import Cluster
-from .com_log import ComLog
-from .config import Config
-from .config_error_log import ConfigErrorLog
-from .config_revision import ConfigRevision
-from .config_script import ConfigScript
-from .config_sync import ConfigSync
-from .crash_log import CrashLog
-from .csf import Csf
-from .current_admins import CurrentAdmins
-from .debug import Debug
-from .dhcp import Dhcp
-from .dhcp6 import Dhcp6
-from .disconnect_admins import DisconnectAdmins
-from .external_resource import ExternalResource
-from .firmware import Firmware
-from .fortiguard import Fortiguard
-from .fortimanager import Fortimanager
-from .fsck import Fsck
-from .global_resources import GlobalResources
-from .global_search import GlobalSearch
-from .ha_backup_hb_used import HaBackupHbUsed
-from .ha_checksums import HaChecksums
-from .ha_history import HaHistory
-from .ha_hw_interface import HaHwInterface
-from .ha_nonsync_checksums import HaNonsyncChecksums
-from .ha_peer import HaPeer
-from .ha_statistics import HaStatistics
-from .ha_table_checksums import HaTableChecksums
-from .hscalefw_license import HscalefwLicense
-from .interface import Interface
-from .interface_connected_admins_info import InterfaceConnectedAdminsInfo
-from .ipam import Ipam
-from .ipconf import Ipconf
-from .link_monitor import LinkMonitor
-from .logdisk import Logdisk
-from .lte_modem import LteModem
-from .modem import Modem
-from .modem_3g import Modem3g
-from .modem_5g import Modem5g
-from .monitor_sensor import MonitorSensor
-from .ntp import Ntp
-from .object import Object
-from .os import Os
-from .password_policy_conform import PasswordPolicyConform
-from .performance import Performance
-from .private_data_encryption import PrivateDataEncryption
-from .process import Process
-from .resolve_fqdn import ResolveFqdn
-from .resource import Resource
-from .running_processes import RunningProcesses
-from .sandbox import Sandbox
-from .sdn_connector import SdnConnector
-from .sensor_info import SensorInfo
-from .status import Status
-from .storage import Storage
-from .time import Time
-from .timezone import Timezone
-from .traffic_history import TrafficHistory
-from .trusted_cert_authorities import TrustedCertAuthorities
-from .upgrade_report import UpgradeReport
-from .usb_device import UsbDevice
-from .usb_log import UsbLog
-from .vdom_link import VdomLink
-from .vdom_resource import VdomResource
-from .vm_information import VmInformation
-from .vmlicense import Vmlicense
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "AcmeCertificateStatus": "._registry",
+        "AcquiredDns": "._registry",
+        "Admin": "._registry",
+        "ApiUser": "._registry",
+        "AutomationAction": "._registry",
+        "AutomationStitch": "._registry",
+        "AvailableCertificates": "._registry",
+        "AvailableInterfaces": "._registry",
+        "Botnet": "._registry",
+        "BotnetDomains": "._registry",
+        "CentralManagement": "._registry",
+        "Certificate": "._registry",
+        "ChangePassword": "._registry",
+        "CheckPortAvailability": "._registry",
+        "Cluster": "._registry",
+        "ComLog": "._registry",
+        "Config": ".config",
+        "ConfigErrorLog": "._registry",
+        "ConfigRevision": "._registry",
+        "ConfigScript": "._registry",
+        "ConfigSync": "._registry",
+        "CrashLog": "._registry",
+        "Csf": "._registry",
+        "CurrentAdmins": "._registry",
+        "Debug": "._registry",
+        "Dhcp": "._registry",
+        "Dhcp6": "._registry",
+        "DisconnectAdmins": "._registry",
+        "ExternalResource": "._registry",
+        "Firmware": "._registry",
+        "Fortiguard": "._registry",
+        "Fortimanager": "._registry",
+        "Fsck": "._registry",
+        "GlobalResources": "._registry",
+        "GlobalSearch": "._registry",
+        "HaBackupHbUsed": "._registry",
+        "HaChecksums": "._registry",
+        "HaHistory": "._registry",
+        "HaHwInterface": "._registry",
+        "HaNonsyncChecksums": "._registry",
+        "HaPeer": "._registry",
+        "HaStatistics": "._registry",
+        "HaTableChecksums": "._registry",
+        "HscalefwLicense": "._registry",
+        "Interface": "._registry",
+        "InterfaceConnectedAdminsInfo": "._registry",
+        "Ipam": "._registry",
+        "Ipconf": "._registry",
+        "LinkMonitor": "._registry",
+        "Logdisk": "._registry",
+        "LteModem": "._registry",
+        "Modem": "._registry",
+        "Modem3g": "._registry",
+        "Modem5g": "._registry",
+        "MonitorSensor": "._registry",
+        "Ntp": "._registry",
+        "Object": "._registry",
+        "Os": "._registry",
+        "PasswordPolicyConform": "._registry",
+        "Performance": "._registry",
+        "PrivateDataEncryption": "._registry",
+        "Process": "._registry",
+        "ResolveFqdn": "._registry",
+        "Resource": "._registry",
+        "RunningProcesses": "._registry",
+        "Sandbox": "._registry",
+        "SdnConnector": "._registry",
+        "SensorInfo": "._registry",
+        "Status": "._registry",
+        "Storage": "._registry",
+        "Time": "._registry",
+        "Timezone": "._registry",
+        "TrafficHistory": "._registry",
+        "TrustedCertAuthorities": "._registry",
+        "UpgradeReport": "._registry",
+        "UsbDevice": "._registry",
+        "UsbLog": "._registry",
+        "VdomLink": "._registry",
+        "VdomResource": "._registry",
+        "VmInformation": "._registry",
+        "Vmlicense": "._registry",
+    },
+)
 
 
 class System:
     """System Monitor category class"""
 
+    modem_3g: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Modem3g")
+    modem_5g: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Modem5g")
+    acme_certificate_status: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AcmeCertificateStatus"
+    )
+    acquired_dns: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("AcquiredDns")
+    admin: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Admin")
+    api_user: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ApiUser")
+    automation_action: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AutomationAction"
+    )
+    automation_stitch: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AutomationStitch"
+    )
+    available_certificates: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AvailableCertificates"
+    )
+    available_interfaces: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "AvailableInterfaces"
+    )
+    botnet: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Botnet")
+    botnet_domains: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "BotnetDomains"
+    )
+    central_management: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CentralManagement"
+    )
+    certificate: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Certificate")
+    change_password: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ChangePassword"
+    )
+    check_port_availability: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CheckPortAvailability"
+    )
+    cluster: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Cluster")
+    com_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ComLog")
+    config: LazyEndpoint[Config] = LazyEndpoint("Config")
+    config_error_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ConfigErrorLog"
+    )
+    config_revision: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ConfigRevision"
+    )
+    config_script: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ConfigScript")
+    config_sync: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ConfigSync")
+    crash_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("CrashLog")
+    csf: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Csf")
+    current_admins: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CurrentAdmins"
+    )
+    debug: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Debug")
+    dhcp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Dhcp")
+    dhcp6: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Dhcp6")
+    disconnect_admins: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "DisconnectAdmins"
+    )
+    external_resource: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ExternalResource"
+    )
+    firmware: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Firmware")
+    fortiguard: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Fortiguard")
+    fortimanager: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Fortimanager")
+    fsck: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Fsck")
+    global_resources: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "GlobalResources"
+    )
+    global_search: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("GlobalSearch")
+    ha_backup_hb_used: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HaBackupHbUsed"
+    )
+    ha_checksums: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("HaChecksums")
+    ha_history: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("HaHistory")
+    ha_hw_interface: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HaHwInterface"
+    )
+    ha_nonsync_checksums: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HaNonsyncChecksums"
+    )
+    ha_peer: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("HaPeer")
+    ha_statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("HaStatistics")
+    ha_table_checksums: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HaTableChecksums"
+    )
+    hscalefw_license: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "HscalefwLicense"
+    )
+    interface: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Interface")
+    interface_connected_admins_info: LazyEndpoint[MonitorEndpoint] = (
+        LazyEndpoint("InterfaceConnectedAdminsInfo")
+    )
+    ipam: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ipam")
+    ipconf: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ipconf")
+    link_monitor: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LinkMonitor")
+    logdisk: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Logdisk")
+    lte_modem: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("LteModem")
+    modem: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Modem")
+    monitor_sensor: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MonitorSensor"
+    )
+    ntp: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ntp")
+    object: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Object")
+    os: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Os")
+    password_policy_conform: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "PasswordPolicyConform"
+    )
+    performance: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Performance")
+    private_data_encryption: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "PrivateDataEncryption"
+    )
+    process: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Process")
+    resolve_fqdn: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ResolveFqdn")
+    resource: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Resource")
+    running_processes: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "RunningProcesses"
+    )
+    sandbox: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Sandbox")
+    sdn_connector: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("SdnConnector")
+    sensor_info: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("SensorInfo")
+    status: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Status")
+    storage: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Storage")
+    time: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Time")
+    timezone: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Timezone")
+    traffic_history: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "TrafficHistory"
+    )
+    trusted_cert_authorities: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "TrustedCertAuthorities"
+    )
+    upgrade_report: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "UpgradeReport"
+    )
+    usb_device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("UsbDevice")
+    usb_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("UsbLog")
+    vdom_link: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("VdomLink")
+    vdom_resource: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("VdomResource")
+    vm_information: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "VmInformation"
+    )
+    vmlicense: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Vmlicense")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize System Monitor category
@@ -105,91 +257,6 @@ class System:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.modem_3g = Modem3g(client)
-        self.modem_5g = Modem5g(client)
-        self.acme_certificate_status = AcmeCertificateStatus(client)
-        self.acquired_dns = AcquiredDns(client)
-        self.admin = Admin(client)
-        self.api_user = ApiUser(client)
-        self.automation_action = AutomationAction(client)
-        self.automation_stitch = AutomationStitch(client)
-        self.available_certificates = AvailableCertificates(client)
-        self.available_interfaces = AvailableInterfaces(client)
-        self.botnet = Botnet(client)
-        self.botnet_domains = BotnetDomains(client)
-        self.central_management = CentralManagement(client)
-        self.certificate = Certificate(client)
-        self.change_password = ChangePassword(client)
-        self.check_port_availability = CheckPortAvailability(client)
-        self.cluster = Cluster(client)
-        self.com_log = ComLog(client)
-        self.config = Config(client)
-        self.config_error_log = ConfigErrorLog(client)
-        self.config_revision = ConfigRevision(client)
-        self.config_script = ConfigScript(client)
-        self.config_sync = ConfigSync(client)
-        self.crash_log = CrashLog(client)
-        self.csf = Csf(client)
-        self.current_admins = CurrentAdmins(client)
-        self.debug = Debug(client)
-        self.dhcp = Dhcp(client)
-        self.dhcp6 = Dhcp6(client)
-        self.disconnect_admins = DisconnectAdmins(client)
-        self.external_resource = ExternalResource(client)
-        self.firmware = Firmware(client)
-        self.fortiguard = Fortiguard(client)
-        self.fortimanager = Fortimanager(client)
-        self.fsck = Fsck(client)
-        self.global_resources = GlobalResources(client)
-        self.global_search = GlobalSearch(client)
-        self.ha_backup_hb_used = HaBackupHbUsed(client)
-        self.ha_checksums = HaChecksums(client)
-        self.ha_history = HaHistory(client)
-        self.ha_hw_interface = HaHwInterface(client)
-        self.ha_nonsync_checksums = HaNonsyncChecksums(client)
-        self.ha_peer = HaPeer(client)
-        self.ha_statistics = HaStatistics(client)
-        self.ha_table_checksums = HaTableChecksums(client)
-        self.hscalefw_license = HscalefwLicense(client)
-        self.interface = Interface(client)
-        self.interface_connected_admins_info = InterfaceConnectedAdminsInfo(
-            client
-        )
-        self.ipam = Ipam(client)
-        self.ipconf = Ipconf(client)
-        self.link_monitor = LinkMonitor(client)
-        self.logdisk = Logdisk(client)
-        self.lte_modem = LteModem(client)
-        self.modem = Modem(client)
-        self.monitor_sensor = MonitorSensor(client)
-        self.ntp = Ntp(client)
-        self.object = Object(client)
-        self.os = Os(client)
-        self.password_policy_conform = PasswordPolicyConform(client)
-        self.performance = Performance(client)
-        self.private_data_encryption = PrivateDataEncryption(client)
-        self.process = Process(client)
-        self.resolve_fqdn = ResolveFqdn(client)
-        self.resource = Resource(client)
-        self.running_processes = RunningProcesses(client)
-        self.sandbox = Sandbox(client)
-        self.sdn_connector = SdnConnector(client)
-        self.sensor_info = SensorInfo(client)
-        self.status = Status(client)
-        self.storage = Storage(client)
-        self.time = Time(client)
-        self.timezone = Timezone(client)
-        self.traffic_history = TrafficHistory(client)
-        self.trusted_cert_authorities = TrustedCertAuthorities(client)
-        self.upgrade_report = UpgradeReport(client)
-        self.usb_device = UsbDevice(client)
-        self.usb_log = UsbLog(client)
-        self.vdom_link = VdomLink(client)
-        self.vdom_resource = VdomResource(client)
-        self.vm_information = VmInformation(client)
-        self.vmlicense = Vmlicense(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
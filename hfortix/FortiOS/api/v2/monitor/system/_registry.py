@@ -0,0 +1,1237 @@
+"""FortiOS MONITOR - System endpoint registry"""
+
+from typing import Any
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "acme_certificate_status": {
+        "class": "AcmeCertificateStatus",
+        "path": "/system/acme-certificate-status",
+        "params": {"mkey": str, "scope": str},
+        "required": ("mkey",),
+        "methods": ("get",),
+    },
+    "acquired_dns": {
+        "class": "AcquiredDns",
+        "path": "/system/acquired-dns",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "admin": {
+        "class": "Admin",
+        "path": "/system/admin",
+        "methods": (),
+        "children": {
+            "change_vdom_mode": {
+                "class": "ChangeVdomMode",
+                "path": "/system/admin/change-vdom-mode",
+                "fields": {"vdom-mode": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "api_user": {
+        "class": "ApiUser",
+        "path": "/system/api-user",
+        "methods": (),
+        "children": {
+            "generate_key": {
+                "class": "GenerateKey",
+                "path": "/system/api-user/generate-key",
+                "fields": {"api-user": str, "expiry": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "automation_action": {
+        "class": "AutomationAction",
+        "path": "/system/automation-action",
+        "methods": (),
+        "children": {
+            "stats": {
+                "class": "Stats",
+                "path": "/system/automation-action/stats",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            }
+        },
+    },
+    "automation_stitch": {
+        "class": "AutomationStitch",
+        "path": "/system/automation-stitch",
+        "methods": (),
+        "children": {
+            "stats": {
+                "class": "Stats",
+                "path": "/system/automation-stitch/stats",
+                "params": {"mkey": str},
+                "methods": ("get",),
+            },
+            "test": {
+                "class": "Test",
+                "path": "/system/automation-stitch/test",
+                "fields": {"mkey": str, "log": str},
+                "methods": ("post",),
+            },
+            "webhook": {
+                "class": "Webhook",
+                "path": "/system/automation-stitch/webhook",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "available_certificates": {
+        "class": "AvailableCertificates",
+        "path": "/system/available-certificates",
+        "params": {
+            "scope": str,
+            "with_remote": bool,
+            "with_ca": bool,
+            "with_crl": bool,
+            "mkey": str,
+            "find_all_references": bool,
+        },
+        "methods": ("get",),
+    },
+    "available_interfaces": {
+        "class": "AvailableInterfaces",
+        "path": "/system/available-interfaces",
+        "params": {
+            "mkey": str,
+            "include_ha": bool,
+            "view_type": str,
+            "scope": str,
+        },
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "meta": {
+                "class": "Meta",
+                "path": "/system/available-interfaces/meta",
+                "params": {"scope": str, "include_ha": bool},
+                "methods": ("get",),
+            }
+        },
+    },
+    "botnet": {
+        "class": "Botnet",
+        "path": "/system/botnet",
+        "params": {"include_hit_only": bool},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "stat": {
+                "class": "Stat",
+                "path": "/system/botnet/stat",
+                "methods": ("get",),
+            }
+        },
+    },
+    "botnet_domains": {
+        "class": "BotnetDomains",
+        "path": "/system/botnet-domains",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "hits": {
+                "class": "Hits",
+                "path": "/system/botnet-domains/hits",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "stat": {
+                "class": "Stat",
+                "path": "/system/botnet-domains/stat",
+                "methods": ("get", "iter", "aiter"),
+            },
+        },
+    },
+    "central_management": {
+        "class": "CentralManagement",
+        "path": "/system/central-management",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/central-management/status",
+                "params": {"skip_detect": bool},
+                "methods": ("get",),
+            }
+        },
+    },
+    "certificate": {
+        "class": "Certificate",
+        "path": "/system/certificate",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/system/certificate/download",
+                "params": {"mkey": str, "type": str, "scope": str},
+                "required": ("mkey", "type"),
+                "methods": ("get",),
+            },
+            "read_info": {
+                "class": "ReadInfo",
+                "path": "/system/certificate/read-info",
+                "fields": {"value": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "change_password": {
+        "class": "ChangePassword",
+        "path": "/system/change-password",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/system/change-password/select",
+                "fields": {
+                    "mkey": str,
+                    "old_password": str,
+                    "new_password": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "check_port_availability": {
+        "class": "CheckPortAvailability",
+        "path": "/system/check-port-availability",
+        "params": {"port_ranges": list, "service": str},
+        "required": ("port_ranges",),
+        "methods": ("get",),
+    },
+    "cluster": {
+        "class": "Cluster",
+        "path": "/system/cluster",
+        "methods": (),
+        "children": {
+            "state": {
+                "class": "State",
+                "path": "/system/cluster/state",
+                "methods": ("get",),
+            }
+        },
+    },
+    "com_log": {
+        "class": "ComLog",
+        "path": "/system/com-log",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/system/com-log/download",
+                "methods": ("get",),
+            },
+            "dump": {
+                "class": "Dump",
+                "path": "/system/com-log/dump",
+                "methods": ("post",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/system/com-log/update",
+                "methods": ("get",),
+            },
+        },
+    },
+    "config_error_log": {
+        "class": "ConfigErrorLog",
+        "path": "/system/config-error-log",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/system/config-error-log/download",
+                "methods": ("get",),
+            }
+        },
+    },
+    "config_revision": {
+        "class": "ConfigRevision",
+        "path": "/system/config-revision",
+        "methods": ("get",),
+        "children": {
+            "delete": {
+                "class": "Delete",
+                "path": "/system/config-revision/delete",
+                "fields": {"config_ids": list},
+                "methods": ("post",),
+            },
+            "file": {
+                "class": "File",
+                "path": "/system/config-revision/file",
+                "params": {"config_id": int},
+                "methods": ("get",),
+            },
+            "info": {
+                "class": "Info",
+                "path": "/system/config-revision/info",
+                "params": {"config_id": int},
+                "methods": ("get",),
+            },
+            "save": {
+                "class": "Save",
+                "path": "/system/config-revision/save",
+                "fields": {"comments": str},
+                "methods": ("post",),
+            },
+            "update_comments": {
+                "class": "UpdateComments",
+                "path": "/system/config-revision/update-comments",
+                "fields": {"config_id": int, "comments": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "config_script": {
+        "class": "ConfigScript",
+        "path": "/system/config-script",
+        "methods": ("get",),
+        "children": {
+            "delete": {
+                "class": "Delete",
+                "path": "/system/config-script/delete",
+                "fields": {"id_list": list},
+                "methods": ("post",),
+            },
+            "run": {
+                "class": "Run",
+                "path": "/system/config-script/run",
+                "fields": {"remote_script": str},
+                "methods": ("post",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/system/config-script/upload",
+                "fields": {"filename": str, "file_content": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "config_sync": {
+        "class": "ConfigSync",
+        "path": "/system/config-sync",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/config-sync/status",
+                "methods": ("get",),
+            }
+        },
+    },
+    "crash_log": {
+        "class": "CrashLog",
+        "path": "/system/crash-log",
+        "methods": (),
+        "children": {
+            "clear": {
+                "class": "Clear",
+                "path": "/system/crash-log/clear",
+                "methods": ("post",),
+            },
+            "download": {
+                "class": "Download",
+                "path": "/system/crash-log/download",
+                "methods": ("get",),
+            },
+        },
+    },
+    "csf": {
+        "class": "Csf",
+        "path": "/system/csf",
+        "params": {"scope": str, "all_vdoms": bool},
+        "methods": ("get",),
+        "children": {
+            "pending_authorizations": {
+                "class": "PendingAuthorizations",
+                "path": "/system/csf/pending-authorizations",
+                "methods": ("get",),
+            },
+            "register_appliance": {
+                "class": "RegisterAppliance",
+                "path": "/system/csf/register-appliance",
+                "fields": {
+                    "type": str,
+                    "mgmt_ip": str,
+                    "mgmt_port": int,
+                    "mgmt_url_parameters": list,
+                    "serial": str,
+                    "hostname": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "current_admins": {
+        "class": "CurrentAdmins",
+        "path": "/system/current-admins",
+        "methods": ("get",),
+    },
+    "debug": {
+        "class": "Debug",
+        "path": "/system/debug",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/system/debug/download",
+                "methods": ("get",),
+            }
+        },
+    },
+    "dhcp": {
+        "class": "Dhcp",
+        "path": "/system/dhcp",
+        "params": {"scope": str, "ipv6": bool, "interface": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "revoke": {
+                "class": "Revoke",
+                "path": "/system/dhcp/revoke",
+                "fields": {"ip": list},
+                "methods": ("post",),
+            }
+        },
+    },
+    "dhcp6": {
+        "class": "Dhcp6",
+        "path": "/system/dhcp6",
+        "methods": (),
+        "children": {
+            "revoke": {
+                "class": "Revoke",
+                "path": "/system/dhcp6/revoke",
+                "fields": {"ip": list},
+                "methods": ("post",),
+            }
+        },
+    },
+    "disconnect_admins": {
+        "class": "DisconnectAdmins",
+        "path": "/system/disconnect-admins",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/system/disconnect-admins/select",
+                "fields": {"id": int, "method": str, "admins": list},
+                "methods": ("post",),
+            }
+        },
+    },
+    "external_resource": {
+        "class": "ExternalResource",
+        "path": "/system/external-resource",
+        "methods": (),
+        "children": {
+            "dynamic": {
+                "class": "Dynamic",
+                "path": "/system/external-resource/dynamic",
+                "fields": {"commands": list},
+                "methods": ("post",),
+            },
+            "entry_list": {
+                "class": "EntryList",
+                "path": "/system/external-resource/entry-list",
+                "params": {
+                    "mkey": str,
+                    "status_only": bool,
+                    "include_notes": bool,
+                    "counts_only": bool,
+                    "entry": str,
+                },
+                "required": ("mkey",),
+                "methods": ("get",),
+            },
+            "generic_address": {
+                "class": "GenericAddress",
+                "path": "/system/external-resource/generic-address",
+                "fields": {"mkey": str, "data": str},
+                "methods": ("post",),
+            },
+            "refresh": {
+                "class": "Refresh",
+                "path": "/system/external-resource/refresh",
+                "fields": {
+                    "mkey": str,
+                    "check_status_only": bool,
+                    "last_connection_time": int,
+                },
+                "methods": ("post",),
+            },
+            "validate_jsonpath": {
+                "class": "ValidateJsonpath",
+                "path": "/system/external-resource/validate-jsonpath",
+                "params": {"path_name": str},
+                "required": ("path_name",),
+                "methods": ("get",),
+            },
+        },
+    },
+    "firmware": {
+        "class": "Firmware",
+        "path": "/system/firmware",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "upgrade": {
+                "class": "Upgrade",
+                "path": "/system/firmware/upgrade",
+                "fields": {
+                    "source": str,
+                    "url": str,
+                    "passphrase": str,
+                    "force": bool,
+                    "filename": str,
+                    "format_partition": bool,
+                    "ignore_invalid_signature": bool,
+                    "file_id": str,
+                    "ignore_admin_lockout_upon_downgrade": bool,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            },
+            "upgrade_paths": {
+                "class": "UpgradePaths",
+                "path": "/system/firmware/upgrade-paths",
+                "methods": ("get", "iter", "aiter"),
+            },
+        },
+    },
+    "fortiguard": {
+        "class": "Fortiguard",
+        "path": "/system/fortiguard",
+        "methods": (),
+        "children": {
+            "clear_statistics": {
+                "class": "ClearStatistics",
+                "path": "/system/fortiguard/clear-statistics",
+                "methods": ("post",),
+            },
+            "manual_update": {
+                "class": "ManualUpdate",
+                "path": "/system/fortiguard/manual-update",
+                "fields": {"file_content": str},
+                "methods": ("post",),
+            },
+            "server_info": {
+                "class": "ServerInfo",
+                "path": "/system/fortiguard/server-info",
+                "methods": ("get",),
+            },
+            "test_availability": {
+                "class": "TestAvailability",
+                "path": "/system/fortiguard/test-availability",
+                "fields": {"protocol": str, "port": int, "service": str},
+                "methods": ("post",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/system/fortiguard/update",
+                "methods": ("post",),
+            },
+        },
+    },
+    "fortimanager": {
+        "class": "Fortimanager",
+        "path": "/system/fortimanager",
+        "methods": (),
+        "children": {
+            "backup_action": {
+                "class": "BackupAction",
+                "path": "/system/fortimanager/backup-action",
+                "fields": {"operation": str, "objects": list},
+                "methods": ("post",),
+            },
+            "backup_details": {
+                "class": "BackupDetails",
+                "path": "/system/fortimanager/backup-details",
+                "params": {"mkey": str, "datasource": str},
+                "required": ("mkey", "datasource"),
+                "methods": ("get",),
+            },
+            "backup_summary": {
+                "class": "BackupSummary",
+                "path": "/system/fortimanager/backup-summary",
+                "methods": ("get",),
+            },
+        },
+    },
+    "fsck": {
+        "class": "Fsck",
+        "path": "/system/fsck",
+        "methods": (),
+        "children": {
+            "start": {
+                "class": "Start",
+                "path": "/system/fsck/start",
+                "methods": ("post",),
+            }
+        },
+    },
+    "global_resources": {
+        "class": "GlobalResources",
+        "path": "/system/global-resources",
+        "methods": ("get",),
+    },
+    "global_search": {
+        "class": "GlobalSearch",
+        "path": "/system/global-search",
+        "params": {
+            "search": str,
+            "scope": str,
+            "search_tables": list,
+            "skip_tables": list,
+            "exact": bool,
+        },
+        "required": ("search",),
+        "methods": ("get",),
+    },
+    "ha_backup_hb_used": {
+        "class": "HaBackupHbUsed",
+        "path": "/system/ha-backup-hb-used",
+        "methods": ("get",),
+    },
+    "ha_checksums": {
+        "class": "HaChecksums",
+        "path": "/system/ha-checksums",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ha_history": {
+        "class": "HaHistory",
+        "path": "/system/ha-history",
+        "methods": ("get",),
+    },
+    "ha_hw_interface": {
+        "class": "HaHwInterface",
+        "path": "/system/ha-hw-interface",
+        "methods": ("get",),
+    },
+    "ha_nonsync_checksums": {
+        "class": "HaNonsyncChecksums",
+        "path": "/system/ha-nonsync-checksums",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ha_peer": {
+        "class": "HaPeer",
+        "path": "/system/ha-peer",
+        "params": {"serial_no": str, "vcluster_id": int},
+        "methods": ("get",),
+        "children": {
+            "disconnect": {
+                "class": "Disconnect",
+                "path": "/system/ha-peer/disconnect",
+                "fields": {
+                    "serial_no": str,
+                    "interface": str,
+                    "ip": str,
+                    "mask": str,
+                },
+                "methods": ("post",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/system/ha-peer/update",
+                "fields": {
+                    "serial_no": str,
+                    "vcluster_id": int,
+                    "priority": int,
+                    "hostname": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "ha_statistics": {
+        "class": "HaStatistics",
+        "path": "/system/ha-statistics",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ha_table_checksums": {
+        "class": "HaTableChecksums",
+        "path": "/system/ha-table-checksums",
+        "params": {"serial_no": str, "vdom_name": str},
+        "required": ("serial_no",),
+        "methods": ("get", "iter", "aiter"),
+    },
+    "hscalefw_license": {
+        "class": "HscalefwLicense",
+        "path": "/system/hscalefw-license",
+        "methods": (),
+        "children": {
+            "upload": {
+                "class": "Upload",
+                "path": "/system/hscalefw-license/upload",
+                "fields": {"license_key": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "interface": {
+        "class": "Interface",
+        "path": "/system/interface",
+        "params": {
+            "interface_name": str,
+            "include_vlan": bool,
+            "include_aggregate": bool,
+            "scope": str,
+        },
+        "methods": ("get",),
+        "children": {
+            "dhcp_renew": {
+                "class": "DhcpRenew",
+                "path": "/system/interface/dhcp-renew",
+                "fields": {"mkey": str, "ipv6": bool},
+                "methods": ("post",),
+            },
+            "dhcp_status": {
+                "class": "DhcpStatus",
+                "path": "/system/interface/dhcp-status",
+                "params": {"mkey": str, "ipv6": bool},
+                "required": ("mkey",),
+                "methods": ("get",),
+            },
+            "kernel_interfaces": {
+                "class": "KernelInterfaces",
+                "path": "/system/interface/kernel-interfaces",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "poe": {
+                "class": "Poe",
+                "path": "/system/interface/poe",
+                "params": {"mkey": str, "scope": str},
+                "methods": ("get",),
+            },
+            "poe_usage": {
+                "class": "PoeUsage",
+                "path": "/system/interface/poe-usage",
+                "methods": ("get",),
+            },
+            "speed_test_status": {
+                "class": "SpeedTestStatus",
+                "path": "/system/interface/speed-test-status",
+                "params": {"id": int},
+                "required": ("id",),
+                "methods": ("get",),
+            },
+            "speed_test_trigger": {
+                "class": "SpeedTestTrigger",
+                "path": "/system/interface/speed-test-trigger",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            },
+            "transceivers": {
+                "class": "Transceivers",
+                "path": "/system/interface/transceivers",
+                "params": {"scope": str},
+                "methods": ("get",),
+            },
+            "wake_on_lan": {
+                "class": "WakeOnLan",
+                "path": "/system/interface/wake-on-lan",
+                "fields": {
+                    "mkey": str,
+                    "mac": str,
+                    "protocol_option": str,
+                    "port": int,
+                    "address": str,
+                    "secureon_password": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "interface_connected_admins_info": {
+        "class": "InterfaceConnectedAdminsInfo",
+        "path": "/system/interface-connected-admins-info",
+        "params": {"interface": str},
+        "required": ("interface",),
+        "methods": ("get",),
+    },
+    "ipam": {
+        "class": "Ipam",
+        "path": "/system/ipam",
+        "methods": (),
+        "children": {
+            "list": {
+                "class": "List",
+                "path": "/system/ipam/list",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "status": {
+                "class": "Status",
+                "path": "/system/ipam/status",
+                "methods": ("get",),
+            },
+            "utilization": {
+                "class": "Utilization",
+                "path": "/system/ipam/utilization",
+                "methods": ("get",),
+            },
+        },
+    },
+    "ipconf": {
+        "class": "Ipconf",
+        "path": "/system/ipconf",
+        "params": {"devs": list, "ipaddr": str},
+        "required": ("devs", "ipaddr"),
+        "methods": ("get",),
+    },
+    "link_monitor": {
+        "class": "LinkMonitor",
+        "path": "/system/link-monitor",
+        "params": {"mkey": str},
+        "methods": ("get",),
+    },
+    "logdisk": {
+        "class": "Logdisk",
+        "path": "/system/logdisk",
+        "methods": (),
+        "children": {
+            "format": {
+                "class": "Format",
+                "path": "/system/logdisk/format",
+                "methods": ("post",),
+            }
+        },
+    },
+    "lte_modem": {
+        "class": "LteModem",
+        "path": "/system/lte-modem",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/lte-modem/status",
+                "methods": ("get",),
+            },
+            "upgrade": {
+                "class": "Upgrade",
+                "path": "/system/lte-modem/upgrade",
+                "methods": ("post",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/system/lte-modem/upload",
+                "fields": {"filename": str, "file_content": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "modem": {
+        "class": "Modem",
+        "path": "/system/modem",
+        "methods": ("get",),
+        "children": {
+            "connect": {
+                "class": "Connect",
+                "path": "/system/modem/connect",
+                "methods": ("post",),
+            },
+            "disconnect": {
+                "class": "Disconnect",
+                "path": "/system/modem/disconnect",
+                "methods": ("post",),
+            },
+            "reset": {
+                "class": "Reset",
+                "path": "/system/modem/reset",
+                "methods": ("post",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/system/modem/update",
+                "methods": ("post",),
+            },
+        },
+    },
+    "modem_3g": {
+        "class": "Modem3g",
+        "path": "/system/3g-modem",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "modem_5g": {
+        "class": "Modem5g",
+        "path": "/system/5g-modem",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/5g-modem/status",
+                "params": {"modem": str},
+                "methods": ("get",),
+            }
+        },
+    },
+    "monitor_sensor": {
+        "class": "MonitorSensor",
+        "path": "/system/monitor-sensor",
+        "methods": ("get",),
+    },
+    "ntp": {
+        "class": "Ntp",
+        "path": "/system/ntp",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/ntp/status",
+                "methods": ("get", "iter", "aiter"),
+            }
+        },
+    },
+    "object": {
+        "class": "Object",
+        "path": "/system/object",
+        "methods": (),
+        "children": {
+            "usage": {
+                "class": "Usage",
+                "path": "/system/object/usage",
+                "params": {
+                    "q_path": str,
+                    "q_name": str,
+                    "qtypes": list,
+                    "scope": str,
+                    "mkey": str,
+                    "child_path": str,
+                },
+                "methods": ("get",),
+            }
+        },
+    },
+    "os": {
+        "class": "Os",
+        "path": "/system/os",
+        "methods": (),
+        "children": {
+            "reboot": {
+                "class": "Reboot",
+                "path": "/system/os/reboot",
+                "fields": {"event_log_message": str},
+                "methods": ("post",),
+            },
+            "shutdown": {
+                "class": "Shutdown",
+                "path": "/system/os/shutdown",
+                "fields": {"event_log_message": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "password_policy_conform": {
+        "class": "PasswordPolicyConform",
+        "path": "/system/password-policy-conform",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/system/password-policy-conform/select",
+                "fields": {
+                    "mkey": str,
+                    "apply_to": str,
+                    "password": str,
+                    "old_password": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "performance": {
+        "class": "Performance",
+        "path": "/system/performance",
+        "methods": (),
+        "children": {
+            "status": {
+                "class": "Status",
+                "path": "/system/performance/status",
+                "methods": ("get",),
+            }
+        },
+    },
+    "private_data_encryption": {
+        "class": "PrivateDataEncryption",
+        "path": "/system/private-data-encryption",
+        "methods": (),
+        "children": {
+            "set": {
+                "class": "Set",
+                "path": "/system/private-data-encryption/set",
+                "fields": {"enable": bool, "password": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "process": {
+        "class": "Process",
+        "path": "/system/process",
+        "methods": (),
+        "children": {
+            "kill": {
+                "class": "Kill",
+                "path": "/system/process/kill",
+                "fields": {"pid": int, "signal": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "resolve_fqdn": {
+        "class": "ResolveFqdn",
+        "path": "/system/resolve-fqdn",
+        "params": {"fqdn": Any, "ipv6": bool},
+        "required": ("fqdn",),
+        "methods": ("get",),
+    },
+    "resource": {
+        "class": "Resource",
+        "path": "/system/resource",
+        "methods": (),
+        "children": {
+            "usage": {
+                "class": "Usage",
+                "path": "/system/resource/usage",
+                "params": {"scope": str, "resource": str, "interval": str},
+                "methods": ("get",),
+            }
+        },
+    },
+    "running_processes": {
+        "class": "RunningProcesses",
+        "path": "/system/running-processes",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "sandbox": {
+        "class": "Sandbox",
+        "path": "/system/sandbox",
+        "methods": (),
+        "children": {
+            "cloud_regions": {
+                "class": "CloudRegions",
+                "path": "/system/sandbox/cloud-regions",
+                "methods": ("get", "iter", "aiter"),
+            },
+            "connection": {
+                "class": "Connection",
+                "path": "/system/sandbox/connection",
+                "params": {"server": str},
+                "methods": ("get",),
+            },
+            "detect": {
+                "class": "Detect",
+                "path": "/system/sandbox/detect",
+                "methods": ("get",),
+            },
+            "stats": {
+                "class": "Stats",
+                "path": "/system/sandbox/stats",
+                "methods": ("get",),
+            },
+            "status": {
+                "class": "Status",
+                "path": "/system/sandbox/status",
+                "methods": ("get",),
+            },
+        },
+    },
+    "sdn_connector": {
+        "class": "SdnConnector",
+        "path": "/system/sdn-connector",
+        "methods": (),
+        "children": {
+            "nsx_security_tags": {
+                "class": "NsxSecurityTags",
+                "path": "/system/sdn-connector/nsx-security-tags",
+                "params": {"mkey": str},
+                "methods": ("get", "iter", "aiter"),
+            },
+            "status": {
+                "class": "Status",
+                "path": "/system/sdn-connector/status",
+                "params": {"mkey": str, "type": str},
+                "methods": ("get",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/system/sdn-connector/update",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            },
+            "validate_gcp_key": {
+                "class": "ValidateGcpKey",
+                "path": "/system/sdn-connector/validate-gcp-key",
+                "fields": {"private-key": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "sensor_info": {
+        "class": "SensorInfo",
+        "path": "/system/sensor-info",
+        "methods": ("get",),
+    },
+    "status": {
+        "class": "Status",
+        "path": "/system/status",
+        "methods": ("get",),
+    },
+    "storage": {
+        "class": "Storage",
+        "path": "/system/storage",
+        "methods": ("get",),
+    },
+    "time": {
+        "class": "Time",
+        "path": "/system/time",
+        "methods": ("get",),
+        "children": {
+            "set": {
+                "class": "Set",
+                "path": "/system/time/set",
+                "fields": {
+                    "year": int,
+                    "month": int,
+                    "day": int,
+                    "hour": int,
+                    "minute": int,
+                    "second": int,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "timezone": {
+        "class": "Timezone",
+        "path": "/system/timezone",
+        "methods": ("get",),
+    },
+    "traffic_history": {
+        "class": "TrafficHistory",
+        "path": "/system/traffic-history",
+        "methods": (),
+        "children": {
+            "enable_app_bandwidth_tracking": {
+                "class": "EnableAppBandwidthTracking",
+                "path": "/system/traffic-history/enable-app-bandwidth-tracking",
+                "methods": ("post",),
+            },
+            "interface": {
+                "class": "Interface",
+                "path": "/system/traffic-history/interface",
+                "params": {"interface": str, "time_period": str},
+                "required": ("interface", "time_period"),
+                "methods": ("get",),
+            },
+            "top_applications": {
+                "class": "TopApplications",
+                "path": "/system/traffic-history/top-applications",
+                "params": {"time_period": str},
+                "required": ("time_period",),
+                "methods": ("get",),
+            },
+        },
+    },
+    "trusted_cert_authorities": {
+        "class": "TrustedCertAuthorities",
+        "path": "/system/trusted-cert-authorities",
+        "params": {"scope": str},
+        "methods": ("get",),
+    },
+    "upgrade_report": {
+        "class": "UpgradeReport",
+        "path": "/system/upgrade-report",
+        "methods": (),
+        "children": {
+            "current": {
+                "class": "Current",
+                "path": "/system/upgrade-report/current",
+                "methods": ("get",),
+            },
+            "exists": {
+                "class": "Exists",
+                "path": "/system/upgrade-report/exists",
+                "methods": ("get",),
+            },
+            "saved": {
+                "class": "Saved",
+                "path": "/system/upgrade-report/saved",
+                "methods": ("get",),
+            },
+        },
+    },
+    "usb_device": {
+        "class": "UsbDevice",
+        "path": "/system/usb-device",
+        "methods": (),
+        "children": {
+            "eject": {
+                "class": "Eject",
+                "path": "/system/usb-device/eject",
+                "methods": ("post",),
+            }
+        },
+    },
+    "usb_log": {
+        "class": "UsbLog",
+        "path": "/system/usb-log",
+        "methods": ("get",),
+        "children": {
+            "start": {
+                "class": "Start",
+                "path": "/system/usb-log/start",
+                "methods": ("post",),
+            },
+            "stop": {
+                "class": "Stop",
+                "path": "/system/usb-log/stop",
+                "methods": ("post",),
+            },
+        },
+    },
+    "vdom_link": {
+        "class": "VdomLink",
+        "path": "/system/vdom-link",
+        "params": {"scope": str},
+        "methods": ("get",),
+    },
+    "vdom_resource": {
+        "class": "VdomResource",
+        "path": "/system/vdom-resource",
+        "methods": ("get",),
+    },
+    "vm_information": {
+        "class": "VmInformation",
+        "path": "/system/vm-information",
+        "methods": ("get",),
+    },
+    "vmlicense": {
+        "class": "Vmlicense",
+        "path": "/system/vmlicense",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/system/vmlicense/download",
+                "fields": {"token": str, "proxy_url": str},
+                "methods": ("post",),
+            },
+            "download_eval": {
+                "class": "DownloadEval",
+                "path": "/system/vmlicense/download-eval",
+                "fields": {
+                    "account_id": str,
+                    "account_password": str,
+                    "is_government": bool,
+                },
+                "methods": ("post",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/system/vmlicense/upload",
+                "fields": {"file_content": str},
+                "methods": ("post",),
+            },
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -28,8 +28,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
 
+    from hfortix.FortiOS.download import DownloadTarget
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 
@@ -115,6 +116,70 @@ class Backup:
         data.update(kwargs)
         return self._client.post("monitor", "/system/config/backup", data=data)
 
+    def download(
+        self,
+        dest: "DownloadTarget",
+        password: str | None = None,
+        scope: str | None = None,
+        vdom: str | None = None,
+        password_mask: bool | None = None,
+        file_format: str | None = None,
+        checksum: str | None = None,
+        payload_dict: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Stream a system config backup to a file.
+
+        The backup is written in chunks as it downloads, so full-config
+        backups of large multi-VDOM systems are never held in memory.
+
+        Args:
+            dest: File path or binary file object opened for writing
+            password: Password to encrypt configuration data. (optional)
+            scope: Specify global or VDOM only backup [global | vdom].
+            (optional)
+            vdom: If 'vdom' scope specified, the name of the VDOM to backup
+            configuration. (optional)
+            password_mask: True to replace all the secrects and passwords
+            with a mask. (optional)
+            file_format: Configuration file format [fos* | yaml].
+            (optional)
+            checksum: hashlib algorithm computed while writing (e.g.
+            "sha256")
+            payload_dict: Optional dictionary of parameters
+            **kwargs: Additional parameters as keyword arguments
+
+        Returns:
+            Dictionary with path, bytes and (if requested) checksum
+
+        Example:
+            >>> fgt.api.monitor.system.config.backup.download(
+            ...     "fgt.conf", scope="global", checksum="sha256"
+            ... )
+        """
+        data = payload_dict.copy() if payload_dict else {}
+        data.setdefault("destination", "file")
+        if password is not None:
+            data["password"] = password
+        if scope is not None:
+            data["scope"] = scope
+        if vdom is not None:
+            data["vdom"] = vdom
+        if password_mask is not None:
+            data["password_mask"] = password_mask
+        if file_format is not None:
+            data["file_format"] = file_format
+        data.update(kwargs)
+        return self._client.download(
+            "monitor",
+            "/system/config/backup",
+            dest,
+            data=data,
+            method="POST",
+            checksum=checksum,
+        )
+
 
 class Restore:
     """Restore operations."""
@@ -276,6 +341,52 @@ class UsbFilelist:
             "monitor", "/system/config/usb-filelist", params=params
         )
 
+    def iter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (sync mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of parameters
+            **kwargs: Additional parameters passed to get()
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import paginate
+
+        return paginate(
+            self.get, page_size, payload_dict=payload_dict, **kwargs
+        )
+
+    def aiter(
+        self,
+        page_size: int = 1000,
+        payload_dict: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all entries page by page (async mode).
+
+        Args:
+            page_size: Number of entries fetched per request (default: 1000)
+            payload_dict: Optional dictionary of parameters
+            **kwargs: Additional parameters passed to get()
+
+        Yields:
+            One entry at a time; memory use is bounded by page_size
+        """
+        from hfortix.FortiOS.api._helpers.pagination import apaginate
+
+        return apaginate(
+            self.get, page_size, payload_dict=payload_dict, **kwargs
+        )
+
 
 class Config:
     """Config operations."""
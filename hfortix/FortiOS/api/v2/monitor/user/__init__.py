@@ -3,34 +3,70 @@ FortiOS Monitor - User
 User authentication and monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .fortitoken import Fortitoken
+    from .fortitoken_cloud import FortitokenCloud
+
 __all__ = ["User"]
 
-from .banned import Banned
-from .collected_email import CollectedEmail
-from .device import Device
-from .firewall import Firewall
-from .fortitoken import Fortitoken
-from .fortitoken_cloud import FortitokenCloud
-from .fsso import Fsso
-from .guest import Guest
-from .info import Info
-from .local import Local
-from .password_policy_conform import PasswordPolicyConform
-from .proxy import Proxy
-from .query import Query
-from .radius import Radius
-from .scim import Scim
-from .tacacs_plus import TacacsPlus
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Banned": "._registry",
+        "CollectedEmail": "._registry",
+        "Device": "._registry",
+        "Firewall": "._registry",
+        "Fortitoken": ".fortitoken",
+        "FortitokenCloud": ".fortitoken_cloud",
+        "Fsso": "._registry",
+        "Guest": "._registry",
+        "Info": "._registry",
+        "Local": "._registry",
+        "PasswordPolicyConform": "._registry",
+        "Proxy": "._registry",
+        "Query": "._registry",
+        "Radius": "._registry",
+        "Scim": "._registry",
+        "TacacsPlus": "._registry",
+    },
+)
 
 
 class User:
     """User Monitor category class"""
 
+    banned: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Banned")
+    collected_email: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CollectedEmail"
+    )
+    device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Device")
+    firewall: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Firewall")
+    fortitoken: LazyEndpoint[Fortitoken] = LazyEndpoint("Fortitoken")
+    fortitoken_cloud: LazyEndpoint[FortitokenCloud] = LazyEndpoint(
+        "FortitokenCloud"
+    )
+    fsso: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Fsso")
+    guest: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Guest")
+    info: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Info")
+    local: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Local")
+    password_policy_conform: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "PasswordPolicyConform"
+    )
+    proxy: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Proxy")
+    query: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Query")
+    radius: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Radius")
+    scim: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Scim")
+    tacacs_plus: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("TacacsPlus")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize User Monitor category
@@ -40,24 +76,6 @@ class User:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.banned = Banned(client)
-        self.collected_email = CollectedEmail(client)
-        self.device = Device(client)
-        self.firewall = Firewall(client)
-        self.fortitoken = Fortitoken(client)
-        self.fortitoken_cloud = FortitokenCloud(client)
-        self.fsso = Fsso(client)
-        self.guest = Guest(client)
-        self.info = Info(client)
-        self.local = Local(client)
-        self.password_policy_conform = PasswordPolicyConform(client)
-        self.proxy = Proxy(client)
-        self.query = Query(client)
-        self.radius = Radius(client)
-        self.scim = Scim(client)
-        self.tacacs_plus = TacacsPlus(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
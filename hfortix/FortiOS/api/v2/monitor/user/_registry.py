@@ -0,0 +1,329 @@
+"""FortiOS MONITOR - User endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "banned": {
+        "class": "Banned",
+        "path": "/user/banned",
+        "methods": ("get",),
+        "children": {
+            "add_users": {
+                "class": "AddUsers",
+                "path": "/user/banned/add_users",
+                "fields": {"ip_addresses": list, "expiry": int},
+                "methods": ("post",),
+            },
+            "check": {
+                "class": "Check",
+                "path": "/user/banned/check",
+                "params": {"ip_address": str},
+                "required": ("ip_address",),
+                "methods": ("get",),
+            },
+            "clear_all": {
+                "class": "ClearAll",
+                "path": "/user/banned/clear_all",
+                "methods": ("post",),
+            },
+            "clear_users": {
+                "class": "ClearUsers",
+                "path": "/user/banned/clear_users",
+                "fields": {"ip_addresses": list},
+                "methods": ("post",),
+            },
+        },
+    },
+    "collected_email": {
+        "class": "CollectedEmail",
+        "path": "/user/collected-email",
+        "params": {"ipv6": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "device": {
+        "class": "Device",
+        "path": "/user/device",
+        "methods": (),
+        "children": {
+            "iot_query": {
+                "class": "IotQuery",
+                "path": "/user/device/iot-query",
+                "params": {"mac": str, "ip": str},
+                "required": ("mac", "ip"),
+                "methods": ("get",),
+            },
+            "purdue_level": {
+                "class": "PurdueLevel",
+                "path": "/user/device/purdue-level",
+                "fields": {"mac": str, "ip": str, "level": str},
+                "methods": ("post",),
+            },
+            "query": {
+                "class": "Query",
+                "path": "/user/device/query",
+                "params": {
+                    "timestamp_from": int,
+                    "timestamp_to": int,
+                    "filters": list,
+                    "query_type": str,
+                    "view_type": str,
+                    "query_id": int,
+                    "cache_query": bool,
+                    "key_only": bool,
+                    "filter_logic": str,
+                    "total_only": bool,
+                },
+                "methods": ("get",),
+            },
+            "stats": {
+                "class": "Stats",
+                "path": "/user/device/stats",
+                "params": {
+                    "stat-key": str,
+                    "timestamp_to": int,
+                    "stat-query-type": str,
+                    "timestamp_from": int,
+                    "filters": list,
+                    "filter_logic": str,
+                },
+                "required": ("stat-key", "timestamp_to"),
+                "methods": ("get",),
+            },
+        },
+    },
+    "firewall": {
+        "class": "Firewall",
+        "path": "/user/firewall",
+        "params": {"ipv4": bool, "ipv6": bool, "include_fsso": bool},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "auth": {
+                "class": "Auth",
+                "path": "/user/firewall/auth",
+                "fields": {"username": str, "ip": str, "server": str},
+                "methods": ("post",),
+            },
+            "count": {
+                "class": "Count",
+                "path": "/user/firewall/count",
+                "params": {"ipv4": bool, "ipv6": bool, "include_fsso": bool},
+                "methods": ("get",),
+            },
+            "deauth": {
+                "class": "Deauth",
+                "path": "/user/firewall/deauth",
+                "fields": {
+                    "user_type": str,
+                    "id": int,
+                    "ip": str,
+                    "ip_version": str,
+                    "method": str,
+                    "all": bool,
+                    "users": list,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "fsso": {
+        "class": "Fsso",
+        "path": "/user/fsso",
+        "methods": ("get",),
+        "children": {
+            "refresh_server": {
+                "class": "RefreshServer",
+                "path": "/user/fsso/refresh-server",
+                "methods": ("post",),
+            }
+        },
+    },
+    "guest": {
+        "class": "Guest",
+        "path": "/user/guest",
+        "methods": (),
+        "children": {
+            "email": {
+                "class": "Email",
+                "path": "/user/guest/email",
+                "fields": {"group": str, "guest": list},
+                "methods": ("post",),
+            },
+            "sms": {
+                "class": "Sms",
+                "path": "/user/guest/sms",
+                "fields": {"group": str, "guest": list},
+                "methods": ("post",),
+            },
+        },
+    },
+    "info": {
+        "class": "Info",
+        "path": "/user/info",
+        "methods": (),
+        "children": {
+            "query": {
+                "class": "Query",
+                "path": "/user/info/query",
+                "params": {
+                    "timestamp_from": int,
+                    "timestamp_to": int,
+                    "filters": list,
+                    "query_type": str,
+                    "query_id": int,
+                    "cache_query": bool,
+                    "key_only": bool,
+                    "filter_logic": str,
+                    "total_only": bool,
+                },
+                "methods": ("get",),
+            },
+            "thumbnail": {
+                "class": "Thumbnail",
+                "path": "/user/info/thumbnail",
+                "params": {"filters": list},
+                "required": ("filters",),
+                "methods": ("get",),
+            },
+            "thumbnail_file": {
+                "class": "ThumbnailFile",
+                "path": "/user/info/thumbnail-file",
+                "params": {"filename": str},
+                "required": ("filename",),
+                "methods": ("get",),
+            },
+        },
+    },
+    "local": {
+        "class": "Local",
+        "path": "/user/local",
+        "methods": (),
+        "children": {
+            "change_password": {
+                "class": "ChangePassword",
+                "path": "/user/local/change-password",
+                "fields": {"username": str, "new_password": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "password_policy_conform": {
+        "class": "PasswordPolicyConform",
+        "path": "/user/password-policy-conform",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/user/password-policy-conform/select",
+                "fields": {"username": str, "password": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "proxy": {
+        "class": "Proxy",
+        "path": "/user/proxy",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "count": {
+                "class": "Count",
+                "path": "/user/proxy/count",
+                "methods": ("get",),
+            }
+        },
+    },
+    "query": {
+        "class": "Query",
+        "path": "/user/query",
+        "methods": (),
+        "children": {
+            "abort": {
+                "class": "Abort",
+                "path": "/user/query/abort",
+                "fields": {"query_id": int},
+                "methods": ("post",),
+            }
+        },
+    },
+    "radius": {
+        "class": "Radius",
+        "path": "/user/radius",
+        "methods": (),
+        "children": {
+            "get_test_connect": {
+                "class": "GetTestConnect",
+                "path": "/user/radius/get-test-connect",
+                "params": {
+                    "mkey": str,
+                    "ordinal": str,
+                    "server": str,
+                    "secret": str,
+                    "auth_type": str,
+                    "user": str,
+                    "password": str,
+                },
+                "methods": ("get",),
+            },
+            "test_connect": {
+                "class": "TestConnect",
+                "path": "/user/radius/test-connect",
+                "fields": {
+                    "mkey": str,
+                    "ordinal": str,
+                    "server": str,
+                    "secret": str,
+                    "auth_type": str,
+                    "user": str,
+                    "password": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "scim": {
+        "class": "Scim",
+        "path": "/user/scim",
+        "methods": (),
+        "children": {
+            "groups": {
+                "class": "Groups",
+                "path": "/user/scim/groups",
+                "params": {"client_name": str},
+                "required": ("client_name",),
+                "methods": ("get",),
+            },
+            "users": {
+                "class": "Users",
+                "path": "/user/scim/users",
+                "params": {
+                    "client_name": str,
+                    "group_name": str,
+                    "user_name": str,
+                },
+                "required": ("client_name",),
+                "methods": ("get",),
+            },
+        },
+    },
+    "tacacs_plus": {
+        "class": "TacacsPlus",
+        "path": "/user/tacacs-plus",
+        "methods": (),
+        "children": {
+            "test": {
+                "class": "Test",
+                "path": "/user/tacacs-plus/test",
+                "fields": {
+                    "mkey": str,
+                    "ordinal": str,
+                    "server": str,
+                    "secret": str,
+                    "port": int,
+                    "source_ip": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,23 +3,44 @@ FortiOS Monitor - Utm
 UTM (Unified Threat Management) monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Utm"]
 
-from .antivirus import Antivirus
-from .app_lookup import AppLookup
-from .application_categories import ApplicationCategories
-from .blacklisted_certificates import BlacklistedCertificates
-from .rating_lookup import RatingLookup
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Antivirus": "._registry",
+        "AppLookup": "._registry",
+        "ApplicationCategories": "._registry",
+        "BlacklistedCertificates": "._registry",
+        "RatingLookup": "._registry",
+    },
+)
 
 
 class Utm:
     """Utm Monitor category class"""
 
+    antivirus: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Antivirus")
+    app_lookup: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("AppLookup")
+    application_categories: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "ApplicationCategories"
+    )
+    blacklisted_certificates: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "BlacklistedCertificates"
+    )
+    rating_lookup: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("RatingLookup")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Utm Monitor category
@@ -29,13 +50,6 @@ class Utm:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.antivirus = Antivirus(client)
-        self.app_lookup = AppLookup(client)
-        self.application_categories = ApplicationCategories(client)
-        self.blacklisted_certificates = BlacklistedCertificates(client)
-        self.rating_lookup = RatingLookup(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
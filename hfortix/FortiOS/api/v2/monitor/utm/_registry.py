@@ -0,0 +1,58 @@
+"""FortiOS MONITOR - Utm endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "antivirus": {
+        "class": "Antivirus",
+        "path": "/utm/antivirus",
+        "methods": (),
+        "children": {
+            "stats": {
+                "class": "Stats",
+                "path": "/utm/antivirus/stats",
+                "methods": ("get",),
+            }
+        },
+    },
+    "app_lookup": {
+        "class": "AppLookup",
+        "path": "/utm/app-lookup",
+        "params": {"hosts": list},
+        "methods": ("get",),
+    },
+    "application_categories": {
+        "class": "ApplicationCategories",
+        "path": "/utm/application-categories",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "blacklisted_certificates": {
+        "class": "BlacklistedCertificates",
+        "path": "/utm/blacklisted-certificates",
+        "params": {"start": int, "count": int},
+        "required": ("start", "count"),
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "statistics": {
+                "class": "Statistics",
+                "path": "/utm/blacklisted-certificates/statistics",
+                "methods": ("get",),
+            }
+        },
+    },
+    "rating_lookup": {
+        "class": "RatingLookup",
+        "path": "/utm/rating-lookup",
+        "methods": (),
+        "children": {
+            "select": {
+                "class": "Select",
+                "path": "/utm/rating-lookup/select",
+                "fields": {"url": list, "lang": str},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -1,106 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Utm Rating Lookup
-
-Monitoring endpoint for monitor utm rating lookup data.
-
-API Endpoints:
-    GET    /monitor/utm/rating_lookup
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.utm.rating_lookup.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.utm.rating_lookup.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Select:
-    """
-    Select Operations.
-
-    Provides read-only access for FortiOS select data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Select endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def post(
-        self,
-        url: list | None = None,
-        lang: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Lookup FortiGuard rating for a specific URL.
-
-        Args:
-            url: List of URLs to query. (optional)
-            lang: Language for the rating response. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.utm.rating_lookup.select.post()
-        """
-        data = payload_dict.copy() if payload_dict else {}
-        if url is not None:
-            data["url"] = url
-        if lang is not None:
-            data["lang"] = lang
-        data.update(kwargs)
-        return self._client.post(
-            "monitor", "/utm/rating-lookup/select", data=data
-        )
-
-
-class RatingLookup:
-    """RatingLookup operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize RatingLookup endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.select = Select(client)
@@ -3,19 +3,34 @@ FortiOS Monitor - Videofilter
 Video filter monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Videofilter"]
 
-from .fortiguard_categories import FortiguardCategories
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "FortiguardCategories": "._registry",
+    },
+)
 
 
 class Videofilter:
     """Videofilter Monitor category class"""
 
+    fortiguard_categories: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "FortiguardCategories"
+    )
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Videofilter Monitor category
@@ -25,9 +40,6 @@ class Videofilter:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.fortiguard_categories = FortiguardCategories(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["fortiguard_categories"]
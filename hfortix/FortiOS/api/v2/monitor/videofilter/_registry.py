@@ -0,0 +1,13 @@
+"""FortiOS MONITOR - Videofilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "fortiguard_categories": {
+        "class": "FortiguardCategories",
+        "path": "/videofilter/fortiguard-categories",
+        "methods": ("get",),
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
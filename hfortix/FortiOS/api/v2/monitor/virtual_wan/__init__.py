@@ -3,23 +3,40 @@ FortiOS Monitor - Virtual Wan
 Virtual WAN monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["VirtualWan"]
 
-from .health_check import HealthCheck
-from .interface_log import InterfaceLog
-from .members import Members
-from .sla_log import SlaLog
-from .sladb import Sladb
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "HealthCheck": "._registry",
+        "InterfaceLog": "._registry",
+        "Members": "._registry",
+        "SlaLog": "._registry",
+        "Sladb": "._registry",
+    },
+)
 
 
 class VirtualWan:
     """VirtualWan Monitor category class"""
 
+    health_check: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("HealthCheck")
+    interface_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("InterfaceLog")
+    members: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Members")
+    sla_log: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("SlaLog")
+    sladb: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Sladb")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize VirtualWan Monitor category
@@ -29,13 +46,6 @@ class VirtualWan:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.health_check = HealthCheck(client)
-        self.interface_log = InterfaceLog(client)
-        self.members = Members(client)
-        self.sla_log = SlaLog(client)
-        self.sladb = Sladb(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["health_check", "interface_log", "members", "sla_log", "sladb"]
@@ -0,0 +1,54 @@
+"""FortiOS MONITOR - Virtual Wan endpoint registry"""
+
+from typing import Any
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "health_check": {
+        "class": "HealthCheck",
+        "path": "/virtual-wan/health-check",
+        "params": {"health_check_name": str},
+        "methods": ("get",),
+    },
+    "interface_log": {
+        "class": "InterfaceLog",
+        "path": "/virtual-wan/interface-log",
+        "params": {"interface": str, "since": int, "seconds": int},
+        "methods": ("get",),
+    },
+    "members": {
+        "class": "Members",
+        "path": "/virtual-wan/members",
+        "params": {
+            "interface": Any,
+            "zone": str,
+            "sla": str,
+            "skip_vpn_child": bool,
+        },
+        "methods": ("get",),
+    },
+    "sla_log": {
+        "class": "SlaLog",
+        "path": "/virtual-wan/sla-log",
+        "params": {
+            "sla": Any,
+            "interface": str,
+            "since": int,
+            "seconds": int,
+            "latest": bool,
+            "min_sample_interval": int,
+            "sampling_interval": int,
+            "skip_vpn_child": bool,
+            "include_sla_targets_met": bool,
+        },
+        "methods": ("get",),
+    },
+    "sladb": {
+        "class": "Sladb",
+        "path": "/virtual-wan/sladb",
+        "methods": ("get",),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
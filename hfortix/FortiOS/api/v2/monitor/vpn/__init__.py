@@ -3,21 +3,36 @@ FortiOS Monitor - Vpn
 VPN monitoring (IPsec/SSL)
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Vpn"]
 
-from .ike import Ike
-from .ipsec import Ipsec
-from .ssl import Ssl
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Ike": "._registry",
+        "Ipsec": "._registry",
+        "Ssl": "._registry",
+    },
+)
 
 
 class Vpn:
     """Vpn Monitor category class"""
 
+    ike: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ike")
+    ipsec: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ipsec")
+    ssl: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ssl")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Vpn Monitor category
@@ -27,11 +42,6 @@ class Vpn:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.ike = Ike(client)
-        self.ipsec = Ipsec(client)
-        self.ssl = Ssl(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["ike", "ipsec", "ssl"]
@@ -0,0 +1,75 @@
+"""FortiOS MONITOR - Vpn endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "ike": {
+        "class": "Ike",
+        "path": "/vpn/ike",
+        "methods": (),
+        "children": {
+            "clear": {
+                "class": "Clear",
+                "path": "/vpn/ike/clear",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "ipsec": {
+        "class": "Ipsec",
+        "path": "/vpn/ipsec",
+        "params": {"tunnel": str},
+        "methods": ("get",),
+        "children": {
+            "connection_count": {
+                "class": "ConnectionCount",
+                "path": "/vpn/ipsec/connection-count",
+                "methods": ("get",),
+            },
+            "tunnel_down": {
+                "class": "TunnelDown",
+                "path": "/vpn/ipsec/tunnel_down",
+                "fields": {"p1name": str, "p2name": str, "p2serial": int},
+                "methods": ("post",),
+            },
+            "tunnel_reset_stats": {
+                "class": "TunnelResetStats",
+                "path": "/vpn/ipsec/tunnel_reset_stats",
+                "fields": {"p1name": str},
+                "methods": ("post",),
+            },
+            "tunnel_up": {
+                "class": "TunnelUp",
+                "path": "/vpn/ipsec/tunnel_up",
+                "fields": {"p1name": str, "p2name": str, "p2serial": int},
+                "methods": ("post",),
+            },
+        },
+    },
+    "ssl": {
+        "class": "Ssl",
+        "path": "/vpn/ssl",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_tunnel": {
+                "class": "ClearTunnel",
+                "path": "/vpn/ssl/clear_tunnel",
+                "methods": ("post",),
+            },
+            "delete": {
+                "class": "Delete",
+                "path": "/vpn/ssl/delete",
+                "fields": {"type": str, "index": int},
+                "methods": ("post",),
+            },
+            "stats": {
+                "class": "Stats",
+                "path": "/vpn/ssl/stats",
+                "methods": ("get",),
+            },
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -1,100 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Vpn Ike
-
-Monitoring endpoint for monitor vpn ike data.
-
-API Endpoints:
-    GET    /monitor/vpn/ike
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.vpn.ike.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.vpn.ike.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Clear:
-    """
-    Clear Operations.
-
-    Provides read-only access for FortiOS clear data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Clear endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def post(
-        self,
-        mkey: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Clear IKE gateways.
-
-        Args:
-            mkey: Name of the IKE gateway to clear. (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.vpn.ike.clear.post()
-        """
-        data = payload_dict.copy() if payload_dict else {}
-        if mkey is not None:
-            data["mkey"] = mkey
-        data.update(kwargs)
-        return self._client.post("monitor", "/vpn/ike/clear", data=data)
-
-
-class Ike:
-    """Ike operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Ike endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.clear = Clear(client)
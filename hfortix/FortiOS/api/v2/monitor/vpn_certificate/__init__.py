@@ -3,24 +3,44 @@ FortiOS Monitor - Vpn Certificate
 VPN certificate monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["VpnCertificate"]
 
-from .ca import Ca
-from .cert_name_available import CertNameAvailable
-from .crl import Crl
-from .csr import Csr
-from .local import Local
-from .remote import Remote
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Ca": "._registry",
+        "CertNameAvailable": "._registry",
+        "Crl": "._registry",
+        "Csr": "._registry",
+        "Local": "._registry",
+        "Remote": "._registry",
+    },
+)
 
 
 class VpnCertificate:
     """VpnCertificate Monitor category class"""
 
+    ca: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ca")
+    cert_name_available: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CertNameAvailable"
+    )
+    crl: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Crl")
+    csr: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Csr")
+    local: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Local")
+    remote: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Remote")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize VpnCertificate Monitor category
@@ -30,14 +50,6 @@ class VpnCertificate:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.ca = Ca(client)
-        self.cert_name_available = CertNameAvailable(client)
-        self.crl = Crl(client)
-        self.csr = Csr(client)
-        self.local = Local(client)
-        self.remote = Remote(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["ca", "cert_name_available", "crl", "csr", "local", "remote"]
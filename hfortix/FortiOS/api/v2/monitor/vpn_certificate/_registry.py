@@ -0,0 +1,121 @@
+"""FortiOS MONITOR - Vpn Certificate endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "ca": {
+        "class": "Ca",
+        "path": "/vpn-certificate/ca",
+        "methods": (),
+        "children": {
+            "import_ca": {
+                "class": "ImportCa",
+                "path": "/vpn-certificate/ca/import",
+                "fields": {
+                    "import_method": str,
+                    "scep_url": str,
+                    "scep_ca_id": str,
+                    "scope": str,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "cert_name_available": {
+        "class": "CertNameAvailable",
+        "path": "/vpn-certificate/cert-name-available",
+        "params": {"mkey": str, "scope": str},
+        "required": ("mkey",),
+        "methods": ("get",),
+    },
+    "crl": {
+        "class": "Crl",
+        "path": "/vpn-certificate/crl",
+        "methods": (),
+        "children": {
+            "import_crl": {
+                "class": "ImportCrl",
+                "path": "/vpn-certificate/crl/import",
+                "fields": {"scope": str, "file_content": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "csr": {
+        "class": "Csr",
+        "path": "/vpn-certificate/csr",
+        "methods": (),
+        "children": {
+            "generate": {
+                "class": "Generate",
+                "path": "/vpn-certificate/csr/generate",
+                "fields": {
+                    "certname": str,
+                    "subject": str,
+                    "keytype": str,
+                    "keysize": int,
+                    "curvename": str,
+                    "orgunits": list,
+                    "org": str,
+                    "city": str,
+                    "state": str,
+                    "countrycode": str,
+                    "email": str,
+                    "subject_alt_name": str,
+                    "password": str,
+                    "scep_url": str,
+                    "scep_password": str,
+                    "scope": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "local": {
+        "class": "Local",
+        "path": "/vpn-certificate/local",
+        "methods": (),
+        "children": {
+            "create": {
+                "class": "Create",
+                "path": "/vpn-certificate/local/create",
+                "fields": {"certname": str, "common_name": str, "scope": str},
+                "methods": ("post",),
+            },
+            "import_local": {
+                "class": "ImportLocal",
+                "path": "/vpn-certificate/local/import",
+                "fields": {
+                    "type": str,
+                    "certname": str,
+                    "password": str,
+                    "key_file_content": str,
+                    "scope": str,
+                    "acme_domain": str,
+                    "acme_email": str,
+                    "acme_ca_url": str,
+                    "acme_rsa_key_size": int,
+                    "acme_renew_window": int,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "remote": {
+        "class": "Remote",
+        "path": "/vpn-certificate/remote",
+        "methods": (),
+        "children": {
+            "import_remote": {
+                "class": "ImportRemote",
+                "path": "/vpn-certificate/remote/import",
+                "fields": {"scope": str, "file_content": str},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,21 +3,36 @@ FortiOS Monitor - Wanopt
 WAN optimization monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Wanopt"]
 
-from .history import History
-from .peer_stats import PeerStats
-from .webcache import Webcache
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "History": "._registry",
+        "PeerStats": "._registry",
+        "Webcache": "._registry",
+    },
+)
 
 
 class Wanopt:
     """Wanopt Monitor category class"""
 
+    history: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("History")
+    peer_stats: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("PeerStats")
+    webcache: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Webcache")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Wanopt Monitor category
@@ -27,11 +42,6 @@ class Wanopt:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.history = History(client)
-        self.peer_stats = PeerStats(client)
-        self.webcache = Webcache(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["history", "peer_stats", "webcache"]
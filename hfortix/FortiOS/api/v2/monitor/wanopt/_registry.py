@@ -0,0 +1,46 @@
+"""FortiOS MONITOR - Wanopt endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "history": {
+        "class": "History",
+        "path": "/wanopt/history",
+        "params": {"period": str},
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/wanopt/history/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+    "peer_stats": {
+        "class": "PeerStats",
+        "path": "/wanopt/peer_stats",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/wanopt/peer_stats/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+    "webcache": {
+        "class": "Webcache",
+        "path": "/wanopt/webcache",
+        "params": {"period": str},
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/wanopt/webcache/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -1,127 +0,0 @@
-"""
-FortiOS MONITOR - Monitor Wanopt Webcache
-
-Monitoring endpoint for monitor wanopt webcache data.
-
-API Endpoints:
-    GET    /monitor/wanopt/webcache
-
-Example Usage:
-    >>> from hfortix.FortiOS import FortiOS
-    >>> fgt = FortiOS(host="192.168.1.99", token="your-api-token")
-    >>>
-    >>> # Get monitoring/log data (read-only)
-    >>> data = fgt.api.monitor.wanopt.webcache.get()
-    >>>
-    >>> # With filters and parameters
-    >>> data = fgt.api.monitor.wanopt.webcache.get(
-    ...     count=100,
-    ...     start=0
-    ... )
-
-Note:
-    This is a read-only endpoint. Only GET operations are supported.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Any, Union
-
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from hfortix.FortiOS.http_client_interface import IHTTPClient
-
-
-class Reset:
-    """
-    Reset Operations.
-
-    Provides read-only access for FortiOS reset data.
-
-    Methods:
-        get(): Retrieve monitoring/log data (read-only)
-
-    Note:
-        This is a read-only endpoint. Configuration changes are not supported.
-    """
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Reset endpoint.
-
-        Args:
-            client: HTTPClient instance
-        """
-        self._client = client
-
-    def post(
-        self,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Reset webcache statistics.
-
-        Args:
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.wanopt.webcache.reset.post()
-        """
-        data = payload_dict.copy() if payload_dict else {}
-        data.update(kwargs)
-        return self._client.post(
-            "monitor", "/wanopt/webcache/reset", data=data
-        )
-
-
-class Webcache:
-    """Webcache operations."""
-
-    def __init__(self, client: "IHTTPClient"):
-        """
-        Initialize Webcache endpoint.
-
-        Args:
-            client: HTTPClient instance for API communication
-        """
-        self._client = client
-
-        # Initialize nested resources
-        self.reset = Reset(client)
-
-    def get(
-        self,
-        period: str | None = None,
-        payload_dict: dict[str, Any] | None = None,
-        raw_json: bool = False,
-        **kwargs: Any,
-    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
-        """
-        Retrieve webcache statistics history.
-
-        Args:
-            period: Statistics period [10-min*|hour|day|week|30-day].
-            (optional)
-            payload_dict: Optional dictionary of parameters
-            raw_json: Return raw JSON response if True
-            **kwargs: Additional parameters as keyword arguments
-
-        Returns:
-            Dictionary containing API response
-
-        Example:
-            >>> fgt.api.monitor.wanopt.webcache.get()
-        """
-        params = payload_dict.copy() if payload_dict else {}
-        if period is not None:
-            params["period"] = period
-        params.update(kwargs)
-        return self._client.get("monitor", "/wanopt/webcache", params=params)
@@ -3,20 +3,36 @@ FortiOS Monitor - Web Ui
 Web UI customization monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["WebUi"]
 
-from .custom_language import CustomLanguage
-from .language import Language
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "CustomLanguage": "._registry",
+        "Language": "._registry",
+    },
+)
 
 
 class WebUi:
     """WebUi Monitor category class"""
 
+    custom_language: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CustomLanguage"
+    )
+    language: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Language")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize WebUi Monitor category
@@ -26,10 +42,6 @@ class WebUi:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.custom_language = CustomLanguage(client)
-        self.language = Language(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["custom_language", "language"]
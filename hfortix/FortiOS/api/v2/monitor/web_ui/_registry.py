@@ -0,0 +1,56 @@
+"""FortiOS MONITOR - Web Ui endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "custom_language": {
+        "class": "CustomLanguage",
+        "path": "/web-ui/custom-language",
+        "methods": (),
+        "children": {
+            "create": {
+                "class": "Create",
+                "path": "/web-ui/custom-language/create",
+                "fields": {
+                    "lang_name": str,
+                    "lang_comments": str,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            },
+            "download": {
+                "class": "Download",
+                "path": "/web-ui/custom-language/download",
+                "params": {"lang_name": str},
+                "required": ("lang_name",),
+                "methods": ("get",),
+            },
+            "update": {
+                "class": "Update",
+                "path": "/web-ui/custom-language/update",
+                "fields": {
+                    "mkey": str,
+                    "lang_name": str,
+                    "lang_comments": str,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            },
+        },
+    },
+    "language": {
+        "class": "Language",
+        "path": "/web-ui/language",
+        "methods": (),
+        "children": {
+            "import_language": {
+                "class": "ImportLanguage",
+                "path": "/web-ui/language/import",
+                "fields": {"file_content": str},
+                "methods": ("post",),
+            }
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
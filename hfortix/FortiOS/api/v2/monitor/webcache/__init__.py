@@ -3,19 +3,32 @@ FortiOS Monitor - Webcache
 Web cache monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Webcache"]
 
-from .stats import Stats
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Stats": "._registry",
+    },
+)
 
 
 class Webcache:
     """Webcache Monitor category class"""
 
+    stats: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Stats")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Webcache Monitor category
@@ -25,9 +38,6 @@ class Webcache:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.stats = Stats(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["stats"]
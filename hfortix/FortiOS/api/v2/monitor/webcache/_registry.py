@@ -0,0 +1,21 @@
+"""FortiOS MONITOR - Webcache endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "stats": {
+        "class": "Stats",
+        "path": "/webcache/stats",
+        "params": {"period": str},
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/webcache/stats/reset",
+                "methods": ("post",),
+            }
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,23 +3,46 @@ FortiOS Monitor - Webfilter
 Web filter monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Webfilter"]
 
-from .category_quota import CategoryQuota
-from .fortiguard_categories import FortiguardCategories
-from .malicious_urls import MaliciousUrls
-from .override import Override
-from .trusted_urls import TrustedUrls
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "CategoryQuota": "._registry",
+        "FortiguardCategories": "._registry",
+        "MaliciousUrls": "._registry",
+        "Override": "._registry",
+        "TrustedUrls": "._registry",
+    },
+)
 
 
 class Webfilter:
     """Webfilter Monitor category class"""
 
+    category_quota: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "CategoryQuota"
+    )
+    fortiguard_categories: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "FortiguardCategories"
+    )
+    malicious_urls: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MaliciousUrls"
+    )
+    override: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Override")
+    trusted_urls: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("TrustedUrls")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Webfilter Monitor category
@@ -29,13 +52,6 @@ class Webfilter:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.category_quota = CategoryQuota(client)
-        self.fortiguard_categories = FortiguardCategories(client)
-        self.malicious_urls = MaliciousUrls(client)
-        self.override = Override(client)
-        self.trusted_urls = TrustedUrls(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
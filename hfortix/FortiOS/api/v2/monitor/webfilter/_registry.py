@@ -0,0 +1,57 @@
+"""FortiOS MONITOR - Webfilter endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "category_quota": {
+        "class": "CategoryQuota",
+        "path": "/webfilter/category-quota",
+        "params": {"profile": str, "user": str},
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/webfilter/category-quota/reset",
+                "fields": {"profile": str, "user": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "fortiguard_categories": {
+        "class": "FortiguardCategories",
+        "path": "/webfilter/fortiguard-categories",
+        "methods": ("get",),
+    },
+    "malicious_urls": {
+        "class": "MaliciousUrls",
+        "path": "/webfilter/malicious-urls",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "stat": {
+                "class": "Stat",
+                "path": "/webfilter/malicious-urls/stat",
+                "methods": ("get",),
+            }
+        },
+    },
+    "override": {
+        "class": "Override",
+        "path": "/webfilter/override",
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "delete": {
+                "class": "Delete",
+                "path": "/webfilter/override/delete",
+                "fields": {"mkey": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "trusted_urls": {
+        "class": "TrustedUrls",
+        "path": "/webfilter/trusted-urls",
+        "methods": ("get", "iter", "aiter"),
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
@@ -3,19 +3,32 @@ FortiOS Monitor - Webproxy
 Web proxy monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Webproxy"]
 
-from .pacfile import Pacfile
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Pacfile": "._registry",
+    },
+)
 
 
 class Webproxy:
     """Webproxy Monitor category class"""
 
+    pacfile: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Pacfile")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Webproxy Monitor category
@@ -25,9 +38,6 @@ class Webproxy:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.pacfile = Pacfile(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["pacfile"]
@@ -0,0 +1,26 @@
+"""FortiOS MONITOR - Webproxy endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "pacfile": {
+        "class": "Pacfile",
+        "path": "/webproxy/pacfile",
+        "methods": (),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/webproxy/pacfile/download",
+                "methods": ("get",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/webproxy/pacfile/upload",
+                "fields": {"filename": str, "file_content": str},
+                "methods": ("post",),
+            },
+        },
+    }
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
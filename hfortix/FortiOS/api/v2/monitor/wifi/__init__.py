@@ -3,39 +3,80 @@ FortiOS Monitor - Wifi
 WiFi controller and AP monitoring
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
+    from hfortix.FortiOS.api._helpers.endpoint import MonitorEndpoint
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+
 __all__ = ["Wifi"]
 
-from .ap_channels import ApChannels
-from .ap_names import ApNames
-from .ap_profile import ApProfile
-from .ap_status import ApStatus
-from .client import Client
-from .euclid import Euclid
-from .firmware import Firmware
-from .interfering_ap import InterferingAp
-from .managed_ap import ManagedAp
-from .matched_devices import MatchedDevices
-from .meta import Meta
-from .nac_device import NacDevice
-from .network import Network
-from .region_image import RegionImage
-from .rogue_ap import RogueAp
-from .spectrum import Spectrum
-from .ssid import Ssid
-from .station_capability import StationCapability
-from .statistics import Statistics
-from .unassociated_devices import UnassociatedDevices
-from .vlan_probe import VlanProbe
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "ApChannels": "._registry",
+        "ApNames": "._registry",
+        "ApProfile": "._registry",
+        "ApStatus": "._registry",
+        "Client": "._registry",
+        "Euclid": "._registry",
+        "Firmware": "._registry",
+        "InterferingAp": "._registry",
+        "ManagedAp": "._registry",
+        "MatchedDevices": "._registry",
+        "Meta": "._registry",
+        "NacDevice": "._registry",
+        "Network": "._registry",
+        "RegionImage": "._registry",
+        "RogueAp": "._registry",
+        "Spectrum": "._registry",
+        "Ssid": "._registry",
+        "StationCapability": "._registry",
+        "Statistics": "._registry",
+        "UnassociatedDevices": "._registry",
+        "VlanProbe": "._registry",
+    },
+)
 
 
 class Wifi:
     """Wifi Monitor category class"""
 
+    ap_channels: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ApChannels")
+    ap_names: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ApNames")
+    ap_profile: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ApProfile")
+    ap_status: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ApStatus")
+    client: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Client")
+    euclid: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Euclid")
+    firmware: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Firmware")
+    interfering_ap: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "InterferingAp"
+    )
+    managed_ap: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("ManagedAp")
+    matched_devices: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "MatchedDevices"
+    )
+    meta: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Meta")
+    nac_device: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("NacDevice")
+    network: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Network")
+    region_image: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("RegionImage")
+    rogue_ap: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("RogueAp")
+    spectrum: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Spectrum")
+    ssid: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Ssid")
+    station_capability: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "StationCapability"
+    )
+    statistics: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("Statistics")
+    unassociated_devices: LazyEndpoint[MonitorEndpoint] = LazyEndpoint(
+        "UnassociatedDevices"
+    )
+    vlan_probe: LazyEndpoint[MonitorEndpoint] = LazyEndpoint("VlanProbe")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Wifi Monitor category
@@ -45,29 +86,6 @@ class Wifi:
         """
         self._client = client
 
-        # Initialize endpoints
-        self.ap_channels = ApChannels(client)
-        self.ap_names = ApNames(client)
-        self.ap_profile = ApProfile(client)
-        self.ap_status = ApStatus(client)
-        self.client = Client(client)
-        self.euclid = Euclid(client)
-        self.firmware = Firmware(client)
-        self.interfering_ap = InterferingAp(client)
-        self.managed_ap = ManagedAp(client)
-        self.matched_devices = MatchedDevices(client)
-        self.meta = Meta(client)
-        self.nac_device = NacDevice(client)
-        self.network = Network(client)
-        self.region_image = RegionImage(client)
-        self.rogue_ap = RogueAp(client)
-        self.spectrum = Spectrum(client)
-        self.ssid = Ssid(client)
-        self.station_capability = StationCapability(client)
-        self.statistics = Statistics(client)
-        self.unassociated_devices = UnassociatedDevices(client)
-        self.vlan_probe = VlanProbe(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return [
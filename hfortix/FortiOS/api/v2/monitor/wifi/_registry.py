@@ -0,0 +1,312 @@
+"""FortiOS MONITOR - Wifi endpoint registry"""
+
+from hfortix.FortiOS.api._helpers.endpoint import endpoint_classes
+
+ENDPOINTS = {
+    "ap_channels": {
+        "class": "ApChannels",
+        "path": "/wifi/ap_channels",
+        "params": {
+            "platform_type": str,
+            "country": str,
+            "indoor_outdoor": int,
+        },
+        "required": ("platform_type",),
+        "methods": ("get",),
+    },
+    "ap_names": {
+        "class": "ApNames",
+        "path": "/wifi/ap-names",
+        "methods": ("get", "iter", "aiter"),
+    },
+    "ap_profile": {
+        "class": "ApProfile",
+        "path": "/wifi/ap-profile",
+        "methods": (),
+        "children": {
+            "create_default": {
+                "class": "CreateDefault",
+                "path": "/wifi/ap-profile/create-default",
+                "fields": {"platform": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "ap_status": {
+        "class": "ApStatus",
+        "path": "/wifi/ap_status",
+        "methods": ("get",),
+    },
+    "client": {
+        "class": "Client",
+        "path": "/wifi/client",
+        "params": {
+            "type": str,
+            "with_triangulation": bool,
+            "with_stats": bool,
+            "mac": str,
+        },
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "disassociate": {
+                "class": "Disassociate",
+                "path": "/wifi/client/disassociate",
+                "fields": {"mac": str},
+                "methods": ("post",),
+            }
+        },
+    },
+    "euclid": {
+        "class": "Euclid",
+        "path": "/wifi/euclid",
+        "methods": ("get",),
+        "children": {
+            "reset": {
+                "class": "Reset",
+                "path": "/wifi/euclid/reset",
+                "methods": ("post",),
+            }
+        },
+    },
+    "firmware": {
+        "class": "Firmware",
+        "path": "/wifi/firmware",
+        "params": {"timeout": int, "version": str},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "download": {
+                "class": "Download",
+                "path": "/wifi/firmware/download",
+                "fields": {"image_id": str},
+                "methods": ("post",),
+            },
+            "push": {
+                "class": "Push",
+                "path": "/wifi/firmware/push",
+                "fields": {"serial": str, "image_id": str},
+                "methods": ("post",),
+            },
+            "upload": {
+                "class": "Upload",
+                "path": "/wifi/firmware/upload",
+                "fields": {"serials": str, "file_content": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "interfering_ap": {
+        "class": "InterferingAp",
+        "path": "/wifi/interfering_ap",
+        "params": {"wtp": str, "radio": int},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "managed_ap": {
+        "class": "ManagedAp",
+        "path": "/wifi/managed_ap",
+        "params": {"wtp_id": str, "incl_local": bool, "skip_eos": bool},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "led_blink": {
+                "class": "LedBlink",
+                "path": "/wifi/managed_ap/led-blink",
+                "fields": {"serials": list, "blink": bool, "duration": int},
+                "methods": ("post",),
+            },
+            "restart": {
+                "class": "Restart",
+                "path": "/wifi/managed_ap/restart",
+                "fields": {"wtpname": str},
+                "methods": ("post",),
+            },
+            "set_status": {
+                "class": "SetStatus",
+                "path": "/wifi/managed_ap/set_status",
+                "fields": {"wtpname": str, "admin": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "matched_devices": {
+        "class": "MatchedDevices",
+        "path": "/wifi/matched-devices",
+        "params": {"mac": str},
+        "methods": ("get",),
+    },
+    "meta": {"class": "Meta", "path": "/wifi/meta", "methods": ("get",)},
+    "nac_device": {
+        "class": "NacDevice",
+        "path": "/wifi/nac-device",
+        "methods": (),
+        "children": {
+            "stats": {
+                "class": "Stats",
+                "path": "/wifi/nac-device/stats",
+                "methods": ("get",),
+            }
+        },
+    },
+    "network": {
+        "class": "Network",
+        "path": "/wifi/network",
+        "methods": (),
+        "children": {
+            "connect": {
+                "class": "Connect",
+                "path": "/wifi/network/connect",
+                "fields": {"ssid": str},
+                "methods": ("post",),
+            },
+            "list": {
+                "class": "List",
+                "path": "/wifi/network/list",
+                "methods": ("get",),
+            },
+            "scan": {
+                "class": "Scan",
+                "path": "/wifi/network/scan",
+                "methods": ("post",),
+            },
+            "status": {
+                "class": "Status",
+                "path": "/wifi/network/status",
+                "methods": ("get",),
+            },
+        },
+    },
+    "region_image": {
+        "class": "RegionImage",
+        "path": "/wifi/region-image",
+        "params": {"region_name": str},
+        "required": ("region_name",),
+        "methods": ("get",),
+        "children": {
+            "upload": {
+                "class": "Upload",
+                "path": "/wifi/region-image/upload",
+                "fields": {
+                    "region_name": str,
+                    "image_type": str,
+                    "file_content": str,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "rogue_ap": {
+        "class": "RogueAp",
+        "path": "/wifi/rogue_ap",
+        "params": {"managed_ssid_only": bool},
+        "methods": ("get", "iter", "aiter"),
+        "children": {
+            "clear_all": {
+                "class": "ClearAll",
+                "path": "/wifi/rogue_ap/clear_all",
+                "methods": ("post",),
+            },
+            "set_status": {
+                "class": "SetStatus",
+                "path": "/wifi/rogue_ap/set_status",
+                "fields": {"bssid": list, "ssid": list, "status": str},
+                "methods": ("post",),
+            },
+        },
+    },
+    "spectrum": {
+        "class": "Spectrum",
+        "path": "/wifi/spectrum",
+        "params": {"wtp_id": str},
+        "required": ("wtp_id",),
+        "methods": ("get",),
+        "children": {
+            "keep_alive": {
+                "class": "KeepAlive",
+                "path": "/wifi/spectrum/keep-alive",
+                "fields": {"wtp_id": str, "radio_id": int, "duration": int},
+                "methods": ("post",),
+            },
+            "start": {
+                "class": "Start",
+                "path": "/wifi/spectrum/start",
+                "fields": {
+                    "wtp_id": str,
+                    "radio_id": int,
+                    "channels": list,
+                    "duration": int,
+                },
+                "methods": ("post",),
+            },
+            "stop": {
+                "class": "Stop",
+                "path": "/wifi/spectrum/stop",
+                "fields": {"wtp_id": str, "radio_id": int},
+                "methods": ("post",),
+            },
+        },
+    },
+    "ssid": {
+        "class": "Ssid",
+        "path": "/wifi/ssid",
+        "methods": (),
+        "children": {
+            "generate_keys": {
+                "class": "GenerateKeys",
+                "path": "/wifi/ssid/generate-keys",
+                "fields": {
+                    "mpsk_profile": str,
+                    "group": str,
+                    "prefix": str,
+                    "count": int,
+                    "key_length": int,
+                },
+                "methods": ("post",),
+            }
+        },
+    },
+    "station_capability": {
+        "class": "StationCapability",
+        "path": "/wifi/station-capability",
+        "params": {"mac_address": str, "min_age": int, "max_age": int},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "statistics": {
+        "class": "Statistics",
+        "path": "/wifi/statistics",
+        "methods": ("get",),
+    },
+    "unassociated_devices": {
+        "class": "UnassociatedDevices",
+        "path": "/wifi/unassociated-devices",
+        "params": {"with_triangulation": bool},
+        "methods": ("get", "iter", "aiter"),
+    },
+    "vlan_probe": {
+        "class": "VlanProbe",
+        "path": "/wifi/vlan-probe",
+        "params": {"ap_interface": int, "wtp": str},
+        "required": ("ap_interface", "wtp"),
+        "methods": ("get",),
+        "children": {
+            "start": {
+                "class": "Start",
+                "path": "/wifi/vlan-probe/start",
+                "fields": {
+                    "ap_interface": int,
+                    "wtp": str,
+                    "start_vlan_id": int,
+                    "end_vlan_id": int,
+                    "retries": int,
+                    "timeout": int,
+                },
+                "methods": ("post",),
+            },
+            "stop": {
+                "class": "Stop",
+                "path": "/wifi/vlan-probe/stop",
+                "fields": {"ap_interface": int, "wtp": str},
+                "methods": ("post",),
+            },
+        },
+    },
+}
+
+__getattr__ = endpoint_classes(__name__, "monitor", ENDPOINTS)
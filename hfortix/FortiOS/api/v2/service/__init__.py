@@ -7,11 +7,26 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from hfortix.FortiOS.api._helpers import LazyEndpoint, lazy_imports
+
 if TYPE_CHECKING:
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
+    from .security_rating.security_rating import SecurityRating
+    from .sniffer.sniffer import Sniffer
+    from .system.system import System
+
 __all__ = ["Service"]
 
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        "Sniffer": ".sniffer.sniffer",
+        "SecurityRating": ".security_rating.security_rating",
+        "System": ".system.system",
+    },
+)
+
 
 class Service:
     """
@@ -19,6 +34,12 @@ class Service:
     Provides access to service endpoints
     """
 
+    sniffer: LazyEndpoint[Sniffer] = LazyEndpoint("Sniffer")
+    security_rating: LazyEndpoint[SecurityRating] = LazyEndpoint(
+        "SecurityRating"
+    )
+    system: LazyEndpoint[System] = LazyEndpoint("System")
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize Service helper
@@ -28,15 +49,6 @@ class Service:
         """
         self._client = client
 
-        # Initialize endpoint classes
-        from .security_rating.security_rating import SecurityRating
-        from .sniffer.sniffer import Sniffer
-        from .system.system import System
-
-        self.sniffer = Sniffer(client)
-        self.security_rating = SecurityRating(client)
-        self.system = System(client)
-
     def __dir__(self):
         """Control autocomplete to show only public attributes"""
         return ["sniffer", "security_rating", "system"]
@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
+    from hfortix.FortiOS.download import DownloadTarget
     from hfortix.FortiOS.http_client_interface import IHTTPClient
 
 
@@ -165,6 +166,58 @@ class Download:
             raw_json=raw_json,
         )
 
+    def download(
+        self,
+        dest: "DownloadTarget",
+        mkey: Optional[str] = None,
+        vdom: Optional[str] = None,
+        checksum: Optional[str] = None,
+        payload_dict: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Stream the PCAP file of a packet capture to disk.
+
+        The capture is written in chunks as it downloads and never held in
+        memory as a whole.
+
+        Args:
+            dest: File path or binary file object opened for writing
+            mkey: Packet Capture name.
+            vdom: Virtual Domain name
+            checksum: hashlib algorithm computed while writing (e.g.
+            "sha256")
+            payload_dict: Alternative to individual parameters - pass all
+            params as dict
+            **kwargs: Additional parameters to pass to the API
+
+        Returns:
+            Dictionary with path, bytes and (if requested) checksum
+
+        Example:
+            result = fgt.api.service.sniffer.download.download(
+                "capture.pcap", mkey="capture1", checksum="sha256"
+            )
+        """
+        if payload_dict:
+            params = payload_dict.copy()
+        else:
+            params = {}
+        if mkey is not None:
+            params["mkey"] = mkey
+
+        params.update(kwargs)
+
+        return self._client.download(
+            "service",
+            "sniffer/download/",
+            dest,
+            vdom=vdom,
+            data=params,
+            method="POST",
+            checksum=checksum,
+        )
+
 
 class List:
     """List resource"""
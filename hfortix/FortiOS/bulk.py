@@ -0,0 +1,494 @@
+"""
+Bulk create/update of CMDB objects.
+
+Creating thousands of objects one ``post()`` after the other is bound by
+round-trip latency, not by the FortiGate. bulk_apply() (sync, threads) and
+abulk_apply() (async, tasks) keep ``concurrency`` requests in flight over
+any generated CMDB endpoint:
+
+    >>> summary = bulk_apply(
+    ...     fgt.api.cmdb.firewall.address,
+    ...     ({"name": f"host-{i}", "subnet": f"10.0.{i >> 8}.{i & 255}/32"}
+    ...      for i in range(20000)),
+    ...     concurrency=16,
+    ... )
+    >>> summary
+    BulkSummary(total=20000, created=19874, updated=126, skipped=0,
+    failed=0, elapsed=98.214s)
+
+Each payload is POSTed; if the object already exists (DuplicateEntryError)
+it is updated with PUT instead (``on_duplicate``). A failing item never
+aborts the run - its error is recorded in a BulkResult and the remaining
+payloads are still applied. Payloads use the FortiOS field names, the same
+as entries returned by ``get()`` / ``iter()``, so a table read from one
+device can be applied to another as is.
+
+Payloads are consumed lazily: at most about twice ``concurrency`` of them
+are held at once, so a generator over a huge source works.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from .api._helpers.endpoint import Endpoint, python_name
+from .exceptions_forti import DuplicateEntryError
+
+logger = logging.getLogger("hfortix.bulk")
+
+__all__ = ["BulkResult", "BulkSummary", "abulk_apply", "bulk_apply"]
+
+_ON_DUPLICATE = ("update", "skip", "error")
+
+ProgressCallback = Callable[["BulkSummary"], Any]
+
+
+class BulkResult:
+    """Outcome of one payload of a bulk apply"""
+
+    __slots__ = ("index", "key", "action", "result", "error", "elapsed")
+
+    def __init__(
+        self,
+        index: int,
+        key: Any,
+        action: str,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.index = index
+        self.key = key
+        # "created", "updated", "skipped", "deleted" or "failed"
+        self.action = action
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """True if the payload was applied (or skipped as a duplicate)"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = self.action if self.ok else type(self.error).__name__
+        return (
+            f"BulkResult(index={self.index}, key={self.key!r}, "
+            f"status={status}, elapsed={self.elapsed:.3f}s)"
+        )
+
+
+class BulkSummary:
+    """
+    Per-item results and counters of a bulk apply
+
+    ``results`` is ordered by payload position once the run has finished;
+    progress callbacks see it in completion order.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[BulkResult] = []
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.deleted = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of payloads processed so far"""
+        return len(self.results)
+
+    @property
+    def ok(self) -> bool:
+        """True if no payload failed"""
+        return self.failed == 0
+
+    @property
+    def errors(self) -> list[BulkResult]:
+        """Results of the payloads that failed"""
+        return [r for r in self.results if r.error is not None]
+
+    def add(self, result: BulkResult) -> None:
+        """Record the outcome of one payload"""
+        self.results.append(result)
+        if result.action == "created":
+            self.created += 1
+        elif result.action == "updated":
+            self.updated += 1
+        elif result.action == "skipped":
+            self.skipped += 1
+        elif result.action == "deleted":
+            self.deleted += 1
+        else:
+            self.failed += 1
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkSummary(total={self.total}, created={self.created}, "
+            f"updated={self.updated}, skipped={self.skipped}, "
+            f"deleted={self.deleted}, failed={self.failed}, "
+            f"elapsed={self.elapsed:.3f}s)"
+        )
+
+
+class Progress:
+    """Feeds results into the summary and calls on_progress every N"""
+
+    def __init__(
+        self,
+        summary: BulkSummary,
+        callback: Optional[ProgressCallback],
+        every: int,
+    ) -> None:
+        if every <= 0:
+            raise ValueError("progress_every must be > 0")
+        self.summary = summary
+        self._callback = callback
+        self._every = every
+        self._reported = 0
+        self._start = time.perf_counter()
+
+    def add(self, result: BulkResult) -> None:
+        summary = self.summary
+        summary.add(result)
+        if result.error is not None:
+            logger.debug(
+                "Bulk item %d (%r) failed: %s",
+                result.index,
+                result.key,
+                result.error,
+            )
+        if summary.total - self._reported >= self._every:
+            self._report()
+
+    def _report(self) -> None:
+        self._reported = self.summary.total
+        self.summary.elapsed = time.perf_counter() - self._start
+        if self._callback is not None:
+            self._callback(self.summary)
+
+    def finish(self) -> BulkSummary:
+        summary = self.summary
+        summary.results.sort(key=lambda r: r.index)
+        if summary.total != self._reported:
+            self._report()
+        summary.elapsed = time.perf_counter() - self._start
+        return summary
+
+
+def key_param(endpoint: Any) -> Optional[str]:
+    """Name of the identifier argument of the endpoint's put()"""
+    cls = type(endpoint)
+    if not hasattr(cls, "post") or not hasattr(cls, "put"):
+        # Singleton tables (system/global, ...) can't be created
+        raise TypeError(
+            f"{cls.__name__} is not a CMDB table endpoint (needs post() and "
+            "put())"
+        )
+    if isinstance(endpoint, Endpoint):
+        return python_name(endpoint.mkey) if endpoint.mkey else None
+    for name in inspect.signature(cls.put).parameters:
+        if name != "self":
+            return None if name == "payload_dict" else name
+    return None
+
+
+class _Apply:
+    """Applies one payload: POST, then PUT/skip on a duplicate"""
+
+    def __init__(
+        self,
+        endpoint: Any,
+        on_duplicate: str,
+        vdom: Optional[Union[str, bool]],
+    ) -> None:
+        if on_duplicate not in _ON_DUPLICATE:
+            raise ValueError(
+                f"on_duplicate must be one of {', '.join(_ON_DUPLICATE)}"
+            )
+        self._endpoint = endpoint
+        self._on_duplicate = on_duplicate
+        self._vdom = vdom
+        self._param = key_param(endpoint)
+        self._field = self._param.replace("_", "-") if self._param else None
+
+    def key(self, payload: Any) -> Any:
+        if self._field is None or not isinstance(payload, dict):
+            return None
+        key = payload.get(self._field)
+        if key is None and self._param is not None:
+            key = payload.get(self._param)
+        return key
+
+    def _put_kwargs(self, key: Any) -> dict[str, Any]:
+        return {self._param: key} if self._param is not None else {}
+
+    def run(self, index: int, payload: Any) -> BulkResult:
+        start = time.perf_counter()
+        key = self.key(payload)
+        action = "created"
+        try:
+            try:
+                result = self._endpoint.post(
+                    payload_dict=payload, vdom=self._vdom
+                )
+            except DuplicateEntryError:
+                if self._on_duplicate == "error":
+                    raise
+                action = "updated"
+                result = None
+                if self._on_duplicate == "skip":
+                    action = "skipped"
+                else:
+                    result = self._endpoint.put(
+                        payload_dict=payload,
+                        vdom=self._vdom,
+                        **self._put_kwargs(key),
+                    )
+        except Exception as e:
+            action = "failed"
+            return BulkResult(
+                index,
+                key,
+                action,
+                error=e,
+                elapsed=time.perf_counter() - start,
+            )
+        return BulkResult(
+            index, key, action, result, elapsed=time.perf_counter() - start
+        )
+
+    async def arun(self, index: int, payload: Any) -> BulkResult:
+        start = time.perf_counter()
+        key = self.key(payload)
+        action = "created"
+        try:
+            try:
+                result = await self._endpoint.post(
+                    payload_dict=payload, vdom=self._vdom
+                )
+            except DuplicateEntryError:
+                if self._on_duplicate == "error":
+                    raise
+                action = "updated"
+                result = None
+                if self._on_duplicate == "skip":
+                    action = "skipped"
+                else:
+                    result = await self._endpoint.put(
+                        payload_dict=payload,
+                        vdom=self._vdom,
+                        **self._put_kwargs(key),
+                    )
+        except Exception as e:
+            action = "failed"
+            return BulkResult(
+                index,
+                key,
+                action,
+                error=e,
+                elapsed=time.perf_counter() - start,
+            )
+        return BulkResult(
+            index, key, action, result, elapsed=time.perf_counter() - start
+        )
+
+
+def is_async(endpoint: Any) -> bool:
+    """True if the endpoint uses an async client"""
+    client = getattr(endpoint, "_client", None)
+    return inspect.iscoroutinefunction(getattr(client, "post", None))
+
+
+def apply_all(
+    work: Callable[[int, Any], BulkResult],
+    items: Iterable[tuple[int, Any]],
+    concurrency: int,
+    progress: Progress,
+) -> None:
+    """Run ``work(index, item)`` for all items on a thread pool"""
+    pool = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="hfortix-bulk"
+    )
+    pending: set[Future] = set()
+    try:
+        for index, item in items:
+            pending.add(pool.submit(work, index, item))
+            # Queue one extra item per worker so none idles between
+            # results, but never pull the whole input into memory
+            if len(pending) >= 2 * concurrency:
+                done, pending = wait_futures(
+                    pending, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    progress.add(future.result())
+        while pending:
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                progress.add(future.result())
+    finally:
+        # Only reached with work pending if the input or a progress
+        # callback raised; requests already on the wire are waited for
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def bulk_apply(
+    endpoint: Any,
+    payloads: Iterable[dict[str, Any]],
+    concurrency: int = 8,
+    on_duplicate: str = "update",
+    vdom: Optional[Union[str, bool]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_every: int = 100,
+) -> BulkSummary:
+    """
+    Create or update many objects of a CMDB table concurrently (sync mode)
+
+    Args:
+        endpoint: CMDB endpoint object, e.g. ``fgt.api.cmdb.firewall.address``
+        payloads: Objects to apply (FortiOS field names); consumed lazily
+        concurrency: Requests in flight at once, using background threads
+            (default: 8). Requires a thread-safe client such as HTTPClient;
+            keep it within the client's ``max_connections``
+        on_duplicate: What to do when the object already exists:
+            "update" (PUT the payload, default), "skip" or "error" (record
+            the DuplicateEntryError as a failure)
+        vdom: Virtual domain for every request (default: client default)
+        on_progress: Called with the BulkSummary every ``progress_every``
+            completed payloads and once at the end, in the calling thread
+        progress_every: Payloads between progress callbacks (default: 100)
+
+    Returns:
+        BulkSummary with one BulkResult per payload, in payload order.
+        Failed payloads do not raise; check ``summary.ok`` /
+        ``summary.errors``
+
+    Raises:
+        TypeError: If the endpoint uses an async client (use abulk_apply)
+
+    Example:
+        >>> summary = bulk_apply(
+        ...     fgt.api.cmdb.firewall.address,
+        ...     addresses,
+        ...     concurrency=16,
+        ...     on_progress=lambda s: print(f"{s.total} done"),
+        ...     progress_every=1000,
+        ... )
+        >>> for failure in summary.errors:
+        ...     print(failure.key, failure.error)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if is_async(endpoint):
+        raise TypeError(
+            "bulk_apply() is not available in async mode, use abulk_apply() "
+            "instead"
+        )
+    apply = _Apply(endpoint, on_duplicate, vdom)
+    progress = Progress(BulkSummary(), on_progress, progress_every)
+    apply_all(apply.run, enumerate(payloads), concurrency, progress)
+    return progress.finish()
+
+
+async def aenumerate(
+    payloads: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[tuple[int, Any]]:
+    """enumerate() for sync or async iterables, as an async iterator"""
+    index = 0
+    if isinstance(payloads, AsyncIterable):
+        async for payload in payloads:
+            yield index, payload
+            index += 1
+    else:
+        for payload in payloads:
+            yield index, payload
+            index += 1
+
+
+async def aapply_all(
+    work: Callable[[int, Any], Awaitable[BulkResult]],
+    items: AsyncIterator[tuple[int, Any]],
+    concurrency: int,
+    progress: Progress,
+) -> None:
+    """Run ``work(index, item)`` for all items on worker tasks"""
+    # Async generators can't be advanced by two tasks at the same time
+    lock = asyncio.Lock()
+
+    async def worker() -> None:
+        while True:
+            async with lock:
+                try:
+                    index, item = await items.__anext__()
+                except StopAsyncIteration:
+                    return
+            progress.add(await work(index, item))
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def abulk_apply(
+    endpoint: Any,
+    payloads: Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]]],
+    concurrency: int = 8,
+    on_duplicate: str = "update",
+    vdom: Optional[Union[str, bool]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_every: int = 100,
+) -> BulkSummary:
+    """
+    Create or update many objects of a CMDB table concurrently (async mode)
+
+    Same as bulk_apply() for endpoints of an async client; ``payloads``
+    may also be an async iterable. ``concurrency`` worker tasks each keep
+    one request in flight.
+
+    Raises:
+        TypeError: If the endpoint uses a sync client (use bulk_apply)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if not is_async(endpoint):
+        raise TypeError(
+            "abulk_apply() is only available in async mode, use "
+            "bulk_apply() instead"
+        )
+    apply = _Apply(endpoint, on_duplicate, vdom)
+    progress = Progress(BulkSummary(), on_progress, progress_every)
+    await aapply_all(apply.arun, aenumerate(payloads), concurrency, progress)
+    return progress.finish()
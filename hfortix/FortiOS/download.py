@@ -0,0 +1,108 @@
+"""
+Streaming binary downloads.
+
+Config backups, archived packet captures and sniffer captures can be
+hundreds of megabytes. ``get_binary()`` holds the whole body in memory;
+``iter_binary()`` and ``download()`` on HTTPClient and AsyncHTTPClient
+instead pass each chunk on as it arrives from the socket.
+
+DownloadSink is the file side of ``download()``, shared by both clients:
+it writes chunks to a path or an open binary file object and feeds them
+to an optional hashlib checksum on the way. A download to a path goes to
+``<path>.part`` first and is renamed into place only once the body is
+complete, so an interrupted download never leaves a truncated file under
+the final name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, BinaryIO, Optional, Union
+
+__all__ = ["DownloadSink", "DownloadTarget"]
+
+DownloadTarget = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+class DownloadSink:
+    """
+    Destination of a streamed download
+
+    Args:
+        dest: File path, or a binary file object opened for writing (it is
+            written to but not closed)
+        checksum: hashlib algorithm computed over the body while it is
+            written (e.g. "sha256"), or None
+
+    Raises:
+        ValueError: If the checksum algorithm is not supported by hashlib
+
+    Example:
+        >>> sink = DownloadSink("backup.conf", checksum="sha256")
+        >>> try:
+        ...     for chunk in chunks:
+        ...         sink.write(chunk)
+        ... except BaseException:
+        ...     sink.abort()
+        ...     raise
+        >>> result = sink.commit()
+    """
+
+    def __init__(
+        self, dest: DownloadTarget, checksum: Optional[str] = None
+    ) -> None:
+        try:
+            self._hash = hashlib.new(checksum) if checksum else None
+        except ValueError:
+            raise ValueError(
+                f"Unsupported checksum algorithm {checksum!r}; use one of "
+                f"{', '.join(sorted(hashlib.algorithms_available))}"
+            ) from None
+        self._checksum = checksum
+        self._bytes = 0
+        self._path: Optional[str] = None
+        self._part: Optional[str] = None
+        if isinstance(dest, (str, os.PathLike)):
+            self._path = os.fspath(dest)
+            self._part = self._path + ".part"
+            self._file: BinaryIO = open(self._part, "wb")
+        else:
+            self._file = dest
+
+    def write(self, chunk: bytes) -> None:
+        """Write one chunk of the body"""
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self._bytes += len(chunk)
+
+    def commit(self) -> dict[str, Any]:
+        """
+        Finish the download and move a path download into place
+
+        Returns:
+            Dictionary with ``path`` (None for file objects), ``bytes`` and,
+            if requested, ``checksum`` (hex digest) and ``algorithm``
+        """
+        if self._path is not None:
+            self._file.close()
+            assert self._part is not None
+            os.replace(self._part, self._path)
+        else:
+            self._file.flush()
+        result: dict[str, Any] = {"path": self._path, "bytes": self._bytes}
+        if self._hash is not None:
+            result["checksum"] = self._hash.hexdigest()
+            result["algorithm"] = self._checksum
+        return result
+
+    def abort(self) -> None:
+        """Close and remove a partial path download"""
+        if self._path is not None:
+            self._file.close()
+            assert self._part is not None
+            try:
+                os.remove(self._part)
+            except OSError:
+                pass
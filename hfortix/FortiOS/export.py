@@ -0,0 +1,792 @@
+"""
+Columnar export of CMDB tables and logs to Arrow, Parquet and CSV.
+
+Analytics jobs want columns, not lists of dicts. The functions here take
+the streaming iterators the API already has - ``iter()`` / ``aiter()`` of
+CMDB and monitor endpoints, ``iter()`` of log endpoints, or the LogBatch
+objects of ``raw.iter_batches()`` - and turn them into columns batch by
+batch, so no more than ``batch_size`` entries are ever held in memory:
+
+- to_arrow_batches(): pyarrow RecordBatch objects
+- write_parquet(): a Parquet file, one row group per batch
+- write_csv(): a CSV file, written one batch at a time (no pyarrow needed)
+
+Each has an async twin (ato_arrow_batches(), awrite_parquet(),
+awrite_csv()) taking an async iterator, and export_table() /
+aexport_table() export a whole endpoint in one call.
+
+The schema (column names and types) is fixed before the first row is
+written. For CMDB endpoints endpoint_schema() derives it from the field
+definitions of the endpoint's ``post()`` method (``route_tag: int`` ->
+``route-tag`` int64 column; table fields like ``srcintf`` -> JSON text).
+Otherwise it is inferred from the first batch. Fields outside the schema
+are not exported.
+
+Path destinations are written to ``<path>.part`` and renamed into place
+when complete, so a failed export never leaves a truncated file.
+"""
+
+from __future__ import annotations
+
+import csv
+import inspect
+import json
+import os
+from itertools import repeat
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from .api._helpers.endpoint import Endpoint
+from .api.v2.log.parser import LogBatch
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "aexport_table",
+    "ato_arrow_batches",
+    "awrite_csv",
+    "awrite_parquet",
+    "endpoint_schema",
+    "export_table",
+    "infer_schema",
+    "to_arrow_batches",
+    "write_csv",
+    "write_parquet",
+]
+
+DEFAULT_BATCH_SIZE = 10000
+
+# Column kinds: "int", "float", "bool", "str" and "json" (nested values
+# encoded as JSON text)
+Schema = dict[str, str]
+SchemaLike = Mapping[str, Union[str, type]]
+
+# post() parameters that are not fields of the table
+_CONTROL_PARAMS = {"self", "payload_dict", "nkey", "vdom", "raw_json"}
+
+_PY_KINDS: dict[Any, str] = {
+    int: "int",
+    float: "float",
+    bool: "bool",
+    str: "str",
+    list: "json",
+    dict: "json",
+}
+_KINDS = {"int", "float", "bool", "str", "json"}
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet export require the pyarrow package "
+            "(pip install pyarrow)"
+        ) from e
+    return pyarrow
+
+
+def _annotation_kind(annotation: Any) -> str:
+    if not isinstance(annotation, str):
+        annotation = getattr(annotation, "__name__", str(annotation))
+    annotation = annotation.replace(" ", "").replace("|None", "")
+    if annotation.startswith(("list", "dict", "List", "Dict")):
+        return "json"
+    return _PY_KINDS.get(
+        {"int": int, "float": float, "bool": bool}.get(annotation), "str"
+    )
+
+
+def endpoint_schema(endpoint: Any) -> Schema:
+    """
+    Column schema of a CMDB endpoint, from its field definitions
+
+    Args:
+        endpoint: Endpoint object, e.g. ``fgt.api.cmdb.firewall.address``
+
+    Returns:
+        Field name (FortiOS spelling) -> column kind, in definition order
+
+    Raises:
+        ValueError: If the endpoint has no field definitions (read-only
+            endpoints have no ``post()``; their schema is inferred instead)
+
+    Example:
+        >>> schema = endpoint_schema(fgt.api.cmdb.firewall.address)
+        >>> schema["route-tag"], schema["macaddr"], schema["subnet"]
+        ('int', 'json', 'str')
+    """
+    post = getattr(type(endpoint), "post", None)
+    if post is None:
+        raise ValueError(f"{type(endpoint).__name__} has no field definitions")
+    if isinstance(endpoint, Endpoint):
+        return {
+            field: _annotation_kind(kind)
+            for field, kind in endpoint.fields.items()
+        }
+    schema = {}
+    for param in inspect.signature(post).parameters.values():
+        if param.name in _CONTROL_PARAMS or param.kind in (
+            param.VAR_POSITIONAL,
+            param.VAR_KEYWORD,
+        ):
+            continue
+        schema[param.name.replace("_", "-")] = _annotation_kind(
+            param.annotation
+        )
+    return schema
+
+
+def _value_kind(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return _PY_KINDS.get(type(value), "str")
+
+
+def _merge_kinds(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+    if "json" in (a, b):
+        return "json"
+    if {a, b} == {"int", "float"}:
+        return "float"
+    return "str"
+
+
+def infer_schema(records: Iterable[Any]) -> Schema:
+    """
+    Infer a column schema from sample entries
+
+    Args:
+        records: Entries (dicts) to sample, usually the first batch
+
+    Returns:
+        Field name -> column kind, in order of first appearance; fields
+        that are always None become "str"
+    """
+    kinds: dict[str, Optional[str]] = {}
+    for record in records:
+        for name, value in record.items():
+            kinds[name] = _merge_kinds(kinds.get(name), _value_kind(value))
+    return {name: kind or "str" for name, kind in kinds.items()}
+
+
+def _batch_schema(batch: LogBatch) -> Schema:
+    schema = {}
+    for name, column in batch.columns.items():
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None and dtype.kind in "iu":
+            schema[name] = "int"
+        elif dtype is not None and dtype.kind == "f":
+            schema[name] = "float"
+        else:
+            kind = None
+            for value in column:
+                kind = _value_kind(value)
+                if kind is not None:
+                    break
+            schema[name] = kind or "str"
+    return schema
+
+
+def _normalize_schema(schema: Optional[SchemaLike]) -> Optional[Schema]:
+    if schema is None:
+        return None
+    normalized = {}
+    for name, kind in schema.items():
+        kind = _PY_KINDS.get(kind, kind)
+        if kind not in _KINDS:
+            raise ValueError(
+                f"Unsupported column type {kind!r} for {name!r}; use one of "
+                "int, float, bool, str, json (or the Python types)"
+            )
+        normalized[name] = kind
+    return normalized
+
+
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _coerce(name: str, kind: str, values: list[Any]) -> list[Any]:
+    """Convert a column of raw entry values to its kind"""
+    if values.count(None) == len(values):
+        # Field not set on any entry of the batch (common for CMDB tables)
+        return values
+    if kind == "json":
+        return [
+            v if v is None or isinstance(v, str) else _dumps(v) for v in values
+        ]
+    if kind == "str":
+        return [v if v is None or type(v) is str else str(v) for v in values]
+    if kind in ("int", "float"):
+        convert = int if kind == "int" else float
+        try:
+            if None not in values:
+                return list(map(convert, values))
+            return [None if v is None else convert(v) for v in values]
+        except (TypeError, ValueError):
+            bad = next(
+                v for v in values if v is not None and not _fits(convert, v)
+            )
+            raise ValueError(
+                f"Field {name!r}: {bad!r} is not a valid {kind}"
+            ) from None
+    return values
+
+
+def _plain(column: Any) -> list[Any]:
+    """NumPy column as a list, with NaN (missing float values) as None"""
+    values = column.tolist()
+    if column.dtype.kind == "f":
+        values = [None if v != v else v for v in values]
+    return values
+
+
+def _fits(convert: Any, value: Any) -> bool:
+    try:
+        convert(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+class _Batcher:
+    """
+    Collects entries (or LogBatches) into column batches of one schema
+
+    Columns hold the raw values; the writers convert them to their kind.
+
+    Args:
+        schema: Fixed schema, or None to infer it from the first batch
+        fields: Columns to export, in order (default: the whole schema)
+        batch_size: Entries per batch
+    """
+
+    def __init__(
+        self,
+        schema: Optional[SchemaLike],
+        fields: Optional[list[str]],
+        batch_size: int,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        self.schema = _normalize_schema(schema)
+        self._fields = fields
+        self._batch_size = batch_size
+        self._records: list[Any] = []
+        self.rows = 0
+
+    def _set_schema(self, inferred: Schema) -> Schema:
+        schema = self.schema if self.schema is not None else inferred
+        if self._fields is not None:
+            schema = {
+                f: schema.get(f, inferred.get(f, "str")) for f in self._fields
+            }
+        self.schema = schema
+        self._fields = None
+        return schema
+
+    def _records_batch(self) -> dict[str, Any]:
+        records, self._records = self._records, []
+        if self._fields is not None or self.schema is None:
+            self._set_schema(infer_schema(records))
+        assert self.schema is not None
+        self.rows += len(records)
+        return {
+            name: list(map(dict.get, records, repeat(name)))
+            for name in self.schema
+        }
+
+    def _log_batch(self, batch: LogBatch) -> dict[str, Any]:
+        if self._fields is not None or self.schema is None:
+            self._set_schema(_batch_schema(batch))
+        assert self.schema is not None
+        self.rows += batch.num_rows
+        columns = {}
+        for name in self.schema:
+            column = batch.get(name)
+            if column is None:
+                column = [None] * batch.num_rows
+            columns[name] = column
+        return columns
+
+    def add(self, item: Any) -> list[dict[str, Any]]:
+        """Add an entry or LogBatch; returns the batches now complete"""
+        if isinstance(item, LogBatch):
+            ready = self.flush()
+            if item.num_rows:
+                ready.append(self._log_batch(item))
+            return ready
+        self._records.append(item)
+        if len(self._records) >= self._batch_size:
+            return [self._records_batch()]
+        return []
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Return the pending entries as a batch (if any)"""
+        return [self._records_batch()] if self._records else []
+
+
+def _arrow_type(pa: Any, kind: str) -> Any:
+    return {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "str": pa.string(),
+        "json": pa.string(),
+    }[kind]
+
+
+def _arrow_schema(pa: Any, schema: Schema) -> Any:
+    return pa.schema([(n, _arrow_type(pa, k)) for n, k in schema.items()])
+
+
+def _arrow_array(pa: Any, name: str, kind: str, column: Any) -> Any:
+    arrow_type = _arrow_type(pa, kind)
+    if kind != "json":
+        try:
+            # Most columns already hold the right Python type; let Arrow
+            # convert them in C++. from_pandas: NaN becomes null
+            return pa.array(column, type=arrow_type, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    if hasattr(column, "tolist"):
+        column = _plain(column)
+    return pa.array(_coerce(name, kind, list(column)), type=arrow_type)
+
+
+def _record_batch(
+    pa: Any, schema: Optional[Schema], columns: dict[str, Any]
+) -> Any:
+    # The batcher sets the schema before it returns the first batch
+    assert schema is not None
+    arrays = [
+        _arrow_array(pa, name, kind, columns[name])
+        for name, kind in schema.items()
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=_arrow_schema(pa, schema))
+
+
+def to_arrow_batches(
+    items: Iterable[Any],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Any]:
+    """
+    Stream entries or LogBatches into pyarrow RecordBatches (sync mode)
+
+    Args:
+        items: Entries (dicts) or LogBatch objects, e.g. ``iter()`` of an
+            endpoint or ``raw.iter_batches()``
+        schema: Field name -> kind ("int", "float", "bool", "str", "json"
+            or the Python type); default: endpoint_schema() for CMDB
+            tables via export_table(), else inferred from the first batch
+        fields: Columns to export, in order (default: all schema fields)
+        batch_size: Entries per RecordBatch (default: 10000). LogBatches
+            are passed through at their own size
+
+    Yields:
+        pyarrow.RecordBatch objects, all with the same schema
+
+    Raises:
+        ImportError: If pyarrow isn't installed
+        ValueError: If a value doesn't fit its column type
+
+    Example:
+        >>> import pyarrow as pa
+        >>> table = pa.Table.from_batches(
+        ...     to_arrow_batches(fgt.api.cmdb.firewall.policy.iter())
+        ... )
+    """
+    pa = _require_pyarrow()
+    batcher = _Batcher(schema, fields, batch_size)
+    for item in items:
+        for columns in batcher.add(item):
+            yield _record_batch(pa, batcher.schema, columns)
+    for columns in batcher.flush():
+        yield _record_batch(pa, batcher.schema, columns)
+
+
+async def ato_arrow_batches(
+    items: AsyncIterable[Any],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[Any]:
+    """
+    Stream entries or LogBatches into pyarrow RecordBatches (async mode)
+
+    Same as to_arrow_batches() for an async iterable such as ``aiter()``.
+    """
+    pa = _require_pyarrow()
+    batcher = _Batcher(schema, fields, batch_size)
+    async for item in items:
+        for columns in batcher.add(item):
+            yield _record_batch(pa, batcher.schema, columns)
+    for columns in batcher.flush():
+        yield _record_batch(pa, batcher.schema, columns)
+
+
+class _FileSink:
+    """Base of the file writers: ``.part`` handling and result summary"""
+
+    def __init__(self, dest: Union[str, "os.PathLike[str]", IO]) -> None:
+        self.path: Optional[str] = None
+        self._part: Optional[str] = None
+        self.dest: Any = dest
+        if isinstance(dest, (str, os.PathLike)):
+            self.path = os.fspath(dest)
+            self._part = self.path + ".part"
+            self.dest = self._part
+        self.batches = 0
+
+    def commit(self) -> None:
+        if self._part is not None:
+            assert self.path is not None
+            os.replace(self._part, self.path)
+
+    def abort(self) -> None:
+        if self._part is not None:
+            try:
+                os.remove(self._part)
+            except OSError:
+                pass
+
+
+class _ParquetSink(_FileSink):
+    def __init__(self, dest: Any, compression: Optional[str]) -> None:
+        super().__init__(dest)
+        self._pa = _require_pyarrow()
+        import pyarrow.parquet
+
+        self._pq = pyarrow.parquet
+        self._compression = compression
+        self._writer: Any = None
+
+    def write(self, schema: Schema, columns: dict[str, Any]) -> None:
+        batch = _record_batch(self._pa, schema, columns)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(
+                self.dest, batch.schema, compression=self._compression
+            )
+        self._writer.write_batch(batch)
+        self.batches += 1
+
+    def close(self, schema: Optional[Schema]) -> None:
+        if self._writer is None:
+            # No rows: still write a valid (empty) file
+            self._writer = self._pq.ParquetWriter(
+                self.dest,
+                _arrow_schema(self._pa, schema or {}),
+                compression=self._compression,
+            )
+        self._writer.close()
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+        super().abort()
+
+
+class _CSVSink(_FileSink):
+    def __init__(self, dest: Any, header: bool, **fmtparams: Any) -> None:
+        super().__init__(dest)
+        self._header = header
+        self._fmtparams = fmtparams
+        self._file: Any = None
+        self._writer: Any = None
+
+    def _open(self, schema: Schema) -> None:
+        if self._part is not None:
+            self._file = open(self._part, "w", newline="", encoding="utf-8")
+        else:
+            self._file = self.dest
+        self._writer = csv.writer(self._file, **self._fmtparams)
+        if self._header:
+            self._writer.writerow(schema)
+
+    def write(self, schema: Schema, columns: dict[str, Any]) -> None:
+        if self._writer is None:
+            self._open(schema)
+        values = []
+        for name, kind in schema.items():
+            column = columns[name]
+            if hasattr(column, "tolist"):
+                column = _plain(column)
+            if kind != "str":
+                # csv writes str() of anything; the rest needs converting
+                column = _coerce(name, kind, column)
+            values.append(column)
+        self._writer.writerows(zip(*values))
+        self.batches += 1
+
+    def close(self, schema: Optional[Schema]) -> None:
+        if self._writer is None:
+            self._open(schema or {})
+        if self._part is not None:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def abort(self) -> None:
+        if self._part is not None and self._file is not None:
+            self._file.close()
+        super().abort()
+
+
+def _summary(sink: _FileSink, batcher: _Batcher) -> dict[str, Any]:
+    return {
+        "path": sink.path,
+        "rows": batcher.rows,
+        "batches": sink.batches,
+        "columns": list(batcher.schema or {}),
+    }
+
+
+def _drive(items: Iterable[Any], batcher: _Batcher, sink: Any) -> Any:
+    try:
+        for item in items:
+            for columns in batcher.add(item):
+                sink.write(batcher.schema, columns)
+        for columns in batcher.flush():
+            sink.write(batcher.schema, columns)
+        sink.close(batcher.schema)
+    except BaseException:
+        sink.abort()
+        raise
+    sink.commit()
+    return _summary(sink, batcher)
+
+
+async def _adrive(
+    items: AsyncIterable[Any], batcher: _Batcher, sink: Any
+) -> Any:
+    try:
+        async for item in items:
+            for columns in batcher.add(item):
+                sink.write(batcher.schema, columns)
+        for columns in batcher.flush():
+            sink.write(batcher.schema, columns)
+        sink.close(batcher.schema)
+    except BaseException:
+        sink.abort()
+        raise
+    sink.commit()
+    return _summary(sink, batcher)
+
+
+def write_parquet(
+    items: Iterable[Any],
+    dest: Union[str, "os.PathLike[str]", IO[bytes]],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: Optional[str] = "zstd",
+) -> dict[str, Any]:
+    """
+    Stream entries or LogBatches into a Parquet file (sync mode)
+
+    Args:
+        items: Entries (dicts) or LogBatch objects
+        dest: File path, or a binary file object opened for writing
+        schema: See to_arrow_batches()
+        fields: Columns to export, in order (default: all schema fields)
+        batch_size: Entries per row group (default: 10000)
+        compression: Parquet compression codec (default: "zstd")
+
+    Returns:
+        Dictionary with ``path`` (None for file objects), ``rows``,
+        ``batches`` and ``columns``
+
+    Raises:
+        ImportError: If pyarrow isn't installed
+        ValueError: If a value doesn't fit its column type
+
+    Example:
+        >>> write_parquet(
+        ...     fgt.api.log.disk.traffic.forward.raw.iter_batches(),
+        ...     "traffic.parquet",
+        ... )
+        {'path': 'traffic.parquet', 'rows': 184223, 'batches': 19, ...}
+    """
+    batcher = _Batcher(schema, fields, batch_size)
+    return _drive(items, batcher, _ParquetSink(dest, compression))
+
+
+async def awrite_parquet(
+    items: AsyncIterable[Any],
+    dest: Union[str, "os.PathLike[str]", IO[bytes]],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: Optional[str] = "zstd",
+) -> dict[str, Any]:
+    """
+    Stream entries or LogBatches into a Parquet file (async mode)
+
+    Same as write_parquet() for an async iterable. File writes run on the
+    event loop; they are small compared to the requests producing them.
+    """
+    batcher = _Batcher(schema, fields, batch_size)
+    return await _adrive(items, batcher, _ParquetSink(dest, compression))
+
+
+def write_csv(
+    items: Iterable[Any],
+    dest: Union[str, "os.PathLike[str]", IO[str]],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    header: bool = True,
+    **fmtparams: Any,
+) -> dict[str, Any]:
+    """
+    Stream entries or LogBatches into a CSV file, one batch at a time
+
+    Needs no third-party packages. Missing values are written as empty
+    cells and nested values as JSON text.
+
+    Args:
+        items: Entries (dicts) or LogBatch objects
+        dest: File path, or a text file object opened for writing (with
+            ``newline=""``)
+        schema: See to_arrow_batches()
+        fields: Columns to export, in order (default: all schema fields)
+        batch_size: Entries converted and written at a time (default:
+            10000)
+        header: Write the column names as the first row (default: True)
+        **fmtparams: csv.writer() formatting parameters (delimiter, ...)
+
+    Returns:
+        Dictionary with ``path`` (None for file objects), ``rows``,
+        ``batches`` and ``columns``
+
+    Raises:
+        ValueError: If a value doesn't fit its column type
+
+    Example:
+        >>> write_csv(
+        ...     fgt.api.cmdb.firewall.address.iter(),
+        ...     "addresses.csv",
+        ...     schema=endpoint_schema(fgt.api.cmdb.firewall.address),
+        ...     fields=["name", "type", "subnet", "fqdn"],
+        ... )
+    """
+    batcher = _Batcher(schema, fields, batch_size)
+    return _drive(items, batcher, _CSVSink(dest, header, **fmtparams))
+
+
+async def awrite_csv(
+    items: AsyncIterable[Any],
+    dest: Union[str, "os.PathLike[str]", IO[str]],
+    schema: Optional[SchemaLike] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    header: bool = True,
+    **fmtparams: Any,
+) -> dict[str, Any]:
+    """
+    Stream entries or LogBatches into a CSV file (async mode)
+
+    Same as write_csv() for an async iterable.
+    """
+    batcher = _Batcher(schema, fields, batch_size)
+    return await _adrive(items, batcher, _CSVSink(dest, header, **fmtparams))
+
+
+def _table_export(
+    endpoint: Any, dest: Any, format: Optional[str]
+) -> tuple[Optional[Schema], str]:
+    if format is None:
+        name = os.fspath(dest) if isinstance(dest, (str, os.PathLike)) else ""
+        format = "csv" if str(name).lower().endswith(".csv") else "parquet"
+    if format not in ("parquet", "csv"):
+        raise ValueError("format must be 'parquet' or 'csv'")
+    try:
+        schema: Optional[Schema] = endpoint_schema(endpoint)
+    except ValueError:
+        schema = None
+    return schema, format
+
+
+def export_table(
+    endpoint: Any,
+    dest: Union[str, "os.PathLike[str]", IO[Any]],
+    format: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    page_size: int = 1000,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Export a whole CMDB table (or monitor list) page by page (sync mode)
+
+    Entries are read with the endpoint's ``iter()`` and written with the
+    schema from endpoint_schema() (inferred for endpoints without field
+    definitions).
+
+    Args:
+        endpoint: Endpoint object, e.g. ``fgt.api.cmdb.firewall.policy``
+        dest: File path or file object
+        format: "parquet" or "csv" (default: from the file extension,
+            Parquet unless it ends in .csv)
+        fields: Columns to export, in order (default: all fields)
+        batch_size: Entries per written batch (default: 10000)
+        page_size: Entries per API request (default: 1000)
+        **kwargs: Query parameters for ``iter()`` (vdom, filter, ...)
+
+    Returns:
+        Dictionary with ``path``, ``rows``, ``batches`` and ``columns``
+
+    Example:
+        >>> export_table(fgt.api.cmdb.firewall.policy, "policies.parquet")
+        {'path': 'policies.parquet', 'rows': 2311, 'batches': 1, ...}
+    """
+    schema, format = _table_export(endpoint, dest, format)
+    writer = write_csv if format == "csv" else write_parquet
+    return writer(
+        endpoint.iter(page_size=page_size, **kwargs),
+        dest,
+        schema=schema,
+        fields=fields,
+        batch_size=batch_size,
+    )
+
+
+async def aexport_table(
+    endpoint: Any,
+    dest: Union[str, "os.PathLike[str]", IO[Any]],
+    format: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    page_size: int = 1000,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Export a whole CMDB table (or monitor list) page by page (async mode)
+
+    Same as export_table() for endpoints of an async client.
+    """
+    schema, format = _table_export(endpoint, dest, format)
+    writer = awrite_csv if format == "csv" else awrite_parquet
+    return await writer(
+        endpoint.aiter(page_size=page_size, **kwargs),
+        dest,
+        schema=schema,
+        fields=fields,
+        batch_size=batch_size,
+    )
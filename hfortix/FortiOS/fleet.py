@@ -0,0 +1,498 @@
+"""
+FortiOS Fleet Client
+
+Drives many FortiGates concurrently from one object. Every device gets its
+own AsyncHTTPClient (and therefore its own connection pool and circuit
+breaker), while a single API namespace is shared by the whole fleet:
+
+    >>> fleet = FortiOSFleet(["fw1.example.com", "fw2.example.com"],
+    ...                      token="...")
+    >>> async for res in fleet.api.monitor.system.status.get():
+    ...     print(res.device, res.ok, res.result or res.error)
+
+Calls made through ``fleet.api`` do not hit the network immediately. They
+return a FleetCall which is executed on every device when iterated (results
+stream in completion order) or awaited (results collected into a dict keyed
+by device name). Devices that fail or exceed ``device_timeout`` produce a
+FleetResult carrying the error instead of aborting the whole call, so the
+caller always gets partial results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Optional,
+    Union,
+)
+
+from .api import API
+from .http_client_async import AsyncHTTPClient
+
+if TYPE_CHECKING:
+    from .fortios import FortiOS
+
+logger = logging.getLogger("hfortix.fleet")
+
+__all__ = ["FortiOSFleet", "FleetCall", "FleetResult"]
+
+DeviceSpec = Union[str, dict[str, Any]]
+
+
+class FleetResult:
+    """Outcome of one fleet call on one device"""
+
+    __slots__ = ("device", "result", "error", "elapsed")
+
+    def __init__(
+        self,
+        device: str,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.device = device
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded on this device"""
+        return self.error is None
+
+    @property
+    def timed_out(self) -> bool:
+        """True if the device did not answer within device_timeout"""
+        return isinstance(self.error, asyncio.TimeoutError)
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else type(self.error).__name__
+        return (
+            f"FleetResult(device={self.device!r}, status={status}, "
+            f"elapsed={self.elapsed:.3f}s)"
+        )
+
+
+class _FleetDevice:
+    """Per-device client, concurrency cap and lazily built FortiOS"""
+
+    def __init__(
+        self, name: str, client: AsyncHTTPClient, max_concurrency: int
+    ) -> None:
+        self.name = name
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._fortios: Optional["FortiOS"] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created on first use so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @property
+    def fortios(self) -> "FortiOS":
+        """Async FortiOS instance sharing this device's HTTP client"""
+        if self._fortios is None:
+            from .fortios import FortiOS
+
+            self._fortios = FortiOS(client=self.client, mode="async")
+        return self._fortios
+
+
+class FleetCall:
+    """
+    A pending operation to run on every device of a fleet
+
+    Iterate with ``async for`` to receive FleetResult objects as each device
+    finishes, or ``await`` to collect all results into a dict keyed by
+    device name. A FleetCall can be executed more than once.
+    """
+
+    def __init__(
+        self,
+        fleet: "FortiOSFleet",
+        operation: Callable[[_FleetDevice], Awaitable[Any]],
+        devices: Optional[Iterable[str]] = None,
+    ) -> None:
+        self._fleet = fleet
+        self._operation = operation
+        self._devices = list(devices) if devices is not None else None
+
+    def on(self, *devices: str) -> "FleetCall":
+        """Restrict the call to a subset of devices (by name)"""
+        return FleetCall(self._fleet, self._operation, devices)
+
+    def __aiter__(self) -> AsyncIterator[FleetResult]:
+        return self._fleet._stream(self._operation, self._devices)
+
+    async def collect(self) -> dict[str, FleetResult]:
+        """Run on all devices and return results keyed by device name"""
+        results: dict[str, FleetResult] = {}
+        async for res in self:
+            results[res.device] = res
+        return results
+
+    def __await__(self) -> Generator[Any, None, dict[str, FleetResult]]:
+        return self.collect().__await__()
+
+
+class _FleetClient:
+    """
+    IHTTPClient implementation that turns requests into FleetCalls
+
+    Endpoint classes only build the api_type/path/params for a request and
+    hand them to their client. This client captures them and returns a
+    FleetCall that replays the request on every device.
+    """
+
+    def __init__(self, fleet: "FortiOSFleet") -> None:
+        self._fleet = fleet
+
+    def _call(self, method: str, api_type: str, path: str, **kw: Any):
+        def operation(device: _FleetDevice) -> Awaitable[Any]:
+            # The HTTP client adds vdom to params in place, so every device
+            # needs its own copy
+            params = kw.get("params")
+            return device.client.request(
+                method,
+                api_type,
+                path,
+                data=kw.get("data"),
+                params=dict(params) if params else None,
+                vdom=kw.get("vdom"),
+                raw_json=kw.get("raw_json", False),
+                coalesce=kw.get("coalesce", True),
+            )
+
+        return FleetCall(self._fleet, operation)
+
+    def get(
+        self,
+        api_type,
+        path,
+        params=None,
+        vdom=None,
+        raw_json=False,
+        coalesce=True,
+    ):
+        return self._call(
+            "GET",
+            api_type,
+            path,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+            coalesce=coalesce,
+        )
+
+    def post(
+        self, api_type, path, data, params=None, vdom=None, raw_json=False
+    ):
+        return self._call(
+            "POST",
+            api_type,
+            path,
+            data=data,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+        )
+
+    def put(
+        self, api_type, path, data, params=None, vdom=None, raw_json=False
+    ):
+        return self._call(
+            "PUT",
+            api_type,
+            path,
+            data=data,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+        )
+
+    def delete(self, api_type, path, params=None, vdom=None, raw_json=False):
+        return self._call(
+            "DELETE",
+            api_type,
+            path,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+        )
+
+    def get_binary(self, api_type, path, params=None, vdom=None):
+        def operation(device: _FleetDevice) -> Awaitable[Any]:
+            return device.client.get_binary(
+                api_type,
+                path,
+                params=dict(params) if params else None,
+                vdom=vdom,
+            )
+
+        return FleetCall(self._fleet, operation)
+
+
+class FortiOSFleet:
+    """
+    Concurrent client for a fleet of FortiGates
+
+    Args:
+        devices: Devices to manage. Each entry is either a host string or a
+            dict with ``host`` plus optional ``name``, ``token``, ``port``,
+            ``vdom``, ``username`` and ``password`` overrides.
+        token: Default API token for devices that don't specify one
+        verify: Verify SSL certificates (default: True)
+        max_concurrency: Maximum number of requests in flight across the
+            whole fleet (default: 100)
+        per_device_concurrency: Maximum number of requests in flight to any
+            single device (default: 2). Also used as the device's
+            max_connections so idle sockets are not kept open needlessly.
+        device_timeout: Seconds one device may take for one call, retries
+            included, before it is reported as timed out (default: 30.0).
+            None disables the limit.
+        **client_options: Extra AsyncHTTPClient options applied to every
+            device (max_retries, read_timeout, circuit_breaker_threshold,
+            circuit_breaker_timeout, read_only, user_agent, ...)
+
+    Example:
+        >>> async with FortiOSFleet(hosts, token="...", max_concurrency=200,
+        ...                         device_timeout=10) as fleet:
+        ...     # Stream results as devices answer
+        ...     async for res in fleet.api.monitor.system.status.get():
+        ...         if res.ok:
+        ...             print(res.device, res.result["version"])
+        ...         elif res.timed_out:
+        ...             print(res.device, "timed out")
+        ...
+        ...     # Or collect everything (partial results on failure)
+        ...     results = await fleet.api.cmdb.system.global_.get()
+        ...
+        ...     # Arbitrary per-device logic with a full async FortiOS
+        ...     async def count_policies(fgt):
+        ...         return len(await fgt.api.cmdb.firewall.policy.get())
+        ...     async for res in fleet.run(count_policies):
+        ...         print(res.device, res.result)
+
+    Note:
+        Calls through ``fleet.api`` return the raw response of each device.
+        Endpoint helpers that post-process a response (e.g. ``exists()`` or
+        raw log decoding) need a real client; use ``fleet.run()`` for those.
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[DeviceSpec],
+        token: Optional[str] = None,
+        *,
+        verify: bool = True,
+        max_concurrency: int = 100,
+        per_device_concurrency: int = 2,
+        device_timeout: Optional[float] = 30.0,
+        **client_options: Any,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        if per_device_concurrency <= 0:
+            raise ValueError("per_device_concurrency must be > 0")
+        if device_timeout is not None and device_timeout <= 0:
+            raise ValueError("device_timeout must be > 0 or None")
+
+        self._max_concurrency = max_concurrency
+        self._device_timeout = device_timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._devices: dict[str, _FleetDevice] = {}
+
+        client_options.setdefault("max_connections", per_device_concurrency)
+        client_options.setdefault(
+            "max_keepalive_connections", per_device_concurrency
+        )
+
+        for spec in devices:
+            if isinstance(spec, str):
+                spec = {"host": spec}
+            spec = dict(spec)
+            host = spec.pop("host", None)
+            if not host:
+                raise ValueError("Every fleet device needs a 'host'")
+            name = spec.pop("name", None) or host
+            if name in self._devices:
+                raise ValueError(f"Duplicate fleet device name '{name}'")
+            port = spec.pop("port", None)
+            # Same port handling as FortiOS; a full URL is used as-is
+            if "://" in host:
+                url = host
+            elif port and ":" not in host:
+                url = f"https://{host}:{port}"
+            else:
+                url = f"https://{host}"
+            spec.setdefault("token", None if "username" in spec else token)
+            client = AsyncHTTPClient(
+                url=url, verify=verify, **{**client_options, **spec}
+            )
+            self._devices[name] = _FleetDevice(
+                name, client, per_device_concurrency
+            )
+
+        if not self._devices:
+            raise ValueError("FortiOSFleet requires at least one device")
+
+        self._api = API(_FleetClient(self))  # type: ignore[arg-type]
+
+        logger.info(
+            "Initialized fleet of %d devices (max_concurrency=%d, "
+            "per_device_concurrency=%d)",
+            len(self._devices),
+            max_concurrency,
+            per_device_concurrency,
+        )
+
+    @property
+    def api(self) -> API:
+        """
+        Fleet-wide API namespace. Every endpoint call returns a FleetCall.
+        """
+        return self._api
+
+    @property
+    def devices(self) -> list[str]:
+        """Names of all devices in the fleet"""
+        return list(self._devices)
+
+    def client(self, device: str) -> AsyncHTTPClient:
+        """HTTP client of a single device (stats, circuit breaker, ...)"""
+        return self._devices[device].client
+
+    def run(self, func: Callable[["FortiOS"], Awaitable[Any]]) -> FleetCall:
+        """
+        Run an async function on every device
+
+        Args:
+            func: ``async def func(fgt)`` receiving an async-mode FortiOS
+                bound to the device
+
+        Returns:
+            FleetCall to iterate or await
+        """
+        return FleetCall(self, lambda device: func(device.fortios))
+
+    def get_circuit_breaker_states(self) -> dict[str, str]:
+        """Circuit breaker state (closed/open/half_open) of every device"""
+        return {
+            name: device.client.get_circuit_breaker_state()["state"]
+            for name, device in self._devices.items()
+        }
+
+    async def _execute(
+        self,
+        device: _FleetDevice,
+        operation: Callable[[_FleetDevice], Awaitable[Any]],
+    ) -> FleetResult:
+        """Run one operation on one device under both concurrency caps"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        # Take the device slot first so a busy device doesn't hold global
+        # slots other devices could use
+        async with device.semaphore:
+            async with self._semaphore:
+                start = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(
+                        operation(device), self._device_timeout
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    elapsed = time.monotonic() - start
+                    logger.debug(
+                        "Fleet call failed on %s after %.2fs: %s",
+                        device.name,
+                        elapsed,
+                        type(e).__name__,
+                    )
+                    return FleetResult(device.name, error=e, elapsed=elapsed)
+                return FleetResult(
+                    device.name,
+                    result=result,
+                    elapsed=time.monotonic() - start,
+                )
+
+    async def _stream(
+        self,
+        operation: Callable[[_FleetDevice], Awaitable[Any]],
+        names: Optional[list[str]] = None,
+    ) -> AsyncIterator[FleetResult]:
+        """Yield results in completion order; cancel the rest on early exit"""
+        if names is None:
+            devices = list(self._devices.values())
+        else:
+            unknown = [n for n in names if n not in self._devices]
+            if unknown:
+                raise KeyError(f"Unknown fleet devices: {', '.join(unknown)}")
+            devices = [self._devices[n] for n in names]
+
+        tasks = [
+            asyncio.ensure_future(self._execute(device, operation))
+            for device in devices
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def login(self) -> None:
+        """Log in to every device using username/password authentication"""
+        logins = FleetCall(self, lambda device: device.client.login())
+        pending = [
+            name
+            for name, device in self._devices.items()
+            if device.client._username and not device.client._session_token
+        ]
+        if pending:
+            async for res in logins.on(*pending):
+                if not res.ok:
+                    logger.error("Fleet login failed on %s", res.device)
+
+    async def aclose(self) -> None:
+        """Close every device's HTTP client"""
+        await asyncio.gather(
+            *(device.client.close() for device in self._devices.values()),
+            return_exceptions=True,
+        )
+
+    async def __aenter__(self) -> "FortiOSFleet":
+        await self.login()
+        return self
+
+    async def __aexit__(
+        self, exc_type: Any, exc_val: Any, exc_tb: Any
+    ) -> bool:
+        await self.aclose()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __repr__(self) -> str:
+        return (
+            f"FortiOSFleet(devices={len(self._devices)}, "
+            f"max_concurrency={self._max_concurrency})"
+        )
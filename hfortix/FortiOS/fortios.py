@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast, overload
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
 
 from .api import API
 from .http_client import HTTPClient
 from .http_client_interface import IHTTPClient
+from .json_codec import JSONCodec
 
 if TYPE_CHECKING:
-    pass
+    from .schema import SchemaCache
 
 __all__ = ["FortiOS"]
 
@@ -186,6 +198,16 @@ class FortiOS:
         read_only: bool = False,
         track_operations: bool = False,
         adaptive_retry: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1024,
+        cache_revision_check: Optional[float] = None,
+        coalesce_requests: bool = True,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        operations_max_entries: int = 10000,
+        operations_spill_file: Optional[str] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        schema_cache: Optional[SchemaCache] = None,
         error_mode: Literal["raise", "return", "print"] = "raise",
         error_format: Literal["detailed", "simple", "code_only"] = "detailed",
     ) -> None:
@@ -318,6 +340,52 @@ class FortiOS:
                           delays when FortiGate is overloaded to prevent
                           cascading failures.
                           Access health metrics via get_health_metrics().
+            cache_ttl: Enable the GET response cache with this default TTL
+            in seconds (default: None = no caching). Repeated reads of the
+                       same endpoint, parameters and vdom are served from
+                       memory. Any POST/PUT/DELETE drops the cached entries
+                       of the same table. Tune per endpoint with
+                       fgt._client.configure_cache_ttl().
+            cache_max_entries: Maximum number of cached responses; the least
+            recently used response is evicted first (default: 1024)
+            cache_revision_check: Validate cached CMDB reads against the
+            device's config revision at most every this many seconds
+                       (default: None). Catches changes made by other
+                       administrators or clients.
+            coalesce_requests: Share one request between identical
+            concurrent GETs (default: True). E.g. 50 tasks polling
+                       monitor/system/resource/usage at the same moment send
+                       a single request.
+            rate_limit: Maximum requests/second sent to the device
+            (default: None = unlimited). Requests are paced before they
+                       are sent, with a separate token bucket for cmdb,
+                       monitor, log and service, so automation never trips
+                       the device's own throttling. Override per API type
+                       with fgt._client.configure_rate_limit().
+            rate_limit_burst: Requests allowed back-to-back after an idle
+            period (default: rate_limit rounded up)
+            operations_max_entries: Operations kept in memory when
+                       track_operations is enabled (default: 10000). The
+                       audit log is a ring buffer: the oldest operations are
+                       evicted first, so long-running processes stay bounded.
+            operations_spill_file: Also append every tracked operation to
+                       this JSONL file (default: None). Lines are written by
+                       a background thread with request payloads sanitized;
+                       query the full history with
+                       fgt.iter_operations(include_spilled=True).
+            json_codec: JSON codec for request and response bodies
+                       (default: "auto"). "auto" uses orjson or msgspec when
+                       installed (pip install orjson) and falls back to the
+                       standard library json module; "orjson", "msgspec" or
+                       "json" select one explicitly, or pass a JSONCodec
+                       instance.
+            schema_cache: Check every CMDB POST and PUT body against the
+            device's own schema before sending it (default: None). Pass a
+                       hfortix.FortiOS.schema.SchemaCache; schemas are
+                       fetched once per firmware build and table, and a
+                       body the firmware would reject (unknown field, value
+                       out of range, missing required field on create)
+                       raises ValueError.
             error_mode: How convenience wrappers handle errors (default:
             "raise").
                        - "raise": Raise exceptions (stops program unless
@@ -525,6 +593,16 @@ class FortiOS:
                     read_only=read_only,
                     track_operations=track_operations,
                     adaptive_retry=adaptive_retry,
+                    cache_ttl=cache_ttl,
+                    cache_max_entries=cache_max_entries,
+                    cache_revision_check=cache_revision_check,
+                    coalesce_requests=coalesce_requests,
+                    rate_limit=rate_limit,
+                    rate_limit_burst=rate_limit_burst,
+                    operations_max_entries=operations_max_entries,
+                    operations_spill_file=operations_spill_file,
+                    json_codec=json_codec,
+                    schema_cache=schema_cache,
                 )
             else:
                 self._client = HTTPClient(
@@ -549,6 +627,16 @@ class FortiOS:
                     read_only=read_only,
                     track_operations=track_operations,
                     adaptive_retry=adaptive_retry,
+                    cache_ttl=cache_ttl,
+                    cache_max_entries=cache_max_entries,
+                    cache_revision_check=cache_revision_check,
+                    coalesce_requests=coalesce_requests,
+                    rate_limit=rate_limit,
+                    rate_limit_burst=rate_limit_burst,
+                    operations_max_entries=operations_max_entries,
+                    operations_spill_file=operations_spill_file,
+                    json_codec=json_codec,
+                    schema_cache=schema_cache,
                 )
 
         # Initialize API namespace.
@@ -770,8 +858,18 @@ class FortiOS:
                 - retry_by_endpoint: Breakdown of retries by endpoint
                 - circuit_breaker_state: Current circuit breaker state
                 (closed/open/half_open)
-                - circuit_breaker_failures: Consecutive failure count
+                - consecutive_failures: Consecutive failure count
                 - last_retry_time: Timestamp of last retry (if any)
+                - max_connections, max_keepalive_connections, http2_enabled:
+                Configured pool settings
+                - active_connections, idle_connections, total_connections:
+                Live connection pool state
+                - connections_opened, connections_reused: New vs reused
+                connections (connection_reuse_rate in percent)
+                - pool_wait_avg_ms, pool_wait_max_ms: Time requests waited
+                for a connection
+                - connections: Per-connection http_version, state and
+                request_count
 
         Example:
             >>> fgt = FortiOS("192.0.2.10", token="...")
@@ -779,6 +877,8 @@ class FortiOS:
             >>> print(f"Success rate: {stats['success_rate']:.1f}%")
             >>> print(f"Total retries: {stats['total_retries']}")
             >>> print(f"Circuit breaker: {stats['circuit_breaker_state']}")
+            >>> print(f"Pool wait: {stats['pool_wait_avg_ms']}ms avg, "
+            ...       f"{stats['active_connections']} active connections")
             >>> if stats['retry_by_reason']:
             ...     print("Retry reasons:")
             ...     for reason, count in stats['retry_by_reason'].items():
@@ -788,6 +888,9 @@ class FortiOS:
             Statistics are collected from the time the FortiOS instance was
             created.
             Use this method to monitor connection health and identify issues.
+            A high pool_wait_avg_ms or queued_requests under load means
+            max_connections is too small; many connections_opened with few
+            connections_reused means max_keepalive_connections is too small.
         """
         return self._client.get_connection_stats()
 
@@ -796,7 +899,9 @@ class FortiOS:
         Get audit log of all API operations (requires track_operations=True)
 
         Returns list of all operations (GET/POST/PUT/DELETE) with details about
-        each request.
+        each request. Only the most recent operations_max_entries operations
+        are kept in memory; use iter_operations(include_spilled=True) with
+        operations_spill_file for the full history.
         Only available when track_operations=True was passed to FortiOS
         constructor.
 
@@ -878,6 +983,80 @@ class FortiOS:
             )
         return self._client.get_write_operations()
 
+    def iter_operations(
+        self,
+        method: Union[str, Iterable[str], None] = None,
+        api_type: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        since: Union[datetime, str, None] = None,
+        until: Union[datetime, str, None] = None,
+        include_spilled: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over tracked operations (requires track_operations=True)
+
+        Yields matching operations one at a time, oldest first, without
+        copying the audit log.
+
+        Args:
+            method: HTTP method or methods to include (e.g. "POST" or
+            ("POST", "PUT", "DELETE"))
+            api_type: API type to include (cmdb, monitor, log, service)
+            path_prefix: Only paths starting with this prefix
+            (e.g. "/firewall/")
+            since: Only operations at or after this time (datetime or ISO
+            8601 string; naive values are UTC)
+            until: Only operations before this time
+            include_spilled: Read the operations_spill_file instead of the
+            in-memory buffer to include operations already evicted
+
+        Returns:
+            Iterator of operation dictionaries (same format as
+            get_operations())
+
+        Raises:
+            RuntimeError: If track_operations was not enabled
+
+        Example:
+            >>> fgt = FortiOS("192.0.2.10", token="...", track_operations=True,
+            ...               operations_spill_file="audit.jsonl")
+            >>> for op in fgt.iter_operations(
+            ...     method="DELETE", path_prefix="/firewall/",
+            ...     since="2024-12-20T00:00:00", include_spilled=True
+            ... ):
+            ...     print(op["timestamp"], op["path"])
+        """
+        if not hasattr(self._client, "iter_operations"):
+            raise RuntimeError(
+                "Operation tracking is not enabled. "
+                "Initialize FortiOS with track_operations=True to use this feature."  # noqa: E501
+            )
+        return self._client.iter_operations(
+            method=method,
+            api_type=api_type,
+            path_prefix=path_prefix,
+            since=since,
+            until=until,
+            include_spilled=include_spilled,
+        )
+
+    def flush_operations(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until tracked operations are written to operations_spill_file
+
+        Call before handing the spill file to another tool. Operations are
+        also flushed when the client is closed.
+
+        Args:
+            timeout: Maximum seconds to wait (default: None = no limit)
+
+        Returns:
+            True if the spill file is up to date (or none is configured)
+        """
+        if not hasattr(self._client, "flush_operations"):
+            return True
+        return self._client.flush_operations(timeout)
+
     def get_health_metrics(self) -> dict[str, Any]:
         """
         Get comprehensive health metrics for HTTP client
@@ -887,6 +1066,7 @@ class FortiOS:
         - Retry statistics by endpoint and reason
         - Response time metrics (if adaptive_retry=True)
         - Endpoint health status (slow vs normal)
+        - Response cache hit/miss counters (if cache_ttl is set)
 
         Returns:
             Dictionary containing:
@@ -896,6 +1076,8 @@ class FortiOS:
             - adaptive_retry_enabled: Whether adaptive retry is active
             - response_times: Per-endpoint metrics (avg, min, max, p50, p95) if
             adaptive_retry=True
+            - cache: Response cache statistics (enabled, hits, misses,
+            hit_rate, entries, evictions, invalidations, revision_changes)
 
         Example:
             >>> fgt = FortiOS("192.0.2.10", token="...", adaptive_retry=True)
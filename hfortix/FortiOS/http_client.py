@@ -11,18 +11,35 @@ capabilities.
 
 from __future__ import annotations
 
+import codecs
+import copy
 import logging
+import threading
 import time
 import uuid
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeAlias, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    TypeAlias,
+    Union,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
+
+    from .schema import SchemaCache
 from urllib.parse import quote, urlencode
 
 import httpx
 
+from .download import DownloadSink, DownloadTarget
 from .http_client_base import BaseHTTPClient
+from .json_codec import JSONCodec
+from .json_stream import ResultsStreamParser
+from .response_cache import CONFIG_REVISION_PATH
 
 logger = logging.getLogger("hfortix.http")
 
@@ -57,6 +74,18 @@ def encode_path_component(component: str | int) -> str:
     return quote(str(component), safe="")
 
 
+class _PendingCall:
+    """In-flight GET shared by identical concurrent requests"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
 class HTTPClient(BaseHTTPClient):
     """
     Internal HTTP client for FortiOS API requests (Sync Implementation)
@@ -72,6 +101,14 @@ class HTTPClient(BaseHTTPClient):
     - Automatic retry with exponential backoff
     - Context manager support (use with 'with' statement)
 
+    Thread Safety:
+        A single HTTPClient may be shared by many worker threads. Endpoint
+        timeouts are passed per request instead of being swapped on the
+        shared httpx client, statistics and circuit breaker state are
+        updated under a lock, and session re-authentication is serialized
+        so only one thread logs in again when the session expires. Sharing
+        one client lets all threads reuse the same TLS connection pool.
+
     Query Parameter Encoding:
         The requests library automatically handles query parameter encoding:
         - Lists: Encoded as repeated parameters (e.g., ['a', 'b'] →
@@ -118,6 +155,16 @@ class HTTPClient(BaseHTTPClient):
         read_only: bool = False,
         track_operations: bool = False,
         adaptive_retry: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1024,
+        cache_revision_check: Optional[float] = None,
+        coalesce_requests: bool = True,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        operations_max_entries: int = 10000,
+        operations_spill_file: Optional[str] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        schema_cache: Optional[SchemaCache] = None,
     ) -> None:
         """
         Initialize HTTP client
@@ -185,6 +232,35 @@ class HTTPClient(BaseHTTPClient):
                           errors). Increases retry
                           delays when FortiGate is overloaded to prevent
                           cascading failures.
+            cache_ttl: Enable the GET response cache with this default TTL
+            in seconds (default: None = no caching). Writes drop the cached
+            entries of the same table. Tune per endpoint with
+            configure_cache_ttl().
+            cache_max_entries: Maximum number of cached responses; the least
+            recently used response is evicted first (default: 1024)
+            cache_revision_check: Validate cached CMDB reads against the
+            device's config revision (monitor/system/config-revision) at
+            most every this many seconds (default: None = rely on TTLs and
+            local write invalidation only)
+            coalesce_requests: Share one request (and its result or
+            exception) between identical concurrent GETs (default: True)
+            rate_limit: Maximum requests/second sent to the device, paced
+            with a separate token bucket per API type (default: None =
+            unlimited). Override per API type with configure_rate_limit().
+            rate_limit_burst: Requests allowed back-to-back after an idle
+            period (default: rate_limit rounded up)
+            operations_max_entries: Operations kept in memory when
+            track_operations is enabled; the oldest are evicted first
+            (default: 10000)
+            operations_spill_file: Also append every tracked operation to this
+            JSONL file, written by a background thread (default: None)
+            json_codec: JSON codec for request and response bodies: "auto"
+            uses orjson or msgspec when installed and falls back to the
+            standard library; "orjson", "msgspec", "json" or a JSONCodec
+            instance select one explicitly (default: "auto")
+            schema_cache: SchemaCache checking every CMDB POST and PUT
+            body against the device's schema before it is sent; a body the
+            firmware would reject raises ValueError (default: None)
 
         Raises:
             ValueError: If parameters are invalid or both token and
@@ -214,6 +290,17 @@ class HTTPClient(BaseHTTPClient):
             max_connections=max_connections,
             max_keepalive_connections=max_keepalive_connections,
             adaptive_retry=adaptive_retry,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            cache_revision_check=cache_revision_check,
+            coalesce_requests=coalesce_requests,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            track_operations=track_operations,
+            operations_max_entries=operations_max_entries,
+            operations_spill_file=operations_spill_file,
+            json_codec=json_codec,
+            schema_cache=schema_cache,
         )
 
         # Store circuit breaker auto-retry settings
@@ -256,6 +343,8 @@ class HTTPClient(BaseHTTPClient):
         # Track last request time
         self._session_last_activity: Optional[float] = None
         self._using_token_auth = token is not None
+        # Serializes login() so concurrent threads don't all re-authenticate
+        self._session_lock = threading.Lock()
 
         # Session timeout settings (in seconds) - only for username/password
         # auth
@@ -275,10 +364,8 @@ class HTTPClient(BaseHTTPClient):
             self._session_idle_timeout = None
             self._session_proactive_refresh = None
 
-        # Read-only mode and operation tracking
+        # Read-only mode (operation tracking is set up by the base class)
         self._read_only = read_only
-        self._track_operations = track_operations
-        self._operations: list[dict[str, Any]] = [] if track_operations else []
 
         # Set token if provided
         if token:
@@ -462,33 +549,6 @@ class HTTPClient(BaseHTTPClient):
             if "X-CSRFTOKEN" in self._client.headers:
                 del self._client.headers["X-CSRFTOKEN"]
 
-    def get_connection_stats(self) -> dict[str, Any]:
-        """
-        Get HTTP connection pool statistics
-
-        Returns:
-            dict: Connection statistics including:
-                - http2_enabled: Whether HTTP/2 is enabled
-                - max_connections: Maximum number of connections allowed
-                - max_keepalive_connections: Maximum keepalive connections
-                - circuit_breaker_state: Current circuit breaker state
-                - consecutive_failures: Number of consecutive failures
-
-        Example:
-            >>> stats = client.get_connection_stats()
-            >>> print(f"Circuit breaker: {stats['circuit_breaker_state']}")
-        """
-        return {
-            "http2_enabled": True,
-            "max_connections": 100,
-            "max_keepalive_connections": 20,
-            "circuit_breaker_state": self._circuit_breaker["state"],
-            "consecutive_failures": self._circuit_breaker[
-                "consecutive_failures"
-            ],
-            "last_failure_time": self._circuit_breaker["last_failure_time"],
-        }
-
     def _check_circuit_breaker(self, endpoint: str) -> None:
         """
         Override base class circuit breaker check with optional auto-retry
@@ -519,16 +579,8 @@ class HTTPClient(BaseHTTPClient):
                 )
                 time.sleep(self._circuit_breaker_retry_delay)
 
-                # Check if enough time has elapsed for circuit to transition
-                elapsed = time.time() - (
-                    self._circuit_breaker["last_failure_time"] or 0
-                )
-                if elapsed >= self._circuit_breaker["timeout"]:
-                    # Timeout elapsed, transition to half_open
-                    self._circuit_breaker["state"] = "half_open"
-                    logger.info(
-                        "Circuit breaker transitioning to HALF_OPEN " "state"
-                    )
+                # Transition to half_open if enough time has elapsed
+                self._try_half_open_circuit_breaker()
                 # If timeout not elapsed, circuit stays open but we
                 # retry anyway (the request will fail-fast again if
                 # service still down)
@@ -584,7 +636,7 @@ class HTTPClient(BaseHTTPClient):
                 )
 
                 # Try to parse JSON response (most FortiOS errors are JSON)
-                json_response = response.json()
+                json_response = self._json.loads(response.content)
 
                 # Add error description if error code present
                 error_code = json_response.get("error")
@@ -629,6 +681,15 @@ class HTTPClient(BaseHTTPClient):
                 )
                 response.raise_for_status()
 
+    def _check_config_revision(self) -> None:
+        """Validate cached CMDB reads against the device's config revision"""
+        try:
+            revision = self.request("GET", "monitor", CONFIG_REVISION_PATH)
+        except Exception as e:
+            logger.debug("Config revision check failed: %s", e)
+            revision = None
+        self._apply_config_revision(revision)
+
     def request(
         self,
         method: str,
@@ -639,10 +700,17 @@ class HTTPClient(BaseHTTPClient):
         vdom: Optional[Union[str, bool]] = None,
         raw_json: bool = False,
         request_id: Optional[str] = None,
+        coalesce: bool = True,
     ) -> dict[str, Any]:
         """
         Generic request method for all API calls
 
+        Identical concurrent GETs (same endpoint, parameters, vdom and
+        raw_json) share one underlying request and its result or exception
+        unless the client was created with coalesce_requests=False or
+        coalesce=False is passed. Each caller still gets its own copy of
+        the result. Log reads are never coalesced.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             api_type: API type (cmdb, monitor, log, service)
@@ -654,6 +722,8 @@ class HTTPClient(BaseHTTPClient):
             return full response
             request_id: Optional correlation ID for tracking requests across
             logs
+            coalesce: If False, never share this request with identical
+            concurrent ones (e.g. reads that start a device session)
 
         Returns:
             dict: If raw_json=False, returns response['results'] (or full
@@ -661,6 +731,87 @@ class HTTPClient(BaseHTTPClient):
                   If raw_json=True, returns complete API response with status,
                   http_status, etc.
         """
+        cache = self._schema_cache_for(method, api_type, path, data)
+        if cache is not None and not self._read_only and data is not None:
+            schema = cache.lookup(self, path, vdom)
+            self._check_schema(schema, method, path, data)
+
+        key = (
+            self._coalesce_key(method, api_type, path, params, vdom, raw_json)
+            if coalesce
+            else None
+        )
+        if key is None:
+            return self._request(
+                method,
+                api_type,
+                path,
+                data=data,
+                params=params,
+                vdom=vdom,
+                raw_json=raw_json,
+                request_id=request_id,
+            )
+
+        with self._state_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _PendingCall()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            self._increment_stat("coalesced_requests")
+            logger.debug(
+                "Request coalesced with in-flight request",
+                extra={
+                    "request_id": request_id,
+                    "endpoint": f"{api_type}/{path}",
+                },
+            )
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = self._request(
+                method,
+                api_type,
+                path,
+                data=data,
+                params=params,
+                vdom=vdom,
+                raw_json=raw_json,
+                request_id=request_id,
+            )
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._state_lock:
+                del self._inflight[key]
+                waiters = call.waiters
+            if waiters and call.error is None:
+                # Followers copy from a snapshot the leader's caller can't
+                # modify while they are still reading it
+                call.result = copy.deepcopy(call.result)
+            call.event.set()
+
+    def _request(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        raw_json: bool = False,
+        request_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Send a request (without coalescing), see request()"""
         # Generate request ID if not provided
         if request_id is None:
             request_id = str(uuid.uuid4())[:8]  # Short UUID for readability
@@ -692,6 +843,26 @@ class HTTPClient(BaseHTTPClient):
         full_path = f"/api/v2/{api_type}/{path}"
         endpoint_key = f"{api_type}/{path}"
 
+        # Serve GETs from the response cache (if enabled)
+        cache_key = self._cache_key(method, api_type, path, params)
+        cache_epoch = 0
+        if cache_key is not None:
+            if self._cache_needs_revision_check(api_type):
+                self._check_config_revision()
+            assert self._cache is not None
+            cache_epoch = self._cache.epoch
+            cached = self._cached_response(cache_key, raw_json)
+            if cached is not None:
+                logger.debug(
+                    "Request served from cache",
+                    extra={
+                        "request_id": request_id,
+                        "method": method.upper(),
+                        "endpoint": full_path,
+                    },
+                )
+                return cached
+
         # Check circuit breaker before making request
         try:
             self._check_circuit_breaker(endpoint_key)
@@ -711,12 +882,10 @@ class HTTPClient(BaseHTTPClient):
             )
             raise
 
-        # Get endpoint-specific timeout if configured
+        # Get endpoint-specific timeout if configured. It is passed per
+        # request (never set on the shared httpx client) so concurrent
+        # threads can't pick up each other's timeouts.
         endpoint_timeout = self._get_endpoint_timeout(endpoint_key)
-        if endpoint_timeout:
-            # Temporarily set custom timeout for this request
-            original_timeout = self._client.timeout
-            self._client.timeout = endpoint_timeout
 
         # Structured log for request start
         logger.debug(
@@ -750,68 +919,43 @@ class HTTPClient(BaseHTTPClient):
         start_time = time.time()
 
         # Track total requests
-        self._retry_stats["total_requests"] += 1
+        self._increment_stat("total_requests")
 
         # ========================================================================
         # Read-Only Mode Check
         # ========================================================================
         # If in read-only mode, block write operations
-        if self._read_only and method in ("POST", "PUT", "DELETE"):
-            logger.error(
-                "READ-ONLY MODE: %s request blocked",
-                method,
-                extra={
-                    "request_id": request_id,
-                    "method": method.upper(),
-                    "endpoint": full_path,
-                    "data": self._sanitize_data(data) if data else None,
-                },
-            )
+        self._block_read_only(method, api_type, path, data, params, request_id)
 
-            # Track blocked operation
-            if self._track_operations:
-                from datetime import datetime, timezone
-
-                self._operations.append(
-                    {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "method": method.upper(),
-                        "api_type": api_type,
-                        "path": f"/{path}",
-                        "data": data,
-                        "status_code": 403,  # Forbidden
-                        "vdom": params.get("vdom") if params else None,
-                        "blocked_by_read_only": True,
-                    }
-                )
-
-            # Raise error - operation blocked
-            from .exceptions_forti import ReadOnlyModeError
-
-            raise ReadOnlyModeError(
-                f"{method} operation blocked by read-only mode: {full_path}"
-            )
+        # Drop cached reads of the table before it is modified
+        self._cache_invalidate(method, api_type, path)
 
         # Proactively check if session needs refresh (username/password auth
         # only)
         if self._should_refresh_session():
-            logger.info(
-                "Session approaching idle timeout, proactively re-authenticating",  # noqa: E501
-                extra={
-                    "request_id": request_id,
-                    "time_since_last_activity": round(
-                        time.time() - (self._session_last_activity or 0), 1
-                    ),
-                },
-            )
-            try:
-                self.login()
-                logger.info("Proactive re-authentication successful")
-            except Exception as e:
-                logger.warning(
-                    "Proactive re-authentication failed, will retry on 401: %s",  # noqa: E501
-                    str(e),
-                )
+            with self._session_lock:
+                # Re-check: another thread may have refreshed the session
+                # while we were waiting for the lock
+                if self._should_refresh_session():
+                    logger.info(
+                        "Session approaching idle timeout, proactively re-authenticating",  # noqa: E501
+                        extra={
+                            "request_id": request_id,
+                            "time_since_last_activity": round(
+                                time.time()
+                                - (self._session_last_activity or 0),
+                                1,
+                            ),
+                        },
+                    )
+                    try:
+                        self.login()
+                        logger.info("Proactive re-authentication successful")
+                    except Exception as e:
+                        logger.warning(
+                            "Proactive re-authentication failed, will retry on 401: %s",  # noqa: E501
+                            str(e),
+                        )
 
         # Retry loop with exponential backoff
         last_error = None
@@ -820,6 +964,9 @@ class HTTPClient(BaseHTTPClient):
         )
 
         for attempt in range(self._max_retries + 1):
+            # Session token this attempt is sent with (detects whether
+            # another thread already re-authenticated after a 401)
+            attempt_session_token = self._session_token
             try:
                 # Update last activity time (for idle timeout tracking)
                 if (
@@ -828,12 +975,19 @@ class HTTPClient(BaseHTTPClient):
                 ):
                     self._session_last_activity = time.time()
 
+                # Pace requests to the device (if rate limited)
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    time.sleep(delay)
+
                 # Make request with httpx client
                 res = self._client.request(
                     method=method,
                     url=url,
-                    json=data if data else None,
                     params=params if params else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.tracer()},
+                    **self._encode_body(data),
                 )
 
                 # Calculate duration
@@ -854,30 +1008,20 @@ class HTTPClient(BaseHTTPClient):
                 self._record_circuit_breaker_success()
 
                 # Record successful request
-                self._retry_stats["successful_requests"] += 1
+                self._increment_stat("successful_requests")
 
                 # Track operation if enabled
-                if self._track_operations:
-                    from datetime import datetime, timezone
-
-                    self._operations.append(
-                        {
-                            "timestamp": datetime.now(
-                                timezone.utc
-                            ).isoformat(),
-                            "method": method.upper(),
-                            "api_type": api_type,
-                            "path": f"/{path}",
-                            "data": (
-                                data if method in ("POST", "PUT") else None
-                            ),
-                            "status_code": res.status_code,
-                            "vdom": params.get("vdom") if params else None,
-                            # Indicates read-only mode was NOT active
-                            # (operation executed)
-                            "read_only": False,
-                        }
-                    )
+                self._record_operation(
+                    method,
+                    api_type,
+                    path,
+                    data if method in ("POST", "PUT") else None,
+                    res.status_code,
+                    params,
+                    # Indicates read-only mode was NOT active (operation
+                    # executed)
+                    read_only=False,
+                )
 
                 # Structured log for successful response
                 logger.info(
@@ -905,11 +1049,14 @@ class HTTPClient(BaseHTTPClient):
                     )
 
                 # Parse JSON response
-                json_response = res.json()
+                json_response = self._json.loads(res.content)
 
-                # Restore original timeout if we changed it
-                if endpoint_timeout:
-                    self._client.timeout = original_timeout
+                # Keep the response cache coherent
+                if cache_key is not None:
+                    assert self._cache is not None
+                    self._cache.put(cache_key, res.content, cache_epoch)
+                else:
+                    self._cache_invalidate(method, api_type, path)
 
                 # Return full response if raw_json=True, otherwise extract
                 # results
@@ -947,8 +1094,11 @@ class HTTPClient(BaseHTTPClient):
                     )
                     session_retry_attempted = True
                     try:
-                        # Try to login again
-                        self.login()
+                        with self._session_lock:
+                            # Only log in again if no other thread has
+                            # already replaced the expired session
+                            if self._session_token == attempt_session_token:
+                                self.login()
                         logger.info(
                             "Re-authentication successful, retrying request"
                         )
@@ -996,19 +1146,13 @@ class HTTPClient(BaseHTTPClient):
                     time.sleep(delay)
                     continue
                 else:
-                    # Don't retry, restore timeout and raise the error
-                    if endpoint_timeout:
-                        self._client.timeout = original_timeout
+                    # Don't retry, raise the error
                     raise
 
-        # If we've exhausted all retries, restore timeout and raise the last
-        # error
-        if endpoint_timeout:
-            self._client.timeout = original_timeout
-
+        # If we've exhausted all retries, raise the last error
         if last_error:
             # Record failed request
-            self._retry_stats["failed_requests"] += 1
+            self._increment_stat("failed_requests")
 
             logger.error(
                 "Request failed after all retries",
@@ -1032,10 +1176,17 @@ class HTTPClient(BaseHTTPClient):
         params: Optional[dict[str, Any]] = None,
         vdom: Optional[Union[str, bool]] = None,
         raw_json: bool = False,
+        coalesce: bool = True,
     ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
         """GET request"""
         return self.request(
-            "GET", api_type, path, params=params, vdom=vdom, raw_json=raw_json
+            "GET",
+            api_type,
+            path,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+            coalesce=coalesce,
         )
 
     def get_binary(
@@ -1067,8 +1218,16 @@ class HTTPClient(BaseHTTPClient):
         elif self._vdom is not None and "vdom" not in params:
             params["vdom"] = self._vdom
 
+        delay = self._rate_limit_delay(api_type)
+        if delay:
+            time.sleep(delay)
+
         # Make request
-        res = self._client.get(url, params=params if params else None)
+        res = self._client.get(
+            url,
+            params=params if params else None,
+            extensions={"trace": self._pool_monitor.tracer()},
+        )
 
         # Build full endpoint path for error context
         full_path = f"/api/v2/{api_type}/{path}"
@@ -1083,6 +1242,324 @@ class HTTPClient(BaseHTTPClient):
 
         return res.content
 
+    def get_stream(
+        self,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """
+        GET request yielding ``results`` entries while the body downloads
+
+        The response is read from the socket in chunks and the ``results``
+        array is decoded incrementally, so a huge table (e.g.
+        cmdb/firewall/internet-service) never exists in memory as one
+        document. Peak memory stays near one entry plus ``chunk_size``.
+
+        Failed attempts are retried like regular requests as long as no
+        entry has been yielded yet. Errors after that are raised to the
+        caller, who has already consumed part of the data.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path (e.g., 'firewall/internet-service')
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Yields:
+            Entries of the response's ``results`` array, one at a time
+
+        Example:
+            >>> for svc in fgt._client.get_stream(
+            ...     "cmdb", "firewall/internet-service"
+            ... ):
+            ...     print(svc["name"])
+        """
+        path = self._normalize_path(path)
+        url = self._build_url(api_type, path)
+        params = dict(params) if params else {}
+        if vdom is not None:
+            params["vdom"] = vdom
+        elif self._vdom is not None and "vdom" not in params:
+            params["vdom"] = self._vdom
+
+        full_path = f"/api/v2/{api_type}/{path}"
+        endpoint_key = f"{api_type}/{path}"
+        self._check_circuit_breaker(endpoint_key)
+        endpoint_timeout = self._get_endpoint_timeout(endpoint_key)
+        start_time = time.time()
+        self._increment_stat("total_requests")
+
+        yielded = False
+        for attempt in range(self._max_retries + 1):
+            try:
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    time.sleep(delay)
+                with self._client.stream(
+                    "GET",
+                    url,
+                    params=params if params else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.tracer()},
+                ) as res:
+                    if not res.is_success:
+                        res.read()
+                        self._handle_response_errors(
+                            res,
+                            endpoint=full_path,
+                            method="GET",
+                            params=params,
+                        )
+                    parser = ResultsStreamParser()
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                    for chunk in res.iter_bytes(chunk_size):
+                        for entry in parser.feed(decoder.decode(chunk)):
+                            yielded = True
+                            yield entry
+                    tail = parser.feed(decoder.decode(b"", final=True))
+                    yield from tail + parser.close()
+
+                self._record_response_time(
+                    endpoint_key, time.time() - start_time
+                )
+                self._record_circuit_breaker_success()
+                self._increment_stat("successful_requests")
+                return
+
+            except Exception as e:
+                self._record_circuit_breaker_failure(endpoint_key)
+                if not yielded and self._should_retry(
+                    e, attempt, endpoint_key
+                ):
+                    response_obj = (
+                        e.response
+                        if isinstance(e, httpx.HTTPStatusError)
+                        else None
+                    )
+                    time.sleep(
+                        self._get_retry_delay(
+                            attempt, response_obj, endpoint_key
+                        )
+                    )
+                    continue
+                self._increment_stat("failed_requests")
+                raise
+
+    def iter_binary(
+        self,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """
+        Request yielding a binary response body in chunks
+
+        Streaming counterpart of get_binary() for large downloads (config
+        backups, archived packet captures, sniffer captures): the body is
+        never held in memory as a whole. Failed attempts are retried like
+        regular requests as long as no chunk has been yielded yet.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path (e.g., 'disk/ips/archive-download')
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            data: JSON request body (for POST downloads such as
+            monitor/system/config/backup)
+            method: HTTP method, GET or POST (default: GET)
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Yields:
+            Chunks of the response body
+
+        Raises:
+            ValueError: If method is not GET or POST
+            ReadOnlyModeError: For POST downloads in read-only mode
+
+        Example:
+            >>> with open("capture.pcap", "wb") as f:
+            ...     for chunk in fgt._client.iter_binary(
+            ...         "log", "disk/ips/archive-download", params={"mkey": 7}
+            ...     ):
+            ...         f.write(chunk)
+        """
+        path = self._normalize_path(path)
+        url = self._build_url(api_type, path)
+        params = dict(params) if params else {}
+        if vdom is not None:
+            params["vdom"] = vdom
+        elif self._vdom is not None and "vdom" not in params:
+            params["vdom"] = self._vdom
+
+        method = self._download_method(method)
+        full_path = f"/api/v2/{api_type}/{path}"
+        endpoint_key = f"{api_type}/{path}"
+        self._block_read_only(method, api_type, path, data, params)
+        self._check_circuit_breaker(endpoint_key)
+        endpoint_timeout = self._get_endpoint_timeout(endpoint_key)
+        start_time = time.time()
+        self._increment_stat("total_requests")
+
+        yielded = False
+        session_retry_attempted = False
+        last_error: Optional[Exception] = None
+        for attempt in range(self._max_retries + 1):
+            attempt_session_token = self._session_token
+            try:
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    time.sleep(delay)
+                with self._client.stream(
+                    method,
+                    url,
+                    params=params if params else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.tracer()},
+                    **self._encode_body(data),
+                ) as res:
+                    if not res.is_success:
+                        res.read()
+                        self._handle_response_errors(
+                            res,
+                            endpoint=full_path,
+                            method=method,
+                            params=params,
+                        )
+                    for chunk in res.iter_bytes(chunk_size):
+                        yielded = True
+                        yield chunk
+                    status_code = res.status_code
+
+                self._record_response_time(
+                    endpoint_key, time.time() - start_time
+                )
+                self._record_circuit_breaker_success()
+                self._increment_stat("successful_requests")
+                self._record_operation(
+                    method,
+                    api_type,
+                    path,
+                    data if method == "POST" else None,
+                    status_code,
+                    params,
+                    read_only=False,
+                )
+                return
+
+            except Exception as e:
+                last_error = e
+                # Session expired: log in again once, like request()
+                if (
+                    not yielded
+                    and not session_retry_attempted
+                    and not self._using_token_auth
+                    and self._username
+                    and self._password
+                    and isinstance(e, httpx.HTTPStatusError)
+                    and e.response.status_code == 401
+                ):
+                    session_retry_attempted = True
+                    try:
+                        with self._session_lock:
+                            if self._session_token == attempt_session_token:
+                                self.login()
+                        continue
+                    except Exception as login_error:
+                        logger.error(
+                            "Re-authentication failed: %s", str(login_error)
+                        )
+                self._record_circuit_breaker_failure(endpoint_key)
+                if not yielded and self._should_retry(
+                    e, attempt, endpoint_key
+                ):
+                    response_obj = (
+                        e.response
+                        if isinstance(e, httpx.HTTPStatusError)
+                        else None
+                    )
+                    time.sleep(
+                        self._get_retry_delay(
+                            attempt, response_obj, endpoint_key
+                        )
+                    )
+                    continue
+                self._increment_stat("failed_requests")
+                raise
+
+        # Re-authenticated on the last attempt
+        self._increment_stat("failed_requests")
+        assert last_error is not None
+        raise last_error
+
+    def download(
+        self,
+        api_type: str,
+        path: str,
+        dest: DownloadTarget,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        checksum: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> dict[str, Any]:
+        """
+        Stream a binary response body to a file
+
+        A path is written to ``<dest>.part`` and renamed once the download
+        is complete; a file object is written to as chunks arrive and left
+        open. The checksum is computed while writing, without reading the
+        file back.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path
+            dest: File path or binary file object opened for writing
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            data: JSON request body (for POST downloads)
+            method: HTTP method, GET or POST (default: GET)
+            checksum: hashlib algorithm to compute (e.g. "sha256")
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Returns:
+            Dictionary with ``path``, ``bytes`` and, if requested,
+            ``checksum`` (hex digest) and ``algorithm``
+
+        Example:
+            >>> fgt._client.download(
+            ...     "monitor", "system/config/backup", "fgt.conf",
+            ...     data={"scope": "global"}, method="POST",
+            ...     checksum="sha256",
+            ... )
+            {'path': 'fgt.conf', 'bytes': 1843201, 'checksum': '9f2c...',
+             'algorithm': 'sha256'}
+        """
+        sink = DownloadSink(dest, checksum)
+        try:
+            for chunk in self.iter_binary(
+                api_type,
+                path,
+                params=params,
+                vdom=vdom,
+                data=data,
+                method=method,
+                chunk_size=chunk_size,
+            ):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.commit()
+
     def post(
         self,
         api_type: str,
@@ -1308,73 +1785,9 @@ class HTTPClient(BaseHTTPClient):
             self._client.close()
             logger.debug("HTTP client session closed")
 
-    def get_operations(self) -> list[dict[str, Any]]:
-        """
-        Get audit log of all tracked API operations
-
-        Returns all tracked operations (GET/POST/PUT/DELETE) in chronological
-        order.
-        Only available when track_operations=True was passed to constructor.
-
-        Returns:
-            List of operation dictionaries with keys:
-                - timestamp: ISO 8601 timestamp
-                - method: HTTP method (GET/POST/PUT/DELETE)
-                - api_type: API type (cmdb/monitor/log/service)
-                - path: API endpoint path
-                - data: Request payload (for POST/PUT), None otherwise
-                - status_code: HTTP response status code
-                - vdom: Virtual domain (if specified)
-                - read_only_simulated: True if operation was simulated in
-                read-only mode
-
-        Example:
-            >>> client = HTTPClient(url="https://192.0.2.10", token="...",
-            track_operations=True)
-            >>> client.post("cmdb", "/firewall/address", {"name": "test"})
-            >>> ops = client.get_operations()
-            >>> print(ops[0])
-            {
-                'timestamp': '2024-12-20T10:30:15Z',
-                'method': 'POST',
-                'api_type': 'cmdb',
-                'path': '/firewall/address',
-                'data': {'name': 'test'},
-                'status_code': 200,
-                'vdom': 'root',
-                'read_only_simulated': False
-            }
-        """
-        return self._operations.copy()
-
-    def get_write_operations(self) -> list[dict[str, Any]]:
-        """
-        Get audit log of write operations only (POST/PUT/DELETE)
-
-        Filters tracked operations to return only write operations, excluding
-        GET requests.
-
-        Returns:
-            List of write operation dictionaries (same format as
-            get_operations())
-
-        Example:
-            >>> client = HTTPClient(url="https://192.0.2.10", token="...",
-            track_operations=True)
-            >>> client.get("cmdb", "/firewall/address/test")  # GET - excluded
-            >>> client.post("cmdb", "/firewall/address", {"name": "test2"})  #
-            POST - included
-            >>> client.delete("cmdb", "/firewall/address/test")  # DELETE -
-            included
-            >>> write_ops = client.get_write_operations()
-            >>> len(write_ops)  # Returns 2 (POST and DELETE only)
-            2
-        """
-        return [
-            op
-            for op in self._operations
-            if op["method"] in ("POST", "PUT", "DELETE")
-        ]
+        # Write pending audit log lines and stop the writer thread
+        if self._operation_log is not None:
+            self._operation_log.close()
 
     @staticmethod
     def make_exists_method(
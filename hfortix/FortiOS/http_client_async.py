@@ -12,15 +12,32 @@ This is an internal implementation detail and not part of the public API.
 from __future__ import annotations
 
 import asyncio
+import codecs
+import copy
 import logging
 import time
 import uuid
-from typing import Any, Callable, Optional, TypeAlias, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Optional,
+    TypeAlias,
+    Union,
+)
 from urllib.parse import quote
 
 import httpx
 
+from .download import DownloadSink, DownloadTarget
 from .http_client_base import BaseHTTPClient
+from .json_codec import JSONCodec
+from .json_stream import ResultsStreamParser
+from .response_cache import CONFIG_REVISION_PATH
+
+if TYPE_CHECKING:
+    from .schema import SchemaCache
 
 logger = logging.getLogger("hfortix.http.async")
 
@@ -82,6 +99,16 @@ class AsyncHTTPClient(BaseHTTPClient):
         read_only: bool = False,
         track_operations: bool = False,
         adaptive_retry: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1024,
+        cache_revision_check: Optional[float] = None,
+        coalesce_requests: bool = True,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        operations_max_entries: int = 10000,
+        operations_spill_file: Optional[str] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        schema_cache: Optional[SchemaCache] = None,
     ) -> None:
         """
         Initialize async HTTP client
@@ -143,6 +170,35 @@ class AsyncHTTPClient(BaseHTTPClient):
                           retry delays based on
                           FortiGate health signals (slow responses, 503
                           errors).
+            cache_ttl: Enable the GET response cache with this default TTL
+            in seconds (default: None = no caching). Writes drop the cached
+            entries of the same table. Tune per endpoint with
+            configure_cache_ttl().
+            cache_max_entries: Maximum number of cached responses; the least
+            recently used response is evicted first (default: 1024)
+            cache_revision_check: Validate cached CMDB reads against the
+            device's config revision (monitor/system/config-revision) at
+            most every this many seconds (default: None = rely on TTLs and
+            local write invalidation only)
+            coalesce_requests: Share one request (and its result or
+            exception) between identical concurrent GETs (default: True)
+            rate_limit: Maximum requests/second sent to the device, paced
+            with a separate token bucket per API type (default: None =
+            unlimited). Override per API type with configure_rate_limit().
+            rate_limit_burst: Requests allowed back-to-back after an idle
+            period (default: rate_limit rounded up)
+            operations_max_entries: Operations kept in memory when
+            track_operations is enabled; the oldest are evicted first
+            (default: 10000)
+            operations_spill_file: Also append every tracked operation to this
+            JSONL file, written by a background thread (default: None)
+            json_codec: JSON codec for request and response bodies: "auto"
+            uses orjson or msgspec when installed and falls back to the
+            standard library; "orjson", "msgspec", "json" or a JSONCodec
+            instance select one explicitly (default: "auto")
+            schema_cache: SchemaCache checking every CMDB POST and PUT
+            body against the device's schema before it is sent; a body the
+            firmware would reject raises ValueError (default: None)
 
         Raises:
             ValueError: If parameters are invalid or both token and
@@ -172,6 +228,17 @@ class AsyncHTTPClient(BaseHTTPClient):
             max_connections=max_connections,
             max_keepalive_connections=max_keepalive_connections,
             adaptive_retry=adaptive_retry,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            cache_revision_check=cache_revision_check,
+            coalesce_requests=coalesce_requests,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            track_operations=track_operations,
+            operations_max_entries=operations_max_entries,
+            operations_spill_file=operations_spill_file,
+            json_codec=json_codec,
+            schema_cache=schema_cache,
         )
 
         # Store circuit breaker auto-retry settings
@@ -210,10 +277,8 @@ class AsyncHTTPClient(BaseHTTPClient):
         self._using_token_auth = token is not None
         self._login_task: Optional[asyncio.Task] = None  # Track login task
 
-        # Read-only mode and operation tracking
+        # Read-only mode (operation tracking is set up by the base class)
         self._read_only = read_only
-        self._track_operations = track_operations
-        self._operations: list[dict[str, Any]] = [] if track_operations else []
 
         # Set token if provided
         if token:
@@ -341,13 +406,6 @@ class AsyncHTTPClient(BaseHTTPClient):
             if "X-CSRFTOKEN" in self._client.headers:
                 del self._client.headers["X-CSRFTOKEN"]
 
-    def get_connection_stats(self) -> dict[str, Any]:
-        """Get connection statistics (placeholder for async)"""
-        return {
-            "active_connections": 0,  # httpx.AsyncClient doesn't expose this easily  # noqa: E501
-            "idle_connections": 0,
-        }
-
     async def _check_circuit_breaker(  # type: ignore[override]
         self, endpoint: str
     ) -> None:
@@ -380,16 +438,8 @@ class AsyncHTTPClient(BaseHTTPClient):
                 )
                 await asyncio.sleep(self._circuit_breaker_retry_delay)
 
-                # Check if enough time has elapsed for circuit to transition
-                elapsed = time.time() - (
-                    self._circuit_breaker["last_failure_time"] or 0
-                )
-                if elapsed >= self._circuit_breaker["timeout"]:
-                    # Timeout elapsed, transition to half_open
-                    self._circuit_breaker["state"] = "half_open"
-                    logger.info(
-                        "Circuit breaker transitioning to HALF_OPEN " "state"
-                    )
+                # Transition to half_open if enough time has elapsed
+                self._try_half_open_circuit_breaker()
                 # If timeout not elapsed, circuit stays open but we
                 # retry anyway (the request will fail-fast again if
                 # service still down)
@@ -430,7 +480,7 @@ class AsyncHTTPClient(BaseHTTPClient):
                     raise_for_status,
                 )
 
-                json_response = response.json()
+                json_response = self._json.loads(response.content)
 
                 # Add error description if error code present
                 error_code = json_response.get("error")
@@ -472,6 +522,17 @@ class AsyncHTTPClient(BaseHTTPClient):
                 )
                 response.raise_for_status()
 
+    async def _check_config_revision(self) -> None:
+        """Validate cached CMDB reads against the device's config revision"""
+        try:
+            revision = await self.request(
+                "GET", "monitor", CONFIG_REVISION_PATH
+            )
+        except Exception as e:
+            logger.debug("Config revision check failed: %s", e)
+            revision = None
+        self._apply_config_revision(revision)
+
     async def request(
         self,
         method: str,
@@ -482,10 +543,17 @@ class AsyncHTTPClient(BaseHTTPClient):
         vdom: Optional[Union[str, bool]] = None,
         raw_json: bool = False,
         request_id: Optional[str] = None,
+        coalesce: bool = True,
     ) -> dict[str, Any]:
         """
         Generic async request method for all API calls
 
+        Identical concurrent GETs (same endpoint, parameters, vdom and
+        raw_json) share one underlying request and its result or exception
+        unless the client was created with coalesce_requests=False or
+        coalesce=False is passed. Each caller still gets its own copy of
+        the result. Log reads are never coalesced.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             api_type: API type (cmdb, monitor, log, service)
@@ -496,10 +564,99 @@ class AsyncHTTPClient(BaseHTTPClient):
             raw_json: If False, return only 'results' field. If True, return
             full response
             request_id: Optional correlation ID for tracking requests
+            coalesce: If False, never share this request with identical
+            concurrent ones (e.g. reads that start a device session)
 
         Returns:
             dict: API response (results or full response based on raw_json)
         """
+        cache = self._schema_cache_for(method, api_type, path, data)
+        if cache is not None and not self._read_only and data is not None:
+            schema = await cache.alookup(self, path, vdom)
+            self._check_schema(schema, method, path, data)
+
+        key = (
+            self._coalesce_key(method, api_type, path, params, vdom, raw_json)
+            if coalesce
+            else None
+        )
+        if key is None:
+            return await self._request(
+                method,
+                api_type,
+                path,
+                data=data,
+                params=params,
+                vdom=vdom,
+                raw_json=raw_json,
+                request_id=request_id,
+            )
+
+        # [task, callers, callers still waiting]
+        entry = self._inflight.get(key)
+        if entry is None or entry[0].done():
+            # First caller: run the request as its own task so it keeps
+            # going for the other callers if this one is cancelled
+            task = asyncio.ensure_future(
+                self._request(
+                    method,
+                    api_type,
+                    path,
+                    data=data,
+                    params=params,
+                    vdom=vdom,
+                    raw_json=raw_json,
+                    request_id=request_id,
+                )
+            )
+            entry = self._inflight[key] = [task, 1, 0]
+
+            def _done(t: asyncio.Future, entry: list = entry) -> None:
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+                if not t.cancelled():
+                    t.exception()  # Retrieved by the callers, if any left
+
+            task.add_done_callback(_done)
+        else:
+            entry[1] += 1
+            self._increment_stat("coalesced_requests")
+            logger.debug(
+                "Async request coalesced with in-flight request",
+                extra={
+                    "request_id": request_id,
+                    "endpoint": f"{api_type}/{path}",
+                },
+            )
+
+        entry[2] += 1
+        try:
+            result = await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            entry[2] -= 1
+            if entry[2] == 0 and not entry[0].done():
+                # Nobody is waiting for the response anymore
+                entry[0].cancel()
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+            raise
+        entry[2] -= 1
+        # Shared by several callers: nobody gets the object another caller
+        # might modify
+        return copy.deepcopy(result) if entry[1] > 1 else result
+
+    async def _request(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        raw_json: bool = False,
+        request_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Send a request (without coalescing), see request()"""
         # Generate request ID if not provided
         if request_id is None:
             request_id = str(uuid.uuid4())[:8]
@@ -522,6 +679,26 @@ class AsyncHTTPClient(BaseHTTPClient):
         full_path = f"/api/v2/{api_type}/{path}"
         endpoint_key = f"{api_type}/{path}"
 
+        # Serve GETs from the response cache (if enabled)
+        cache_key = self._cache_key(method, api_type, path, params)
+        cache_epoch = 0
+        if cache_key is not None:
+            if self._cache_needs_revision_check(api_type):
+                await self._check_config_revision()
+            assert self._cache is not None
+            cache_epoch = self._cache.epoch
+            cached = self._cached_response(cache_key, raw_json)
+            if cached is not None:
+                logger.debug(
+                    "Request served from cache",
+                    extra={
+                        "request_id": request_id,
+                        "method": method.upper(),
+                        "endpoint": full_path,
+                    },
+                )
+                return cached
+
         # Check circuit breaker
         try:
             await self._check_circuit_breaker(endpoint_key)
@@ -556,19 +733,28 @@ class AsyncHTTPClient(BaseHTTPClient):
         start_time = time.time()
 
         # Track total requests
-        self._retry_stats["total_requests"] += 1
+        self._increment_stat("total_requests")
+
+        # Drop cached reads of the table before it is modified
+        self._cache_invalidate(method, api_type, path)
 
         # Retry loop with exponential backoff
         last_error = None
         for attempt in range(self._max_retries + 1):
             try:
+                # Pace requests to the device (if rate limited)
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    await asyncio.sleep(delay)
+
                 # Make async request
                 res = await self._client.request(
                     method=method,
                     url=url,
-                    json=data if data else None,
                     params=params if params else None,
-                    timeout=endpoint_timeout if endpoint_timeout else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.atracer()},
+                    **self._encode_body(data),
                 )
 
                 # Calculate duration
@@ -587,7 +773,18 @@ class AsyncHTTPClient(BaseHTTPClient):
 
                 # Record success
                 self._record_circuit_breaker_success()
-                self._retry_stats["successful_requests"] += 1
+                self._increment_stat("successful_requests")
+
+                # Track operation if enabled
+                self._record_operation(
+                    method,
+                    api_type,
+                    path,
+                    data if method in ("POST", "PUT") else None,
+                    res.status_code,
+                    params,
+                    read_only=False,
+                )
 
                 # Log successful response
                 logger.info(
@@ -603,7 +800,14 @@ class AsyncHTTPClient(BaseHTTPClient):
                 )
 
                 # Parse JSON response
-                json_response = res.json()
+                json_response = self._json.loads(res.content)
+
+                # Keep the response cache coherent
+                if cache_key is not None:
+                    assert self._cache is not None
+                    self._cache.put(cache_key, res.content, cache_epoch)
+                else:
+                    self._cache_invalidate(method, api_type, path)
 
                 # Return based on raw_json flag
                 if raw_json:
@@ -650,7 +854,7 @@ class AsyncHTTPClient(BaseHTTPClient):
 
         # If we've exhausted all retries
         if last_error:
-            self._retry_stats["failed_requests"] += 1
+            self._increment_stat("failed_requests")
             logger.error(
                 "Async request failed after all retries",
                 extra={
@@ -672,10 +876,17 @@ class AsyncHTTPClient(BaseHTTPClient):
         params: Optional[dict[str, Any]] = None,
         vdom: Optional[Union[str, bool]] = None,
         raw_json: bool = False,
+        coalesce: bool = True,
     ) -> dict[str, Any]:
         """Async GET request"""
         return await self.request(
-            "GET", api_type, path, params=params, vdom=vdom, raw_json=raw_json
+            "GET",
+            api_type,
+            path,
+            params=params,
+            vdom=vdom,
+            raw_json=raw_json,
+            coalesce=coalesce,
         )
 
     async def get_binary(
@@ -696,8 +907,16 @@ class AsyncHTTPClient(BaseHTTPClient):
         elif self._vdom is not None and "vdom" not in params:
             params["vdom"] = self._vdom
 
+        delay = self._rate_limit_delay(api_type)
+        if delay:
+            await asyncio.sleep(delay)
+
         # Make async request
-        res = await self._client.get(url, params=params if params else None)
+        res = await self._client.get(
+            url,
+            params=params if params else None,
+            extensions={"trace": self._pool_monitor.atracer()},
+        )
 
         # Build full endpoint path for error context
         full_path = f"/api/v2/{api_type}/{path}"
@@ -712,6 +931,297 @@ class AsyncHTTPClient(BaseHTTPClient):
 
         return res.content
 
+    async def get_stream(
+        self,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Any]:
+        """
+        GET request yielding ``results`` entries while the body downloads
+
+        The response is read from the socket in chunks and the ``results``
+        array is decoded incrementally, so a huge table (e.g.
+        cmdb/firewall/internet-service) never exists in memory as one
+        document. Peak memory stays near one entry plus ``chunk_size``.
+
+        Failed attempts are retried like regular requests as long as no
+        entry has been yielded yet. Errors after that are raised to the
+        caller, who has already consumed part of the data.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path (e.g., 'firewall/internet-service')
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Yields:
+            Entries of the response's ``results`` array, one at a time
+
+        Example:
+            >>> async for svc in fgt._client.get_stream(
+            ...     "cmdb", "firewall/internet-service"
+            ... ):
+            ...     print(svc["name"])
+        """
+        path = self._normalize_path(path)
+        url = self._build_url(api_type, path)
+        params = dict(params) if params else {}
+        if vdom is not None:
+            params["vdom"] = vdom
+        elif self._vdom is not None and "vdom" not in params:
+            params["vdom"] = self._vdom
+
+        full_path = f"/api/v2/{api_type}/{path}"
+        endpoint_key = f"{api_type}/{path}"
+        await self._check_circuit_breaker(endpoint_key)
+        endpoint_timeout = self._get_endpoint_timeout(endpoint_key)
+        start_time = time.time()
+        self._increment_stat("total_requests")
+
+        yielded = False
+        for attempt in range(self._max_retries + 1):
+            try:
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    await asyncio.sleep(delay)
+                async with self._client.stream(
+                    "GET",
+                    url,
+                    params=params if params else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.atracer()},
+                ) as res:
+                    if not res.is_success:
+                        await res.aread()
+                        self._handle_response_errors(
+                            res,
+                            endpoint=full_path,
+                            method="GET",
+                            params=params,
+                        )
+                    parser = ResultsStreamParser()
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                    async for chunk in res.aiter_bytes(chunk_size):
+                        for entry in parser.feed(decoder.decode(chunk)):
+                            yielded = True
+                            yield entry
+                    tail = parser.feed(decoder.decode(b"", final=True))
+                    for entry in tail + parser.close():
+                        yield entry
+
+                self._record_response_time(
+                    endpoint_key, time.time() - start_time
+                )
+                self._record_circuit_breaker_success()
+                self._increment_stat("successful_requests")
+                return
+
+            except Exception as e:
+                self._record_circuit_breaker_failure(endpoint_key)
+                if not yielded and self._should_retry(
+                    e, attempt, endpoint_key
+                ):
+                    response_obj = (
+                        e.response
+                        if isinstance(e, httpx.HTTPStatusError)
+                        else None
+                    )
+                    await asyncio.sleep(
+                        self._get_retry_delay(
+                            attempt, response_obj, endpoint_key
+                        )
+                    )
+                    continue
+                self._increment_stat("failed_requests")
+                raise
+
+    async def iter_binary(
+        self,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """
+        Request yielding a binary response body in chunks
+
+        Streaming counterpart of get_binary() for large downloads (config
+        backups, archived packet captures, sniffer captures): the body is
+        never held in memory as a whole. Failed attempts are retried like
+        regular requests as long as no chunk has been yielded yet.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path (e.g., 'disk/ips/archive-download')
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            data: JSON request body (for POST downloads such as
+            monitor/system/config/backup)
+            method: HTTP method, GET or POST (default: GET)
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Yields:
+            Chunks of the response body
+
+        Raises:
+            ValueError: If method is not GET or POST
+            ReadOnlyModeError: For POST downloads in read-only mode
+
+        Example:
+            >>> with open("capture.pcap", "wb") as f:
+            ...     async for chunk in fgt._client.iter_binary(
+            ...         "log", "disk/ips/archive-download", params={"mkey": 7}
+            ...     ):
+            ...         f.write(chunk)
+        """
+        path = self._normalize_path(path)
+        url = self._build_url(api_type, path)
+        params = dict(params) if params else {}
+        if vdom is not None:
+            params["vdom"] = vdom
+        elif self._vdom is not None and "vdom" not in params:
+            params["vdom"] = self._vdom
+
+        method = self._download_method(method)
+        full_path = f"/api/v2/{api_type}/{path}"
+        endpoint_key = f"{api_type}/{path}"
+        self._block_read_only(method, api_type, path, data, params)
+        await self._check_circuit_breaker(endpoint_key)
+        endpoint_timeout = self._get_endpoint_timeout(endpoint_key)
+        start_time = time.time()
+        self._increment_stat("total_requests")
+
+        yielded = False
+        for attempt in range(self._max_retries + 1):
+            try:
+                delay = self._rate_limit_delay(api_type)
+                if delay:
+                    await asyncio.sleep(delay)
+                async with self._client.stream(
+                    method,
+                    url,
+                    params=params if params else None,
+                    timeout=endpoint_timeout or httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._pool_monitor.atracer()},
+                    **self._encode_body(data),
+                ) as res:
+                    if not res.is_success:
+                        await res.aread()
+                        self._handle_response_errors(
+                            res,
+                            endpoint=full_path,
+                            method=method,
+                            params=params,
+                        )
+                    async for chunk in res.aiter_bytes(chunk_size):
+                        yielded = True
+                        yield chunk
+                    status_code = res.status_code
+
+                self._record_response_time(
+                    endpoint_key, time.time() - start_time
+                )
+                self._record_circuit_breaker_success()
+                self._increment_stat("successful_requests")
+                self._record_operation(
+                    method,
+                    api_type,
+                    path,
+                    data if method == "POST" else None,
+                    status_code,
+                    params,
+                    read_only=False,
+                )
+                return
+
+            except Exception as e:
+                self._record_circuit_breaker_failure(endpoint_key)
+                if not yielded and self._should_retry(
+                    e, attempt, endpoint_key
+                ):
+                    response_obj = (
+                        e.response
+                        if isinstance(e, httpx.HTTPStatusError)
+                        else None
+                    )
+                    await asyncio.sleep(
+                        self._get_retry_delay(
+                            attempt, response_obj, endpoint_key
+                        )
+                    )
+                    continue
+                self._increment_stat("failed_requests")
+                raise
+
+    async def download(
+        self,
+        api_type: str,
+        path: str,
+        dest: DownloadTarget,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        checksum: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> dict[str, Any]:
+        """
+        Stream a binary response body to a file
+
+        A path is written to ``<dest>.part`` and renamed once the download
+        is complete; a file object is written to as chunks arrive and left
+        open. The checksum is computed while writing, without reading the
+        file back. Chunks are written from the event loop; local disk writes
+        of chunk_size bytes don't block it noticeably.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path
+            dest: File path or binary file object opened for writing
+            params: Query parameters
+            vdom: Virtual domain (None=use default)
+            data: JSON request body (for POST downloads)
+            method: HTTP method, GET or POST (default: GET)
+            checksum: hashlib algorithm to compute (e.g. "sha256")
+            chunk_size: Bytes read from the socket at a time (default: 64KB)
+
+        Returns:
+            Dictionary with ``path``, ``bytes`` and, if requested,
+            ``checksum`` (hex digest) and ``algorithm``
+
+        Example:
+            >>> await fgt._client.download(
+            ...     "monitor", "system/config/backup", "fgt.conf",
+            ...     data={"scope": "global"}, method="POST",
+            ...     checksum="sha256",
+            ... )
+            {'path': 'fgt.conf', 'bytes': 1843201, 'checksum': '9f2c...',
+             'algorithm': 'sha256'}
+        """
+        sink = DownloadSink(dest, checksum)
+        try:
+            async for chunk in self.iter_binary(
+                api_type,
+                path,
+                params=params,
+                vdom=vdom,
+                data=data,
+                method=method,
+                chunk_size=chunk_size,
+            ):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.commit()
+
     async def post(
         self,
         api_type: str,
@@ -892,36 +1402,9 @@ class AsyncHTTPClient(BaseHTTPClient):
             await self._client.aclose()
             logger.debug("Async HTTP client session closed")
 
-    def get_operations(self) -> list[dict[str, Any]]:
-        """
-        Get audit log of all tracked API operations
-
-        Returns all tracked operations (GET/POST/PUT/DELETE) in chronological
-        order.
-        Only available when track_operations=True was passed to constructor.
-
-        Returns:
-            List of operation dictionaries (same format as
-            HTTPClient.get_operations())
-        """
-        return self._operations.copy()
-
-    def get_write_operations(self) -> list[dict[str, Any]]:
-        """
-        Get audit log of write operations only (POST/PUT/DELETE)
-
-        Filters tracked operations to return only write operations, excluding
-        GET requests.
-
-        Returns:
-            List of write operation dictionaries (same format as
-            HTTPClient.get_write_operations())
-        """
-        return [
-            op
-            for op in self._operations
-            if op["method"] in ("POST", "PUT", "DELETE")
-        ]
+        # Write pending audit log lines without blocking the event loop
+        if self._operation_log is not None:
+            await asyncio.to_thread(self._operation_log.close)
 
     @staticmethod
     def make_exists_method(
@@ -9,14 +9,33 @@ AsyncHTTPClient.
 from __future__ import annotations
 
 import fnmatch
+import json
 import logging
+import threading
 import time
 from collections import deque
-from typing import Any, Optional, TypeAlias, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeAlias,
+    Union,
+)
 from urllib.parse import quote
 
 import httpx
 
+from .json_codec import JSON_HEADERS, JSONCodec, get_json_codec
+from .operation_log import WRITE_METHODS, OperationLog, TimeBound
+from .pool_stats import PoolMonitor, get_transport_pool
+from .rate_limit import RateLimiter
+from .response_cache import SESSION_PARAMS, ResponseCache, table_of
+
+if TYPE_CHECKING:
+    from .schema import SchemaCache, TableSchema
+
 logger = logging.getLogger("hfortix.http.base")
 
 # Type alias for API responses
@@ -37,8 +56,20 @@ class BaseHTTPClient:
     - Endpoint timeout configuration
     - Path normalization and encoding
     - Data sanitization
+    - Optional GET response cache
+    - Coalescing of identical concurrent GETs
+    - Client-side rate limiting per API type
+    - Bounded operation audit log (track_operations)
+
+    Thread Safety:
+        Retry statistics, circuit breaker state and response time samples
+        are guarded by a single lock, so one client instance can be shared
+        by a pool of worker threads (sync) or many tasks (async).
     """
 
+    # Set by subclasses from their read_only argument
+    _read_only: bool = False
+
     def __init__(
         self,
         url: str,
@@ -52,6 +83,17 @@ class BaseHTTPClient:
         max_connections: int = 100,
         max_keepalive_connections: int = 20,
         adaptive_retry: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1024,
+        cache_revision_check: Optional[float] = None,
+        coalesce_requests: bool = True,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        track_operations: bool = False,
+        operations_max_entries: int = 10000,
+        operations_spill_file: Optional[str] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        schema_cache: Optional[SchemaCache] = None,
     ) -> None:
         """Initialize base HTTP client with shared configuration
 
@@ -61,6 +103,29 @@ class BaseHTTPClient:
                           When enabled, monitors response times and adjusts
                           retry delays
                           based on FortiGate health signals.
+            cache_ttl: Enable the GET response cache with this default TTL
+            in seconds (default: None = no caching)
+            cache_max_entries: Maximum number of cached responses (LRU,
+            default: 1024)
+            cache_revision_check: Seconds between config revision checks
+            validating cached CMDB reads (default: None = no validation)
+            coalesce_requests: Share one request between identical
+            concurrent GETs (default: True)
+            rate_limit: Maximum requests/second sent to the device, paced
+            separately per API type (default: None = unlimited)
+            rate_limit_burst: Requests allowed back-to-back after an idle
+            period (default: rate_limit rounded up)
+            track_operations: Keep an audit log of API operations
+            (default: False)
+            operations_max_entries: Operations kept in memory by the audit
+            log; older ones are evicted (default: 10000)
+            operations_spill_file: Also append every operation to this JSONL
+            file from a background thread (default: None)
+            json_codec: JSON codec for request and response bodies: "auto"
+            (orjson, then msgspec, then stdlib), "orjson", "msgspec", "json"
+            or a JSONCodec instance (default: "auto")
+            schema_cache: Check CMDB POST/PUT bodies against the device's
+            table schema before sending them (default: None = no check)
         """
         # Validate parameters
         if not url:
@@ -101,6 +166,20 @@ class BaseHTTPClient:
         self._max_retries = max_retries
         self._connect_timeout = connect_timeout
         self._read_timeout = read_timeout
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._http2 = True
+
+        # Encodes request bodies, decodes response bytes (see json_codec)
+        self._json = get_json_codec(json_codec)
+
+        # Connection pool metrics, fed by the httpcore trace extension
+        self._pool_monitor = PoolMonitor()
+
+        # Guards _retry_stats, _circuit_breaker and _response_times. Only
+        # held for short, non-blocking updates so it is also safe to use
+        # from the event loop thread in the async client.
+        self._state_lock = threading.RLock()
 
         # Initialize retry statistics
         self._retry_stats: dict[str, Any] = {
@@ -108,6 +187,7 @@ class BaseHTTPClient:
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
+            "coalesced_requests": 0,
             "retry_by_reason": {},
             "retry_by_endpoint": {},
             "last_retry_time": None,
@@ -134,10 +214,62 @@ class BaseHTTPClient:
         # Endpoint is slow if 3x baseline
         self._slowdown_multiplier = 3.0
 
+        # In-flight GETs shared by identical concurrent requests
+        # (coalesce key -> pending call, see _coalesce_key)
+        self._coalesce_requests = coalesce_requests
+        self._inflight: dict[tuple, Any] = {}
+        # Writes per table; part of the coalesce key, so a GET sent after a
+        # write never shares the response of a GET sent before it
+        self._write_epochs: dict[tuple[str, str], int] = {}
+
+        # Optional schema check of CMDB writes (see _schema_cache_for)
+        self._schema_cache = schema_cache
+
+        # Optional client-side rate limiter (token bucket per API type)
+        self._rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(rate_limit, rate_limit_burst)
+            if rate_limit is not None
+            else None
+        )
+
+        # Optional GET response cache
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(
+                default_ttl=cache_ttl,
+                max_entries=cache_max_entries,
+                revision_check_interval=cache_revision_check,
+            )
+            if cache_ttl is not None
+            else None
+        )
+
+        # Optional operation audit log (ring buffer + JSONL spill file)
+        self._track_operations = track_operations
+        self._operation_log: Optional[OperationLog] = (
+            OperationLog(
+                max_entries=operations_max_entries,
+                spill_file=operations_spill_file,
+                sanitize=self._sanitize_data,
+            )
+            if track_operations
+            else None
+        )
+
     # ========================================================================
     # Shared Utility Methods
     # ========================================================================
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """JSON codec used for request and response bodies"""
+        return self._json
+
+    def _encode_body(self, data: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """httpx request() keyword arguments sending ``data`` as JSON"""
+        if not data:
+            return {}
+        return {"content": self._json.dumps(data), "headers": JSON_HEADERS}
+
     @staticmethod
     def _sanitize_data(data: Optional[dict[str, Any]]) -> dict[str, Any]:
         """
@@ -208,32 +340,116 @@ class BaseHTTPClient:
         encoded_path = quote(str(path), safe="/%")
         return f"{self._url}/api/v2/{api_type}/{encoded_path}"
 
+    @staticmethod
+    def _download_method(method: str) -> str:
+        """
+        Check the method of a binary download (iter_binary/download)
+
+        Downloads are GETs, or POSTs for endpoints that build the file
+        from a request body (config backup, sniffer capture).
+
+        Raises:
+            ValueError: For any other method
+        """
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Binary downloads use GET or POST, not {method}")
+        return method
+
     # ========================================================================
     # Statistics Methods
     # ========================================================================
 
     def get_retry_stats(self) -> dict[str, Any]:
         """Get retry statistics"""
-        return self._retry_stats.copy()
+        with self._state_lock:
+            stats = self._retry_stats.copy()
+            stats["retry_by_reason"] = dict(stats["retry_by_reason"])
+            stats["retry_by_endpoint"] = dict(stats["retry_by_endpoint"])
+            return stats
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """
+        Get HTTP connection pool statistics
+
+        Returns:
+            dict: Connection statistics including:
+                - http2_enabled, max_connections, max_keepalive_connections:
+                  Configured pool settings
+                - active_connections, idle_connections, total_connections:
+                  Live state of the connection pool
+                - queued_requests: Requests waiting for a free connection
+                - connections_opened, connections_reused: How requests got
+                  their connection (reuse rate in connection_reuse_rate)
+                - pool_wait_avg_ms, pool_wait_max_ms: Time requests waited
+                  for a connection (including opening a new one)
+                - connect_time_avg_ms: Average TCP + TLS setup time
+                - requests_by_http_version: Requests per negotiated version
+                - connections: Per-connection http_version, state and
+                  request_count
+                - circuit_breaker_state, consecutive_failures,
+                  last_failure_time: Circuit breaker state
+                - total_requests, successful_requests, failed_requests,
+                  success_rate, total_retries, retry_by_reason, ...: Request
+                  statistics (see get_retry_stats)
+
+        Example:
+            >>> stats = client.get_connection_stats()
+            >>> print(f"{stats['active_connections']} active, "
+            ...       f"{stats['idle_connections']} idle, "
+            ...       f"reuse {stats['connection_reuse_rate']}%")
+        """
+        breaker = self.get_circuit_breaker_state()
+        retry_stats = self.get_retry_stats()
+        total = retry_stats["total_requests"]
+        stats: dict[str, Any] = {
+            "http2_enabled": self._http2,
+            "max_connections": self._max_connections,
+            "max_keepalive_connections": self._max_keepalive_connections,
+        }
+        stats.update(
+            self._pool_monitor.snapshot(
+                get_transport_pool(getattr(self, "_client", None))
+            )
+        )
+        stats.update(
+            {
+                "circuit_breaker_state": breaker["state"],
+                "consecutive_failures": breaker["consecutive_failures"],
+                "last_failure_time": breaker["last_failure_time"],
+                "success_rate": (
+                    retry_stats["successful_requests"] / total * 100
+                    if total
+                    else 0.0
+                ),
+            }
+        )
+        stats.update(retry_stats)
+        return stats
 
     def get_circuit_breaker_state(self) -> dict[str, Any]:
         """Get current circuit breaker state"""
-        return self._circuit_breaker.copy()
+        with self._state_lock:
+            return self._circuit_breaker.copy()
+
+    def _increment_stat(self, key: str) -> None:
+        """Atomically increment a top-level retry statistics counter"""
+        with self._state_lock:
+            self._retry_stats[key] += 1
 
     def _record_retry(self, reason: str, endpoint: str) -> None:
         """Record retry attempt in statistics"""
-        self._retry_stats["total_retries"] += 1
-        self._retry_stats["last_retry_time"] = time.time()
+        with self._state_lock:
+            self._retry_stats["total_retries"] += 1
+            self._retry_stats["last_retry_time"] = time.time()
 
-        # Track by reason
-        if reason not in self._retry_stats["retry_by_reason"]:
-            self._retry_stats["retry_by_reason"][reason] = 0
-        self._retry_stats["retry_by_reason"][reason] += 1
+            # Track by reason
+            by_reason = self._retry_stats["retry_by_reason"]
+            by_reason[reason] = by_reason.get(reason, 0) + 1
 
-        # Track by endpoint
-        if endpoint not in self._retry_stats["retry_by_endpoint"]:
-            self._retry_stats["retry_by_endpoint"][endpoint] = 0
-        self._retry_stats["retry_by_endpoint"][endpoint] += 1
+            # Track by endpoint
+            by_endpoint = self._retry_stats["retry_by_endpoint"]
+            by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + 1
 
     # ========================================================================
     # Endpoint Timeout Configuration
@@ -262,70 +478,533 @@ class BaseHTTPClient:
 
     def _get_endpoint_timeout(self, endpoint: str) -> Optional[httpx.Timeout]:
         """Get custom timeout for specific endpoint if configured"""
-        for pattern, timeout in self._endpoint_timeouts.items():
+        # Iterate over a snapshot so configure_endpoint_timeout() can be
+        # called from another thread while requests are in flight
+        for pattern, timeout in list(self._endpoint_timeouts.items()):
             if fnmatch.fnmatch(endpoint, pattern):
                 return timeout
         return None
 
+    # ========================================================================
+    # Rate Limiting
+    # ========================================================================
+
+    def configure_rate_limit(
+        self, api_type: str, rate: float, burst: Optional[int] = None
+    ) -> None:
+        """
+        Limit the request rate of one API type
+
+        Overrides the client-wide rate_limit for ``api_type``, or limits
+        only this API type if the client was created without rate_limit.
+
+        Args:
+            api_type: API type (cmdb, monitor, log, service)
+            rate: Maximum requests per second
+            burst: Requests allowed back-to-back after an idle period
+            (default: rate rounded up)
+
+        Example:
+            >>> # Log searches are expensive on the device
+            >>> client.configure_rate_limit("log", rate=2)
+        """
+        self._validate_api_type(api_type)
+        with self._state_lock:
+            if self._rate_limiter is None:
+                self._rate_limiter = RateLimiter()
+        self._rate_limiter.configure(api_type, rate, burst)
+        logger.info(
+            "Configured rate limit for '%s': %.1f requests/s", api_type, rate
+        )
+
+    def get_rate_limit_stats(self) -> dict[str, Any]:
+        """Get rate limiter wait-time metrics per API type"""
+        if self._rate_limiter is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._rate_limiter.get_stats()}
+
+    def _rate_limit_delay(self, api_type: str) -> float:
+        """Reserve a request slot and return seconds to wait before sending"""
+        if self._rate_limiter is None:
+            return 0.0
+        delay = self._rate_limiter.acquire(api_type)
+        if delay > 0:
+            logger.debug(
+                "Rate limit reached for %s, delaying request by %.3fs",
+                api_type,
+                delay,
+            )
+        return delay
+
+    # ========================================================================
+    # Request Coalescing
+    # ========================================================================
+
+    def _coalesce_key(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+        vdom: Optional[Union[str, bool]],
+        raw_json: bool,
+    ) -> Optional[tuple]:
+        """
+        Return the key identical concurrent requests share, else None
+
+        Only GETs are coalesced; they are idempotent, so concurrent callers
+        asking for the same endpoint, parameters and vdom can share one
+        request and its result or exception. The key includes the write
+        epoch of the table, so reads never join a read that went out before
+        a write to the table. Log reads and GETs that continue a session
+        are not idempotent (each log search opens its own device session)
+        and are never coalesced.
+        """
+        if (
+            not self._coalesce_requests
+            or method.upper() != "GET"
+            or api_type == "log"
+            or (params and not SESSION_PARAMS.isdisjoint(params))
+        ):
+            return None
+        frozen = (
+            json.dumps(params, sort_keys=True, default=str) if params else ""
+        )
+        path = self._normalize_path(path)
+        epoch = self._write_epochs.get(table_of(api_type, path), 0)
+        return (api_type, path, frozen, vdom, raw_json, epoch)
+
+    # ========================================================================
+    # Response Cache
+    # ========================================================================
+
+    def configure_cache_ttl(self, endpoint_pattern: str, ttl: float) -> None:
+        """
+        Configure the cache TTL for specific endpoints
+
+        Args:
+            endpoint_pattern: Wildcard pattern matched against
+                ``api_type/path`` (e.g. 'monitor/system/*')
+            ttl: Seconds responses stay fresh; 0 disables caching
+
+        Raises:
+            RuntimeError: If the client was created without cache_ttl
+        """
+        if self._cache is None:
+            raise RuntimeError(
+                "Response cache is disabled; create the client with cache_ttl"
+            )
+        self._cache.configure_ttl(endpoint_pattern, ttl)
+        logger.info(
+            "Configured cache TTL for endpoint pattern '%s': %.1fs",
+            endpoint_pattern,
+            ttl,
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get response cache statistics (hits, misses, entries, ...)"""
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
+
+    def _cache_key(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+    ) -> Optional[tuple]:
+        """Return the cache key of a cacheable request, else None"""
+        if (
+            self._cache is None
+            or method.upper() != "GET"
+            or (params and not SESSION_PARAMS.isdisjoint(params))
+            or self._cache.ttl_for(f"{api_type}/{path}") <= 0
+        ):
+            return None
+        return self._cache.make_key(method, api_type, path, params)
+
+    def _cache_needs_revision_check(self, api_type: str) -> bool:
+        """Whether a cached read must validate the config revision first"""
+        return (
+            self._cache is not None
+            and api_type == "cmdb"
+            and self._cache.revision_check_due()
+        )
+
+    def _apply_config_revision(self, revision: Any) -> None:
+        """Record a fetched config revision (None if the fetch failed)"""
+        if self._cache is not None and self._cache.apply_revision(revision):
+            logger.debug("Config revision changed, cached CMDB reads dropped")
+
+    def _cached_response(self, key: tuple, raw_json: bool) -> Optional[Any]:
+        """Return a decoded cached response for a key, or None"""
+        assert self._cache is not None
+        body = self._cache.get(key)
+        if body is None:
+            return None
+        json_response = self._json.loads(body)
+        if raw_json:
+            return json_response
+        return json_response.get("results", json_response)
+
+    def _cache_invalidate(self, method: str, api_type: str, path: str) -> None:
+        """
+        Drop cached entries of the table a write request touches
+
+        Called before a write is sent and after it succeeded; also detaches
+        later reads of the table from in-flight ones (see _coalesce_key).
+        """
+        if method.upper() not in ("POST", "PUT", "DELETE"):
+            return
+        table = table_of(api_type, self._normalize_path(path))
+        with self._state_lock:
+            self._write_epochs[table] = self._write_epochs.get(table, 0) + 1
+        if self._cache is not None:
+            self._cache.invalidate(api_type, path)
+
+    # ========================================================================
+    # Schema Validation
+    # ========================================================================
+
+    def _schema_cache_for(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        data: Optional[dict[str, Any]],
+    ) -> Optional[SchemaCache]:
+        """
+        Return the schema cache if a request must be checked, else None
+
+        Checked are CMDB POST and PUT requests with a body on a table or
+        one of its objects; nested tables (``firewall/policy/1/srcaddr``)
+        have a schema of their own and are sent unchecked.
+        """
+        if (
+            self._schema_cache is None
+            or api_type != "cmdb"
+            or method.upper() not in ("POST", "PUT")
+            or not data
+            or self._normalize_path(path).strip("/").count("/") > 2
+        ):
+            return None
+        return self._schema_cache
+
+    @staticmethod
+    def _check_schema(
+        schema: TableSchema,
+        method: str,
+        path: str,
+        data: dict[str, Any],
+    ) -> None:
+        """
+        Raise ValueError if a request body doesn't fit the table schema
+
+        PUT bodies only need to hold the fields they change.
+        """
+        method = method.upper()
+        valid, error = schema.check(data, partial=method == "PUT")
+        if not valid:
+            raise ValueError(
+                f"{method} {path.strip('/')} rejected by the "
+                f"{schema.version} build {schema.build} schema: {error}"
+            )
+
+    # ========================================================================
+    # Operation Audit Log
+    # ========================================================================
+
+    def _record_operation(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        data: Optional[dict[str, Any]],
+        status_code: int,
+        params: Optional[dict[str, Any]],
+        **extra: Any,
+    ) -> None:
+        """Add an operation to the audit log (if track_operations is on)"""
+        if self._operation_log is None:
+            return
+        from datetime import datetime, timezone
+
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "method": method.upper(),
+            "api_type": api_type,
+            "path": f"/{path}",
+            "data": data,
+            "status_code": status_code,
+            "vdom": params.get("vdom") if params else None,
+        }
+        entry.update(extra)
+        self._operation_log.record(entry)
+
+    def _block_read_only(
+        self,
+        method: str,
+        api_type: str,
+        path: str,
+        data: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        request_id: Optional[str] = None,
+    ) -> None:
+        """
+        Refuse a write request in read-only mode
+
+        The blocked request is logged and recorded in the audit log.
+
+        Raises:
+            ReadOnlyModeError: If read_only is on and ``method`` writes
+        """
+        if not self._read_only or method.upper() not in WRITE_METHODS:
+            return
+        full_path = f"/api/v2/{api_type}/{path}"
+        logger.error(
+            "READ-ONLY MODE: %s request blocked",
+            method,
+            extra={
+                "request_id": request_id,
+                "method": method.upper(),
+                "endpoint": full_path,
+                "data": self._sanitize_data(data) if data else None,
+            },
+        )
+        self._record_operation(
+            method,
+            api_type,
+            path,
+            data,
+            403,  # Forbidden
+            params,
+            blocked_by_read_only=True,
+        )
+        from .exceptions_forti import ReadOnlyModeError
+
+        raise ReadOnlyModeError(
+            f"{method} operation blocked by read-only mode: {full_path}"
+        )
+
+    def iter_operations(
+        self,
+        method: Union[str, Iterable[str], None] = None,
+        api_type: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        include_spilled: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over tracked operations matching the given filters
+
+        Walks the in-memory ring buffer (or streams the spill file) and
+        yields one operation at a time, oldest first, without copying the
+        history. Yields nothing if track_operations is disabled.
+
+        Args:
+            method: HTTP method or methods to include (e.g. "POST" or
+            ("POST", "PUT", "DELETE"))
+            api_type: API type to include (cmdb, monitor, log, service)
+            path_prefix: Only paths starting with this prefix
+            (e.g. "/firewall/")
+            since: Only operations at or after this time (datetime or ISO
+            8601 string; naive values are UTC)
+            until: Only operations before this time
+            include_spilled: Read the JSONL spill file, which also holds
+            operations evicted from memory (payloads are sanitized there)
+
+        Returns:
+            Iterator of operation dictionaries (see get_operations())
+
+        Example:
+            >>> for op in client.iter_operations(
+            ...     method=("PUT", "DELETE"), path_prefix="/firewall/policy"
+            ... ):
+            ...     print(op["timestamp"], op["method"], op["path"])
+        """
+        if self._operation_log is None:
+            return iter(())
+        return self._operation_log.query(
+            method=method,
+            api_type=api_type,
+            path_prefix=path_prefix,
+            since=since,
+            until=until,
+            include_spilled=include_spilled,
+        )
+
+    def get_operations(self) -> list[dict[str, Any]]:
+        """
+        Get audit log of all tracked API operations
+
+        Returns the operations still held in memory (the most recent
+        operations_max_entries) in chronological order. Use
+        iter_operations() to filter without building a list, or
+        include_spilled=True to read the full history from the spill file.
+        Only available when track_operations=True was passed to constructor.
+
+        Returns:
+            List of operation dictionaries with keys:
+                - timestamp: ISO 8601 timestamp
+                - method: HTTP method (GET/POST/PUT/DELETE)
+                - api_type: API type (cmdb/monitor/log/service)
+                - path: API endpoint path
+                - data: Request payload (for POST/PUT), None otherwise
+                - status_code: HTTP response status code
+                - vdom: Virtual domain (if specified)
+                - read_only: False for executed operations
+                - blocked_by_read_only: True if the operation was blocked by
+                read-only mode
+
+        Example:
+            >>> client = HTTPClient(url="https://192.0.2.10", token="...",
+            track_operations=True)
+            >>> client.post("cmdb", "/firewall/address", {"name": "test"})
+            >>> ops = client.get_operations()
+            >>> print(ops[0])
+            {
+                'timestamp': '2024-12-20T10:30:15+00:00',
+                'method': 'POST',
+                'api_type': 'cmdb',
+                'path': '/firewall/address',
+                'data': {'name': 'test'},
+                'status_code': 200,
+                'vdom': 'root',
+                'read_only': False
+            }
+        """
+        return list(self.iter_operations())
+
+    def get_write_operations(self) -> list[dict[str, Any]]:
+        """
+        Get audit log of write operations only (POST/PUT/DELETE)
+
+        Filters tracked operations to return only write operations, excluding
+        GET requests.
+
+        Returns:
+            List of write operation dictionaries (same format as
+            get_operations())
+
+        Example:
+            >>> client.get("cmdb", "/firewall/address/test")  # Excluded
+            >>> client.post("cmdb", "/firewall/address", {"name": "test2"})
+            >>> client.delete("cmdb", "/firewall/address/test")
+            >>> len(client.get_write_operations())  # POST and DELETE
+            2
+        """
+        return list(self.iter_operations(method=WRITE_METHODS))
+
+    def flush_operations(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all tracked operations are written to the spill file
+
+        Args:
+            timeout: Maximum seconds to wait (default: None = no limit)
+
+        Returns:
+            True if the spill file is up to date (or none is configured)
+        """
+        if self._operation_log is None:
+            return True
+        return self._operation_log.flush(timeout)
+
+    def get_operation_stats(self) -> dict[str, Any]:
+        """Get audit log occupancy, evictions and spill file counters"""
+        if self._operation_log is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._operation_log.get_stats()}
+
     # ========================================================================
     # Circuit Breaker Methods
     # ========================================================================
 
     def _check_circuit_breaker(self, endpoint: str) -> None:
         """Check circuit breaker state before making request"""
-        if self._circuit_breaker["state"] == "open":
+        remaining = None
+        with self._state_lock:
+            if self._circuit_breaker["state"] == "open":
+                elapsed = time.time() - (
+                    self._circuit_breaker["last_failure_time"] or 0
+                )
+                if elapsed < self._circuit_breaker["timeout"]:
+                    remaining = self._circuit_breaker["timeout"] - elapsed
+                else:
+                    self._circuit_breaker["state"] = "half_open"
+                    logger.info(
+                        "Circuit breaker transitioning to HALF_OPEN state"
+                    )
+
+        if remaining is not None:
+            logger.error(
+                "Circuit breaker is OPEN - service unavailable (retry in %.1fs)",  # noqa: E501
+                remaining,
+            )
+            from .exceptions import CircuitBreakerOpenError
+
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker is OPEN for {endpoint}. "
+                f"Service appears to be down. Retry in {remaining:.1f}s"
+            )
+
+    def _try_half_open_circuit_breaker(self) -> None:
+        """Move an open circuit to half_open once its timeout has elapsed"""
+        with self._state_lock:
+            if self._circuit_breaker["state"] != "open":
+                return
             elapsed = time.time() - (
                 self._circuit_breaker["last_failure_time"] or 0
             )
-            if elapsed < self._circuit_breaker["timeout"]:
-                remaining = self._circuit_breaker["timeout"] - elapsed
-                logger.error(
-                    "Circuit breaker is OPEN - service unavailable (retry in %.1fs)",  # noqa: E501
-                    remaining,
-                )
-                from .exceptions import CircuitBreakerOpenError
-
-                raise CircuitBreakerOpenError(
-                    f"Circuit breaker is OPEN for {endpoint}. "
-                    f"Service appears to be down. Retry in {remaining:.1f}s"
-                )
-            else:
+            if elapsed >= self._circuit_breaker["timeout"]:
                 self._circuit_breaker["state"] = "half_open"
                 logger.info("Circuit breaker transitioning to HALF_OPEN state")
 
     def _record_circuit_breaker_success(self) -> None:
         """Record successful request in circuit breaker"""
-        if self._circuit_breaker["state"] == "half_open":
-            self._circuit_breaker["state"] = "closed"
-            self._circuit_breaker["consecutive_failures"] = 0
-            logger.info("Circuit breaker CLOSED after successful request")
-        elif self._circuit_breaker["state"] == "closed":
-            self._circuit_breaker["consecutive_failures"] = 0
+        with self._state_lock:
+            if self._circuit_breaker["state"] == "half_open":
+                self._circuit_breaker["state"] = "closed"
+                self._circuit_breaker["consecutive_failures"] = 0
+                logger.info("Circuit breaker CLOSED after successful request")
+            elif self._circuit_breaker["state"] == "closed":
+                self._circuit_breaker["consecutive_failures"] = 0
 
     def _record_circuit_breaker_failure(self, endpoint: str) -> None:
         """Record failed request in circuit breaker"""
-        self._circuit_breaker["consecutive_failures"] += 1
-        self._circuit_breaker["last_failure_time"] = time.time()
-
-        failures = self._circuit_breaker["consecutive_failures"]
-        threshold = self._circuit_breaker["failure_threshold"]
-
-        if failures >= threshold and self._circuit_breaker["state"] != "open":
-            self._circuit_breaker["state"] = "open"
-            logger.error(
-                (
-                    "Circuit breaker OPENED after %d consecutive "
-                    "failures for endpoint %s"
-                ),
-                failures,
-                endpoint,
-            )
+        with self._state_lock:
+            self._circuit_breaker["consecutive_failures"] += 1
+            self._circuit_breaker["last_failure_time"] = time.time()
+
+            failures = self._circuit_breaker["consecutive_failures"]
+            threshold = self._circuit_breaker["failure_threshold"]
+
+            if (
+                failures >= threshold
+                and self._circuit_breaker["state"] != "open"
+            ):
+                self._circuit_breaker["state"] = "open"
+                logger.error(
+                    (
+                        "Circuit breaker OPENED after %d consecutive "
+                        "failures for endpoint %s"
+                    ),
+                    failures,
+                    endpoint,
+                )
 
     def reset_circuit_breaker(self) -> None:
         """Reset circuit breaker to closed state"""
-        self._circuit_breaker["state"] = "closed"
-        self._circuit_breaker["consecutive_failures"] = 0
-        self._circuit_breaker["last_failure_time"] = None
+        with self._state_lock:
+            self._circuit_breaker["state"] = "closed"
+            self._circuit_breaker["consecutive_failures"] = 0
+            self._circuit_breaker["last_failure_time"] = None
         logger.info("Circuit breaker manually reset to CLOSED state")
 
     # ========================================================================
@@ -484,11 +1163,12 @@ class BaseHTTPClient:
         if not self._adaptive_retry:
             return  # Zero overhead when disabled
 
-        if endpoint not in self._response_times:
-            # Keep last 100 response times per endpoint
-            self._response_times[endpoint] = deque(maxlen=100)
+        with self._state_lock:
+            if endpoint not in self._response_times:
+                # Keep last 100 response times per endpoint
+                self._response_times[endpoint] = deque(maxlen=100)
 
-        self._response_times[endpoint].append(duration)
+            self._response_times[endpoint].append(duration)
 
     def _get_avg_response_time(self, endpoint: str) -> float:
         """
@@ -500,7 +1180,8 @@ class BaseHTTPClient:
         Returns:
             Average response time in seconds, or 0.0 if no data
         """
-        times = self._response_times.get(endpoint, deque())
+        with self._state_lock:
+            times = list(self._response_times.get(endpoint, ()))
         if not times:
             return 0.0
         return sum(times) / len(times)
@@ -532,22 +1213,29 @@ class BaseHTTPClient:
         Returns:
             Dictionary with health score, response times, circuit state, etc.
         """
+        breaker = self.get_circuit_breaker_state()
         metrics: dict[str, Any] = {
             "circuit_breaker": {
-                "state": self._circuit_breaker["state"],
-                "consecutive_failures": self._circuit_breaker[
-                    "consecutive_failures"
-                ],
-                "threshold": self._circuit_breaker["failure_threshold"],
+                "state": breaker["state"],
+                "consecutive_failures": breaker["consecutive_failures"],
+                "threshold": breaker["failure_threshold"],
             },
-            "retry_stats": self._retry_stats.copy(),
+            "retry_stats": self.get_retry_stats(),
             "adaptive_retry_enabled": self._adaptive_retry,
+            "cache": self.get_cache_stats(),
+            "rate_limit": self.get_rate_limit_stats(),
+            "operations": self.get_operation_stats(),
         }
 
         # Add response time metrics if adaptive retry is enabled
-        if self._adaptive_retry and self._response_times:
+        with self._state_lock:
+            response_times = {
+                endpoint: list(times)
+                for endpoint, times in self._response_times.items()
+            }
+        if self._adaptive_retry and response_times:
             metrics["response_times"] = {}
-            for endpoint, times in self._response_times.items():
+            for endpoint, times in response_times.items():
                 if times:
                     sorted_times = sorted(times)
                     count = len(sorted_times)
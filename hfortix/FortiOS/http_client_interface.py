@@ -45,7 +45,9 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine, Iterator
+
+    from .download import DownloadTarget
 
 __all__ = ["IHTTPClient"]
 
@@ -87,6 +89,7 @@ class IHTTPClient(Protocol):
         params: Optional[dict[str, Any]] = None,
         vdom: Optional[Union[str, bool]] = None,
         raw_json: bool = False,
+        coalesce: bool = True,
     ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
         """
         Perform GET request to retrieve resource(s) from the API.
@@ -99,6 +102,8 @@ class IHTTPClient(Protocol):
             vdom: Virtual domain name, or False to skip VDOM parameter
             raw_json: If True, return full API response with metadata; if
             False, return only results
+            coalesce: If False, never share the request with identical
+            concurrent ones
 
         Returns:
             dict: API response (sync mode) or Coroutine[dict] (async mode)
@@ -300,3 +305,61 @@ class IHTTPClient(Protocol):
             Raw binary response data (bytes)
         """
         ...
+
+    def iter_binary(
+        self,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        chunk_size: int = 65536,
+    ) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+        """
+        Request yielding a binary response body in chunks.
+
+        Args:
+            api_type: API category (e.g., 'monitor', 'log', 'service')
+            path: Endpoint path
+            params: Optional query parameters
+            vdom: Virtual domain name, or False to skip VDOM parameter
+            data: Optional JSON request body (for POST downloads)
+            method: HTTP method (GET or POST)
+            chunk_size: Bytes read from the socket at a time
+
+        Returns:
+            Iterator (sync) or async iterator (async) of body chunks
+        """
+        ...
+
+    def download(
+        self,
+        api_type: str,
+        path: str,
+        dest: DownloadTarget,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        data: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        checksum: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> Union[dict[str, Any], Coroutine[Any, Any, dict[str, Any]]]:
+        """
+        Stream a binary response body to a file path or file object.
+
+        Args:
+            api_type: API category (e.g., 'monitor', 'log', 'service')
+            path: Endpoint path
+            dest: File path or binary file object opened for writing
+            params: Optional query parameters
+            vdom: Virtual domain name, or False to skip VDOM parameter
+            data: Optional JSON request body (for POST downloads)
+            method: HTTP method (GET or POST)
+            checksum: Optional hashlib algorithm computed while writing
+            chunk_size: Bytes read from the socket at a time
+
+        Returns:
+            Dictionary with path, bytes and optional checksum/algorithm
+        """
+        ...
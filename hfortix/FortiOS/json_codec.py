@@ -0,0 +1,154 @@
+"""
+Pluggable JSON encoding and decoding of request and response bodies.
+
+Decoding large CMDB tables (thousands of policies or addresses) is the
+biggest CPU cost of a request once the data has arrived. HTTPClient and
+AsyncHTTPClient therefore encode and decode bodies through a JSONCodec
+instead of httpx's stdlib ``json`` calls:
+
+- ``"auto"`` (default) uses orjson if installed, then msgspec, then the
+  standard library
+- ``"orjson"``, ``"msgspec"`` or ``"json"`` select one explicitly
+- any JSONCodec instance (or subclass) can be passed for custom behaviour
+
+Responses are decoded straight from the response bytes, skipping the
+bytes -> str conversion ``response.json()`` does first. The fast codecs
+are stricter than the standard library (NaN/Infinity literals, integers
+beyond 64 bits, non-string dict keys); anything they reject is retried
+with the standard library, so results and exceptions match what the
+stdlib codec would produce.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+__all__ = ["JSONCodec", "get_json_codec"]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec, and base class of the fast codecs
+
+    Encodes like httpx's ``json=`` argument (compact separators, UTF-8,
+    no NaN/Infinity) so switching codecs doesn't change request bodies.
+
+    Example:
+        >>> codec = get_json_codec("auto")
+        >>> codec.name
+        'orjson'
+        >>> codec.loads(b'{"results": []}')
+        {'results': []}
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as a UTF-8 JSON request body"""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON response body"""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError:
+            return super().loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encode = msgspec.json.encode
+        self._decode = msgspec.json.decode
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encode(obj)
+        except (TypeError, ValueError):
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decode(data)
+        except ValueError:
+            return super().loads(data)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+def get_json_codec(codec: Union[str, JSONCodec] = "auto") -> JSONCodec:
+    """
+    Resolve a codec name (or instance) to a JSONCodec
+
+    Args:
+        codec: "auto", "orjson", "msgspec", "json" or a JSONCodec instance
+
+    Returns:
+        JSONCodec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the named library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return JSONCodec()
+    try:
+        codec_class = _CODECS[codec]
+    except KeyError:
+        raise ValueError(
+            f"Unknown json_codec {codec!r}; expected 'auto', "
+            f"{', '.join(repr(n) for n in _CODECS)} or a JSONCodec instance"
+        ) from None
+    try:
+        return codec_class()
+    except ImportError as e:
+        raise ImportError(
+            f"json_codec={codec!r} requires the {codec} package "
+            f"(pip install {codec})"
+        ) from e
@@ -0,0 +1,221 @@
+"""
+Incremental JSON decoding of FortiOS API responses.
+
+FortiOS wraps every response in an envelope whose ``results`` member holds
+the data. For large tables that array can be hundreds of megabytes, and
+decoding it with ``response.json()`` keeps the raw bytes, the decoded text
+and the complete object tree in memory at the same time.
+
+ResultsStreamParser consumes the response body in chunks as they arrive
+from the socket and hands back each entry of ``results`` as soon as it is
+complete, so memory use stays near one entry plus the receive buffer.
+Only the standard library is used: entries are decoded with the C
+accelerated ``json`` scanner, the envelope is walked by a small state
+machine.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, Callable, List, cast
+
+__all__ = ["ResultsStreamParser"]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can follow a complete value inside the envelope
+_DELIMITERS = frozenset(",]}")
+_NUMBERS = (int, float)
+
+# Parser states
+_START = 0  # Before the top-level value
+_KEY = 1  # Expecting an envelope key (or "}")
+_COLON = 2  # Expecting ":" after a key
+_VALUE = 3  # Expecting an envelope value
+_AFTER_VALUE = 4  # Expecting "," or "}" after an envelope value
+_ITEM = 5  # Expecting a results entry (or "]")
+_AFTER_ITEM = 6  # Expecting "," or "]" after a results entry
+_DONE = 7
+
+
+class ResultsStreamParser:
+    """
+    Push parser yielding the entries of a response's ``results`` array
+
+    Feed decoded text chunks with feed(); each call returns the entries
+    completed by that chunk. Call close() once the body has been fully
+    received. Other envelope members (status, http_status, vdom, ...) are
+    collected in ``envelope``. If ``results`` is not an array, its value
+    is returned as a single entry. A bare top-level array is streamed as
+    if it were the results array.
+
+    Example:
+        >>> parser = ResultsStreamParser()
+        >>> for chunk in chunks:
+        ...     for entry in parser.feed(chunk):
+        ...         handle(entry)
+        >>> for entry in parser.close():
+        ...     handle(entry)
+    """
+
+    def __init__(self, key: str = "results") -> None:
+        self._key = key
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key: str | None = None
+        self._top_level_array = False
+        # Length of buffered text when decoding last failed for lack of
+        # data; decoding is retried once twice as much is available, which
+        # keeps very large entries from being re-scanned on every chunk
+        self._retry_at = 0
+        self._decode = json.JSONDecoder().raw_decode
+        self.envelope: dict[str, Any] = {}
+
+    def feed(self, text: str) -> List[Any]:
+        """Add a chunk of response text and return completed entries"""
+        if text:
+            self._buf = self._buf[self._pos :] + text
+            self._pos = 0
+        out: List[Any] = []
+        if len(self._buf) - self._pos >= self._retry_at:
+            self._parse(out, final=False)
+        return out
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing and return the remaining entries
+
+        Raises:
+            ValueError: If the response was truncated or is not valid JSON
+        """
+        out: List[Any] = []
+        self._parse(out, final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON response")
+        return out
+
+    def _error(self, expected: str, pos: int) -> ValueError:
+        found = self._buf[pos : pos + 20]
+        return ValueError(
+            f"Invalid JSON response: expected {expected}, found {found!r}"
+        )
+
+    def _parse(self, out: List[Any], final: bool) -> None:
+        buf = self._buf
+        n = len(buf)
+        pos = self._pos
+        state = self._state
+        # Matches the empty string, so never returns None
+        whitespace = cast(
+            "Callable[[str, int], re.Match[str]]", _WHITESPACE.match
+        )
+        decode = self._decode
+        try:
+            while True:
+                pos = whitespace(buf, pos).end()
+                if pos >= n:
+                    break
+                ch = buf[pos]
+
+                if (
+                    state == _VALUE
+                    and ch == "["
+                    and self._current_key == self._key
+                ):
+                    state = _ITEM
+                    pos += 1
+
+                elif state == _ITEM and ch == "]":
+                    state = _DONE if self._top_level_array else _AFTER_VALUE
+                    pos += 1
+
+                elif state == _ITEM or state == _VALUE:
+                    # Decode one complete value. Without the next token
+                    # the value might still be cut short (a number split
+                    # by a chunk boundary), so wait for more data unless
+                    # the body is complete.
+                    try:
+                        value, end = decode(buf, pos)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        self._retry_at = 2 * (n - pos)
+                        break
+                    if not final:
+                        # A number is only complete once the delimiter
+                        # after it is here: "-2500." decodes as -2500
+                        after = whitespace(buf, end).end()
+                        if after >= n or (
+                            type(value) in _NUMBERS
+                            and buf[after] not in _DELIMITERS
+                        ):
+                            self._retry_at = 2 * (n - pos)
+                            break
+                    self._retry_at = 0
+                    if state == _ITEM or self._current_key == self._key:
+                        out.append(value)
+                    else:
+                        self.envelope[self._current_key or ""] = value
+                    state = _AFTER_ITEM if state == _ITEM else _AFTER_VALUE
+                    pos = end
+
+                elif state == _AFTER_ITEM:
+                    if ch == ",":
+                        state = _ITEM
+                    elif ch == "]":
+                        state = (
+                            _DONE if self._top_level_array else _AFTER_VALUE
+                        )
+                    else:
+                        raise self._error("',' or ']'", pos)
+                    pos += 1
+
+                elif state == _KEY:
+                    if ch == "}":
+                        state = _DONE
+                        pos += 1
+                    elif ch == '"':
+                        try:
+                            key, end = scanstring(buf, pos + 1)
+                        except json.JSONDecodeError:
+                            if final:
+                                raise
+                            break
+                        self._current_key = key
+                        state = _COLON
+                        pos = end
+                    else:
+                        raise self._error("a key", pos)
+
+                elif state == _COLON:
+                    if ch != ":":
+                        raise self._error("':'", pos)
+                    state = _VALUE
+                    pos += 1
+
+                elif state == _AFTER_VALUE:
+                    if ch == ",":
+                        state = _KEY
+                    elif ch == "}":
+                        state = _DONE
+                    else:
+                        raise self._error("',' or '}'", pos)
+                    pos += 1
+
+                elif state == _START:
+                    if ch == "{":
+                        state = _KEY
+                    elif ch == "[":
+                        state = _ITEM
+                        self._top_level_array = True
+                    else:
+                        raise self._error("'{' or '['", pos)
+                    pos += 1
+
+                else:
+                    raise self._error("end of response", pos)
+        finally:
+            self._pos = pos
+            self._state = state
@@ -0,0 +1,299 @@
+"""
+Operation audit log for ``track_operations``.
+
+Used by HTTPClient and AsyncHTTPClient when ``track_operations=True``.
+Operations are kept in a fixed-size ring buffer, so a long-running process
+only holds the most recent ``max_entries`` operations in memory.
+
+For a complete history, operations can also be appended to a JSONL file
+(one JSON object per line). Lines are written by a background thread, so
+the request path never waits for disk I/O; request payloads are redacted
+with the client's data sanitizer before they are queued. If the writer
+falls behind by more than ``max_entries`` operations, new lines are
+dropped and counted rather than blocking requests.
+
+``query()`` walks the buffer (or streams the file) and yields matching
+entries one at a time instead of copying the whole history.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+logger = logging.getLogger("hfortix.http.operations")
+
+__all__ = ["OperationLog"]
+
+WRITE_METHODS = ("POST", "PUT", "DELETE")
+
+# Entries copied out of the ring buffer per lock acquisition in query()
+_QUERY_BATCH = 256
+
+_STOP = object()
+
+TimeBound = Union[datetime, str, None]
+
+
+def _to_datetime(value: TimeBound) -> Optional[datetime]:
+    """Normalize a time bound; naive datetimes are taken as UTC"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class _SpillWriter:
+    """Background thread appending queued entries to a JSONL file"""
+
+    def __init__(self, path: str, max_pending: int) -> None:
+        self.path = path
+        # Open in the caller's thread so a bad path fails at construction
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self._thread = threading.Thread(
+            target=self._run, name="hfortix-operation-log", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, entry: dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: Optional[float]) -> bool:
+        """Wait until everything queued so far is on disk"""
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float]) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        with self._file:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    return
+                if isinstance(item, threading.Event):
+                    self._file.flush()
+                    item.set()
+                    continue
+                try:
+                    self._file.write(json.dumps(item, default=str) + "\n")
+                    self.written += 1
+                except (OSError, TypeError, ValueError) as e:
+                    self.errors += 1
+                    logger.warning(
+                        "Failed to write operation to %s: %s", self.path, e
+                    )
+                if self._queue.empty():
+                    self._file.flush()
+
+
+class OperationLog:
+    """
+    Bounded, optionally spilled, log of API operations
+
+    Args:
+        max_entries: Operations kept in memory; the oldest are evicted
+            first (default: 10000)
+        spill_file: Path of a JSONL file every operation is appended to,
+            or None to keep only the in-memory buffer (default: None)
+        sanitize: Function applied to an operation's ``data`` before it is
+            written to the spill file (e.g. to redact passwords)
+
+    Example:
+        >>> log = OperationLog(max_entries=1000, spill_file="audit.jsonl")
+        >>> log.record({"method": "POST", "path": "/firewall/address", ...})
+        >>> for op in log.query(method="POST", path_prefix="/firewall/"):
+        ...     print(op["timestamp"], op["path"])
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        spill_file: Optional[str] = None,
+        sanitize: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("operations_max_entries must be > 0")
+        self._capacity = max_entries
+        self._buffer: list[Optional[dict[str, Any]]] = [None] * max_entries
+        # Sequence number of the next entry; entry n lives in slot
+        # n % capacity until it is overwritten by entry n + capacity
+        self._next = 0
+        self._lock = threading.Lock()
+        self._sanitize = sanitize
+        self._writer: Optional[_SpillWriter] = (
+            _SpillWriter(spill_file, max_entries) if spill_file else None
+        )
+
+    def __len__(self) -> int:
+        return min(self._next, self._capacity)
+
+    @property
+    def spill_file(self) -> Optional[str]:
+        """Path of the JSONL spill file, or None"""
+        return self._writer.path if self._writer is not None else None
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """Add an operation (never blocks on I/O)"""
+        with self._lock:
+            self._buffer[self._next % self._capacity] = entry
+            self._next += 1
+        if self._writer is not None:
+            if self._sanitize is not None and entry.get("data"):
+                entry = dict(entry, data=self._sanitize(entry["data"]))
+            self._writer.put(entry)
+
+    def query(
+        self,
+        method: Union[str, Iterable[str], None] = None,
+        api_type: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        include_spilled: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield matching operations, oldest first
+
+        Only entries recorded before iteration starts are yielded. Entries
+        evicted from the buffer while the iterator is paused are skipped.
+
+        Args:
+            method: HTTP method or methods to include (e.g. "POST" or
+                ("POST", "PUT", "DELETE"))
+            api_type: API type to include (cmdb, monitor, log, service)
+            path_prefix: Only paths starting with this prefix
+                (e.g. "/firewall/")
+            since: Only operations at or after this time (datetime or ISO
+                8601 string; naive values are UTC)
+            until: Only operations before this time
+            include_spilled: Read the spill file instead of the buffer, to
+                include operations already evicted from memory (payloads in
+                the file are sanitized). Requires a spill file.
+
+        Returns:
+            Iterator of operation dictionaries
+        """
+        methods: Optional[set[str]] = None
+        if method is not None:
+            methods = (
+                {method.upper()}
+                if isinstance(method, str)
+                else {m.upper() for m in method}
+            )
+        start_time = _to_datetime(since)
+        end_time = _to_datetime(until)
+
+        def matches(entry: dict[str, Any]) -> bool:
+            if methods is not None and entry.get("method") not in methods:
+                return False
+            if api_type is not None and entry.get("api_type") != api_type:
+                return False
+            if path_prefix is not None and not str(
+                entry.get("path", "")
+            ).startswith(path_prefix):
+                return False
+            if start_time is not None or end_time is not None:
+                stamp = _to_datetime(entry.get("timestamp"))
+                if stamp is None:
+                    return False
+                if start_time is not None and stamp < start_time:
+                    return False
+                if end_time is not None and stamp >= end_time:
+                    return False
+            return True
+
+        if include_spilled:
+            if self._writer is None:
+                raise RuntimeError(
+                    "No operation spill file configured. Initialize with "
+                    "operations_spill_file=... to query the full history."
+                )
+            return self._query_spilled(self._writer, matches)
+        return self._query_buffer(matches)
+
+    def _query_buffer(
+        self, matches: Callable[[dict[str, Any]], bool]
+    ) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            seq = max(0, self._next - self._capacity)
+            end = self._next
+        while seq < end:
+            with self._lock:
+                # Skip entries overwritten since the last batch
+                seq = max(seq, self._next - self._capacity)
+                stop = min(end, seq + _QUERY_BATCH)
+                batch = [
+                    self._buffer[i % self._capacity] for i in range(seq, stop)
+                ]
+            seq = stop
+            for entry in batch:
+                if entry is not None and matches(entry):
+                    yield entry
+
+    @staticmethod
+    def _query_spilled(
+        writer: _SpillWriter, matches: Callable[[dict[str, Any]], bool]
+    ) -> Iterator[dict[str, Any]]:
+        writer.flush(timeout=None)
+        with open(writer.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if matches(entry):
+                    yield entry
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all recorded operations are written to the spill file
+
+        Returns:
+            True if the file is up to date (or there is no spill file)
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write pending operations and stop the background writer"""
+        if self._writer is not None:
+            self._writer.close(timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return buffer occupancy and spill file counters"""
+        with self._lock:
+            recorded = self._next
+        stats: dict[str, Any] = {
+            "entries": min(recorded, self._capacity),
+            "max_entries": self._capacity,
+            "recorded": recorded,
+            "evicted": max(0, recorded - self._capacity),
+            "spill_file": self.spill_file,
+        }
+        if self._writer is not None:
+            stats["spilled"] = self._writer.written
+            stats["spill_dropped"] = self._writer.dropped
+            stats["spill_errors"] = self._writer.errors
+        return stats
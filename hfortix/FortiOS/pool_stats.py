@@ -0,0 +1,177 @@
+"""
+Connection pool instrumentation.
+
+httpx doesn't expose pool metrics directly. PoolMonitor collects them from
+two sources:
+
+- The ``trace`` request extension of httpcore (the transport under httpx),
+  which reports when a request opens a new TCP connection and when its
+  headers are sent. From that we count connections opened versus reused,
+  how long requests waited for a connection and how long connecting took.
+- The transport's connection pool, which is inspected when stats are
+  requested to report active/idle connections and the HTTP version
+  negotiated on each of them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+__all__ = ["PoolMonitor", "get_transport_pool"]
+
+TraceCallback = Callable[[str, dict[str, Any]], None]
+
+
+def get_transport_pool(client: Any) -> Optional[Any]:
+    """Return the httpcore connection pool behind an httpx client, if any"""
+    transport = getattr(client, "_transport", None)
+    return getattr(transport, "_pool", None)
+
+
+class PoolMonitor:
+    """
+    Thread-safe connection pool metrics for one httpx client
+
+    Example:
+        >>> monitor = PoolMonitor()
+        >>> client.get(url, extensions={"trace": monitor.tracer()})
+        >>> monitor.snapshot(get_transport_pool(client))["connections_opened"]
+        1
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._reused = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._waits = 0
+        self._connect_total = 0.0
+        self._by_version: dict[str, int] = {}
+
+    def tracer(self) -> TraceCallback:
+        """Return a trace callback for one request (sync clients)"""
+        start = time.monotonic()
+        state: dict[str, Any] = {"acquired": False, "connect_start": None}
+
+        def trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.started":
+                # No reusable connection: the request opens a new one
+                now = time.monotonic()
+                state["connect_start"] = now
+                if not state["acquired"]:
+                    state["acquired"] = True
+                    self._record_wait(now - start, opened=True)
+            elif event.endswith(".send_request_headers.started"):
+                now = time.monotonic()
+                version = "HTTP/2" if event.startswith("http2") else "HTTP/1.1"
+                connect_start = state["connect_start"]
+                with self._lock:
+                    self._by_version[version] = (
+                        self._by_version.get(version, 0) + 1
+                    )
+                    if connect_start is not None:
+                        self._connect_total += now - connect_start
+                        state["connect_start"] = None
+                if not state["acquired"]:
+                    state["acquired"] = True
+                    self._record_wait(now - start, opened=False)
+
+        return trace
+
+    def atracer(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """Return a trace callback for one request (async clients)"""
+        trace = self.tracer()
+
+        async def atrace(event: str, info: dict[str, Any]) -> None:
+            trace(event, info)
+
+        return atrace
+
+    def _record_wait(self, wait: float, opened: bool) -> None:
+        with self._lock:
+            if opened:
+                self._opened += 1
+            else:
+                self._reused += 1
+            self._waits += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+    def snapshot(self, pool: Optional[Any]) -> dict[str, Any]:
+        """
+        Return pool metrics
+
+        Args:
+            pool: httpcore connection pool (see get_transport_pool), or None
+                if the client uses a custom transport
+
+        Returns:
+            Dictionary with active/idle/total connections, queued requests,
+            connections opened and reused, pool wait and connect times and
+            per-connection state including the negotiated HTTP version
+        """
+        connections: list[dict[str, Any]] = []
+        queued = 0
+        if pool is not None:
+            for conn in list(getattr(pool, "connections", [])):
+                # info() looks like "'https://host', HTTP/2, ACTIVE, Request
+                # Count: 12", or "'https://host', CONNECTING" before the
+                # handshake completed
+                parts = [part.strip() for part in conn.info().split(",")]
+                version = next(
+                    (part for part in parts if part.startswith("HTTP/")), None
+                )
+                count = 0
+                if parts[-1].startswith("Request Count:"):
+                    count = int(parts[-1].split(":", 1)[1])
+                connections.append(
+                    {
+                        "http_version": version,
+                        "state": (
+                            "closed"
+                            if conn.is_closed()
+                            else "idle" if conn.is_idle() else "active"
+                        ),
+                        "request_count": count,
+                    }
+                )
+            queued = sum(
+                1
+                for request in list(getattr(pool, "_requests", []))
+                if request.is_queued()
+            )
+
+        with self._lock:
+            opened = self._opened
+            reused = self._reused
+            waits = self._waits
+            wait_total = self._wait_total
+            wait_max = self._wait_max
+            connect_total = self._connect_total
+            by_version = dict(self._by_version)
+
+        states = [conn["state"] for conn in connections]
+        return {
+            "pool_instrumented": pool is not None,
+            "active_connections": states.count("active"),
+            "idle_connections": states.count("idle"),
+            "total_connections": len(states) - states.count("closed"),
+            "queued_requests": queued,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "connection_reuse_rate": (
+                round(reused / waits * 100, 2) if waits else 0.0
+            ),
+            "pool_wait_avg_ms": (
+                round(wait_total / waits * 1000, 3) if waits else 0.0
+            ),
+            "pool_wait_max_ms": round(wait_max * 1000, 3),
+            "connect_time_avg_ms": (
+                round(connect_total / opened * 1000, 3) if opened else 0.0
+            ),
+            "requests_by_http_version": by_version,
+            "connections": connections,
+        }
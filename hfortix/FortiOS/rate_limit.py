@@ -0,0 +1,173 @@
+"""
+Client-side rate limiting.
+
+FortiGate management planes slow down sharply under API load, and retrying
+after 429/503 only reacts once the device is already struggling.
+RateLimiter paces requests before they are sent, with one token bucket per
+API type (cmdb, monitor, log, service) so a burst of log queries can't
+starve configuration reads. Each client talks to one device, so each
+client owns one RateLimiter.
+
+Tokens are reserved rather than waited for under a lock: acquire() hands
+out the next free slot and returns how long the caller has to wait for it.
+The sync client sleeps, the async client awaits asyncio.sleep(), and the
+limiter itself never blocks.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Optional
+
+__all__ = ["RateLimiter", "TokenBucket"]
+
+
+def _default_burst(rate: float) -> int:
+    """One second worth of requests, at least one"""
+    return max(1, math.ceil(rate))
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests/second with bursts of ``burst``
+
+    Not thread-safe on its own; RateLimiter serializes access.
+
+    Args:
+        rate: Sustained requests per second (> 0)
+        burst: Requests that may be sent back-to-back after an idle period
+            (default: 1)
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return the seconds until it is available"""
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        # Negative balance: the caller waits until the debt is paid off
+        return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Per-device request pacing with a token bucket per API type
+
+    Args:
+        rate: Default requests/second for every API type, or None to only
+            limit API types set up with configure()
+        burst: Default burst size (default: rate rounded up, at least 1)
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, burst=20)
+        >>> limiter.configure("log", rate=2, burst=2)
+        >>> delay = limiter.acquire("cmdb")  # Seconds to wait before sending
+    """
+
+    def __init__(
+        self, rate: Optional[float] = None, burst: Optional[int] = None
+    ) -> None:
+        self._default: Optional[tuple[float, int]] = None
+        if rate is not None:
+            self._default = (rate, burst or _default_burst(rate))
+            TokenBucket(*self._default)  # Validate early
+        self._config: dict[str, tuple[float, int]] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def configure(
+        self, api_type: str, rate: float, burst: Optional[int] = None
+    ) -> None:
+        """
+        Override the limit of one API type
+
+        Args:
+            api_type: cmdb, monitor, log or service
+            rate: Requests per second
+            burst: Burst size (default: rate rounded up, at least 1)
+        """
+        config = (rate, burst or _default_burst(rate))
+        TokenBucket(*config)  # Validate
+        with self._lock:
+            self._config[api_type] = config
+            self._buckets.pop(api_type, None)
+
+    def acquire(self, api_type: str) -> float:
+        """
+        Reserve a request slot for ``api_type``
+
+        Returns:
+            Seconds the caller must wait before sending (0.0 if none)
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(api_type)
+            if bucket is None:
+                config = self._config.get(api_type, self._default)
+                if config is None:
+                    return 0.0  # API type not limited
+                bucket = self._buckets[api_type] = TokenBucket(*config)
+            delay = bucket.reserve(now)
+            stats = self._stats.get(api_type)
+            if stats is None:
+                stats = self._stats[api_type] = {
+                    "requests": 0,
+                    "delayed": 0,
+                    "total_wait": 0.0,
+                    "max_wait": 0.0,
+                }
+            stats["requests"] += 1
+            if delay > 0:
+                stats["delayed"] += 1
+                stats["total_wait"] += delay
+                stats["max_wait"] = max(stats["max_wait"], delay)
+        return delay
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return limits and wait-time metrics per API type
+
+        Returns:
+            Dictionary mapping api_type to rate, burst, requests, delayed
+            (requests that had to wait), total_wait_ms, avg_wait_ms and
+            max_wait_ms
+        """
+        with self._lock:
+            snapshot = {k: dict(v) for k, v in self._stats.items()}
+            config = dict(self._config)
+        result: dict[str, Any] = {}
+        for api_type, stats in snapshot.items():
+            rate, burst = config.get(api_type) or self._default or (0, 0)
+            requests = stats["requests"]
+            result[api_type] = {
+                "rate": rate,
+                "burst": burst,
+                "requests": requests,
+                "delayed": stats["delayed"],
+                "total_wait_ms": round(stats["total_wait"] * 1000, 2),
+                "avg_wait_ms": (
+                    round(stats["total_wait"] / requests * 1000, 2)
+                    if requests
+                    else 0.0
+                ),
+                "max_wait_ms": round(stats["max_wait"] * 1000, 2),
+            }
+        return result
@@ -0,0 +1,567 @@
+"""
+Desired-state reconciliation of CMDB tables.
+
+Instead of PUTting every object on every run, describe what a table should
+contain and let the library work out the smallest set of writes:
+
+    >>> plan = plan_table(fgt.api.cmdb.firewall.address, [
+    ...     {"name": "web-1", "subnet": "10.0.1.10/32", "comment": "web"},
+    ...     {"name": "web-2", "subnet": "10.0.1.11/32", "comment": "web"},
+    ... ])
+    >>> print(plan.describe())
+    + web-2
+    ~ web-1  comment: 'old' -> 'web'
+    >>> apply_plan(plan)
+    BulkSummary(total=2, created=1, updated=1, skipped=0, deleted=0,
+    failed=0, elapsed=0.012s)
+
+plan_table() reads the live table once (only the fields the desired
+objects mention, via ``format``) and matches objects by the endpoint's
+mkey (``name``, ``policyid``, ...) or another ``key`` field. For each
+desired object:
+
+- missing on the device: POST the whole object
+- present but different: PUT only the fields that differ
+- present and equal: nothing is sent
+
+With ``prune=True`` objects on the device that are not desired are
+DELETEd. Only the fields given in a desired object are compared; fields it
+leaves out (or sets to None) keep whatever value the device has.
+
+Comparison follows FortiOS conventions: numbers match their string form,
+``10.0.0.0/24`` matches ``10.0.0.0 255.255.255.0``, and table fields
+(``member``, ``srcaddr``, ...) match regardless of order, comparing only
+the sub-fields the desired entries give (so ``q_origin_key`` is ignored).
+
+apply_plan() / aapply_plan() execute one or more plans with the bulk
+apply engine, in dependency order (see scheduler.ChangeGraph): an object is
+created before the groups and policies referring to it and deleted only
+after they stopped referring to it, while independent changes of all
+plans run concurrently. The order the plans are given in doesn't matter.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import re
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .bulk import (
+    BulkResult,
+    BulkSummary,
+    Progress,
+    ProgressCallback,
+    aapply_all,
+    apply_all,
+    is_async,
+    key_param,
+)
+from .scheduler import REFERENCE_FIELDS, ChangeGraph, table_name
+
+__all__ = [
+    "Change",
+    "Plan",
+    "aapply_plan",
+    "aplan_table",
+    "apply_plan",
+    "diff_table",
+    "plan_table",
+]
+
+_CIDR = re.compile(r"^(\d{1,3}(?:\.\d{1,3}){3})/(\d{1,2})$")
+
+
+class Change:
+    """One write of a plan"""
+
+    __slots__ = ("action", "key", "mkey", "data", "before")
+
+    def __init__(
+        self,
+        action: str,
+        key: Any,
+        mkey: Any = None,
+        data: Optional[dict[str, Any]] = None,
+        before: Optional[dict[str, Any]] = None,
+    ) -> None:
+        # "create", "update" or "delete"
+        self.action = action
+        # Value of the matching key field
+        self.key = key
+        # Identifier of the live object (None for creates)
+        self.mkey = mkey
+        # Payload to send: the whole object (create) or changed fields
+        self.data = data
+        # Live values of the changed fields (update) or live object (delete)
+        self.before = before
+
+    def describe(self) -> str:
+        """One-line, human readable form of the change"""
+        if self.action == "create":
+            return f"+ {self.key}"
+        if self.action == "delete":
+            return f"- {self.key}"
+        before = self.before or {}
+        fields = ", ".join(
+            f"{name}: {before.get(name)!r} -> {value!r}"
+            for name, value in (self.data or {}).items()
+        )
+        return f"~ {self.key}  {fields}"
+
+    def __repr__(self) -> str:
+        return f"Change({self.action}, key={self.key!r})"
+
+
+class Plan:
+    """
+    Writes needed to bring one CMDB table to its desired state
+
+    Args:
+        endpoint: Endpoint object the plan was computed for
+        changes: Creates, updates and deletes, in that order
+        unchanged: Number of desired objects already up to date
+        vdom: Virtual domain the table was read from
+        key: Field the objects were matched by
+    """
+
+    def __init__(
+        self,
+        endpoint: Any,
+        changes: list[Change],
+        unchanged: int,
+        vdom: Optional[Union[str, bool]] = None,
+        key: Optional[str] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.changes = changes
+        self.unchanged = unchanged
+        self.vdom = vdom
+        self.key = key
+
+    @property
+    def creates(self) -> list[Change]:
+        """Objects to POST"""
+        return [c for c in self.changes if c.action == "create"]
+
+    @property
+    def updates(self) -> list[Change]:
+        """Objects to PUT (changed fields only)"""
+        return [c for c in self.changes if c.action == "update"]
+
+    @property
+    def deletes(self) -> list[Change]:
+        """Objects to DELETE (only with prune=True)"""
+        return [c for c in self.changes if c.action == "delete"]
+
+    def describe(self) -> str:
+        """All changes, one per line (+ create, ~ update, - delete)"""
+        return "\n".join(change.describe() for change in self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[Change]:
+        return iter(self.changes)
+
+    def __repr__(self) -> str:
+        return (
+            f"Plan({type(self.endpoint).__name__}: "
+            f"{len(self.creates)} to create, {len(self.updates)} to update, "
+            f"{len(self.deletes)} to delete, {self.unchanged} unchanged)"
+        )
+
+
+def _scalar(value: Any) -> str:
+    text = value.strip() if isinstance(value, str) else str(value)
+    match = _CIDR.match(text)
+    if match and int(match[2]) <= 32:
+        mask = ipaddress.IPv4Network(f"0.0.0.0/{match[2]}").netmask
+        return f"{match[1]} {mask}"
+    return text
+
+
+def _same(desired: Any, live: Any) -> bool:
+    """True if the live value satisfies the desired value"""
+    if isinstance(desired, dict):
+        return isinstance(live, dict) and all(
+            value is None or _same(value, live.get(name))
+            for name, value in desired.items()
+        )
+    if isinstance(desired, list):
+        if not isinstance(live, list) or len(desired) != len(live):
+            return False
+        # Order-insensitive; cheap when both lists are in the same order
+        remaining = list(live)
+        for item in desired:
+            for i, candidate in enumerate(remaining):
+                if _same(item, candidate):
+                    del remaining[i]
+                    break
+            else:
+                return False
+        return True
+    if live is None or isinstance(live, (dict, list)):
+        return False
+    return _scalar(desired) == _scalar(live)
+
+
+def diff_table(
+    live: Iterable[dict[str, Any]],
+    desired: Iterable[dict[str, Any]],
+    key: str = "name",
+    mkey: Optional[str] = None,
+    prune: bool = False,
+) -> tuple[list[Change], int]:
+    """
+    Compute the changes turning ``live`` into ``desired``
+
+    Args:
+        live: Entries currently on the device
+        desired: Entries that should be there (FortiOS field names)
+        key: Field matching desired to live entries (default: "name")
+        mkey: Identifier field of the table (default: ``key``); updates
+            and deletes address the live object by it
+        prune: Also delete live entries that are not desired. Live
+            entries without a ``key`` value are never deleted
+
+    Returns:
+        (changes, number of desired entries already up to date)
+
+    Raises:
+        ValueError: If a desired entry has no ``key`` value or two share
+            one
+    """
+    mkey = mkey or key
+    wanted: dict[Any, dict[str, Any]] = {}
+    for index, item in enumerate(desired):
+        value = item.get(key)
+        if value is None:
+            raise ValueError(f"Desired entry {index} has no {key!r}")
+        if _scalar(value) in wanted:
+            raise ValueError(f"Duplicate desired entry {key}={value!r}")
+        wanted[_scalar(value)] = item
+
+    creates: list[Change] = []
+    updates: list[Change] = []
+    deletes: list[Change] = []
+    unchanged = 0
+    found = set()
+    for current in live:
+        value = current.get(key)
+        if value is None:
+            continue
+        entry = wanted.get(_scalar(value))
+        if entry is None:
+            if prune:
+                deletes.append(
+                    Change("delete", value, current.get(mkey), None, current)
+                )
+            continue
+        found.add(_scalar(value))
+        changed = {
+            name: new
+            for name, new in entry.items()
+            if name != key
+            and new is not None
+            and not _same(new, current.get(name))
+        }
+        if not changed:
+            unchanged += 1
+            continue
+        before = {name: current.get(name) for name in changed}
+        updates.append(
+            Change("update", value, current.get(mkey), changed, before)
+        )
+    for value, entry in wanted.items():
+        if value not in found:
+            creates.append(Change("create", entry[key], None, entry))
+    # Updates in desired order, for a readable plan
+    order = {value: i for i, value in enumerate(wanted)}
+    updates.sort(key=lambda c: order[_scalar(c.key)])
+    return creates + updates + deletes, unchanged
+
+
+def _table_args(
+    endpoint: Any,
+    desired: Iterable[dict[str, Any]],
+    key: Optional[str],
+    prune: bool,
+    kwargs: dict[str, Any],
+) -> tuple[list[dict[str, Any]], str, str]:
+    param = key_param(endpoint)
+    if param is None:
+        raise TypeError(
+            f"{type(endpoint).__name__} is a singleton table, not a list "
+            "of objects"
+        )
+    mkey = param.replace("_", "-")
+    desired = list(desired)
+    key = key or mkey
+    if "format" not in kwargs:
+        # Read only what is compared (mkey and key are always needed)
+        fields = {mkey, key}
+        for entry in desired:
+            fields.update(entry)
+        if prune:
+            # Deletes are ordered by what the deleted objects refer to
+            fields.update(REFERENCE_FIELDS.get(table_name(endpoint), ()))
+        kwargs["format"] = "|".join(sorted(fields))
+    return desired, key, mkey
+
+
+def plan_table(
+    endpoint: Any,
+    desired: Iterable[dict[str, Any]],
+    key: Optional[str] = None,
+    prune: bool = False,
+    vdom: Optional[Union[str, bool]] = None,
+    page_size: int = 1000,
+    **kwargs: Any,
+) -> Plan:
+    """
+    Compare a CMDB table with its desired contents (sync mode)
+
+    Args:
+        endpoint: CMDB table endpoint, e.g. ``fgt.api.cmdb.firewall.address``
+        desired: Objects the table should contain (FortiOS field names)
+        key: Field to match objects by (default: the endpoint's mkey, e.g.
+            ``name`` or ``policyid``; use ``"name"`` for policies whose IDs
+            are assigned by the device)
+        prune: Also delete objects that are not desired (default: False)
+        vdom: Virtual domain (default: client default)
+        page_size: Entries per request while reading the table
+        **kwargs: Extra query parameters for reading the table (e.g. a
+            ``filter`` limiting which live objects are managed)
+
+    Returns:
+        Plan to review (``plan.describe()``) and pass to apply_plan()
+
+    Raises:
+        TypeError: If the client is async (use aplan_table) or the
+            endpoint is not a table of objects
+        ValueError: If desired objects lack the key or repeat one
+
+    Example:
+        >>> plan = plan_table(
+        ...     fgt.api.cmdb.firewall.policy, policies, key="name",
+        ...     prune=True,
+        ... )
+        >>> if plan:
+        ...     apply_plan(plan)
+    """
+    if is_async(endpoint):
+        raise TypeError(
+            "plan_table() is not available in async mode, use aplan_table() "
+            "instead"
+        )
+    desired, key, mkey = _table_args(endpoint, desired, key, prune, kwargs)
+    live = endpoint.iter(page_size=page_size, vdom=vdom, **kwargs)
+    changes, unchanged = diff_table(live, desired, key, mkey, prune)
+    return Plan(endpoint, changes, unchanged, vdom, key)
+
+
+async def aplan_table(
+    endpoint: Any,
+    desired: Iterable[dict[str, Any]],
+    key: Optional[str] = None,
+    prune: bool = False,
+    vdom: Optional[Union[str, bool]] = None,
+    page_size: int = 1000,
+    **kwargs: Any,
+) -> Plan:
+    """
+    Compare a CMDB table with its desired contents (async mode)
+
+    Same as plan_table() for endpoints of an async client.
+    """
+    if not is_async(endpoint):
+        raise TypeError(
+            "aplan_table() is only available in async mode, use "
+            "plan_table() instead"
+        )
+    desired, key, mkey = _table_args(endpoint, desired, key, prune, kwargs)
+    live = [
+        entry
+        async for entry in endpoint.aiter(
+            page_size=page_size, vdom=vdom, **kwargs
+        )
+    ]
+    changes, unchanged = diff_table(live, desired, key, mkey, prune)
+    return Plan(endpoint, changes, unchanged, vdom, key)
+
+
+class _Writer:
+    """Sends the changes of one plan"""
+
+    def __init__(self, plan: Plan) -> None:
+        self._endpoint = plan.endpoint
+        self._vdom = plan.vdom
+        self._param = key_param(plan.endpoint)
+
+    def _call(self, change: Change) -> tuple[str, Any]:
+        endpoint, vdom = self._endpoint, self._vdom
+        if change.action == "create":
+            return "created", endpoint.post(
+                payload_dict=change.data, vdom=vdom
+            )
+        target = {self._param: change.mkey} if self._param is not None else {}
+        if change.action == "update":
+            return "updated", endpoint.put(
+                payload_dict=change.data, vdom=vdom, **target
+            )
+        return "deleted", endpoint.delete(vdom=vdom, **target)
+
+    def run(self, index: int, change: Change) -> BulkResult:
+        start = time.perf_counter()
+        try:
+            action, result = self._call(change)
+        except Exception as e:
+            action, result = "failed", e
+        return self._result(index, change, action, result, start)
+
+    async def arun(self, index: int, change: Change) -> BulkResult:
+        start = time.perf_counter()
+        try:
+            action, pending = self._call(change)
+            result = await pending
+        except Exception as e:
+            action, result = "failed", e
+        return self._result(index, change, action, result, start)
+
+    def _result(
+        self,
+        index: int,
+        change: Change,
+        action: str,
+        result: Any,
+        start: float,
+    ) -> BulkResult:
+        elapsed = time.perf_counter() - start
+        if action == "failed":
+            return BulkResult(
+                index, change.key, action, error=result, elapsed=elapsed
+            )
+        return BulkResult(index, change.key, action, result, elapsed=elapsed)
+
+
+class _Schedule:
+    """Sends the changes of plans level by level, in dependency order"""
+
+    def __init__(self, plans: Union[Plan, Sequence[Plan]]) -> None:
+        self.graph = ChangeGraph(plans)
+        writers: dict[int, _Writer] = {}
+        self._writers = [
+            writers.setdefault(id(plan), _Writer(plan))
+            for plan, _ in self.graph.nodes
+        ]
+        self._failed: set[int] = set()
+
+    def ready(self, level: list[int], progress: Progress) -> list:
+        """
+        (index, index) of the changes of a level to send; changes whose
+        dependencies failed are recorded as failed without being sent
+        """
+        items = []
+        for i in level:
+            failed = self.graph.requires[i] & self._failed
+            if not failed:
+                items.append((i, i))
+                continue
+            self._failed.add(i)
+            error = RuntimeError(
+                "Not attempted, depends on failed change: "
+                f"{self.graph.label(min(failed))}"
+            )
+            key = self.graph.nodes[i][1].key
+            progress.add(BulkResult(i, key, "failed", error=error))
+        return items
+
+    def run(self, index: int, node: int) -> BulkResult:
+        result = self._writers[node].run(index, self.graph.nodes[node][1])
+        if not result.ok:
+            self._failed.add(node)
+        return result
+
+    async def arun(self, index: int, node: int) -> BulkResult:
+        change = self.graph.nodes[node][1]
+        result = await self._writers[node].arun(index, change)
+        if not result.ok:
+            self._failed.add(node)
+        return result
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+def apply_plan(
+    plans: Union[Plan, Sequence[Plan]],
+    concurrency: int = 8,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_every: int = 100,
+) -> BulkSummary:
+    """
+    Execute one or more plans (sync mode)
+
+    Changes run level by level in dependency order (scheduler.ChangeGraph),
+    the changes of a level ``concurrency`` at a time. A failed change
+    doesn't stop the others, but changes depending on it are not sent and
+    are reported as failed too.
+
+    Args:
+        plans: Plan or sequence of plans (e.g. addresses, groups,
+            policies, in any order)
+        concurrency: Requests in flight at once (default: 8)
+        on_progress: Called with the BulkSummary every ``progress_every``
+            changes and once at the end
+        progress_every: Changes between progress callbacks (default: 100)
+
+    Returns:
+        BulkSummary with one BulkResult per change (action "created",
+        "updated", "deleted" or "failed"), indexed in plan order
+
+    Raises:
+        ValueError: If the changes depend on each other in a cycle
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    schedule = _Schedule(plans)
+    progress = Progress(BulkSummary(), on_progress, progress_every)
+    for level in schedule.graph.levels:
+        items = schedule.ready(level, progress)
+        apply_all(schedule.run, items, concurrency, progress)
+    return progress.finish()
+
+
+async def aapply_plan(
+    plans: Union[Plan, Sequence[Plan]],
+    concurrency: int = 8,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_every: int = 100,
+) -> BulkSummary:
+    """
+    Execute one or more plans (async mode)
+
+    Same as apply_plan() for plans made with aplan_table().
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    schedule = _Schedule(plans)
+    progress = Progress(BulkSummary(), on_progress, progress_every)
+    for level in schedule.graph.levels:
+        items = _aiter(schedule.ready(level, progress))
+        await aapply_all(schedule.arun, items, concurrency, progress)
+    return progress.finish()
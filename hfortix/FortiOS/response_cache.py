@@ -0,0 +1,280 @@
+"""
+Response cache for GET requests.
+
+Used by HTTPClient and AsyncHTTPClient when ``cache_ttl`` is set. Entries
+are keyed on method, api_type, path and query parameters (including vdom)
+and hold the raw response body, so every hit is decoded into fresh objects
+that callers may modify freely.
+
+Freshness is enforced in three ways:
+
+- Per-endpoint TTLs (``configure_ttl()`` with wildcard patterns, like
+  ``configure_endpoint_timeout()``), and an LRU bound on the entry count.
+- Any POST/PUT/DELETE drops the cached entries of the same table, in every
+  vdom. A GET that was in flight while the write happened is not stored.
+- Optionally, cached CMDB reads are validated against the device's config
+  revision (``monitor/system/config-revision``), which catches changes
+  made by other administrators or other clients.
+
+Log reads are never cached: every log search opens a session on the
+device, and a running search returns new entries for the same
+parameters. Neither are GETs that continue a session (``session_id``,
+``keep_session_alive`` parameters).
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+__all__ = [
+    "ResponseCache",
+    "CONFIG_REVISION_PATH",
+    "SESSION_PARAMS",
+    "table_of",
+]
+
+# Endpoint whose response identifies the current configuration revision
+CONFIG_REVISION_PATH = "system/config-revision"
+
+# Query parameters of a request that starts or continues a device session
+SESSION_PARAMS = frozenset({"session_id", "keep_session_alive"})
+
+
+def table_of(api_type: str, path: str) -> tuple[str, str]:
+    """Return the table an endpoint path belongs to
+
+    CMDB paths are ``category/table[/mkey[/child...]]``; monitor action
+    paths are ``category/resource/action``. The first two segments identify
+    the table in both cases.
+    """
+    return api_type, "/".join(path.strip("/").split("/")[:2])
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of GET response bodies
+
+    Args:
+        default_ttl: Seconds a response stays fresh unless a pattern set
+            with configure_ttl() matches the endpoint
+        max_entries: Maximum number of cached responses; the least recently
+            used entry is evicted first (default: 1024)
+        revision_check_interval: Seconds between config revision checks for
+            cached CMDB reads, or None to rely on TTLs and local write
+            invalidation only (default: None)
+
+    Example:
+        >>> cache = ResponseCache(default_ttl=30.0)
+        >>> cache.configure_ttl("monitor/system/*", 5.0)
+        >>> cache.configure_ttl("monitor/log/*", 0)  # Never cache
+    """
+
+    def __init__(
+        self,
+        default_ttl: float,
+        max_entries: int = 1024,
+        revision_check_interval: Optional[float] = None,
+    ) -> None:
+        if default_ttl < 0:
+            raise ValueError("cache_ttl must be >= 0")
+        if max_entries <= 0:
+            raise ValueError("cache_max_entries must be > 0")
+        if revision_check_interval is not None and revision_check_interval < 0:
+            raise ValueError("cache_revision_check must be >= 0")
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._revision_interval = revision_check_interval
+        self._ttls: dict[str, float] = {
+            # Used to validate the cache itself
+            f"monitor/{CONFIG_REVISION_PATH}*": 0,
+            # Searches run in device sessions
+            "log/*": 0,
+        }
+        # key -> (expires_at, table, body)
+        self._entries: OrderedDict[tuple, tuple[float, tuple, bytes]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a response is only stored if no
+        # invalidation happened while its request was in flight
+        self._epoch = 0
+        self._revision: Optional[str] = None
+        self._revision_checked_at = 0.0
+        self._stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "revision_changes": 0,
+        }
+
+    @property
+    def revision_check_enabled(self) -> bool:
+        """Whether cached CMDB reads are validated against the revision"""
+        return self._revision_interval is not None
+
+    def configure_ttl(self, endpoint_pattern: str, ttl: float) -> None:
+        """
+        Set the TTL of endpoints matching a wildcard pattern
+
+        Args:
+            endpoint_pattern: Pattern matched against ``api_type/path``
+                (e.g. 'cmdb/firewall/*', 'monitor/system/status')
+            ttl: Seconds responses stay fresh; 0 disables caching
+        """
+        if ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        with self._lock:
+            self._ttls[endpoint_pattern] = ttl
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL for an endpoint (``api_type/path``)"""
+        with self._lock:
+            patterns = list(self._ttls.items())
+        for pattern, ttl in patterns:
+            if fnmatch.fnmatch(endpoint, pattern):
+                return ttl
+        return self._default_ttl
+
+    @staticmethod
+    def make_key(
+        method: str,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+    ) -> tuple:
+        """Build the cache key of a request (vdom is part of params)"""
+        frozen = (
+            json.dumps(params, sort_keys=True, default=str) if params else ""
+        )
+        return (method.upper(), api_type, path.strip("/"), frozen)
+
+    @property
+    def epoch(self) -> int:
+        """Invalidation counter to capture before sending a request"""
+        return self._epoch
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        """Return the cached body for a key, or None (counts hit/miss)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[2]
+            if entry is not None:
+                del self._entries[key]
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key: tuple, body: bytes, epoch: int) -> None:
+        """
+        Store a response body
+
+        Args:
+            key: Key from make_key()
+            body: Raw response body
+            epoch: Value of ``epoch`` captured before the request was sent;
+                the body is dropped if an invalidation happened since
+        """
+        ttl = self.ttl_for(f"{key[1]}/{key[2]}")
+        if ttl <= 0:
+            return
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = (
+                time.monotonic() + ttl,
+                table_of(key[1], key[2]),
+                body,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, api_type: str, path: str) -> int:
+        """Drop all entries of the table ``path`` belongs to (all vdoms)"""
+        table = table_of(api_type, path)
+        with self._lock:
+            return self._drop(lambda entry: entry[1] == table)
+
+    def invalidate_api_type(self, api_type: str) -> int:
+        """Drop all entries of one API type (e.g. all of cmdb)"""
+        with self._lock:
+            return self._drop(lambda entry: entry[1][0] == api_type)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._drop(lambda entry: True)
+
+    def _drop(self, match: Any) -> int:
+        # Caller holds the lock
+        self._epoch += 1
+        stale = [key for key, entry in self._entries.items() if match(entry)]
+        for key in stale:
+            del self._entries[key]
+        self._stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def revision_check_due(self) -> bool:
+        """
+        Return True if the config revision should be checked now
+
+        Claims the check, so concurrent callers don't all fetch the
+        revision at the same time.
+        """
+        if self._revision_interval is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._revision_checked_at < self._revision_interval:
+                return False
+            self._revision_checked_at = now
+            return True
+
+    def apply_revision(self, revision: Any) -> bool:
+        """
+        Record the device's config revision response
+
+        Drops all cached CMDB entries if the revision changed since the
+        last check. Pass None if the revision could not be fetched; the
+        CMDB entries are dropped as they can't be validated.
+
+        Returns:
+            True if cached CMDB entries were dropped
+        """
+        token = (
+            json.dumps(revision, sort_keys=True, default=str)
+            if revision is not None
+            else None
+        )
+        with self._lock:
+            previous = self._revision
+            self._revision = token
+            if token is not None and token == previous:
+                return False
+            if previous is not None:
+                self._stats["revision_changes"] += 1
+            self._drop(lambda entry: entry[1][0] == "cmdb")
+            return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the current size"""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["max_entries"] = self._max_entries
+        stats["hit_rate"] = (
+            round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+        )
+        stats["revision_check_enabled"] = self.revision_check_enabled
+        return stats
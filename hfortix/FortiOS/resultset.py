@@ -0,0 +1,408 @@
+"""
+Compact result sets for large tables.
+
+A 50,000-entry firewall policy table decoded from JSON is 50,000 dicts of
+100+ keys each, with every "enable", "all" and interface name stored once
+per occurrence - hundreds of MB. ResultSet holds the same entries
+compactly:
+
+- every entry is a record holding a tuple of values; the field names are
+  stored once per record class (one class per endpoint and set of
+  fields, e.g. ``PolicyRecord``) instead of once per entry
+- equal strings are stored once
+- member lists (``[{"name": "port1", "q_origin_key": "port1"}, ...]``)
+  are tuples of names
+
+Records are read-only mappings: ``record["srcintf"]``, ``record.get()``,
+``keys()``, ``items()``, ``in`` and ``==`` with a dict work as before,
+fields are also attributes in Python spelling (``record.srcintf``), and
+the members of a member list still answer ``member["name"]``:
+
+    >>> policies = fgt.api.cmdb.firewall.policy.get(compact=True)
+    >>> [m["name"] for m in policies[0]["srcintf"]]
+    ['port1']
+    >>> policies[0].srcintf
+    Names('port1')
+    >>> policies.to_dicts()  # plain dicts, same as get() returns
+
+Records are not dicts, so code that requires one (``json.dumps()``,
+``dict`` type checks) needs ``record.to_dict()`` or ``to_dicts()``.
+
+collect() and acollect() build the result set page by page, so the full
+table is never held as dicts:
+
+    >>> policies = collect(fgt.api.cmdb.firewall.policy, view="summary")
+    >>> policies = await acollect(fgt.api.cmdb.firewall.policy)
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Mapping, Sequence
+from typing import (
+    Any,
+    AsyncIterable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from .api._helpers.endpoint import python_name
+from .bulk import is_async
+
+__all__ = [
+    "Name",
+    "Names",
+    "Record",
+    "ResultSet",
+    "acollect",
+    "collect",
+    "compact_result",
+]
+
+
+class Name(str):
+    """Member of a member list; a string that also answers ``["name"]``"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        if key == "name" or key == "q_origin_key":
+            return str(self)
+        if isinstance(key, str):
+            raise KeyError(key)
+        return str.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Like dict.get() on the member's ``{"name": ...}`` entry"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class Names(tuple):
+    """Member list, e.g. the ``srcintf`` of a policy"""
+
+    __slots__ = ()
+    # Entries also had a q_origin_key
+    _origin: ClassVar[bool] = True
+
+    def to_list(self) -> list[dict[str, str]]:
+        """The member list as the API returned it"""
+        if self._origin:
+            return [{"name": name, "q_origin_key": name} for name in self]
+        return [{"name": name} for name in self]
+
+    def __repr__(self) -> str:
+        return f"Names({', '.join(map(repr, map(str, self)))})"
+
+
+class _BareNames(Names):
+    __slots__ = ()
+    _origin = False
+
+
+class Record:
+    """
+    One entry of a ResultSet, a read-only mapping
+
+    Subclasses (one per endpoint and set of fields) hold the field names;
+    an instance only holds the values. Fields named like a method
+    (``keys``, ``get``, ...) are only available as ``record["keys"]``.
+    Records are not dicts: pass ``record.to_dict()`` to json.dumps().
+    """
+
+    __slots__ = ("_values",)
+    _keys: ClassVar[tuple[str, ...]] = ()
+    _index: ClassVar[dict[str, int]] = {}
+    # Python spelling -> index
+    _attrs: ClassVar[dict[str, int]] = {}
+
+    def __init__(self, values: tuple[Any, ...]) -> None:
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            index = self._index[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return self._values[index]
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            index = self._attrs[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__} has no field {name!r}"
+            ) from None
+        return self._values[index]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a field, or default if the entry doesn't have it"""
+        index = self._index.get(key)
+        return default if index is None else self._values[index]
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def values(self) -> tuple[Any, ...]:
+        return self._values
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        return zip(self._keys, self._values)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == _plain(dict(other.items()))
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    # Equal to dicts, so unhashable like them
+    __hash__: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """The entry as a plain dict, as the API returned it"""
+        return {
+            key: _plain(value) for key, value in zip(self._keys, self._values)
+        }
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+Mapping.register(Record)
+
+
+def _plain(value: Any) -> Any:
+    """Compact value -> JSON value"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, Names):
+        return value.to_list()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class _Compactor:
+    """Converts decoded entries; equal strings are shared per build"""
+
+    def __init__(self, result: ResultSet) -> None:
+        self._classes = result._classes
+        self._name = result.name
+        self._strings: dict[str, str] = {}
+        self._names: dict[str, Name] = {}
+
+    def record(self, entry: dict[str, Any], suffix: str = "Record") -> Record:
+        keys = tuple(entry)
+        cls = self._classes.get((suffix, keys))
+        if cls is None:
+            cls = self._record_class(keys, suffix)
+        strings = self._strings
+        value = self.value
+        values: list[Any] = []
+        append = values.append
+        for item in entry.values():
+            # Inline the common cases; value() handles the rest
+            kind = type(item)
+            if kind is str:
+                append(strings.setdefault(item, item))
+            elif kind is int or item is None:
+                append(item)
+            else:
+                append(value(item))
+        return cls(tuple(values))
+
+    def _record_class(self, keys: tuple[str, ...], suffix: str) -> type:
+        strings = self._strings
+        keys = tuple(strings.setdefault(key, key) for key in keys)
+        cls = type(
+            f"{self._name}{suffix}",
+            (Record,),
+            {
+                "__slots__": (),
+                "_keys": keys,
+                "_index": {key: i for i, key in enumerate(keys)},
+                "_attrs": {python_name(key): i for i, key in enumerate(keys)},
+            },
+        )
+        self._classes[(suffix, keys)] = cls
+        return cls
+
+    def value(self, value: Any) -> Any:
+        kind = type(value)
+        if kind is str:
+            return self._strings.setdefault(value, value)
+        if kind is list:
+            if not value:
+                return ()
+            members = self._members(value)
+            if members is not None:
+                return members
+            if all(type(item) is dict for item in value):
+                return tuple(self.record(item, "Entry") for item in value)
+            return tuple(self.value(item) for item in value)
+        if kind is dict:
+            return self.record(value, "Entry")
+        return value
+
+    def _members(self, items: list[dict[str, Any]]) -> Optional[Names]:
+        """Names of a list of {"name": ...} entries, else None"""
+        if type(items[0]) is not dict:
+            return None
+        origin = "q_origin_key" in items[0]
+        size = 2 if origin else 1
+        names = self._names
+        result = []
+        for item in items:
+            if type(item) is not dict:
+                return None
+            name = item.get("name")
+            if (
+                type(name) is not str
+                or len(item) != size
+                or (origin and item["q_origin_key"] != name)
+            ):
+                return None
+            member = names.get(name)
+            if member is None:
+                member = names[name] = Name(name)
+            result.append(member)
+        return (Names if origin else _BareNames)(result)
+
+
+class ResultSet(Sequence):
+    """
+    Entries of a table in compact form
+
+    Args:
+        entries: Decoded entries (dicts), e.g. the result of get()
+        name: Prefix of the record class names, usually the endpoint
+            class name ("Policy" -> PolicyRecord)
+
+    Example:
+        >>> rs = ResultSet(fgt.api.cmdb.firewall.address.get(), "Address")
+        >>> rs[0]["subnet"], len(rs)
+    """
+
+    def __init__(
+        self, entries: Iterable[dict[str, Any]] = (), name: str = ""
+    ) -> None:
+        self.name = name
+        self._records: list[Record] = []
+        # (suffix, field names) -> record class
+        self._classes: dict[tuple[str, tuple[str, ...]], type] = {}
+        self.extend(entries)
+
+    def extend(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Add decoded entries"""
+        record = _Compactor(self).record
+        self._records.extend(record(entry) for entry in entries)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self._records)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """The entries as plain dicts, as the API returned them"""
+        return [record.to_dict() for record in self._records]
+
+    def __repr__(self) -> str:
+        return f"<ResultSet {self.name or 'entries'}: {len(self)} entries>"
+
+
+def _name_of(endpoint: Any) -> str:
+    return type(endpoint).__name__
+
+
+def compact_result(result: Any, name: str = "") -> Any:
+    """
+    ResultSet of a get() result (sync) or of its coroutine (async)
+
+    A single object (singleton tables) becomes a one-entry result set.
+    """
+
+    def build(value: Any) -> ResultSet:
+        if isinstance(value, dict):
+            value = [value]
+        return ResultSet(value, name)
+
+    if inspect.iscoroutine(result):
+
+        async def _async() -> ResultSet:
+            return build(await result)
+
+        return _async()
+    return build(result)
+
+
+def collect(endpoint: Any, **kwargs: Any) -> ResultSet:
+    """
+    Read a whole table page by page into a ResultSet (sync mode)
+
+    Only one page of dicts exists at a time.
+
+    Args:
+        endpoint: CMDB or monitor endpoint with iter()
+        **kwargs: Passed to endpoint.iter() (page_size, filter, format,
+            view, vdom, ...)
+
+    Returns:
+        ResultSet of all entries
+
+    Raises:
+        TypeError: If the client is async (use acollect)
+    """
+    if is_async(endpoint):
+        raise TypeError(
+            "collect() is not available in async mode, use acollect() instead"
+        )
+    return ResultSet(endpoint.iter(**kwargs), _name_of(endpoint))
+
+
+async def acollect(endpoint: Any, **kwargs: Any) -> ResultSet:
+    """
+    Read a whole table page by page into a ResultSet (async mode)
+
+    Same as collect() for endpoints of an async client.
+    """
+    if not is_async(endpoint):
+        raise TypeError(
+            "acollect() is only available in async mode, use collect() "
+            "instead"
+        )
+    result = ResultSet(name=_name_of(endpoint))
+    await _aextend(result, endpoint.aiter(**kwargs))
+    return result
+
+
+async def _aextend(
+    result: ResultSet, entries: AsyncIterable[dict[str, Any]]
+) -> None:
+    record = _Compactor(result).record
+    records = result._records
+    async for entry in entries:
+        records.append(record(entry))
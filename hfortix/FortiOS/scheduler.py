@@ -0,0 +1,322 @@
+"""
+Dependency ordering of multi-table CMDB changes.
+
+A policy can only be created once its addresses, groups, services and
+schedules exist, and an address can only be deleted once nothing refers
+to it any more (otherwise FortiOS answers with EntryInUseError).
+ChangeGraph turns the changes of one or more reconcile plans into a
+dependency graph and groups them into levels: every change in a level only
+depends on changes of earlier levels, so each level can run concurrently.
+``reconcile.apply_plan()`` executes plans this way.
+
+Dependencies come from reference fields - table fields such as
+``member``, ``srcaddr`` or ``service`` whose entries name objects of other
+tables:
+
+- a create or update runs after the creates of the objects it refers to
+- a delete runs after the updates and deletes of the objects that referred
+  to it before (a group losing a member, a policy being removed)
+
+Tables are identified by their path under ``fgt.api.cmdb``, e.g.
+``firewall.address`` or ``firewall.service_custom``. REFERENCE_FIELDS
+lists the reference fields of the common object and policy tables; add
+others with register_references(). For a table that is not listed, every
+string value (and every ``name`` in a table field) is treated as a
+possible reference to an object of the same name being changed in the same
+run. That can only order changes more strictly than needed, never less.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence, Union
+
+from .api._helpers.endpoint import Endpoint
+
+if TYPE_CHECKING:
+    from .reconcile import Change, Plan
+
+__all__ = [
+    "REFERENCE_FIELDS",
+    "ChangeGraph",
+    "register_references",
+    "table_name",
+]
+
+_ADDRESS = ("firewall.address", "firewall.addrgrp")
+_ADDRESS6 = ("firewall.address6", "firewall.addrgrp6")
+_DSTADDRESS = _ADDRESS + ("firewall.vip", "firewall.vipgrp")
+_DSTADDRESS6 = _ADDRESS6 + ("firewall.vip6", "firewall.vipgrp6")
+_SERVICE = ("firewall.service_custom", "firewall.service_group")
+_SCHEDULE = (
+    "firewall.schedule_onetime",
+    "firewall.schedule_recurring",
+    "firewall.schedule_group",
+)
+_INTERFACE = ("system.interface", "system.zone")
+
+# Table -> reference field -> tables the referenced names live in
+REFERENCE_FIELDS: dict[str, dict[str, tuple[str, ...]]] = {
+    "firewall.address": {
+        "interface": ("system.interface",),
+        "associated-interface": _INTERFACE,
+    },
+    "firewall.address6": {"associated-interface": _INTERFACE},
+    "firewall.addrgrp": {"member": _ADDRESS, "exclude-member": _ADDRESS},
+    "firewall.addrgrp6": {"member": _ADDRESS6, "exclude-member": _ADDRESS6},
+    "firewall.vip": {"extintf": ("system.interface",)},
+    "firewall.vip6": {},
+    "firewall.vipgrp": {
+        "member": ("firewall.vip",),
+        "interface": ("system.interface",),
+    },
+    "firewall.vipgrp6": {"member": ("firewall.vip6",)},
+    "firewall.service_custom": {},
+    "firewall.service_group": {"member": _SERVICE},
+    "firewall.schedule_onetime": {},
+    "firewall.schedule_recurring": {},
+    "firewall.schedule_group": {
+        "member": ("firewall.schedule_onetime", "firewall.schedule_recurring")
+    },
+    "firewall.ippool": {},
+    "firewall.ippool6": {},
+    "firewall.policy": {
+        "srcintf": _INTERFACE,
+        "dstintf": _INTERFACE,
+        "srcaddr": _ADDRESS,
+        "dstaddr": _DSTADDRESS,
+        "srcaddr6": _ADDRESS6,
+        "dstaddr6": _DSTADDRESS6,
+        "service": _SERVICE,
+        "schedule": _SCHEDULE,
+        "poolname": ("firewall.ippool",),
+        "poolname6": ("firewall.ippool6",),
+        "groups": ("user.group",),
+        "users": ("user.local",),
+    },
+    "firewall.local_in_policy": {
+        "intf": _INTERFACE,
+        "srcaddr": _ADDRESS,
+        "dstaddr": _ADDRESS,
+        "service": _SERVICE,
+        "schedule": _SCHEDULE,
+    },
+    "firewall.local_in_policy6": {
+        "intf": _INTERFACE,
+        "srcaddr": _ADDRESS6,
+        "dstaddr": _ADDRESS6,
+        "service": _SERVICE,
+        "schedule": _SCHEDULE,
+    },
+    "firewall.shaping_policy": {
+        "srcintf": _INTERFACE,
+        "dstintf": _INTERFACE,
+        "srcaddr": _ADDRESS,
+        "dstaddr": _ADDRESS,
+        "service": _SERVICE,
+        "schedule": _SCHEDULE,
+        "groups": ("user.group",),
+        "users": ("user.local",),
+    },
+    "firewall.central_snat_map": {
+        "srcintf": _INTERFACE,
+        "dstintf": _INTERFACE,
+        "orig-addr": _ADDRESS,
+        "dst-addr": _ADDRESS,
+        "nat-ippool": ("firewall.ippool",),
+    },
+    "system.zone": {"interface": ("system.interface",)},
+    "user.group": {"member": ("user.local",)},
+    "user.local": {},
+}
+
+# Sub-field of table entries holding the referenced name, if not "name"
+_SUBFIELDS: dict[tuple[str, str], str] = {
+    ("system.zone", "interface"): "interface-name",
+}
+
+
+def register_references(
+    table: str,
+    fields: dict[str, Sequence[str]],
+    subfields: Optional[dict[str, str]] = None,
+) -> None:
+    """
+    Declare (or extend) the reference fields of a table
+
+    Args:
+        table: Table path under ``fgt.api.cmdb``, e.g. "router.static"
+        fields: Reference field -> tables the referenced names live in
+        subfields: Reference field -> sub-field holding the name in table
+            entries, where it is not "name"
+
+    Example:
+        >>> register_references(
+        ...     "router.static",
+        ...     {"device": ["system.interface"],
+        ...      "dstaddr": ["firewall.address", "firewall.addrgrp"]},
+        ... )
+    """
+    known = REFERENCE_FIELDS.setdefault(table, {})
+    known.update({field: tuple(tables) for field, tables in fields.items()})
+    for field, subfield in (subfields or {}).items():
+        _SUBFIELDS[(table, field)] = subfield
+
+
+def table_name(endpoint: Any) -> str:
+    """Path of an endpoint under ``fgt.api.cmdb``, e.g. firewall.address"""
+    if isinstance(endpoint, Endpoint) and endpoint.api == "cmdb":
+        return endpoint.table
+    module = type(endpoint).__module__
+    _, found, path = module.partition(".cmdb.")
+    return path if found else module
+
+
+def _names(value: Any, subfield: str) -> Iterator[str]:
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                item = item.get(subfield)
+            if isinstance(item, (str, int)) and item != "":
+                yield str(item)
+    elif isinstance(value, dict):
+        yield from _names([value], subfield)
+    elif isinstance(value, str) and value:
+        yield value
+
+
+def references(
+    table: str, entry: dict[str, Any], key: Optional[str] = None
+) -> Iterator[tuple[Optional[tuple[str, ...]], str]]:
+    """
+    (target tables, name) of every object an entry refers to
+
+    Target tables are None for tables without known reference fields
+    (any table may hold the name). ``key`` is the entry's own key field.
+    """
+    fields = REFERENCE_FIELDS.get(table)
+    if fields is None:
+        for field, value in entry.items():
+            if field != key:
+                for name in _names(value, "name"):
+                    yield None, name
+        return
+    for field, targets in fields.items():
+        value = entry.get(field)
+        if value is not None:
+            subfield = _SUBFIELDS.get((table, field), "name")
+            for name in _names(value, subfield):
+                yield targets, name
+
+
+class ChangeGraph:
+    """
+    Dependency graph of the changes of one or more plans
+
+    Args:
+        plans: Plan or sequence of plans (reconcile.plan_table())
+
+    Raises:
+        ValueError: If the changes depend on each other in a cycle
+
+    Example:
+        >>> graph = ChangeGraph([addresses, groups, policies])
+        >>> print(graph.describe())
+        level 0
+          + firewall.address web-1
+        level 1
+          + firewall.addrgrp web-servers
+        level 2
+          ~ firewall.policy allow-web
+    """
+
+    def __init__(self, plans: Union["Plan", Sequence["Plan"]]) -> None:
+        if hasattr(plans, "changes"):
+            plans = [plans]  # type: ignore[list-item]
+        self.nodes: list[tuple["Plan", "Change"]] = [
+            (plan, change) for plan in plans for change in plan.changes
+        ]
+        # Node -> nodes that must be done before it
+        self.requires: list[set[int]] = [set() for _ in self.nodes]
+        self._build()
+        self.levels = self._levels()
+
+    def _build(self) -> None:
+        tables = [table_name(plan.endpoint) for plan, _ in self.nodes]
+        by_name: dict[str, list[int]] = {}
+        for i, (_, change) in enumerate(self.nodes):
+            for name in {str(change.key), str(change.mkey)}:
+                by_name.setdefault(name, []).append(i)
+
+        def lookup(targets: Optional[tuple[str, ...]], name: str) -> list:
+            found = by_name.get(name, ())
+            if targets is None:
+                return list(found)
+            return [j for j in found if tables[j] in targets]
+
+        for i, (plan, change) in enumerate(self.nodes):
+            key = getattr(plan, "key", None)
+            if change.action != "delete" and change.data:
+                # Objects referred to must be created first
+                for targets, name in references(tables[i], change.data, key):
+                    for j in lookup(targets, name):
+                        if j != i and self.nodes[j][1].action == "create":
+                            self.requires[i].add(j)
+            if change.action != "create" and change.before:
+                # Objects no longer referred to are deleted afterwards
+                for targets, name in references(tables[i], change.before, key):
+                    for j in lookup(targets, name):
+                        if j != i and self.nodes[j][1].action == "delete":
+                            self.requires[j].add(i)
+
+    def _levels(self) -> list[list[int]]:
+        waiting = {i: len(req) for i, req in enumerate(self.requires)}
+        dependents: list[list[int]] = [[] for _ in self.nodes]
+        for i, required in enumerate(self.requires):
+            for j in required:
+                dependents[j].append(i)
+        levels = []
+        ready = [i for i, count in waiting.items() if not count]
+        while ready:
+            levels.append(ready)
+            for i in ready:
+                del waiting[i]
+            following = []
+            for i in ready:
+                for j in dependents[i]:
+                    waiting[j] -= 1
+                    if not waiting[j]:
+                        following.append(j)
+            ready = sorted(following)
+        if waiting:
+            stuck = ", ".join(self.label(i) for i in sorted(waiting)[:5])
+            raise ValueError(
+                f"Changes depend on each other in a cycle: {stuck}"
+            )
+        return levels
+
+    def label(self, i: int) -> str:
+        """Action, table and key of node ``i``, e.g. for error messages"""
+        plan, change = self.nodes[i]
+        return f"{change.action} {table_name(plan.endpoint)} {change.key}"
+
+    def describe(self) -> str:
+        """Changes level by level (+ create, ~ update, - delete)"""
+        lines = []
+        for number, level in enumerate(self.levels):
+            lines.append(f"level {number}")
+            for i in level:
+                plan, change = self.nodes[i]
+                symbol = {"create": "+", "update": "~"}.get(change.action, "-")
+                lines.append(
+                    f"  {symbol} {table_name(plan.endpoint)} {change.key}"
+                )
+        return "\n".join(lines)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangeGraph({len(self.nodes)} changes, "
+            f"{len(self.levels)} levels)"
+        )
@@ -0,0 +1,480 @@
+"""
+Firmware-aware CMDB table schemas.
+
+The validators in ``_helpers`` describe the one FortiOS version they were
+generated from. A FortiGate describes what it accepts itself: ``GET
+cmdb/<table>?action=schema`` returns every field with its type, allowed
+values, integer range and maximum length. SchemaCache fetches that schema,
+compiles it into the same validation engine the generated validators use
+(validation.EndpointSchema) and keeps it in memory and on disk:
+
+    >>> cache = SchemaCache()
+    >>> schema = cache.get(fgt.api.cmdb.firewall.address)
+    >>> schema.check({"name": "web", "type": "fqdn", "fqdn": "example.com"})
+    (True, None)
+    >>> schema.project(entry)  # only the fields this firmware knows
+
+Schemas are keyed by the firmware version and build the device reports
+and stored as ``<directory>/<version>-<build>/<table>.json`` (by default
+under ``~/.cache/hfortix/schema``), so the schema of a table is fetched
+once per firmware build - not once per device, run or process. The
+firmware of a client is looked up once (``monitor/system/status``) and
+remembered for the client's lifetime.
+
+One cache serves a whole fleet; devices on different firmware validate
+against their own schema:
+
+    >>> async def check(fgt):
+    ...     schema = await cache.aget(fgt.api.cmdb.firewall.address)
+    ...     return schema.check_all(addresses)
+    >>> results = await fleet.run(check)
+
+Concurrent lookups of the same schema (threads in sync mode, tasks in
+async mode) share one request.
+
+Passed to a client, the cache checks every CMDB POST and PUT against the
+device's schema before it is sent and raises ValueError instead of
+sending a payload the firmware would reject:
+
+    >>> fgt = FortiOS(host, token=token, schema_cache=SchemaCache())
+    >>> fgt.api.cmdb.firewall.address.post(name="web", color=99)
+    ValueError: POST firewall/address rejected by the v7.4.3 build 2573
+    schema: ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+from .api._helpers.endpoint import python_name
+from .api._helpers.validation import EndpointSchema, ValidationResult
+from .bulk import is_async
+from .scheduler import table_name
+
+logger = logging.getLogger("hfortix.schema")
+
+__all__ = ["SchemaCache", "TableSchema", "default_directory"]
+
+Firmware = tuple[str, int]
+
+
+def default_directory() -> Path:
+    """``$XDG_CACHE_HOME/hfortix/schema`` (``~/.cache/hfortix/schema``)"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "hfortix" / "schema"
+
+
+def _table_path(path: str) -> str:
+    """
+    Table of a CMDB request path, e.g. "firewall/address/web" ->
+    "firewall/address"
+    """
+    return "/".join(path.strip("/").split("/")[:2])
+
+
+def _table_of_path(path: str) -> str:
+    """Cache name of a table path, the table_name() of its endpoint"""
+    category, _, rest = re.split(r"([./])", _table_path(path), maxsplit=1)
+    return f"{python_name(category)}.{python_name(re.sub('[./]', '_', rest))}"
+
+
+# Keys of read entries that are not fields; devices accept them back
+_RESPONSE_ONLY = frozenset({"q_origin_key"})
+
+
+def _constraints(children: dict[str, Any]) -> dict[str, Any]:
+    """EndpointSchema body table from the fields of a schema"""
+    body: dict[str, Any] = {}
+    for name, field in children.items():
+        kind = field.get("type")
+        if kind == "option" and not field.get("multiple_values"):
+            # Multiple-value options are space-separated lists of options
+            options = [o["name"] for o in field.get("options", ()) if o]
+            if options:
+                body[name] = options
+        elif kind == "integer":
+            low, high = field.get("min-value"), field.get("max-value")
+            if low is not None and high is not None:
+                body[name] = (int(low), int(high))
+        elif kind in ("string", "var-string") and field.get("size"):
+            body[name] = int(field["size"])
+    return body
+
+
+class TableSchema:
+    """
+    Schema of one CMDB table on one firmware build
+
+    Args:
+        table: Table path under ``cmdb``, e.g. "firewall.address"
+        version: Firmware version, e.g. "v7.4.3"
+        build: Firmware build number
+        definition: ``results`` of the ``action=schema`` response
+    """
+
+    __slots__ = (
+        "table",
+        "version",
+        "build",
+        "definition",
+        "mkey",
+        "fields",
+        "required",
+        "validator",
+        "_partial",
+        "_known",
+        "_accepted",
+    )
+
+    def __init__(
+        self, table: str, version: str, build: int, definition: dict
+    ) -> None:
+        self.table = table
+        self.version = version
+        self.build = build
+        self.definition = definition
+        children = definition.get("children") or {}
+        self.mkey: Optional[str] = definition.get("mkey") or None
+        # Field names (FortiOS spelling) in the device's order
+        self.fields = tuple(children)
+        self.required = tuple(
+            name
+            for name, field in children.items()
+            if field.get("required") in (True, "true")
+        )
+        constraints = _constraints(children)
+        self.validator = EndpointSchema(
+            body=constraints, required=self.required
+        )
+        # Updates only send the fields they change
+        self._partial = EndpointSchema(body=constraints)
+        self._known = frozenset(children)
+        self._accepted = self._known | _RESPONSE_ONLY
+
+    @property
+    def firmware(self) -> Firmware:
+        """(version, build) the schema was fetched from"""
+        return (self.version, self.build)
+
+    def unknown(self, payload: dict[str, Any]) -> list[str]:
+        """
+        Fields of a payload this firmware doesn't have
+
+        Response-only keys (``q_origin_key``) are not reported, so entries
+        read with get() can be checked as is.
+        """
+        return [name for name in payload if name not in self._accepted]
+
+    def check(
+        self, payload: dict[str, Any], partial: bool = False
+    ) -> ValidationResult:
+        """
+        Validate a request body against this firmware
+
+        Args:
+            payload: Fields to send (FortiOS names)
+            partial: The payload updates an existing object (PUT), so
+                required fields may be missing
+
+        Returns:
+            Tuple of (is_valid, error_message); fields the firmware doesn't
+            have are reported before the field constraints
+        """
+        unknown = self.unknown(payload)
+        if unknown:
+            return (False, self._unknown_message(unknown))
+        return (self._partial if partial else self.validator).check(payload)
+
+    def check_all(
+        self, payloads: Iterable[dict[str, Any]]
+    ) -> list[ValidationResult]:
+        """
+        Validate many request bodies, e.g. a bulk import
+
+        Returns:
+            One (is_valid, error_message) tuple per payload, same as
+            check() would return for each
+        """
+        items = list(payloads)
+        results = self.validator.check_all(items)
+        accepted = self._accepted
+        for i, payload in enumerate(items):
+            if not accepted.issuperset(payload):
+                results[i] = (
+                    False,
+                    self._unknown_message(self.unknown(payload)),
+                )
+        return results
+
+    def project(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """
+        Copy of an entry with only the fields this firmware has
+
+        Drops response-only keys (``q_origin_key``, ...) and fields of
+        other firmware, e.g. to copy an object between devices.
+        """
+        known = self._known
+        return {name: value for name, value in entry.items() if name in known}
+
+    def _unknown_message(self, unknown: list[str]) -> str:
+        return (
+            f"Unknown fields for {self.table} on {self.version} build "
+            f"{self.build}: {', '.join(unknown)}"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TableSchema({self.table}, {self.version} build {self.build}, "
+            f"{len(self.fields)} fields)"
+        )
+
+
+def _firmware_of(response: Any) -> Firmware:
+    if not isinstance(response, dict) or "version" not in response:
+        raise ValueError("Response does not report the firmware version")
+    return (str(response["version"]), int(response.get("build") or 0))
+
+
+class SchemaCache:
+    """
+    Table schemas fetched from devices, cached by firmware build
+
+    Thread-safe; one cache can serve any number of sync or async clients.
+
+    Args:
+        directory: On-disk cache location (default: default_directory()),
+            or False to keep schemas in memory only
+    """
+
+    def __init__(
+        self, directory: Union[str, "os.PathLike[str]", bool, None] = None
+    ) -> None:
+        if directory is False:
+            self.directory: Optional[Path] = None
+        elif directory is None or directory is True:
+            self.directory = default_directory()
+        else:
+            self.directory = Path(directory)
+        # Schema requests sent (to tell warm-up from steady state)
+        self.fetches = 0
+        self._schemas: dict[tuple[str, int, str], TableSchema] = {}
+        self._firmware: weakref.WeakKeyDictionary[Any, Firmware] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, int, str], threading.Lock] = {}
+        self._tasks: dict[tuple[str, int, str], asyncio.Future] = {}
+
+    def get(
+        self, endpoint: Any, vdom: Optional[Union[str, bool]] = None
+    ) -> TableSchema:
+        """
+        Schema of a CMDB table on the endpoint's device (sync mode)
+
+        Args:
+            endpoint: CMDB endpoint, e.g. ``fgt.api.cmdb.firewall.address``
+            vdom: Virtual domain to request the schema in
+
+        Returns:
+            TableSchema for the device's firmware
+
+        Raises:
+            TypeError: If the client is async (use aget)
+        """
+        if is_async(endpoint):
+            raise TypeError(
+                "get() is not available in async mode, use aget() instead"
+            )
+        return self._get(
+            endpoint._client,
+            table_name(endpoint),
+            lambda: endpoint.get(action="schema", vdom=vdom, raw_json=True),
+        )
+
+    async def aget(
+        self, endpoint: Any, vdom: Optional[Union[str, bool]] = None
+    ) -> TableSchema:
+        """
+        Schema of a CMDB table on the endpoint's device (async mode)
+
+        Same as get() for endpoints of an async client.
+        """
+        if not is_async(endpoint):
+            raise TypeError(
+                "aget() is only available in async mode, use get() instead"
+            )
+        return await self._aget(
+            endpoint._client,
+            table_name(endpoint),
+            lambda: endpoint.get(action="schema", vdom=vdom, raw_json=True),
+        )
+
+    def lookup(
+        self,
+        client: Any,
+        path: str,
+        vdom: Optional[Union[str, bool]] = None,
+    ) -> TableSchema:
+        """
+        Schema of the table a CMDB path belongs to (sync client)
+
+        Used by clients created with ``schema_cache=`` to check writes.
+
+        Args:
+            client: HTTPClient of the device
+            path: CMDB request path, e.g. "firewall/address/web"
+            vdom: Virtual domain to request the schema in
+        """
+        return self._get(
+            client,
+            _table_of_path(path),
+            lambda: client.get(
+                "cmdb",
+                _table_path(path),
+                params={"action": "schema"},
+                vdom=vdom,
+                raw_json=True,
+            ),
+        )
+
+    async def alookup(
+        self,
+        client: Any,
+        path: str,
+        vdom: Optional[Union[str, bool]] = None,
+    ) -> TableSchema:
+        """Same as lookup() for an AsyncHTTPClient"""
+        return await self._aget(
+            client,
+            _table_of_path(path),
+            lambda: client.get(
+                "cmdb",
+                _table_path(path),
+                params={"action": "schema"},
+                vdom=vdom,
+                raw_json=True,
+            ),
+        )
+
+    def _get(
+        self, client: Any, table: str, fetch: Callable[[], Any]
+    ) -> TableSchema:
+        firmware = self._firmware.get(client)
+        if firmware is None:
+            firmware = _firmware_of(
+                client.get("monitor", "/system/status", raw_json=True)
+            )
+            self._firmware[client] = firmware
+        key = (*firmware, table)
+        schema = self._cached(key)
+        if schema is not None:
+            return schema
+        with self._lock:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        with lock:
+            schema = self._cached(key)
+            if schema is None:
+                with self._lock:
+                    self.fetches += 1
+                schema = self._store(client, table, fetch())
+        return schema
+
+    async def _aget(
+        self, client: Any, table: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> TableSchema:
+        firmware = self._firmware.get(client)
+        if firmware is None:
+            firmware = _firmware_of(
+                await client.get("monitor", "/system/status", raw_json=True)
+            )
+            self._firmware[client] = firmware
+        key = (*firmware, table)
+        schema = self._cached(key)
+        if schema is not None:
+            return schema
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._afetch(client, table, fetch))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _afetch(
+        self, client: Any, table: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> TableSchema:
+        self.fetches += 1
+        return self._store(client, table, await fetch())
+
+    def firmware(self, endpoint: Any) -> Optional[Firmware]:
+        """(version, build) of the endpoint's device, if already known"""
+        return self._firmware.get(endpoint._client)
+
+    def clear(self) -> None:
+        """Forget the schemas held in memory (the disk cache is kept)"""
+        with self._lock:
+            self._schemas.clear()
+
+    def _path(self, key: tuple[str, int, str]) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        version, build, table = key
+        return self.directory / f"{version}-{build}" / f"{table}.json"
+
+    def _cached(self, key: tuple[str, int, str]) -> Optional[TableSchema]:
+        schema = self._schemas.get(key)
+        path = self._path(key)
+        if schema is not None or path is None:
+            return schema
+        try:
+            with open(path, "rb") as f:
+                definition = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable schema cache file: %s", e)
+            return None
+        schema = TableSchema(key[2], key[0], key[1], definition)
+        with self._lock:
+            return self._schemas.setdefault(key, schema)
+
+    def _store(self, client: Any, table: str, response: Any) -> TableSchema:
+        firmware = _firmware_of(response)
+        definition = response.get("results")
+        if not isinstance(definition, dict):
+            raise ValueError(f"{table} did not return a schema")
+        # The response tells the firmware that answered; it only differs
+        # from the remembered one if the device was upgraded meanwhile
+        self._firmware[client] = firmware
+        key = (*firmware, table)
+        schema = TableSchema(table, *firmware, definition)
+        with self._lock:
+            self._schemas[key] = schema
+        path = self._path(key)
+        if path is not None:
+            self._write(path, definition)
+        return schema
+
+    def _write(self, path: Path, definition: dict) -> None:
+        part = path.with_name(f"{path.name}.{os.getpid()}.part")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(part, "w", encoding="utf-8") as f:
+                json.dump(definition, f)
+            # Readers never see a partly written file
+            os.replace(part, path)
+        except OSError as e:
+            logger.warning("Could not write schema cache file: %s", e)
+
+    def __repr__(self) -> str:
+        return (
+            f"SchemaCache({self.directory or 'memory'}, "
+            f"{len(self._schemas)} schemas)"
+        )
@@ -25,7 +25,9 @@ from __future__ import annotations
 import logging
 
 from .FortiOS import (  # noqa: F401
+    FleetResult,
     FortiOS,
+    FortiOSFleet,
     __author__,
     __version__,
     quick_test,
@@ -102,6 +104,7 @@ __all__ = [
 ]
 
 __all__.append("FortiOS")
+__all__.extend(["FortiOSFleet", "FleetResult"])
 
 
 def get_available_modules():
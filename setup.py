@@ -59,6 +59,15 @@ setup(
             "mypy>=1.5.0",
             "python-dotenv>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
+        "columnar": [
+            "numpy>=1.22",
+        ],
+        "arrow": [
+            "pyarrow>=12.0",
+        ],
     },
     keywords=(
         "hfortix fortinet fortigate fortios fortimanager fortianalyzer "